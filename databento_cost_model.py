@@ -0,0 +1,365 @@
+"""Offline Databento cost planner backed by a SQLite table of observed request statistics.
+
+``estimate_databento_costs`` used to ask ``metadata.get_cost`` and
+``metadata.get_billable_size`` once per dataset / schema / window before an
+export could start -- two blocking round trips per trading day. This module
+keeps what those calls returned in ``CostStatsCache`` (one SQLite table of
+per-symbol record counts, billable bytes and costs over the observed
+ranges; ``ALL_SYMBOLS`` requests are stored under the ``*`` symbol) and
+estimates new requests from the per-second rates and the USD-per-byte price
+of the same dataset and schema::
+
+    billable_bytes = sum(symbol bytes/s) * requested seconds
+    cost_usd       = billable_bytes * observed USD/byte
+
+``plan_costs`` coalesces adjacent or overlapping ranges of the same scope,
+estimates every request offline and only calls the live metadata API for
+requests the statistics cannot answer (``refresh="missing"``), for all of
+them (``"always"``) or never (``"never"``). Live answers are written back,
+so the next plan is offline.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import statistics
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import Any, Literal
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+ALL_SYMBOLS = "ALL_SYMBOLS"
+# Symbol under which ``ALL_SYMBOLS`` observations are stored.
+_ALL = "*"
+# Fixed DBN record sizes, used to derive record counts from billable bytes
+# when the metadata client does not report them.
+DBN_RECORD_BYTES = {
+    "ohlcv-1s": 56,
+    "ohlcv-1m": 56,
+    "ohlcv-1h": 56,
+    "ohlcv-1d": 56,
+    "ohlcv-eod": 56,
+    "trades": 48,
+    "tbbo": 80,
+    "mbp-1": 80,
+    "bbo-1s": 80,
+    "bbo-1m": 80,
+}
+
+Refresh = Literal["never", "missing", "always"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS observations (
+  dataset TEXT NOT NULL,
+  schema TEXT NOT NULL,
+  symbol TEXT NOT NULL,
+  start_utc TEXT NOT NULL,
+  end_utc TEXT NOT NULL,
+  seconds REAL NOT NULL,
+  record_count REAL NOT NULL,
+  billable_bytes REAL NOT NULL,
+  cost_usd REAL,
+  observed_at REAL NOT NULL,
+  PRIMARY KEY(dataset, schema, symbol, start_utc, end_utc)
+) WITHOUT ROWID;
+"""
+
+
+def _utc(value: date | datetime | pd.Timestamp | str) -> pd.Timestamp:
+    ts = pd.Timestamp(value)
+    return ts.tz_localize(UTC) if ts.tzinfo is None else ts.tz_convert(UTC)
+
+
+@dataclass(frozen=True)
+class CostRequest:
+    """One metadata query: ``[start, end)`` in UTC; no ``symbols`` means ``ALL_SYMBOLS``."""
+
+    scope: str
+    dataset: str
+    schema: str
+    start: pd.Timestamp
+    end: pd.Timestamp
+    symbols: tuple[str, ...] = ()
+
+    @classmethod
+    def build(
+        cls,
+        scope: str,
+        *,
+        dataset: str,
+        schema: str,
+        start: date | datetime | pd.Timestamp | str,
+        end: date | datetime | pd.Timestamp | str,
+        symbols: Iterable[str] = (),
+    ) -> CostRequest:
+        first, last = _utc(start), _utc(end)
+        if last <= first:
+            raise ValueError(f"CostRequest range is empty: {first} >= {last}")
+        normalized = tuple(sorted({text for raw in symbols if (text := str(raw).strip().upper())}))
+        return cls(scope=scope, dataset=dataset, schema=schema, start=first, end=last, symbols=normalized)
+
+    @property
+    def seconds(self) -> float:
+        return (self.end - self.start).total_seconds()
+
+    def metadata_kwargs(self) -> dict[str, Any]:
+        return {
+            "dataset": self.dataset,
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            "symbols": list(self.symbols) if self.symbols else ALL_SYMBOLS,
+            "schema": self.schema,
+        }
+
+
+@dataclass(frozen=True)
+class CostEstimate:
+    """``source`` is ``stats`` (offline), ``live`` (metadata API) or ``missing``."""
+
+    request: CostRequest
+    cost_usd: float | None
+    billable_size_bytes: int | None
+    record_count: int | None
+    source: str
+    fallback_symbols: int = 0
+
+
+@dataclass(frozen=True)
+class CostPlan:
+    estimates: tuple[CostEstimate, ...]
+    requested: int
+    live_calls: int
+    elapsed_seconds: float
+
+    @property
+    def complete(self) -> bool:
+        return all(estimate.source != "missing" for estimate in self.estimates)
+
+    def totals(self) -> dict[str, tuple[float | None, int | None]]:
+        """``scope -> (cost_usd, billable_size_bytes)``; ``None`` where any request of the scope is unknown."""
+        totals: dict[str, tuple[float | None, int | None]] = {}
+        for estimate in self.estimates:
+            cost, size = totals.get(estimate.request.scope, (0.0, 0))
+            totals[estimate.request.scope] = (
+                None if cost is None or estimate.cost_usd is None else cost + estimate.cost_usd,
+                None if size is None or estimate.billable_size_bytes is None else size + estimate.billable_size_bytes,
+            )
+        return totals
+
+
+def coalesce_requests(requests: Iterable[CostRequest]) -> list[CostRequest]:
+    """Merge requests of the same scope, dataset, schema and symbols whose ranges touch or overlap."""
+    merged: list[CostRequest] = []
+    for request in sorted(requests, key=lambda r: (r.scope, r.dataset, r.schema, r.symbols, r.start, r.end)):
+        previous = merged[-1] if merged else None
+        if (
+            previous is not None
+            and (previous.scope, previous.dataset, previous.schema, previous.symbols)
+            == (request.scope, request.dataset, request.schema, request.symbols)
+            and request.start <= previous.end
+        ):
+            merged[-1] = replace(previous, end=max(previous.end, request.end))
+        else:
+            merged.append(request)
+    return merged
+
+
+class CostStatsCache:
+    """Observed request statistics in ``path`` (SQLite). Safe to share across threads."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+        # Per (dataset, schema) aggregates, dropped whenever ``record`` adds rows.
+        self._rates: dict[tuple[str, str], dict[str, tuple[float, float]]] = {}
+        self._prices: dict[tuple[str, str], float | None] = {}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> CostStatsCache:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM observations").fetchone()[0])
+
+    # -- statistics ---------------------------------------------------------
+
+    def record(
+        self,
+        request: CostRequest,
+        *,
+        billable_size_bytes: float,
+        cost_usd: float | None = None,
+        record_count: float | None = None,
+    ) -> None:
+        """Store what the metadata API returned for ``request``.
+
+        A multi-symbol answer is attributed to its symbols in proportion to
+        their current byte rates (evenly when none is known yet).
+        """
+        if record_count is None:
+            record_count = billable_size_bytes / DBN_RECORD_BYTES.get(request.schema, 1)
+        symbols = request.symbols or (_ALL,)
+        rates = self._symbol_rates(request.dataset, request.schema)
+        weights = [rates[symbol][1] if symbol in rates else 0.0 for symbol in symbols]
+        if not any(weights):
+            weights = [1.0] * len(symbols)
+        total_weight = sum(weights)
+        now = time.time()
+        rows = [
+            (
+                request.dataset,
+                request.schema,
+                symbol,
+                request.start.isoformat(),
+                request.end.isoformat(),
+                request.seconds,
+                record_count * weight / total_weight,
+                billable_size_bytes * weight / total_weight,
+                None if cost_usd is None else cost_usd * weight / total_weight,
+                now,
+            )
+            for symbol, weight in zip(symbols, weights, strict=True)
+        ]
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO observations VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._conn.commit()
+            self._rates.pop((request.dataset, request.schema), None)
+            self._prices.pop((request.dataset, request.schema), None)
+
+    def _symbol_rates(self, dataset: str, schema: str) -> dict[str, tuple[float, float]]:
+        """``symbol -> (records/s, bytes/s)`` over every observation of ``dataset`` / ``schema``."""
+        key = (dataset, schema)
+        with self._lock:
+            cached = self._rates.get(key)
+            if cached is None:
+                cached = self._rates[key] = {
+                    symbol: (records / seconds, size / seconds)
+                    for symbol, records, size, seconds in self._conn.execute(
+                        """
+                        SELECT symbol, SUM(record_count), SUM(billable_bytes), SUM(seconds)
+                        FROM observations WHERE dataset = ? AND schema = ?
+                        GROUP BY symbol HAVING SUM(seconds) > 0
+                        """,
+                        key,
+                    )
+                }
+            return cached
+
+    def usd_per_byte(self, dataset: str, schema: str) -> float | None:
+        key = (dataset, schema)
+        with self._lock:
+            if key not in self._prices:
+                cost, size = self._conn.execute(
+                    """
+                    SELECT SUM(cost_usd), SUM(billable_bytes) FROM observations
+                    WHERE dataset = ? AND schema = ? AND cost_usd IS NOT NULL
+                    """,
+                    key,
+                ).fetchone()
+                self._prices[key] = float(cost) / float(size) if cost is not None and size else None
+            return self._prices[key]
+
+    # -- estimation ---------------------------------------------------------
+
+    def estimate(self, request: CostRequest) -> CostEstimate:
+        """Estimate ``request`` from the stored rates; ``source="missing"`` when they cannot answer it."""
+        rates = self._symbol_rates(request.dataset, request.schema)
+        fallback = 0
+        if not request.symbols:
+            if _ALL not in rates:
+                return CostEstimate(request, None, None, None, "missing")
+            records_per_s, bytes_per_s = rates[_ALL]
+        else:
+            known = [rate for symbol, rate in rates.items() if symbol != _ALL]
+            if not known:
+                return CostEstimate(request, None, None, None, "missing")
+            # Symbols never observed are charged the median observed symbol.
+            median = (statistics.median(r for r, _ in known), statistics.median(b for _, b in known))
+            records_per_s = bytes_per_s = 0.0
+            for symbol in request.symbols:
+                rate = rates.get(symbol)
+                if rate is None:
+                    rate = median
+                    fallback += 1
+                records_per_s += rate[0]
+                bytes_per_s += rate[1]
+        size = bytes_per_s * request.seconds
+        price = self.usd_per_byte(request.dataset, request.schema)
+        return CostEstimate(
+            request,
+            cost_usd=None if price is None else size * price,
+            billable_size_bytes=round(size),
+            record_count=round(records_per_s * request.seconds),
+            source="stats",
+            fallback_symbols=fallback,
+        )
+
+    def refresh(self, client: Any, request: CostRequest) -> CostEstimate:
+        """Ask the metadata API for ``request`` and record the answer."""
+        kwargs = request.metadata_kwargs()
+        cost = float(client.metadata.get_cost(**kwargs))
+        size = int(client.metadata.get_billable_size(**kwargs))
+        try:
+            records: int | None = int(client.metadata.get_record_count(**kwargs))
+        except Exception:
+            records = None
+        self.record(request, billable_size_bytes=size, cost_usd=cost, record_count=records)
+        if records is None:
+            records = round(size / DBN_RECORD_BYTES.get(request.schema, 1))
+        return CostEstimate(request, cost_usd=cost, billable_size_bytes=size, record_count=records, source="live")
+
+
+def plan_costs(
+    requests: Iterable[CostRequest],
+    stats: CostStatsCache,
+    *,
+    client: Any = None,
+    refresh: Refresh = "missing",
+) -> CostPlan:
+    """Estimate ``requests`` after coalescing them; live calls only per ``refresh`` (and only with a client)."""
+    started = time.perf_counter()
+    requested = list(requests)
+    estimates: list[CostEstimate] = []
+    live_calls = 0
+    for request in coalesce_requests(requested):
+        estimate = None if refresh == "always" else stats.estimate(request)
+        if client is not None and refresh != "never" and (estimate is None or estimate.source == "missing"):
+            try:
+                estimate = stats.refresh(client, request)
+                live_calls += 1
+            except Exception:
+                logger.warning(
+                    "Live cost refresh failed for %s %s (%s)",
+                    request.dataset,
+                    request.schema,
+                    request.scope,
+                    exc_info=True,
+                )
+        estimates.append(estimate if estimate is not None else stats.estimate(request))
+    return CostPlan(
+        estimates=tuple(estimates),
+        requested=len(requested),
+        live_calls=live_calls,
+        elapsed_seconds=time.perf_counter() - started,
+    )
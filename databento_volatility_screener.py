@@ -7,13 +7,13 @@
 
 from __future__ import annotations
 
-import asyncio
 import contextlib
 import gc
 import hashlib
 import json
 import logging
 import math
+import multiprocessing
 import os
 import re
 import sys
@@ -22,8 +22,16 @@ import threading
 import time as time_module
 import warnings
 from collections.abc import Callable, Iterable
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    BrokenExecutor,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, fields
 from datetime import UTC, date, datetime, time, timedelta, tzinfo
 from io import BytesIO
 from pathlib import Path
@@ -36,11 +44,10 @@ import numpy as np
 import pandas as pd
 
 from databento_client import _install_databento_requests_tls_override
+from databento_content_cache import CacheGap, CacheLookup, ContentAddressedCache, ContentKey
+from databento_cost_model import CostRequest, CostStatsCache, Refresh, plan_costs
+from lazy_imports import lazy_module
 from open_prep_boundary import FMPClientLike, make_fmp_client
-from scripts.databento_production_workbook import (
-    create_excel_workbook_bytes,
-    prepare_frame_for_excel,
-)
 from strategy_config import (
     LONG_DIP_ENTRY_EARLY_DIP_MAX_SECONDS,
     LONG_DIP_ENTRY_EARLY_DIP_MIN_PCT,
@@ -52,6 +59,10 @@ from strategy_config import (
 
 logger = logging.getLogger(__name__)
 
+# The shared workbook writer pulls in openpyxl; it is imported on the first
+# Excel export instead of with the screener.
+_production_workbook = lazy_module("scripts.databento_production_workbook")
+
 
 # F-V8-perf-3.5 (2026-05-18): Cache-probe-log.
 #
@@ -228,6 +239,14 @@ FULL_UNIVERSE_OPTIONAL_FEATURE_COLUMNS = (
     "short_interest_ratio",
     "short_float_pct",
 )
+DAILY_FEATURE_TRAILING_SESSIONS = 20
+# Bump when a change to build_daily_features_full_universe() alters stored
+# rows, so persisted incremental feature state is rebuilt instead of reused.
+DAILY_FEATURE_STATE_VERSION = "v2"
+# Bump when a change to the open-window / close-trade detail collectors alters
+# the rows they compute, so stored second-detail partitions are not reused.
+SECOND_DETAIL_STORE_VERSION = "v1"
+SECOND_DETAIL_STORE_ROW_GROUP_SIZE = 65_536
 SUPPORTED_DISPLAY_TZ = {
     "America/New_York": ZoneInfo("America/New_York"),
     "Europe/Berlin": ZoneInfo("Europe/Berlin"),
@@ -263,6 +282,16 @@ DATA_CACHE_TTL_SECONDS = 4 * 3600  # 4 hours – guards against stale intra-day
 RECENT_INTRADAY_CACHE_TTL_SECONDS = DATA_CACHE_TTL_SECONDS
 DATABENTO_GET_RANGE_MAX_ATTEMPTS = 3
 INTRADAY_SUMMARY_BATCH_SIZE = 500
+# Streaming intraday summary loader: ``ohlcv-1s`` ranges are decoded in
+# ndarray batches sized so one batch's working set inside
+# ``_IntradayStateReducer.update_arrays`` (record columns, sort permutation,
+# factorized codes, masks) stays under this ceiling.
+INTRADAY_STREAM_DECODE_MAX_MIB = 64
+_INTRADAY_STREAM_BYTES_PER_RECORD = 480
+_DBN_UNDEF_PRICE = np.iinfo(np.int64).max  # databento_dbn.UNDEF_PRICE
+_DBN_FIXED_PRICE_SCALE = 1_000_000_000
+_NS_PER_DAY = 86_400 * 1_000_000_000
+_UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
 # P5.3-A6: parallelize the per-day intraday-screen loop. Each worker fetches
 # one trade_day independently against Databento (Unlimited plan); shared
 # ``runtime_unsupported_symbols`` mutations rely on GIL-atomic ``set.update``,
@@ -270,7 +299,20 @@ INTRADAY_SUMMARY_BATCH_SIZE = 500
 # until completion (acceptable: corrected on next run). Memory budget on
 # ubuntu-latest-l (16 GB): ~2 GB pandas frame per concurrent day -> 4 workers
 # = 8 GB peak (50% headroom). Increase only with memory monitoring.
+# The day scheduler reads INTRADAY_DAY_PARALLELISM as a budget of
+# full-universe fetches rather than a thread count: days with uncached
+# symbols share ``INTRADAY_DAY_PARALLELISM * len(universe)`` fetched symbols
+# (so partial re-fetches pack together), while cache-served days run in
+# their own INTRADAY_CACHED_DAY_PARALLELISM lane next to them. Each lane
+# starts its heaviest days first (cached days weigh their bytes).
 INTRADAY_DAY_PARALLELISM = 4
+INTRADAY_CACHED_DAY_PARALLELISM = 2
+INTRADAY_DAY_MAX_THREADS = 16
+# Spooled ``ohlcv-1s`` ranges are reduced in a process pool of this size so
+# the GIL-bound fold does not serialize the day threads' downloads. ``None``
+# sizes it to the spare CPUs (capped at INTRADAY_DAY_PARALLELISM); 0 reduces
+# in the day thread.
+INTRADAY_REDUCE_PROCESSES: int | None = None
 DATABENTO_SYMBOL_ALIASES = {
     "BRK-A": "BRK.A",
     "BRK-B": "BRK.B",
@@ -939,6 +981,13 @@ def filter_supported_universe_for_databento(
 
 
 def _import_databento() -> Any:
+    # Only the first import can leave idle event loops behind; once databento
+    # is loaded, skip the two gc sweeps, which cost time linear in the heap.
+    loaded = sys.modules.get("databento")
+    if loaded is not None:
+        return loaded
+    import asyncio
+
     existing_loop_ids = {
         id(obj)
         for obj in gc.get_objects()
@@ -1141,6 +1190,10 @@ def _databento_get_range_with_retry(
     for attempt in range(1, attempts + 1):
         try:
             _normalize_tls_certificate_env()
+            if kwargs.get("path") is not None:
+                # ``get_range(path=...)`` opens its target exclusively; drop the
+                # partial download a failed attempt left behind.
+                Path(kwargs["path"]).unlink(missing_ok=True)
             return client.timeseries.get_range(**kwargs)
         except Exception as exc:
             last_exc = exc
@@ -1644,7 +1697,14 @@ def load_daily_bars(
     force_refresh: bool = False,
     progress_callback: Callable[[str], None] | None = None,
     max_workers: int = 1,
+    content_cache: ContentAddressedCache | None = None,
 ) -> pd.DataFrame:
+    """Load ``ohlcv-1d`` bars (plus ``previous_close``) for ``trading_days``.
+
+    With ``content_cache`` and ``use_file_cache`` the content-addressed cache
+    replaces the per-request ``daily_bars`` Parquet file: overlapping windows
+    and symbol supersets are served from it and only the gaps are fetched.
+    """
     if not trading_days:
         return pd.DataFrame(columns=["trade_date", "symbol", "open", "high", "low", "close", "volume", "previous_close"])
     _t0 = time_module.perf_counter()
@@ -1675,34 +1735,14 @@ def load_daily_bars(
         for symbol in universe_symbols
         if (normalized := normalize_symbol_for_databento(symbol))
     }
-    cached_frame: pd.DataFrame | None = None
-    missing_symbols: set[str] = set(normalized_universe_symbols)
-    if use_file_cache and not force_refresh:
-        cached_frame, missing_symbols = _cached_frame_coverage(
-            cache_path,
-            normalized_universe_symbols,
-            max_age_seconds=DATA_CACHE_TTL_SECONDS,
-            current_universe_symbols=normalized_universe_symbols,
-        )
-    if cached_frame is not None and not missing_symbols:
-        _emit(f"cache HIT path={cache_path} rows={len(cached_frame)}")
-        frame = cached_frame
-    else:
-        if cached_frame is not None:
-            _emit(
-                f"cache PARTIAL path={cache_path} cached_rows={len(cached_frame)} "
-                f"missing_symbols={len(missing_symbols)}"
-            )
-            fetch_symbols: list[str] | set[str] = sorted(missing_symbols)
-        else:
-            _emit(f"cache MISS path={cache_path} (force_refresh={force_refresh})")
-            fetch_symbols = universe_symbols
-        client = _make_databento_client(databento_api_key)
-        schema_end = _get_schema_available_end(client, dataset, "ohlcv-1d")
-        end_date = _daily_request_end_exclusive(end_date, schema_end)
-        if end_date <= start_date:
-            _emit("schema_end collapsed window; returning empty frame")
-            return pd.DataFrame(columns=["trade_date", "symbol", "open", "high", "low", "close", "volume", "previous_close"])
+
+    def _fetch_window(
+        client: Any,
+        fetch_symbols: Iterable[str],
+        start: date,
+        end: date,
+        failed_symbols: set[str] | None = None,
+    ) -> pd.DataFrame:
         batches = list(_iter_symbol_batches(fetch_symbols))
         effective_workers = max(1, min(int(max_workers), len(batches)))
         mode = "parallel" if effective_workers > 1 else "sequential"
@@ -1718,8 +1758,8 @@ def load_daily_bars(
                     dataset=dataset,
                     symbols=symbols_batch,
                     schema="ohlcv-1d",
-                    start=start_date.isoformat(),
-                    end=end_date.isoformat(),
+                    start=start.isoformat(),
+                    end=end.isoformat(),
                 )
                 batch_frame = _store_to_frame(store, context="load_daily_bars")
                 if not batch_frame.empty:
@@ -1733,6 +1773,9 @@ def load_daily_bars(
                     include_traceback=True,
                 )
                 _emit(f"batch {idx}/{len(batches)} FAILED")
+                if failed_symbols is not None:
+                    with _emit_lock:
+                        failed_symbols.update(symbols_batch)
                 return None
 
         indexed = list(enumerate(batches, start=1))
@@ -1745,33 +1788,126 @@ def load_daily_bars(
         ok = sum(1 for f in results if f is not None)
         failed = sum(1 for f in results if f is None)
         _emit(f"fetch complete batches_ok={ok} batches_failed_or_empty={failed}")
-        fetched_frame = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
-        if cached_frame is not None and not fetched_frame.empty:
-            # #2334: merge delta-fetched missing symbols into the cached subset
-            # so future reads see a complete superset and downstream callers
-            # never observe partial coverage.
-            fetched_frame["symbol"] = fetched_frame.get("symbol", "").map(normalize_symbol_for_databento)
-            frame = pd.concat([cached_frame, fetched_frame], ignore_index=True)
-            if use_file_cache and not frame.empty:
-                _write_cached_frame(
-                    cache_path,
-                    frame,
-                    captured_universe_symbols=normalized_universe_symbols,
-                )
-                _emit(f"wrote cache rows={len(frame)} (merged cached+delta)")
-        elif cached_frame is not None:
-            # delta-fetch returned nothing for missing symbols → keep cached
-            # as-is; the missing symbols are simply unavailable upstream.
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    cached_frame: pd.DataFrame | None = None
+    missing_symbols: set[str] = set(normalized_universe_symbols)
+    if content_cache is not None and use_file_cache:
+        # Content-addressed path: serve every covered (symbol, session day)
+        # from overlapping entries and fetch only the uncovered gaps.
+        content_key = ContentKey.build(
+            dataset=dataset,
+            schema="ohlcv-1d",
+            symbols=normalized_universe_symbols,
+            start=start_date,
+            end=end_date,
+        )
+        lookup = (
+            CacheLookup(frame=None, gaps=(CacheGap(start_date, end_date, frozenset(content_key.symbols)),))
+            if force_refresh
+            else content_cache.lookup(content_key)
+        )
+        if lookup.complete:
+            _emit(f"cache HIT content_key={content_key.digest[:12]} rows={len(lookup.frame)}")
+            frame = lookup.frame
+        else:
+            cached_rows = 0 if lookup.frame is None else len(lookup.frame)
+            _emit(
+                f"cache {'PARTIAL' if cached_rows else 'MISS'} content_key={content_key.digest[:12]} "
+                f"cached_rows={cached_rows} gaps={len(lookup.gaps)} missing_symbols={len(lookup.missing_symbols)} "
+                f"(force_refresh={force_refresh})"
+            )
+            client = _make_databento_client(databento_api_key)
+            schema_end = _get_schema_available_end(client, dataset, "ohlcv-1d")
+            request_end = _daily_request_end_exclusive(end_date, schema_end)
+            # Only sessions that closed before the schema's available end are
+            # complete; later days stay uncovered so the next run refetches them.
+            complete_through = request_end - timedelta(days=1)
+            if schema_end is not None:
+                available = pd.Timestamp(schema_end)
+                available = available.tz_localize(UTC) if available.tzinfo is None else available.tz_convert(UTC)
+                complete_through = min(complete_through, available.date() - timedelta(days=1))
+            parts = [] if lookup.frame is None else [lookup.frame]
+            for gap in lookup.gaps:
+                gap_end = min(gap.end + timedelta(days=1), request_end)
+                if gap_end <= gap.start:
+                    continue
+                failed_symbols: set[str] = set()
+                fetched = _fetch_window(client, sorted(gap.symbols), gap.start, gap_end, failed_symbols)
+                if not fetched.empty:
+                    fetched["symbol"] = fetched["symbol"].map(normalize_symbol_for_databento)
+                    parts.append(fetched)
+                # Every symbol whose batch was answered is cached, rows or not:
+                # an empty answer becomes a negative entry instead of a gap
+                # that is refetched on every run. Failed batches stay gaps.
+                answered = gap.symbols - failed_symbols
+                if answered and min(gap.end, complete_through) >= gap.start:
+                    content_cache.put(
+                        ContentKey.build(
+                            dataset=dataset,
+                            schema="ohlcv-1d",
+                            symbols=answered,
+                            start=gap.start,
+                            end=min(gap.end, complete_through),
+                        ),
+                        fetched,
+                    )
+            frame = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+            _emit(f"content cache stats {content_cache.stats.as_dict()}")
+    else:
+        if use_file_cache and not force_refresh:
+            cached_frame, missing_symbols = _cached_frame_coverage(
+                cache_path,
+                normalized_universe_symbols,
+                max_age_seconds=DATA_CACHE_TTL_SECONDS,
+                current_universe_symbols=normalized_universe_symbols,
+            )
+        if cached_frame is not None and not missing_symbols:
+            _emit(f"cache HIT path={cache_path} rows={len(cached_frame)}")
             frame = cached_frame
         else:
-            frame = fetched_frame
-            if use_file_cache and not frame.empty:
-                _write_cached_frame(
-                    cache_path,
-                    frame,
-                    captured_universe_symbols=normalized_universe_symbols,
+            if cached_frame is not None:
+                _emit(
+                    f"cache PARTIAL path={cache_path} cached_rows={len(cached_frame)} "
+                    f"missing_symbols={len(missing_symbols)}"
                 )
-                _emit(f"wrote cache rows={len(frame)}")
+                fetch_symbols: list[str] | set[str] = sorted(missing_symbols)
+            else:
+                _emit(f"cache MISS path={cache_path} (force_refresh={force_refresh})")
+                fetch_symbols = universe_symbols
+            client = _make_databento_client(databento_api_key)
+            schema_end = _get_schema_available_end(client, dataset, "ohlcv-1d")
+            end_date = _daily_request_end_exclusive(end_date, schema_end)
+            if end_date <= start_date:
+                _emit("schema_end collapsed window; returning empty frame")
+                return pd.DataFrame(columns=["trade_date", "symbol", "open", "high", "low", "close", "volume", "previous_close"])
+            fetched_frame = _fetch_window(client, fetch_symbols, start_date, end_date)
+            if cached_frame is not None and not fetched_frame.empty:
+                # #2334: merge delta-fetched missing symbols into the cached subset
+                # so future reads see a complete superset and downstream callers
+                # never observe partial coverage.
+                fetched_frame["symbol"] = fetched_frame.get("symbol", "").map(normalize_symbol_for_databento)
+                frame = pd.concat([cached_frame, fetched_frame], ignore_index=True)
+                if use_file_cache and not frame.empty:
+                    _write_cached_frame(
+                        cache_path,
+                        frame,
+                        captured_universe_symbols=normalized_universe_symbols,
+                    )
+                    _emit(f"wrote cache rows={len(frame)} (merged cached+delta)")
+            elif cached_frame is not None:
+                # delta-fetch returned nothing for missing symbols → keep cached
+                # as-is; the missing symbols are simply unavailable upstream.
+                frame = cached_frame
+            else:
+                frame = fetched_frame
+                if use_file_cache and not frame.empty:
+                    _write_cached_frame(
+                        cache_path,
+                        frame,
+                        captured_universe_symbols=normalized_universe_symbols,
+                    )
+                    _emit(f"wrote cache rows={len(frame)}")
     if frame.empty:
         _emit("complete rows=0 (empty after fetch)")
         return pd.DataFrame(columns=["trade_date", "symbol", "open", "high", "low", "close", "volume", "previous_close"])
@@ -1800,6 +1936,7 @@ def _update_state_from_chunk(
     universe_symbols: set[str] | None,
     states: dict[str, SymbolDayState],
 ) -> None:
+    """Row-wise reference reducer; ``_IntradayStateReducer`` is pinned against it."""
     if chunk.empty:
         return
     frame = _coerce_timestamp_frame(chunk)
@@ -1893,6 +2030,303 @@ def _update_state_from_chunk(
             state._last_window_close_for_rv = trailing_close
 
 
+def _first_rows_by_code(codes: np.ndarray, positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(codes, positions)`` of each code's first row, in row order."""
+    unique_codes, first = np.unique(codes, return_index=True)
+    order = np.argsort(first, kind="stable")
+    return unique_codes[order], positions[first[order]]
+
+
+def _last_rows_by_code(codes: np.ndarray, positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(codes, positions)`` of each code's last row, in row order."""
+    unique_codes, first_reversed = np.unique(codes[::-1], return_index=True)
+    last = codes.size - 1 - first_reversed
+    order = np.argsort(last, kind="stable")
+    return unique_codes[order], positions[last[order]]
+
+
+def _positive_finite(values: np.ndarray) -> np.ndarray:
+    return np.isfinite(values) & (values > 0)
+
+
+class _IntradayStateReducer:
+    """Columnar replacement for ``_update_state_from_chunk`` over one trade day.
+
+    ``_update_state_from_chunk`` runs a ``groupby(...).apply`` for realized
+    variance and then walks every symbol with ``iterrows`` on each chunk.
+    This reducer keeps the same per-symbol running state (window first open
+    / last close / last timestamp, high, low, volume, second count, realized
+    variance and its carried-over close, premarket and market-open prices)
+    in aligned numpy arrays indexed through a symbol dictionary, merges each
+    chunk with sorted-segment reductions and only materialises
+    ``SymbolDayState`` objects in ``states()`` at day end. States come out
+    in the same insertion order the row-wise reducer creates them.
+    """
+
+    _FLOAT_FIELDS = (
+        "first_window_open",
+        "last_window_close",
+        "window_high",
+        "window_low",
+        "premarket_price",
+        "market_open_price",
+        "last_close_for_rv",
+    )
+
+    def __init__(self, window: WindowDefinition, *, universe_symbols: set[str] | None = None) -> None:
+        self.window = window
+        self.universe_symbols = universe_symbols
+        self._premarket_start_ns = pd.Timestamp(window.premarket_anchor_utc).value
+        self._regular_open_ns = pd.Timestamp(window.regular_open_utc).value
+        self._fetch_end_ns = pd.Timestamp(window.fetch_end_utc).value
+        self._window_start_ns = pd.Timestamp(window.window_start_local.astimezone(UTC)).value
+        self._window_end_ns = pd.Timestamp(window.window_end_local.astimezone(UTC)).value
+        self._slots: dict[str, int] = {}
+        self._symbols: list[str] = []
+        self._touch_order: list[int] = []
+        self._capacity = 0
+        self._touched = np.zeros(0, dtype=bool)
+        self._float = {name: np.zeros(0, dtype=float) for name in self._FLOAT_FIELDS}
+        self._last_ts_ns = np.zeros(0, dtype=np.int64)
+        self._window_volume = np.zeros(0, dtype=float)
+        self._second_count = np.zeros(0, dtype=np.int64)
+        self._realized_var = np.zeros(0, dtype=float)
+
+    def __len__(self) -> int:
+        return len(self._touch_order)
+
+    # -- slot bookkeeping -------------------------------------------------
+    def _slots_for(self, symbols: np.ndarray) -> np.ndarray:
+        slots = np.empty(symbols.size, dtype=np.int64)
+        for position, symbol in enumerate(symbols.tolist()):
+            slot = self._slots.get(symbol)
+            if slot is None:
+                slot = self._slots[symbol] = len(self._symbols)
+                self._symbols.append(symbol)
+            slots[position] = slot
+        self._ensure_capacity(len(self._symbols))
+        return slots
+
+    def _ensure_capacity(self, size: int) -> None:
+        if size <= self._capacity:
+            return
+        capacity = max(size, 2 * self._capacity, 64)
+        grow = capacity - self._capacity
+        self._touched = np.concatenate([self._touched, np.zeros(grow, dtype=bool)])
+        for name, values in self._float.items():
+            self._float[name] = np.concatenate([values, np.full(grow, np.nan)])
+        self._last_ts_ns = np.concatenate([self._last_ts_ns, np.full(grow, np.iinfo(np.int64).min)])
+        self._window_volume = np.concatenate([self._window_volume, np.zeros(grow)])
+        self._second_count = np.concatenate([self._second_count, np.zeros(grow, dtype=np.int64)])
+        self._realized_var = np.concatenate([self._realized_var, np.zeros(grow)])
+        self._capacity = capacity
+
+    def _touch(self, slots: np.ndarray) -> None:
+        # Mirrors ``states.setdefault``: first touch fixes the output order.
+        fresh = slots[~self._touched[slots]]
+        self._touched[fresh] = True
+        self._touch_order.extend(fresh.tolist())
+
+    # -- chunk merge --------------------------------------------------------
+    def update(self, chunk: pd.DataFrame) -> None:
+        if chunk.empty:
+            return
+        frame = _coerce_timestamp_frame(chunk)
+        if "symbol" not in frame.columns:
+            return
+
+        def column(name: str) -> np.ndarray:
+            if name not in frame.columns:
+                return np.full(len(frame), np.nan)
+            return pd.to_numeric(frame[name], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+
+        self.update_arrays(
+            frame["symbol"].astype(str).str.upper().to_numpy(dtype=object),
+            frame["ts"].dt.as_unit("ns").array.asi8,
+            *(column(name) for name in ("open", "high", "low", "close", "volume")),
+        )
+
+    def update_arrays(
+        self,
+        symbols: np.ndarray,
+        ts_ns: np.ndarray,
+        open_px: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+    ) -> None:
+        """Merge one chunk given as aligned columns (upper-case symbols, UTC epoch ns, float prices)."""
+        if symbols.size == 0:
+            return
+        # ``frame.sort_values("ts")`` argsorts the datetime64 values with the
+        # (unstable) default kind; sorting the same view keeps symbols tied on
+        # a timestamp in the row-wise reducer's order.
+        if self.universe_symbols is not None:
+            kept = np.flatnonzero(pd.Index(symbols).isin(self.universe_symbols))
+            order = kept[np.argsort(ts_ns[kept].view("datetime64[ns]"))]
+        else:
+            order = np.argsort(ts_ns.view("datetime64[ns]"))
+        if order.size == 0:
+            return
+        ts_ns = ts_ns[order]
+        codes, uniques = pd.factorize(symbols[order])
+        slots = self._slots_for(np.asarray(uniques, dtype=object))
+        open_px, high, low, close, volume = (values[order] for values in (open_px, high, low, close, volume))
+        floats = self._float
+        positions = np.arange(order.size)
+
+        premarket = np.flatnonzero((ts_ns >= self._premarket_start_ns) & (ts_ns < self._regular_open_ns))
+        if premarket.size:
+            pm_codes, pm_rows = _last_rows_by_code(codes[premarket], positions[premarket])
+            valid = _positive_finite(close[pm_rows])
+            pm_slots = slots[pm_codes[valid]]
+            self._touch(pm_slots)
+            floats["premarket_price"][pm_slots] = close[pm_rows[valid]]
+
+        regular = np.flatnonzero((ts_ns >= self._regular_open_ns) & (ts_ns <= self._fetch_end_ns))
+        if regular.size:
+            reg_codes, reg_rows = _first_rows_by_code(codes[regular], positions[regular])
+            first_open = open_px[reg_rows]
+            # ``_safe_float(open) or _safe_float(close)``: a zero open falls back to close.
+            use_open = np.isfinite(first_open) & (first_open != 0)
+            open_or_close = np.where(use_open, first_open, close[reg_rows])
+            valid = _positive_finite(open_or_close)
+            reg_slots = slots[reg_codes[valid]]
+            self._touch(reg_slots)
+            unset = np.isnan(floats["market_open_price"][reg_slots])
+            floats["market_open_price"][reg_slots[unset]] = open_or_close[valid][unset]
+
+        in_window = np.flatnonzero((ts_ns >= self._window_start_ns) & (ts_ns <= self._window_end_ns))
+        if in_window.size == 0:
+            return
+        win_codes = codes[in_window]
+        touched_codes, _ = _first_rows_by_code(win_codes, in_window)
+        self._touch(slots[touched_codes])
+        self._merge_window(
+            slots=slots,
+            codes=win_codes,
+            rows=in_window,
+            ts_ns=ts_ns,
+            open_px=open_px,
+            high=high,
+            low=low,
+            close=close,
+            volume=volume,
+        )
+
+    def _merge_window(
+        self,
+        *,
+        slots: np.ndarray,
+        codes: np.ndarray,
+        rows: np.ndarray,
+        ts_ns: np.ndarray,
+        open_px: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+    ) -> None:
+        floats = self._float
+        # Group the window rows by symbol, keeping time order inside each group.
+        by_code = np.argsort(codes, kind="stable")
+        grouped_rows = rows[by_code]
+        grouped_codes = codes[by_code]
+        starts = np.flatnonzero(np.r_[True, grouped_codes[1:] != grouped_codes[:-1]])
+        group_slots = slots[grouped_codes[starts]]
+
+        counts = np.diff(np.r_[starts, grouped_rows.size])
+        self._second_count[group_slots] += counts
+        g_volume = volume[grouped_rows]
+        self._window_volume[group_slots] += np.add.reduceat(np.where(np.isnan(g_volume), 0.0, g_volume), starts)
+        last_ts = ts_ns[grouped_rows[np.r_[starts[1:], grouped_rows.size] - 1]]
+        self._last_ts_ns[group_slots] = last_ts
+
+        with np.errstate(all="ignore"):
+            g_high = np.fmax.reduceat(high[grouped_rows], starts)
+            g_low = np.fmin.reduceat(low[grouped_rows], starts)
+        valid = _positive_finite(g_high)
+        floats["window_high"][group_slots[valid]] = np.fmax(floats["window_high"][group_slots[valid]], g_high[valid])
+        valid = _positive_finite(g_low)
+        floats["window_low"][group_slots[valid]] = np.fmin(floats["window_low"][group_slots[valid]], g_low[valid])
+
+        # pandas ``first`` / ``last`` skip missing values.
+        has_open = ~np.isnan(open_px[rows])
+        if has_open.any():
+            open_codes, open_rows = _first_rows_by_code(codes[has_open], rows[has_open])
+            first_open = open_px[open_rows]
+            open_slots = slots[open_codes]
+            settable = _positive_finite(first_open) & np.isnan(floats["first_window_open"][open_slots])
+            floats["first_window_open"][open_slots[settable]] = first_open[settable]
+
+        g_close = close[grouped_rows]
+        with np.errstate(all="ignore"):
+            log_returns = np.log(g_close[1:] / g_close[:-1])
+        squared = np.zeros(grouped_rows.size)
+        squared[1:] = np.square(log_returns)
+        squared[starts] = 0.0
+        chunk_var = np.add.reduceat(np.where(np.isnan(squared), 0.0, squared), starts)
+
+        has_close = ~np.isnan(close[rows])
+        linked = np.zeros(group_slots.size)
+        if has_close.any():
+            close_codes = codes[has_close]
+            first_codes, first_rows = _first_rows_by_code(close_codes, rows[has_close])
+            last_codes, last_rows = _last_rows_by_code(close_codes, rows[has_close])
+            first_close = close[first_rows]
+            last_close = close[last_rows]
+
+            first_slots = slots[first_codes]
+            carried = floats["last_close_for_rv"][first_slots]
+            link = ~np.isnan(carried) & _positive_finite(first_close)
+            link_var = np.zeros(first_slots.size)
+            link_var[link] = np.log(first_close[link] / carried[link]) ** 2
+            position = {slot: index for index, slot in enumerate(group_slots.tolist())}
+            linked[[position[slot] for slot in first_slots.tolist()]] = link_var
+
+            last_slots = slots[last_codes]
+            valid = _positive_finite(last_close)
+            floats["last_window_close"][last_slots[valid]] = last_close[valid]
+            floats["last_close_for_rv"][last_slots[valid]] = last_close[valid]
+        self._realized_var[group_slots] += linked
+        self._realized_var[group_slots] += chunk_var
+
+    # -- day-end materialisation -------------------------------------------
+    def states(self) -> dict[str, SymbolDayState]:
+        """Materialise one ``SymbolDayState`` per touched symbol, in first-touch order."""
+        floats = {name: values.tolist() for name, values in self._float.items()}
+        last_ts = self._last_ts_ns.tolist()
+        volume = self._window_volume.tolist()
+        counts = self._second_count.tolist()
+        realized = self._realized_var.tolist()
+        missing_ts = int(np.iinfo(np.int64).min)
+
+        def value(name: str, slot: int) -> float | None:
+            number = floats[name][slot]
+            return None if math.isnan(number) else number
+
+        out: dict[str, SymbolDayState] = {}
+        for slot in self._touch_order:
+            symbol = self._symbols[slot]
+            out[symbol] = SymbolDayState(
+                symbol=symbol,
+                trade_date=self.window.trade_date,
+                first_window_open=value("first_window_open", slot),
+                last_window_close=value("last_window_close", slot),
+                last_window_timestamp=None if last_ts[slot] == missing_ts else pd.Timestamp(last_ts[slot], tz="UTC"),
+                window_high=value("window_high", slot),
+                window_low=value("window_low", slot),
+                window_volume=volume[slot],
+                second_count=counts[slot],
+                premarket_price=value("premarket_price", slot),
+                market_open_price=value("market_open_price", slot),
+                realized_var=realized[slot],
+                _last_window_close_for_rv=value("last_close_for_rv", slot),
+            )
+        return out
+
+
 def summarize_symbol_day(
     state: SymbolDayState,
     *,
@@ -1957,6 +2391,238 @@ def summarize_symbol_day(
     }
 
 
+def _intraday_decode_batch_records(max_mib: float) -> int:
+    """Records per decoded batch that keep one reducer merge under ``max_mib``."""
+    return max(1_024, int(max_mib * 1024 * 1024) // _INTRADAY_STREAM_BYTES_PER_RECORD)
+
+
+def _reduce_dbn_store(store: Any, reducer: _IntradayStateReducer, *, batch_records: int) -> int:
+    """Fold ``store`` into ``reducer`` ``batch_records`` records at a time; return the record count.
+
+    A ``DBNStore`` is decoded with ``to_ndarray(count=...)``: ``ts_event``,
+    prices and volume go to ``update_arrays`` as plain columns and
+    instrument ids are resolved through the store's own symbology mappings,
+    so no DataFrame is built. Records without a mapping are dropped.
+    Stores without ``to_ndarray`` are read through ``to_df(count=...)``.
+    """
+    if not hasattr(store, "to_ndarray"):
+        payload = store.to_df(count=batch_records)
+        records = 0
+        for chunk in [payload] if isinstance(payload, pd.DataFrame) else payload:
+            reducer.update(chunk)
+            records += len(chunk)
+        return records
+    instrument_map = _import_databento().InstrumentMap()
+    instrument_map.insert_metadata(store.metadata)
+    # (instrument_id, UTC day) -> upper-case symbol, resolved once per range.
+    resolved: dict[int, str | None] = {}
+    records = 0
+    for batch in store.to_ndarray(count=batch_records):
+        if batch.size == 0:
+            continue
+        records += batch.size
+        ts_ns = batch["ts_event"].astype(np.int64)
+        keys = batch["instrument_id"].astype(np.int64) << 32 | ts_ns // _NS_PER_DAY
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        for key in unique_keys.tolist():
+            if key not in resolved:
+                symbol = instrument_map.resolve(key >> 32, date.fromordinal(_UNIX_EPOCH_ORDINAL + (key & 0xFFFFFFFF)))
+                resolved[key] = symbol.upper() if symbol else None
+        symbols = np.asarray([resolved[key] for key in unique_keys.tolist()], dtype=object)[inverse]
+        mapped = pd.notna(symbols)
+        rows = batch[mapped]
+        reducer.update_arrays(
+            symbols[mapped],
+            ts_ns[mapped],
+            *(_dbn_float_prices(rows[name]) for name in ("open", "high", "low", "close")),
+            rows["volume"].astype(float),
+        )
+    return records
+
+
+def _dbn_float_prices(raw: np.ndarray) -> np.ndarray:
+    """Fixed-point DBN prices as floats, ``UNDEF_PRICE`` as NaN (``to_df``'s price formatting)."""
+    return np.where(raw == _DBN_UNDEF_PRICE, np.nan, raw / _DBN_FIXED_PRICE_SCALE)
+
+
+def _intraday_range_key(symbols: Iterable[str]) -> str:
+    return hashlib.sha256(",".join(sorted(symbols)).encode("utf-8")).hexdigest()[:16]
+
+
+_SYMBOL_DAY_OPTIONAL_FLOATS = (
+    "first_window_open",
+    "last_window_close",
+    "window_high",
+    "window_low",
+    "premarket_price",
+    "market_open_price",
+    "_last_window_close_for_rv",
+)
+
+
+def _symbol_day_states_frame(states: Iterable[SymbolDayState]) -> pd.DataFrame:
+    # Not ``asdict``: its deepcopy of the tz-aware Timestamp fields is slow and
+    # raised SystemError from concurrent day threads.
+    columns = [field.name for field in fields(SymbolDayState)]
+    return pd.DataFrame([vars(state) for state in states], columns=columns)
+
+
+def _symbol_day_states_from_frame(frame: pd.DataFrame, *, trade_date: date) -> list[SymbolDayState]:
+    states = []
+    for row in frame.to_dict(orient="records"):
+        last_ts = pd.to_datetime(row.get("last_window_timestamp"), errors="coerce", utc=True)
+        states.append(
+            SymbolDayState(
+                symbol=str(row["symbol"]),
+                trade_date=trade_date,
+                last_window_timestamp=None if pd.isna(last_ts) else last_ts,
+                window_volume=_safe_float(row.get("window_volume"), 0.0),
+                second_count=int(row.get("second_count") or 0),
+                realized_var=_safe_float(row.get("realized_var"), 0.0),
+                **{name: _safe_float(row.get(name)) for name in _SYMBOL_DAY_OPTIONAL_FLOATS},
+            )
+        )
+    return states
+
+
+class _IntradayRangeCheckpoint:
+    """Committed symbol ranges of one intraday trade day.
+
+    ``_load_intraday_summary_batch`` reduces every symbol range into its own
+    ``_IntradayStateReducer`` and commits the states here only once the
+    whole range decoded, so a failed or split range never leaves half-merged
+    rows behind. With ``root`` set, each commit is also written as one
+    Parquet file (the states, plus the requested symbols in the ``skipp.*``
+    schema metadata) and responses are spooled to disk next to it; a later
+    run of the same day -- after a crash, SIGTERM or OOM kill -- resumes
+    from those ranges instead of downloading them again. ``clear()`` drops
+    the directory once the day frame is cached.
+    """
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        *,
+        trade_date: date,
+        resume_symbols: set[str] | None = None,
+        max_age_seconds: int | None = None,
+    ) -> None:
+        self.root = root
+        self.trade_date = trade_date
+        self.states: dict[str, SymbolDayState] = {}
+        self.covered: set[str] = set()
+        self.ranges = 0
+        self.resumed_ranges = 0
+        self.records = 0
+        self.elapsed_seconds = 0.0
+        if root is not None and resume_symbols is not None and root.is_dir():
+            self._resume(root, resume_symbols, max_age_seconds)
+
+    def spool_path(self, symbols: list[str]) -> Path | None:
+        """Download target for ``symbols``; ``None`` keeps the response in memory."""
+        if self.root is None:
+            return None
+        self.root.mkdir(parents=True, exist_ok=True)
+        return self.root / f"{_intraday_range_key(symbols)}.dbn.zst"
+
+    def commit(self, symbols: list[str], states: dict[str, SymbolDayState], *, records: int, seconds: float) -> None:
+        self.states.update(states)
+        self.covered.update(symbols)
+        self.ranges += 1
+        self.records += records
+        self.elapsed_seconds += seconds
+        if self.root is None:
+            return
+        path = self.root / f"{_intraday_range_key(symbols)}.parquet"
+        try:
+            _write_parquet_atomic(
+                path,
+                _symbol_day_states_frame(states.values()),
+                metadata=_build_universe_metadata(symbols),
+            )
+        except OSError as exc:
+            logger.warning("intraday range checkpoint write failed (%s): %s", path.name, exc)
+
+    def clear(self) -> None:
+        if self.root is None or not self.root.is_dir():
+            return
+        for path in self.root.iterdir():
+            with contextlib.suppress(OSError):
+                path.unlink()
+        with contextlib.suppress(OSError):
+            self.root.rmdir()
+
+    def _resume(self, root: Path, wanted: set[str], max_age_seconds: int | None) -> None:
+        cutoff = time_module.time() - max_age_seconds if max_age_seconds is not None else None
+        symbols_key = f"{_UNIVERSE_META_PREFIX}captured_universe_symbols"
+        for path in sorted(root.glob("*.parquet")):
+            meta = _read_universe_metadata(path) or {}
+            symbols = {symbol for symbol in meta.get(symbols_key, "").split(",") if symbol} & wanted
+            if not symbols:
+                continue
+            try:
+                if cutoff is not None and path.stat().st_mtime < cutoff:
+                    continue
+                frame = pd.read_parquet(path)
+            except Exception as exc:  # corrupt or vanished checkpoint: the range is fetched again
+                logger.warning("ignoring unreadable intraday range checkpoint %s: %s", path.name, exc)
+                continue
+            for state in _symbol_day_states_from_frame(frame, trade_date=self.trade_date):
+                if state.symbol in symbols:
+                    self.states[state.symbol] = state
+            self.covered |= symbols
+            self.resumed_ranges += 1
+
+
+def _reduce_spooled_intraday_range(
+    path: str, window: WindowDefinition, batch_records: int
+) -> tuple[dict[str, SymbolDayState], int]:
+    """Process-pool entry point: fold one spooled ``ohlcv-1s`` range into fresh states."""
+    reducer = _IntradayStateReducer(window)
+    records = _reduce_dbn_store(_import_databento().DBNStore.from_file(path), reducer, batch_records=batch_records)
+    return reducer.states(), records
+
+
+def _reduce_intraday_range(
+    store: Any,
+    window: WindowDefinition,
+    *,
+    batch_records: int,
+    spool_path: Path | None,
+    reduce_executor: Executor | None,
+) -> tuple[dict[str, SymbolDayState], int]:
+    """Fold one ``get_range`` response into fresh per-symbol states.
+
+    A response spooled to disk is reduced in ``reduce_executor`` when one is
+    given, which keeps the GIL free for the other day threads' downloads. A
+    broken pool falls back to reducing in this thread.
+    """
+    if reduce_executor is not None and spool_path is not None and spool_path.exists():
+        try:
+            return reduce_executor.submit(
+                _reduce_spooled_intraday_range, str(spool_path), window, batch_records
+            ).result()
+        except BrokenExecutor as exc:
+            logger.warning("intraday reduce pool unavailable, reducing in-thread: %s", exc)
+    reducer = _IntradayStateReducer(window)
+    records = _reduce_dbn_store(store, reducer, batch_records=batch_records)
+    return reducer.states(), records
+
+
+def _intraday_reduce_context() -> multiprocessing.context.BaseContext:
+    # The day threads hold sockets and locks by the time ranges are reduced,
+    # so the pool must not fork this process; forkserver/spawn start clean.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _intraday_reduce_processes(requested: int | None, *, max_workers: int) -> int:
+    if requested is not None:
+        return max(0, requested)
+    return max(0, min(max_workers, (os.cpu_count() or 1) - 1))
+
+
 def _load_intraday_summary_batch(
     client: Any,
     *,
@@ -1965,9 +2631,12 @@ def _load_intraday_summary_batch(
     window: WindowDefinition,
     available_end_1s: pd.Timestamp | None,
     symbols_batch: list[str],
-    states: dict[str, SymbolDayState],
+    checkpoint: _IntradayRangeCheckpoint,
     runtime_unsupported_symbols: set[str],
+    decode_max_mib: float = INTRADAY_STREAM_DECODE_MAX_MIB,
+    reduce_executor: Executor | None = None,
 ) -> None:
+    spool_path = checkpoint.spool_path(symbols_batch)
     try:
         with warnings.catch_warnings(record=True) as caught_warnings:
             warnings.simplefilter("always")
@@ -1977,6 +2646,7 @@ def _load_intraday_summary_batch(
             if clamped_end_1s <= pd.Timestamp(window.fetch_start_utc):
                 return
             retry_attempts = 1 if len(symbols_batch) > 1 else DATABENTO_GET_RANGE_MAX_ATTEMPTS
+            started = time_module.perf_counter()
             store = _databento_get_range_with_retry(
                 client,
                 context="run_intraday_screen",
@@ -1986,16 +2656,19 @@ def _load_intraday_summary_batch(
                 schema="ohlcv-1s",
                 start=window.fetch_start_utc.isoformat(),
                 end=clamped_end_1s.isoformat(),
+                **({"path": spool_path} if spool_path is not None else {}),
+            )
+            states, records = _reduce_intraday_range(
+                store,
+                window,
+                batch_records=_intraday_decode_batch_records(decode_max_mib),
+                spool_path=spool_path,
+                reduce_executor=reduce_executor,
             )
-            iterator = store.to_df(count=250_000)
-            if isinstance(iterator, pd.DataFrame):
-                _update_state_from_chunk(iterator, window=window, universe_symbols=None, states=states)
-            else:
-                for chunk in iterator:
-                    _update_state_from_chunk(chunk, window=window, universe_symbols=None, states=states)
         runtime_unsupported_symbols.update(
             _extract_unresolved_symbols_from_warning_messages([str(item.message) for item in caught_warnings])
         )
+        checkpoint.commit(symbols_batch, states, records=records, seconds=time_module.perf_counter() - started)
     except Exception as exc:
         if _is_retryable_databento_get_range_error(exc) and len(symbols_batch) > 1:
             midpoint = len(symbols_batch) // 2
@@ -2009,32 +2682,148 @@ def _load_intraday_summary_batch(
                 len(left_batch),
                 len(right_batch),
             )
-            _load_intraday_summary_batch(
-                client,
-                dataset=dataset,
-                trade_day=trade_day,
-                window=window,
-                available_end_1s=available_end_1s,
-                symbols_batch=left_batch,
-                states=states,
-                runtime_unsupported_symbols=runtime_unsupported_symbols,
-            )
-            _load_intraday_summary_batch(
-                client,
-                dataset=dataset,
-                trade_day=trade_day,
-                window=window,
-                available_end_1s=available_end_1s,
-                symbols_batch=right_batch,
-                states=states,
-                runtime_unsupported_symbols=runtime_unsupported_symbols,
-            )
+            for half in (left_batch, right_batch):
+                _load_intraday_summary_batch(
+                    client,
+                    dataset=dataset,
+                    trade_day=trade_day,
+                    window=window,
+                    available_end_1s=available_end_1s,
+                    symbols_batch=half,
+                    checkpoint=checkpoint,
+                    runtime_unsupported_symbols=runtime_unsupported_symbols,
+                    decode_max_mib=decode_max_mib,
+                    reduce_executor=reduce_executor,
+                )
             return
         _warn_with_redacted_exception(
             f"Intraday fetch failed for batch on {trade_day}, skipping batch",
             exc,
             include_traceback=True,
         )
+    finally:
+        if spool_path is not None:
+            with contextlib.suppress(OSError):
+                spool_path.unlink(missing_ok=True)
+
+
+def _intraday_day_cache_path(
+    cache_dir: str | Path | None,
+    *,
+    dataset: str,
+    trade_day: date,
+    display_timezone: str,
+    day_ws: time,
+    day_we: time,
+    premarket_anchor_et: time,
+) -> Path:
+    return build_cache_path(
+        cache_dir,
+        "intraday_summary",
+        dataset=dataset,
+        parts=[
+            trade_day.isoformat(),
+            display_timezone,
+            day_ws.strftime("%H%M%S"),
+            day_we.strftime("%H%M%S"),
+            premarket_anchor_et.strftime("%H%M%S"),
+        ],
+    )
+
+
+@dataclass(frozen=True)
+class _IntradayDayJob:
+    day_index: int
+    trade_day: date
+    fetch_symbols: int
+    cached_bytes: int = 0
+
+
+def _estimate_intraday_day_cost(
+    cache_path: Path, *, symbols: int, max_age_seconds: int | None
+) -> tuple[int, int]:
+    """Return ``(fetch_symbols, cached_bytes)`` for one trade day from file stats alone.
+
+    A fresh day cache fetches nothing; otherwise every symbol is counted as
+    fetched -- committed range checkpoints only add their bytes, since
+    subtracting the symbols they cover would mean opening every file.
+    """
+    cached_bytes = 0
+    fresh = False
+    with contextlib.suppress(OSError):
+        stat = cache_path.stat()
+        cached_bytes += stat.st_size
+        fresh = max_age_seconds is None or time_module.time() - stat.st_mtime <= max_age_seconds
+    with contextlib.suppress(OSError):
+        cached_bytes += sum(path.stat().st_size for path in cache_path.with_suffix(".ranges").glob("*.parquet"))
+    return (0 if fresh else symbols), cached_bytes
+
+
+def _admit_intraday_days(
+    pending: list[_IntradayDayJob],
+    *,
+    running: Iterable[_IntradayDayJob],
+    fetch_budget: int,
+    cached_slots: int,
+    max_threads: int,
+) -> list[_IntradayDayJob]:
+    """Remove and return the ``pending`` jobs that may start now.
+
+    ``pending`` is ordered heaviest first. Fetch days are admitted while
+    their symbols fit ``fetch_budget``; one that does not fit leaves the
+    room to lighter fetch days behind it, and an idle fetch lane always
+    admits its heaviest day, so a day larger than the budget still runs.
+    Cache-served days take one of ``cached_slots``.
+    """
+    running = list(running)
+    fetch_free = fetch_budget - sum(job.fetch_symbols for job in running)
+    fetch_idle = not any(job.fetch_symbols for job in running)
+    cached_free = cached_slots - sum(1 for job in running if not job.fetch_symbols)
+    threads_free = max_threads - len(running)
+    admitted: list[_IntradayDayJob] = []
+    kept: list[_IntradayDayJob] = []
+    for job in pending:
+        if len(admitted) >= threads_free:
+            kept.append(job)
+        elif job.fetch_symbols and (job.fetch_symbols <= fetch_free or fetch_idle):
+            admitted.append(job)
+            fetch_free -= job.fetch_symbols
+            fetch_idle = False
+        elif not job.fetch_symbols and cached_free > 0:
+            admitted.append(job)
+            cached_free -= 1
+        else:
+            kept.append(job)
+    pending[:] = kept
+    return admitted
+
+
+def _previous_close_frame(daily_bars: pd.DataFrame) -> pd.DataFrame:
+    """``(trade_date, symbol, previous_close)`` join table for the intraday rows."""
+    columns = ["trade_date", "symbol", "previous_close"]
+    if daily_bars.empty or not set(columns) <= set(daily_bars.columns):
+        return pd.DataFrame(columns=columns)
+    frame = pd.DataFrame(
+        {
+            "trade_date": pd.to_datetime(daily_bars["trade_date"], errors="coerce").dt.date,
+            "symbol": daily_bars["symbol"].astype(str).str.upper(),
+            "previous_close": pd.to_numeric(daily_bars["previous_close"], errors="coerce").replace(
+                [np.inf, -np.inf], np.nan
+            ),
+        }
+    )
+    return frame.drop_duplicates(["trade_date", "symbol"], keep="last")
+
+
+def _lookup_previous_close(frame: pd.DataFrame, previous_close_frame: pd.DataFrame) -> np.ndarray:
+    """``previous_close`` aligned to ``frame`` rows (NaN where daily bars have none)."""
+    keys = pd.DataFrame(
+        {
+            "trade_date": pd.to_datetime(frame["trade_date"], errors="coerce").dt.date,
+            "symbol": frame["symbol"].astype(str).str.upper(),
+        }
+    )
+    return keys.merge(previous_close_frame, on=["trade_date", "symbol"], how="left")["previous_close"].to_numpy()
 
 
 def _process_intraday_day(
@@ -2053,9 +2842,14 @@ def _process_intraday_day(
     use_file_cache: bool,
     force_refresh: bool,
     latest_trade_day: date | None,
-    prev_close_lookup: dict[tuple[date, str], float | None],
+    decode_max_mib: float = INTRADAY_STREAM_DECODE_MAX_MIB,
+    reduce_executor: Executor | None = None,
 ) -> tuple[list[dict[str, Any]], int, bool]:
-    """Worker for one intraday trade_day. Returns (records, row_count, cache_hit)."""
+    """Worker for one intraday trade_day. Returns (records, row_count, cache_hit).
+
+    ``previous_close`` and the transition columns are added by the caller in
+    one pass over every day's rows.
+    """
     day_ws, day_we = _resolve_window_for_date(trade_day, display_timezone, window_start, window_end)
     window = build_window_definition(
         trade_day,
@@ -2064,17 +2858,14 @@ def _process_intraday_day(
         window_end=day_we,
         premarket_anchor_et=premarket_anchor_et,
     )
-    cache_path = build_cache_path(
+    cache_path = _intraday_day_cache_path(
         cache_dir,
-        "intraday_summary",
         dataset=dataset,
-        parts=[
-            trade_day.isoformat(),
-            display_timezone,
-            day_ws.strftime("%H%M%S"),
-            day_we.strftime("%H%M%S"),
-            premarket_anchor_et.strftime("%H%M%S"),
-        ],
+        trade_day=trade_day,
+        display_timezone=display_timezone,
+        day_ws=day_ws,
+        day_we=day_we,
+        premarket_anchor_et=premarket_anchor_et,
     )
     cached_frame: pd.DataFrame | None = None
     missing_symbols: set[str] = set(universe_symbols)
@@ -2090,13 +2881,18 @@ def _process_intraday_day(
     if cached_frame is not None and not missing_symbols:
         day_frame: pd.DataFrame = cached_frame
     else:
-        states: dict[str, SymbolDayState] = {}
         if cached_frame is not None:
             # #2334: only fetch symbols missing from cached subset; merge below.
             fetch_pool = missing_symbols - runtime_unsupported_symbols
         else:
             fetch_pool = set(universe_symbols) - runtime_unsupported_symbols
-        for symbols_batch in _iter_symbol_batches(fetch_pool, batch_size=INTRADAY_SUMMARY_BATCH_SIZE):
+        checkpoint = _IntradayRangeCheckpoint(
+            cache_path.with_suffix(".ranges") if use_file_cache else None,
+            trade_date=trade_day,
+            resume_symbols=None if force_refresh else fetch_pool,
+            max_age_seconds=_trade_day_cache_max_age_seconds(trade_day, latest_trade_day),
+        )
+        for symbols_batch in _iter_symbol_batches(fetch_pool - checkpoint.covered, batch_size=INTRADAY_SUMMARY_BATCH_SIZE):
             _load_intraday_summary_batch(
                 client,
                 dataset=dataset,
@@ -2104,10 +2900,22 @@ def _process_intraday_day(
                 window=window,
                 available_end_1s=available_end_1s,
                 symbols_batch=symbols_batch,
-                states=states,
+                checkpoint=checkpoint,
                 runtime_unsupported_symbols=runtime_unsupported_symbols,
+                decode_max_mib=decode_max_mib,
+                reduce_executor=reduce_executor,
             )
-        day_rows = [summarize_symbol_day(state, previous_close=None) for state in states.values()]
+        if checkpoint.ranges or checkpoint.resumed_ranges:
+            logger.info(
+                "run_intraday_screen: %s streamed ranges=%d resumed_ranges=%d records=%d records_per_s=%.0f rss=%s",
+                trade_day,
+                checkpoint.ranges,
+                checkpoint.resumed_ranges,
+                checkpoint.records,
+                checkpoint.records / checkpoint.elapsed_seconds if checkpoint.elapsed_seconds > 0 else 0.0,
+                _fmt_rss_pair(),
+            )
+        day_rows = [summarize_symbol_day(state, previous_close=None) for state in checkpoint.states.values()]
         fetched_frame = pd.DataFrame(day_rows) if day_rows else _empty_intraday_frame()
         if cached_frame is not None and not fetched_frame.empty:
             day_frame = pd.concat([cached_frame, fetched_frame], ignore_index=True)
@@ -2127,16 +2935,12 @@ def _process_intraday_day(
                     day_frame,
                     captured_universe_symbols=universe_symbols,
                 )
+        checkpoint.clear()
     if day_frame.empty:
         return [], 0, cache_hit
-    filtered = day_frame[day_frame["symbol"].isin(universe_symbols)].copy()
+    filtered = day_frame[day_frame["symbol"].isin(universe_symbols)]
     if filtered.empty:
         return [], 0, cache_hit
-    filtered["previous_close"] = filtered.apply(
-        lambda row: prev_close_lookup.get((pd.Timestamp(row["trade_date"]).date(), str(row["symbol"]).upper())),
-        axis=1,
-    )
-    filtered = _add_transition_columns(filtered)
     return filtered.to_dict(orient="records"), len(filtered), cache_hit
 
 
@@ -2156,14 +2960,22 @@ def run_intraday_screen(
     force_refresh: bool = False,
     progress_callback: Any = None,
     max_workers: int = INTRADAY_DAY_PARALLELISM,
+    decode_max_mib: float = INTRADAY_STREAM_DECODE_MAX_MIB,
+    reduce_processes: int | None = None,
 ) -> pd.DataFrame:
+    """Summarise the intraday window of every ``trading_days`` entry for ``universe_symbols``.
+
+    Days that fetch share a budget of ``max_workers`` full-universe fetches
+    and cache-served days run in their own lane beside them, heaviest first
+    in each (see ``_admit_intraday_days``). ``reduce_processes`` sizes the process pool that folds spooled
+    ranges (default ``INTRADAY_REDUCE_PROCESSES``; only used with
+    ``use_file_cache``). ``decode_max_mib`` caps the per-batch decode
+    working set of each streamed ``ohlcv-1s`` range (see
+    ``_intraday_decode_batch_records``).
+    """
     client = _make_databento_client(databento_api_key)
     available_end_1s = _get_schema_available_end(client, dataset, "ohlcv-1s")
     runtime_unsupported_symbols: set[str] = set()
-    prev_close_lookup = {
-        (row.trade_date, row.symbol): _safe_float(row.previous_close)
-        for row in daily_bars.itertuples(index=False)
-    }
     results: list[dict[str, Any]] = []
     latest_trade_day = max(trading_days) if trading_days else None
     total_days = len(trading_days)
@@ -2173,9 +2985,43 @@ def run_intraday_screen(
     # P5.3-A6: parallelize day-loop. Each day is independent (own state dict,
     # own cache key, own DB query). ``progress_callback`` is invoked under a
     # lock so emit-order is consistent even though completion-order is not.
-    effective_workers = max(1, min(max_workers, total_days))
+    pending: list[_IntradayDayJob] = []
+    for day_index, trade_day in enumerate(trading_days, start=1):
+        fetch_symbols, cached_bytes = len(universe_symbols), 0
+        if use_file_cache and not force_refresh:
+            day_ws, day_we = _resolve_window_for_date(trade_day, display_timezone, window_start, window_end)
+            fetch_symbols, cached_bytes = _estimate_intraday_day_cost(
+                _intraday_day_cache_path(
+                    cache_dir,
+                    dataset=dataset,
+                    trade_day=trade_day,
+                    display_timezone=display_timezone,
+                    day_ws=day_ws,
+                    day_we=day_we,
+                    premarket_anchor_et=premarket_anchor_et,
+                ),
+                symbols=len(universe_symbols),
+                max_age_seconds=_trade_day_cache_max_age_seconds(trade_day, latest_trade_day),
+            )
+        pending.append(_IntradayDayJob(day_index, trade_day, fetch_symbols, cached_bytes))
+    pending.sort(key=lambda job: (-job.fetch_symbols, -job.cached_bytes, job.day_index))
+    fetch_budget = max(1, max_workers) * max(1, len(universe_symbols))
+    max_threads = max(1, min(INTRADAY_DAY_MAX_THREADS, total_days))
+    pool_size = _intraday_reduce_processes(
+        INTRADAY_REDUCE_PROCESSES if reduce_processes is None else reduce_processes,
+        max_workers=max_workers,
+    ) if use_file_cache else 0
+    logger.info(
+        "run_intraday_screen: scheduling %d days (fetch_days=%d, fetch_budget=%d, threads=%d, reduce_processes=%d)",
+        total_days,
+        sum(1 for job in pending if job.fetch_symbols),
+        fetch_budget,
+        max_threads,
+        pool_size,
+    )
     progress_lock = threading.Lock()
     day_errors: list[tuple[date, BaseException]] = []
+    reduce_executor: Executor | None = None
 
     def _submit_day(day_index: int, trade_day: date) -> tuple[int, date, list[dict[str, Any]], int, bool]:
         records, row_count, cache_hit = _process_intraday_day(
@@ -2193,43 +3039,57 @@ def run_intraday_screen(
             use_file_cache=use_file_cache,
             force_refresh=force_refresh,
             latest_trade_day=latest_trade_day,
-            prev_close_lookup=prev_close_lookup,
+            decode_max_mib=decode_max_mib,
+            reduce_executor=reduce_executor,
         )
         return day_index, trade_day, records, row_count, cache_hit
 
-    with ThreadPoolExecutor(max_workers=effective_workers, thread_name_prefix="intraday_day") as executor:
-        future_to_day = {
-            executor.submit(_submit_day, day_index, trade_day): (day_index, trade_day)
-            for day_index, trade_day in enumerate(trading_days, start=1)
-        }
-        for future in as_completed(future_to_day):
-            day_index, trade_day = future_to_day[future]
-            try:
-                _, _, records, row_count, cache_hit = future.result()
-            except Exception as exc:
-                day_errors.append((trade_day, exc))
-                logger.warning(
-                    "Step 6/10 progress: intraday day %d/%d %s FAILED: %s",
-                    day_index,
-                    total_days,
-                    trade_day.isoformat(),
-                    exc,
-                )
+    with contextlib.ExitStack() as stack:
+        if pool_size:
+            reduce_executor = stack.enter_context(
+                ProcessPoolExecutor(max_workers=pool_size, mp_context=_intraday_reduce_context())
+            )
+        executor = stack.enter_context(ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix="intraday_day"))
+        running: dict[Future[tuple[int, date, list[dict[str, Any]], int, bool]], _IntradayDayJob] = {}
+        while pending or running:
+            for job in _admit_intraday_days(
+                pending,
+                running=running.values(),
+                fetch_budget=fetch_budget,
+                cached_slots=INTRADAY_CACHED_DAY_PARALLELISM,
+                max_threads=max_threads,
+            ):
+                running[executor.submit(_submit_day, job.day_index, job.trade_day)] = job
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                job = running.pop(future)
+                day_index, trade_day = job.day_index, job.trade_day
+                try:
+                    _, _, records, row_count, cache_hit = future.result()
+                except Exception as exc:
+                    day_errors.append((trade_day, exc))
+                    logger.warning(
+                        "Step 6/10 progress: intraday day %d/%d %s FAILED: %s",
+                        day_index,
+                        total_days,
+                        trade_day.isoformat(),
+                        exc,
+                    )
+                    with progress_lock:
+                        if progress_callback is not None:
+                            progress_callback(
+                                f"Step 6/10 progress: intraday day {day_index}/{total_days} "
+                                f"{trade_day.isoformat()} FAILED ({type(exc).__name__})"
+                            )
+                    continue
                 with progress_lock:
+                    results.extend(records)
                     if progress_callback is not None:
                         progress_callback(
                             f"Step 6/10 progress: intraday day {day_index}/{total_days} "
-                            f"{trade_day.isoformat()} FAILED ({type(exc).__name__})"
+                            f"{trade_day.isoformat()} complete "
+                            f"(rows={row_count}, cache_hit={'yes' if cache_hit else 'no'})"
                         )
-                continue
-            with progress_lock:
-                results.extend(records)
-                if progress_callback is not None:
-                    progress_callback(
-                        f"Step 6/10 progress: intraday day {day_index}/{total_days} "
-                        f"{trade_day.isoformat()} complete "
-                        f"(rows={row_count}, cache_hit={'yes' if cache_hit else 'no'})"
-                    )
 
     if day_errors and len(day_errors) == total_days:
         # All days failed — surface the first error so the caller does not
@@ -2241,7 +3101,9 @@ def run_intraday_screen(
 
     if not results:
         return _empty_intraday_frame()
-    return pd.DataFrame(results)
+    frame = pd.DataFrame(results)
+    frame["previous_close"] = _lookup_previous_close(frame, _previous_close_frame(daily_bars))
+    return _add_transition_columns(frame)
 
 
 def rank_top_fraction_per_day(
@@ -2494,29 +3356,171 @@ def collect_detail_tables_for_summary(
     return second_detail_all, minute_detail_all
 
 
-def collect_full_universe_open_window_second_detail(
-    databento_api_key: str,
+# --- Second-detail partition store ------------------------------------------
+# The open-window seconds and close-window trades of a closed session never
+# change, so with ``detail_store_dir`` the detail collectors keep them in a
+# partitioned Parquet store instead of recomputing them on every export:
+#
+#   <detail_store_dir>/<kind>/<dataset>/window=<window key>/trade_date=<day>/part-<ns>.parquet
+#
+# A read only opens the (window, session) partition it needs. Each part holds
+# its rows sorted by symbol, so the symbol filter prunes row groups, and its
+# ``skipp.captured_universe_symbols`` metadata lists every symbol it was
+# computed for -- including symbols without rows, which are therefore not
+# refetched. Rows of a symbol never depend on the other symbols requested, so
+# partitions are shared across universes and symbol-day scopes.
+
+
+def _second_detail_partition_dir(
+    detail_store_dir: str | Path,
+    kind: str,
     *,
     dataset: str,
-    trading_days: list[date],
-    universe_symbols: set[str],
-    daily_bars: pd.DataFrame,
-    symbol_day_scope: pd.DataFrame | None = None,
-    display_timezone: str = DEFAULT_DISPLAY_TZ,
-    window_start: time | None = None,
-    window_end: time | None = None,
-    premarket_anchor_et: time = time(8, 0),
+    window_parts: list[str],
+    trade_day: date,
+) -> Path:
+    safe_dataset = dataset.replace(".", "_").replace("/", "_")
+    window_key = "_".join(
+        [SECOND_DETAIL_STORE_VERSION, *(str(part).replace("/", "-").replace(":", "-").replace(" ", "_") for part in window_parts)]
+    )
+    return Path(detail_store_dir) / kind / safe_dataset / f"window={window_key}" / f"trade_date={trade_day.isoformat()}"
+
+
+def _second_detail_partition_is_final(
+    trade_day: date,
+    latest_trade_day: date | None,
+    *,
+    window_end_utc: pd.Timestamp,
+    available_end: pd.Timestamp | None,
+) -> bool:
+    """Only a closed session whose window Databento has fully published is immutable."""
+    return (
+        latest_trade_day is not None
+        and trade_day < latest_trade_day
+        and available_end is not None
+        and window_end_utc <= available_end
+    )
+
+
+def _read_second_detail_partition(
+    partition_dir: Path,
+    symbols: Iterable[str],
+) -> tuple[pd.DataFrame | None, set[str]]:
+    """Return ``(stored_rows, missing_symbols)`` for ``symbols`` in one partition.
+
+    ``stored_rows`` is ``None`` when no part covers any requested symbol and is
+    sorted by symbol otherwise. A symbol covered by several parts is read from
+    the newest one. Unreadable parts are removed and their symbols reported
+    missing.
+    """
+    import pyarrow.parquet as pq
+
+    remaining = {str(symbol) for symbol in symbols}
+    requested_count = len(remaining)
+    parts = sorted(partition_dir.glob("part-*.parquet"), reverse=True) if partition_dir.is_dir() else []
+    frames: list[pd.DataFrame] = []
+    for part in parts:
+        if not remaining:
+            break
+        try:
+            parquet_file = pq.ParquetFile(part)
+            raw = parquet_file.schema_arrow.metadata or {}
+            payload = raw.get(f"{_UNIVERSE_META_PREFIX}captured_universe_symbols".encode(), b"").decode("utf-8")
+            taken = remaining & {symbol for symbol in payload.split(",") if symbol}
+            if taken and parquet_file.metadata.num_rows:
+                table = pq.read_table(part, filters=[("symbol", "in", sorted(taken))], partitioning=None)
+                if table.num_rows:
+                    frames.append(table.to_pandas())
+        except Exception:
+            logger.warning("Corrupt second-detail partition part removed: %s", part, exc_info=True)
+            with contextlib.suppress(OSError):
+                part.unlink()
+            continue
+        remaining -= taken
+    _record_cache_probe(partition_dir, hit=not remaining)
+    if len(remaining) == requested_count:
+        return None, remaining
+    if not frames:
+        return pd.DataFrame(), remaining
+    return pd.concat(frames, ignore_index=True).sort_values("symbol", kind="mergesort", ignore_index=True), remaining
+
+
+def _write_second_detail_partition(
+    partition_dir: Path,
+    frame: pd.DataFrame,
+    *,
+    covered_symbols: Iterable[str],
+) -> None:
+    """Add one part holding ``frame`` (sorted by symbol) for ``covered_symbols``."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    rows = frame.sort_values("symbol", kind="mergesort", ignore_index=True) if not frame.empty else frame
+    table = pa.Table.from_pandas(rows, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    for key, value in _build_universe_metadata(covered_symbols).items():
+        metadata[key.encode("utf-8")] = value.encode("utf-8")
+    table = table.replace_schema_metadata(metadata)
+
+    def write_temp(temp_path: Path) -> None:
+        pq.write_table(table, temp_path, row_group_size=SECOND_DETAIL_STORE_ROW_GROUP_SIZE)
+
+    _replace_atomic(partition_dir / f"part-{time_module.time_ns():020d}.parquet", write_temp)
+
+
+def _clear_second_detail_partition(partition_dir: Path) -> None:
+    for part in partition_dir.glob("part-*.parquet") if partition_dir.is_dir() else []:
+        with contextlib.suppress(OSError):
+            part.unlink()
+
+
+def _store_second_detail_day(
+    partition_dir: Path,
+    stored_frame: pd.DataFrame | None,
+    fetched_frame: pd.DataFrame,
+    *,
+    covered_symbols: set[str],
+    output_columns: list[str],
+) -> pd.DataFrame:
+    """Persist the freshly computed symbols and return stored + fresh rows sorted by symbol.
+
+    Symbols whose fetch failed are left out of ``covered_symbols`` and stay missing.
+    """
+    if covered_symbols:
+        _write_second_detail_partition(
+            partition_dir,
+            fetched_frame if not fetched_frame.empty else pd.DataFrame(columns=output_columns),
+            covered_symbols=covered_symbols,
+        )
+    frames = [frame for frame in (stored_frame, fetched_frame) if frame is not None and not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=output_columns)
+    return pd.concat(frames, ignore_index=True).sort_values("symbol", kind="mergesort", ignore_index=True)
+
+
+def collect_full_universe_open_window_second_detail(
+    databento_api_key: str,
+    *,
+    dataset: str,
+    trading_days: list[date],
+    universe_symbols: set[str],
+    daily_bars: pd.DataFrame,
+    symbol_day_scope: pd.DataFrame | None = None,
+    display_timezone: str = DEFAULT_DISPLAY_TZ,
+    window_start: time | None = None,
+    window_end: time | None = None,
+    premarket_anchor_et: time = time(8, 0),
     cache_dir: str | Path | None = None,
     use_file_cache: bool = False,
     force_refresh: bool = False,
+    detail_store_dir: str | Path | None = None,
 ) -> pd.DataFrame:
+    output_columns = [
+        "trade_date", "symbol", "timestamp", "session", "open", "high", "low", "close", "volume",
+        "trade_count", "second_delta_pct", "from_previous_close_pct",
+    ]
     if not trading_days or not universe_symbols:
-        return pd.DataFrame(
-            columns=[
-                "trade_date", "symbol", "timestamp", "session", "open", "high", "low", "close", "volume",
-                "trade_count", "second_delta_pct", "from_previous_close_pct",
-            ]
-        )
+        return pd.DataFrame(columns=output_columns)
 
     client = _make_databento_client(databento_api_key)
     available_end_1s = _get_schema_available_end(client, dataset, "ohlcv-1s")
@@ -2573,9 +3577,35 @@ def collect_full_universe_open_window_second_detail(
             dataset=dataset,
             parts=open_parts,
         )
+        window = build_window_definition(
+            trade_day,
+            display_timezone=display_timezone,
+            window_start=day_ws,
+            window_end=day_we,
+            premarket_anchor_et=premarket_anchor_et,
+        )
+        window_end_1s = _exclusive_ohlcv_1s_end(window.window_end_local.astimezone(UTC))
+        store_partition: Path | None = None
+        if detail_store_dir is not None and _second_detail_partition_is_final(
+            trade_day, latest_trade_day, window_end_utc=window_end_1s, available_end=available_end_1s
+        ):
+            store_partition = _second_detail_partition_dir(
+                detail_store_dir,
+                "open_window_second_detail",
+                dataset=dataset,
+                window_parts=open_parts[1:5],
+                trade_day=trade_day,
+            )
         cached_frame: pd.DataFrame | None = None
         missing_symbols: set[str] = set(day_universe_symbols)
-        if use_file_cache and not force_refresh:
+        if store_partition is not None:
+            # Closed sessions are served from the partition store instead of
+            # the day-level cache file.
+            if force_refresh:
+                _clear_second_detail_partition(store_partition)
+            else:
+                cached_frame, missing_symbols = _read_second_detail_partition(store_partition, day_universe_symbols)
+        elif use_file_cache and not force_refresh:
             cached_frame, missing_symbols = _cached_frame_coverage(
                 cache_path,
                 day_universe_symbols,
@@ -2586,14 +3616,8 @@ def collect_full_universe_open_window_second_detail(
         if cached_frame is not None and not missing_symbols:
             day_frame: pd.DataFrame = cached_frame
         else:
-            window = build_window_definition(
-                trade_day,
-                display_timezone=display_timezone,
-                window_start=day_ws,
-                window_end=day_we,
-                premarket_anchor_et=premarket_anchor_et,
-            )
             day_parts: list[pd.DataFrame] = []
+            failed_symbols: set[str] = set()
             previous_close_by_symbol = {
                 symbol: previous_close_lookup.get((trade_day, symbol))
                 for symbol in day_universe_symbols
@@ -2603,9 +3627,7 @@ def collect_full_universe_open_window_second_detail(
                 missing_symbols if cached_frame is not None else set(day_universe_symbols)
             )
             active_symbols = fetch_pool - runtime_unsupported_symbols
-            clamped_end_1s = _clamp_request_end(
-                _exclusive_ohlcv_1s_end(window.window_end_local.astimezone(UTC)), available_end_1s,
-            )
+            clamped_end_1s = _clamp_request_end(window_end_1s, available_end_1s)
             if clamped_end_1s <= pd.Timestamp(window.fetch_start_utc):
                 continue
             for symbols_batch in _iter_symbol_batches(active_symbols):
@@ -2637,6 +3659,7 @@ def collect_full_universe_open_window_second_detail(
                         exc,
                         include_traceback=True,
                     )
+                    failed_symbols.update(symbols_batch)
                     continue
                 if frame.empty or "symbol" not in frame.columns:
                     continue
@@ -2668,17 +3691,18 @@ def collect_full_universe_open_window_second_detail(
                     np.nan,
                 )
                 frame.insert(0, "trade_date", trade_day)
-                day_parts.append(
-                    frame[
-                        [
-                            "trade_date", "symbol", "timestamp", "session", "open", "high", "low", "close", "volume",
-                            "trade_count", "second_delta_pct", "from_previous_close_pct",
-                        ]
-                    ].reset_index(drop=True)
-                )
+                day_parts.append(frame[output_columns].reset_index(drop=True))
 
             fetched_frame = pd.concat(day_parts, ignore_index=True) if day_parts else pd.DataFrame()
-            if cached_frame is not None and not fetched_frame.empty:
+            if store_partition is not None:
+                day_frame = _store_second_detail_day(
+                    store_partition,
+                    cached_frame,
+                    fetched_frame,
+                    covered_symbols=fetch_pool - failed_symbols,
+                    output_columns=output_columns,
+                )
+            elif cached_frame is not None and not fetched_frame.empty:
                 # #2334: merge delta-fetched missing symbols into cached subset.
                 day_frame = pd.concat([cached_frame, fetched_frame], ignore_index=True)
                 if use_file_cache:
@@ -2707,12 +3731,7 @@ def collect_full_universe_open_window_second_detail(
             if not day_frame.empty:
                 all_rows.append(day_frame)
 
-    return pd.concat(all_rows, ignore_index=True) if all_rows else pd.DataFrame(
-        columns=[
-            "trade_date", "symbol", "timestamp", "session", "open", "high", "low", "close", "volume",
-            "trade_count", "second_delta_pct", "from_previous_close_pct",
-        ]
-    )
+    return pd.concat(all_rows, ignore_index=True) if all_rows else pd.DataFrame(columns=output_columns)
 
 
 def _build_expected_symbol_day_frame(trading_days: list[date], universe: pd.DataFrame) -> pd.DataFrame:
@@ -3022,6 +4041,7 @@ def collect_full_universe_close_trade_detail(
     cache_dir: str | Path | None = None,
     use_file_cache: bool = False,
     force_refresh: bool = False,
+    detail_store_dir: str | Path | None = None,
 ) -> pd.DataFrame:
     output_columns = [
         "trade_date", "symbol", "timestamp", "ts_event", "ts_recv", "publisher_id", "publisher", "venue_class",
@@ -3067,7 +4087,8 @@ def collect_full_universe_close_trade_detail(
         local_start = datetime.combine(trade_day, window_start, tzinfo=US_EASTERN_TZ).astimezone(display_tz)
         local_end = datetime.combine(trade_day, window_end, tzinfo=US_EASTERN_TZ).astimezone(display_tz)
         fetch_start_utc = pd.Timestamp(local_start.astimezone(UTC))
-        fetch_end_utc = _clamp_request_end(pd.Timestamp(local_end.astimezone(UTC)), available_end)
+        window_end_utc = pd.Timestamp(local_end.astimezone(UTC))
+        fetch_end_utc = _clamp_request_end(window_end_utc, available_end)
         if fetch_end_utc <= fetch_start_utc:
             continue
         cache_parts: list[str] = [trade_day.isoformat(), display_timezone]
@@ -3081,9 +4102,26 @@ def collect_full_universe_close_trade_detail(
             dataset=dataset,
             parts=cache_parts,
         )
+        store_partition: Path | None = None
+        if detail_store_dir is not None and _second_detail_partition_is_final(
+            trade_day, latest_trade_day, window_end_utc=window_end_utc, available_end=available_end
+        ):
+            store_partition = _second_detail_partition_dir(
+                detail_store_dir,
+                "close_trade_detail",
+                dataset=dataset,
+                window_parts=[display_timezone, window_start.strftime("%H%M%S"), window_end.strftime("%H%M%S")],
+                trade_day=trade_day,
+            )
         cached_frame: pd.DataFrame | None = None
         missing_symbols: set[str] = set(day_universe_symbols)
-        if use_file_cache and not force_refresh:
+        if store_partition is not None:
+            # See ``collect_full_universe_open_window_second_detail``.
+            if force_refresh:
+                _clear_second_detail_partition(store_partition)
+            else:
+                cached_frame, missing_symbols = _read_second_detail_partition(store_partition, day_universe_symbols)
+        elif use_file_cache and not force_refresh:
             cached_frame, missing_symbols = _cached_frame_coverage(
                 cache_path,
                 day_universe_symbols,
@@ -3095,6 +4133,7 @@ def collect_full_universe_close_trade_detail(
             day_frame: pd.DataFrame = cached_frame
         else:
             day_parts: list[pd.DataFrame] = []
+            failed_symbols: set[str] = set()
             # #2334: delta-fetch only the symbols missing from the cached subset.
             fetch_pool = (
                 missing_symbols if cached_frame is not None else set(day_universe_symbols)
@@ -3136,6 +4175,7 @@ def collect_full_universe_close_trade_detail(
                         exc,
                         include_traceback=True,
                     )
+                    failed_symbols.update(symbols_batch)
                     continue
                 if frame.empty or "symbol" not in frame.columns:
                     continue
@@ -3160,7 +4200,15 @@ def collect_full_universe_close_trade_detail(
                 day_parts.append(frame[output_columns].reset_index(drop=True))
 
             fetched_frame = pd.concat(day_parts, ignore_index=True) if day_parts else pd.DataFrame(columns=output_columns)
-            if cached_frame is not None and not fetched_frame.empty:
+            if store_partition is not None:
+                day_frame = _store_second_detail_day(
+                    store_partition,
+                    cached_frame,
+                    fetched_frame,
+                    covered_symbols=fetch_pool - failed_symbols,
+                    output_columns=output_columns,
+                )
+            elif cached_frame is not None and not fetched_frame.empty:
                 # #2334: merge delta-fetched missing symbols into cached subset.
                 day_frame = pd.concat([cached_frame, fetched_frame], ignore_index=True)
                 if use_file_cache:
@@ -3515,6 +4563,112 @@ def _build_close_outcome_aggregates(close_outcome_minute_detail_all: pd.DataFram
     return pd.DataFrame(metrics)
 
 
+def _full_universe_attribute_frame(universe: pd.DataFrame) -> pd.DataFrame:
+    optional_universe_columns = [column for column in FULL_UNIVERSE_OPTIONAL_FEATURE_COLUMNS if column in universe.columns]
+    universe_columns = [column for column in ["symbol", "company_name", "exchange", "sector", "industry", "market_cap", *optional_universe_columns] if column in universe.columns]
+    universe_frame = universe[universe_columns].copy() if universe_columns else pd.DataFrame(columns=["symbol"])
+    if not universe_frame.empty:
+        universe_frame["symbol"] = universe_frame["symbol"].astype(str).str.upper()
+        universe_frame = universe_frame.drop_duplicates(subset=["symbol"]).reset_index(drop=True)
+    return universe_frame
+
+
+def _add_next_session_columns(features: pd.DataFrame) -> None:
+    """Forward-outcome columns read from each symbol's next row (frame sorted by symbol, trade_date)."""
+    close_ref = pd.to_numeric(features.get("close_auction_reference_price"), errors="coerce")
+    features["next_trade_date"] = features.groupby("symbol")["trade_date"].shift(-1)
+    if "market_open_price" in features.columns:
+        next_day_open_from_intraday = pd.to_numeric(features.groupby("symbol")["market_open_price"].shift(-1), errors="coerce")
+    else:
+        next_day_open_from_intraday = pd.Series(np.nan, index=features.index, dtype=float)
+    if "day_open" in features.columns:
+        next_day_open_from_daily = pd.to_numeric(features.groupby("symbol")["day_open"].shift(-1), errors="coerce")
+    else:
+        next_day_open_from_daily = pd.Series(np.nan, index=features.index, dtype=float)
+    features["next_day_open_price"] = pd.Series(next_day_open_from_intraday).combine_first(next_day_open_from_daily)
+    if "exact_1000_price" in features.columns:
+        next_day_window_end_from_exact = pd.to_numeric(features.groupby("symbol")["exact_1000_price"].shift(-1), errors="coerce")
+    else:
+        next_day_window_end_from_exact = pd.Series(np.nan, index=features.index, dtype=float)
+    if "current_price" in features.columns:
+        next_day_window_end_from_current = pd.to_numeric(features.groupby("symbol")["current_price"].shift(-1), errors="coerce")
+    else:
+        next_day_window_end_from_current = pd.Series(np.nan, index=features.index, dtype=float)
+    features["next_day_window_end_price"] = pd.Series(next_day_window_end_from_exact).combine_first(next_day_window_end_from_current)
+    next_open = pd.to_numeric(features.get("next_day_open_price"), errors="coerce")
+    next_window_end = pd.to_numeric(features.get("next_day_window_end_price"), errors="coerce")
+    features["close_to_next_open_return_pct"] = np.where(
+        close_ref > 0,
+        ((next_open / close_ref) - 1.0) * 100.0,
+        np.nan,
+    )
+    features["next_open_to_window_end_return_pct"] = np.where(
+        next_open > 0,
+        ((next_window_end / next_open) - 1.0) * 100.0,
+        np.nan,
+    )
+    features["close_to_next_window_end_return_pct"] = np.where(
+        close_ref > 0,
+        ((next_window_end / close_ref) - 1.0) * 100.0,
+        np.nan,
+    )
+    features["has_next_day_outcome"] = features["next_trade_date"].notna() & next_open.gt(0) & next_window_end.gt(0)
+
+
+def _trailing_session_mean(values: pd.Series, symbols: pd.Series, *, sessions: int = DAILY_FEATURE_TRAILING_SESSIONS) -> np.ndarray:
+    """Mean of the previous ``sessions`` rows of the same symbol, skipping NaN.
+
+    Same semantics as ``shift(1).rolling(sessions, min_periods=1).mean()`` per
+    symbol, but every row is summed from its own window (lag 1 first) instead
+    of a running sum, so a row's value does not depend on where the frame
+    starts -- the incremental builder relies on that to match a full rebuild
+    bit for bit. Rows must be sorted by symbol, then trade date.
+    """
+    data = pd.to_numeric(values, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    keys = symbols.to_numpy()
+    index = np.arange(len(data))
+    group_start = np.zeros(len(data), dtype=np.int64)
+    if len(data):
+        is_start = np.empty(len(data), dtype=bool)
+        is_start[0] = True
+        is_start[1:] = keys[1:] != keys[:-1]
+        group_start = np.maximum.accumulate(np.where(is_start, index, 0))
+    position = index - group_start
+    total = np.zeros(len(data), dtype=float)
+    count = np.zeros(len(data), dtype=np.int64)
+    for lag in range(1, sessions + 1):
+        lagged = data[np.maximum(index - lag, 0)]
+        present = (position >= lag) & ~np.isnan(lagged)
+        total += np.where(present, lagged, 0.0)
+        count += present
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(count > 0, total / count, np.nan)
+
+
+def _add_trailing_volume_columns(features: pd.DataFrame) -> None:
+    for source, average in (
+        ("open_1m_volume", "avg_open_1m_volume_20d"),
+        ("open_5m_volume", "avg_open_5m_volume_20d"),
+        ("day_volume", "avg_day_volume_20d"),
+    ):
+        features[average] = _trailing_session_mean(features[source], features["symbol"])
+    features["open_1m_rvol_20d"] = np.where(
+        pd.to_numeric(features["avg_open_1m_volume_20d"], errors="coerce") > 0,
+        pd.to_numeric(features["open_1m_volume"], errors="coerce") / pd.to_numeric(features["avg_open_1m_volume_20d"], errors="coerce"),
+        np.nan,
+    )
+    features["open_5m_rvol_20d"] = np.where(
+        pd.to_numeric(features["avg_open_5m_volume_20d"], errors="coerce") > 0,
+        pd.to_numeric(features["open_5m_volume"], errors="coerce") / pd.to_numeric(features["avg_open_5m_volume_20d"], errors="coerce"),
+        np.nan,
+    )
+    features["day_volume_rvol_20d"] = np.where(
+        pd.to_numeric(features["avg_day_volume_20d"], errors="coerce") > 0,
+        pd.to_numeric(features["day_volume"], errors="coerce") / pd.to_numeric(features["avg_day_volume_20d"], errors="coerce"),
+        np.nan,
+    )
+
+
 def build_daily_features_full_universe(
     *,
     trading_days: list[date],
@@ -3547,12 +4701,7 @@ def build_daily_features_full_universe(
     if close_outcome_minute_detail_all is None:
         close_outcome_minute_detail_all = pd.DataFrame()
 
-    optional_universe_columns = [column for column in FULL_UNIVERSE_OPTIONAL_FEATURE_COLUMNS if column in universe.columns]
-    universe_columns = [column for column in ["symbol", "company_name", "exchange", "sector", "industry", "market_cap", *optional_universe_columns] if column in universe.columns]
-    universe_frame = universe[universe_columns].copy() if universe_columns else pd.DataFrame(columns=["symbol"])
-    if not universe_frame.empty:
-        universe_frame["symbol"] = universe_frame["symbol"].astype(str).str.upper()
-        universe_frame = universe_frame.drop_duplicates(subset=["symbol"]).reset_index(drop=True)
+    universe_frame = _full_universe_attribute_frame(universe)
 
     daily = daily_bars.copy()
     if not daily.empty:
@@ -3735,43 +4884,7 @@ def build_daily_features_full_universe(
             ((close_low_2000 / close_ref) - 1.0) * 100.0,
             np.nan,
         )
-        features["next_trade_date"] = features.groupby("symbol")["trade_date"].shift(-1)
-        if "market_open_price" in features.columns:
-            next_day_open_from_intraday = pd.to_numeric(features.groupby("symbol")["market_open_price"].shift(-1), errors="coerce")
-        else:
-            next_day_open_from_intraday = pd.Series(np.nan, index=features.index, dtype=float)
-        if "day_open" in features.columns:
-            next_day_open_from_daily = pd.to_numeric(features.groupby("symbol")["day_open"].shift(-1), errors="coerce")
-        else:
-            next_day_open_from_daily = pd.Series(np.nan, index=features.index, dtype=float)
-        features["next_day_open_price"] = pd.Series(next_day_open_from_intraday).combine_first(next_day_open_from_daily)
-        if "exact_1000_price" in features.columns:
-            next_day_window_end_from_exact = pd.to_numeric(features.groupby("symbol")["exact_1000_price"].shift(-1), errors="coerce")
-        else:
-            next_day_window_end_from_exact = pd.Series(np.nan, index=features.index, dtype=float)
-        if "current_price" in features.columns:
-            next_day_window_end_from_current = pd.to_numeric(features.groupby("symbol")["current_price"].shift(-1), errors="coerce")
-        else:
-            next_day_window_end_from_current = pd.Series(np.nan, index=features.index, dtype=float)
-        features["next_day_window_end_price"] = pd.Series(next_day_window_end_from_exact).combine_first(next_day_window_end_from_current)
-        next_open = pd.to_numeric(features.get("next_day_open_price"), errors="coerce")
-        next_window_end = pd.to_numeric(features.get("next_day_window_end_price"), errors="coerce")
-        features["close_to_next_open_return_pct"] = np.where(
-            close_ref > 0,
-            ((next_open / close_ref) - 1.0) * 100.0,
-            np.nan,
-        )
-        features["next_open_to_window_end_return_pct"] = np.where(
-            next_open > 0,
-            ((next_window_end / next_open) - 1.0) * 100.0,
-            np.nan,
-        )
-        features["close_to_next_window_end_return_pct"] = np.where(
-            close_ref > 0,
-            ((next_window_end / close_ref) - 1.0) * 100.0,
-            np.nan,
-        )
-        features["has_next_day_outcome"] = features["next_trade_date"].notna() & next_open.gt(0) & next_window_end.gt(0)
+        _add_next_session_columns(features)
     logger.info("[A8] step9a/groupby-cascade done rss=%s", _fmt_rss_pair())
 
     if "open_1m_volume" not in features.columns:
@@ -3839,24 +4952,7 @@ def build_daily_features_full_universe(
     reclaimed_flag = pd.Series(features["reclaimed_start_price_within_30s"], dtype="boolean")
     features["reclaimed_start_price_within_30s"] = reclaimed_flag.fillna(False).astype(bool)
 
-    features["avg_open_1m_volume_20d"] = features.groupby("symbol")["open_1m_volume"].transform(lambda s: s.shift(1).rolling(20, min_periods=1).mean())
-    features["avg_open_5m_volume_20d"] = features.groupby("symbol")["open_5m_volume"].transform(lambda s: s.shift(1).rolling(20, min_periods=1).mean())
-    features["avg_day_volume_20d"] = features.groupby("symbol")["day_volume"].transform(lambda s: s.shift(1).rolling(20, min_periods=1).mean())
-    features["open_1m_rvol_20d"] = np.where(
-        pd.to_numeric(features["avg_open_1m_volume_20d"], errors="coerce") > 0,
-        pd.to_numeric(features["open_1m_volume"], errors="coerce") / pd.to_numeric(features["avg_open_1m_volume_20d"], errors="coerce"),
-        np.nan,
-    )
-    features["open_5m_rvol_20d"] = np.where(
-        pd.to_numeric(features["avg_open_5m_volume_20d"], errors="coerce") > 0,
-        pd.to_numeric(features["open_5m_volume"], errors="coerce") / pd.to_numeric(features["avg_open_5m_volume_20d"], errors="coerce"),
-        np.nan,
-    )
-    features["day_volume_rvol_20d"] = np.where(
-        pd.to_numeric(features["avg_day_volume_20d"], errors="coerce") > 0,
-        pd.to_numeric(features["day_volume"], errors="coerce") / pd.to_numeric(features["avg_day_volume_20d"], errors="coerce"),
-        np.nan,
-    )
+    _add_trailing_volume_columns(features)
 
     coverage = expected.copy()
     coverage = coverage.merge(
@@ -3918,6 +5014,323 @@ def build_daily_features_full_universe(
     return features, coverage
 
 
+# Incremental daily-feature state (single Parquet file). Rows are the full
+# feature frame; coverage columns ride along under the ``coverage:`` prefix,
+# ``daily_bar_digest`` fingerprints the daily bar each row was built from and
+# ``session_input_digest`` the intraday / detail rows of its session. Schema
+# metadata keys live in the ``skipp.`` namespace.
+_FEATURE_STATE_COVERAGE_PREFIX = "coverage:"
+_FEATURE_STATE_DIGEST_COLUMN = "daily_bar_digest"
+_FEATURE_STATE_SESSION_DIGEST_COLUMN = "session_input_digest"
+_SESSION_DIGEST_INPUTS = (
+    "intraday",
+    "second_detail_all",
+    "close_detail_all",
+    "close_trade_detail_all",
+    "close_outcome_minute_detail_all",
+)
+_FEATURE_STATE_PARAMS_KEY = f"{_UNIVERSE_META_PREFIX}feature_state_params"
+_FEATURE_STATE_FEATURE_COLUMNS_KEY = f"{_UNIVERSE_META_PREFIX}feature_state_feature_columns"
+_FEATURE_STATE_COVERAGE_COLUMNS_KEY = f"{_UNIVERSE_META_PREFIX}feature_state_coverage_columns"
+_DAILY_BAR_DIGEST_COLUMNS = ("open", "high", "low", "close", "volume", "previous_close")
+
+
+def _daily_bar_digests(daily_bars: pd.DataFrame) -> pd.DataFrame:
+    """One ``daily_bar_digest`` per (trade_date, symbol) daily bar.
+
+    Split/dividend adjustments rewrite a symbol's whole history, so any
+    changed digest on an already-built session marks the symbol for rebuild.
+    """
+    columns = ["trade_date", "symbol", _FEATURE_STATE_DIGEST_COLUMN]
+    if daily_bars.empty or not {"trade_date", "symbol"}.issubset(daily_bars.columns):
+        return pd.DataFrame(columns=columns)
+    frame = pd.DataFrame(
+        {
+            "trade_date": pd.to_datetime(daily_bars["trade_date"], errors="coerce").dt.date,
+            "symbol": daily_bars["symbol"].astype(str).str.upper(),
+        }
+    )
+    for column in _DAILY_BAR_DIGEST_COLUMNS:
+        values = daily_bars[column] if column in daily_bars.columns else np.nan
+        frame[column] = pd.to_numeric(values, errors="coerce")
+    frame = frame.drop_duplicates(subset=["trade_date", "symbol"], keep="last").reset_index(drop=True)
+    frame[_FEATURE_STATE_DIGEST_COLUMN] = pd.util.hash_pandas_object(frame, index=False).to_numpy()
+    return frame[columns]
+
+
+def _session_input_digests(inputs: dict[str, pd.DataFrame | None]) -> pd.DataFrame:
+    """One ``session_input_digest`` per (trade_date, symbol) over the per-session inputs.
+
+    Every row of the intraday summary and the detail frames is hashed and the
+    hashes are summed per session, so row order does not matter. A session
+    whose rows appeared (an intraday fetch that failed last run), vanished or
+    changed gets a new digest and is rebuilt on its own.
+    """
+    keys = ["trade_date", "symbol"]
+    parts: list[pd.DataFrame] = []
+    for name in _SESSION_DIGEST_INPUTS:
+        frame = inputs.get(name)
+        if frame is None or frame.empty or not set(keys).issubset(frame.columns):
+            continue
+        # Salted per input, so equal rows in two inputs do not cancel out.
+        salt = pd.util.hash_array(np.array([name], dtype=object))[0]
+        parts.append(
+            pd.DataFrame(
+                {
+                    "trade_date": pd.to_datetime(frame["trade_date"], errors="coerce").dt.date,
+                    "symbol": frame["symbol"].astype(str).str.upper(),
+                    _FEATURE_STATE_SESSION_DIGEST_COLUMN: pd.util.hash_pandas_object(frame, index=False).to_numpy() + salt,
+                }
+            )
+        )
+    if not parts:
+        return pd.DataFrame(columns=[*keys, _FEATURE_STATE_SESSION_DIGEST_COLUMN])
+    # uint64 sums wrap around, which keeps the digest exact.
+    return pd.concat(parts, ignore_index=True).groupby(keys, as_index=False, sort=False)[_FEATURE_STATE_SESSION_DIGEST_COLUMN].sum()
+
+
+def _merge_digests(frame: pd.DataFrame, digests: pd.DataFrame, column: str, *, suffix: str = "") -> pd.Series:
+    """``digests[column]`` aligned to the (trade_date, symbol) rows of ``frame``; 0 where absent."""
+    nullable = digests.astype({column: "UInt64"}).rename(columns={column: f"{column}{suffix}"})
+    merged = frame[["trade_date", "symbol"]].merge(nullable, on=["trade_date", "symbol"], how="left")
+    # The nullable dtype keeps unmatched rows from turning the hashes into floats.
+    return merged[f"{column}{suffix}"].fillna(0).astype("uint64").set_axis(frame.index)
+
+
+def _slice_symbol_day_frame(frame: pd.DataFrame | None, *, days: set[date], symbols: set[str] | None = None) -> pd.DataFrame | None:
+    if frame is None or frame.empty or "trade_date" not in frame.columns:
+        return frame
+    mask = pd.to_datetime(frame["trade_date"], errors="coerce").dt.date.isin(days)
+    if symbols is not None and "symbol" in frame.columns:
+        mask &= frame["symbol"].astype(str).str.upper().isin(symbols)
+    return frame.loc[mask].reset_index(drop=True)
+
+
+def _read_daily_feature_state(path: Path, *, params: str) -> tuple[pd.DataFrame, list[str], list[str]] | None:
+    """Return ``(state, feature_columns, coverage_columns)`` or ``None`` when unusable."""
+    if not path.exists():
+        return None
+    try:
+        import pyarrow.parquet as pq
+
+        raw = pq.read_schema(path).metadata or {}
+        meta = {key.decode("utf-8"): value.decode("utf-8") for key, value in raw.items()}
+        if meta.get(_FEATURE_STATE_PARAMS_KEY) != params:
+            logger.info("daily feature state %s was built with other parameters; rebuilding", path.name)
+            return None
+        feature_columns = json.loads(meta[_FEATURE_STATE_FEATURE_COLUMNS_KEY])
+        coverage_columns = json.loads(meta[_FEATURE_STATE_COVERAGE_COLUMNS_KEY])
+        state = pd.read_parquet(path)
+    except Exception:
+        logger.warning("daily feature state %s is unreadable; rebuilding", path, exc_info=True)
+        return None
+    return state, feature_columns, coverage_columns
+
+
+def _write_daily_feature_state(
+    path: Path,
+    features: pd.DataFrame,
+    coverage: pd.DataFrame,
+    digests: pd.DataFrame,
+    session_digests: pd.DataFrame,
+    *,
+    params: str,
+) -> None:
+    keys = ["trade_date", "symbol"]
+    if len(features) != len(coverage) or not features[keys].equals(coverage[keys]):
+        logger.warning("daily feature state not written: feature and coverage rows are not aligned (%s)", path.name)
+        return
+    state = features.copy()
+    for column in coverage.columns.drop(keys):
+        state[f"{_FEATURE_STATE_COVERAGE_PREFIX}{column}"] = coverage[column].to_numpy()
+    state[_FEATURE_STATE_DIGEST_COLUMN] = _merge_digests(state, digests, _FEATURE_STATE_DIGEST_COLUMN)
+    state[_FEATURE_STATE_SESSION_DIGEST_COLUMN] = _merge_digests(
+        state, session_digests, _FEATURE_STATE_SESSION_DIGEST_COLUMN
+    )
+    _write_parquet_atomic(
+        path,
+        state,
+        metadata={
+            _FEATURE_STATE_PARAMS_KEY: params,
+            _FEATURE_STATE_FEATURE_COLUMNS_KEY: json.dumps(list(features.columns)),
+            _FEATURE_STATE_COVERAGE_COLUMNS_KEY: json.dumps(list(coverage.columns)),
+        },
+    )
+
+
+def build_daily_features_incremental(
+    state_path: Path,
+    *,
+    trading_days: list[date],
+    universe: pd.DataFrame,
+    daily_bars: pd.DataFrame,
+    intraday: pd.DataFrame,
+    second_detail_all: pd.DataFrame,
+    close_detail_all: pd.DataFrame | None = None,
+    close_trade_detail_all: pd.DataFrame | None = None,
+    close_outcome_minute_detail_all: pd.DataFrame | None = None,
+    display_timezone: str = DEFAULT_DISPLAY_TZ,
+    premarket_anchor_et: time = time(8, 0),
+    open_window_start: time | None = None,
+    open_window_end: time | None = None,
+    smc_base_only: bool = False,
+    invalidate_symbols: Iterable[str] = (),
+    force_rebuild: bool = False,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """``build_daily_features_full_universe`` that reuses the rows stored at ``state_path``.
+
+    Only sessions missing from the state are aggregated for the whole
+    universe. Symbols that are new to the universe, listed in
+    ``invalidate_symbols`` (corporate actions) or whose daily bars changed
+    on an already-built session are rebuilt over every session; stored
+    sessions whose intraday or detail rows changed are rebuilt for the
+    affected symbols only. Universe
+    attributes are re-joined onto stored rows, and the cross-session columns
+    (next-session outcomes, trailing volume means) are recomputed over the
+    combined frame, so the result equals a full rebuild. Falls back to a
+    full rebuild when the state is missing, was built with other
+    parameters, or its columns no longer match the fresh rows. The state is
+    rewritten on every call.
+    """
+    build_options = {
+        "display_timezone": display_timezone,
+        "premarket_anchor_et": premarket_anchor_et,
+        "open_window_start": open_window_start,
+        "open_window_end": open_window_end,
+        "smc_base_only": smc_base_only,
+    }
+    inputs = {
+        "daily_bars": daily_bars,
+        "intraday": intraday,
+        "second_detail_all": second_detail_all,
+        "close_detail_all": close_detail_all,
+        "close_trade_detail_all": close_trade_detail_all,
+        "close_outcome_minute_detail_all": close_outcome_minute_detail_all,
+    }
+    params = json.dumps(
+        {"version": DAILY_FEATURE_STATE_VERSION, **{key: str(value) for key, value in build_options.items()}},
+        sort_keys=True,
+    )
+    started = time_module.perf_counter()
+    digests = _daily_bar_digests(daily_bars)
+    session_digests = _session_input_digests(inputs)
+
+    def _full_rebuild(reason: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+        features, coverage = build_daily_features_full_universe(
+            trading_days=trading_days, universe=universe, **inputs, **build_options
+        )
+        if not features.empty:
+            _write_daily_feature_state(state_path, features, coverage, digests, session_digests, params=params)
+        logger.info(
+            "build_daily_features_incremental: full rebuild (%s) rows=%d elapsed=%.2fs",
+            reason,
+            len(features),
+            time_module.perf_counter() - started,
+        )
+        return features, coverage
+
+    loaded = None if force_rebuild else _read_daily_feature_state(state_path, params=params)
+    if loaded is None:
+        return _full_rebuild("forced" if force_rebuild else "no usable state")
+    state, feature_columns, coverage_columns = loaded
+
+    expected = _build_expected_symbol_day_frame(trading_days, universe)
+    if expected.empty:
+        return _full_rebuild("empty universe")
+    symbols = set(expected["symbol"])
+    day_set = set(trading_days)
+    stored_days = set(state["trade_date"])
+    new_days = sorted(day_set - stored_days)
+    reused_days = day_set & stored_days
+    state = state[state["trade_date"].isin(reused_days) & state["symbol"].isin(symbols)].reset_index(drop=True)
+    if state.empty:
+        return _full_rebuild("no reusable sessions")
+
+    keys = ["trade_date", "symbol"]
+    current_digest = _merge_digests(state, digests, _FEATURE_STATE_DIGEST_COLUMN)
+    changed = set(state.loc[current_digest.ne(state[_FEATURE_STATE_DIGEST_COLUMN]), "symbol"])
+    rebuild_symbols = (symbols - set(state["symbol"])) | changed | ({str(symbol).upper() for symbol in invalidate_symbols} & symbols)
+    state = state[~state["symbol"].isin(rebuild_symbols)].reset_index(drop=True)
+    current_session_digest = _merge_digests(state, session_digests, _FEATURE_STATE_SESSION_DIGEST_COLUMN)
+    stale_sessions = state.loc[current_session_digest.ne(state[_FEATURE_STATE_SESSION_DIGEST_COLUMN]), keys]
+    stale_days = set(stale_sessions["trade_date"])
+    stale_symbols = set(stale_sessions["symbol"])
+    if stale_sessions.size:
+        state = state[~(state["trade_date"].isin(stale_days) & state["symbol"].isin(stale_symbols))].reset_index(drop=True)
+
+    pieces: list[tuple[pd.DataFrame, pd.DataFrame]] = []
+    if new_days:
+        new_day_set = set(new_days)
+        pieces.append(
+            build_daily_features_full_universe(
+                trading_days=new_days,
+                universe=universe,
+                **{name: _slice_symbol_day_frame(frame, days=new_day_set) for name, frame in inputs.items()},
+                **build_options,
+            )
+        )
+    if rebuild_symbols and reused_days:
+        rebuild_universe = universe[universe["symbol"].astype(str).str.upper().isin(rebuild_symbols)]
+        pieces.append(
+            build_daily_features_full_universe(
+                trading_days=sorted(reused_days),
+                universe=rebuild_universe,
+                **{
+                    name: _slice_symbol_day_frame(frame, days=reused_days, symbols=rebuild_symbols)
+                    for name, frame in inputs.items()
+                },
+                **build_options,
+            )
+        )
+    if stale_days:
+        stale_universe = universe[universe["symbol"].astype(str).str.upper().isin(stale_symbols)]
+        pieces.append(
+            build_daily_features_full_universe(
+                trading_days=sorted(stale_days),
+                universe=stale_universe,
+                **{
+                    name: _slice_symbol_day_frame(frame, days=stale_days, symbols=stale_symbols)
+                    for name, frame in inputs.items()
+                },
+                **build_options,
+            )
+        )
+    for piece_features, piece_coverage in pieces:
+        if set(piece_features.columns) != set(feature_columns) or set(piece_coverage.columns) != set(coverage_columns):
+            return _full_rebuild("feature columns changed")
+
+    universe_frame = _full_universe_attribute_frame(universe)
+    attribute_columns = [column for column in universe_frame.columns if column != "symbol"]
+    if not set(attribute_columns).issubset(feature_columns):
+        return _full_rebuild("universe attributes changed")
+    stored_features = state[feature_columns].drop(columns=attribute_columns).merge(universe_frame, on="symbol", how="left")
+    stored_coverage = state[[f"{_FEATURE_STATE_COVERAGE_PREFIX}{column}" if column not in keys else column for column in coverage_columns]]
+    stored_coverage.columns = coverage_columns
+
+    features = pd.concat(
+        [stored_features[feature_columns], *(piece[0][feature_columns] for piece in pieces)], ignore_index=True
+    )
+    features = features.sort_values(["symbol", "trade_date"]).reset_index(drop=True)
+    if not smc_base_only:
+        _add_next_session_columns(features)
+    _add_trailing_volume_columns(features)
+    coverage = pd.concat([stored_coverage, *(piece[1][coverage_columns] for piece in pieces)], ignore_index=True)
+    coverage = coverage.sort_values(["symbol", "trade_date"]).reset_index(drop=True)
+
+    _write_daily_feature_state(state_path, features, coverage, digests, session_digests, params=params)
+    logger.info(
+        "build_daily_features_incremental: reused_rows=%d new_sessions=%d rebuilt_symbols=%d "
+        "rebuilt_sessions=%d rows=%d elapsed=%.2fs",
+        len(stored_features),
+        len(new_days),
+        len(rebuild_symbols),
+        len(stale_sessions),
+        len(features),
+        time_module.perf_counter() - started,
+    )
+    return features, coverage
+
+
 def _filter_materialized_detail_rows(
     frame: pd.DataFrame,
     *,
@@ -3979,9 +5392,30 @@ def estimate_databento_costs(
     window_start: time | None = None,
     window_end: time | None = None,
     premarket_anchor_et: time = time(8, 0),
+    cost_stats_path: str | Path | None = None,
+    refresh_cost_stats: Refresh = "missing",
 ) -> pd.DataFrame:
+    """Estimate the daily-bar and intraday ``ohlcv-1s`` cost of an export.
+
+    Without ``cost_stats_path`` every range is priced by the metadata API.
+    With it, the ranges are estimated offline from the SQLite statistics at
+    that path (see :mod:`databento_cost_model`) and the API is only asked
+    per ``refresh_cost_stats``.
+    """
     if not trading_days:
         return pd.DataFrame(columns=["scope", "cost_usd", "billable_size_bytes"])
+    if cost_stats_path is not None:
+        return _estimate_databento_costs_offline(
+            databento_api_key,
+            dataset=dataset,
+            trading_days=trading_days,
+            display_timezone=display_timezone,
+            window_start=window_start,
+            window_end=window_end,
+            premarket_anchor_et=premarket_anchor_et,
+            cost_stats_path=cost_stats_path,
+            refresh=refresh_cost_stats,
+        )
     client = _make_databento_client(databento_api_key)
     rows: list[dict[str, Any]] = []
     daily_start = trading_days[0] - timedelta(days=14)
@@ -4057,6 +5491,97 @@ def estimate_databento_costs(
     return pd.DataFrame(rows)
 
 
+def _cost_requests(
+    *,
+    dataset: str,
+    trading_days: list[date],
+    display_timezone: str,
+    window_start: time | None,
+    window_end: time | None,
+    premarket_anchor_et: time,
+    daily_available_end: pd.Timestamp | None,
+) -> list[CostRequest]:
+    """The ranges ``estimate_databento_costs`` prices, one ``CostRequest`` each."""
+    cost_requests: list[CostRequest] = []
+    daily_start = trading_days[0] - timedelta(days=14)
+    daily_end_exclusive = _daily_request_end_exclusive(trading_days[-1], daily_available_end)
+    if daily_end_exclusive > daily_start:
+        cost_requests.append(
+            CostRequest.build(
+                "daily_ohlcv_1d", dataset=dataset, schema="ohlcv-1d", start=daily_start, end=daily_end_exclusive
+            )
+        )
+    for trade_day in trading_days:
+        day_ws, day_we = _resolve_window_for_date(trade_day, display_timezone, window_start, window_end)
+        window = build_window_definition(
+            trade_day,
+            display_timezone=display_timezone,
+            window_start=day_ws,
+            window_end=day_we,
+            premarket_anchor_et=premarket_anchor_et,
+        )
+        cost_requests.append(
+            CostRequest.build(
+                "intraday_ohlcv_1s_total",
+                dataset=dataset,
+                schema="ohlcv-1s",
+                start=window.fetch_start_utc,
+                end=_exclusive_ohlcv_1s_end(window.fetch_end_utc),
+            )
+        )
+    return cost_requests
+
+
+def _estimate_databento_costs_offline(
+    databento_api_key: str,
+    *,
+    dataset: str,
+    trading_days: list[date],
+    display_timezone: str,
+    window_start: time | None,
+    window_end: time | None,
+    premarket_anchor_et: time,
+    cost_stats_path: str | Path,
+    refresh: Refresh,
+) -> pd.DataFrame:
+    options = {
+        "dataset": dataset,
+        "trading_days": trading_days,
+        "display_timezone": display_timezone,
+        "window_start": window_start,
+        "window_end": window_end,
+        "premarket_anchor_et": premarket_anchor_et,
+    }
+    with CostStatsCache(cost_stats_path) as stats:
+        plan = None
+        if refresh != "always":
+            # Offline first: the daily range is not clamped to the schema's
+            # available end, which only matters for a same-day export.
+            plan = plan_costs(_cost_requests(**options, daily_available_end=None), stats, refresh="never")
+        if plan is None or (refresh == "missing" and not plan.complete):
+            client = _make_databento_client(databento_api_key)
+            daily_available_end = _get_schema_available_end(client, dataset, "ohlcv-1d")
+            plan = plan_costs(
+                _cost_requests(**options, daily_available_end=daily_available_end), stats, client=client, refresh=refresh
+            )
+    logger.info(
+        "Cost plan: %d requests -> %d estimates, %d live calls, %.1f ms (stats=%s)",
+        plan.requested,
+        len(plan.estimates),
+        plan.live_calls,
+        plan.elapsed_seconds * 1000.0,
+        cost_stats_path,
+    )
+    totals = plan.totals()
+    return pd.DataFrame(
+        [
+            {"scope": scope, "cost_usd": cost, "billable_size_bytes": size}
+            for scope in ("daily_ohlcv_1d", "intraday_ohlcv_1s_total")
+            for cost, size in [totals.get(scope, (None, None))]
+        ]
+    )
+
+
 def default_export_directory() -> Path:
     return Path.home() / "Downloads"
 
@@ -4416,7 +5941,11 @@ def build_run_manifest_frame(manifest: dict[str, Any]) -> pd.DataFrame:
 
 
 def _prepare_frame_for_excel(frame: pd.DataFrame) -> pd.DataFrame:
-    return prepare_frame_for_excel(frame)
+    return _production_workbook.prepare_frame_for_excel(frame)
+
+
+def create_excel_workbook_bytes(summary: pd.DataFrame, **sheets: Any) -> bytes:
+    return _production_workbook.create_excel_workbook_bytes(summary, **sheets)
 
 
 def create_excel_workbook(
@@ -14,7 +14,10 @@ Two deliberate statistical choices:
    an i.i.d. permutation/bootstrap would understate the p-value (anti-
    conservative). We resample with the Politis-Romano stationary block bootstrap
    (the C3.1 primitive in :mod:`smc_core.inference.bootstrap`) using an expected
-   block length tied to the family's outcome horizon.
+   block length tied to the family's outcome horizon. Seeded p-values with
+   ``block_length > 1`` follow that primitive's RNG stream, which changed when
+   its index generation was vectorised (same null distribution, different
+   draws); ``block_length == 1`` p-values are unchanged.
 
 2. **FDR, not per-test alpha.** A single family in isolation has no false-
    discovery rate — FDR is intrinsically a multiple-testing quantity. The raw
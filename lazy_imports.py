@@ -0,0 +1,74 @@
+"""Deferred imports for optional, import-heavy provider libraries.
+
+``lazy_module`` returns a stand-in that imports the real module on first
+attribute access, so a module can bind a provider (``yfinance``,
+``tradingview_ta`` ...) at module level without paying for its import when
+the entry module (``streamlit_terminal``, ``databento_volatility_screener``)
+is loaded.  ``module_available`` answers the "is it installed" question
+those modules used to answer with a ``try: import`` block, without
+importing anything.
+
+The stand-in never caches attributes of the real module: ``patch.object``
+on the real module stays visible through it, and attributes set on the
+stand-in itself (tests patching ``terminal_bitcoin.yf.Ticker``) shadow
+the real ones for as long as they are set.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule(ModuleType):
+    """Module stand-in that imports ``name`` on first attribute access."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self._lazy_lock = threading.Lock()
+        self._lazy_target: ModuleType | None = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._lazy_target is not None
+
+    def _load(self) -> ModuleType:
+        target = self._lazy_target
+        if target is None:
+            with self._lazy_lock:
+                if self._lazy_target is None:
+                    self._lazy_target = importlib.import_module(self.__name__)
+                target = self._lazy_target
+        return target
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_module(name: str) -> ModuleType:
+    """Return ``name`` if it is already imported, else a ``LazyModule`` for it."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
+
+
+def module_available(name: str) -> bool:
+    """True when ``name`` is imported or importable, without importing it."""
+    if sys.modules.get(name) is not None:
+        return True
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
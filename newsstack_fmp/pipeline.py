@@ -356,6 +356,84 @@ def _filter_uw_news_new(items: list, last_seen: float) -> list:
 
 # ── Core: process a batch of NewsItem objects ───────────────────
 
+def _skip_failed_item(store: SqliteStore, it: NewsItem, exc: Exception, *, marked_seen: bool) -> None:
+    """Log a per-item failure; un-commit its dedup row if it was already marked."""
+    if marked_seen:
+        # Roll back the dedup commit so a transient failure does
+        # not turn into permanent data loss on the next poll cycle.
+        try:
+            store.unmark_seen(it.provider, it.item_id)
+        except Exception:
+            logger.exception(
+                "process_news_items: unmark_seen rollback failed for %s/%s",
+                getattr(it, "provider", "?"),
+                getattr(it, "item_id", "?"),
+            )
+    logger.warning(
+        "process_news_items: skipping item provider=%s id=%s due to %s",
+        getattr(it, "provider", "?"),
+        getattr(it, "item_id", "?"),
+        type(exc).__name__,
+        exc_info=exc,
+    )
+
+
+def _mark_seen_batch(store: SqliteStore, pending: list[tuple[NewsItem, float]]) -> list[bool]:
+    """Dedup *pending* in one transaction via ``mark_seen_many``.
+
+    If the bulk call fails, falls back to per-item ``mark_seen`` so a single
+    bad row cannot drop the whole batch; items that still fail are logged
+    and reported as not new.
+    """
+    if not pending:
+        return []
+    try:
+        return store.mark_seen_many([(it.provider, it.item_id, ts) for it, ts in pending])
+    except Exception:
+        logger.warning(
+            "process_news_items: mark_seen_many failed for %d items, falling back to per-item dedup",
+            len(pending),
+            exc_info=True,
+        )
+    flags: list[bool] = []
+    for it, ts in pending:
+        try:
+            flags.append(bool(store.mark_seen(it.provider, it.item_id, ts)))
+        except Exception as exc:
+            _skip_failed_item(store, it, exc, marked_seen=False)
+            flags.append(False)
+    return flags
+
+
+def _cluster_touch_batch(
+    store: SqliteStore, touches: list[tuple[NewsItem, float, list[str], str]]
+) -> list[int | None]:
+    """Touch the novelty clusters of *touches* in one transaction.
+
+    Mirrors :func:`_mark_seen_batch`: on bulk failure each item is touched
+    individually, and an item whose touch fails is un-marked and reported
+    as ``None``.
+    """
+    if not touches:
+        return []
+    try:
+        return [count for count, _ in store.cluster_touch_many([(chash, ts) for _, ts, _, chash in touches])]
+    except Exception:
+        logger.warning(
+            "process_news_items: cluster_touch_many failed for %d items, falling back to per-item touches",
+            len(touches),
+            exc_info=True,
+        )
+    counts: list[int | None] = []
+    for it, ts, _, chash in touches:
+        try:
+            counts.append(store.cluster_touch(chash, ts)[0])
+        except Exception as exc:
+            _skip_failed_item(store, it, exc, marked_seen=True)
+            counts.append(None)
+    return counts
+
+
 def process_news_items(
     store: SqliteStore,
     items: list[NewsItem],
@@ -370,6 +448,10 @@ def process_news_items(
 ) -> tuple[float, int]:
     """Dedupe → novelty → score → enrich a batch of :class:`NewsItem`.
 
+    Dedup and novelty clustering each run as one SQLite transaction per
+    batch (``mark_seen_many`` / ``cluster_touch_many``); scoring and
+    enrichment then walk the surviving items in batch order.
+
     Returns ``(max_ts, enrich_used)`` — the maximum ``updated_ts`` seen
     (for cursor advancement) and the number of enrichment HTTP calls made.
 
@@ -394,12 +476,13 @@ def process_news_items(
     if _enriched_clusters is None:
         _enriched_clusters = {}
 
+    # Phase 1: timestamp + cursor filter (no DB access).
+    pending: list[tuple[NewsItem, float]] = []
     for it in items:
         # Lens 1 (silent-degradation v2): isolate per-item failures so a
         # single bad item (DB locked, scoring crash, malformed payload)
-        # does not silently drop the remainder of the batch. exc_info=True
+        # does not silently drop the remainder of the batch. exc_info
         # preserves the traceback for diagnosis while continuing the loop.
-        marked_seen = False
         try:
             if not it.is_valid:
                 continue
@@ -413,22 +496,27 @@ def process_news_items(
 
             # Cursor check: skip items older than last seen for this provider.
             # Use strict < so items sharing the cursor timestamp are not dropped;
-            # mark_seen() is the authoritative dedup.
+            # mark_seen_many() is the authoritative dedup.
             if ts < last_seen_epoch:
                 continue
 
             # Only advance cursor with real (non-synthetic) timestamps
             if has_real_ts:
                 max_ts = max(max_ts, ts)
+            pending.append((it, ts))
+        except Exception as exc:
+            _skip_failed_item(store, it, exc, marked_seen=False)
 
-            # Dedup (provider, item_id)
-            if not store.mark_seen(it.provider, it.item_id, ts):
-                continue
-            # Track for rollback: if classification/enrich/best_by_ticker
-            # raises below, we must unmark to keep the item retriable.
-            marked_seen = True
+    # Phase 2: dedup (provider, item_id) for the whole batch in one
+    # transaction instead of one INSERT per item.
+    fresh = [entry for entry, is_new in zip(pending, _mark_seen_batch(store, pending), strict=True) if is_new]
 
-            # Tickers + universe filter (deduplicate to avoid redundant per-ticker work)
+    # Phase 3: tickers + universe filter.  Every item from here on is
+    # marked seen, so a failure must unmark it to keep it retriable.
+    to_score: list[tuple[NewsItem, float, list[str], str]] = []
+    for it, ts in fresh:
+        try:
+            # Deduplicate tickers to avoid redundant per-ticker work
             tickers = [t for t in (it.tickers or []) if isinstance(t, str) and t.strip()]
             tickers = list(dict.fromkeys(t.strip().upper() for t in tickers))
             if universe:
@@ -441,9 +529,20 @@ def process_news_items(
 
             # Novelty cluster -- compute hash once, reuse in scorer
             chash = cluster_hash(it.headline or "", it.tickers or [])
-            cluster_count, _ = store.cluster_touch(chash, ts)
-            score = classify_and_score(it, cluster_count=cluster_count, chash=chash)
+            to_score.append((it, ts, tickers, chash))
+        except Exception as exc:
+            _skip_failed_item(store, it, exc, marked_seen=True)
+
+    # Phase 4: novelty clusters, one transaction; counts match sequential
+    # per-item touches in batch order.
+    cluster_counts = _cluster_touch_batch(store, to_score)
 
+    # Phase 5: score → enrich → best-per-ticker, in batch order.
+    for (it, ts, tickers, chash), cluster_count in zip(to_score, cluster_counts, strict=True):
+        if cluster_count is None:
+            continue
+        try:
+            score = classify_and_score(it, cluster_count=cluster_count, chash=chash)
             warn_flags: list[str] = []
             if score.category == "offering":
                 warn_flags.append("offering_risk")
@@ -507,25 +606,7 @@ def process_news_items(
                     ):
                         best_by_ticker[tk] = cand
         except Exception as exc:
-            if marked_seen:
-                # Roll back the dedup commit so a transient failure does
-                # not turn into permanent data loss on the next poll cycle.
-                try:
-                    store.unmark_seen(it.provider, it.item_id)
-                except Exception:
-                    logger.exception(
-                        "process_news_items: unmark_seen rollback failed for %s/%s",
-                        getattr(it, "provider", "?"),
-                        getattr(it, "item_id", "?"),
-                    )
-            logger.warning(
-                "process_news_items: skipping item provider=%s id=%s due to %s",
-                getattr(it, "provider", "?"),
-                getattr(it, "item_id", "?"),
-                type(exc).__name__,
-                exc_info=True,
-            )
-            continue
+            _skip_failed_item(store, it, exc, marked_seen=True)
 
     return max_ts, enrich_count
 
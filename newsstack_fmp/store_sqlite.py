@@ -16,6 +16,7 @@ import os
 import sqlite3
 import threading
 import time
+from collections.abc import Iterable
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +43,24 @@ CREATE TABLE IF NOT EXISTS clusters (
 CREATE INDEX IF NOT EXISTS idx_clusters_last_ts ON clusters(last_ts);
 """
 
+# Per-connection staging tables for the bulk APIs: rows are loaded with
+# ``executemany`` (which cannot return rows) and then upserted with one
+# ``INSERT ... SELECT ... RETURNING``.  ``WHERE true`` is required by the
+# SQLite grammar for an upsert fed by a SELECT.
+_BATCH_SCHEMA = """
+CREATE TEMP TABLE IF NOT EXISTS batch_seen (
+  provider TEXT NOT NULL,
+  item_id TEXT NOT NULL,
+  ts REAL NOT NULL
+);
+CREATE TEMP TABLE IF NOT EXISTS batch_clusters (
+  hash TEXT NOT NULL,
+  first_ts REAL NOT NULL,
+  last_ts REAL NOT NULL,
+  n INTEGER NOT NULL
+);
+"""
+
 # ── Retry parameters ───────────────────────────────────────────
 _MAX_RETRIES = 5
 _BASE_BACKOFF_S = 0.1  # 100ms, 200ms, 400ms, 800ms, 1600ms
@@ -144,6 +163,7 @@ class SqliteStore:
             self.conn = self._connect(self._path)
 
         self.conn.executescript(SCHEMA)
+        self.conn.executescript(_BATCH_SCHEMA)
         logger.debug("SqliteStore singleton ready: %s", self._path)
 
     @classmethod
@@ -175,6 +195,7 @@ class SqliteStore:
             logger.info("Reconnecting SQLite: %s", self._path)
             self.conn = self._connect(self._path)
             self.conn.executescript(SCHEMA)
+            self.conn.executescript(_BATCH_SCHEMA)
 
     # ── Key-value ───────────────────────────────────────────────
 
@@ -207,6 +228,47 @@ class SqliteStore:
         except sqlite3.IntegrityError:
             return False
 
+    def mark_seen_many(self, rows: Iterable[tuple[str, str, float]]) -> list[bool]:
+        """Bulk ``mark_seen`` for ``(provider, item_id, ts)`` rows in one transaction.
+
+        Returns one flag per input row, in input order: True if the row was
+        newly inserted, False if it was already seen -- including a repeat of
+        an earlier row in the same call, exactly as sequential ``mark_seen``
+        calls would report it.  ``ON CONFLICT DO NOTHING RETURNING`` yields
+        only the keys that were actually inserted.
+        """
+        # Materialise before the retrying call: a generator would be exhausted
+        # by the first attempt and a retry would commit an empty batch.
+        return self._mark_seen_many(list(rows))
+
+    @_retry_on_locked
+    def _mark_seen_many(self, rows: list[tuple[str, str, float]]) -> list[bool]:
+        if not rows:
+            return []
+        first_index: dict[tuple[str, str], int] = {}
+        for idx, (provider, item_id, _ts) in enumerate(rows):
+            first_index.setdefault((provider, item_id), idx)
+        unique = [rows[idx] for idx in first_index.values()]
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.executemany("INSERT INTO batch_seen(provider,item_id,ts) VALUES(?,?,?)", unique)
+                inserted = set(
+                    self.conn.execute(
+                        "INSERT INTO seen(provider,item_id,ts) SELECT provider, item_id, ts FROM batch_seen "
+                        "WHERE true ON CONFLICT(provider,item_id) DO NOTHING RETURNING provider, item_id"
+                    ).fetchall()
+                )
+                self.conn.execute("DELETE FROM batch_seen")
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+        return [
+            first_index[(provider, item_id)] == idx and (provider, item_id) in inserted
+            for idx, (provider, item_id, _ts) in enumerate(rows)
+        ]
+
     @_retry_on_locked
     def unmark_seen(self, provider: str, item_id: str) -> None:
         """Reverse a prior ``mark_seen`` so a transient failure can be retried.
@@ -244,6 +306,61 @@ class SqliteStore:
                 raise
         return (row[0], row[1])
 
+    def cluster_touch_many(self, touches: Iterable[tuple[str, float]]) -> list[tuple[int, float]]:
+        """Bulk ``cluster_touch`` for ``(hash, ts)`` pairs in one transaction.
+
+        Returns ``(count, first_ts)`` per input pair, in input order, equal to
+        what sequential ``cluster_touch`` calls would have returned.  Repeats
+        of a hash are folded into one upsert (``count + k``, ``MAX`` of the
+        timestamps); the n-th touch of a hash within the call then reports
+        ``count_after - k + n``.  RETURNING yields the post-upsert counts.
+        """
+        # Materialised here for the same reason as in ``mark_seen_many``.
+        return self._cluster_touch_many(list(touches))
+
+    @_retry_on_locked
+    def _cluster_touch_many(self, touches: list[tuple[str, float]]) -> list[tuple[int, float]]:
+        if not touches:
+            return []
+        # hash -> [first ts in call, max ts in call, touches in call]
+        folded: dict[str, list[float]] = {}
+        for h, ts in touches:
+            agg = folded.get(h)
+            if agg is None:
+                folded[h] = [ts, ts, 1]
+            else:
+                agg[1] = max(agg[1], ts)
+                agg[2] += 1
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.executemany(
+                    "INSERT INTO batch_clusters(hash, first_ts, last_ts, n) VALUES(?,?,?,?)",
+                    [(h, first_ts, last_ts, int(n)) for h, (first_ts, last_ts, n) in folded.items()],
+                )
+                final = {
+                    h: (count, first_ts)
+                    for h, count, first_ts in self.conn.execute(
+                        "INSERT INTO clusters(hash, first_ts, last_ts, count) "
+                        "SELECT hash, first_ts, last_ts, n FROM batch_clusters WHERE true "
+                        "ON CONFLICT(hash) DO UPDATE SET last_ts=MAX(clusters.last_ts, excluded.last_ts), "
+                        "count=clusters.count+excluded.count RETURNING hash, count, first_ts"
+                    ).fetchall()
+                }
+                self.conn.execute("DELETE FROM batch_clusters")
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+        seen_in_call: dict[str, int] = {}
+        out: list[tuple[int, float]] = []
+        for h, _ts in touches:
+            nth = seen_in_call.get(h, 0) + 1
+            seen_in_call[h] = nth
+            count, first_ts = final[h]
+            out.append((count - int(folded[h][2]) + nth, first_ts))
+        return out
+
     # ── Maintenance ─────────────────────────────────────────────
 
     @_retry_on_locked
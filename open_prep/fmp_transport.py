@@ -0,0 +1,113 @@
+"""Pluggable HTTP transports for :class:`open_prep.macro.FMPClient`.
+
+``FMPClient`` historically opened a fresh ``urllib.request.urlopen``
+connection per call, paying a TCP + TLS handshake on every request. A
+transport lets the client reuse connections instead, without changing any
+of the retry / circuit-breaker / endpoint-stats logic in
+``FMPClient._execute_get``: transports report failures as the same
+``urllib.error.HTTPError`` / ``URLError`` exceptions ``urlopen`` raises.
+
+Design notes:
+  - ``PooledHTTPTransport`` wraps one ``httpx.Client`` (the repo's standard
+    HTTP client). httpx keeps a keep-alive pool per origin, so every FMP
+    host gets up to ``pool_size`` persistent connections shared by all
+    threads of the client (``get_batch_quotes`` fans out over a pool).
+  - The ``httpx.Client`` is created lazily on first use, so building an
+    ``FMPClient`` that never makes a request opens nothing.
+  - ``timeout`` passed per request wins over the constructor default, which
+    keeps ``FMPClient.timeout_seconds`` authoritative.
+  - In-flight requests are capped at ``pool_size`` by a semaphore, so threads
+    queue here instead of inside httpcore's pool: with httpx 0.28 /
+    httpcore 1.0 sync clients, threads waiting on a saturated pool can be
+    handed a connection another thread still uses (ReadError "Bad file
+    descriptor" / spurious ReadTimeout).
+"""
+
+from __future__ import annotations
+
+import io
+import ssl
+import threading
+import urllib.error
+from collections.abc import Mapping
+from email.message import Message
+from typing import Protocol
+
+import httpx
+
+DEFAULT_POOL_SIZE = 8
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+
+class FMPTransport(Protocol):
+    """Minimal GET transport used by ``FMPClient._request_once``."""
+
+    def get_text(self, url: str, *, headers: Mapping[str, str], timeout: float) -> str:
+        """Return the UTF-8 decoded response body.
+
+        Must raise ``urllib.error.HTTPError`` for HTTP status >= 400 and
+        ``urllib.error.URLError`` for connection / timeout failures.
+        """
+        ...
+
+    def close(self) -> None:
+        """Release pooled connections."""
+        ...
+
+
+class PooledHTTPTransport:
+    """Keep-alive connection pool (per host) backed by ``httpx.Client``."""
+
+    def __init__(
+        self,
+        *,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+        timeout: float = 30.0,
+        verify: ssl.SSLContext | bool = True,
+    ) -> None:
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be >= 1, got {pool_size}")
+        self.pool_size = int(pool_size)
+        self.keepalive_expiry = float(keepalive_expiry)
+        self.timeout = float(timeout)
+        self._verify = verify
+        self._client: httpx.Client | None = None
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.pool_size)
+
+    def _get_client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    timeout=self.timeout,
+                    verify=self._verify,
+                    limits=httpx.Limits(
+                        max_connections=self.pool_size,
+                        max_keepalive_connections=self.pool_size,
+                        keepalive_expiry=self.keepalive_expiry,
+                    ),
+                )
+            return self._client
+
+    def get_text(self, url: str, *, headers: Mapping[str, str], timeout: float) -> str:
+        client = self._get_client()
+        try:
+            with self._slots:
+                response = client.get(url, headers=dict(headers), timeout=timeout)
+        except httpx.TimeoutException as exc:
+            raise urllib.error.URLError(TimeoutError(str(exc) or "timed out")) from exc
+        except httpx.TransportError as exc:
+            raise urllib.error.URLError(exc) from exc
+        if response.status_code >= 400:
+            hdrs = Message()
+            for key, value in response.headers.multi_items():
+                hdrs[key] = value
+            raise urllib.error.HTTPError(url, response.status_code, response.reason_phrase, hdrs, io.BytesIO(response.content))
+        return response.content.decode("utf-8")
+
+    def close(self) -> None:
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
@@ -22,6 +22,8 @@ from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 from zoneinfo import ZoneInfo
 
+from .fmp_transport import DEFAULT_POOL_SIZE, FMPTransport, PooledHTTPTransport
+
 try:
     import certifi
 except ImportError:  # pragma: no cover
@@ -37,6 +39,9 @@ logger = logging.getLogger(__name__)
 _US_EASTERN = ZoneInfo("America/New_York")
 _FMP_FEATURE_UNAVAILABLE_LOGGED: set[str] = set()
 _FMP_PROFILE_BULK_MAX_PARTS = 100
+# /stable/batch-quote takes a comma-joined symbol list; 100 keeps the URL
+# (plus apikey) well under common proxy/CDN length limits.
+_FMP_QUOTE_BATCH_MAX_SYMBOLS = 100
 
 # R-E2 (2026-06-14): _normalize_tls_certificate_env writes to os.environ which
 # is a process-global mutable shared across all threads. Guard the write with a
@@ -168,6 +173,14 @@ def _normalize_tls_certificate_env() -> str | None:
     return cafile
 
 
+def _resolve_fmp_http_pool_size() -> int:
+    raw = str(os.environ.get("OPEN_PREP_FMP_HTTP_POOL_SIZE") or DEFAULT_POOL_SIZE).strip()
+    try:
+        return max(0, min(int(raw), 64))
+    except ValueError:
+        return DEFAULT_POOL_SIZE
+
+
 def _build_tls_context() -> ssl.SSLContext:
     cafile = _normalize_tls_certificate_env()
     if cafile:
@@ -694,6 +707,9 @@ class FMPClient:
     timeout_seconds: float = 30.0
     base_url: str = "https://financialmodelingprep.com/api/v3"
     stable_base_url: str = "https://financialmodelingprep.com"
+    # None keeps the one-connection-per-call urlopen path; a pooled transport
+    # (see open_prep/fmp_transport.py) reuses keep-alive connections.
+    transport: FMPTransport | None = field(default=None, repr=False)
     _circuit_breaker: _CircuitBreaker = field(default_factory=_CircuitBreaker, init=False, repr=False)
     _last_quote_fetch_diagnostics: dict[str, Any] = field(default_factory=dict, init=False, repr=False)
     # G6 (2026-05-12): per-endpoint usage counters for provider-utilization audits.
@@ -708,7 +724,21 @@ class FMPClient:
 
     @classmethod
     def from_env(cls) -> FMPClient:
-        return cls(api_key=str(os.environ.get("FMP_API_KEY") or ""))
+        """Build a client from ``FMP_API_KEY`` with a pooled keep-alive transport.
+
+        ``OPEN_PREP_FMP_HTTP_POOL_SIZE`` sets the per-host connection pool
+        size (default 8); ``0`` falls back to one ``urlopen`` per call.
+        """
+        pool_size = _resolve_fmp_http_pool_size()
+        transport = None
+        if pool_size > 0:
+            transport = PooledHTTPTransport(pool_size=pool_size, verify=_build_tls_context())
+        return cls(api_key=str(os.environ.get("FMP_API_KEY") or ""), transport=transport)
+
+    def close(self) -> None:
+        """Release pooled transport connections (no-op for the urlopen path)."""
+        if self.transport is not None:
+            self.transport.close()
 
     def _build_url(self, path: str, params: dict[str, Any]) -> str:
         query = {key: value for key, value in params.items() if value is not None}
@@ -736,7 +766,12 @@ class FMPClient:
         return data
 
     def _request_once(self, path: str, params: dict[str, Any]) -> Any:
-        request = Request(self._build_url(path, params), headers={"User-Agent": "skipp-algo/1.0"})
+        url = self._build_url(path, params)
+        headers = {"User-Agent": "skipp-algo/1.0"}
+        if self.transport is not None:
+            payload = self.transport.get_text(url, headers=headers, timeout=self.timeout_seconds)
+            return self._parse_payload(path, payload)
+        request = Request(url, headers=headers)
         with urlopen(request, timeout=self.timeout_seconds, context=_build_tls_context()) as response:
             payload = response.read().decode("utf-8")
         return self._parse_payload(path, payload)
@@ -853,6 +888,22 @@ class FMPClient:
             configured = 4
         return max(1, min(configured, 8, max(symbol_count, 1)))
 
+    def _resolve_quote_batch_size(self) -> int:
+        """Symbols per ``/stable/batch-quote`` request; 1 keeps per-symbol ``/stable/quote``.
+
+        Opt-in because batch-quote is plan-gated on some FMP tiers.
+        """
+        configured_raw = str(
+            os.environ.get("OPEN_PREP_FMP_QUOTE_BATCH_SIZE")
+            or os.environ.get("FMP_QUOTE_BATCH_SIZE")
+            or "1"
+        ).strip()
+        try:
+            configured = int(configured_raw)
+        except ValueError:
+            configured = 1
+        return max(1, min(configured, _FMP_QUOTE_BATCH_MAX_SYMBOLS))
+
     def get_last_quote_fetch_diagnostics(self) -> dict[str, Any]:
         diagnostics = dict(self._last_quote_fetch_diagnostics)
         for key in (
@@ -991,7 +1042,10 @@ class FMPClient:
         started_at = time.perf_counter()
         rows_by_symbol: dict[str, list[dict[str, Any]]] = {}
         failed_symbol_errors: dict[str, str] = {}
-        worker_count = self._resolve_quote_fetch_workers(len(deduped_symbols)) if deduped_symbols else 1
+        batch_size = self._resolve_quote_batch_size()
+        chunks = [deduped_symbols[i:i + batch_size] for i in range(0, len(deduped_symbols), batch_size)]
+        worker_count = self._resolve_quote_fetch_workers(len(chunks)) if chunks else 1
+        batch_fallback_chunks = 0
 
         def fetch_symbol_quote(symbol: str) -> tuple[str, list[dict[str, Any]], str | None]:
             data = self._execute_get("/stable/quote", {"symbol": symbol}, use_circuit_breaker=False)
@@ -1006,32 +1060,61 @@ class FMPClient:
                 return symbol, [], "quote response missing requested symbol"
             return symbol, matching_rows, None
 
-        if worker_count == 1:
-            for symbol in deduped_symbols:
-                try:
-                    fetched_symbol, symbol_rows, error = fetch_symbol_quote(symbol)
-                except Exception as exc:  # pragma: no cover - defensive catch
-                    fetched_symbol, symbol_rows, error = symbol, [], str(exc)
+        def fetch_symbol_quote_safe(symbol: str) -> tuple[str, list[dict[str, Any]], str | None]:
+            try:
+                return fetch_symbol_quote(symbol)
+            except Exception as exc:  # pragma: no cover - defensive catch
+                return symbol, [], str(exc)
+
+        def fetch_quote_chunk(chunk: list[str]) -> tuple[list[tuple[str, list[dict[str, Any]], str | None]], bool]:
+            """Return per-symbol results and whether the batch fell back per symbol."""
+            if len(chunk) == 1:
+                return [fetch_symbol_quote_safe(chunk[0])], False
+            try:
+                data = self._execute_get("/stable/batch-quote", {"symbols": ",".join(chunk)}, use_circuit_breaker=False)
+            except RuntimeError as exc:
+                # Batch endpoint rejected (plan tier, URL limits, outage):
+                # the per-symbol endpoint is the source of truth.
+                logger.debug("FMP batch-quote failed for %d symbols, falling back per symbol: %s", len(chunk), exc)
+                return [fetch_symbol_quote_safe(symbol) for symbol in chunk], True
+            if not isinstance(data, list) or not data:
+                return [(symbol, [], "empty quote response") for symbol in chunk], False
+            grouped: dict[str, list[dict[str, Any]]] = {}
+            for row in data:
+                if isinstance(row, dict):
+                    grouped.setdefault(str(row.get("symbol") or "").strip().upper(), []).append(row)
+            return [
+                (symbol, grouped[symbol], None) if grouped.get(symbol)
+                else (symbol, [], "quote response missing requested symbol")
+                for symbol in chunk
+            ], False
+
+        def record(results: list[tuple[str, list[dict[str, Any]], str | None]]) -> None:
+            for fetched_symbol, symbol_rows, error in results:
                 if error:
                     failed_symbol_errors[fetched_symbol] = error
                     continue
                 rows_by_symbol[fetched_symbol] = symbol_rows
+
+        if worker_count == 1:
+            for chunk in chunks:
+                results, fell_back = fetch_quote_chunk(chunk)
+                batch_fallback_chunks += int(fell_back)
+                record(results)
         else:
             with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="fmp-quote") as executor:
                 future_map = {
-                    executor.submit(fetch_symbol_quote, symbol): symbol
-                    for symbol in deduped_symbols
+                    executor.submit(fetch_quote_chunk, chunk): chunk
+                    for chunk in chunks
                 }
                 for future in as_completed(future_map):
-                    requested_symbol = future_map[future]
+                    requested_chunk = future_map[future]
                     try:
-                        fetched_symbol, symbol_rows, error = future.result()
+                        results, fell_back = future.result()
                     except Exception as exc:  # pragma: no cover - defensive catch
-                        fetched_symbol, symbol_rows, error = requested_symbol, [], str(exc)
-                    if error:
-                        failed_symbol_errors[fetched_symbol] = error
-                        continue
-                    rows_by_symbol[fetched_symbol] = symbol_rows
+                        results, fell_back = [(symbol, [], str(exc)) for symbol in requested_chunk], False
+                    batch_fallback_chunks += int(fell_back)
+                    record(results)
 
         rows: list[dict[str, Any]] = []
         fetched_unique_symbols: list[str] = []
@@ -1049,7 +1132,7 @@ class FMPClient:
         ) or None
         duration_ms = round((time.perf_counter() - started_at) * 1000.0)
         self._last_quote_fetch_diagnostics = {
-            "quote_fetch_mode": "fmp_stable_quote_per_symbol",
+            "quote_fetch_mode": "fmp_stable_batch_quote" if batch_size > 1 else "fmp_stable_quote_per_symbol",
             "requested_symbols": requested_symbols,
             "requested_symbol_count": len(requested_symbols),
             "deduped_symbols": deduped_symbols,
@@ -1064,7 +1147,9 @@ class FMPClient:
             "quote_fetch_all_failed": bool(deduped_symbols) and not fetched_unique_symbols,
             "quote_fetch_duration_ms": duration_ms,
             "quote_fetch_workers": worker_count,
-            "endpoint_used": "/stable/quote",
+            "quote_batch_size": batch_size,
+            "quote_batch_fallback_chunks": batch_fallback_chunks,
+            "endpoint_used": "/stable/batch-quote" if batch_size > 1 else "/stable/quote",
         }
         return rows
 
@@ -73,8 +73,11 @@ class PPOSlicer:
     def _wrap_env(self, env: Any) -> Any:
         if hasattr(env, "action_space") and hasattr(env, "observation_space"):
             return env
-        from rl.simulator.sb3_execution_env import SB3ExecutionEnv
+        from rl.simulator.sb3_execution_env import SB3ExecutionEnv, SB3VectorExecutionEnv
+        from rl.simulator.vector_execution_env import VectorExecutionEnv
 
+        if isinstance(env, VectorExecutionEnv):
+            return SB3VectorExecutionEnv(vector_env=env, order_type=self.order_type)
         return SB3ExecutionEnv(execution_env=env, order_type=self.order_type)
 
     def fit(self, env: Any, total_timesteps: int = 50_000) -> PPOSlicer:  # pragma: no cover
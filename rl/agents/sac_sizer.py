@@ -69,8 +69,11 @@ class SACSizer:
     def _wrap_env(self, env: Any) -> Any:
         if hasattr(env, "action_space") and hasattr(env, "observation_space"):
             return env
-        from rl.simulator.sb3_execution_env import SB3ExecutionEnv
+        from rl.simulator.sb3_execution_env import SB3ExecutionEnv, SB3VectorExecutionEnv
+        from rl.simulator.vector_execution_env import VectorExecutionEnv
 
+        if isinstance(env, VectorExecutionEnv):
+            return SB3VectorExecutionEnv(vector_env=env, order_type=self.order_type)
         return SB3ExecutionEnv(execution_env=env, order_type=self.order_type)
 
     def fit(self, env: Any, total_timesteps: int = 100_000) -> SACSizer:  # pragma: no cover
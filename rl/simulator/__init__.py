@@ -1,5 +1,12 @@
 """Execution simulator + gymnasium-compatible env for the slicer."""
 from rl.simulator.execution_env import EnvConfig, ExecutionEnv
-from rl.simulator.sb3_execution_env import SB3ExecutionEnv
+from rl.simulator.sb3_execution_env import SB3ExecutionEnv, SB3VectorExecutionEnv
+from rl.simulator.vector_execution_env import VectorExecutionEnv
 
-__all__ = ["EnvConfig", "ExecutionEnv", "SB3ExecutionEnv"]
+__all__ = [
+    "EnvConfig",
+    "ExecutionEnv",
+    "SB3ExecutionEnv",
+    "SB3VectorExecutionEnv",
+    "VectorExecutionEnv",
+]
@@ -3,13 +3,16 @@
 The core execution simulator intentionally stays dependency-light. This wrapper
 is now mostly a thin adapter that pins ``order_type`` over the real
 ``ExecutionEnv`` gym contract, keeping older call sites working while the
-core env itself became SB3-compatible.
+core env itself became SB3-compatible. ``SB3VectorExecutionEnv`` exposes the
+batched ``VectorExecutionEnv`` as an SB3 ``VecEnv`` so rollouts collect
+``n_envs`` transitions per policy call.
 """
 from __future__ import annotations
 
 import numpy as np
 
 from rl.simulator.execution_env import EnvConfig, ExecutionEnv
+from rl.simulator.vector_execution_env import VectorExecutionEnv
 from rl.slippage import AlmgrenChrissCalibrator
 from rl.types import OrderType
 
@@ -23,6 +26,14 @@ except Exception:  # pragma: no cover - absence is the common CI path
     spaces = None  # type: ignore
     _HAS_GYM = False
 
+try:  # pragma: no cover - exercised only in RL research environments
+    from stable_baselines3.common.vec_env import VecEnv  # type: ignore[import-not-found]
+
+    _HAS_SB3 = True
+except Exception:  # pragma: no cover - absence is the common CI path
+    VecEnv = None  # type: ignore[assignment,misc]
+    _HAS_SB3 = False
+
 
 if _HAS_GYM:  # pragma: no cover - requires optional gymnasium dependency
     class SB3ExecutionEnv(gym.Env):  # type: ignore[misc]
@@ -84,4 +95,122 @@ else:
             )
 
 
-__all__ = ["SB3ExecutionEnv"]
+if _HAS_GYM and _HAS_SB3:  # pragma: no cover - requires optional sb3 dependency
+    class SB3VectorExecutionEnv(VecEnv):  # type: ignore[misc]
+        """SB3 ``VecEnv`` over ``VectorExecutionEnv`` (one process, array state).
+
+        Finished slots auto-reset inside the batched env; their pre-reset
+        observation is reported as ``infos[i]["terminal_observation"]`` and
+        horizon cut-offs as ``infos[i]["TimeLimit.truncated"]``, as SB3
+        expects from ``DummyVecEnv``.
+
+        The slots share one ``EnvConfig`` and one episode-seed stream:
+
+        - ``seed(s)`` is applied at the next ``reset()``, which restarts the
+          batched env's seed stream with ``s`` (slot seeds are drawn from it).
+        - ``get_attr`` serves the batch-level attributes; ``set_attr`` accepts
+          ``order_type`` and ``slippage`` for the whole batch only and raises
+          ``ValueError`` for a subset of ``indices``.
+        - There are no per-slot sub-environments, so ``env_method`` raises
+          ``AttributeError``.
+        """
+
+        _SETTABLE_ATTRS = frozenset({"order_type", "slippage"})
+
+        def __init__(
+            self,
+            *,
+            vector_env: VectorExecutionEnv | None = None,
+            cfg: EnvConfig | None = None,
+            n_envs: int = 8,
+            slippage: AlmgrenChrissCalibrator | None = None,
+            order_type: OrderType = "limit_at_mid",
+        ) -> None:
+            base_env = vector_env or VectorExecutionEnv(
+                cfg=cfg or EnvConfig(default_order_type=order_type),
+                n_envs=n_envs,
+                slippage=slippage,
+            )
+            base_env.cfg.default_order_type = order_type
+            self.vector_env = base_env
+            self.order_type = order_type
+            self._actions: np.ndarray | None = None
+            self._next_seed: int | None = None
+            spaces_env = ExecutionEnv(cfg=base_env.cfg)
+            super().__init__(base_env.n_envs, spaces_env.observation_space, spaces_env.action_space)
+
+        def seed(self, seed: int | None = None) -> list[int | None]:
+            seeds = list(super().seed(seed))
+            self._next_seed = seeds[0]
+            return seeds
+
+        def reset(self):
+            seed, self._next_seed = self._next_seed, None
+            obs, _ = self.vector_env.reset(seed=seed)
+            self._reset_seeds()
+            return np.asarray(obs, dtype=np.float32)
+
+        def step_async(self, actions: np.ndarray) -> None:
+            self._actions = np.asarray(actions)
+
+        def step_wait(self):
+            if self._actions is None:
+                raise RuntimeError("step_wait() called before step_async()")
+            obs, rewards, terminated, truncated, info = self.vector_env.step(self._actions)
+            self._actions = None
+            dones = terminated | truncated
+            infos: list[dict] = [{} for _ in range(self.num_envs)]
+            for row in np.flatnonzero(dones).tolist():
+                infos[row] = {
+                    "terminal_observation": np.asarray(info["final_observation"][row], dtype=np.float32),
+                    "TimeLimit.truncated": bool(truncated[row]),
+                    "is_bps": float(info["is_bps"][row]),
+                    "episode_seed": int(info["episode_seed"][row]),
+                }
+            return np.asarray(obs, dtype=np.float32), rewards.astype(np.float32), dones, infos
+
+        def close(self) -> None:
+            self.vector_env.close()
+
+        def get_attr(self, attr_name: str, indices=None) -> list:
+            shared = {
+                "cfg": self.vector_env.cfg,
+                "slippage": self.vector_env.slippage,
+                "order_type": self.order_type,
+                "render_mode": None,
+                "metadata": {"render_modes": []},
+            }
+            if attr_name not in shared:
+                raise AttributeError(f"SB3VectorExecutionEnv does not expose {attr_name!r}")
+            return [shared[attr_name] for _ in self._get_indices(indices)]
+
+        def set_attr(self, attr_name: str, value, indices=None) -> None:
+            if attr_name not in self._SETTABLE_ATTRS:
+                raise AttributeError(f"SB3VectorExecutionEnv cannot set {attr_name!r}")
+            if len(list(self._get_indices(indices))) != self.num_envs:
+                raise ValueError(f"{attr_name!r} is shared by all slots; set it without indices")
+            if attr_name == "order_type":
+                self.order_type = value
+                self.vector_env.cfg.default_order_type = value
+            else:
+                self.vector_env.slippage = value
+
+        def env_method(self, method_name: str, *method_args, indices=None, **method_kwargs) -> list:
+            raise AttributeError(
+                f"SB3VectorExecutionEnv has no per-slot sub-environments to call {method_name!r} on"
+            )
+
+        def env_is_wrapped(self, wrapper_class, indices=None) -> list[bool]:
+            return [False for _ in self._get_indices(indices)]
+
+
+else:
+    class SB3VectorExecutionEnv:  # pragma: no cover - trivial dependency guard
+        def __init__(self, **_: object) -> None:
+            raise RuntimeError(
+                "stable-baselines3 / gymnasium are not installed. Install via "
+                "'pip install -r requirements-rl.txt' to use rl.simulator.SB3VectorExecutionEnv."
+            )
+
+
+__all__ = ["SB3ExecutionEnv", "SB3VectorExecutionEnv"]
@@ -0,0 +1,206 @@
+"""Batched order-slicing environment: ``n_envs`` episodes stepped in lockstep.
+
+``ExecutionEnv`` runs one parent order per Python call, so PPO / SAC
+rollouts spend most of their wall-clock in per-step interpreter overhead
+(one ``rng.normal`` draw per noise term, one ``predict_bps`` per slice).
+``VectorExecutionEnv`` keeps the same dynamics but holds every episode's
+state (mid, remaining / filled quantity, step index, shortfall / variance
+accumulators) in arrays and advances all of them with a handful of numpy
+ops per step.
+
+Randomness is pre-drawn per episode: each episode owns an integer seed and
+a ``(horizon_steps, 3)`` standard-normal tensor drawn from
+``np.random.default_rng(seed)`` in the exact order ``ExecutionEnv.step``
+consumes it (volume shock, volatility shock, price drift). Replaying an
+episode on a scalar env with ``ExecutionEnv.reset(seed=episode_seed)``
+and the same actions therefore reproduces its trajectory.
+
+Finished episodes auto-reset inside ``step``: the returned observation
+row is the new episode's first observation, while
+``info["final_observation"]`` and the other ``info`` arrays describe the
+step that just finished (gymnasium vector-env convention). Episode seeds
+come from a seed stream initialised by ``cfg.seed`` or ``reset(seed=...)``.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from rl.extensions import cvar
+from rl.simulator.execution_env import EnvConfig
+from rl.slippage import AlmgrenChrissCalibrator
+
+# Extra spread paid per order type, mirroring ``ExecutionEnv.step``.
+_ORDER_TYPE_SLIPPAGE_BPS: dict[str, float] = {"market": 1.5, "limit_aggressive": 0.5}
+_SEED_HIGH = np.iinfo(np.int64).max
+
+
+@dataclass
+class VectorExecutionEnv:
+    """``n_envs`` independent ``ExecutionEnv`` episodes sharing one ``EnvConfig``.
+
+    Actions are one slice fraction per episode (shape ``(n_envs,)`` or
+    ``(n_envs, 1)``); the order type is ``cfg.default_order_type`` for the
+    whole batch.
+    """
+
+    cfg: EnvConfig = field(default_factory=EnvConfig)
+    n_envs: int = 8
+    slippage: AlmgrenChrissCalibrator | None = None
+
+    def __post_init__(self) -> None:
+        if self.n_envs < 1:
+            raise ValueError(f"VectorExecutionEnv.n_envs must be >= 1, got {self.n_envs}")
+        n = self.n_envs
+        horizon = max(int(self.cfg.horizon_steps), 1)
+        self._seed_rng = np.random.default_rng(self.cfg.seed)
+        self._episode_seeds = np.zeros(n, dtype=np.int64)
+        self._noise = np.zeros((n, horizon, 3), dtype=float)
+        self._step_returns = np.zeros((n, horizon), dtype=float)
+        self._mid = np.zeros(n, dtype=float)
+        self._remaining_qty = np.zeros(n, dtype=float)
+        self._filled_qty = np.zeros(n, dtype=float)
+        self._step_idx = np.zeros(n, dtype=np.int64)
+        self._is_accum = np.zeros(n, dtype=float)
+        self._var_accum = np.zeros(n, dtype=float)
+        self._rows = np.arange(n)
+        parent = max(self.cfg.parent_qty, 1.0)
+        self._obs_template = np.empty((n, 5), dtype=float)
+        self._obs_template[:, 2] = self.cfg.base_volatility_bps / 100.0
+        self._obs_template[:, 3] = self.cfg.base_volume_per_step / parent
+        self._obs_template[:, 4] = float(self.cfg.side)
+        self._begin_episodes(self._rows)
+
+    # gymnasium-vector-compatible -------------------------------------------
+    def reset(self, *, seed: int | None = None, options: dict | None = None):
+        """Start a fresh episode in every slot; ``seed`` restarts the seed stream."""
+        del options
+        if seed is not None:
+            self._seed_rng = np.random.default_rng(seed)
+        self._begin_episodes(self._rows)
+        return self._obs(), self._info()
+
+    def step(self, actions: np.ndarray | list[float] | float):
+        """Advance every episode one step, auto-resetting the ones that finish."""
+        cfg = self.cfg
+        rows = self._rows
+        fraction = self._coerce_actions(actions)
+        slice_qty = fraction * self._remaining_qty
+        # Final step forces full liquidation regardless of action.
+        last_step = self._step_idx >= cfg.horizon_steps - 1
+        slice_qty[last_step] = self._remaining_qty[last_step]
+        # Volume + price evolution from the pre-drawn per-episode noise.
+        noise = self._noise[rows, self._step_idx]
+        vol_step = cfg.base_volume_per_step * np.exp(0.2 * noise[:, 0])
+        vol_bps = cfg.base_volatility_bps * np.exp(0.2 * noise[:, 1])
+        price_drift_bps = vol_bps * noise[:, 2]
+        self._mid *= 1.0 + price_drift_bps / 1e4
+        slip_bps = np.zeros(self.n_envs, dtype=float)
+        if self.slippage is not None:
+            trading = slice_qty > 0
+            if trading.any():
+                spct = (cfg.side * slice_qty[trading]) / np.maximum(vol_step[trading], 1.0)
+                features = np.empty((spct.size, 3), dtype=float)
+                features[:, 0] = spct
+                features[:, 1] = cfg.seconds_per_step**0.5
+                features[:, 2] = np.abs(spct)
+                slip_bps[trading] = np.maximum(0.0, self.slippage.predict_batch_bps(features))
+        slip_bps += _ORDER_TYPE_SLIPPAGE_BPS.get(cfg.default_order_type, 0.0)
+        fill_price = self._mid * (1.0 + cfg.side * slip_bps / 1e4)
+        # Accounting, reward and risk term exactly as in ``ExecutionEnv.step``.
+        self._filled_qty += slice_qty
+        self._remaining_qty -= slice_qty
+        notional_bps = (fill_price / cfg.starting_mid - 1.0) * 1e4 * cfg.side
+        is_contrib = notional_bps * slice_qty
+        self._is_accum += is_contrib
+        share = slice_qty / max(cfg.parent_qty, 1.0)
+        var_step = (price_drift_bps**2) * share
+        self._var_accum += var_step
+        base_reward = -(notional_bps * share)
+        self._step_returns[rows, self._step_idx] = base_reward
+        reward = base_reward.copy()
+        if cfg.risk_metric == "variance":
+            reward -= cfg.lambda_var * var_step
+        self._step_idx += 1
+        terminated = self._remaining_qty <= 1e-9
+        truncated = (self._step_idx >= cfg.horizon_steps) & ~terminated
+        done = terminated | truncated
+        done_rows = np.flatnonzero(done)
+        if done_rows.size and cfg.risk_metric in ("cvar5", "cvar1"):
+            alpha = 0.05 if cfg.risk_metric == "cvar5" else 0.01
+            for row in done_rows:
+                returns = self._step_returns[row, : self._step_idx[row]].tolist()
+                reward[row] -= cfg.lambda_var * abs(min(0.0, cvar(returns, alpha=alpha)))
+        info = self._info()
+        info.update(
+            {
+                "slice_qty": slice_qty,
+                "fill_price": fill_price,
+                "slippage_bps": slip_bps,
+                "implementation_shortfall_bps": is_contrib / max(cfg.parent_qty, 1.0),
+                "final_observation": self._obs(),
+            }
+        )
+        if done_rows.size:
+            self._begin_episodes(done_rows)
+        return self._obs(), reward, terminated, truncated, info
+
+    # introspection --------------------------------------------------------
+    @property
+    def episode_seeds(self) -> np.ndarray:
+        """Seed of the episode currently running in each slot."""
+        return self._episode_seeds.copy()
+
+    @property
+    def total_implementation_shortfall_bps(self) -> np.ndarray:
+        return self._is_accum / max(self.cfg.parent_qty, 1.0)
+
+    @property
+    def realized_variance(self) -> np.ndarray:
+        """Per-slot sum of variance contributions consumed by the reward."""
+        return self._var_accum.copy()
+
+    def close(self) -> None:
+        return None
+
+    # internals ------------------------------------------------------------
+    def _coerce_actions(self, actions: np.ndarray | list[float] | float) -> np.ndarray:
+        arr = np.asarray(actions, dtype=float)
+        if arr.ndim == 0:
+            arr = np.full(self.n_envs, float(arr))
+        arr = arr.reshape(self.n_envs, -1)[:, 0]
+        return np.clip(np.where(np.isfinite(arr), arr, 0.0), 0.0, 1.0)
+
+    def _begin_episodes(self, rows: np.ndarray) -> None:
+        seeds = self._seed_rng.integers(0, _SEED_HIGH, size=rows.size, dtype=np.int64)
+        shape = self._noise.shape[1:]
+        for row, seed in zip(rows.tolist(), seeds.tolist(), strict=True):
+            self._noise[row] = np.random.default_rng(seed).standard_normal(shape)
+        self._episode_seeds[rows] = seeds
+        self._step_returns[rows] = 0.0
+        self._mid[rows] = float(self.cfg.starting_mid)
+        self._remaining_qty[rows] = float(self.cfg.parent_qty)
+        self._filled_qty[rows] = 0.0
+        self._step_idx[rows] = 0
+        self._is_accum[rows] = 0.0
+        self._var_accum[rows] = 0.0
+
+    def _obs(self) -> np.ndarray:
+        obs = self._obs_template.copy()
+        obs[:, 0] = self._remaining_qty / max(self.cfg.parent_qty, 1.0)
+        obs[:, 1] = 1.0 - self._step_idx / max(self.cfg.horizon_steps, 1)
+        return obs
+
+    def _info(self) -> dict[str, np.ndarray]:
+        return {
+            "step": self._step_idx.copy(),
+            "remaining_qty": self._remaining_qty.copy(),
+            "filled_qty": self._filled_qty.copy(),
+            "mid": self._mid.copy(),
+            "is_bps": self.total_implementation_shortfall_bps,
+            "episode_seed": self._episode_seeds.copy(),
+        }
+
+
+__all__ = ["VectorExecutionEnv"]
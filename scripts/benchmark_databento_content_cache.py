@@ -0,0 +1,168 @@
+"""Replay recorded cache-probe logs against the content-addressed cache.
+
+Every probe event (``{path, hit}`` from ``DATABENTO_CACHE_PROBE_LOG``) is
+parsed back into the request it stood for -- category, dataset, the
+session-date range from its date parts, the remaining request parts
+(timezone, window times, ...) and its symbol scope -- and replayed in run
+order through:
+
+  - ``recorded``   -- the hit flags the producer logged (path-keyed cache);
+  - ``path_exact`` -- a cross-run replay keyed by the exact cache path;
+  - ``content``    -- ``ContentAddressedCache.lookup`` + ``put`` of each
+                      uncovered gap, filled with a synthetic frame of one
+                      row per symbol and weekday.
+
+Universe-scoped paths carry a ``<count>_<digest>`` scope token; the replay
+models that universe as the first ``count`` symbols of one shared pool
+(nested universes, which matches small day-over-day drift). Per-symbol
+families use the symbol from the filename.
+
+Usage:
+    python -m scripts.benchmark_databento_content_cache                       # baseline/run1 baseline/run2
+    python -m scripts.benchmark_databento_content_cache baseline/run1 baseline/run2 --max-bytes 50000000
+
+Prints a JSON report to stdout. Dev-only; not wired into CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+
+from databento_content_cache import ContentAddressedCache, ContentKey
+from scripts.analyze_cache_probe import parse_symbol_date
+from scripts.simulate_cache_redesign_2334 import SCOPE_TOKEN_RE, _parse_event, load_events
+
+_REPO = Path(__file__).resolve().parents[1]
+_DATE_RE = re.compile(r"^(\d{4})-?(\d{2})-?(\d{2})$")
+_UNDATED = date(1970, 1, 1)
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "runs",
+        nargs="*",
+        type=Path,
+        default=[_REPO / "baseline" / "run1", _REPO / "baseline" / "run2"],
+        help="probe-log run directories, replayed in order (default: baseline/run1 baseline/run2)",
+    )
+    parser.add_argument("--max-bytes", type=int, default=2_000_000_000, help="cache byte budget (default: 2e9)")
+    return parser.parse_args(argv)
+
+
+def _request(event: dict) -> tuple[str, str, set[str], date, date] | None:
+    """Return ``(dataset, schema, symbols, start, end)`` for a probe event."""
+    parsed = _parse_event(event)
+    if parsed is None:
+        return None
+    category, dataset, parts = parsed
+    days = sorted(date(*map(int, m.groups())) for part in parts if (m := _DATE_RE.match(part)))
+    symbols: set[str] = set()
+    identity: list[str] = []
+    per_symbol = parse_symbol_date(event["path"]) if category.startswith("symbol_detail_") else None
+    for part in parts:
+        if _DATE_RE.match(part):
+            continue
+        if per_symbol is not None and part == per_symbol[1]:
+            symbols.add(part)
+        elif SCOPE_TOKEN_RE.match(part):
+            symbols.update(f"S{i:05d}" for i in range(int(part.split("_", 1)[0])))
+        else:
+            identity.append(part)
+    schema = "/".join([category, *identity])
+    return dataset, schema, symbols, (days[0] if days else _UNDATED), (days[-1] if days else _UNDATED)
+
+
+def _synthetic_frame(symbols: frozenset[str] | set[str], start: date, end: date) -> pd.DataFrame:
+    days = pd.bdate_range(start, end) if start != _UNDATED else pd.DatetimeIndex([pd.Timestamp(start)])
+    stamps = days.tz_localize("UTC") + pd.Timedelta(hours=14, minutes=30)
+    ordered = sorted(symbols) or ["*"]
+    return pd.DataFrame(
+        {
+            "symbol": [symbol for symbol in ordered for _ in stamps],
+            "ts": list(stamps) * len(ordered),
+            "close": 1.0,
+        }
+    )
+
+
+def run_benchmark(runs: list[Path], *, max_bytes: int = 2_000_000_000) -> dict[str, object]:
+    events = [(run.name, event) for run in runs for event in load_events(run)]
+    seen_paths: set[str] = set()
+    recorded_hits = path_hits = replayed = 0
+    requested_rows = 0
+    fetched_rows = {"path_exact": 0, "content": 0}
+    lookup_s = 0.0
+    with tempfile.TemporaryDirectory(prefix="content_cache_bench_") as tmp:
+        cache = ContentAddressedCache(Path(tmp), max_bytes=max_bytes)
+        for _run, event in events:
+            request = _request(event)
+            if request is None:
+                continue
+            dataset, schema, symbols, start, end = request
+            replayed += 1
+            recorded_hits += bool(event["hit"])
+            full = _synthetic_frame(symbols, start, end)
+            requested_rows += len(full)
+            if event["path"] in seen_paths:
+                path_hits += 1
+            else:
+                seen_paths.add(event["path"])
+                fetched_rows["path_exact"] += len(full)
+
+            key = ContentKey.build(dataset=dataset, schema=schema, symbols=symbols, start=start, end=end)
+            started = time.perf_counter()
+            result = cache.lookup(key)
+            lookup_s += time.perf_counter() - started
+            for gap in result.gaps:
+                symbols_gap = set() if gap.symbols == {"*"} else gap.symbols
+                delta = _synthetic_frame(symbols_gap, gap.start, gap.end)
+                fetched_rows["content"] += len(delta)
+                cache.put(
+                    ContentKey.build(dataset=dataset, schema=schema, symbols=symbols_gap, start=gap.start, end=gap.end),
+                    delta,
+                )
+        stats = cache.stats.as_dict()
+        entries, total_bytes = len(cache), cache.total_bytes
+        cache.close()
+
+    def _rate(hits: int) -> float:
+        return round(hits / replayed, 4) if replayed else 0.0
+
+    return {
+        "runs": [run.name for run in runs],
+        "events": replayed,
+        "hit_rate": {
+            "recorded": _rate(recorded_hits),
+            "path_exact": _rate(path_hits),
+            "content": stats["hit_rate"],
+            "content_incl_partial": _rate(int(stats["hits"] + stats["partial_hits"])),
+        },
+        "requested_rows": requested_rows,
+        "fetched_rows": fetched_rows,
+        "served_from_cache_fraction": {
+            name: round(1 - rows / requested_rows, 4) if requested_rows else 0.0
+            for name, rows in fetched_rows.items()
+        },
+        "content_cache": {**stats, "entries": entries, "total_bytes": total_bytes, "max_bytes": max_bytes},
+        "lookup_ms_per_event": round(lookup_s / replayed * 1000, 3) if replayed else None,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    report = run_benchmark(args.runs, max_bytes=args.max_bytes)
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
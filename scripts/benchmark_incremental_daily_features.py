@@ -0,0 +1,172 @@
+"""Benchmark full-universe daily features: full rebuild vs. 1-session incremental update.
+
+Builds synthetic daily bars, intraday summaries and open/close second detail
+for ``--symbols`` symbols over ``--days`` sessions, then times:
+
+  - ``full``        -- ``build_daily_features_full_universe`` over all sessions
+                       (what Step 9 runs on every export);
+  - ``seed``        -- ``build_daily_features_incremental`` without a state file
+                       (a full rebuild that also writes the Parquet state);
+  - ``incremental`` -- ``build_daily_features_incremental`` for the same window
+                       plus one new session, reusing the state.
+
+and checks the incremental frames equal a full rebuild of the extended window.
+
+Usage:
+    python -m scripts.benchmark_incremental_daily_features                  # 100 symbols x 25 days
+    python -m scripts.benchmark_incremental_daily_features --symbols 300 --days 40
+
+Prints a JSON report to stdout. Dev-only; not wired into CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from databento_volatility_screener import (
+    _fmt_rss_pair,
+    build_daily_features_full_universe,
+    build_daily_features_incremental,
+)
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--symbols", type=int, default=100, help="universe size (default: 100)")
+    parser.add_argument("--days", type=int, default=25, help="sessions in the lookback window (default: 25)")
+    parser.add_argument(
+        "--seconds-per-symbol", type=int, default=30, help="open-window 1s rows per symbol-day (default: 30)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed (default: 0)")
+    return parser.parse_args(argv)
+
+
+def _et(days: np.ndarray, clock: str) -> pd.DatetimeIndex:
+    return pd.DatetimeIndex([pd.Timestamp(f"{day} {clock}", tz="America/New_York") for day in days]).tz_convert("UTC")
+
+
+def _inputs(days: list[date], symbols: list[str], *, seconds_per_symbol: int, seed: int) -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    keys = pd.MultiIndex.from_product([days, symbols], names=["trade_date", "symbol"]).to_frame(index=False)
+    base = rng.uniform(5.0, 300.0, len(symbols))[np.tile(np.arange(len(symbols)), len(days))]
+    base = base * np.exp(rng.normal(0.0, 0.02, len(keys)))
+    daily = keys.assign(
+        open=base,
+        high=base * 1.02,
+        low=base * 0.98,
+        close=base * 1.01,
+        volume=rng.integers(10_000, 5_000_000, len(keys)).astype(float),
+        previous_close=base * 0.99,
+    )
+    intraday = keys.assign(
+        previous_close=base * 0.99,
+        market_open_price=base,
+        current_price=base * 1.005,
+        exact_1000_price=base * 1.004,
+        has_premarket_data=rng.uniform(size=len(keys)) < 0.5,
+    )
+    opens = _et(keys["trade_date"].to_numpy(), "09:30:00").repeat(seconds_per_symbol)
+    rows = np.repeat(np.arange(len(keys)), seconds_per_symbol)
+    price = base[rows] * rng.uniform(0.99, 1.01, rows.size)
+    second = pd.DataFrame(
+        {
+            "trade_date": keys["trade_date"].to_numpy()[rows],
+            "symbol": keys["symbol"].to_numpy()[rows],
+            "timestamp": opens + pd.to_timedelta(np.tile(np.arange(seconds_per_symbol) * 3, len(keys)), unit="s"),
+            "session": "regular",
+            "open": price,
+            "high": price * 1.002,
+            "low": price * 0.998,
+            "close": price * 1.001,
+            "volume": rng.integers(1, 500, rows.size).astype(float),
+        }
+    )
+    close_rows = np.repeat(np.arange(len(keys)), 3)
+    close_stamps = np.stack(
+        [_et(keys["trade_date"].to_numpy(), clock).asi8 for clock in ("15:50:00", "15:59:30", "16:00:00")], axis=1
+    ).ravel()
+    close_price = base[close_rows] * rng.uniform(0.99, 1.01, close_rows.size)
+    close = pd.DataFrame(
+        {
+            "trade_date": keys["trade_date"].to_numpy()[close_rows],
+            "symbol": keys["symbol"].to_numpy()[close_rows],
+            "timestamp": pd.to_datetime(close_stamps, utc=True),
+            "session": np.tile(["regular", "regular", "postmarket"], len(keys)),
+            "open": close_price,
+            "high": close_price * 1.001,
+            "low": close_price * 0.999,
+            "close": close_price,
+            "volume": rng.integers(1, 500, close_rows.size).astype(float),
+        }
+    )
+    return {"daily_bars": daily, "intraday": intraday, "second_detail_all": second, "close_detail_all": close}
+
+
+def _timed(build) -> tuple[float, tuple[pd.DataFrame, pd.DataFrame]]:
+    started = time.perf_counter()
+    result = build()
+    return round(time.perf_counter() - started, 3), result
+
+
+def run_benchmark(symbols: int, days: int, *, seconds_per_symbol: int = 30, seed: int = 0) -> dict[str, object]:
+    sessions = [day.date() for day in pd.bdate_range("2026-01-05", periods=days + 1)]
+    universe = pd.DataFrame({"symbol": [f"SYM{i:05d}" for i in range(symbols)], "market_cap": 1.0e9})
+    inputs = _inputs(sessions, list(universe["symbol"]), seconds_per_symbol=seconds_per_symbol, seed=seed)
+    window, extended = sessions[:-1], sessions[1:]
+
+    def _sliced(window_days: list[date]) -> dict[str, pd.DataFrame]:
+        wanted = set(window_days)
+        return {name: frame[frame["trade_date"].isin(wanted)] for name, frame in inputs.items()}
+
+    with tempfile.TemporaryDirectory(prefix="incremental_features_bench_") as tmp:
+        state_path = Path(tmp) / "daily_features_state.parquet"
+        full_s, _ = _timed(
+            lambda: build_daily_features_full_universe(trading_days=window, universe=universe, **_sliced(window))
+        )
+        seed_s, _ = _timed(
+            lambda: build_daily_features_incremental(
+                state_path, trading_days=window, universe=universe, **_sliced(window)
+            )
+        )
+        state_bytes = state_path.stat().st_size
+        incremental_s, (features, coverage) = _timed(
+            lambda: build_daily_features_incremental(
+                state_path, trading_days=extended, universe=universe, **_sliced(extended)
+            )
+        )
+        rebuild_s, (full_features, full_coverage) = _timed(
+            lambda: build_daily_features_full_universe(trading_days=extended, universe=universe, **_sliced(extended))
+        )
+
+    return {
+        "symbols": symbols,
+        "days": days,
+        "rows": len(features),
+        "full_rebuild_s": full_s,
+        "seed_state_s": seed_s,
+        "incremental_1_day_s": incremental_s,
+        "full_rebuild_extended_s": rebuild_s,
+        "speedup": round(rebuild_s / incremental_s, 1) if incremental_s else None,
+        "state_mib": round(state_bytes / 2**20, 2),
+        "identical": features.equals(full_features) and coverage.equals(full_coverage),
+        "rss": _fmt_rss_pair(),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    report = run_benchmark(args.symbols, args.days, seconds_per_symbol=args.seconds_per_symbol, seed=args.seed)
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,127 @@
+"""Benchmark the vectorised bootstrap / block-permutation kernels.
+
+Times ``smc_core.inference`` on a synthetic AR(1) return stream of
+``--n`` observations:
+
+  - ``stationary_bootstrap`` -- ``bootstrap_ci(..., statistic="sharpe",
+                                block_length=L)`` with ``--B`` resamples;
+  - ``bca_mean``             -- ``bootstrap_ci(..., statistic="mean",
+                                method="bca")`` (closed-form jackknife);
+  - ``block_permutation``    -- ``block_permutation_test(...,
+                                statistic="mean_diff")`` over two arms.
+
+With ``--loop-B`` > 0 the pre-vectorised per-element stationary loop is also
+timed on that many resamples and extrapolated to ``--B`` for comparison.
+
+Usage:
+    python -m scripts.benchmark_inference_kernels                 # B=10k, n=50k
+    python -m scripts.benchmark_inference_kernels --B 2000 --n 5000 --loop-B 20
+
+Prints a JSON report to stdout. Dev-only; not wired into CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from smc_core.inference.bootstrap import bootstrap_ci
+from smc_core.inference.permutation import block_permutation_test
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--B", type=int, default=10_000, help="resamples / permutations (default: 10000)")
+    parser.add_argument("--n", type=int, default=50_000, help="observations (default: 50000)")
+    parser.add_argument("--block-length", type=int, default=20, help="mean / fixed block length (default: 20)")
+    parser.add_argument("--loop-B", type=int, default=5, help="resamples timed on the legacy loop (default: 5)")
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed (default: 0)")
+    return parser.parse_args(argv)
+
+
+def _ar1(n: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    eps = rng.normal(0.0002, 0.01, size=n)
+    out = np.empty(n)
+    out[0] = eps[0]
+    for i in range(1, n):
+        out[i] = 0.3 * out[i - 1] + eps[i]
+    return out
+
+
+def _legacy_stationary_loop(arr: np.ndarray, B: int, mean_block_length: int, rng: np.random.Generator) -> None:
+    n = arr.size
+    p = 1.0 / mean_block_length
+    for _ in range(B):
+        starts = rng.integers(0, n, size=n, dtype=np.int64)
+        breaks = rng.random(size=n) < p
+        idx = np.empty(n, dtype=np.int64)
+        cur = int(starts[0])
+        for k in range(n):
+            if k > 0 and breaks[k]:
+                cur = int(starts[k])
+            idx[k] = cur % n
+            cur += 1
+        float(arr[idx].mean())
+
+
+def _timed(fn) -> tuple[float, object]:
+    started = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - started, result
+
+
+def run_benchmark(
+    n: int, *, B: int = 10_000, block_length: int = 20, loop_B: int = 5, seed: int = 0
+) -> dict[str, object]:
+    returns = _ar1(n, seed)
+    half = n // 2
+    stationary_s, stationary = _timed(
+        lambda: bootstrap_ci(returns, statistic="sharpe", B=B, seed=seed, block_length=block_length)
+    )
+    bca_s, bca = _timed(lambda: bootstrap_ci(returns, statistic="mean", method="bca", B=B, seed=seed))
+    permutation_s, permutation = _timed(
+        lambda: block_permutation_test(
+            treatment=returns[:half],
+            control=returns[half:],
+            statistic="mean_diff",
+            block_size=block_length,
+            B=B,
+            seed=seed,
+        )
+    )
+    report: dict[str, object] = {
+        "n": n,
+        "B": B,
+        "block_length": block_length,
+        "seconds": {
+            "stationary_bootstrap": round(stationary_s, 3),
+            "bca_mean": round(bca_s, 3),
+            "block_permutation": round(permutation_s, 3),
+        },
+        "stationary_sharpe_ci": [stationary["ci_low"], stationary["ci_high"]],
+        "bca_mean_ci": [bca["ci_low"], bca["ci_high"]],
+        "permutation_p_value": permutation[0],
+    }
+    if loop_B > 0:
+        loop_s, _ = _timed(
+            lambda: _legacy_stationary_loop(returns, loop_B, block_length, np.random.default_rng(seed))
+        )
+        extrapolated = loop_s / loop_B * B
+        report["legacy_stationary_loop_s_extrapolated"] = round(extrapolated, 1)
+        report["stationary_speedup"] = round(extrapolated / stationary_s, 1) if stationary_s else None
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    report = run_benchmark(args.n, B=args.B, block_length=args.block_length, loop_B=args.loop_B, seed=args.seed)
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,139 @@
+"""Benchmark per-day intraday state reduction: row-wise vs. columnar reducer.
+
+Builds a synthetic ``ohlcv-1s`` day for ``--symbols`` symbols, splits it
+into ``--chunk-rows`` chunks and folds them into per-symbol
+``SymbolDayState`` objects through:
+
+  - ``row_wise`` -- ``_update_state_from_chunk`` (groupby + per-symbol
+                    Python loop, the pre-reducer path);
+  - ``columnar`` -- ``_IntradayStateReducer.update`` (one sort plus
+                    ``np.*.reduceat`` per chunk).
+
+The report includes both wall-clock totals and whether every state field
+agrees to 1e-12 relative.
+
+Usage:
+    python -m scripts.benchmark_intraday_chunk_reducer                      # 3000 symbols
+    python -m scripts.benchmark_intraday_chunk_reducer --symbols 500 --rows-per-symbol 400
+
+Prints a JSON report to stdout. Dev-only; not wired into CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import time
+import warnings
+from datetime import date
+from datetime import time as dt_time
+
+import numpy as np
+import pandas as pd
+
+from databento_volatility_screener import (
+    SymbolDayState,
+    _IntradayStateReducer,
+    _update_state_from_chunk,
+    build_window_definition,
+)
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--symbols", type=int, default=3_000, help="symbols per day (default: 3000)")
+    parser.add_argument("--rows-per-symbol", type=int, default=300, help="1s bars per symbol (default: 300)")
+    parser.add_argument("--chunk-rows", type=int, default=250_000, help="rows per chunk (default: 250000)")
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed (default: 0)")
+    return parser.parse_args(argv)
+
+
+def _synthetic_day(window, symbols: int, rows_per_symbol: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    start_ns = pd.Timestamp(window.fetch_start_utc).value
+    seconds = (pd.Timestamp(window.fetch_end_utc).value - start_ns) // 10**9
+    codes = np.repeat(np.arange(symbols), rows_per_symbol)
+    offsets = np.concatenate(
+        [np.sort(rng.choice(seconds, rows_per_symbol, replace=False)) for _ in range(symbols)]
+    )
+    n = len(codes)
+    close = rng.uniform(5.0, 200.0, symbols)[codes] * np.exp(rng.normal(0.0, 0.001, n))
+    open_px = close * rng.uniform(0.999, 1.001, n)
+    frame = pd.DataFrame(
+        {
+            "symbol": np.asarray([f"SYM{i:05d}" for i in range(symbols)])[codes],
+            "open": open_px,
+            "high": np.maximum(open_px, close) * 1.0005,
+            "low": np.minimum(open_px, close) * 0.9995,
+            "close": close,
+            "volume": rng.integers(1, 5_000, n).astype(float),
+        },
+        index=pd.DatetimeIndex(pd.to_datetime(start_ns + offsets * 10**9, utc=True), name="ts_event"),
+    )
+    return frame.sort_index(kind="stable")
+
+
+def _states_match(expected: dict[str, SymbolDayState], actual: dict[str, SymbolDayState]) -> bool:
+    if list(expected) != list(actual):
+        return False
+    for symbol, state in expected.items():
+        for name in state.__dataclass_fields__:
+            want, got = getattr(state, name), getattr(actual[symbol], name)
+            if isinstance(want, float) and isinstance(got, float):
+                if not math.isclose(want, got, rel_tol=1e-12, abs_tol=1e-15):
+                    return False
+            elif want != got:
+                return False
+    return True
+
+
+def run_benchmark(
+    symbols: int, *, rows_per_symbol: int = 300, chunk_rows: int = 250_000, seed: int = 0
+) -> dict[str, object]:
+    window = build_window_definition(
+        date(2026, 3, 5),
+        display_timezone="Europe/Berlin",
+        window_start=dt_time(15, 20),
+        window_end=dt_time(16, 0),
+        premarket_anchor_et=dt_time(8, 0),
+    )
+    day = _synthetic_day(window, symbols, rows_per_symbol, seed)
+    chunks = [day.iloc[start : start + chunk_rows] for start in range(0, len(day), chunk_rows)]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        started = time.perf_counter()
+        row_wise: dict[str, SymbolDayState] = {}
+        for chunk in chunks:
+            _update_state_from_chunk(chunk, window=window, universe_symbols=None, states=row_wise)
+        row_wise_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        reducer = _IntradayStateReducer(window)
+        for chunk in chunks:
+            reducer.update(chunk)
+        columnar = reducer.states()
+        columnar_s = time.perf_counter() - started
+
+    return {
+        "symbols": symbols,
+        "rows": len(day),
+        "chunks": len(chunks),
+        "seconds": {"row_wise": round(row_wise_s, 3), "columnar": round(columnar_s, 3)},
+        "speedup": round(row_wise_s / columnar_s, 1) if columnar_s else None,
+        "states_identical": _states_match(row_wise, columnar),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    report = run_benchmark(
+        args.symbols, rows_per_symbol=args.rows_per_symbol, chunk_rows=args.chunk_rows, seed=args.seed
+    )
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,339 @@
+"""Benchmark the intraday day loop: fixed day pool vs. the adaptive scheduler.
+
+Builds a synthetic ``--days``-day, ``--symbols``-symbol fixture in which
+``--cached-fraction`` of the days already have a fresh ``intraday_summary``
+cache and the rest are fetched through a fake Historical client. That client
+sleeps ``--latency-ms`` per request (the network wait, GIL released) and
+then spools a real zstd DBN range to ``path=``. ``run_intraday_screen`` runs
+over fresh copies of the fixture cache in two modes:
+
+  - ``fixed``    -- every day estimated as a full fetch, threads capped at
+                    ``INTRADAY_DAY_PARALLELISM`` and no reduce pool: the
+                    former fixed day pool, in trading-day order;
+  - ``adaptive`` -- day costs from file stats, fetch days under the symbol
+                    budget with cache-served days in their own lane, and
+                    spooled ranges reduced in a ``--reduce-processes`` pool.
+
+For each mode the report gives wall-clock seconds, CPU seconds (this
+process plus the reaped reduce workers, which the benchmark starts with
+``spawn``), CPU utilization per core, and whether both modes returned the
+same frame. ``previous_close_join`` times the former row-wise ``.apply``
+lookup against the vectorized merge on one cached day.
+
+Usage:
+    python -m scripts.benchmark_intraday_day_scheduler                 # 60 days x 8000 symbols
+    python -m scripts.benchmark_intraday_day_scheduler --days 20 --symbols 2000 --latency-ms 50
+
+Prints a JSON report to stdout. Dev-only; not wired into CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import resource
+import shutil
+import tempfile
+import time
+import warnings
+from datetime import date, timedelta
+from datetime import time as dt_time
+from pathlib import Path
+from types import SimpleNamespace
+
+import databento as db
+import databento_dbn as dbn
+import numpy as np
+import pandas as pd
+import zstandard
+
+import databento_volatility_screener as screener
+from databento_volatility_screener import (
+    INTRADAY_DAY_PARALLELISM,
+    _empty_intraday_frame,
+    _intraday_day_cache_path,
+    _intraday_reduce_processes,
+    _lookup_previous_close,
+    _previous_close_frame,
+    _resolve_window_for_date,
+    _safe_float,
+    _write_cached_frame,
+    run_intraday_screen,
+)
+from scripts.benchmark_intraday_stream_loader import _OHLCV_DTYPE
+
+_DATASET = "XNAS.ITCH"
+_DISPLAY_TZ = "Europe/Berlin"
+_WINDOW_START = dt_time(15, 20)
+_WINDOW_END = dt_time(16, 0)
+_PREMARKET_ANCHOR = dt_time(8, 0)
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=60, help="trading days (default: 60)")
+    parser.add_argument("--symbols", type=int, default=8_000, help="universe size (default: 8000)")
+    parser.add_argument("--cached-fraction", type=float, default=0.75, help="days with a fresh cache (default: 0.75)")
+    parser.add_argument("--rows-per-symbol", type=int, default=20, help="1s bars per fetched symbol (default: 20)")
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="per-request network wait (default: 200)")
+    parser.add_argument(
+        "--reduce-processes",
+        type=int,
+        default=None,
+        help="adaptive-mode reduce pool size (default: INTRADAY_REDUCE_PROCESSES, i.e. the spare CPUs)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed (default: 0)")
+    return parser.parse_args(argv)
+
+
+def _trading_days(count: int) -> list[date]:
+    return [day.date() for day in pd.bdate_range(end=date(2026, 3, 31), periods=count)]
+
+
+def _cached_day_frame(trade_day: date, symbols: list[str], rng: np.random.Generator) -> pd.DataFrame:
+    frame = pd.DataFrame({column: rng.uniform(1.0, 200.0, len(symbols)) for column in _empty_intraday_frame().columns})
+    frame["trade_date"] = trade_day
+    frame["symbol"] = symbols
+    frame["previous_close"] = np.nan
+    frame["current_price_timestamp"] = pd.Timestamp(f"{trade_day.isoformat()}T14:59:59Z")
+    frame["has_premarket_data"] = True
+    return frame
+
+
+class _SyntheticTimeseries:
+    """``get_range`` that waits out the network latency, then spools a DBN range."""
+
+    def __init__(self, symbols: list[str], rows_per_symbol: int, latency_s: float, seed: int) -> None:
+        self.ids = {symbol: index for index, symbol in enumerate(symbols, start=1)}
+        self.rows_per_symbol = rows_per_symbol
+        self.latency_s = latency_s
+        self.seed = seed
+        self.requests = 0
+
+    def get_range(self, *, symbols, start, end, path, **_kwargs):
+        self.requests += 1
+        time.sleep(self.latency_s)
+        ids = np.array([self.ids[symbol] for symbol in symbols], dtype=np.uint32)
+        start_ns, end_ns = pd.Timestamp(start).value, pd.Timestamp(end).value
+        rng = np.random.default_rng([self.seed, start_ns // 10**9, int(ids[0])])
+        seconds = (end_ns - start_ns) // 10**9
+        rows = np.repeat(ids, self.rows_per_symbol)
+        close = rng.uniform(5.0, 200.0, ids.size).repeat(self.rows_per_symbol) * np.exp(
+            rng.normal(0.0, 0.001, rows.size)
+        )
+        records = np.zeros(rows.size, dtype=_OHLCV_DTYPE)
+        records["length"] = _OHLCV_DTYPE.itemsize // 4
+        records["rtype"] = int(dbn.RType.OHLCV_1S)
+        records["publisher_id"] = 2
+        records["instrument_id"] = rows
+        records["ts_event"] = start_ns + rng.integers(0, seconds, rows.size) * 10**9
+        records["open"] = records["close"] = np.round(close * 1e9)
+        records["high"] = np.round(close * 1.0005 * 1e9)
+        records["low"] = np.round(close * 0.9995 * 1e9)
+        records["volume"] = rng.integers(1, 5_000, rows.size)
+        records = records[np.argsort(records["ts_event"], kind="stable")]
+        trade_day = pd.Timestamp(start_ns, unit="ns").date()
+        metadata = dbn.Metadata(
+            dataset=_DATASET,
+            schema=dbn.Schema.OHLCV_1S,
+            start=start_ns,
+            stype_in=dbn.SType.RAW_SYMBOL,
+            stype_out=dbn.SType.INSTRUMENT_ID,
+            end=end_ns,
+            symbols=list(symbols),
+            partial=[],
+            not_found=[],
+            mappings=[
+                SimpleNamespace(
+                    raw_symbol=symbol,
+                    intervals=[
+                        SimpleNamespace(
+                            start_date=trade_day, end_date=trade_day + timedelta(days=1), symbol=str(self.ids[symbol])
+                        )
+                    ],
+                )
+                for symbol in symbols
+            ],
+        )
+        # ATOMIC-WRITE-EXEMPT: dev-only benchmark spool inside a TemporaryDirectory.
+        Path(path).write_bytes(zstandard.ZstdCompressor().compress(metadata.encode() + records.tobytes()))
+        return db.DBNStore.from_file(path)
+
+
+@contextlib.contextmanager
+def _patched(**attributes):
+    saved = {name: getattr(screener, name) for name in attributes}
+    for name, value in attributes.items():
+        setattr(screener, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(screener, name, value)
+
+
+def _cpu_seconds() -> float:
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def _previous_close_join(frame: pd.DataFrame, daily_bars: pd.DataFrame) -> dict[str, object]:
+    started = time.perf_counter()
+    lookup = {
+        (row.trade_date, row.symbol): _safe_float(row.previous_close) for row in daily_bars.itertuples(index=False)
+    }
+    by_apply = frame.apply(
+        lambda row: lookup.get((pd.Timestamp(row["trade_date"]).date(), str(row["symbol"]).upper())), axis=1
+    )
+    apply_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    by_merge = _lookup_previous_close(frame, _previous_close_frame(daily_bars))
+    merge_s = time.perf_counter() - started
+    return {
+        "rows": len(frame),
+        "apply_s": round(apply_s, 4),
+        "merge_s": round(merge_s, 4),
+        "speedup": round(apply_s / merge_s, 1) if merge_s else None,
+        "identical": bool(
+            np.allclose(
+                pd.to_numeric(by_apply, errors="coerce").to_numpy(dtype=float),
+                by_merge.astype(float),
+                equal_nan=True,
+            )
+        ),
+    }
+
+
+def run_benchmark(
+    *,
+    days: int = 60,
+    symbols: int = 8_000,
+    cached_fraction: float = 0.75,
+    rows_per_symbol: int = 20,
+    latency_ms: float = 200.0,
+    reduce_processes: int | None = None,
+    seed: int = 0,
+) -> dict[str, object]:
+    rng = np.random.default_rng(seed)
+    universe = [f"S{i:05d}" for i in range(symbols)]
+    trading_days = _trading_days(days)
+    cached_days = set(rng.choice(days, round(days * cached_fraction), replace=False).tolist())
+    daily_bars = pd.DataFrame(
+        {
+            "trade_date": np.repeat(trading_days, symbols),
+            "symbol": universe * days,
+            "previous_close": rng.uniform(5.0, 200.0, days * symbols),
+        }
+    )
+    report: dict[str, object] = {
+        "days": days,
+        "symbols": symbols,
+        "cached_days": len(cached_days),
+        "cpus": os.cpu_count(),
+        "reduce_processes": _intraday_reduce_processes(reduce_processes, max_workers=INTRADAY_DAY_PARALLELISM),
+    }
+    frames: dict[str, pd.DataFrame] = {}
+    with tempfile.TemporaryDirectory(prefix="intraday_scheduler_bench_") as tmp:
+        template = Path(tmp) / "template"
+        sample: pd.DataFrame | None = None
+        for index in sorted(cached_days):
+            trade_day = trading_days[index]
+            day_ws, day_we = _resolve_window_for_date(trade_day, _DISPLAY_TZ, _WINDOW_START, _WINDOW_END)
+            frame = _cached_day_frame(trade_day, universe, rng)
+            sample = frame if sample is None else sample
+            _write_cached_frame(
+                _intraday_day_cache_path(
+                    template,
+                    dataset=_DATASET,
+                    trade_day=trade_day,
+                    display_timezone=_DISPLAY_TZ,
+                    day_ws=day_ws,
+                    day_we=day_we,
+                    premarket_anchor_et=_PREMARKET_ANCHOR,
+                ),
+                frame,
+                captured_universe_symbols=universe,
+            )
+        modes = {
+            "fixed": (
+                {
+                    "_estimate_intraday_day_cost": lambda cache_path, *, symbols, max_age_seconds: (symbols, 0),
+                    "INTRADAY_DAY_MAX_THREADS": INTRADAY_DAY_PARALLELISM,
+                },
+                0,
+            ),
+            "adaptive": ({}, reduce_processes),
+        }
+        for mode, (overrides, processes) in modes.items():
+            cache_dir = Path(tmp) / mode
+            if template.exists():
+                shutil.copytree(template, cache_dir)
+            timeseries = _SyntheticTimeseries(universe, rows_per_symbol, latency_ms / 1000.0, seed)
+            with _patched(
+                _make_databento_client=lambda key, timeseries=timeseries: SimpleNamespace(timeseries=timeseries),
+                _get_schema_available_end=lambda client, dataset, schema: None,
+                _intraday_reduce_context=lambda: multiprocessing.get_context("spawn"),
+                **overrides,
+            ), warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                cpu_started = _cpu_seconds()
+                started = time.perf_counter()
+                frames[mode] = run_intraday_screen(
+                    "benchmark-key",
+                    dataset=_DATASET,
+                    trading_days=trading_days,
+                    universe_symbols=set(universe),
+                    daily_bars=daily_bars,
+                    display_timezone=_DISPLAY_TZ,
+                    window_start=_WINDOW_START,
+                    window_end=_WINDOW_END,
+                    premarket_anchor_et=_PREMARKET_ANCHOR,
+                    cache_dir=cache_dir,
+                    use_file_cache=True,
+                    reduce_processes=processes,
+                )
+                seconds = time.perf_counter() - started
+                cpu = _cpu_seconds() - cpu_started
+            report[mode] = {
+                "seconds": round(seconds, 2),
+                "cpu_seconds": round(cpu, 2),
+                "cpu_utilization": round(cpu / seconds / (os.cpu_count() or 1), 3) if seconds else None,
+                "requests": timeseries.requests,
+                "rows": len(frames[mode]),
+            }
+        if sample is not None:
+            report["previous_close_join"] = _previous_close_join(sample, daily_bars)
+
+    report["speedup"] = (
+        round(report["fixed"]["seconds"] / report["adaptive"]["seconds"], 2) if report["adaptive"]["seconds"] else None
+    )
+
+    def _ordered(frame: pd.DataFrame) -> pd.DataFrame:
+        return frame.sort_values(["trade_date", "symbol"], ignore_index=True)
+
+    report["frames_identical"] = _ordered(frames["fixed"]).equals(_ordered(frames["adaptive"]))
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    report = run_benchmark(
+        days=args.days,
+        symbols=args.symbols,
+        cached_fraction=args.cached_fraction,
+        rows_per_symbol=args.rows_per_symbol,
+        latency_ms=args.latency_ms,
+        reduce_processes=args.reduce_processes,
+        seed=args.seed,
+    )
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,208 @@
+"""Benchmark intraday ``ohlcv-1s`` decode: DataFrame chunks vs. streamed ndarrays.
+
+Writes a local zstd DBN file for ``--symbols`` symbols (one merged,
+time-sorted day, as ``timeseries.get_range`` streams it) and folds it into
+an ``_IntradayStateReducer`` through:
+
+  - ``to_df``  -- the whole response held in memory (``get_range`` without
+                  ``path=``) and ``store.to_df(count=250_000)`` chunks into
+                  ``update`` (the pre-streaming loader);
+  - ``stream`` -- the response spooled to disk and ``_reduce_dbn_store``
+                  (``to_ndarray`` batches sized by ``--decode-max-mib`` into
+                  ``update_arrays``).
+
+For each path the report gives wall-clock seconds, records/sec, the
+tracemalloc allocation peak and the A8.1 ``cur=/peak=`` RSS pair, plus
+whether both paths produced identical states.
+
+Usage:
+    python -m scripts.benchmark_intraday_stream_loader                     # 3000 symbols
+    python -m scripts.benchmark_intraday_stream_loader --symbols 500 --decode-max-mib 16
+
+Prints a JSON report to stdout. Dev-only; not wired into CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+import warnings
+from datetime import date, timedelta
+from datetime import time as dt_time
+from pathlib import Path
+from types import SimpleNamespace
+
+import databento as db
+import databento_dbn as dbn
+import numpy as np
+import pandas as pd
+import zstandard
+
+from databento_volatility_screener import (
+    INTRADAY_STREAM_DECODE_MAX_MIB,
+    _fmt_rss_pair,
+    _intraday_decode_batch_records,
+    _IntradayStateReducer,
+    _reduce_dbn_store,
+    build_window_definition,
+)
+from scripts.benchmark_intraday_chunk_reducer import _states_match
+
+_TRADE_DAY = date(2026, 3, 5)
+_OHLCV_DTYPE = np.dtype(
+    [
+        ("length", "u1"),
+        ("rtype", "u1"),
+        ("publisher_id", "<u2"),
+        ("instrument_id", "<u4"),
+        ("ts_event", "<u8"),
+        ("open", "<i8"),
+        ("high", "<i8"),
+        ("low", "<i8"),
+        ("close", "<i8"),
+        ("volume", "<u8"),
+    ]
+)
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--symbols", type=int, default=3_000, help="symbols per day (default: 3000)")
+    parser.add_argument("--rows-per-symbol", type=int, default=300, help="1s bars per symbol (default: 300)")
+    parser.add_argument(
+        "--decode-max-mib",
+        type=float,
+        default=INTRADAY_STREAM_DECODE_MAX_MIB,
+        help=f"streamed decode ceiling (default: {INTRADAY_STREAM_DECODE_MAX_MIB})",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed (default: 0)")
+    return parser.parse_args(argv)
+
+
+def _write_day(path: Path, window, symbols: int, rows_per_symbol: int, seed: int) -> int:
+    rng = np.random.default_rng(seed)
+    start_ns = pd.Timestamp(window.fetch_start_utc).value
+    seconds = (pd.Timestamp(window.fetch_end_utc).value - start_ns) // 10**9
+    ids = np.repeat(np.arange(1, symbols + 1, dtype=np.uint32), rows_per_symbol)
+    offsets = np.concatenate([np.sort(rng.choice(seconds, rows_per_symbol, replace=False)) for _ in range(symbols)])
+    close = rng.uniform(5.0, 200.0, symbols)[ids - 1] * np.exp(rng.normal(0.0, 0.001, ids.size))
+    open_px = close * rng.uniform(0.999, 1.001, ids.size)
+    records = np.zeros(ids.size, dtype=_OHLCV_DTYPE)
+    records["length"] = _OHLCV_DTYPE.itemsize // 4
+    records["rtype"] = int(dbn.RType.OHLCV_1S)
+    records["publisher_id"] = 2
+    records["instrument_id"] = ids
+    records["ts_event"] = start_ns + offsets * 10**9
+    records["open"] = np.round(open_px * 1e9)
+    records["high"] = np.round(np.maximum(open_px, close) * 1.0005 * 1e9)
+    records["low"] = np.round(np.minimum(open_px, close) * 0.9995 * 1e9)
+    records["close"] = np.round(close * 1e9)
+    records["volume"] = rng.integers(1, 5_000, ids.size)
+    records = records[np.argsort(records["ts_event"], kind="stable")]
+    metadata = dbn.Metadata(
+        dataset="XNAS.ITCH",
+        schema=dbn.Schema.OHLCV_1S,
+        start=start_ns,
+        stype_in=dbn.SType.RAW_SYMBOL,
+        stype_out=dbn.SType.INSTRUMENT_ID,
+        end=pd.Timestamp(window.fetch_end_utc).value,
+        symbols=[f"SYM{i:05d}" for i in range(1, symbols + 1)],
+        partial=[],
+        not_found=[],
+        mappings=[
+            SimpleNamespace(
+                raw_symbol=f"SYM{i:05d}",
+                intervals=[
+                    SimpleNamespace(start_date=_TRADE_DAY, end_date=_TRADE_DAY + timedelta(days=1), symbol=str(i))
+                ],
+            )
+            for i in range(1, symbols + 1)
+        ],
+    )
+    # ATOMIC-WRITE-EXEMPT: dev-only benchmark input inside a TemporaryDirectory.
+    path.write_bytes(zstandard.ZstdCompressor().compress(metadata.encode() + records.tobytes()))
+    return int(records.size)
+
+
+def _by_symbol(states: dict) -> dict:
+    return dict(sorted(states.items()))
+
+
+def _measure(fold) -> tuple[dict[str, object], _IntradayStateReducer]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    reducer, records = fold()
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "seconds": round(seconds, 3),
+        "records_per_s": round(records / seconds) if seconds else None,
+        "alloc_peak_mib": round(peak / 2**20, 1),
+        "rss": _fmt_rss_pair(),
+    }, reducer
+
+
+def run_benchmark(
+    symbols: int,
+    *,
+    rows_per_symbol: int = 300,
+    decode_max_mib: float = INTRADAY_STREAM_DECODE_MAX_MIB,
+    seed: int = 0,
+) -> dict[str, object]:
+    window = build_window_definition(
+        _TRADE_DAY,
+        display_timezone="Europe/Berlin",
+        window_start=dt_time(15, 20),
+        window_end=dt_time(16, 0),
+        premarket_anchor_et=dt_time(8, 0),
+    )
+    batch_records = _intraday_decode_batch_records(decode_max_mib)
+    with tempfile.TemporaryDirectory(prefix="intraday_stream_bench_") as tmp:
+        path = Path(tmp) / "day.dbn.zst"
+        total = _write_day(path, window, symbols, rows_per_symbol, seed)
+
+        def _to_df():
+            reducer = _IntradayStateReducer(window)
+            records = 0
+            for chunk in db.DBNStore.from_bytes(path.read_bytes()).to_df(count=250_000):
+                reducer.update(chunk)
+                records += len(chunk)
+            return reducer, records
+
+        def _stream():
+            reducer = _IntradayStateReducer(window)
+            return reducer, _reduce_dbn_store(db.DBNStore.from_file(path), reducer, batch_records=batch_records)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            to_df, by_frame = _measure(_to_df)
+            stream, streamed = _measure(_stream)
+
+    return {
+        "symbols": symbols,
+        "records": total,
+        "decode_batch_records": batch_records,
+        "to_df": to_df,
+        "stream": stream,
+        "speedup": round(to_df["seconds"] / stream["seconds"], 1) if stream["seconds"] else None,
+        # The two paths cut the day at different record counts, which moves
+        # the first-touch order of symbols tied on a timestamp; compare by symbol.
+        "states_identical": _states_match(_by_symbol(by_frame.states()), _by_symbol(streamed.states())),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    report = run_benchmark(
+        args.symbols, rows_per_symbol=args.rows_per_symbol, decode_max_mib=args.decode_max_mib, seed=args.seed
+    )
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
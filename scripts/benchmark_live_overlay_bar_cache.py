@@ -0,0 +1,202 @@
+"""Measure bar-cache read latency of the live overlay daemon under write load.
+
+One writer thread pushes 1-minute bars round-robin over ``--symbols``
+symbols at a paced ``--rate`` (bars per second) while ``--readers``
+threads each issue ``--read-rate`` requests per second against the read
+paths the daemon serves concurrently:
+
+  - ``bars``      -- ``get_bars_snapshot(symbol)`` (raw 1-minute window);
+  - ``arrays``    -- ``get_bar_arrays(symbol)`` (versioned numpy copy);
+  - ``timeframe`` -- ``get_timeframe_bars_snapshot(symbol, tf)`` (the
+                     on-demand ``/smc_live`` path);
+  - ``all_tf``    -- ``get_all_timeframe_snapshots("5m")`` (compute cycle),
+                     issued by reader 0 once per ``--cycle-seconds``.
+
+The cache is pre-filled to ``--rolling-bars`` bars per symbol, so every
+push evicts a bar and the rolling aggregators do their steady-state work.
+
+Usage:
+    python -m scripts.benchmark_live_overlay_bar_cache
+    python -m scripts.benchmark_live_overlay_bar_cache --rate 20000 --readers 8 --seconds 10
+
+Prints a JSON report to stdout. Dev-only; not wired into CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+
+import numpy as np
+
+from services.live_overlay_daemon import cache
+
+_NS_PER_MINUTE = 60_000_000_000
+_TIMEFRAMES = ("5m", "15m", "1H")
+_PACE_BATCH = 100  # bars pushed between pacing checks
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--symbols", type=int, default=2_000, help="symbols written round-robin (default: 2000)")
+    parser.add_argument("--rate", type=float, default=10_000.0, help="writer rate in bars per second (default: 10000)")
+    parser.add_argument("--readers", type=int, default=4, help="concurrent reader threads (default: 4)")
+    parser.add_argument("--read-rate", type=float, default=500.0, help="requests per second per reader (default: 500)")
+    parser.add_argument("--seconds", type=float, default=5.0, help="measured run length (default: 5)")
+    parser.add_argument("--rolling-bars", type=int, default=60, help="bars kept per symbol (default: 60)")
+    parser.add_argument("--cycle-seconds", type=float, default=1.0, help="compute-cycle period (default: 1)")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args(argv)
+
+
+def _bar(rng: random.Random, minute: int) -> dict[str, float | int]:
+    price = 100.0 + rng.uniform(-5.0, 5.0)
+    return {
+        "open": price,
+        "high": price + 0.5,
+        "low": price - 0.5,
+        "close": price + rng.uniform(-0.25, 0.25),
+        "volume": float(rng.randint(1, 5_000)),
+        "ts_event": minute * _NS_PER_MINUTE,
+    }
+
+
+def _percentiles(samples_ns: list[int]) -> dict[str, float]:
+    if not samples_ns:
+        return {"count": 0}
+    samples_us = np.asarray(samples_ns, dtype=np.float64) / 1_000.0
+    p50, p99, p999 = np.percentile(samples_us, [50, 99, 99.9])
+    return {
+        "count": int(samples_us.size),
+        "p50_us": round(float(p50), 1),
+        "p99_us": round(float(p99), 1),
+        "p99_9_us": round(float(p999), 1),
+        "max_us": round(float(samples_us.max()), 1),
+    }
+
+
+def run_benchmark(
+    *,
+    symbols: int = 2_000,
+    rate: float = 10_000.0,
+    readers: int = 4,
+    read_rate: float = 500.0,
+    seconds: float = 5.0,
+    rolling_bars: int = 60,
+    cycle_seconds: float = 1.0,
+    seed: int = 7,
+) -> dict[str, object]:
+    rng = random.Random(seed)
+    names = [f"S{i:05d}" for i in range(symbols)]
+    cache.reset_bar_cache()
+    cache.init_bar_cache(rolling_bars, max_symbols=max(symbols, 1))
+    minute = 1_000_000
+    for _ in range(rolling_bars):
+        minute += 1
+        for name in names:
+            cache.push_bar(name, _bar(rng, minute))
+
+    stop = threading.Event()
+    latencies: list[dict[str, list[int]]] = [defaultdict(list) for _ in range(readers)]
+    writer_stats: dict[str, float] = {}
+
+    def _write() -> None:
+        writer_rng = random.Random(seed + 1)
+        pushed, bar_minute, max_lag = 0, minute, 0.0
+        started = time.perf_counter()
+        while not stop.is_set():
+            for _ in range(_PACE_BATCH):
+                name = names[pushed % symbols]
+                if pushed % symbols == 0:
+                    bar_minute += 1
+                cache.push_bar(name, _bar(writer_rng, bar_minute))
+                pushed += 1
+            lag = (time.perf_counter() - started) - pushed / rate
+            max_lag = max(max_lag, lag)
+            if lag < 0:
+                stop.wait(-lag)
+        elapsed = time.perf_counter() - started
+        writer_stats.update(bars=pushed, bars_per_second=round(pushed / elapsed, 1), max_lag_ms=round(max_lag * 1e3, 2))
+
+    def _read(index: int) -> None:
+        reader_rng = random.Random(seed + 2 + index)
+        samples = latencies[index]
+        started_at = time.perf_counter()
+        next_cycle = started_at + cycle_seconds
+        issued = 0
+        while not stop.is_set():
+            ahead = issued / read_rate - (time.perf_counter() - started_at)
+            if ahead > 0:
+                stop.wait(ahead)
+                continue
+            issued += 1
+            if index == 0 and time.perf_counter() >= next_cycle:
+                op = "all_tf"
+                started = time.perf_counter_ns()
+                cache.get_all_timeframe_snapshots("5m")
+                next_cycle += cycle_seconds
+            else:
+                name = names[reader_rng.randrange(symbols)]
+                op = reader_rng.choice(("bars", "arrays", "timeframe"))
+                started = time.perf_counter_ns()
+                if op == "bars":
+                    cache.get_bars_snapshot(name)
+                elif op == "arrays":
+                    cache.get_bar_arrays(name)
+                else:
+                    cache.get_timeframe_bars_snapshot(name, reader_rng.choice(_TIMEFRAMES))
+            samples[op].append(time.perf_counter_ns() - started)
+
+    threads = [threading.Thread(target=_write, name="bar-writer", daemon=True)]
+    threads += [threading.Thread(target=_read, args=(i,), name=f"bar-reader-{i}", daemon=True) for i in range(readers)]
+    for thread in threads:
+        thread.start()
+    stop.wait(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    merged: dict[str, list[int]] = defaultdict(list)
+    for samples in latencies:
+        for op, values in samples.items():
+            merged[op].extend(values)
+    report = {
+        "config": {
+            "symbols": symbols,
+            "rate": rate,
+            "readers": readers,
+            "read_rate": read_rate,
+            "seconds": seconds,
+            "rolling_bars": rolling_bars,
+            "shards": cache._BAR_SHARDS,
+        },
+        "writer": writer_stats,
+        "reads": {op: _percentiles(merged[op]) for op in ("bars", "arrays", "timeframe", "all_tf")},
+        "cached_bars": cache.total_bar_count(),
+    }
+    cache.reset_bar_cache()
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    report = run_benchmark(
+        symbols=args.symbols,
+        rate=args.rate,
+        readers=args.readers,
+        read_rate=args.read_rate,
+        seconds=args.seconds,
+        rolling_bars=args.rolling_bars,
+        cycle_seconds=args.cycle_seconds,
+        seed=args.seed,
+    )
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
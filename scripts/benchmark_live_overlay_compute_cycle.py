@@ -0,0 +1,155 @@
+"""Measure the live overlay daemon's full compute cycle under partial churn.
+
+Fills the bar cache with ``--symbols`` symbols of ``--rolling-bars``
+1-minute bars and serves a synthetic news snapshot of ``--stories``
+stories. Each measured cycle first pushes one new bar to ``--churn`` of
+the symbols (5 % by default), then runs
+``compute.run_full_compute_cycle()`` in two modes:
+
+  - ``full``        -- the cycle memo is reset first, so every symbol is
+                       recomputed (the cost of a cycle without dirty
+                       tracking);
+  - ``incremental`` -- the memo carries over, so only the churned symbols
+                       are recomputed.
+
+Usage:
+    python -m scripts.benchmark_live_overlay_compute_cycle
+    python -m scripts.benchmark_live_overlay_compute_cycle --symbols 10000 --churn 0.01 --workers 8
+
+Prints a JSON report to stdout. Dev-only; not wired into CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from typing import Any
+from unittest import mock
+
+import numpy as np
+
+from services.live_overlay_daemon import cache, compute, config
+
+_NS_PER_MINUTE = 60_000_000_000
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--symbols", type=int, default=3_000, help="cached symbols (default: 3000)")
+    parser.add_argument("--churn", type=float, default=0.05, help="share of symbols with a new bar per cycle (default: 0.05)")
+    parser.add_argument("--cycles", type=int, default=10, help="measured cycles per mode (default: 10)")
+    parser.add_argument("--stories", type=int, default=500, help="stories in the news snapshot (default: 500)")
+    parser.add_argument("--rolling-bars", type=int, default=60, help="bars kept per symbol (default: 60)")
+    parser.add_argument("--workers", type=int, default=4, help="compute worker threads (default: 4)")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args(argv)
+
+
+def _bar(rng: random.Random, minute: int) -> dict[str, float | int]:
+    price = 100.0 + rng.uniform(-5.0, 5.0)
+    return {
+        "open": price,
+        "high": price + 0.5,
+        "low": price - 0.5,
+        "close": price + rng.uniform(-0.25, 0.25),
+        "volume": float(rng.randint(1, 5_000)),
+        "ts_event": minute * _NS_PER_MINUTE,
+    }
+
+
+def _news_snapshot(rng: random.Random, names: list[str], stories: int) -> dict[str, Any]:
+    return {
+        "stories": [
+            {"tickers": rng.sample(names, k=min(3, len(names))), "sentiment_score": rng.uniform(-1.0, 1.0)}
+            for _ in range(stories)
+        ]
+    }
+
+
+def _summary_ms(samples_s: list[float]) -> dict[str, float]:
+    samples_ms = np.asarray(samples_s, dtype=np.float64) * 1_000.0
+    return {
+        "mean_ms": round(float(samples_ms.mean()), 2),
+        "p50_ms": round(float(np.percentile(samples_ms, 50)), 2),
+        "max_ms": round(float(samples_ms.max()), 2),
+    }
+
+
+def run_benchmark(
+    *,
+    symbols: int = 3_000,
+    churn: float = 0.05,
+    cycles: int = 10,
+    stories: int = 500,
+    rolling_bars: int = 60,
+    workers: int = 4,
+    seed: int = 7,
+) -> dict[str, object]:
+    rng = random.Random(seed)
+    names = [f"S{i:05d}" for i in range(symbols)]
+    cache.reset_bar_cache()
+    cache.init_bar_cache(rolling_bars, max_symbols=max(symbols, 1))
+    minute = 1_000_000
+    for _ in range(rolling_bars):
+        minute += 1
+        cache.push_bars((name, _bar(rng, minute)) for name in names)
+    news = _news_snapshot(rng, names, stories)
+    churned = max(1, round(symbols * churn))
+
+    timings: dict[str, list[float]] = {"full": [], "incremental": []}
+    with (
+        mock.patch.object(compute, "_load_news_snapshot", lambda: dict(news)),
+        mock.patch.object(config, "compute_workers", lambda: workers),
+        mock.patch.object(cache, "set_overlay", lambda _payloads: None),
+    ):
+        compute._cycle_state.reset()
+        compute.run_full_compute_cycle()  # warm-up: fills the memo and starts the pool
+        for mode in ("full", "incremental"):
+            for _ in range(cycles):
+                minute += 1
+                cache.push_bars((name, _bar(rng, minute)) for name in rng.sample(names, churned))
+                if mode == "full":
+                    compute._cycle_state.reset()
+                started = time.perf_counter()
+                computed = compute.run_full_compute_cycle()
+                timings[mode].append(time.perf_counter() - started)
+                if computed != symbols:
+                    raise RuntimeError(f"cycle computed {computed} of {symbols} symbols")
+
+    report = {
+        "config": {
+            "symbols": symbols,
+            "churn": churn,
+            "churned_per_cycle": churned,
+            "cycles": cycles,
+            "stories": stories,
+            "rolling_bars": rolling_bars,
+            "workers": workers,
+        },
+        "cycle": {mode: _summary_ms(samples) for mode, samples in timings.items()},
+        "speedup": round(float(np.mean(timings["full"]) / np.mean(timings["incremental"])), 1),
+    }
+    compute._cycle_state.reset()
+    cache.reset_bar_cache()
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    report = run_benchmark(
+        symbols=args.symbols,
+        churn=args.churn,
+        cycles=args.cycles,
+        stories=args.stories,
+        rolling_bars=args.rolling_bars,
+        workers=args.workers,
+        seed=args.seed,
+    )
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
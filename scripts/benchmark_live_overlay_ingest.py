@@ -0,0 +1,215 @@
+"""Replay a minute-rollover burst through the live overlay daemon's ingest path.
+
+Decodes a DBN stream, then feeds its records through the same two stages
+the daemon runs: ``feed._consume_records`` (record dispatch + bar
+conversion + enqueue) on the calling thread and ``feed._run_ingest_loop``
+(batched drain into ``cache.push_bars``) on a worker thread. Records are
+yielded as fast as the consumer takes them, like the burst ``db.Live()``
+delivers when every symbol's bar closes at once.
+
+One unmeasured warm-up replay inserts every symbol first, so the measured
+replays see the steady state of a session (every symbol cached, the bar
+appended to an existing ring). End-to-end latency is measured per bar,
+from the moment its record is yielded to the return of the
+``cache.push_bars`` call that applied it (the queue is FIFO, so the n-th
+applied bar is the n-th yielded one).
+
+``--dbn`` replays a live recording (``db.Live.add_stream``) of EQUS.MINI
+``ohlcv-1m``; it must carry the ``SymbolMappingMsg`` records the live
+gateway sends. Without ``--dbn`` a synthetic burst of ``--symbols`` bars
+(one per symbol, preceded by their mapping records) is encoded to DBN in
+memory and decoded back.
+
+Usage:
+    python -m scripts.benchmark_live_overlay_ingest
+    python -m scripts.benchmark_live_overlay_ingest --symbols 12000 --repeat 5
+    python -m scripts.benchmark_live_overlay_ingest --dbn recordings/equs_mini_rollover.dbn
+
+Prints a JSON report to stdout. Dev-only; not wired into CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import databento as db
+import databento_dbn
+import numpy as np
+
+from services.live_overlay_daemon import cache, feed
+from services.live_overlay_daemon.ingest_buffer import IngestBuffer
+
+_NS_PER_MINUTE = 60_000_000_000
+_BURST_TS_EVENT = 1_780_000_000 * 1_000_000_000
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dbn", type=Path, default=None, help="live DBN recording to replay (default: synthetic)")
+    parser.add_argument("--symbols", type=int, default=10_000, help="synthetic burst size in bars (default: 10000)")
+    parser.add_argument("--repeat", type=int, default=3, help="measured replays of the burst (default: 3)")
+    parser.add_argument("--rolling-bars", type=int, default=60, help="bars kept per symbol (default: 60)")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args(argv)
+
+
+def synthetic_burst_dbn(symbols: int, *, seed: int = 7) -> bytes:
+    """Encode a mapping record plus one ``ohlcv-1m`` bar per symbol as a DBN stream."""
+    rng = random.Random(seed)
+    metadata = databento_dbn.Metadata(
+        dataset="EQUS.MINI",
+        schema=databento_dbn.Schema.OHLCV_1M,
+        start=_BURST_TS_EVENT - _NS_PER_MINUTE,
+        stype_in=databento_dbn.SType.RAW_SYMBOL,
+        stype_out=databento_dbn.SType.INSTRUMENT_ID,
+        symbols=["ALL_SYMBOLS"],
+        partial=[],
+        not_found=[],
+        mappings=[],
+        version=3,
+        ts_out=False,
+        end=None,
+        limit=None,
+    )
+    chunks = [metadata.encode()]
+    for index in range(symbols):
+        chunks.append(
+            bytes(
+                databento_dbn.SymbolMappingMsg(
+                    publisher_id=1,
+                    instrument_id=index + 1,
+                    ts_event=_BURST_TS_EVENT,
+                    stype_in=databento_dbn.SType.RAW_SYMBOL,
+                    stype_in_symbol=f"S{index:05d}",
+                    stype_out=databento_dbn.SType.INSTRUMENT_ID,
+                    stype_out_symbol=f"S{index:05d}",
+                    start_ts=0,
+                    end_ts=0,
+                )
+            )
+        )
+    for index in range(symbols):
+        price = int((100.0 + rng.uniform(-5.0, 5.0)) * 1e9)
+        chunks.append(
+            bytes(
+                databento_dbn.OHLCVMsg(
+                    rtype=databento_dbn.RType.OHLCV_1M,
+                    publisher_id=1,
+                    instrument_id=index + 1,
+                    ts_event=_BURST_TS_EVENT,
+                    open=price,
+                    high=price + 500_000_000,
+                    low=price - 500_000_000,
+                    close=price + 100_000_000,
+                    volume=rng.randint(1, 5_000),
+                )
+            )
+        )
+    return b"".join(chunks)
+
+
+def _replay(records: list[Any], yielded_at: list[float]) -> Iterator[Any]:
+    """Yield ``records`` back to back, stamping the yield time of each bar record."""
+    for record in records:
+        if type(record) is db.OHLCVMsg:
+            yielded_at.append(time.monotonic())
+        yield record
+
+
+def _percentiles_ms(samples_s: list[float]) -> dict[str, float]:
+    if not samples_s:
+        return {"count": 0}
+    samples_ms = np.asarray(samples_s, dtype=np.float64) * 1_000.0
+    p50, p99 = np.percentile(samples_ms, [50, 99])
+    return {
+        "count": int(samples_ms.size),
+        "p50_ms": round(float(p50), 3),
+        "p99_ms": round(float(p99), 3),
+        "max_ms": round(float(samples_ms.max()), 3),
+    }
+
+
+def run_benchmark(
+    records: list[Any],
+    *,
+    repeat: int = 3,
+    rolling_bars: int = 60,
+) -> dict[str, object]:
+    bars = sum(type(record) is db.OHLCVMsg for record in records)
+    if not any(type(record) is db.SymbolMappingMsg for record in records):
+        raise ValueError("the DBN stream carries no SymbolMappingMsg records; replay a live recording")
+    cache.reset_bar_cache()
+    cache.init_bar_cache(rolling_bars, max_symbols=max(bars, 1))
+
+    yielded_at: list[float] = []
+    applied_at: list[float] = []
+    batch_sizes: list[int] = []
+    push_bars = cache.push_bars
+
+    def _timed_push_bars(batch: Any) -> int:
+        count = push_bars(batch)
+        applied_at.extend([time.monotonic()] * count)
+        batch_sizes.append(count)
+        return count
+
+    saved_queue = feed._runtime.get("ingest_queue")
+    burst_seconds: list[float] = []
+    with mock.patch.object(cache, "push_bars", _timed_push_bars):
+        for replay in range(repeat + 1):
+            if replay == 1:
+                # The warm-up replay inserted every symbol; measure from here.
+                del yielded_at[:], applied_at[:], batch_sizes[:], burst_seconds[:]
+            stop = threading.Event()
+            expected = len(applied_at) + bars
+            feed._runtime["ingest_queue"] = IngestBuffer(maxsize=bars + 1)
+            ingest_thread = threading.Thread(target=feed._run_ingest_loop, args=(stop,), name="bench-ingest", daemon=True)
+            ingest_thread.start()
+            started = time.monotonic()
+            feed._consume_records(_replay(records, yielded_at), stop)
+            while len(applied_at) < expected and ingest_thread.is_alive():
+                stop.wait(0.001)
+            burst_seconds.append(time.monotonic() - started)
+            stop.set()
+            ingest_thread.join()
+    feed._runtime["ingest_queue"] = saved_queue
+    feed._feed_ready.clear()
+
+    latencies = [done - start for start, done in zip(yielded_at, applied_at, strict=False)]
+    report = {
+        "config": {"records": len(records), "bars": bars, "repeat": repeat, "rolling_bars": rolling_bars},
+        "burst_seconds": [round(seconds, 4) for seconds in burst_seconds],
+        "bars_per_second": round(bars * repeat / sum(burst_seconds), 1),
+        "applied": len(applied_at),
+        "latency": _percentiles_ms(latencies),
+        "batches": {
+            "count": len(batch_sizes),
+            "mean_size": round(float(np.mean(batch_sizes)), 1) if batch_sizes else 0.0,
+            "max_size": max(batch_sizes, default=0),
+        },
+        "cached_bars": cache.total_bar_count(),
+    }
+    cache.reset_bar_cache()
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    if args.dbn is not None:
+        store = db.DBNStore.from_file(args.dbn)
+    else:
+        store = db.DBNStore.from_bytes(synthetic_burst_dbn(args.symbols, seed=args.seed))
+    report = run_benchmark(list(store), repeat=args.repeat, rolling_bars=args.rolling_bars)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,171 @@
+"""Measure the live overlay daemon's Prometheus scrape rendering under partial updates.
+
+Seeds ``--series`` per-symbol counter series into the in-process counter
+registry (``live_overlay.symbol_requests.<SYM>.total``, the flat naming the
+renderer exposes) and then, before each measured scrape, bumps ``--updates``
+of them (1 % by default) through ``observability.metric_counter``. Each
+scrape is timed in two modes:
+
+  - ``scratch``     -- the fragment cache is reset first, so every counter
+                       is formatted again (the cost of a renderer without
+                       cached fragments);
+  - ``incremental`` -- the fragment cache carries over, so only the bumped
+                       counters are re-rendered.
+
+Both the counter section alone and the full ``render_metrics()`` body are
+timed; the news / signals / credential / experiment loaders and the external
+bridges are stubbed out so the numbers measure rendering, not I/O. Per-update
+metric log lines are silenced (``logging.disable``).
+
+Usage:
+    python -m scripts.benchmark_live_overlay_metrics_render
+    python -m scripts.benchmark_live_overlay_metrics_render --series 20000 --updates 0.01 --openmetrics
+
+Prints a JSON report to stdout. Dev-only; not wired into CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gzip
+import json
+import logging
+import random
+import time
+from collections.abc import Iterator
+from unittest import mock
+
+import numpy as np
+
+from services.live_overlay_daemon import (
+    compute,
+    github_workflow_bridge,
+    metrics,
+    observability,
+    railway_metrics,
+    uptimerobot_bridge,
+)
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--series", type=int, default=5_000, help="per-symbol counter series (default: 5000)")
+    parser.add_argument("--updates", type=float, default=0.01, help="share of series bumped per scrape (default: 0.01)")
+    parser.add_argument("--scrapes", type=int, default=50, help="measured scrapes per mode (default: 50)")
+    parser.add_argument("--openmetrics", action="store_true", help="render OpenMetrics instead of Prometheus text")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args(argv)
+
+
+@contextlib.contextmanager
+def _quiet_sources() -> Iterator[None]:
+    with contextlib.ExitStack() as stack:
+        for loader, empty in (
+            ("_load_news_snapshot", {}),
+            ("_load_signals_snapshot", {}),
+            ("_load_tradingview_credential_snapshot", {}),
+            ("_load_credential_health_snapshot", {}),
+            ("_load_experiment_snapshot", {}),
+            ("_load_experiment_history", []),
+        ):
+            stack.enter_context(mock.patch.object(compute, loader, lambda empty=empty: empty))
+        for bridge in (uptimerobot_bridge, github_workflow_bridge):
+            stack.enter_context(mock.patch.object(bridge, "snapshot", lambda: {"enabled": False, "configured": False}))
+        stack.enter_context(mock.patch.object(railway_metrics, "snapshot", railway_metrics._disabled_snapshot))
+        yield
+
+
+def _summary_ms(samples_s: list[float]) -> dict[str, float]:
+    samples_ms = np.asarray(samples_s, dtype=np.float64) * 1_000.0
+    return {
+        "mean_ms": round(float(samples_ms.mean()), 3),
+        "p50_ms": round(float(np.percentile(samples_ms, 50)), 3),
+        "p99_ms": round(float(np.percentile(samples_ms, 99)), 3),
+    }
+
+
+def run_benchmark(
+    *,
+    series: int = 5_000,
+    updates: float = 0.01,
+    scrapes: int = 50,
+    openmetrics: bool = False,
+    seed: int = 7,
+) -> dict[str, object]:
+    rng = random.Random(seed)
+    names = [f"live_overlay.symbol_requests.s{i:05d}.total" for i in range(series)]
+    bumped = max(1, round(series * updates))
+    with observability._counter_lock:
+        saved_counters = dict(observability._counters)
+        observability._counters.clear()
+        observability._counters.update((name, float(rng.randint(0, 1_000))) for name in names)
+
+    timings: dict[str, dict[str, list[float]]] = {
+        mode: {"counter_section": [], "full_body": []} for mode in ("scratch", "incremental")
+    }
+    logging.disable(logging.INFO)
+    try:
+        with _quiet_sources():
+            body = metrics.render_metrics(0.0, openmetrics=openmetrics)  # warm-up: fills the fragment cache
+            for mode in ("scratch", "incremental"):
+                for _ in range(scrapes):
+                    for name in rng.sample(names, bumped):
+                        observability.metric_counter(name)
+                    if mode == "scratch":
+                        metrics._counter_families.reset()
+                    with observability._counter_lock:
+                        counters = dict(observability._counters)
+                    started = time.perf_counter()
+                    metrics._counter_families.render(counters, openmetrics=openmetrics)
+                    timings[mode]["counter_section"].append(time.perf_counter() - started)
+
+                    for name in rng.sample(names, bumped):
+                        observability.metric_counter(name)
+                    if mode == "scratch":
+                        metrics._counter_families.reset()
+                    started = time.perf_counter()
+                    body = metrics.render_metrics(0.0, openmetrics=openmetrics)
+                    timings[mode]["full_body"].append(time.perf_counter() - started)
+    finally:
+        logging.disable(logging.NOTSET)
+        metrics._counter_families.reset()
+        with observability._counter_lock:
+            observability._counters.clear()
+            observability._counters.update(saved_counters)
+
+    encoded = body.encode("utf-8")
+    report = {
+        "config": {
+            "series": series,
+            "updates": updates,
+            "bumped_per_scrape": bumped,
+            "scrapes": scrapes,
+            "format": "openmetrics" if openmetrics else "prometheus",
+        },
+        "body_bytes": len(encoded),
+        "gzip_body_bytes": len(gzip.compress(encoded, compresslevel=1, mtime=0)),
+    }
+    for part in ("counter_section", "full_body"):
+        report[part] = {mode: _summary_ms(timings[mode][part]) for mode in ("scratch", "incremental")}
+        report[part]["speedup"] = round(
+            float(np.mean(timings["scratch"][part]) / np.mean(timings["incremental"][part])), 1
+        )
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    report = run_benchmark(
+        series=args.series,
+        updates=args.updates,
+        scrapes=args.scrapes,
+        openmetrics=args.openmetrics,
+        seed=args.seed,
+    )
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,194 @@
+"""Load-test the live overlay daemon's ``/{token}/smc_live`` endpoint in-process.
+
+Fills the bar cache with ``--symbols`` symbols of ``--rolling-bars``
+1-minute bars, runs one full compute cycle and then drives the FastAPI app
+through a local ASGI client (``fastapi.testclient.TestClient`` outside its
+context manager: no sockets, no lifespan, so no feed threads) with
+``--concurrency`` poller threads, each requesting random symbols across all
+served timeframes. Three modes:
+
+  - ``uncached``     -- the payload cache never stores an entry, so every
+                        request builds and encodes its payload (the cost of
+                        the endpoint before the pre-encoded cache);
+  - ``cached``       -- ``payload_cache.refresh()`` ran after the cycle and
+                        requests are served from pre-encoded bytes;
+  - ``not_modified`` -- as ``cached``, but pollers send the ETag of their
+                        previous response and get 304s.
+
+Per-request audit and metric log lines are silenced (``logging.disable``)
+so the numbers measure the endpoint, not the log handler.
+
+Usage:
+    python -m scripts.benchmark_live_overlay_smc_live
+    python -m scripts.benchmark_live_overlay_smc_live --symbols 5000 --requests 20000 --concurrency 32
+
+Prints a JSON report to stdout. Dev-only; not wired into CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import json
+import logging
+import random
+import threading
+import time
+from unittest import mock
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from services.live_overlay_daemon import cache, compute, config, payload_cache
+from services.live_overlay_daemon.main import app
+
+_NS_PER_MINUTE = 60_000_000_000
+_TOKEN = "benchmark-token"
+_TIMEFRAMES = tuple(sorted(compute.supported_timeframes()))
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--symbols", type=int, default=2_000, help="cached symbols (default: 2000)")
+    parser.add_argument("--requests", type=int, default=5_000, help="measured requests per mode (default: 5000)")
+    parser.add_argument("--concurrency", type=int, default=8, help="poller threads (default: 8)")
+    parser.add_argument("--rolling-bars", type=int, default=240, help="bars kept per symbol (default: 240)")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args(argv)
+
+
+def _fill_cache(rng: random.Random, names: list[str], rolling_bars: int) -> None:
+    cache.reset_bar_cache()
+    cache.init_bar_cache(rolling_bars, max_symbols=max(len(names), 1))
+    # Bars end now, so every timeframe serves fresh (non-stale) payloads.
+    last = int(time.time() // 60)
+    for minute in range(last - rolling_bars + 1, last + 1):
+        bars = []
+        for name in names:
+            price = 100.0 + rng.uniform(-5.0, 5.0)
+            bars.append(
+                (
+                    name,
+                    {
+                        "open": price,
+                        "high": price + 0.5,
+                        "low": price - 0.5,
+                        "close": price + rng.uniform(-0.25, 0.25),
+                        "volume": float(rng.randint(1, 5_000)),
+                        "ts_event": minute * _NS_PER_MINUTE,
+                    },
+                )
+            )
+        cache.push_bars(bars)
+
+
+def _drive(
+    requests: list[tuple[str, str]], concurrency: int, *, revalidate: bool
+) -> tuple[float, list[float], dict[int, int]]:
+    latencies: list[float] = []
+    statuses: dict[int, int] = {}
+    etags: dict[tuple[str, str], str] = {}
+    lock = threading.Lock()
+    if revalidate:
+        client = TestClient(app)
+        for key in set(requests):
+            response = client.get(f"/{_TOKEN}/smc_live", params={"symbol": key[0], "tf": key[1]})
+            etags[key] = response.headers["etag"]
+
+    def _poller(share: list[tuple[str, str]]) -> None:
+        client = TestClient(app)
+        for key in share:
+            headers = {"Accept-Encoding": "gzip"}
+            if revalidate:
+                headers["If-None-Match"] = etags[key]
+            started = time.perf_counter()
+            response = client.get(f"/{_TOKEN}/smc_live", params={"symbol": key[0], "tf": key[1]}, headers=headers)
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    started = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(_poller, requests[i::concurrency]) for i in range(concurrency)]:
+            future.result()
+    elapsed = time.perf_counter() - started
+    return elapsed, latencies, statuses
+
+
+def _summary(elapsed: float, latencies: list[float], statuses: dict[int, int]) -> dict[str, object]:
+    latencies_ms = np.asarray(latencies, dtype=np.float64) * 1_000.0
+    return {
+        "requests_per_sec": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(float(np.percentile(latencies_ms, 50)), 3),
+        "p99_ms": round(float(np.percentile(latencies_ms, 99)), 3),
+        "statuses": {str(code): count for code, count in sorted(statuses.items())},
+    }
+
+
+def run_benchmark(
+    *,
+    symbols: int = 2_000,
+    requests: int = 5_000,
+    concurrency: int = 8,
+    rolling_bars: int = 240,
+    seed: int = 7,
+) -> dict[str, object]:
+    rng = random.Random(seed)
+    names = [f"S{i:05d}" for i in range(symbols)]
+    load = [(rng.choice(names), rng.choice(_TIMEFRAMES)) for _ in range(requests)]
+    report: dict[str, object] = {
+        "config": {
+            "symbols": symbols,
+            "requests": requests,
+            "concurrency": concurrency,
+            "rolling_bars": rolling_bars,
+            "timeframes": list(_TIMEFRAMES),
+        },
+    }
+    logging.disable(logging.INFO)
+    try:
+        with (
+            mock.patch.object(config, "overlay_secret_token", lambda: _TOKEN),
+            mock.patch.object(compute, "_load_news_snapshot", lambda: {"stories": []}),
+        ):
+            _fill_cache(rng, names, rolling_bars)
+            compute._cycle_state.reset()
+            compute.run_full_compute_cycle()
+
+            payload_cache.reset()
+            with mock.patch.object(payload_cache, "_cacheable", lambda _version: False):
+                report["uncached"] = _summary(*_drive(load, concurrency, revalidate=False))
+
+            payload_cache.refresh()
+            report["cached"] = _summary(*_drive(load, concurrency, revalidate=False))
+            report["not_modified"] = _summary(*_drive(load, concurrency, revalidate=True))
+    finally:
+        logging.disable(logging.NOTSET)
+        payload_cache.reset()
+        compute._cycle_state.reset()
+        cache.reset_bar_cache()
+
+    for mode in ("uncached", "cached", "not_modified"):
+        statuses = report[mode]["statuses"]  # type: ignore[index]
+        expected = "304" if mode == "not_modified" else "200"
+        if statuses != {expected: requests}:
+            raise RuntimeError(f"{mode}: unexpected response statuses {statuses}")
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    report = run_benchmark(
+        symbols=args.symbols,
+        requests=args.requests,
+        concurrency=args.concurrency,
+        rolling_bars=args.rolling_bars,
+        seed=args.seed,
+    )
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
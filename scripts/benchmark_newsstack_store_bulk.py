@@ -0,0 +1,131 @@
+"""Benchmark newsstack dedup / novelty writes: per-item vs. batched transactions.
+
+Feeds ``--items`` synthetic news items (with ``--dup-ratio`` re-deliveries
+and a small pool of shared headline clusters) through a file-backed
+``SqliteStore`` in a temp dir, once per mode, each on a fresh database:
+
+  - ``per_item`` -- ``mark_seen`` + ``cluster_touch`` per item (one INSERT
+                    and one ``BEGIN IMMEDIATE`` transaction per item, the
+                    pre-batching ``process_news_items`` write pattern);
+  - ``batched``  -- ``mark_seen_many`` + ``cluster_touch_many`` once per
+                    poll batch of ``--batch-size`` items.
+
+Both modes must report identical new-item flags and cluster counts; the
+report includes that check. Timings are the best of ``--repeat`` runs.
+
+Usage:
+    python -m scripts.benchmark_newsstack_store_bulk                  # 10k items
+    python -m scripts.benchmark_newsstack_store_bulk --items 2000 --batch-size 100
+
+Prints a JSON report to stdout. Dev-only; not wired into CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from newsstack_fmp.store_sqlite import SqliteStore
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10_000, help="synthetic items (default: 10000)")
+    parser.add_argument("--batch-size", type=int, default=500, help="items per poll batch (default: 500)")
+    parser.add_argument("--dup-ratio", type=float, default=0.1, help="share of re-delivered items (default: 0.1)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per mode, best is reported (default: 3)")
+    parser.add_argument("--seed", type=int, default=7, help="RNG seed (default: 7)")
+    return parser.parse_args(argv)
+
+
+def build_synthetic_items(n_items: int, *, dup_ratio: float = 0.1, seed: int = 7) -> list[tuple[str, str, float, str]]:
+    """Return ``(provider, item_id, ts, cluster_hash)`` rows in arrival order."""
+    rng = random.Random(seed)
+    providers = ("fmp_stock_latest", "fmp_press_latest", "benzinga_rest", "newsapi_ai")
+    n_clusters = max(1, n_items // 4)
+    rows: list[tuple[str, str, float, str]] = []
+    for idx in range(n_items):
+        if rows and rng.random() < dup_ratio:
+            provider, item_id, _ts, chash = rng.choice(rows)
+        else:
+            provider, item_id = rng.choice(providers), f"item-{idx:06d}"
+            chash = f"{rng.randrange(n_clusters):016x}"
+        rows.append((provider, item_id, 1_700_000_000.0 + idx * 0.5, chash))
+    return rows
+
+
+def _run_per_item(store: SqliteStore, rows: list[tuple[str, str, float, str]]) -> tuple[list[bool], list[int]]:
+    flags: list[bool] = []
+    counts: list[int] = []
+    for provider, item_id, ts, chash in rows:
+        is_new = store.mark_seen(provider, item_id, ts)
+        flags.append(is_new)
+        if is_new:
+            counts.append(store.cluster_touch(chash, ts)[0])
+    return flags, counts
+
+
+def _run_batched(
+    store: SqliteStore, rows: list[tuple[str, str, float, str]], batch_size: int
+) -> tuple[list[bool], list[int]]:
+    flags: list[bool] = []
+    counts: list[int] = []
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start:start + batch_size]
+        batch_flags = store.mark_seen_many([(provider, item_id, ts) for provider, item_id, ts, _ in batch])
+        flags.extend(batch_flags)
+        touches = [(chash, ts) for (_, _, ts, chash), is_new in zip(batch, batch_flags, strict=True) if is_new]
+        counts.extend(count for count, _ in store.cluster_touch_many(touches))
+    return flags, counts
+
+
+def run_benchmark(
+    n_items: int, *, batch_size: int = 500, dup_ratio: float = 0.1, repeat: int = 3, seed: int = 7
+) -> dict[str, object]:
+    rows = build_synthetic_items(n_items, dup_ratio=dup_ratio, seed=seed)
+    timings: dict[str, float] = {}
+    results: dict[str, tuple[list[bool], list[int]]] = {}
+    with tempfile.TemporaryDirectory(prefix="newsstack_store_bench_") as tmp:
+        for mode in ("per_item", "batched"):
+            best = float("inf")
+            for run in range(max(1, repeat)):
+                store = SqliteStore(str(Path(tmp) / f"{mode}_{run}.db"))
+                try:
+                    started = time.perf_counter()
+                    if mode == "per_item":
+                        results[mode] = _run_per_item(store, rows)
+                    else:
+                        results[mode] = _run_batched(store, rows, batch_size)
+                    best = min(best, time.perf_counter() - started)
+                finally:
+                    store.close(force=True)
+            timings[mode] = best
+
+    new_items = sum(results["batched"][0])
+    return {
+        "items": n_items,
+        "new_items": new_items,
+        "batch_size": batch_size,
+        "repeat": repeat,
+        "results_match": results["per_item"] == results["batched"],
+        "timings_s": {mode: round(seconds, 4) for mode, seconds in timings.items()},
+        "items_per_s": {mode: round(n_items / seconds) if seconds else None for mode, seconds in timings.items()},
+        "speedup": round(timings["per_item"] / timings["batched"], 1) if timings["batched"] else None,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    report = run_benchmark(
+        args.items, batch_size=args.batch_size, dup_ratio=args.dup_ratio, repeat=args.repeat, seed=args.seed
+    )
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
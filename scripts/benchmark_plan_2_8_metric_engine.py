@@ -0,0 +1,115 @@
+"""Benchmark a full Plan 2.8 ledger / weekly-summary metric refresh.
+
+Writes a synthetic ``--records``-line state ledger and a weekly summary,
+then refreshes every metric registered with ``plan_2_8_metric_engine``:
+
+  - ``per_script`` -- each metric script's ``main(... --output ...)`` in turn
+                      (one read + decode of the input per metric, the
+                      pre-engine refresh path minus interpreter start-up);
+  - ``engine``     -- ``run_metrics`` over one shared ``LedgerTable`` per input.
+
+The report includes both wall-clock totals and whether every per-metric
+output file is byte-identical between the two paths.
+
+Usage:
+    python -m scripts.benchmark_plan_2_8_metric_engine                  # 20k records
+    python -m scripts.benchmark_plan_2_8_metric_engine --records 2000 --format json
+
+Prints a JSON report to stdout. Dev-only; not wired into CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from scripts.plan_2_8_metric_engine import discover_metrics, run_metrics
+
+_STATUSES = ("green", "green", "green", "amber", "red", "unknown")
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=20_000, help="ledger lines (default: 20000)")
+    parser.add_argument("--format", choices=("md", "json"), default="md", help="output format (default: md)")
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed (default: 0)")
+    return parser.parse_args(argv)
+
+
+def _write_inputs(root: Path, records: int, seed: int) -> tuple[Path, Path]:
+    rng = random.Random(seed)
+    lines = []
+    for index in range(records):
+        hours, minutes = divmod(index * 7, 60)
+        days, hours = divmod(hours, 24)
+        lines.append(
+            json.dumps(
+                {
+                    "status": rng.choice(_STATUSES),
+                    "captured_at": f"2026-{1 + days // 28 % 12:02d}-{1 + days % 28:02d}T{hours:02d}:{minutes:02d}:00Z",
+                    "checks": [rng.randint(0, 9) for _ in range(3)],
+                    "score": round(rng.random(), 4),
+                    "ok": rng.random() < 0.8,
+                }
+            )
+        )
+    ledger = root / "state_ledger.jsonl"
+    # ATOMIC-WRITE-EXEMPT: dev-only benchmark input inside a TemporaryDirectory.
+    ledger.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    sections = [f"## Section {n}\n\n- green: {n} & amber: {n % 3}\n- [link](https://example.com/{n})\n" for n in range(40)]
+    summary = root / "weekly_summary.md"
+    # ATOMIC-WRITE-EXEMPT: same rationale as above (temporary benchmark input).
+    summary.write_text("# Plan 2.8 weekly summary\n\n" + "\n".join(sections), encoding="utf-8")
+    return ledger, summary
+
+
+def run_benchmark(records: int, *, fmt: str = "md", seed: int = 0) -> dict[str, object]:
+    registry = discover_metrics()
+    with tempfile.TemporaryDirectory(prefix="plan28_engine_bench_") as tmp:
+        root = Path(tmp)
+        ledger, summary = _write_inputs(root, records, seed)
+        inputs = {"ledger": ledger, "summary": summary}
+        for spec in registry.values():
+            importlib.import_module(spec.module)
+
+        started = time.perf_counter()
+        for name, spec in registry.items():
+            mod = importlib.import_module(spec.module)
+            argv = [f"--{spec.source}", str(inputs[spec.source]), "--format", fmt]
+            with contextlib.redirect_stdout(io.StringIO()):
+                mod.main([*argv, "--output", str(root / "per_script" / f"{name}.{fmt}")])
+        per_script_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        written = run_metrics(registry.values(), inputs=inputs, output_dir=root / "engine", fmt=fmt)
+        engine_s = time.perf_counter() - started
+
+        identical = all(
+            path.read_bytes() == (root / "per_script" / path.name).read_bytes() for path in written.values()
+        )
+    return {
+        "records": records,
+        "metrics": len(registry),
+        "format": fmt,
+        "seconds": {"per_script": round(per_script_s, 3), "engine": round(engine_s, 3)},
+        "speedup": round(per_script_s / engine_s, 1) if engine_s else None,
+        "outputs_identical": identical,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    report = run_benchmark(args.records, fmt=args.format, seed=args.seed)
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
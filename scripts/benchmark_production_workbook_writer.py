@@ -0,0 +1,134 @@
+"""Benchmark the production workbook writer: in-memory xlsx vs. sheet dataset + streaming xlsx.
+
+Builds a synthetic export of ``--sheets`` sheets x ``--rows`` rows (dates,
+tz-aware timestamps, symbols, floats, ints, bools; the first sheet is a
+``summary`` with the colour-scaled columns) and writes it once per mode, each
+in a fresh process so peak RSS is per mode:
+
+  - ``in_memory`` -- historic pandas/openpyxl ``create_excel_workbook_bytes``;
+  - ``streaming`` -- Parquet sheet dataset, then the write-only xlsx from it
+                     (the Step 10/10c default);
+  - ``off``       -- Parquet sheet dataset only (xlsx rendered on demand).
+
+Reports wall time, peak RSS and its growth over the post-build baseline, and
+the artifact sizes.
+
+Usage:
+    python -m scripts.benchmark_production_workbook_writer                  # 10k rows x 30 sheets
+    python -m scripts.benchmark_production_workbook_writer --rows 50000 --sheets 10
+
+Prints a JSON report to stdout. Dev-only; not wired into CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from scripts.databento_production_workbook import (
+    SUMMARY_HEAT_COLUMNS,
+    write_databento_production_workbook_from_frames,
+)
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000, help="rows per sheet (default: 10000)")
+    parser.add_argument("--sheets", type=int, default=30, help="sheets in the workbook (default: 30)")
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed (default: 0)")
+    return parser.parse_args(argv)
+
+
+def _peak_rss_mib() -> float:
+    # Linux reports ru_maxrss in KiB, macOS in bytes.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / 2**20 if sys.platform == "darwin" else peak / 1024, 1)
+
+
+def _sheet(rows: int, rng: np.random.Generator) -> pd.DataFrame:
+    symbols = np.array([f"SYM{i:04d}" for i in range(500)])
+    days = pd.bdate_range("2026-01-05", periods=30)
+    return pd.DataFrame(
+        {
+            "trade_date": days[rng.integers(0, len(days), rows)].date,
+            "symbol": symbols[rng.integers(0, len(symbols), rows)],
+            "timestamp": pd.Timestamp("2026-01-05 14:30", tz="UTC")
+            + pd.to_timedelta(rng.integers(0, 30 * 86_400, rows), unit="s"),
+            "open": rng.uniform(5.0, 300.0, rows),
+            "high": rng.uniform(5.0, 300.0, rows),
+            "low": rng.uniform(5.0, 300.0, rows),
+            "close": np.where(rng.uniform(size=rows) < 0.05, np.nan, rng.uniform(5.0, 300.0, rows)),
+            "volume": rng.integers(100, 5_000_000, rows),
+            "trade_count": rng.integers(1, 50_000, rows),
+            "is_eligible": rng.uniform(size=rows) < 0.8,
+            "exchange": rng.choice(["XNAS", "XNYS", "ARCX"], rows),
+            **{column: rng.normal(0.0, 5.0, rows) for column in SUMMARY_HEAT_COLUMNS},
+        }
+    )
+
+
+def _run_mode(mode: str, rows: int, sheets: int, seed: int, out_dir: Path) -> dict[str, object]:
+    rng = np.random.default_rng(seed)
+    frames = [_sheet(rows, rng) for _ in range(sheets)]
+    baseline = _peak_rss_mib()
+    started = time.perf_counter()
+    result = write_databento_production_workbook_from_frames(
+        summary=frames[0],
+        output_path=out_dir / "workbook.xlsx",
+        generated_at=1_700_000_000.0,
+        additional_sheets={f"sheet_{index:02d}": frame for index, frame in enumerate(frames[1:], start=1)},
+        sheet_dataset_dir=None if mode == "in_memory" else out_dir / "sheets",
+        xlsx_mode=mode,
+    )
+    elapsed = time.perf_counter() - started
+    peak = _peak_rss_mib()
+    dataset_bytes = sum(path.stat().st_size for path in (out_dir / "sheets").glob("*")) if mode != "in_memory" else 0
+    return {
+        "mode": mode,
+        "seconds": round(elapsed, 2),
+        "peak_rss_mib": peak,
+        "baseline_rss_mib": baseline,
+        "rss_growth_mib": round(peak - baseline, 1),
+        "xlsx_mib": round(result.output_path.stat().st_size / 2**20, 2) if result.output_path.exists() else None,
+        "sheet_dataset_mib": round(dataset_bytes / 2**20, 2) if dataset_bytes else None,
+    }
+
+
+def run_benchmark(rows: int, sheets: int, *, seed: int = 0) -> dict[str, object]:
+    report: dict[str, object] = {"rows_per_sheet": rows, "sheets": sheets}
+    with tempfile.TemporaryDirectory(prefix="workbook_writer_bench_") as tmp:
+        for mode in ("in_memory", "streaming", "off"):
+            out_dir = Path(tmp) / mode
+            out_dir.mkdir()
+            # A fresh spawned interpreter per mode keeps ru_maxrss per mode.
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                report[mode] = pool.submit(_run_mode, mode, rows, sheets, seed, out_dir).result()
+    in_memory, streaming = report["in_memory"], report["streaming"]
+    report["streaming_rss_growth_ratio"] = (
+        round(streaming["rss_growth_mib"] / in_memory["rss_growth_mib"], 3) if in_memory["rss_growth_mib"] else None
+    )
+    report["streaming_time_ratio"] = (
+        round(streaming["seconds"] / in_memory["seconds"], 3) if in_memory["seconds"] else None
+    )
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    report = run_benchmark(args.rows, args.sheets, seed=args.seed)
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,102 @@
+"""Benchmark env-steps/sec: N scalar ``ExecutionEnv`` loops vs. ``VectorExecutionEnv``.
+
+For each batch size in ``--n-envs`` the script advances ``--steps`` lockstep
+steps with a fixed random slice policy through:
+
+  - ``scalar`` -- N ``ExecutionEnv`` instances stepped one by one in Python
+                  (the pre-vector rollout path, reset on episode end);
+  - ``vector`` -- one ``VectorExecutionEnv(n_envs=N)`` with auto-reset.
+
+Both paths use a fitted Almgren-Chriss slippage model so the per-slice
+``predict_bps`` cost is included.
+
+Usage:
+    python -m scripts.benchmark_rl_vector_env                       # N = 1, 64, 1024
+    python -m scripts.benchmark_rl_vector_env --n-envs 64 --steps 500
+
+Prints a JSON report to stdout. Dev-only; not wired into CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from rl.simulator import EnvConfig, ExecutionEnv, VectorExecutionEnv
+from rl.slippage import AlmgrenChrissCalibrator
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n-envs", type=int, nargs="+", default=[1, 64, 1024], help="batch sizes (default: 1 64 1024)")
+    parser.add_argument("--steps", type=int, default=200, help="lockstep steps per batch size (default: 200)")
+    parser.add_argument("--horizon", type=int, default=20, help="EnvConfig.horizon_steps (default: 20)")
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed (default: 0)")
+    return parser.parse_args(argv)
+
+
+def _calibrator(seed: int) -> AlmgrenChrissCalibrator:
+    rng = np.random.default_rng(seed)
+    X = np.column_stack([rng.uniform(-0.5, 0.5, 500), np.full(500, 30.0**0.5), rng.uniform(0.0, 0.5, 500)])
+    y = X @ np.array([4.0, 0.3, 6.0]) + rng.normal(0.0, 0.5, 500)
+    return AlmgrenChrissCalibrator(prior_precision=0.01).fit(X, y)
+
+
+def _run_scalar(cfg: EnvConfig, slippage: AlmgrenChrissCalibrator, actions: np.ndarray) -> float:
+    envs = [ExecutionEnv(cfg=cfg, slippage=slippage) for _ in range(actions.shape[1])]
+    for row, env in enumerate(envs):
+        env.reset(seed=cfg.seed + row)
+    started = time.perf_counter()
+    for step_actions in actions:
+        for env, action in zip(envs, step_actions, strict=True):
+            _obs, _reward, terminated, truncated, _info = env.step(action)
+            if terminated or truncated:
+                env.reset()
+    return time.perf_counter() - started
+
+
+def _run_vector(cfg: EnvConfig, slippage: AlmgrenChrissCalibrator, actions: np.ndarray) -> float:
+    env = VectorExecutionEnv(cfg=cfg, n_envs=actions.shape[1], slippage=slippage)
+    env.reset(seed=cfg.seed)
+    started = time.perf_counter()
+    for step_actions in actions:
+        env.step(step_actions)
+    return time.perf_counter() - started
+
+
+def run_benchmark(
+    n_envs: list[int], *, steps: int = 200, horizon: int = 20, seed: int = 0
+) -> dict[str, object]:
+    cfg = EnvConfig(horizon_steps=horizon, seed=seed)
+    slippage = _calibrator(seed)
+    rng = np.random.default_rng(seed)
+    rows: list[dict[str, object]] = []
+    for n in n_envs:
+        actions = rng.uniform(0.0, 0.3, size=(steps, n))
+        scalar_s = _run_scalar(cfg, slippage, actions)
+        vector_s = _run_vector(cfg, slippage, actions)
+        env_steps = steps * n
+        rows.append(
+            {
+                "n_envs": n,
+                "env_steps": env_steps,
+                "scalar_steps_per_s": round(env_steps / scalar_s) if scalar_s else None,
+                "vector_steps_per_s": round(env_steps / vector_s) if vector_s else None,
+                "speedup": round(scalar_s / vector_s, 1) if vector_s else None,
+            }
+        )
+    return {"steps": steps, "horizon": horizon, "results": rows}
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    report = run_benchmark(args.n_envs, steps=args.steps, horizon=args.horizon, seed=args.seed)
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
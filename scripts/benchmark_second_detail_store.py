@@ -0,0 +1,157 @@
+"""Benchmark the second-detail partition store on a re-run over a populated window.
+
+Runs the open-window second-detail and close-trade detail collectors over
+``--days`` sessions for ``--symbols`` symbols against a simulated Databento
+``get_range`` (synthetic ``ohlcv-1s`` / ``trades`` rows, ``--latency-ms`` per
+request), and times three passes:
+
+  - ``no_store`` -- the collectors without the store or the file cache
+                    (every session is fetched and recomputed);
+  - ``populate`` -- the first run with ``detail_store_dir`` (computes every
+                    session and writes the closed ones to the store);
+  - ``rerun``    -- the same request again: closed sessions are read from
+                    their partitions, only the latest session is fetched.
+
+and checks the re-run returns the same rows as the first run.
+
+Usage:
+    python -m scripts.benchmark_second_detail_store                         # 1000 symbols x 20 days
+    python -m scripts.benchmark_second_detail_store --symbols 3000 --latency-ms 500
+
+Prints a JSON report to stdout. Dev-only; not wired into CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+import databento_volatility_screener as screener
+
+_COLLECTORS = ("open_window_second_detail", "close_trade_detail")
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--symbols", type=int, default=1_000, help="universe size (default: 1000)")
+    parser.add_argument("--days", type=int, default=20, help="sessions in the window (default: 20)")
+    parser.add_argument("--rows", type=int, default=60, help="rows per symbol-session and collector (default: 60)")
+    parser.add_argument("--latency-ms", type=float, default=250.0, help="simulated latency per request (default: 250)")
+    return parser.parse_args(argv)
+
+
+class _SimulatedDatabento:
+    """Deterministic synthetic ranges plus a fixed per-request latency."""
+
+    def __init__(self, rows: int, latency_seconds: float) -> None:
+        self.rows = rows
+        self.latency_seconds = latency_seconds
+        self.requests = 0
+
+    def get_range(self, client, *, context, dataset, symbols, schema, start, end) -> pd.DataFrame:
+        self.requests += 1
+        time.sleep(self.latency_seconds)
+        start_ts = pd.Timestamp(start)
+        rng = np.random.default_rng(start_ts.value // 10**9)
+        count = len(symbols) * self.rows
+        frame = pd.DataFrame(
+            {
+                "symbol": np.repeat(np.asarray(symbols, dtype=object), self.rows),
+                "ts": start_ts + pd.to_timedelta(np.tile(np.arange(self.rows), len(symbols)), unit="s"),
+            }
+        )
+        price = rng.uniform(5.0, 300.0, count)
+        if schema == "ohlcv-1s":
+            frame["open"] = price
+            frame["high"] = price * 1.001
+            frame["low"] = price * 0.999
+            frame["close"] = price * rng.uniform(0.999, 1.001, count)
+            frame["volume"] = rng.integers(1, 5_000, count).astype(float)
+            frame["count"] = rng.integers(1, 50, count)
+        else:
+            frame["ts_event"] = frame["ts"]
+            frame["publisher_id"] = rng.integers(1, 4, count)
+            frame["side"] = rng.choice(["A", "B", "N"], count)
+            frame["price"] = price
+            frame["size"] = rng.integers(1, 500, count).astype(float)
+            frame["flags"] = 0
+            frame["sequence"] = np.arange(count)
+            frame["ts_in_delta"] = rng.integers(0, 50_000, count)
+        return frame
+
+
+def _collect(trading_days, symbols: set[str], daily_bars: pd.DataFrame, store_dir: Path | None) -> dict[str, pd.DataFrame]:
+    common = {
+        "dataset": "DBEQ.BASIC",
+        "trading_days": trading_days,
+        "universe_symbols": symbols,
+        "display_timezone": "America/New_York",
+        "detail_store_dir": store_dir,
+    }
+    return {
+        "open_window_second_detail": screener.collect_full_universe_open_window_second_detail(
+            "benchmark", daily_bars=daily_bars, **common
+        ),
+        "close_trade_detail": screener.collect_full_universe_close_trade_detail("benchmark", **common),
+    }
+
+
+def run_benchmark(symbols: int, days: int, *, rows: int = 60, latency_ms: float = 250.0) -> dict[str, object]:
+    trading_days = [day.date() for day in pd.bdate_range("2026-02-02", periods=days)]
+    universe = {f"S{i:05d}" for i in range(symbols)}
+    daily_bars = pd.DataFrame(
+        {
+            "trade_date": np.repeat(np.asarray(trading_days, dtype=object), symbols),
+            "symbol": np.tile(sorted(universe), days),
+            "previous_close": 100.0,
+        }
+    )
+    databento = _SimulatedDatabento(rows, latency_ms / 1000.0)
+    available_end = pd.Timestamp(trading_days[-1], tz="UTC") + pd.Timedelta(days=1)
+    report: dict[str, object] = {"symbols": symbols, "days": days, "rows_per_symbol_day": rows, "latency_ms": latency_ms}
+    outputs: dict[str, dict[str, pd.DataFrame]] = {}
+    with ExitStack() as patches, tempfile.TemporaryDirectory(prefix="second_detail_store_bench_") as tmp:
+        for name, value in {
+            "_make_databento_client": lambda key: object(),
+            "_get_schema_available_end": lambda client, dataset, schema: available_end,
+            "_load_databento_publisher_lookup": lambda client: {},
+            "_databento_get_range_with_retry": databento.get_range,
+            "_store_to_frame": lambda store, count, context: store,
+        }.items():
+            patches.enter_context(mock.patch.object(screener, name, value))
+        store_dir = Path(tmp) / "second_detail_store"
+        for mode in ("no_store", "populate", "rerun"):
+            requests_before = databento.requests
+            started = time.perf_counter()
+            outputs[mode] = _collect(trading_days, universe, daily_bars, None if mode == "no_store" else store_dir)
+            report[mode] = {
+                "seconds": round(time.perf_counter() - started, 2),
+                "requests": databento.requests - requests_before,
+                "rows": {kind: len(frame) for kind, frame in outputs[mode].items()},
+            }
+        report["store_mib"] = round(sum(path.stat().st_size for path in store_dir.rglob("*.parquet")) / 2**20, 2)
+        report["store_parts"] = sum(1 for _ in store_dir.rglob("part-*.parquet"))
+    report["identical"] = all(outputs["rerun"][kind].equals(outputs["populate"][kind]) for kind in _COLLECTORS)
+    report["rerun_speedup_vs_no_store"] = (
+        round(report["no_store"]["seconds"] / report["rerun"]["seconds"], 2) if report["rerun"]["seconds"] else None
+    )
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    report = run_benchmark(args.symbols, args.days, rows=args.rows, latency_ms=args.latency_ms)
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,145 @@
+"""Benchmark the shard payload merge: in-memory concat + dedupe vs. streaming k-way merge.
+
+Writes ``--shards`` synthetic shard bundles (a manifest plus a daily
+symbol-feature frame of ``--rows`` symbol/trade_date rows, written in
+session order so every shard has to be sorted into a run, with ``--overlap``
+of the previous shard's rows repeated) and
+merges them once per mode, each in a fresh process so peak RSS is per mode:
+
+  - ``in_memory`` -- the pre-streaming reducer: one Arrow table over all
+                     shards, ``to_pandas`` and ``_dedupe_frame``;
+  - ``streaming`` -- ``merge_shard_payloads`` (sorted runs, k-way merge over
+                     record batches, incremental ``ParquetWriter``).
+
+Reports wall time, peak RSS and its growth over the pre-merge baseline, and
+whether both outputs are identical.
+
+Usage:
+    python -m scripts.benchmark_shard_merge                          # 6 shards x 500k rows
+    python -m scripts.benchmark_shard_merge --shards 12 --rows 1000000
+
+Prints a JSON report to stdout. Dev-only; not wired into CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from scripts.databento_production_merge_shards import (
+    MERGED_BASENAME,
+    _dedupe_frame,
+    _discover_shard_parquets,
+    merge_shard_payloads,
+)
+from scripts.databento_run_shards import _peak_rss_mib
+from scripts.smc_atomic_write import atomic_write_parquet
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--shards", type=int, default=6, help="shard bundles (default: 6)")
+    parser.add_argument("--rows", type=int, default=500_000, help="rows per shard (default: 500000)")
+    parser.add_argument(
+        "--overlap", type=float, default=0.01, help="fraction of keys repeated from the previous shard (default: 0.01)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed (default: 0)")
+    return parser.parse_args(argv)
+
+
+def _write_shards(root: Path, shards: int, rows: int, overlap: float, seed: int) -> list[Path]:
+    rng = np.random.default_rng(seed)
+    manifests = []
+    previous: pd.DataFrame | None = None
+    for shard_id in range(1, shards + 1):
+        days = pd.bdate_range("2026-01-05", periods=5 * shards)[5 * (shard_id - 1) : 5 * shard_id]
+        symbols = np.array([f"SYM{i:05d}" for i in range(rows // len(days))])
+        # One row per symbol-day, in session order (not key order).
+        order = rng.permutation(len(symbols) * len(days))
+        frame = pd.DataFrame(
+            {
+                "trade_date": np.repeat(days.strftime("%Y-%m-%d"), len(symbols))[order],
+                "symbol": np.tile(symbols, len(days))[order],
+                "close": rng.uniform(5.0, 300.0, order.size),
+                "volume": rng.integers(1, 50_000, order.size),
+                "gap_pct": rng.normal(0.0, 3.0, order.size),
+            }
+        ).sort_values("trade_date", kind="mergesort", ignore_index=True)
+        if previous is not None and overlap > 0:
+            frame = pd.concat([frame, previous.sample(frac=overlap, random_state=seed)], ignore_index=True)
+        export_dir = root / f"shard-{shard_id}-of-{shards}" / "export"
+        export_dir.mkdir(parents=True)
+        basename = f"databento_volatility_production_shard{shard_id}"
+        # ATOMIC-WRITE-EXEMPT: dev-only benchmark input inside a TemporaryDirectory.
+        (export_dir / f"{basename}_manifest.json").write_text("{}", encoding="utf-8")
+        frame.to_parquet(export_dir / f"{basename}__daily_features.parquet", index=False)
+        manifests.append(export_dir / f"{basename}_manifest.json")
+        previous = frame
+    return manifests
+
+
+def _run_mode(mode: str, manifests: list[Path], out_dir: Path) -> dict[str, object]:
+    baseline = _peak_rss_mib()
+    started = time.perf_counter()
+    if mode == "streaming":
+        rows = merge_shard_payloads(manifests, out_dir)["daily_features"]
+    else:
+        import pyarrow.dataset as ds
+
+        paths = _discover_shard_parquets(manifests)["daily_features"]
+        merged = _dedupe_frame("daily_features", ds.dataset([str(p) for p in paths]).to_table().to_pandas())
+        atomic_write_parquet(merged, out_dir / f"{MERGED_BASENAME}__daily_features.parquet", index=False)
+        rows = len(merged)
+    elapsed = time.perf_counter() - started
+    peak = _peak_rss_mib()
+    return {
+        "mode": mode,
+        "rows": rows,
+        "seconds": round(elapsed, 2),
+        "peak_rss_mib": peak,
+        "baseline_rss_mib": baseline,
+        "rss_growth_mib": round(peak - baseline, 1) if peak is not None and baseline is not None else None,
+    }
+
+
+def run_benchmark(shards: int, rows: int, *, overlap: float = 0.01, seed: int = 0) -> dict[str, object]:
+    report: dict[str, object] = {"shards": shards, "rows_per_shard": rows, "overlap": overlap}
+    with tempfile.TemporaryDirectory(prefix="shard_merge_bench_") as tmp:
+        manifests = _write_shards(Path(tmp) / "shards", shards, rows, overlap, seed)
+        report["input_mib"] = round(sum(p.stat().st_size for p in Path(tmp).rglob("*.parquet")) / 2**20, 2)
+        outputs = {}
+        for mode in ("in_memory", "streaming"):
+            out_dir = Path(tmp) / mode
+            out_dir.mkdir()
+            # A fresh spawned interpreter per mode keeps ru_maxrss per mode.
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                report[mode] = pool.submit(_run_mode, mode, manifests, out_dir).result()
+            outputs[mode] = pd.read_parquet(out_dir / f"{MERGED_BASENAME}__daily_features.parquet")
+        report["identical"] = outputs["in_memory"].equals(outputs["streaming"])
+    in_memory, streaming = report["in_memory"], report["streaming"]
+    report["streaming_rss_growth_ratio"] = (
+        round(streaming["rss_growth_mib"] / in_memory["rss_growth_mib"], 3) if in_memory["rss_growth_mib"] else None
+    )
+    report["streaming_time_ratio"] = (
+        round(streaming["seconds"] / in_memory["seconds"], 3) if in_memory["seconds"] else None
+    )
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    report = run_benchmark(args.shards, args.rows, overlap=args.overlap, seed=args.seed)
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
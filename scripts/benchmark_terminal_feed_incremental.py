@@ -0,0 +1,167 @@
+"""Benchmark terminal feed merges: full derived-state rebuild vs. incremental engine.
+
+Seeds a ``--rows`` synthetic feed (default 50k rows over ``--tickers``
+tickers), then replays ``--polls`` poll batches of ``--batch-size`` new rows
+through both merge paths, each starting from the same seeded feed:
+
+  - ``full``        -- ``merge_live_feed_rows`` (re-derives every layer from
+                       the whole feed, the pre-engine Streamlit merge path);
+  - ``incremental`` -- ``IncrementalFeedState.apply_rows`` (re-derives only
+                       the tickers a batch touches or whose boundaries pass).
+
+The report includes the mean per-poll latency of each path and whether the
+final states match.
+
+Usage:
+    python -m scripts.benchmark_terminal_feed_incremental                # 50k rows
+    python -m scripts.benchmark_terminal_feed_incremental --rows 10000 --polls 10
+
+Prints a JSON report to stdout. Dev-only; not wired into CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from terminal_feed_state import (
+    DerivedFeedState,
+    IncrementalFeedState,
+    merge_live_feed_rows,
+)
+
+_PROVIDERS = ("benzinga_rest", "fmp_stock_latest", "fmp_press_latest", "tv_news", "newsapi_ai")
+_SENTIMENTS = ("bullish", "bearish", "neutral")
+_MATERIALITY = ("LOW", "MEDIUM", "HIGH")
+
+
+@dataclass(slots=True)
+class _BenchCfg:
+    feed_max_age_s: float = 259200.0
+    live_story_ttl_s: float = 7200.0
+    live_story_cooldown_s: float = 900.0
+    max_items: int = 0
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50_000, help="seeded feed rows (default: 50000)")
+    parser.add_argument("--tickers", type=int, default=2_000, help="distinct tickers (default: 2000)")
+    parser.add_argument("--polls", type=int, default=20, help="poll batches replayed (default: 20)")
+    parser.add_argument("--batch-size", type=int, default=25, help="new rows per poll (default: 25)")
+    parser.add_argument("--seed", type=int, default=7, help="RNG seed (default: 7)")
+    return parser.parse_args(argv)
+
+
+def _synthetic_row(rng: random.Random, serial: int, ticker: str, published_ts: float) -> dict[str, Any]:
+    return {
+        "item_id": f"item-{serial:07d}",
+        "ticker": ticker,
+        "headline": f"{ticker} headline {serial}",
+        "provider": rng.choice(_PROVIDERS),
+        "source": rng.choice(("Benzinga", "Reuters", "PR Newswire")),
+        "source_rank": rng.randint(1, 4),
+        "news_score": round(rng.random(), 3),
+        "materiality": rng.choice(_MATERIALITY),
+        "published_ts": published_ts,
+        "updated_ts": published_ts,
+        "sentiment_label": rng.choice(_SENTIMENTS),
+        "event_label": "news",
+        "is_actionable": rng.random() < 0.2,
+    }
+
+
+def _states_match(left: DerivedFeedState, right: DerivedFeedState) -> bool:
+    return all(
+        getattr(left, name) == getattr(right, name)
+        for name in (
+            "feed",
+            "live_story_state",
+            "ticker_catalyst_state",
+            "ticker_reaction_state",
+            "ticker_resolution_state",
+            "ticker_posture_state",
+            "ticker_attention_state",
+            "legacy_cursor",
+        )
+    )
+
+
+def run_benchmark(
+    n_rows: int, *, n_tickers: int = 2_000, polls: int = 20, batch_size: int = 25, seed: int = 7
+) -> dict[str, object]:
+    rng = random.Random(seed)
+    cfg = _BenchCfg()
+    tickers = [f"T{index:04d}" for index in range(max(1, n_tickers))]
+    now = 1_700_000_000.0
+    seed_rows = [
+        _synthetic_row(rng, serial, rng.choice(tickers), now - rng.uniform(0.0, 172800.0))
+        for serial in range(n_rows)
+    ]
+    seed_rows.sort(key=lambda row: row["published_ts"], reverse=True)
+    batches = []
+    for poll in range(polls):
+        poll_now = now + 30.0 * (poll + 1)
+        batches.append(
+            (
+                poll_now,
+                [
+                    _synthetic_row(rng, n_rows + poll * batch_size + index, rng.choice(tickers), poll_now - 5.0)
+                    for index in range(batch_size)
+                ],
+            )
+        )
+
+    started = time.perf_counter()
+    engine = IncrementalFeedState(cfg)
+    incremental = engine.apply_rows(seed_rows, now=now)
+    incremental = engine.apply_rows([], now=now + 1.0)
+    seed_s = time.perf_counter() - started
+    full = incremental
+
+    timings: dict[str, list[float]] = {"full": [], "incremental": []}
+    for poll_now, batch in batches:
+        started = time.perf_counter()
+        full = merge_live_feed_rows(
+            full.feed,
+            batch,
+            cfg=cfg,
+            previous_reaction_state=full.ticker_reaction_state,
+            previous_resolution_state=full.ticker_resolution_state,
+            now=poll_now,
+        )
+        timings["full"].append(time.perf_counter() - started)
+        started = time.perf_counter()
+        incremental = engine.apply_rows(batch, current_feed=incremental.feed, now=poll_now)
+        timings["incremental"].append(time.perf_counter() - started)
+
+    mean = {mode: sum(values) / len(values) if values else 0.0 for mode, values in timings.items()}
+    return {
+        "rows": n_rows,
+        "tickers": n_tickers,
+        "polls": polls,
+        "batch_size": batch_size,
+        "feed_rows_final": len(incremental.feed),
+        "seed_and_settle_s": round(seed_s, 3),
+        "full_rebuilds": engine.full_rebuilds,
+        "states_match": _states_match(incremental, full),
+        "mean_poll_s": {mode: round(seconds, 4) for mode, seconds in mean.items()},
+        "speedup": round(mean["full"] / mean["incremental"], 1) if mean["incremental"] else None,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    report = run_benchmark(
+        args.rows, n_tickers=args.tickers, polls=args.polls, batch_size=args.batch_size, seed=args.seed
+    )
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
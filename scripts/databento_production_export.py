@@ -118,6 +118,7 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from databento_content_cache import ContentAddressedCache
 from databento_volatility_screener import (
     DEFAULT_CLOSE_IMBALANCE_AFTERHOURS_END_ET,
     DEFAULT_CLOSE_IMBALANCE_AUCTION_TIME_ET,
@@ -125,6 +126,7 @@ from databento_volatility_screener import (
     DEFAULT_CLOSE_IMBALANCE_NEXT_DAY_OUTCOME_TIME_ET,
     DEFAULT_CLOSE_IMBALANCE_WINDOW_END_ET,
     DEFAULT_CLOSE_IMBALANCE_WINDOW_START_ET,
+    INTRADAY_STREAM_DECODE_MAX_MIB,
     US_EASTERN_TZ,
     _read_cached_frame,
     _write_cached_frame,
@@ -132,6 +134,7 @@ from databento_volatility_screener import (
     _write_parquet_atomic,
     build_cache_path,
     build_daily_features_full_universe,
+    build_daily_features_incremental,
     build_export_basename,
     build_run_manifest_frame,
     build_summary_table,
@@ -163,6 +166,8 @@ from scripts.bullish_quality_config import (
     build_default_bullish_quality_config,
 )
 from scripts.databento_production_workbook import (
+    WORKBOOK_XLSX_MODES,
+    canonical_production_sheet_dataset_path,
     canonical_production_workbook_path,
     write_databento_production_workbook_from_frames,
 )
@@ -376,6 +381,19 @@ DEFAULT_SLIM_CANONICAL_WORKBOOK_SHEET_NAMES = (
 CANONICAL_WORKBOOK_SHEETS_ENV_VAR = "CANONICAL_WORKBOOK_SHEETS"
 CANONICAL_WORKBOOK_SHEETS_ALL_TOKEN = "all"
 
+# Step 10/10c always writes the canonical workbook's sheets as a Parquet
+# sheet dataset (`databento_volatility_production_workbook_sheets/`, one file
+# per sheet + `sheets.json`); that dataset is what loaders should read. This
+# env var only selects how the xlsx itself is rendered:
+#   streaming  (default) write-only openpyxl over the sheet dataset, decoded
+#              in bounded chunks, so peak RSS no longer scales with the
+#              workbook (the `__exit__` spike behind the Q5a/Q5b OOMs);
+#   in_memory  the historic pandas/openpyxl writer;
+#   off        no xlsx; render on demand with
+#              `python -m scripts.databento_production_workbook`.
+PRODUCTION_WORKBOOK_XLSX_ENV_VAR = "DATABENTO_PRODUCTION_WORKBOOK_XLSX"
+DEFAULT_PRODUCTION_WORKBOOK_XLSX_MODE = "streaming"
+
 
 def _resolve_canonical_workbook_sheet_whitelist() -> frozenset[str] | None:
     """Resolve the active canonical-workbook sheet whitelist.
@@ -403,6 +421,23 @@ def _resolve_canonical_workbook_sheet_whitelist() -> frozenset[str] | None:
         return frozenset(DEFAULT_SLIM_CANONICAL_WORKBOOK_SHEET_NAMES)
     return frozenset(names)
 
+
+def _resolve_production_workbook_xlsx_mode() -> str:
+    """Resolve the Step 10/10c xlsx mode; unknown values fall back to the default."""
+    raw = os.environ.get(PRODUCTION_WORKBOOK_XLSX_ENV_VAR, "").strip().lower().replace("-", "_")
+    if not raw:
+        return DEFAULT_PRODUCTION_WORKBOOK_XLSX_MODE
+    if raw not in WORKBOOK_XLSX_MODES:
+        logger.warning(
+            "%s=%r not in %s; using %r",
+            PRODUCTION_WORKBOOK_XLSX_ENV_VAR,
+            raw,
+            WORKBOOK_XLSX_MODES,
+            DEFAULT_PRODUCTION_WORKBOOK_XLSX_MODE,
+        )
+        return DEFAULT_PRODUCTION_WORKBOOK_XLSX_MODE
+    return raw
+
 SECOND_DETAIL_EXPORT_COLUMNS = [
     "trade_date",
     "symbol",
@@ -2174,20 +2209,26 @@ def _build_daily_symbol_features_full_universe_export(
     ranking_metric: str,
     top_fraction: float,
     smc_base_only: bool = False,
+    feature_state_path: Path | None = None,
+    force_rebuild: bool = False,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
-    features, coverage = build_daily_features_full_universe(
-        trading_days=trading_days,
-        universe=raw_universe,
-        daily_bars=daily_bars,
-        intraday=intraday,
-        second_detail_all=second_detail_all,
-        close_detail_all=close_detail_all,
-        close_trade_detail_all=close_trade_detail_all,
-        close_outcome_minute_detail_all=close_outcome_minute_detail_all,
-        display_timezone=display_timezone,
-        premarket_anchor_et=premarket_anchor_et,
-        smc_base_only=smc_base_only,
-    )
+    build_kwargs = {
+        "trading_days": trading_days,
+        "universe": raw_universe,
+        "daily_bars": daily_bars,
+        "intraday": intraday,
+        "second_detail_all": second_detail_all,
+        "close_detail_all": close_detail_all,
+        "close_trade_detail_all": close_trade_detail_all,
+        "close_outcome_minute_detail_all": close_outcome_minute_detail_all,
+        "display_timezone": display_timezone,
+        "premarket_anchor_et": premarket_anchor_et,
+        "smc_base_only": smc_base_only,
+    }
+    if feature_state_path is None:
+        features, coverage = build_daily_features_full_universe(**build_kwargs)
+    else:
+        features, coverage = build_daily_features_incremental(feature_state_path, force_rebuild=force_rebuild, **build_kwargs)
     if features.empty:
         return pd.DataFrame(columns=DAILY_SYMBOL_FEATURE_COLUMNS), pd.DataFrame(columns=SYMBOL_DAY_DIAGNOSTIC_COLUMNS)
 
@@ -3301,7 +3342,13 @@ def _write_canonical_production_workbook(
     output_summary: dict[str, Any],
     smc_base_only: bool = False,
     progress_callback: Callable[[str], None] | None = None,
-) -> Path:
+) -> Path | None:
+    """Write the canonical workbook's sheet dataset and, unless disabled, its xlsx.
+
+    Returns the xlsx path, or None when ``DATABENTO_PRODUCTION_WORKBOOK_XLSX=off``
+    (the sheet dataset at ``canonical_production_sheet_dataset_path`` is
+    written either way).
+    """
     canonical_workbook = canonical_production_workbook_path(export_dir=export_dir)
     additional_sheets = {
         "manifest": build_run_manifest_frame(manifest),
@@ -3411,6 +3458,9 @@ def _write_canonical_production_workbook(
                     f"dropped={dropped} "
                     "(parquet retained via Step 10/10b)"
                 )
+    xlsx_mode = _resolve_production_workbook_xlsx_mode()
+    if progress_callback is not None:
+        progress_callback(f"workbook: xlsx_mode={xlsx_mode} (via {PRODUCTION_WORKBOOK_XLSX_ENV_VAR})")
     workbook_result = write_databento_production_workbook_from_frames(
         summary=summary,
         output_path=canonical_workbook,
@@ -3418,7 +3468,11 @@ def _write_canonical_production_workbook(
         second_detail=workbook_second_detail,
         additional_sheets=additional_sheets,
         progress_callback=progress_callback,
+        sheet_dataset_dir=canonical_production_sheet_dataset_path(export_dir=export_dir),
+        xlsx_mode=xlsx_mode,
     )
+    if xlsx_mode == "off":
+        return None
     return workbook_result.output_path
 
 
@@ -3721,6 +3775,13 @@ def run_production_export_pipeline(
         cost_estimate = pd.DataFrame(columns=["scope", "cost_usd", "billable_size_bytes"])
     else:
         _progress(f"Step 2/10: Estimating costs ({len(trading_days)} trading days)...")
+        cost_stats_path: Path | None = None
+        cost_stats_refresh = os.environ.get("DATABENTO_COST_STATS_REFRESH", "").strip().lower() or "missing"
+        if use_file_cache and _env_flag("DATABENTO_COST_STATS"):
+            if cost_stats_refresh not in {"never", "missing", "always"}:
+                _progress(f"Step 2/10: WARN ignoring DATABENTO_COST_STATS_REFRESH={cost_stats_refresh!r}")
+                cost_stats_refresh = "missing"
+            cost_stats_path = Path(resolved_cache_dir) / "cost_stats.sqlite3"
         cost_estimate = estimate_databento_costs(
             databento_api_key,
             dataset=dataset,
@@ -3729,6 +3790,8 @@ def run_production_export_pipeline(
             window_start=window_start,
             window_end=window_end,
             premarket_anchor_et=premarket_anchor_et,
+            cost_stats_path=cost_stats_path,
+            refresh_cost_stats=cost_stats_refresh,
         )
 
     _progress("Step 3/10: Fetching equity universe...")
@@ -3768,6 +3831,20 @@ def run_production_export_pipeline(
             f"Step 5/10: WARN ignoring DATABENTO_DAILY_MAX_WORKERS={_daily_workers_raw!r} (not an int); defaulting to 1"
         )
         _daily_max_workers = 1
+    _content_cache_raw = os.environ.get("DATABENTO_CONTENT_CACHE_MAX_BYTES", "").strip()
+    daily_content_cache: ContentAddressedCache | None = None
+    if _content_cache_raw and use_file_cache:
+        try:
+            _content_cache_max_bytes = int(_content_cache_raw)
+        except ValueError:
+            _progress(
+                f"Step 5/10: WARN ignoring DATABENTO_CONTENT_CACHE_MAX_BYTES={_content_cache_raw!r} (not an int)"
+            )
+        else:
+            if _content_cache_max_bytes > 0:
+                daily_content_cache = ContentAddressedCache(
+                    Path(resolved_cache_dir) / "content", max_bytes=_content_cache_max_bytes
+                )
     daily_bars = load_daily_bars(
         databento_api_key,
         dataset=dataset,
@@ -3778,7 +3855,11 @@ def run_production_export_pipeline(
         force_refresh=force_refresh,
         progress_callback=_progress,
         max_workers=_daily_max_workers,
+        content_cache=daily_content_cache,
     )
+    if daily_content_cache is not None:
+        _progress(f"Step 5/10: content cache {daily_content_cache.stats.as_dict()}")
+        daily_content_cache.close()
     daily_bars_fetched_at = datetime.now(UTC).isoformat(timespec="seconds")
 
     if smc_base_only:
@@ -3786,6 +3867,19 @@ def run_production_export_pipeline(
     else:
         _progress(f"Step 6/10: Running intraday screens ({len(trading_days)} days, including fixed 10:00 ET outcome snapshot)...")
     intraday_started_at = time_module.perf_counter()
+    _decode_max_mib_raw = os.environ.get("DATABENTO_INTRADAY_DECODE_MAX_MIB", "").strip()
+    _intraday_decode_max_mib = INTRADAY_STREAM_DECODE_MAX_MIB
+    if _decode_max_mib_raw:
+        try:
+            _intraday_decode_max_mib = float(_decode_max_mib_raw)
+            if not _intraday_decode_max_mib > 0:
+                raise ValueError(_decode_max_mib_raw)
+        except ValueError:
+            _progress(
+                f"Step 6/10: WARN ignoring DATABENTO_INTRADAY_DECODE_MAX_MIB={_decode_max_mib_raw!r} "
+                f"(not a positive number); defaulting to {INTRADAY_STREAM_DECODE_MAX_MIB}"
+            )
+            _intraday_decode_max_mib = INTRADAY_STREAM_DECODE_MAX_MIB
     intraday = run_intraday_screen(
         databento_api_key,
         dataset=dataset,
@@ -3800,6 +3894,7 @@ def run_production_export_pipeline(
         use_file_cache=use_file_cache,
         force_refresh=force_refresh,
         progress_callback=_progress,
+        decode_max_mib=_intraday_decode_max_mib,
     )
     _progress(
         f"Step 6/10 complete: Intraday screens finished in {time_module.perf_counter() - intraday_started_at:.1f}s "
@@ -3825,6 +3920,7 @@ def run_production_export_pipeline(
             use_file_cache=use_file_cache,
             force_refresh=force_refresh,
             progress_callback=_progress,
+            decode_max_mib=_intraday_decode_max_mib,
         )
         _progress(
             f"Step 6b/10 complete: Close-imbalance outcome anchor screen finished in "
@@ -3928,6 +4024,10 @@ def run_production_export_pipeline(
         # Step 8/10e (quality-window source frames) remains sequential after the layer
         # because no wallclock baseline exists yet and it depends on raw_universe extras.
         step8_progress_lock = threading.Lock()
+        detail_store_dir: Path | None = None
+        if use_file_cache and _env_flag("DATABENTO_SECOND_DETAIL_STORE"):
+            detail_store_dir = Path(resolved_cache_dir) / "second_detail_store"
+            _progress(f"Step 8/10: closed sessions served from the second-detail store ({detail_store_dir})")
 
         def _run_open_window_substep() -> tuple[str, pd.DataFrame, str]:
             started = time_module.perf_counter()
@@ -3945,6 +4045,7 @@ def run_production_export_pipeline(
                 cache_dir=resolved_cache_dir,
                 use_file_cache=use_file_cache,
                 force_refresh=force_refresh,
+                detail_store_dir=detail_store_dir,
             )
             elapsed = time_module.perf_counter() - started
             return (
@@ -3969,6 +4070,7 @@ def run_production_export_pipeline(
                 cache_dir=resolved_cache_dir,
                 use_file_cache=use_file_cache,
                 force_refresh=force_refresh,
+                detail_store_dir=detail_store_dir,
             )
             elapsed = time_module.perf_counter() - started
             return (
@@ -3992,6 +4094,7 @@ def run_production_export_pipeline(
                 cache_dir=resolved_cache_dir,
                 use_file_cache=use_file_cache,
                 force_refresh=force_refresh,
+                detail_store_dir=detail_store_dir,
             )
             elapsed = time_module.perf_counter() - started
             return (
@@ -4109,6 +4212,10 @@ def run_production_export_pipeline(
             )
     _progress(f"Step 9/10: Building features and exports... rss_before={_fmt_rss_pair()}")
     feature_build_started_at = time_module.perf_counter()
+    feature_state_path: Path | None = None
+    if use_file_cache and _env_flag("DATABENTO_INCREMENTAL_FEATURES"):
+        feature_state_path = build_cache_path(resolved_cache_dir, "daily_feature_state", dataset=dataset, parts=["full_universe"])
+        _progress(f"Step 9/10: incremental daily features (state={feature_state_path.name})")
     daily_symbol_features_full_universe, symbol_day_diagnostics = _build_daily_symbol_features_full_universe_export(
         trading_days=trading_days,
         raw_universe=raw_universe,
@@ -4124,6 +4231,8 @@ def run_production_export_pipeline(
         ranking_metric=ranking_metric,
         top_fraction=top_fraction,
         smc_base_only=smc_base_only,
+        feature_state_path=feature_state_path,
+        force_rebuild=force_refresh,
     )
     _progress(
         f"Step 9/10a complete: Daily symbol features built in {time_module.perf_counter() - feature_build_started_at:.1f}s "
@@ -4576,7 +4685,7 @@ def run_production_export_pipeline(
 
     _progress("Step 10/10c: Writing canonical production workbook...")
     canonical_workbook_started_at = time_module.perf_counter()
-    paths["canonical_production_workbook"] = _write_canonical_production_workbook(
+    canonical_workbook_path = _write_canonical_production_workbook(
         export_dir=resolved_export_dir,
         summary=summary,
         minute_detail=minute_detail,
@@ -4612,6 +4721,9 @@ def run_production_export_pipeline(
         smc_base_only=smc_base_only,
         progress_callback=_progress,
     )
+    paths["canonical_production_sheet_dataset"] = canonical_production_sheet_dataset_path(export_dir=resolved_export_dir)
+    if canonical_workbook_path is not None:
+        paths["canonical_production_workbook"] = canonical_workbook_path
     _progress(
         f"Step 10/10c complete: Canonical production workbook written in {time_module.perf_counter() - canonical_workbook_started_at:.1f}s"
     )
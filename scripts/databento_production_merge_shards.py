@@ -75,6 +75,12 @@ _DEDUPE_KEY_CANDIDATES: tuple[tuple[str, ...], ...] = (
     ("date",),
 )
 
+# Rows per record batch pulled from each sorted shard run by the k-way
+# payload merge (``merge_shard_payloads``). Peak merge memory is about
+# ``shards × MERGE_BATCH_ROWS`` rows plus the largest shard that has to be
+# sorted before it can join the merge.
+MERGE_BATCH_ROWS = 65_536
+
 # ---------------------------------------------------------------------------
 # Override table — single source of truth for classification deviations
 # from the auto-classifier.
@@ -425,7 +431,7 @@ def _parse_shard_id_from_dir(name: str) -> int | None:
 
 
 # ---------------------------------------------------------------------------
-# Payload merge (frame-level parquet concat across shards)
+# Payload merge (frame-level streaming k-way merge across shards)
 # ---------------------------------------------------------------------------
 
 def _discover_shard_parquets(
@@ -451,7 +457,8 @@ def _discover_shard_parquets(
 def _dedupe_frame(frame_name: str, df):  # type: ignore[no-untyped-def]
     """Drop_duplicates on the first matching key candidate; return df.
 
-    Falls back to no dedupe (with a stdout note) when no candidate matches
+    In-memory reference for the streaming payload merge: the merged
+    parquet equals ``_dedupe_frame`` over the shard concat. Falls back to no dedupe (with a stdout note) when no candidate matches
     the frame's columns.
     """
     cols = set(df.columns)
@@ -474,38 +481,284 @@ def _dedupe_frame(frame_name: str, df):  # type: ignore[no-untyped-def]
     return df.reset_index(drop=True)
 
 
+def _merge_key(schema) -> tuple[str, ...]:  # type: ignore[no-untyped-def]
+    """First :data:`_DEDUPE_KEY_CANDIDATES` entry fully present in ``schema``."""
+    names = set(schema.names)
+    for key in _DEDUPE_KEY_CANDIDATES:
+        if key and all(col in names for col in key):
+            return key
+    return ()
+
+
+def _payload_schema(paths: Sequence[Path]):  # type: ignore[no-untyped-def]
+    """Union of the shard schemas, minus any pandas index columns.
+
+    Shards written from different date slices can disagree on a column's
+    type (an all-null column is ``null`` in one shard and ``double`` in the
+    next) or on the column set; ``promote_options="permissive"`` widens to
+    the common type. The pandas metadata of the first shard is kept (so
+    dtypes round-trip through ``pd.read_parquet``) with its index entries
+    dropped — the merged frame, like the old ``reset_index`` output, has a
+    plain RangeIndex.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.unify_schemas([pq.read_schema(p) for p in paths], promote_options="permissive")
+    schema = pa.schema([f for f in schema if not f.name.startswith("__index_level_")], metadata=schema.metadata)
+    metadata = dict(schema.metadata or {})
+    if b"pandas" in metadata:
+        pandas_meta = json.loads(metadata[b"pandas"])
+        pandas_meta["index_columns"] = []
+        pandas_meta["columns"] = [
+            col
+            for col in pandas_meta.get("columns", [])
+            if not str(col.get("field_name", "")).startswith("__index_level_")
+        ]
+        metadata[b"pandas"] = json.dumps(pandas_meta).encode("utf-8")
+    return schema.with_metadata(metadata)
+
+
+def _conform(data, schema):  # type: ignore[no-untyped-def]
+    """Cast a batch/table to ``schema``, null-filling columns it lacks."""
+    import pyarrow as pa
+
+    table = data if isinstance(data, pa.Table) else pa.Table.from_batches([data])
+    columns = [
+        table.column(field.name).combine_chunks().cast(field.type)
+        if field.name in table.column_names
+        else pa.nulls(table.num_rows, field.type)
+        for field in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _sort_order(table, key: Sequence[str]):  # type: ignore[no-untyped-def]
+    """Stable ascending sort indices on ``key``, nulls last (as ``sort_values``)."""
+    import pyarrow.compute as pc
+
+    return pc.sort_indices(
+        table.select(list(key)),
+        sort_keys=[(col, "ascending") for col in key],
+        null_placement="at_end",
+    )
+
+
+def _group_starts(keys):  # type: ignore[no-untyped-def]
+    """Boolean mask marking the first row of each run of equal keys.
+
+    ``keys`` must already be sorted. Two nulls compare equal, matching
+    ``drop_duplicates``.
+    """
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    n = keys.num_rows
+    starts = np.ones(n, dtype=bool)
+    if n < 2:
+        return starts
+    differs = np.zeros(n - 1, dtype=bool)
+    for name in keys.column_names:
+        column = keys.column(name).combine_chunks()
+        if pa.types.is_null(column.type):
+            continue
+        prev, cur = column.slice(0, n - 1), column.slice(1)
+        not_equal = pc.fill_null(pc.not_equal(prev, cur), True)
+        both_null = pc.and_(pc.is_null(prev), pc.is_null(cur))
+        differs |= pc.and_not(not_equal, both_null).to_numpy(zero_copy_only=False)
+    starts[1:] = differs
+    return starts
+
+
+def _sorted_run(path: Path, key: Sequence[str], schema, spill_path: Path) -> Path:  # type: ignore[no-untyped-def]
+    """Return a file holding ``path``'s rows sorted on ``key``.
+
+    Producer payloads are usually already in key order, which is checked on
+    the key columns alone; only an out-of-order shard is loaded whole (one
+    shard at a time, never the union), sorted and spilled.
+    """
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    present = [col for col in key if col in pq.read_schema(path).names]
+    keys = pq.read_table(path, columns=present)
+    if not present or keys.num_rows < 2:
+        return path
+    order = _sort_order(keys, present)
+    del keys
+    if np.array_equal(order.to_numpy(), np.arange(len(order))):
+        return path
+    # Scratch run, read back once batch by batch: Arrow IPC, no encoding.
+    with pa.ipc.new_file(str(spill_path), schema) as sink:
+        sink.write_table(_conform(pq.read_table(path), schema).take(order), max_chunksize=MERGE_BATCH_ROWS)
+    return spill_path
+
+
+def _run_batches(run: Path):  # type: ignore[no-untyped-def]
+    """Record batches of a sorted run: a spilled IPC file or a shard parquet."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if run.suffix == ".arrow":
+        reader = pa.ipc.open_file(pa.memory_map(str(run)))
+        for index in range(reader.num_record_batches):
+            yield reader.get_batch(index)
+    else:
+        yield from pq.ParquetFile(run).iter_batches(batch_size=MERGE_BATCH_ROWS)
+
+
+def _write_k_way_merge(runs: Sequence[Path], key: Sequence[str], schema, writer) -> int:  # type: ignore[no-untyped-def]
+    """Merge key-sorted ``runs`` into ``writer``, keeping the last row per key.
+
+    Each run contributes :data:`MERGE_BATCH_ROWS`-row record batches to a
+    buffer. Every round sorts the buffered key columns (stable, so equal
+    keys stay in shard-then-row order, i.e. concat order) and emits each key
+    group that no run can still extend: a group is complete once it sorts
+    before the group of every unexhausted run's last buffered row. The kept
+    row of a group is its last one — ``drop_duplicates(keep="last")`` over
+    the shard concat. Only emitted rows are gathered; what a run has not
+    emitted yet is a suffix of its buffer and stays as a zero-copy slice.
+    Runs are refilled below half a batch; when nothing is safe, the runs
+    holding the watermark pull their next batch.
+    """
+    import numpy as np
+    import pyarrow as pa
+
+    iterators = [_run_batches(run) for run in runs]
+    buffers: list[Any] = [None] * len(runs)
+    live = [True] * len(runs)
+
+    def _pull(index: int) -> None:
+        for batch in iterators[index]:
+            if batch.num_rows:
+                table = _conform(batch, schema)
+                buffers[index] = table if buffers[index] is None else pa.concat_tables([buffers[index], table])
+                return
+        live[index] = False
+
+    written = 0
+    while True:
+        for index in range(len(runs)):
+            # Keep every live run at least half a batch deep: a run whose
+            # buffer runs dry holds the watermark down to its last few keys.
+            while live[index] and (buffers[index] is None or buffers[index].num_rows < MERGE_BATCH_ROWS // 2):
+                _pull(index)
+        active = [index for index in range(len(runs)) if buffers[index] is not None]
+        if not active:
+            return written
+        buffered = pa.concat_tables([buffers[index] for index in active])
+        order = _sort_order(buffered, key).to_numpy()
+        run_ids = np.repeat(np.asarray(active), [buffers[index].num_rows for index in active])[order]
+        starts = _group_starts(buffered.select(list(key)).take(order))
+        start_positions = np.flatnonzero(starts)
+        safe, blocking = len(order), []
+        for index in active:
+            if not live[index]:
+                continue
+            last = np.flatnonzero(run_ids == index)[-1]
+            bound = int(start_positions[np.searchsorted(start_positions, last, side="right") - 1])
+            if bound < safe:
+                safe, blocking = bound, [index]
+            elif bound == safe:
+                blocking.append(index)
+        if safe == 0:
+            for index in blocking:
+                _pull(index)
+            continue
+        keep_last = np.append(starts[1:safe], True)
+        emitted = buffered.take(order[:safe][keep_last])
+        writer.write_table(emitted)
+        written += emitted.num_rows
+        emitted_per_run = np.bincount(run_ids[:safe], minlength=len(runs))
+        for index in active:
+            rest = buffers[index].slice(int(emitted_per_run[index]))
+            buffers[index] = rest if rest.num_rows else None
+
+
+def _merge_frame(frame: str, paths: Sequence[Path], out_path: Path) -> int:
+    """Stream one frame's shard parquets into ``out_path``; return rows written.
+
+    With a dedupe key (see :func:`_dedupe_frame` for the semantics this
+    reproduces) the shards are k-way merged as sorted runs; without one the
+    record batches are appended in shard order. The output is written to a
+    sibling temp file and ``os.replace``-d into place.
+    """
+    import os
+    import tempfile
+
+    import pyarrow.parquet as pq
+
+    schema = _payload_schema(paths)
+    key = _merge_key(schema)
+    input_rows = sum(pq.ParquetFile(p).metadata.num_rows for p in paths)
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    try:
+        with (
+            tempfile.TemporaryDirectory(prefix=".merge_runs_", dir=out_path.parent) as spill,
+            pq.ParquetWriter(tmp_path, schema) as writer,
+        ):
+            if key:
+                runs = [
+                    _sorted_run(path, key, schema, Path(spill) / f"run_{index:04d}.arrow")
+                    for index, path in enumerate(paths)
+                ]
+                written = _write_k_way_merge(runs, key, schema, writer)
+            else:
+                written = 0
+                for path in paths:
+                    for batch in pq.ParquetFile(path).iter_batches(batch_size=MERGE_BATCH_ROWS):
+                        writer.write_table(_conform(batch, schema))
+                        written += batch.num_rows
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    if not key:
+        print(
+            f"{_LOG_PREFIX}{frame}: no dedupe key matched columns "
+            f"{sorted(schema.names)[:8]}…; keeping all rows (planner contract: shards "
+            f"are calendar-day-disjoint, so cross-shard duplicates are unexpected)"
+        )
+    elif input_rows != written:
+        print(f"{_LOG_PREFIX}{frame}: dropped {input_rows - written} duplicate row(s) on key={list(key)}")
+    return written
+
+
 def merge_shard_payloads(
     manifest_paths: Sequence[Path],
     output_dir: Path,
     *,
     merged_basename: str = MERGED_BASENAME,
 ) -> dict[str, int]:
-    """Concat per-shard frame parquets into a canonical merged bundle.
+    """Merge per-shard frame parquets into a canonical merged bundle.
 
-    For each frame found across the supplied shards, loads every sibling
-    parquet, concatenates them, dedupes by the first matching key in
-    :data:`_DEDUPE_KEY_CANDIDATES`, and writes the result to
-    ``{output_dir}/{merged_basename}__{frame}.parquet``.
+    For each frame found across the supplied shards, merges every sibling
+    parquet, dedupes by the first matching key in
+    :data:`_DEDUPE_KEY_CANDIDATES` (keeping the last shard's row, sorted
+    by the key — exactly :func:`_dedupe_frame` over the shard concat), and
+    writes the result to ``{output_dir}/{merged_basename}__{frame}.parquet``.
 
     Returns ``{frame: row_count}`` so the caller can log a summary. Frames
     that exist in some shards but not others are still merged (best-effort:
     union of what's available); the missing shards simply contribute zero
     rows.
 
-    Memory profile (WF-026 OOM fix, 2026-06-24)
-    --------------------------------------------
-    Old implementation loaded every shard file into a separate pandas
-    DataFrame (``[pd.read_parquet(p) for p in paths]``) and then called
-    ``pd.concat()``, holding N DataFrames + the concatenated copy + the
-    deduped copy simultaneously — peak ≈ 3× total frame size.  On the
-    standard 7 GB GitHub runner with 6 shards this triggered OOM /
-    swap-thrash on 2026-06-22 (swap_used peaked at 5 750 MB / 9 215 MB).
-
-    New implementation uses ``pyarrow.dataset`` to read all shard files
-    in a single streaming pass into one Arrow table (column-oriented,
-    more compact than N pandas DataFrames).  The Arrow table is released
-    before ``_dedupe_frame`` allocates its sorted copy, giving a peak of
-    ≈ 2× total frame size.
+    Memory profile
+    --------------
+    The original implementation concatenated N pandas DataFrames (peak ≈ 3×
+    total frame size; OOM on the 7 GB runner with 6 shards, 2026-06-22).
+    The WF-026 fix (2026-06-24) read all shards into one Arrow table first
+    (peak ≈ 2× total frame size) — still linear in the merged bundle.
+
+    Frames are now streamed: every shard is a key-sorted run (already
+    sorted payloads are used in place; an unsorted one is sorted alone and
+    spilled next to the output), and :func:`_write_k_way_merge` merges the
+    runs through :data:`MERGE_BATCH_ROWS`-row record batches into an
+    incremental ``ParquetWriter``. Peak is roughly one shard (when a run
+    has to be sorted) plus ``shards × MERGE_BATCH_ROWS`` buffered rows,
+    independent of the shard count × window length.
 
     Heavy deps (``pyarrow``, parquet engine) are imported lazily so the
     manifest-only merge path stays import-cheap.
@@ -522,41 +775,10 @@ def merge_shard_payloads(
         )
         return {}
 
-    # Lazy imports — keep CLI startup cheap when operating in manifest-only
-    # mode.  pyarrow is a transitive dep via pandas' parquet engine so it
-    # is always available without an extra install step.
-    import pyarrow.dataset as _pa_ds
-
-    from scripts.smc_atomic_write import atomic_write_parquet
-
     summary: dict[str, int] = {}
     for frame, paths in by_frame.items():
-        # ------------------------------------------------------------------
-        # STREAMING READ — WF-026 OOM fix (2026-06-24)
-        # ------------------------------------------------------------------
-        # Previous: [pd.read_parquet(p) for p in paths] + pd.concat(...)
-        #   Peak ≈ 3× total frame size: N DataFrames simultaneously in RAM,
-        #   then the concatenated copy, then the deduped/sorted copy.
-        #   On a 7 GB runner with 6 shards → swap_used > 5 GB → OOM.
-        #
-        # New: pyarrow.dataset reads all shard files in one streaming pass
-        #   into a single Arrow table (column-oriented, ~2× more compact
-        #   than equivalent pandas DataFrames).  Explicit del before
-        #   _dedupe_frame frees the buffer before pandas allocates the
-        #   sorted copy.
-        #   Peak ≈ 2× total frame size (Arrow table → pandas → deduped).
-        # ------------------------------------------------------------------
-        _dataset = _pa_ds.dataset([str(p) for p in paths], format="parquet")
-        _arrow_table = _dataset.to_table()
-        concat_df = _arrow_table.to_pandas()
-        del _arrow_table  # release Arrow buffer before sort/dedup allocates
-        deduped = _dedupe_frame(frame, concat_df)
-        del concat_df  # release pre-dedup copy
         out_path = output_dir / f"{merged_basename}__{frame}.parquet"
-        atomic_write_parquet(deduped, out_path, index=False)
-        row_count = len(deduped)
-        del deduped  # release before next frame iteration
-
+        row_count = _merge_frame(frame, paths, out_path)
         summary[frame] = row_count
         print(
             f"{_LOG_PREFIX}{frame}: merged {len(paths)} shard(s) → "
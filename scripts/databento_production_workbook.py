@@ -2,7 +2,12 @@
 
 Canonical upstream artifact policy:
 - Canonical artifact: Databento production export bundle (manifest + parquet frames).
-- Derived artifact: production workbook (.xlsx) generated from canonical frames.
+- Sheet dataset: one Parquet file per workbook sheet plus a ``sheets.json``
+  index, written next to the workbook. Loaders read sheets from here
+  (:func:`read_production_workbook_sheet`) instead of parsing the xlsx.
+- Derived artifact: production workbook (.xlsx) generated from canonical frames,
+  either in memory (``create_excel_workbook_bytes``) or streamed from the sheet
+  dataset in constant memory (:func:`write_streaming_workbook`).
 
 This module centralizes workbook generation so daily/base production paths and UI paths
 use the same producer logic.
@@ -10,7 +15,10 @@ use the same producer logic.
 
 from __future__ import annotations
 
+import argparse
 import logging
+import os
+import shutil
 import sys
 import zipfile
 from collections.abc import Callable
@@ -22,6 +30,8 @@ from time import perf_counter
 from typing import Any
 
 import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.formatting.rule import ColorScaleRule
 from openpyxl.styles import Alignment, Font, PatternFill
 from openpyxl.utils import get_column_letter
@@ -35,11 +45,31 @@ except ImportError:  # pragma: no cover - graceful fallback if psutil absent
     _PSUTIL_AVAILABLE = False
 
 from scripts.load_databento_export_bundle import load_export_bundle
+from smc_core.cached_workbook_reader import (
+    SHEET_DATASET_FORMAT_VERSION,
+    SHEET_DATASET_INDEX_NAME,
+    SHEET_DATASET_SUFFIX,
+    read_sheet_dataset_index,
+)
 
 DEFAULT_PRODUCTION_EXPORT_DIR = Path("artifacts") / "smc_microstructure_exports"
 CANONICAL_PRODUCTION_WORKBOOK_NAME = "databento_volatility_production_workbook.xlsx"
 LEGACY_WORKBOOK_GLOB = "databento_volatility_production_*.xlsx"
 EXCEL_MAX_ROWS_PER_SHEET = 1_048_576
+# ``smc_core.cached_workbook_reader.sheet_dataset_for`` finds it by this name.
+CANONICAL_PRODUCTION_SHEET_DATASET_NAME = Path(CANONICAL_PRODUCTION_WORKBOOK_NAME).stem + SHEET_DATASET_SUFFIX
+# Rows decoded from Parquet per streaming-write step; bounds peak memory of
+# the write-only path independently of the sheet size.
+STREAMING_WORKBOOK_CHUNK_ROWS = 50_000
+WORKBOOK_XLSX_MODES = ("streaming", "in_memory", "off")
+SUMMARY_HEAT_COLUMNS = (
+    "window_range_pct",
+    "realized_vol_pct",
+    "window_return_pct",
+    "prev_close_to_premarket_pct",
+    "premarket_to_open_pct",
+    "open_to_current_pct",
+)
 
 
 @dataclass(frozen=True)
@@ -49,6 +79,8 @@ class WorkbookWriteResult:
     row_counts: dict[str, int]
     sheet_names: list[str]
     canonical_upstream_artifact: str
+    sheet_dataset_dir: Path | None = None
+    xlsx_mode: str = "in_memory"
 
 
 def canonical_production_workbook_path(*, export_dir: Path | None = None) -> Path:
@@ -56,6 +88,11 @@ def canonical_production_workbook_path(*, export_dir: Path | None = None) -> Pat
     return root / CANONICAL_PRODUCTION_WORKBOOK_NAME
 
 
+def canonical_production_sheet_dataset_path(*, export_dir: Path | None = None) -> Path:
+    root = export_dir if export_dir is not None else DEFAULT_PRODUCTION_EXPORT_DIR
+    return root / CANONICAL_PRODUCTION_SHEET_DATASET_NAME
+
+
 def resolve_production_workbook_path(
     workbook: str | Path | None = None,
     *,
@@ -159,6 +196,76 @@ def _memory_snapshot() -> str:
         logging.debug("resource.getrusage failed: %s", exc)
         return "rss=unknown"
 
+
+def _plan_workbook_sheets(
+    summary: pd.DataFrame,
+    *,
+    minute_detail: pd.DataFrame | None = None,
+    second_detail: pd.DataFrame | None = None,
+    additional_sheets: dict[str, pd.DataFrame | None] | None = None,
+) -> list[tuple[str, pd.DataFrame]]:
+    """Return the workbook's ``(sheet_name, frame)`` list in write order.
+
+    ``summary`` is always first (even when empty); empty additional and
+    detail sheets are dropped and names are truncated to Excel's 31 chars.
+    """
+    planned_sheets: list[tuple[str, pd.DataFrame]] = [("summary", summary)]
+    if additional_sheets:
+        for sheet_name, frame in additional_sheets.items():
+            if frame is None or frame.empty:
+                continue
+            planned_sheets.append((str(sheet_name)[:31], frame))
+    if minute_detail is not None and not minute_detail.empty:
+        planned_sheets.append(("minute_detail", minute_detail))
+    if second_detail is not None and not second_detail.empty:
+        planned_sheets.append(("second_detail", second_detail))
+    return planned_sheets
+
+
+def _chunk_sheet_name(base_name: str, chunk_index: int) -> str:
+    """Name of the ``chunk_index``-th (1-based) worksheet of a split sheet."""
+    if chunk_index == 1:
+        return base_name
+    suffix = f"_{chunk_index:03d}"
+    return f"{base_name[: max(0, 31 - len(suffix))]}{suffix}"
+
+
+def _style_header_cell(cell: Any) -> None:
+    cell.fill = PatternFill(fill_type="solid", fgColor="1F4E78")
+    cell.font = Font(color="FFFFFF", bold=True)
+    cell.alignment = Alignment(horizontal="center")
+
+
+def _column_width(max_length: int) -> int:
+    return min(max(max_length + 2, 12), 28)
+
+
+def _add_summary_heat_formatting(worksheet: Any, headers: list[Any], *, max_row: int) -> None:
+    """Colour-scale the summary's percentage columns (rows 2..max_row)."""
+    if max_row < 2:
+        return
+    positions = {name: idx + 1 for idx, name in enumerate(headers)}
+    for col_name in SUMMARY_HEAT_COLUMNS:
+        col_idx = positions.get(col_name)
+        if col_idx is None:
+            continue
+        letter = get_column_letter(col_idx)
+        worksheet.conditional_formatting.add(
+            f"{letter}2:{letter}{max_row}",
+            ColorScaleRule(
+                start_type="num",
+                start_value=-10,
+                start_color="C00000",
+                mid_type="num",
+                mid_value=0,
+                mid_color="FFF2CC",
+                end_type="num",
+                end_value=10,
+                end_color="63BE7B",
+            ),
+        )
+
+
 def create_excel_workbook_bytes(
     summary: pd.DataFrame,
     *,
@@ -183,16 +290,12 @@ def create_excel_workbook_bytes(
 
     # Pre-compute the planned sheet list so per-sheet markers can include
     # `idx/total` for monotonic progress tracking.
-    planned_sheets: list[tuple[str, pd.DataFrame]] = [("summary", summary)]
-    if additional_sheets:
-        for sheet_name, frame in additional_sheets.items():
-            if frame is None or frame.empty:
-                continue
-            planned_sheets.append((str(sheet_name)[:31], frame))
-    if minute_detail is not None and not minute_detail.empty:
-        planned_sheets.append(("minute_detail", minute_detail))
-    if second_detail is not None and not second_detail.empty:
-        planned_sheets.append(("second_detail", second_detail))
+    planned_sheets = _plan_workbook_sheets(
+        summary,
+        minute_detail=minute_detail,
+        second_detail=second_detail,
+        additional_sheets=additional_sheets,
+    )
     total_sheets = len(planned_sheets)
     _emit(f"begin openpyxl write, sheets={total_sheets} mem={_memory_snapshot()}")
 
@@ -221,11 +324,7 @@ def create_excel_workbook_bytes(
         base_name = str(sheet_name)[:31]
         for chunk_index, start_row in enumerate(range(0, len(prepared), max_data_rows_per_sheet), start=1):
             end_row = start_row + max_data_rows_per_sheet
-            if chunk_index == 1:
-                chunk_sheet_name = base_name
-            else:
-                suffix = f"_{chunk_index:03d}"
-                chunk_sheet_name = f"{base_name[: max(0, 31 - len(suffix))]}{suffix}"
+            chunk_sheet_name = _chunk_sheet_name(base_name, chunk_index)
             chunk_rows = min(end_row, rows) - start_row
             _emit(
                 f"sheet {sheet_index}/{total_sheets} '{sheet_name}' chunk {chunk_index} "
@@ -261,16 +360,12 @@ def create_excel_workbook_bytes(
             )
             worksheet.freeze_panes = "A2"
             worksheet.auto_filter.ref = worksheet.dimensions
-            header_fill = PatternFill(fill_type="solid", fgColor="1F4E78")
-            header_font = Font(color="FFFFFF", bold=True)
             for cell in worksheet[1]:
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = Alignment(horizontal="center")
+                _style_header_cell(cell)
             header_done = perf_counter()
             for column_cells in worksheet.columns:
                 max_length = max(len(str(cell.value or "")) for cell in column_cells)
-                worksheet.column_dimensions[get_column_letter(column_cells[0].column)].width = min(max(max_length + 2, 12), 28)
+                worksheet.column_dimensions[get_column_letter(column_cells[0].column)].width = _column_width(max_length)
             width_done = perf_counter()
             _emit(
                 f"styling ws {ws_idx}/{total_ws} '{worksheet.title}' done "
@@ -281,34 +376,11 @@ def create_excel_workbook_bytes(
 
         cf_t0 = perf_counter()
         summary_sheet = workbook["summary"]
-        headers = {cell.value: idx + 1 for idx, cell in enumerate(summary_sheet[1])}
-        heat_columns = [
-            "window_range_pct",
-            "realized_vol_pct",
-            "window_return_pct",
-            "prev_close_to_premarket_pct",
-            "premarket_to_open_pct",
-            "open_to_current_pct",
-        ]
-        for col_name in heat_columns:
-            col_idx = headers.get(col_name)
-            if col_idx is None or summary_sheet.max_row < 2:
-                continue
-            letter = get_column_letter(col_idx)
-            summary_sheet.conditional_formatting.add(
-                f"{letter}2:{letter}{summary_sheet.max_row}",
-                ColorScaleRule(
-                    start_type="num",
-                    start_value=-10,
-                    start_color="C00000",
-                    mid_type="num",
-                    mid_value=0,
-                    mid_color="FFF2CC",
-                    end_type="num",
-                    end_value=10,
-                    end_color="63BE7B",
-                ),
-            )
+        _add_summary_heat_formatting(
+            summary_sheet,
+            [cell.value for cell in summary_sheet[1]],
+            max_row=summary_sheet.max_row,
+        )
         _emit(f"conditional formatting applied in {perf_counter() - cf_t0:.2f}s")
 
         # Pin docProps/core.xml timestamps so byte output is deterministic for a
@@ -344,6 +416,17 @@ def _normalize_xlsx_zip_timestamps(raw: bytes, *, generated_at: float) -> bytes:
     second apart produce different bytes. By round-tripping the archive with a
     pinned ``date_time`` we guarantee byte-stability for a fixed input.
     """
+    dst = BytesIO()
+    _copy_xlsx_zip_pinned(BytesIO(raw), dst, generated_at=generated_at)
+    return dst.getvalue()
+
+
+def _copy_xlsx_zip_pinned(src: Any, dst: Any, *, generated_at: float) -> None:
+    """Copy the xlsx zip ``src`` to ``dst`` with pinned entry/core.xml stamps.
+
+    Entries are streamed one at a time, so this also serves the file-backed
+    streaming writer without loading whole worksheet XML parts into memory.
+    """
     import re
 
     pinned_dt = datetime.fromtimestamp(generated_at, tz=UTC)
@@ -365,10 +448,8 @@ def _normalize_xlsx_zip_timestamps(raw: bytes, *, generated_at: float) -> bytes:
     )
 
     def _pin_core_xml(blob: bytes) -> bytes:
-        return _DCTERMS_RE.sub(rb"\1" + pinned_iso + rb"\2", blob)
+        return _DCTERMS_RE.sub(rb"\g<1>" + pinned_iso + rb"\g<2>", blob)
 
-    src = BytesIO(raw)
-    dst = BytesIO()
     with zipfile.ZipFile(src, "r") as src_zip, zipfile.ZipFile(
         dst, "w", compression=zipfile.ZIP_DEFLATED
     ) as dst_zip:
@@ -376,15 +457,215 @@ def _normalize_xlsx_zip_timestamps(raw: bytes, *, generated_at: float) -> bytes:
         # across runs. openpyxl writes via a temp staging area whose iteration
         # order is not guaranteed deterministic.
         for info in sorted(src_zip.infolist(), key=lambda i: i.filename):
-            data = src_zip.read(info.filename)
-            if info.filename == "docProps/core.xml":
-                data = _pin_core_xml(data)
             new_info = zipfile.ZipInfo(filename=info.filename, date_time=pinned_tuple)
             new_info.compress_type = info.compress_type
             new_info.external_attr = info.external_attr
             new_info.create_system = info.create_system
-            dst_zip.writestr(new_info, data)
-    return dst.getvalue()
+            if info.filename == "docProps/core.xml":
+                dst_zip.writestr(new_info, _pin_core_xml(src_zip.read(info.filename)))
+                continue
+            with src_zip.open(info) as src_entry, dst_zip.open(new_info, "w") as dst_entry:
+                shutil.copyfileobj(src_entry, dst_entry)
+
+
+def _sheet_file_name(position: int, sheet_name: str) -> str:
+    safe = "".join(char if char.isalnum() or char in "-_." else "_" for char in sheet_name)
+    return f"{position:02d}_{safe}.parquet"
+
+
+def _arrow_safe_sheet(frame: pd.DataFrame) -> tuple[pd.DataFrame, list[str]]:
+    """Return ``frame`` with object columns Arrow cannot type stored as text.
+
+    Sheets such as ``manifest`` / ``output_checks`` mix numbers and strings
+    in one column; those columns are written as nullable strings (the xlsx
+    renders them identically) and reported so the index can record them.
+    """
+    import pyarrow as pa
+
+    stored = frame.reset_index(drop=True)
+    stored.columns = [str(column) for column in stored.columns]
+    stringified: list[str] = []
+    for column in stored.columns:
+        if stored[column].dtype != object:
+            continue
+        try:
+            pa.array(stored[column], from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            stored[column] = stored[column].map(
+                lambda value: None if value is None or (pd.api.types.is_scalar(value) and pd.isna(value)) else str(value)
+            )
+            stringified.append(column)
+    return stored, stringified
+
+
+def write_workbook_sheet_dataset(
+    dataset_dir: str | Path,
+    sheets: list[tuple[str, pd.DataFrame]],
+    *,
+    generated_at: float | None = None,
+) -> dict[str, int]:
+    """Write one Parquet file per sheet plus the ``sheets.json`` index.
+
+    Each file is replaced atomically and the index is written last, so a
+    reader never sees an index naming a half-written sheet. Files left over
+    from an earlier run with a different sheet list are removed afterwards.
+    Returns the per-sheet row counts.
+    """
+    from scripts.smc_atomic_write import atomic_write_json, atomic_write_parquet
+
+    root = Path(dataset_dir).expanduser()
+    root.mkdir(parents=True, exist_ok=True)
+    entries: list[dict[str, Any]] = []
+    for position, (sheet_name, frame) in enumerate(sheets, start=1):
+        stored, stringified = _arrow_safe_sheet(frame)
+        file_name = _sheet_file_name(position, sheet_name)
+        atomic_write_parquet(stored, root / file_name, index=False)
+        entries.append(
+            {
+                "name": sheet_name,
+                "file": file_name,
+                "rows": len(stored),
+                "columns": list(stored.columns),
+                "stringified_columns": stringified,
+            }
+        )
+    atomic_write_json(
+        {
+            "format_version": SHEET_DATASET_FORMAT_VERSION,
+            "generated_at": (
+                datetime.fromtimestamp(float(generated_at), tz=UTC).isoformat(timespec="seconds")
+                if generated_at is not None
+                else None
+            ),
+            "sheets": entries,
+        },
+        root / SHEET_DATASET_INDEX_NAME,
+    )
+    current = {entry["file"] for entry in entries}
+    for stale in root.glob("*.parquet"):
+        if stale.name not in current:
+            stale.unlink(missing_ok=True)
+    return {entry["name"]: entry["rows"] for entry in entries}
+
+
+def _excel_rows(frame: pd.DataFrame) -> pd.DataFrame:
+    """Excel-ready cell values: tz stripped, missing values as empty cells."""
+    prepared = prepare_frame_for_excel(frame).astype(object)
+    return prepared.where(prepared.notna(), None)
+
+
+def _estimated_widths(headers: list[str], sample: pd.DataFrame) -> list[int]:
+    widths = []
+    for position, header in enumerate(headers):
+        longest = len(header)
+        if not sample.empty:
+            lengths = sample.iloc[:, position].map(lambda value: 0 if value is None else len(str(value)))
+            longest = max(longest, int(lengths.max()))
+        widths.append(_column_width(longest))
+    return widths
+
+
+def write_streaming_workbook(
+    dataset_dir: str | Path,
+    output_path: str | Path,
+    *,
+    chunk_rows: int = STREAMING_WORKBOOK_CHUNK_ROWS,
+    generated_at: float | None = None,
+    progress_callback: Callable[[str], None] | None = None,
+) -> Path:
+    """Render the xlsx from a sheet dataset with write-only worksheets.
+
+    Rows are decoded ``chunk_rows`` at a time from each sheet's Parquet file
+    and appended to an openpyxl write-only worksheet, so peak memory is
+    bounded by one chunk plus the shared-strings table rather than the whole
+    workbook. Sheet order, the ``_002`` row-limit split, header styling,
+    frozen header, auto filter and the summary colour scales match
+    :func:`create_excel_workbook_bytes`; column widths are estimated from the
+    header and the first chunk instead of every cell.
+    """
+    import pyarrow.parquet as pq
+
+    _t0 = perf_counter()
+
+    def _emit(msg: str) -> None:
+        if progress_callback is None:
+            return
+        progress_callback(f"workbook: {msg} (t+{perf_counter() - _t0:.1f}s)")
+
+    root = Path(dataset_dir).expanduser()
+    sheets = read_sheet_dataset_index(root)["sheets"]
+    path = Path(output_path).expanduser()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    workbook = Workbook(write_only=True)
+    max_data_rows = max(1, EXCEL_MAX_ROWS_PER_SHEET - 1)
+    total_sheets = len(sheets)
+    _emit(f"begin streaming write, sheets={total_sheets} chunk_rows={chunk_rows} mem={_memory_snapshot()}")
+
+    def _open_worksheet(name: str, chunk_index: int, headers: list[str], widths: list[int], rows: int) -> Any:
+        worksheet = workbook.create_sheet(_chunk_sheet_name(name[:31], chunk_index))
+        worksheet.freeze_panes = "A2"
+        for position, width in enumerate(widths, start=1):
+            worksheet.column_dimensions[get_column_letter(position)].width = width
+        if headers:
+            worksheet.auto_filter.ref = f"A1:{get_column_letter(len(headers))}{rows + 1}"
+        if name == "summary" and chunk_index == 1:
+            _add_summary_heat_formatting(worksheet, headers, max_row=rows + 1)
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(worksheet, value=header)
+            _style_header_cell(cell)
+            header_cells.append(cell)
+        worksheet.append(header_cells)
+        return worksheet
+
+    for sheet_index, entry in enumerate(sheets, start=1):
+        name, rows = str(entry["name"]), int(entry["rows"])
+        parquet = pq.ParquetFile(root / entry["file"])
+        headers = [str(column) for column in parquet.schema_arrow.names]
+        _emit(f"sheet {sheet_index}/{total_sheets} '{name}' rows={rows} begin mem={_memory_snapshot()}")
+        worksheet = None
+        chunk_index = 0
+        written = 0
+        widths: list[int] | None = None
+        for batch in parquet.iter_batches(batch_size=max(1, int(chunk_rows))):
+            values = _excel_rows(batch.to_pandas())
+            if widths is None:
+                widths = _estimated_widths(headers, values)
+            offset = 0
+            while offset < len(values):
+                if worksheet is None or written >= max_data_rows:
+                    chunk_index += 1
+                    chunk_total = min(max_data_rows, rows - (chunk_index - 1) * max_data_rows)
+                    worksheet = _open_worksheet(name, chunk_index, headers, widths, chunk_total)
+                    written = 0
+                take = min(max_data_rows - written, len(values) - offset)
+                for row in values.iloc[offset : offset + take].itertuples(index=False, name=None):
+                    worksheet.append(row)
+                written += take
+                offset += take
+        if worksheet is None:
+            _open_worksheet(name, 1, headers, widths or _estimated_widths(headers, pd.DataFrame()), 0)
+        _emit(f"sheet {sheet_index}/{total_sheets} '{name}' rows={rows} done mem={_memory_snapshot()}")
+
+    if generated_at is not None:
+        pinned = datetime.fromtimestamp(float(generated_at), tz=UTC).replace(tzinfo=None)
+        workbook.properties.created = pinned
+        workbook.properties.modified = pinned
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    pinned_path = path.with_name(f"{path.name}.{os.getpid()}.pinned.tmp")
+    try:
+        _emit(f"save begin mem={_memory_snapshot()}")
+        workbook.save(tmp_path)
+        if generated_at is not None:
+            _copy_xlsx_zip_pinned(tmp_path, pinned_path, generated_at=float(generated_at))
+            os.replace(pinned_path, path)
+        else:
+            os.replace(tmp_path, path)
+        _emit(f"save done (bytes={path.stat().st_size}) mem={_memory_snapshot()}")
+    finally:
+        tmp_path.unlink(missing_ok=True)
+        pinned_path.unlink(missing_ok=True)
+    return path
 
 
 def write_databento_production_workbook_from_frames(
@@ -396,27 +677,73 @@ def write_databento_production_workbook_from_frames(
     second_detail: pd.DataFrame | None = None,
     additional_sheets: dict[str, pd.DataFrame | None] | None = None,
     progress_callback: Callable[[str], None] | None = None,
+    sheet_dataset_dir: str | Path | None = None,
+    xlsx_mode: str = "in_memory",
 ) -> WorkbookWriteResult:
+    """Write the workbook's sheets and (per ``xlsx_mode``) the xlsx itself.
+
+    With ``sheet_dataset_dir`` the sheets are first written as a Parquet
+    sheet dataset. ``xlsx_mode`` then picks how the xlsx is produced:
+    ``"in_memory"`` (pandas/openpyxl, the historic path), ``"streaming"``
+    (:func:`write_streaming_workbook` over the sheet dataset) or ``"off"``
+    (no xlsx; render it later with ``python -m scripts.databento_production_workbook``).
+    The last two require ``sheet_dataset_dir``. The daily-bars loaders read
+    the sheet dataset, so they keep working without the xlsx.
+    """
+    if xlsx_mode not in WORKBOOK_XLSX_MODES:
+        raise ValueError(f"xlsx_mode must be one of {WORKBOOK_XLSX_MODES}, got {xlsx_mode!r}")
+    if xlsx_mode != "in_memory" and sheet_dataset_dir is None:
+        raise ValueError(f"xlsx_mode={xlsx_mode!r} requires sheet_dataset_dir")
     path = Path(output_path).expanduser()
     path.parent.mkdir(parents=True, exist_ok=True)
-    payload = create_excel_workbook_bytes(
-        summary,
-        minute_detail=minute_detail,
-        second_detail=second_detail,
-        additional_sheets=additional_sheets,
-        generated_at=generated_at,
-        progress_callback=progress_callback,
-    )
-    if progress_callback is not None:
-        _t0 = perf_counter()
-        progress_callback(
-            f"workbook: write_bytes begin (bytes={len(payload)}) (t+0.0s)"
+    dataset_path = Path(sheet_dataset_dir).expanduser() if sheet_dataset_dir is not None else None
+    if dataset_path is not None:
+        dataset_t0 = perf_counter()
+        sheet_rows = write_workbook_sheet_dataset(
+            dataset_path,
+            _plan_workbook_sheets(
+                summary,
+                minute_detail=minute_detail,
+                second_detail=second_detail,
+                additional_sheets=additional_sheets,
+            ),
+            generated_at=generated_at,
+        )
+        if progress_callback is not None:
+            progress_callback(
+                f"workbook: sheet dataset written sheets={len(sheet_rows)} rows={sum(sheet_rows.values())} "
+                f"(t+{perf_counter() - dataset_t0:.1f}s)"
+            )
+    if xlsx_mode == "streaming":
+        write_streaming_workbook(
+            dataset_path,
+            path,
+            generated_at=generated_at,
+            progress_callback=progress_callback,
         )
-    path.write_bytes(payload)
-    if progress_callback is not None:
-        progress_callback(
-            f"workbook: write_bytes done (t+{perf_counter() - _t0:.1f}s)"
+    elif xlsx_mode == "in_memory":
+        payload = create_excel_workbook_bytes(
+            summary,
+            minute_detail=minute_detail,
+            second_detail=second_detail,
+            additional_sheets=additional_sheets,
+            generated_at=generated_at,
+            progress_callback=progress_callback,
         )
+        if progress_callback is not None:
+            _t0 = perf_counter()
+            progress_callback(
+                f"workbook: write_bytes begin (bytes={len(payload)}) (t+0.0s)"
+            )
+        path.write_bytes(payload)
+        if progress_callback is not None:
+            progress_callback(
+                f"workbook: write_bytes done (t+{perf_counter() - _t0:.1f}s)"
+            )
+    if dataset_path is not None and xlsx_mode != "off":
+        # Readers use the dataset only while its index is at least as new as
+        # the xlsx (smc_core.cached_workbook_reader.sheet_dataset_for).
+        os.utime(dataset_path / SHEET_DATASET_INDEX_NAME)
 
     rows = {"summary": len(summary)}
     if minute_detail is not None:
@@ -439,6 +766,8 @@ def write_databento_production_workbook_from_frames(
         row_counts=rows,
         sheet_names=list(rows.keys()),
         canonical_upstream_artifact="databento_production_export_bundle",
+        sheet_dataset_dir=dataset_path,
+        xlsx_mode=xlsx_mode,
     )
 
 
@@ -502,3 +831,44 @@ def write_databento_production_workbook(
         "canonical_upstream_artifact": result.canonical_upstream_artifact,
         "bundle_manifest_path": str(payload["manifest_path"]),
     }
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Render the production workbook xlsx from its Parquet sheet dataset (streaming, constant memory)."
+    )
+    parser.add_argument(
+        "--export-dir",
+        type=Path,
+        default=DEFAULT_PRODUCTION_EXPORT_DIR,
+        help=f"export directory holding the sheet dataset (default: {DEFAULT_PRODUCTION_EXPORT_DIR})",
+    )
+    parser.add_argument("--sheet-dataset", type=Path, default=None, help="sheet dataset dir (default: under --export-dir)")
+    parser.add_argument("--output", type=Path, default=None, help="xlsx path (default: canonical workbook path)")
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=STREAMING_WORKBOOK_CHUNK_ROWS,
+        help=f"rows decoded per write step (default: {STREAMING_WORKBOOK_CHUNK_ROWS})",
+    )
+    parser.add_argument("--generated-at", type=float, default=None, help="epoch seconds to pin for byte-stable output")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    dataset_dir = args.sheet_dataset or canonical_production_sheet_dataset_path(export_dir=args.export_dir)
+    output_path = args.output or canonical_production_workbook_path(export_dir=args.export_dir)
+    written = write_streaming_workbook(
+        dataset_dir,
+        output_path,
+        chunk_rows=args.chunk_rows,
+        generated_at=args.generated_at,
+        progress_callback=print,
+    )
+    print(written)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
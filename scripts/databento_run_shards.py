@@ -0,0 +1,412 @@
+"""Local runner for the sharded Databento production export.
+
+Executes a shard plan (``databento_plan_shards.plan_shards``, or a
+``--plan-file`` holding its JSON output) on one machine, the way the
+``smc-databento-production-export-sharded.yml`` matrix + reduce jobs do on
+GitHub Actions:
+
+* every shard runs ``scripts/databento_production_export.py --start-date S
+  --end-date E --shard-id I --shard-of N --export-dir <work>/shard-I-of-N/export``
+  in its own process, at most ``--max-parallel`` at a time;
+* a failed (or timed-out) shard is retried up to ``--retries`` more times
+  with a fresh export dir, so a half-written attempt never leaks a stale
+  manifest into the merge; each attempt's stdout/stderr goes to
+  ``<work>/shard-I-of-N/attempt-K.log``;
+* progress is kept in ``<work>/shard_run_manifest.json`` (atomically
+  rewritten on every state change). Re-running with the same plan skips
+  shards that already succeeded; ``--restart`` discards the progress;
+* unless ``--no-merge`` is given, the succeeded shards are reduced with
+  ``databento_production_merge_shards`` (merged manifest + streaming payload
+  merge) into ``<work>/merged`` in a child process whose peak RSS is
+  reported alongside the end-to-end wall time.
+
+Usage:
+    python -m scripts.databento_run_shards --lookback-days 30 --num-shards 6 --work-dir artifacts/shard_run
+    python -m scripts.databento_run_shards --plan-file shards.json --max-parallel 3 --retries 2 \\
+        --allow-partial -- --smc-base-only
+
+Arguments after ``--`` are appended to every producer command. Prints a JSON
+report to stdout; exits 1 when a shard failed (unless ``--allow-partial``)
+and 2 when the merge failed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import Any
+
+from scripts.databento_plan_shards import plan_shards
+from scripts.databento_production_merge_shards import (
+    MERGED_BASENAME,
+    discover_shard_manifests,
+    merge_manifests,
+    merge_shard_payloads,
+)
+from scripts.smc_atomic_write import atomic_write_json
+
+try:
+    import resource  # POSIX-only stdlib; absent on Windows.
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+_LOG_PREFIX = "[run-shards] "
+
+PROGRESS_MANIFEST_NAME = "shard_run_manifest.json"
+MERGED_DIR_NAME = "merged"
+RUNNER_VERSION = "1"
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+PRODUCER_SCRIPT = _REPO_ROOT / "scripts" / "databento_production_export.py"
+
+# ``(shard, export_dir) -> argv``; injectable so tests can run fixture shards.
+ShardCommand = Callable[[Mapping[str, Any], Path], Sequence[str]]
+
+
+def producer_command(shard: Mapping[str, Any], export_dir: Path, *, extra_args: Sequence[str] = ()) -> list[str]:
+    """argv of the production export for one shard (mirrors the workflow matrix step)."""
+    return [
+        sys.executable,
+        "-u",
+        str(PRODUCER_SCRIPT),
+        "--start-date",
+        str(shard["start_date"]),
+        "--end-date",
+        str(shard["end_date"]),
+        "--shard-id",
+        str(shard["shard_id"]),
+        "--shard-of",
+        str(shard["shard_of"]),
+        "--export-dir",
+        str(export_dir),
+        *extra_args,
+    ]
+
+
+def shard_dir_name(shard: Mapping[str, Any]) -> str:
+    """``shard-<i>-of-<N>``: the artifact naming the reduce step parses shard ids from."""
+    return f"shard-{shard['shard_id']}-of-{shard['shard_of']}"
+
+
+def _now_utc_iso() -> str:
+    return datetime.now(UTC).isoformat(timespec="seconds")
+
+
+def _peak_rss_mib() -> float | None:
+    if resource is None:
+        return None
+    # Linux reports ru_maxrss in KiB, macOS in bytes.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / 2**20 if sys.platform == "darwin" else peak / 1024, 1)
+
+
+def _run_command(argv: Sequence[str], *, log_path: Path, timeout: float | None) -> int | None:
+    """Run one shard attempt, streaming its output to ``log_path``.
+
+    Returns the exit code, or ``None`` when the attempt hit ``timeout``.
+    """
+    with log_path.open("wb") as log:
+        try:
+            completed = subprocess.run(  # noqa: S603 -- argv from producer_command / the caller's factory, no shell
+                list(argv), stdout=log, stderr=subprocess.STDOUT, cwd=_REPO_ROOT, timeout=timeout, check=False
+            )
+        except subprocess.TimeoutExpired:
+            return None
+    return completed.returncode
+
+
+def _shard_windows(shards: Sequence[Mapping[str, Any]]) -> list[list[Any]]:
+    return [[s["shard_id"], s["shard_of"], s["start_date"], s["end_date"]] for s in shards]
+
+
+def _initial_progress(shards: Sequence[Mapping[str, Any]], work_dir: Path, *, restart: bool) -> dict[str, Any]:
+    """Fresh progress manifest, carrying over succeeded shards of the same plan."""
+    previous: dict[str, Any] = {}
+    progress_path = work_dir / PROGRESS_MANIFEST_NAME
+    if progress_path.exists() and not restart:
+        loaded = json.loads(progress_path.read_text(encoding="utf-8"))
+        if _shard_windows(loaded.get("shards", [])) == _shard_windows(shards):
+            previous = {entry["shard_id"]: entry for entry in loaded["shards"]}
+    entries = []
+    for shard in shards:
+        shard_dir = work_dir / shard_dir_name(shard)
+        entry = {
+            "shard_id": shard["shard_id"],
+            "shard_of": shard["shard_of"],
+            "start_date": shard["start_date"],
+            "end_date": shard["end_date"],
+            "shard_dir": str(shard_dir),
+            "export_dir": str(shard_dir / "export"),
+            "status": "pending",
+            "attempts": [],
+            "seconds": None,
+        }
+        done = previous.get(shard["shard_id"])
+        if done is not None and done.get("status") == "succeeded" and Path(done["export_dir"]).is_dir():
+            entry.update(status="succeeded", attempts=done["attempts"], seconds=done["seconds"], resumed=True)
+        entries.append(entry)
+    return {
+        "runner_version": RUNNER_VERSION,
+        "status": "running",
+        "started_at": _now_utc_iso(),
+        "finished_at": None,
+        "wall_seconds": None,
+        "shards": entries,
+        "merge": None,
+    }
+
+
+class _Progress:
+    """Thread-safe owner of the progress manifest; every update is persisted."""
+
+    def __init__(self, path: Path, manifest: dict[str, Any]) -> None:
+        self.path = path
+        self.manifest = manifest
+        self._lock = threading.Lock()
+        self._write()
+
+    def _write(self) -> None:
+        atomic_write_json(self.manifest, self.path, indent=2, sort_keys=True)
+
+    def update(self, entry: dict[str, Any], **changes: Any) -> None:
+        with self._lock:
+            entry.update(changes)
+            self._write()
+
+    def add_attempt(self, entry: dict[str, Any], attempt: dict[str, Any]) -> None:
+        with self._lock:
+            entry["attempts"].append(attempt)
+            self._write()
+
+    def finish(self, **changes: Any) -> None:
+        with self._lock:
+            self.manifest.update(changes)
+            self._write()
+
+
+def _run_shard(
+    entry: dict[str, Any],
+    shard: Mapping[str, Any],
+    progress: _Progress,
+    *,
+    command: ShardCommand,
+    retries: int,
+    retry_backoff_seconds: float,
+    timeout: float | None,
+) -> None:
+    shard_dir, export_dir = Path(entry["shard_dir"]), Path(entry["export_dir"])
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    started = time.monotonic()
+    for attempt in range(1, retries + 2):
+        # A failed attempt can leave a partial export (or a manifest) behind;
+        # every attempt starts from an empty export dir.
+        shutil.rmtree(export_dir, ignore_errors=True)
+        export_dir.mkdir(parents=True)
+        log_path = shard_dir / f"attempt-{attempt}.log"
+        progress.update(entry, status="running")
+        attempt_started = time.monotonic()
+        returncode = _run_command(command(shard, export_dir), log_path=log_path, timeout=timeout)
+        progress.add_attempt(
+            entry,
+            {
+                "attempt": attempt,
+                "returncode": returncode,
+                "timed_out": returncode is None,
+                "seconds": round(time.monotonic() - attempt_started, 3),
+                "log_path": str(log_path),
+            },
+        )
+        if returncode == 0:
+            progress.update(entry, status="succeeded", seconds=round(time.monotonic() - started, 3))
+            print(f"{_LOG_PREFIX}{shard_dir.name}: succeeded on attempt {attempt}", flush=True)
+            return
+        outcome = "timed out" if returncode is None else f"exited {returncode}"
+        print(f"{_LOG_PREFIX}{shard_dir.name}: attempt {attempt} {outcome} (log: {log_path})", flush=True)
+        if attempt <= retries and retry_backoff_seconds > 0:
+            time.sleep(retry_backoff_seconds * attempt)
+    progress.update(entry, status="failed", seconds=round(time.monotonic() - started, 3))
+
+
+def _merge_succeeded_shards(
+    shard_dirs: Sequence[str], output_dir: str, *, expected_shard_count: int, allow_partial: bool
+) -> dict[str, Any]:
+    """Reduce step (manifest + payloads); runs in a child process for a clean peak RSS."""
+    started = time.monotonic()
+    baseline = _peak_rss_mib()
+    pairs = discover_shard_manifests([Path(d) for d in shard_dirs])
+    manifests = [json.loads(path.read_text(encoding="utf-8")) for _, path in pairs]
+    merged = merge_manifests(
+        manifests,
+        shard_ids=[sid for sid, _ in pairs],
+        expected_shard_count=expected_shard_count,
+        allow_partial=allow_partial,
+    )
+    out_dir = Path(output_dir)
+    manifest_path = out_dir / f"{MERGED_BASENAME}_manifest.json"
+    atomic_write_json(merged, manifest_path, indent=2, sort_keys=True)
+    rows = merge_shard_payloads([path for _, path in pairs], out_dir, merged_basename=MERGED_BASENAME)
+    peak = _peak_rss_mib()
+    return {
+        "manifest_path": str(manifest_path),
+        "partial_run": bool(merged.get("partial_run")),
+        "frame_rows": rows,
+        "seconds": round(time.monotonic() - started, 3),
+        "peak_rss_mib": peak,
+        "rss_growth_mib": round(peak - baseline, 1) if peak is not None and baseline is not None else None,
+    }
+
+
+def run_shards(
+    shards: Sequence[Mapping[str, Any]],
+    work_dir: Path,
+    *,
+    command: ShardCommand = producer_command,
+    max_parallel: int = 2,
+    retries: int = 1,
+    retry_backoff_seconds: float = 5.0,
+    timeout_seconds: float | None = None,
+    merge: bool = True,
+    allow_partial: bool = False,
+    restart: bool = False,
+) -> dict[str, Any]:
+    """Execute ``shards`` in a bounded pool, then merge; return the progress manifest.
+
+    ``max_parallel`` caps the number of concurrently running shard
+    processes. ``manifest["status"]`` is ``succeeded`` (all shards and the
+    merge ran), ``partial`` (some shards failed, ``allow_partial`` merged
+    the rest), ``failed`` (a shard failed without ``allow_partial``; no
+    merge) or ``merge_failed``.
+    """
+    if max_parallel < 1:
+        raise ValueError(f"max_parallel must be >= 1 (got {max_parallel})")
+    if retries < 0:
+        raise ValueError(f"retries must be >= 0 (got {retries})")
+    work_dir.mkdir(parents=True, exist_ok=True)
+    started = time.monotonic()
+    progress = _Progress(work_dir / PROGRESS_MANIFEST_NAME, _initial_progress(shards, work_dir, restart=restart))
+    entries = progress.manifest["shards"]
+    pending = [(entry, shard) for entry, shard in zip(entries, shards, strict=True) if entry["status"] != "succeeded"]
+    print(
+        f"{_LOG_PREFIX}{len(pending)} of {len(entries)} shard(s) to run, max_parallel={max_parallel}, "
+        f"retries={retries}",
+        flush=True,
+    )
+    with ThreadPoolExecutor(max_workers=max_parallel, thread_name_prefix="shard") as pool:
+        futures = [
+            pool.submit(
+                _run_shard,
+                entry,
+                shard,
+                progress,
+                command=command,
+                retries=retries,
+                retry_backoff_seconds=retry_backoff_seconds,
+                timeout=timeout_seconds,
+            )
+            for entry, shard in pending
+        ]
+        for future in futures:
+            future.result()
+    shards_seconds = round(time.monotonic() - started, 3)
+
+    succeeded = [entry for entry in entries if entry["status"] == "succeeded"]
+    failed = [entry["shard_id"] for entry in entries if entry["status"] != "succeeded"]
+    status = "succeeded" if not failed else "partial" if allow_partial else "failed"
+    merge_report: dict[str, Any] | None = None
+    if merge and succeeded and status != "failed":
+        try:
+            # A fresh spawned interpreter keeps ru_maxrss specific to the merge.
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                merge_report = pool.submit(
+                    _merge_succeeded_shards,
+                    [entry["shard_dir"] for entry in succeeded],
+                    str(work_dir / MERGED_DIR_NAME),
+                    expected_shard_count=len(entries),
+                    allow_partial=allow_partial,
+                ).result()
+        except Exception as exc:
+            # Any merge error (a bad shard manifest, ArrowInvalid, a dead
+            # worker pool, ...) must end the run as merge_failed rather than
+            # leave the progress manifest at "running"; main() exits non-zero.
+            merge_report = {"error": f"{type(exc).__name__}: {exc}"}
+            status = "merge_failed"
+    progress.finish(
+        status=status,
+        failed_shard_ids=failed,
+        finished_at=_now_utc_iso(),
+        shards_wall_seconds=shards_seconds,
+        wall_seconds=round(time.monotonic() - started, 3),
+        merge=merge_report,
+    )
+    return progress.manifest
+
+
+def _load_plan(args: argparse.Namespace) -> list[dict[str, Any]]:
+    if args.plan_file is not None:
+        return json.loads(args.plan_file.read_text(encoding="utf-8"))
+    end_date = args.end_date if args.end_date is not None else datetime.now(UTC).date()
+    return plan_shards(lookback_days=args.lookback_days, num_shards=args.num_shards, end_date=end_date)
+
+
+def _parse_args(argv: Sequence[str] | None = None) -> tuple[argparse.Namespace, list[str]]:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    extra: list[str] = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, extra = argv[:split], argv[split + 1 :]
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    plan = parser.add_mutually_exclusive_group(required=True)
+    plan.add_argument("--plan-file", type=Path, default=None, help="JSON shard plan (databento_plan_shards output)")
+    plan.add_argument("--lookback-days", type=int, default=None, help="plan the trailing window in-process")
+    parser.add_argument("--num-shards", type=int, default=6, help="shards for --lookback-days (default: 6)")
+    parser.add_argument(
+        "--end-date", type=date.fromisoformat, default=None, help="inclusive window end (default: today UTC)"
+    )
+    parser.add_argument("--work-dir", type=Path, default=Path("artifacts/shard_run"), help="shard dirs + progress")
+    parser.add_argument("--max-parallel", type=int, default=2, help="concurrent shard processes (default: 2)")
+    parser.add_argument("--retries", type=int, default=1, help="extra attempts per failed shard (default: 1)")
+    parser.add_argument(
+        "--retry-backoff-seconds", type=float, default=5.0, help="sleep before retry k is k x this (default: 5)"
+    )
+    parser.add_argument("--shard-timeout-seconds", type=float, default=None, help="per-attempt timeout (default: none)")
+    parser.add_argument("--allow-partial", action="store_true", help="merge the succeeded shards if some failed")
+    parser.add_argument("--no-merge", action="store_true", help="run the shards only")
+    parser.add_argument("--restart", action="store_true", help="ignore the progress of a previous run")
+    return parser.parse_args(argv), extra
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args, extra = _parse_args(argv)
+    try:
+        shards = _load_plan(args)
+        report = run_shards(
+            shards,
+            args.work_dir,
+            command=lambda shard, export_dir: producer_command(shard, export_dir, extra_args=extra),
+            max_parallel=args.max_parallel,
+            retries=args.retries,
+            retry_backoff_seconds=args.retry_backoff_seconds,
+            timeout_seconds=args.shard_timeout_seconds,
+            merge=not args.no_merge,
+            allow_partial=args.allow_partial,
+            restart=args.restart,
+        )
+    except ValueError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return {"succeeded": 0, "partial": 0, "failed": 1}.get(report["status"], 2)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
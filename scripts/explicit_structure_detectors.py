@@ -7,6 +7,7 @@ import pandas as pd
 
 from scripts.smc_price_action_engine import canonical_timeframe, detect_bos_from_pivots, normalize_bars
 from smc_core.ids import fvg_id, liquidity_id, ob_id, sweep_id
+from smc_core.mitigation_search import ZoneMitigationEngine
 
 
 def _is_up(open_price: float, close_price: float) -> bool:
@@ -29,6 +30,53 @@ def _dedupe_by_id(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
     return out
 
 
+def _bar_columns(bars: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # Timestamps stay float64: the original row-wise loops read them through
+    # ``bars.iloc[i]``, which upcasts the all-numeric OHLCV row to float64, so
+    # IDs and ``*_ts`` fields were always derived from the float value.
+    return (
+        bars["open"].to_numpy(dtype=float),
+        bars["high"].to_numpy(dtype=float),
+        bars["low"].to_numpy(dtype=float),
+        bars["close"].to_numpy(dtype=float),
+        bars["timestamp"].to_numpy(dtype=float),
+    )
+
+
+def _resolve_zone_lifecycles(
+    engine: ZoneMitigationEngine,
+    ts: np.ndarray,
+    zones: list[tuple[int, str, float, float]],
+) -> list[tuple[bool, bool, int | None]]:
+    """Return ``(valid, mitigated, mitigated_ts)`` per ``(anchor_index, dir, low, high)`` zone.
+
+    Replaces the per-zone ``for j in range(i + 1, len(bars))`` forward scan of
+    the original detectors with one batched :class:`ZoneMitigationEngine`
+    query per direction; results come back in input order.
+    """
+    resolved: list[tuple[bool, bool, int | None]] = [(True, False, None)] * len(zones)
+    for direction in ("BULL", "BEAR"):
+        positions = [k for k, zone in enumerate(zones) if zone[1] == direction]
+        if not positions:
+            continue
+        result = engine.resolve(
+            direction,
+            np.array([zones[k][0] + 1 for k in positions], dtype=np.int64),
+            np.array([zones[k][2] for k in positions], dtype=float),
+            np.array([zones[k][3] for k in positions], dtype=float),
+        )
+        valid = result.valid.tolist()
+        mitigated = result.mitigated.tolist()
+        mitigated_index = result.mitigated_index.tolist()
+        for slot, k in enumerate(positions):
+            mitigated_ts = int(ts[mitigated_index[slot]]) if mitigated[slot] else None
+            resolved[k] = (bool(valid[slot]), bool(mitigated[slot]), mitigated_ts)
+    return resolved
+
+
+_INVALIDATION_RULE = {"BULL": "close_below_low", "BEAR": "close_above_high"}
+
+
 def detect_orderblocks_classic(
     df: pd.DataFrame,
     symbol: str,
@@ -45,120 +93,56 @@ def detect_orderblocks_classic(
     out: list[dict[str, Any]] = []
     diagnostics: list[dict[str, Any]] = []
 
+    open_arr, high_arr, low_arr, close_arr, ts_arr = _bar_columns(bars)
+    opens, highs, lows, closes = open_arr.tolist(), high_arr.tolist(), low_arr.tolist(), close_arr.tolist()
+
+    zones: list[tuple[int, str, float, float]] = []
     for i in range(1, len(bars)):
-        prev = bars.iloc[i - 1]
-        cur = bars.iloc[i]
-
-        prev_open = float(prev["open"])
-        prev_close = float(prev["close"])
-        prev_high = float(prev["high"])
-        prev_low = float(prev["low"])
-        cur_open = float(cur["open"])
-        cur_close = float(cur["close"])
-        cur_high = float(cur["high"])
-        cur_low = float(cur["low"])
-        cur_ts = float(cur["timestamp"])
-        prev_ts = int(prev["timestamp"])
+        prev_open, prev_close, prev_high, prev_low = opens[i - 1], closes[i - 1], highs[i - 1], lows[i - 1]
+        cur_open, cur_close, cur_high, cur_low = opens[i], closes[i], highs[i], lows[i]
 
         if _is_down(prev_open, prev_close) and _is_up(cur_open, cur_close) and cur_close > prev_high:
-            low = float(min(prev_low, cur_low))
-            high = float(prev_high)
-            zone_id = ob_id(
-                symbol=symbol_name,
-                timeframe=tf,
-                anchor_ts=cur_ts,
-                direction="BULL",
-                low=low,
-                high=high,
-                ticksize=ticksize,
-                asset_class=asset_class,
-                session_tz=session_tz,
-            )
-            valid = True
-            mitigated = False
-            mitigated_ts: int | None = None
-            for j in range(i + 1, len(bars)):
-                probe = bars.iloc[j]
-                probe_close = float(probe["close"])
-                probe_low = float(probe["low"])
-                probe_ts = int(probe["timestamp"])
-                if not mitigated and probe_low <= high and probe_low >= low:
-                    mitigated = True
-                    mitigated_ts = probe_ts
-                if probe_close < low:
-                    valid = False
-                    break
-            out.append(
-                {
-                    "id": zone_id,
-                    "low": low,
-                    "high": high,
-                    "dir": "BULL",
-                    "valid": valid,
-                    "anchor_ts": int(cur_ts),
-                    "source": "classic_ob",
-                }
-            )
-            diagnostics.append(
-                {
-                    "id": zone_id,
-                    "kind": "ORDERBLOCK",
-                    "mitigated": mitigated,
-                    "mitigated_ts": mitigated_ts,
-                    "invalidation_rule": "close_below_low",
-                    "left_anchor_ts": prev_ts,
-                }
-            )
+            zones.append((i, "BULL", float(min(prev_low, cur_low)), float(prev_high)))
 
         if _is_up(prev_open, prev_close) and _is_down(cur_open, cur_close) and cur_close < prev_low:
-            high = float(max(prev_high, cur_high))
-            low = float(prev_low)
-            zone_id = ob_id(
-                symbol=symbol_name,
-                timeframe=tf,
-                anchor_ts=cur_ts,
-                direction="BEAR",
-                low=low,
-                high=high,
-                ticksize=ticksize,
-                asset_class=asset_class,
-                session_tz=session_tz,
-            )
-            valid = True
-            mitigated = False
-            mitigated_ts = None
-            for j in range(i + 1, len(bars)):
-                probe = bars.iloc[j]
-                probe_close = float(probe["close"])
-                probe_high = float(probe["high"])
-                probe_ts = int(probe["timestamp"])
-                if not mitigated and probe_high >= low and probe_high <= high:
-                    mitigated = True
-                    mitigated_ts = probe_ts
-                if probe_close > high:
-                    valid = False
-                    break
-            out.append(
-                {
-                    "id": zone_id,
-                    "low": low,
-                    "high": high,
-                    "dir": "BEAR",
-                    "valid": valid,
-                    "anchor_ts": int(cur_ts),
-                    "source": "classic_ob",
-                }
-            )
-            diagnostics.append(
-                {
-                    "id": zone_id,
-                    "kind": "ORDERBLOCK",
-                    "mitigated": mitigated,
-                    "mitigated_ts": mitigated_ts,
-                    "invalidation_rule": "close_above_high",
-                    "left_anchor_ts": prev_ts,
-                }
-            )
+            zones.append((i, "BEAR", float(prev_low), float(max(prev_high, cur_high))))
+
+    engine = ZoneMitigationEngine(low_arr, high_arr, close_arr)
+    lifecycles = _resolve_zone_lifecycles(engine, ts_arr, zones)
+    for (i, direction, low, high), (valid, mitigated, mitigated_ts) in zip(zones, lifecycles):
+        cur_ts = float(ts_arr[i])
+        zone_id = ob_id(
+            symbol=symbol_name,
+            timeframe=tf,
+            anchor_ts=cur_ts,
+            direction=direction,
+            low=low,
+            high=high,
+            ticksize=ticksize,
+            asset_class=asset_class,
+            session_tz=session_tz,
+        )
+        out.append(
+            {
+                "id": zone_id,
+                "low": low,
+                "high": high,
+                "dir": direction,
+                "valid": valid,
+                "anchor_ts": int(cur_ts),
+                "source": "classic_ob",
+            }
+        )
+        diagnostics.append(
+            {
+                "id": zone_id,
+                "kind": "ORDERBLOCK",
+                "mitigated": mitigated,
+                "mitigated_ts": mitigated_ts,
+                "invalidation_rule": _INVALIDATION_RULE[direction],
+                "left_anchor_ts": int(ts_arr[i - 1]),
+            }
+        )
 
     return _dedupe_by_id(out), diagnostics
 
@@ -204,20 +188,14 @@ def detect_rejection_blocks_classic(
     out: list[dict[str, Any]] = []
     diagnostics: list[dict[str, Any]] = []
 
+    open_arr, high_arr, low_arr, close_arr, ts_arr = _bar_columns(bars)
+    opens, highs, lows, closes = open_arr.tolist(), high_arr.tolist(), low_arr.tolist(), close_arr.tolist()
+
+    zones: list[tuple[int, str, float, float]] = []
+    variants: list[str] = []
     for i in range(1, len(bars)):
-        prev = bars.iloc[i - 1]
-        cur = bars.iloc[i]
-
-        prev_open = float(prev["open"])
-        prev_close = float(prev["close"])
-        prev_high = float(prev["high"])
-        prev_low = float(prev["low"])
-        cur_open = float(cur["open"])
-        cur_close = float(cur["close"])
-        cur_high = float(cur["high"])
-        cur_low = float(cur["low"])
-        cur_ts = float(cur["timestamp"])
-        prev_ts = int(prev["timestamp"])
+        prev_open, prev_close, prev_high, prev_low = opens[i - 1], closes[i - 1], highs[i - 1], lows[i - 1]
+        cur_open, cur_close, cur_high, cur_low = opens[i], closes[i], highs[i], lows[i]
 
         # Bullish RJB: down (trapped) then up (signal) closing above the trap.
         if _is_down(prev_open, prev_close) and _is_up(cur_open, cur_close) and cur_close > prev_high:
@@ -230,53 +208,8 @@ def detect_rejection_blocks_classic(
                 variant = "signal_wick"
                 low, high = cur_low, cur_open
             if variant is not None and high > low:
-                zone_id = ob_id(
-                    symbol=symbol_name,
-                    timeframe=tf,
-                    anchor_ts=cur_ts,
-                    direction="BULL",
-                    low=low,
-                    high=high,
-                    ticksize=ticksize,
-                    asset_class=asset_class,
-                    session_tz=session_tz,
-                )
-                valid = True
-                mitigated = False
-                mitigated_ts: int | None = None
-                for j in range(i + 1, len(bars)):
-                    probe = bars.iloc[j]
-                    probe_close = float(probe["close"])
-                    probe_low = float(probe["low"])
-                    probe_ts = int(probe["timestamp"])
-                    if not mitigated and low <= probe_low <= high:
-                        mitigated = True
-                        mitigated_ts = probe_ts
-                    if probe_close < low:
-                        valid = False
-                        break
-                out.append(
-                    {
-                        "id": zone_id,
-                        "low": low,
-                        "high": high,
-                        "dir": "BULL",
-                        "valid": valid,
-                        "anchor_ts": int(cur_ts),
-                        "source": "classic_rjb",
-                    }
-                )
-                diagnostics.append(
-                    {
-                        "id": zone_id,
-                        "kind": "REJECTIONBLOCK",
-                        "mitigated": mitigated,
-                        "mitigated_ts": mitigated_ts,
-                        "invalidation_rule": "close_below_low",
-                        "left_anchor_ts": prev_ts,
-                        "variant": variant,
-                    }
-                )
+                zones.append((i, "BULL", low, high))
+                variants.append(variant)
 
         # Bearish RJB: up (trapped) then down (signal) closing below the trap.
         if _is_up(prev_open, prev_close) and _is_down(cur_open, cur_close) and cur_close < prev_low:
@@ -289,53 +222,46 @@ def detect_rejection_blocks_classic(
                 variant = "signal_wick"
                 low, high = cur_open, cur_high
             if variant is not None and high > low:
-                zone_id = ob_id(
-                    symbol=symbol_name,
-                    timeframe=tf,
-                    anchor_ts=cur_ts,
-                    direction="BEAR",
-                    low=low,
-                    high=high,
-                    ticksize=ticksize,
-                    asset_class=asset_class,
-                    session_tz=session_tz,
-                )
-                valid = True
-                mitigated = False
-                mitigated_ts = None
-                for j in range(i + 1, len(bars)):
-                    probe = bars.iloc[j]
-                    probe_close = float(probe["close"])
-                    probe_high = float(probe["high"])
-                    probe_ts = int(probe["timestamp"])
-                    if not mitigated and low <= probe_high <= high:
-                        mitigated = True
-                        mitigated_ts = probe_ts
-                    if probe_close > high:
-                        valid = False
-                        break
-                out.append(
-                    {
-                        "id": zone_id,
-                        "low": low,
-                        "high": high,
-                        "dir": "BEAR",
-                        "valid": valid,
-                        "anchor_ts": int(cur_ts),
-                        "source": "classic_rjb",
-                    }
-                )
-                diagnostics.append(
-                    {
-                        "id": zone_id,
-                        "kind": "REJECTIONBLOCK",
-                        "mitigated": mitigated,
-                        "mitigated_ts": mitigated_ts,
-                        "invalidation_rule": "close_above_high",
-                        "left_anchor_ts": prev_ts,
-                        "variant": variant,
-                    }
-                )
+                zones.append((i, "BEAR", low, high))
+                variants.append(variant)
+
+    engine = ZoneMitigationEngine(low_arr, high_arr, close_arr)
+    lifecycles = _resolve_zone_lifecycles(engine, ts_arr, zones)
+    for (i, direction, low, high), variant, (valid, mitigated, mitigated_ts) in zip(zones, variants, lifecycles):
+        cur_ts = float(ts_arr[i])
+        zone_id = ob_id(
+            symbol=symbol_name,
+            timeframe=tf,
+            anchor_ts=cur_ts,
+            direction=direction,
+            low=low,
+            high=high,
+            ticksize=ticksize,
+            asset_class=asset_class,
+            session_tz=session_tz,
+        )
+        out.append(
+            {
+                "id": zone_id,
+                "low": low,
+                "high": high,
+                "dir": direction,
+                "valid": valid,
+                "anchor_ts": int(cur_ts),
+                "source": "classic_rjb",
+            }
+        )
+        diagnostics.append(
+            {
+                "id": zone_id,
+                "kind": "REJECTIONBLOCK",
+                "mitigated": mitigated,
+                "mitigated_ts": mitigated_ts,
+                "invalidation_rule": _INVALIDATION_RULE[direction],
+                "left_anchor_ts": int(ts_arr[i - 1]),
+                "variant": variant,
+            }
+        )
 
     return _dedupe_by_id(out), diagnostics
 
@@ -356,115 +282,56 @@ def detect_fvg_classic(
     out: list[dict[str, Any]] = []
     diagnostics: list[dict[str, Any]] = []
 
-    for i in range(2, len(bars)):
-        b2 = bars.iloc[i - 2]
-        b0 = bars.iloc[i]
+    _open_arr, high_arr, low_arr, close_arr, ts_arr = _bar_columns(bars)
+    highs, lows = high_arr.tolist(), low_arr.tolist()
 
-        b2_high = float(b2["high"])
-        b2_low = float(b2["low"])
-        b0_high = float(b0["high"])
-        b0_low = float(b0["low"])
-        anchor_ts = float(b0["timestamp"])
+    zones: list[tuple[int, str, float, float]] = []
+    for i in range(2, len(bars)):
+        b2_high, b2_low = highs[i - 2], lows[i - 2]
+        b0_high, b0_low = highs[i], lows[i]
 
         if b0_low > b2_high:
-            low = b2_high
-            high = b0_low
-            zone_id = fvg_id(
-                symbol=symbol_name,
-                timeframe=tf,
-                anchor_ts=anchor_ts,
-                direction="BULL",
-                low=low,
-                high=high,
-                ticksize=ticksize,
-                asset_class=asset_class,
-                session_tz=session_tz,
-            )
-            mitigated = False
-            mitigated_ts: int | None = None
-            valid = True
-            for j in range(i + 1, len(bars)):
-                probe = bars.iloc[j]
-                probe_low = float(probe["low"])
-                probe_close = float(probe["close"])
-                probe_ts = int(probe["timestamp"])
-                if not mitigated and probe_low <= high and probe_low >= low:
-                    mitigated = True
-                    mitigated_ts = probe_ts
-                if probe_close < low:
-                    valid = False
-                    break
-            out.append(
-                {
-                    "id": zone_id,
-                    "low": low,
-                    "high": high,
-                    "dir": "BULL",
-                    "valid": valid,
-                    "anchor_ts": int(anchor_ts),
-                    "source": "classic_fvg",
-                }
-            )
-            diagnostics.append(
-                {
-                    "id": zone_id,
-                    "kind": "FVG",
-                    "mitigated": mitigated,
-                    "mitigated_ts": mitigated_ts,
-                    "is_structure_breaking": False,
-                    "break_reference": None,
-                }
-            )
+            zones.append((i, "BULL", b2_high, b0_low))
 
         if b0_high < b2_low:
-            low = b0_high
-            high = b2_low
-            zone_id = fvg_id(
-                symbol=symbol_name,
-                timeframe=tf,
-                anchor_ts=anchor_ts,
-                direction="BEAR",
-                low=low,
-                high=high,
-                ticksize=ticksize,
-                asset_class=asset_class,
-                session_tz=session_tz,
-            )
-            mitigated = False
-            mitigated_ts = None
-            valid = True
-            for j in range(i + 1, len(bars)):
-                probe = bars.iloc[j]
-                probe_high = float(probe["high"])
-                probe_close = float(probe["close"])
-                probe_ts = int(probe["timestamp"])
-                if not mitigated and probe_high >= low and probe_high <= high:
-                    mitigated = True
-                    mitigated_ts = probe_ts
-                if probe_close > high:
-                    valid = False
-                    break
-            out.append(
-                {
-                    "id": zone_id,
-                    "low": low,
-                    "high": high,
-                    "dir": "BEAR",
-                    "valid": valid,
-                    "anchor_ts": int(anchor_ts),
-                    "source": "classic_fvg",
-                }
-            )
-            diagnostics.append(
-                {
-                    "id": zone_id,
-                    "kind": "FVG",
-                    "mitigated": mitigated,
-                    "mitigated_ts": mitigated_ts,
-                    "is_structure_breaking": False,
-                    "break_reference": None,
-                }
-            )
+            zones.append((i, "BEAR", b0_high, b2_low))
+
+    engine = ZoneMitigationEngine(low_arr, high_arr, close_arr)
+    lifecycles = _resolve_zone_lifecycles(engine, ts_arr, zones)
+    for (i, direction, low, high), (valid, mitigated, mitigated_ts) in zip(zones, lifecycles):
+        anchor_ts = float(ts_arr[i])
+        zone_id = fvg_id(
+            symbol=symbol_name,
+            timeframe=tf,
+            anchor_ts=anchor_ts,
+            direction=direction,
+            low=low,
+            high=high,
+            ticksize=ticksize,
+            asset_class=asset_class,
+            session_tz=session_tz,
+        )
+        out.append(
+            {
+                "id": zone_id,
+                "low": low,
+                "high": high,
+                "dir": direction,
+                "valid": valid,
+                "anchor_ts": int(anchor_ts),
+                "source": "classic_fvg",
+            }
+        )
+        diagnostics.append(
+            {
+                "id": zone_id,
+                "kind": "FVG",
+                "mitigated": mitigated,
+                "mitigated_ts": mitigated_ts,
+                "is_structure_breaking": False,
+                "break_reference": None,
+            }
+        )
 
     return _dedupe_by_id(out), diagnostics
 
@@ -484,14 +351,24 @@ def detect_liquidity_lines_pivot3(
 
     out: list[dict[str, Any]] = []
 
-    for i in range(0, len(bars) - 2):
-        left = bars.iloc[i]
-        mid = bars.iloc[i + 1]
-        right = bars.iloc[i + 2]
-
-        if float(mid["high"]) > float(left["high"]) and float(mid["high"]) > float(right["high"]):
-            price = float(mid["high"])
-            ts = int(mid["timestamp"])
+    # Pivot masks are computed column-wise instead of three ``bars.iloc`` row
+    # lookups per bar; emission order (BUY_SIDE before SELL_SIDE per pivot bar)
+    # is unchanged.
+    _open_arr, high_arr, low_arr, _close_arr, ts_arr = _bar_columns(bars)
+    if len(bars) >= 3:
+        mid_high = high_arr[1:-1]
+        mid_low = low_arr[1:-1]
+        is_buy_side = (mid_high > high_arr[:-2]) & (mid_high > high_arr[2:])
+        is_sell_side = (mid_low < low_arr[:-2]) & (mid_low < low_arr[2:])
+        pivot_rows = np.flatnonzero(is_buy_side | is_sell_side).tolist()
+    else:
+        is_buy_side = is_sell_side = np.zeros(0, dtype=bool)
+        pivot_rows = []
+
+    for i in pivot_rows:
+        ts = int(ts_arr[i + 1])
+        if is_buy_side[i]:
+            price = float(high_arr[i + 1])
             out.append(
                 {
                     "id": liquidity_id(
@@ -513,9 +390,8 @@ def detect_liquidity_lines_pivot3(
                 }
             )
 
-        if float(mid["low"]) < float(left["low"]) and float(mid["low"]) < float(right["low"]):
-            price = float(mid["low"])
-            ts = int(mid["timestamp"])
+        if is_sell_side[i]:
+            price = float(low_arr[i + 1])
             out.append(
                 {
                     "id": liquidity_id(
@@ -43,6 +43,12 @@ def _build_parser() -> argparse.ArgumentParser:
             "auto-discovery (#2667)."
         ),
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for per-symbol artifact builds (default: 1, serial). Output is identical for any value.",
+    )
     return parser
 
 
@@ -57,6 +63,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         output_dir=Path(args.output_dir).expanduser(),
         export_bundle_root=Path(args.export_bundle_root).expanduser() if args.export_bundle_root else None,
         generated_at=args.generated_at,
+        max_workers=max(1, int(args.workers)),
     )
 
     print(json.dumps(manifest, indent=2, sort_keys=True))
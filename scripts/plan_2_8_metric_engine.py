@@ -0,0 +1,249 @@
+"""Plan 2.8 metric engine: refresh many ledger / weekly-summary metrics in one pass.
+
+Every ``scripts/plan_2_8_ledger_*.py`` and ``plan_2_8_weekly_summary_*.py``
+metric re-reads its input and (for the ledger) re-decodes every JSONL line
+to compute one statistic, so a full refresh repeats the same I/O and JSON
+decoding a few hundred times. This engine loads each input once into a
+``LedgerTable`` -- raw bytes, the ``Path.read_text`` view and the decoded
+record objects -- and runs each metric's own ``compute`` /
+``render_markdown`` as a reducer over that table. The per-metric output
+file is byte-identical to ``python scripts/<metric>.py --output ...``.
+
+Metrics register themselves by shape: a script qualifies when its ``main``
+is the standard ``--ledger|--summary`` + ``--format`` + ``--output``
+template calling ``compute(args.<input>)`` or ``compute(<parser>(args.ledger))``.
+Scripts with extra flags (thresholds, windows, exit gates) keep running
+standalone. Reducers share the decoded records and must not mutate them.
+
+Usage:
+    python scripts/plan_2_8_metric_engine.py \\
+        --ledger artifacts/plan_2_8_digest/state_ledger.jsonl \\
+        --summary artifacts/plan_2_8_digest/weekly_summary.md \\
+        --output-dir artifacts/plan_2_8_digest [--format md] [--metric ledger_green_ratio ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import importlib
+import io
+import json
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+from scripts._logging_init import init_cli_logging
+from scripts.smc_atomic_write import atomic_write_text
+
+MetricSource = Literal["ledger", "summary"]
+MetricInput = Literal["records", "path"]
+
+_SCRIPTS_DIR = Path(__file__).resolve().parent
+_SCRIPT_PREFIXES: dict[str, MetricSource] = {
+    "plan_2_8_ledger_": "ledger",
+    "plan_2_8_weekly_summary_": "summary",
+}
+
+
+@dataclass(frozen=True)
+class LedgerTable:
+    """One input file read and decoded once, shared by every reducer."""
+
+    path: Path
+    data: bytes
+    text: str
+    records: tuple[dict[str, Any], ...]
+
+    @classmethod
+    def load(cls, path: Path) -> LedgerTable:
+        data = path.read_bytes()
+        # Same decode + universal-newline translation as ``Path.read_text``.
+        text = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8").read()
+        return cls(path=path, data=data, text=text, records=tuple(_decode_records(text)))
+
+    def snapshot_path(self) -> _SnapshotPath:
+        return _SnapshotPath(self.path, table=self)
+
+
+class _SnapshotPath(Path):
+    """``Path`` whose ``read_text`` / ``read_bytes`` are served from a ``LedgerTable``."""
+
+    def __init__(self, *args: Any, table: LedgerTable | None = None) -> None:
+        super().__init__(*args)
+        self._table = table
+
+    def read_bytes(self) -> bytes:
+        if self._table is None:
+            return super().read_bytes()
+        return self._table.data
+
+    def read_text(self, encoding: str | None = None, errors: str | None = None, newline: str | None = None) -> str:
+        if self._table is None or encoding != "utf-8" or errors is not None or newline is not None:
+            return super().read_text(encoding=encoding, errors=errors, newline=newline)
+        return self._table.text
+
+
+def _decode_records(text: str) -> Iterable[dict[str, Any]]:
+    # Mirrors the ``_iter`` / ``_iter_records`` / ``read_ledger`` helper
+    # every ledger metric script carries.
+    for line in text.splitlines():
+        s = line.strip()
+        if not s:
+            continue
+        try:
+            obj = json.loads(s)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(obj, dict):
+            yield obj
+
+
+@dataclass(frozen=True)
+class MetricSpec:
+    """A metric script the engine can run as a reducer over a ``LedgerTable``."""
+
+    name: str
+    module: str
+    source: MetricSource
+    input: MetricInput
+
+    def reduce(self, table: LedgerTable) -> dict[str, Any]:
+        mod = importlib.import_module(self.module)
+        if self.input == "records":
+            return mod.compute(list(table.records))
+        return mod.compute(table.snapshot_path())
+
+    def render(self, table: LedgerTable, fmt: str) -> str:
+        report = self.reduce(table)
+        if fmt == "md":
+            return importlib.import_module(self.module).render_markdown(report)
+        return json.dumps(report, indent=2) + "\n"
+
+
+def _metric_name(stem: str, source: MetricSource) -> str:
+    # Matches the artifact names the weekly digest workflow uses
+    # (``ledger_<metric>.md`` / ``summary_<metric>.md``).
+    if source == "ledger":
+        return stem.removeprefix("plan_2_8_")
+    return "summary_" + stem.removeprefix("plan_2_8_weekly_summary_")
+
+
+def _classify_main(tree: ast.Module, source: MetricSource) -> MetricInput | None:
+    functions = {node.name: node for node in tree.body if isinstance(node, ast.FunctionDef)}
+    main = functions.get("main")
+    if main is None or "compute" not in functions or "render_markdown" not in functions:
+        return None
+    flags: set[str] = set()
+    compute_calls: list[ast.Call] = []
+    ifs = 0
+    for node in ast.walk(main):
+        if isinstance(node, ast.If):
+            ifs += 1
+        if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Attribute | ast.Name):
+            continue
+        if isinstance(node.func, ast.Attribute) and node.func.attr == "add_argument":
+            flags.update(arg.value for arg in node.args if isinstance(arg, ast.Constant))
+        if isinstance(node.func, ast.Name) and node.func.id == "compute":
+            compute_calls.append(node)
+    # Only the ``input missing`` and ``--output`` branches are allowed;
+    # anything else (exit gates, extra flags) changes the script's contract.
+    if flags != {f"--{source}", "--format", "--output"} or ifs != 2 or len(compute_calls) != 1:
+        return None
+    call = compute_calls[0]
+    if len(call.args) != 1 or call.keywords:
+        return None
+    arg = call.args[0]
+    if isinstance(arg, ast.Attribute) and arg.attr == source:
+        return "path"
+    if (
+        source == "ledger"
+        and isinstance(arg, ast.Call)
+        and isinstance(arg.func, ast.Name)
+        and arg.func.id in functions
+        and len(arg.args) == 1
+        and isinstance(arg.args[0], ast.Attribute)
+        and arg.args[0].attr == "ledger"
+    ):
+        return "records"
+    return None
+
+
+def discover_metrics(scripts_dir: Path = _SCRIPTS_DIR) -> dict[str, MetricSpec]:
+    """Return every engine-compatible metric script keyed by metric name."""
+    specs: dict[str, MetricSpec] = {}
+    for prefix, source in _SCRIPT_PREFIXES.items():
+        for path in sorted(scripts_dir.glob(f"{prefix}*.py")):
+            tree = ast.parse(path.read_text(encoding="utf-8"))
+            metric_input = _classify_main(tree, source)
+            if metric_input is None:
+                continue
+            name = _metric_name(path.stem, source)
+            specs[name] = MetricSpec(name=name, module=f"scripts.{path.stem}", source=source, input=metric_input)
+    return specs
+
+
+def run_metrics(
+    specs: Iterable[MetricSpec],
+    *,
+    inputs: dict[MetricSource, Path | None],
+    output_dir: Path,
+    fmt: str = "md",
+) -> dict[str, Path]:
+    """Load each input once, run every metric over it and write its output file."""
+    tables: dict[MetricSource, LedgerTable] = {}
+    written: dict[str, Path] = {}
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for spec in specs:
+        table = tables.get(spec.source)
+        if table is None:
+            path = inputs.get(spec.source)
+            if path is None or not path.exists():
+                continue
+            table = tables[spec.source] = LedgerTable.load(path)
+        target = output_dir / f"{spec.name}.{fmt}"
+        atomic_write_text(spec.render(table, fmt), target)
+        written[spec.name] = target
+    return written
+
+
+def main(argv: list[str] | None = None) -> int:
+    init_cli_logging()
+    parser = argparse.ArgumentParser(description="Refresh Plan 2.8 ledger / weekly-summary metrics in one pass.")
+    parser.add_argument("--ledger", type=Path, default=None)
+    parser.add_argument("--summary", type=Path, default=None)
+    parser.add_argument("--output-dir", type=Path, required=True)
+    parser.add_argument("--format", choices=("md", "json"), default="md")
+    parser.add_argument(
+        "--metric", action="append", default=None,
+        help="Metric name (e.g. ledger_green_ratio); repeatable. Default: all.",
+    )
+    parser.add_argument("--list", action="store_true", help="Print the registered metric names and exit.")
+    args = parser.parse_args(argv)
+
+    registry = discover_metrics()
+    if args.list:
+        print("\n".join(sorted(registry)))
+        return 0
+    unknown = sorted(set(args.metric or ()) - set(registry))
+    if unknown:
+        print(f"ERROR: unknown metric(s): {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    selected = [registry[name] for name in (args.metric or sorted(registry))]
+    inputs: dict[MetricSource, Path | None] = {"ledger": args.ledger, "summary": args.summary}
+    missing = sorted(
+        {spec.source for spec in selected}
+        - {source for source, path in inputs.items() if path is not None and path.exists()}
+    )
+    for source in missing:
+        print(f"ERROR: {source} not found: {inputs[source]}", file=sys.stderr)
+
+    written = run_metrics(selected, inputs=inputs, output_dir=args.output_dir, fmt=args.format)
+    print(f"wrote {len(written)} metric file(s) to {args.output_dir}")
+    return 1 if missing else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,179 @@
+"""Profile the import cost of the Streamlit / CLI entry modules.
+
+Imports each entry module in a fresh interpreter under ``-X importtime``
+and turns the per-module timings CPython writes to stderr into a report:
+total import time, the slowest modules by self time, the time per
+top-level package, and which of ``HEAVY_MODULES`` the import loaded.
+
+``STARTUP_IMPORT_BUDGET`` is the heavy-module budget per entry module: a
+heavy module not listed for the entry is reported under ``over_budget``
+(and fails ``--check``). Provider libraries belong behind
+``lazy_imports.lazy_module`` / a PEP 562 package facade, not in the budget.
+
+Entry modules are imported with ``_SMC_TERMINAL_TEST_MODE=1`` so the
+terminal skips its ``.env`` / secrets bootstrap and no credentials or
+network are touched.
+
+Usage:
+    python -m scripts.profile_startup_imports                          # all entry modules
+    python -m scripts.profile_startup_imports streamlit_terminal --top 40
+    python -m scripts.profile_startup_imports --check --output artifacts/startup_imports.json
+
+Prints a JSON report to stdout. Dev-only; not wired into CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+from scripts.smc_atomic_write import atomic_write_json
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules whose import alone costs a noticeable share of a cold start.
+HEAVY_MODULES: frozenset[str] = frozenset(
+    {
+        "altair",
+        "bs4",
+        "curl_cffi",
+        "databento",
+        "numpy",
+        "openpyxl",
+        "pandas",
+        "plotly",
+        "pyarrow",
+        "requests",
+        "scipy",
+        "scripts.databento_production_workbook",
+        "smc_integration.service",
+        "streamlit",
+        "tradingview_ta",
+        "websockets",
+        "yfinance",
+    }
+)
+
+# Heavy modules each entry module may load when it is imported.
+STARTUP_IMPORT_BUDGET: dict[str, frozenset[str]] = {
+    "databento_volatility_screener": frozenset({"numpy", "pandas", "pyarrow"}),
+    "streamlit_databento_volatility_screener": frozenset({"numpy", "pandas", "pyarrow"}),
+    "streamlit_terminal": frozenset({"numpy", "pandas", "pyarrow"}),
+}
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$")
+_TIMEOUT_SECONDS = 120.0
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass(frozen=True)
+class StartupProfile:
+    entry: str
+    timings: tuple[ImportTiming, ...]
+
+    @property
+    def total_us(self) -> int:
+        return sum(timing.self_us for timing in self.timings)
+
+    @property
+    def modules(self) -> frozenset[str]:
+        return frozenset(timing.module for timing in self.timings)
+
+    @property
+    def heavy_loaded(self) -> frozenset[str]:
+        return HEAVY_MODULES & self.modules
+
+    @property
+    def over_budget(self) -> frozenset[str]:
+        return self.heavy_loaded - STARTUP_IMPORT_BUDGET.get(self.entry, frozenset())
+
+    def by_package(self) -> dict[str, int]:
+        totals: dict[str, int] = defaultdict(int)
+        for timing in self.timings:
+            totals[timing.module.partition(".")[0]] += timing.self_us
+        return dict(totals)
+
+    def to_report(self, top: int = 25) -> dict[str, object]:
+        def _ms(us: int) -> float:
+            return round(us / 1000.0, 1)
+
+        slowest = sorted(self.timings, key=lambda timing: timing.self_us, reverse=True)[:top]
+        packages = sorted(self.by_package().items(), key=lambda item: item[1], reverse=True)[:top]
+        return {
+            "total_ms": _ms(self.total_us),
+            "modules_imported": len(self.timings),
+            "heavy_loaded": sorted(self.heavy_loaded),
+            "over_budget": sorted(self.over_budget),
+            "top_self_ms": {timing.module: _ms(timing.self_us) for timing in slowest},
+            "top_packages_ms": {package: _ms(us) for package, us in packages},
+        }
+
+
+def parse_importtime(stderr: str) -> tuple[ImportTiming, ...]:
+    """Parse the ``import time: self | cumulative | name`` lines ``-X importtime`` writes."""
+    timings: list[ImportTiming] = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        timings.append(ImportTiming(module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return tuple(timings)
+
+
+def profile_import(entry: str, *, python: str = sys.executable) -> StartupProfile:
+    """Import ``entry`` in a fresh interpreter under ``-X importtime``."""
+    env = {**os.environ, "_SMC_TERMINAL_TEST_MODE": "1"}
+    completed = subprocess.run(  # noqa: S603 -- fixed argv around a module name, no shell
+        [python, "-X", "importtime", "-c", f"import {entry}"],
+        cwd=_REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=_TIMEOUT_SECONDS,
+        check=False,
+    )
+    if completed.returncode != 0:
+        tail = "\n".join(line for line in completed.stderr.splitlines() if not line.startswith("import time:"))
+        raise RuntimeError(f"importing {entry} failed (exit {completed.returncode}):\n{tail[-2000:]}")
+    return StartupProfile(entry, parse_importtime(completed.stderr))
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "entries", nargs="*", default=sorted(STARTUP_IMPORT_BUDGET), help="entry modules (default: all budgeted)"
+    )
+    parser.add_argument("--top", type=int, default=25, help="modules / packages listed per entry (default: 25)")
+    parser.add_argument("--output", type=Path, default=None, help="also write the JSON report to this path")
+    parser.add_argument("--check", action="store_true", help="exit 1 when an entry loads heavy modules over budget")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    report = {entry: profile_import(entry).to_report(args.top) for entry in args.entries}
+    print(json.dumps(report, indent=2))
+    if args.output is not None:
+        atomic_write_json(report, args.output)
+    if args.check and any(entry_report["over_budget"] for entry_report in report.values()):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
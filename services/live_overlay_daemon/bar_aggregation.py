@@ -0,0 +1,307 @@
+"""
+Multi-timeframe bar bucketing shared by cache.py and compute.py.
+
+Leaf module (stdlib only, no package imports) so the bar cache can own an
+incremental aggregator without importing compute.py, which itself imports
+the cache.
+
+Design notes:
+  - ``_fold_values_into_bucket`` is the single definition of how a 1-minute
+    bar folds into a higher-timeframe bucket. The from-scratch
+    ``compute._aggregate_bars`` reaches it through ``_fold_bar_into_bucket``
+    and the rolling ``RollingBarAggregator`` with values coerced once per
+    bar, so the two paths cannot drift apart.
+  - ``RollingBarAggregator`` mirrors one symbol's 1-minute window (a deque
+    or cache.py's bar ring). A push updates the open bucket of every
+    timeframe in O(1); only a bucket that lost a member to window eviction
+    (high/low are not invertible) or received an out-of-order bar is
+    re-folded, lazily on the next read and from its own members only.
+    Finalized buckets keep their emitted row between reads.
+  - The window evicts in arrival order, so the evicted bar is always the
+    oldest arrival of its buckets and is removed from the front of their
+    member lists; it only has to carry its ``ts_event``.
+  - Not thread-safe on its own: cache.py calls it under the owning stripe
+    lock.
+"""
+from __future__ import annotations
+
+import math
+from collections import deque
+from collections.abc import Iterable
+from typing import Any
+
+_TF_TO_MINUTES: dict[str, int] = {
+    "5m": 5,
+    "10m": 10,
+    "15m": 15,
+    "30m": 30,
+    "1H": 60,
+    "4H": 240,
+}
+
+
+def _coerce_finite_float(v: Any) -> float | None:
+    """Coerce value to finite float, returning None on invalid/non-finite input."""
+    if v is None:
+        return None
+    # bool is a subclass of int in Python, but True/False in OHLC/volume fields
+    # indicates malformed provider data and must not be interpreted as 1.0/0.0.
+    if isinstance(v, bool):
+        return None
+    try:
+        coerced = float(v)
+    except (TypeError, ValueError):
+        return None
+    if not math.isfinite(coerced):
+        return None
+    return coerced
+
+
+def _coerce_volume(v: Any) -> float | None:
+    """Coerce a volume field value to float, returning None on failure.
+
+    Accepts int, float, and numeric strings (e.g. '100' from schema drift).
+    Returns None for None, empty string, negative values, non-finite values
+    (NaN/Inf), or
+    any non-numeric value so that
+    callers can safely skip the bar instead of crashing.
+    """
+    coerced = _coerce_finite_float(v)
+    if coerced is None:
+        return None
+    if coerced < 0:
+        return None
+    return coerced
+
+
+def _valid_ts_event(bar: dict[str, Any]) -> int | None:
+    """Return the bar's ``ts_event`` when it is a positive int, else None."""
+    ts = bar.get("ts_event")
+    if isinstance(ts, int) and not isinstance(ts, bool) and ts > 0:
+        return ts
+    return None
+
+
+def _bar_minute_bucket(ts_event: int, minutes: int) -> int:
+    """Return the bucket-end timestamp (nanoseconds) for a bar.
+
+    Databento ts_event is in nanoseconds since the Unix epoch. We align
+    to the end of the N-minute bucket in UTC. Intraday timeframes only.
+
+    For bar-close stamps, events between boundaries are ceiled to the next
+    boundary while events already on a boundary remain unchanged.
+    """
+    ns_per_minute = 60_000_000_000
+    minute = ts_event // ns_per_minute
+    floored_minute = (minute // minutes) * minutes
+    aligned_minute = floored_minute if minute == floored_minute else floored_minute + minutes
+    return aligned_minute * ns_per_minute
+
+
+def _new_bucket(bucket_ts: int) -> dict[str, Any]:
+    return {
+        "open": None,
+        "high": None,
+        "low": None,
+        "close": None,
+        "volume": None,
+        "ts_event": bucket_ts,
+        "_first_ts": None,
+        "_last_ts": None,
+    }
+
+
+_BarValues = tuple[float | None, float | None, float | None, float | None, float | None]
+
+
+def _bar_values(bar: dict[str, Any]) -> _BarValues:
+    """Return a bar's coerced (open, high, low, close, volume)."""
+    return (
+        _coerce_finite_float(bar.get("open")),
+        _coerce_finite_float(bar.get("high")),
+        _coerce_finite_float(bar.get("low")),
+        _coerce_finite_float(bar.get("close")),
+        _coerce_volume(bar.get("volume")),
+    )
+
+
+def _fold_bar_into_bucket(bucket: dict[str, Any], bar: dict[str, Any], ts_event: int) -> None:
+    """Fold one 1-minute bar into an aggregate bucket (bars in ts order)."""
+    _fold_values_into_bucket(bucket, _bar_values(bar), ts_event)
+
+
+def _fold_values_into_bucket(bucket: dict[str, Any], values: _BarValues, ts_event: int) -> None:
+    """Fold one bar's ``_bar_values`` into an aggregate bucket (bars in ts order)."""
+    open_, high, low, close, volume = values
+    if open_ is not None and (bucket["_first_ts"] is None or ts_event < bucket["_first_ts"]):
+        bucket["open"] = open_
+        bucket["_first_ts"] = ts_event
+    if high is not None:
+        bucket["high"] = high if bucket["high"] is None else max(bucket["high"], high)
+    if low is not None:
+        bucket["low"] = low if bucket["low"] is None else min(bucket["low"], low)
+    if close is not None and (bucket["_last_ts"] is None or ts_event >= bucket["_last_ts"]):
+        bucket["close"] = close
+        bucket["_last_ts"] = ts_event
+    if volume is not None:
+        bucket["volume"] = volume if bucket["volume"] is None else bucket["volume"] + volume
+
+
+def _bucket_row(bucket: dict[str, Any]) -> dict[str, Any]:
+    """Return the public aggregated-bar view of a bucket (drops bookkeeping keys)."""
+    return {
+        "open": bucket["open"],
+        "high": bucket["high"],
+        "low": bucket["low"],
+        "close": bucket["close"],
+        "volume": bucket["volume"],
+        "ts_event": bucket["ts_event"],
+    }
+
+
+class _RollingBucket:
+    """One higher-timeframe bucket plus the 1-minute bars currently inside it.
+
+    Members are kept as ``(ts_event, _bar_values)`` so neither the running
+    fold nor a refold coerces the bar fields again.
+    """
+
+    __slots__ = ("max_ts", "members", "needs_refold", "row", "state")
+
+    def __init__(self, bucket_ts: int) -> None:
+        self.state = _new_bucket(bucket_ts)
+        self.members: deque[tuple[int, _BarValues]] = deque()
+        self.max_ts = 0
+        self.needs_refold = False
+        self.row: dict[str, Any] | None = None
+
+    def add(self, ts_event: int, values: _BarValues) -> None:
+        self.members.append((ts_event, values))
+        self.row = None
+        if ts_event < self.max_ts:
+            # Out-of-order arrival: the from-scratch path folds in ts order,
+            # so the running fold is no longer equivalent.
+            self.needs_refold = True
+        self.max_ts = max(self.max_ts, ts_event)
+        if not self.needs_refold:
+            _fold_values_into_bucket(self.state, values, ts_event)
+
+    def remove_oldest(self) -> None:
+        self.members.popleft()
+        self.row = None
+        self.needs_refold = True
+
+    def current_row(self) -> dict[str, Any] | None:
+        """Return the emitted aggregate, or None when the bucket has no close."""
+        if self.needs_refold:
+            self.state = _new_bucket(self.state["ts_event"])
+            self.max_ts = 0
+            # sorted() is stable, so equal timestamps keep arrival order exactly
+            # like the global stable sort in compute._aggregate_bars.
+            for ts_event, values in sorted(self.members, key=lambda member: member[0]):
+                _fold_values_into_bucket(self.state, values, ts_event)
+                self.max_ts = max(self.max_ts, ts_event)
+            self.needs_refold = False
+        if self.state["close"] is None:
+            return None
+        if self.row is None:
+            self.row = _bucket_row(self.state)
+        return self.row
+
+
+class RollingBarAggregator:
+    """Incremental multi-timeframe view over one symbol's 1-minute bar window.
+
+    ``timeframe_bars(tf)`` returns exactly what
+    ``compute._bars_for_timeframe(list(source), tf)`` would return for the
+    current window contents, without re-sorting or re-bucketing the window.
+    ``source`` is any re-iterable window that evicts oldest-first.
+    """
+
+    def __init__(self, source: Iterable[dict[str, Any]], timeframes: Iterable[str] = tuple(_TF_TO_MINUTES)) -> None:
+        self.source = source
+        self._minutes = {tf: _TF_TO_MINUTES[tf] for tf in timeframes}
+        self._buckets: dict[str, dict[int, _RollingBucket]] = {tf: {} for tf in self._minutes}
+        self._unordered: set[str] = set()
+        self._snapshots: dict[str, list[dict[str, Any]]] = {}
+        self.valid_ts_count = 0
+        for bar in source:
+            self._add(bar)
+
+    def push(self, bar: dict[str, Any], evicted: dict[str, Any] | None = None) -> None:
+        """Apply one window append (and the bar it pushed out, if any)."""
+        if evicted is not None:
+            self._remove(evicted)
+        self._add(bar)
+
+    def _add(self, bar: dict[str, Any]) -> None:
+        ts_event = _valid_ts_event(bar)
+        if ts_event is None:
+            return
+        self.valid_ts_count += 1
+        values = _bar_values(bar)
+        for tf, minutes in self._minutes.items():
+            buckets = self._buckets[tf]
+            bucket_ts = _bar_minute_bucket(ts_event, minutes)
+            bucket = buckets.get(bucket_ts)
+            if bucket is None:
+                if buckets and bucket_ts < next(reversed(buckets)):
+                    self._unordered.add(tf)
+                bucket = _RollingBucket(bucket_ts)
+                buckets[bucket_ts] = bucket
+            bucket.add(ts_event, values)
+            self._snapshots.pop(tf, None)
+
+    def _remove(self, bar: dict[str, Any]) -> None:
+        ts_event = _valid_ts_event(bar)
+        if ts_event is None:
+            return
+        self.valid_ts_count -= 1
+        for tf, minutes in self._minutes.items():
+            buckets = self._buckets[tf]
+            bucket_ts = _bar_minute_bucket(ts_event, minutes)
+            bucket = buckets.get(bucket_ts)
+            if bucket is None:
+                continue
+            bucket.remove_oldest()
+            if not bucket.members:
+                del buckets[bucket_ts]
+            self._snapshots.pop(tf, None)
+
+    def _ordered_buckets(self, tf: str) -> dict[int, _RollingBucket]:
+        buckets = self._buckets[tf]
+        if tf in self._unordered:
+            buckets = dict(sorted(buckets.items()))
+            self._buckets[tf] = buckets
+            self._unordered.discard(tf)
+        return buckets
+
+    def aggregated(self, tf: str) -> list[dict[str, Any]]:
+        """Return aggregated bars for ``tf`` in bucket order (fresh dict copies)."""
+        if tf not in self._minutes:
+            raise ValueError(f"unsupported timeframe: {tf}")
+        snapshot = self._snapshots.get(tf)
+        if snapshot is None:
+            snapshot = [
+                row
+                for bucket in self._ordered_buckets(tf).values()
+                if (row := bucket.current_row()) is not None
+            ]
+            self._snapshots[tf] = snapshot
+        return [dict(row) for row in snapshot]
+
+    def timeframe_bars(self, tf: str) -> list[dict[str, Any]]:
+        """Aggregated bars, with the raw-bar fallback of ``_bars_for_timeframe``."""
+        aggregated = self.aggregated(tf)
+        if aggregated:
+            return aggregated
+        return [] if self.valid_ts_count else list(self.source)
+
+    def latest_ts_event(self) -> int | None:
+        """Newest valid ``ts_event`` in the window, or None when there is none."""
+        if not self.valid_ts_count:
+            return None
+        tf = next(iter(self._minutes))
+        buckets = self._ordered_buckets(tf)
+        last_bucket = buckets[next(reversed(buckets))]
+        return max(ts_event for ts_event, _bar in last_bucket.members)
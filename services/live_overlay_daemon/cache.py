@@ -2,140 +2,535 @@
 Thread-safe bar accumulator and overlay field cache.
 
 Design notes:
-  - A single module-level RWLock-style design would be simpler, but Python's
-    threading.Lock is sufficient here because the read path (HTTP requests)
-    is fast (dict lookup) and the write path (bar append) holds the lock for
-    microseconds.
   - Per user memory (concurrency-shared-mutables.md): module-level mutable
     dicts that are touched from background threads MUST be guarded by a Lock.
-  - Snapshot reads must return a defensive copy under the lock.
+  - The bar cache is split into ``_BAR_SHARDS`` lock stripes keyed by symbol
+    hash, so the ingest thread, the compute loops and the HTTP handlers only
+    contend when they touch symbols of the same stripe.
+  - Each symbol's 1-minute bars live in a fixed-capacity numpy ring
+    (``_BarRing``): one float64 row of open/high/low/close/volume (NaN =
+    missing) plus an int64 ``ts_event`` (0 = missing) per bar, normalized on
+    push with the bar_aggregation coercion helpers. Writers hold the stripe
+    lock; readers copy the ring without any lock and retry when its
+    seqlock-style ``version`` shows a concurrent write, so snapshots are
+    consistent copy-on-read views and the bar dicts are rebuilt outside any
+    lock.
+  - Each ring is mirrored by a RollingBarAggregator (see bar_aggregation.py)
+    updated inside push_bar / push_bars, so compute cycles and the on-demand endpoint
+    read higher-timeframe bars without re-bucketing the whole window on every
+    call. Aggregator reads take the stripe lock (the aggregator refolds
+    lazily).
+  - Symbol insertion and eviction are serialized by ``_evict_lock``, which
+    owns a last-update min-heap with lazy deletion: an entry whose symbol was
+    updated since it was pushed is re-pushed with the newer time instead of
+    evicted, so push_bar never touches the heap and evicting k symbols costs
+    O(k log n) amortized instead of a sort of every symbol.
+  - ``push_bars`` applies an ingest batch stripe by stripe, taking each
+    stripe lock once per batch instead of once per bar; only symbols that
+    are not cached yet go through the ``_evict_lock`` insertion path.
+  - A ring's ``version`` doubles as its dirty mark: the full compute cycle
+    passes the versions it last computed to get_dirty_timeframe_snapshots()
+    and only re-aggregates symbols whose version moved.
+  - Lock order: ``_evict_lock`` before any stripe lock, never the reverse.
+  - Snapshot reads return defensive copies.
 """
 from __future__ import annotations
 
 import copy
+import heapq
+import itertools
 import logging
 import math
 import threading
 import time
-from collections import deque
-from typing import Any
+from collections.abc import Iterable, Iterator
+from typing import Any, NamedTuple
+
+import numpy as np
+
+from .bar_aggregation import RollingBarAggregator, _coerce_finite_float, _coerce_volume, _valid_ts_event
 
 logger = logging.getLogger(__name__)
 
-# BarCache: symbol → deque of bar dicts (OHLCV), capped at rolling_bars
-_bar_lock = threading.Lock()
-_bars: dict[str, deque[dict[str, Any]]] = {}
-_bar_last_update: dict[str, float] = {}  # symbol → monotonic timestamp of last push
-_rolling_bars_cap: int = 60  # set by feed.py on init
-_max_symbols: int = 2000  # configurable via init_bar_cache()
-_last_eviction_at: float = 0.0  # monotonic ts of last eviction pass (L5)
+_BAR_SHARDS = 16  # lock stripes of the bar cache
+_SNAPSHOT_RETRIES = 8  # lock-free copy attempts before a reader takes the stripe lock
 _EVICT_INTERVAL_SECS: float = 60.0  # periodic eviction interval
+_MAX_TS_EVENT = int(np.iinfo(np.int64).max)
+
+# Global write sequence: every ring write (and every overlay set / patch)
+# takes the next number, so a version never repeats across eviction /
+# re-init of the same symbol.
+_write_seq = itertools.count(1)
 
 # OverlayCache: symbol → overlay payload dict (pre-computed)
 _overlay_lock = threading.Lock()
 _overlay: dict[str, dict[str, Any]] = {}
 _overlay_computed_at: float = 0.0
+# symbol → version of its overlay payload; a new one on every set / patch
+_overlay_versions: dict[str, int] = {}
 
 # VIX level (updated separately since it's a single value)
 _vix_lock = threading.Lock()
 _vix_level: float | None = None
 
 
+class BarArrays(NamedTuple):
+    """Read-only copy of one symbol's bar window, oldest bar first.
+
+    ``values`` columns are open, high, low, close, volume (NaN = missing);
+    ``ts_event`` is 0 where the bar had no valid timestamp. ``version``
+    changes with every push to the symbol and is never reused, so callers
+    can skip recomputation when it has not moved.
+    """
+
+    values: np.ndarray
+    ts_event: np.ndarray
+    version: int
+
+
+class _BarRing:
+    """Fixed-capacity ring of one symbol's normalized 1-minute bars.
+
+    Written only under the owning stripe lock. ``version`` is odd while a
+    write is in progress; lock-free readers retry until they copied the ring
+    between two reads of the same even version.
+    """
+
+    __slots__ = ("capacity", "count", "start", "ts", "values", "version")
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.values = np.full((capacity, 5), np.nan)
+        self.ts = np.zeros(capacity, dtype=np.int64)
+        self.start = 0
+        self.count = 0
+        self.version = 2 * next(_write_seq)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        values, ts = self._ordered()
+        return iter(_to_bar_dicts(values, ts))
+
+    @property
+    def full(self) -> bool:
+        return self.count == self.capacity
+
+    def oldest_ts_event(self) -> int:
+        return int(self.ts[self.start])
+
+    def append(self, bar: dict[str, Any]) -> None:
+        """Store a normalized bar (see ``_normalize_bar``), overwriting the oldest when full."""
+        if not self.capacity:
+            return
+        seq = next(_write_seq)
+        self.version = 2 * seq - 1
+        if self.count < self.capacity:
+            slot = (self.start + self.count) % self.capacity
+            self.count += 1
+        else:
+            slot = self.start
+            self.start = (self.start + 1) % self.capacity
+        # numpy stores the None of a missing field as NaN.
+        self.values[slot] = (bar["open"], bar["high"], bar["low"], bar["close"], bar["volume"])
+        self.ts[slot] = bar["ts_event"] or 0
+        self.version = 2 * seq
+
+    def resized(self, capacity: int) -> _BarRing:
+        """Return a new ring of ``capacity`` holding the newest bars of this one."""
+        ring = _BarRing(capacity)
+        values, ts = self._ordered()
+        keep = min(len(ts), capacity)
+        if keep:
+            ring.values[:keep] = values[len(ts) - keep :]
+            ring.ts[:keep] = ts[len(ts) - keep :]
+            ring.count = keep
+        return ring
+
+    def _ordered(self) -> tuple[np.ndarray, np.ndarray]:
+        """Copy the bars oldest-first. Caller holds the stripe lock or validates ``version``."""
+        start, end = self.start, self.start + self.count
+        if end <= self.capacity:
+            return self.values[start:end].copy(), self.ts[start:end].copy()
+        end -= self.capacity
+        return (
+            np.concatenate((self.values[start:], self.values[:end])),
+            np.concatenate((self.ts[start:], self.ts[:end])),
+        )
+
+    def snapshot(self, lock: threading.Lock) -> BarArrays:
+        """Copy the ring without the stripe lock; fall back to it behind a writer."""
+        for _ in range(_SNAPSHOT_RETRIES):
+            version = self.version
+            if version % 2:
+                break  # a write is in progress; wait for it on the stripe lock
+            values, ts = self._ordered()
+            if self.version == version:
+                return _read_only(values, ts, version)
+        with lock:
+            values, ts = self._ordered()
+            return _read_only(values, ts, self.version)
+
+
+class _SymbolBars:
+    """One symbol's ring, the aggregator mirroring it and its last push time."""
+
+    __slots__ = ("aggregator", "last_update", "ring")
+
+    def __init__(self, ring: _BarRing, last_update: float) -> None:
+        self.ring = ring
+        self.last_update = last_update
+        self.aggregator = RollingBarAggregator(ring)
+
+    def append(self, bar: dict[str, Any], now: float) -> None:
+        ring = self.ring
+        self.last_update = now
+        if not ring.capacity:
+            return
+        evicted = {"ts_event": ring.oldest_ts_event()} if ring.full else None
+        ring.append(bar)
+        self.aggregator.push(bar, evicted)
+
+    def resize(self, capacity: int) -> None:
+        if capacity != self.ring.capacity:
+            self.ring = self.ring.resized(capacity)
+            # The aggregator mirrors the replaced ring; rebuild it from it.
+            self.aggregator = RollingBarAggregator(self.ring)
+
+
+class _BarShard:
+    __slots__ = ("lock", "symbols")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.symbols: dict[str, _SymbolBars] = {}
+
+
+class _BarCacheState:
+    """Capacity settings and eviction bookkeeping. Guarded by ``_evict_lock``."""
+
+    __slots__ = ("heap", "last_eviction_at", "max_symbols", "rolling_bars_cap", "symbol_count")
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.rolling_bars_cap = 60  # set by feed.py on init
+        self.max_symbols = 2000  # configurable via init_bar_cache()
+        self.last_eviction_at = 0.0  # monotonic ts of last eviction pass (L5)
+        self.symbol_count = 0
+        # (last_update, symbol), one entry per cached symbol; the time may lag
+        # the symbol's real last_update (lazy deletion, see design notes).
+        self.heap: list[tuple[float, str]] = []
+
+
+_evict_lock = threading.Lock()
+_bar_state = _BarCacheState()
+_bar_shards: tuple[_BarShard, ...] = tuple(_BarShard() for _ in range(_BAR_SHARDS))
+
+
 # ---------------------------------------------------------------------------
 # Bar cache API
 # ---------------------------------------------------------------------------
 
 def init_bar_cache(rolling_bars: int, *, max_symbols: int = 2000) -> None:
-    global _rolling_bars_cap, _max_symbols
     if max_symbols < 1:
         raise ValueError(f"max_symbols must be >= 1, got {max_symbols}")
-    with _bar_lock:
-        _rolling_bars_cap = rolling_bars
-        _max_symbols = max_symbols
-        # Apply updated rolling cap to existing symbol deques as well, so a
+    with _evict_lock:
+        _bar_state.rolling_bars_cap = rolling_bars
+        _bar_state.max_symbols = max_symbols
+        # Apply updated rolling cap to existing symbol rings as well, so a
         # runtime reconfiguration is reflected immediately for already-tracked
         # symbols.
-        if _bars:
-            for sym, dq in list(_bars.items()):
-                _bars[sym] = deque(dq, maxlen=_rolling_bars_cap)
-            # Downscaling max_symbols must enforce the hard cap immediately.
-            overshoot = len(_bars) - _max_symbols
-            if overshoot > 0:
-                _evict_n_stale_symbols_locked(overshoot)
+        for shard in _bar_shards:
+            with shard.lock:
+                for entry in shard.symbols.values():
+                    entry.resize(rolling_bars)
+        # Downscaling max_symbols must enforce the hard cap immediately.
+        overshoot = _bar_state.symbol_count - max_symbols
+        if overshoot > 0:
+            _evict_n_stale_symbols_locked(overshoot)
+
+
+def reset_bar_cache() -> None:
+    """Drop every cached bar and restore the default caps."""
+    with _evict_lock:
+        for shard in _bar_shards:
+            with shard.lock:
+                shard.symbols.clear()
+        _bar_state.reset()
 
 
 def push_bar(symbol: str, bar: dict[str, Any]) -> None:
     """Append a 1-min OHLCV bar for symbol, evicting stale entries."""
-    global _last_eviction_at
-    with _bar_lock:
-        now = time.monotonic()
-        # Seed the eviction clock on first push so periodic eviction can fire
-        if _last_eviction_at == 0.0:
-            _last_eviction_at = now
-        need_cap_evict = symbol not in _bars and len(_bars) >= _max_symbols
-        if need_cap_evict:
-            # Evict exactly the required overshoot (+1 for the incoming symbol)
-            # in a single stale-sort pass to keep lock hold time bounded.
-            overshoot_plus_incoming = (len(_bars) - _max_symbols) + 1
-            _evict_n_stale_symbols_locked(overshoot_plus_incoming)
-            _last_eviction_at = now
-        if symbol not in _bars:
-            _bars[symbol] = deque(maxlen=_rolling_bars_cap)
-        _bars[symbol].append(bar)
-        _bar_last_update[symbol] = now
-        # L5: periodic eviction so stale symbols don't linger indefinitely
-        if (
-            _last_eviction_at > 0
-            and not need_cap_evict
-            and (now - _last_eviction_at) >= _EVICT_INTERVAL_SECS
-        ):
-            _evict_stale_symbols_locked()
-            _last_eviction_at = now
+    bar = _normalize_bar(bar)
+    shard = _shard_for(symbol)
+    now = time.monotonic()
+    with shard.lock:
+        entry = shard.symbols.get(symbol)
+        if entry is not None:
+            entry.append(bar, now)
+    if entry is None:
+        _insert_symbol(shard, symbol, bar, now)
+        return
+    _maybe_evict_periodically(now)
+
+
+def push_bars(bars: Iterable[tuple[str, dict[str, Any]]]) -> int:
+    """Append a batch of ``(symbol, bar)`` pairs; return how many were applied.
+
+    Same bars as push_bar() per pair in order, but each stripe lock is
+    taken once per batch. The batch is applied stripe by stripe with one
+    update time, so when the symbol cap forces evictions mid-batch the
+    least-recently-updated victims can differ from per-pair pushes.
+    Called by the feed's ingest thread.
+    """
+    pending: list[list[tuple[str, dict[str, Any]]]] = [[] for _ in range(_BAR_SHARDS)]
+    count = 0
+    for symbol, bar in bars:
+        pending[hash(symbol) % _BAR_SHARDS].append((symbol, _normalize_bar(bar)))
+        count += 1
+    if not count:
+        return 0
+    now = time.monotonic()
+    for shard, shard_bars in zip(_bar_shards, pending):
+        if not shard_bars:
+            continue
+        missing: list[tuple[str, dict[str, Any]]] = []
+        with shard.lock:
+            symbols = shard.symbols
+            for symbol, bar in shard_bars:
+                entry = symbols.get(symbol)
+                if entry is None:
+                    missing.append((symbol, bar))
+                else:
+                    entry.append(bar, now)
+        # A symbol's later bars in the batch are missing too, so inserting in
+        # order keeps its bars in arrival order.
+        for symbol, bar in missing:
+            _insert_symbol(shard, symbol, bar, now)
+    _maybe_evict_periodically(now)
+    return count
+
+
+def get_bar_arrays(symbol: str) -> BarArrays | None:
+    """Return a read-only copy of one symbol's bars, or None when it is not cached."""
+    shard = _shard_for(symbol)
+    entry = shard.symbols.get(symbol)
+    if entry is None:
+        return None
+    return entry.ring.snapshot(shard.lock)
 
 
 def get_bars_snapshot(symbol: str) -> list[dict[str, Any]]:
-    """Return a defensive copy of the bar deque for one symbol."""
-    with _bar_lock:
-        if symbol not in _bars:
-            return []
-        return list(_bars[symbol])
+    """Return a defensive copy of the bars for one symbol."""
+    arrays = get_bar_arrays(symbol)
+    if arrays is None:
+        return []
+    return _to_bar_dicts(arrays.values, arrays.ts_event)
 
 
 def get_all_symbols_snapshot() -> dict[str, list[dict[str, Any]]]:
     """Return a defensive copy of all bars. Called by compute cycle."""
-    with _bar_lock:
-        return {sym: list(dq) for sym, dq in _bars.items()}
+    snapshot: dict[str, list[dict[str, Any]]] = {}
+    for shard in _bar_shards:
+        with shard.lock:
+            entries = list(shard.symbols.items())
+        for sym, entry in entries:
+            arrays = entry.ring.snapshot(shard.lock)
+            snapshot[sym] = _to_bar_dicts(arrays.values, arrays.ts_event)
+    return snapshot
+
+
+def get_timeframe_bars_snapshot(symbol: str, tf: str) -> list[dict[str, Any]] | None:
+    """Return bars for one symbol aggregated to ``tf``.
+
+    Matches ``compute._bars_for_timeframe(get_bars_snapshot(symbol), tf)``
+    but is served from the rolling aggregator. Returns None when the symbol
+    has no 1-minute bars at all.
+    """
+    shard = _shard_for(symbol)
+    with shard.lock:
+        entry = shard.symbols.get(symbol)
+        if entry is None or not entry.ring.count:
+            return None
+        return entry.aggregator.timeframe_bars(tf)
+
+
+def get_all_timeframe_snapshots(tf: str) -> dict[str, list[dict[str, Any]]]:
+    """Return ``tf`` bars for every symbol with at least one 1-minute bar.
+
+    Called by the compute cycles in place of re-aggregating
+    ``get_all_symbols_snapshot()`` per symbol on every tick.
+    """
+    snapshot: dict[str, list[dict[str, Any]]] = {}
+    for shard in _bar_shards:
+        with shard.lock:
+            snapshot.update(
+                (sym, entry.aggregator.timeframe_bars(tf))
+                for sym, entry in shard.symbols.items()
+                if entry.ring.count
+            )
+    return snapshot
+
+
+def get_dirty_timeframe_snapshots(
+    tf: str, seen: dict[str, int]
+) -> tuple[dict[str, int], dict[str, list[dict[str, Any]]]]:
+    """Return every cached symbol's ring version plus ``tf`` bars of the dirty ones.
+
+    A symbol is dirty when its version (see ``BarArrays.version``) differs
+    from ``seen[symbol]``, i.e. it received bars since the caller last read
+    it. Symbols without any 1-minute bars are omitted from both dicts, like
+    get_all_timeframe_snapshots(). Each returned bar list matches the
+    returned version. Called by the full compute cycle.
+    """
+    versions: dict[str, int] = {}
+    dirty: dict[str, list[dict[str, Any]]] = {}
+    for shard in _bar_shards:
+        with shard.lock:
+            for sym, entry in shard.symbols.items():
+                ring = entry.ring
+                if not ring.count:
+                    continue
+                versions[sym] = ring.version
+                if seen.get(sym) != ring.version:
+                    dirty[sym] = entry.aggregator.timeframe_bars(tf)
+    return versions, dirty
+
+
+def bar_version(symbol: str) -> int | None:
+    """Current ring version of the symbol (see ``BarArrays.version``), or None without bars."""
+    entry = _shard_for(symbol).symbols.get(symbol)
+    if entry is None or not entry.ring.count:
+        return None
+    return entry.ring.version
+
+
+def latest_bar_ts_event(symbol: str) -> int | None:
+    """Newest valid ``ts_event`` (ns) among the symbol's cached 1-minute bars."""
+    arrays = get_bar_arrays(symbol)
+    if arrays is None:
+        return None
+    return int(arrays.ts_event.max(initial=0)) or None
 
 
 def bar_symbol_count() -> int:
-    with _bar_lock:
-        return len(_bars)
+    return _bar_state.symbol_count
 
 
 def total_bar_count() -> int:
-    with _bar_lock:
-        return sum(len(dq) for dq in _bars.values())
+    total = 0
+    for shard in _bar_shards:
+        with shard.lock:
+            total += sum(entry.ring.count for entry in shard.symbols.values())
+    return total
+
+
+def _shard_for(symbol: str) -> _BarShard:
+    return _bar_shards[hash(symbol) % _BAR_SHARDS]
+
+
+def _insert_symbol(shard: _BarShard, symbol: str, bar: dict[str, Any], now: float) -> None:
+    """Slow path of push_bar for a symbol that is not cached yet."""
+    with _evict_lock:
+        state = _bar_state
+        # Seed the eviction clock on first push so periodic eviction can fire
+        if state.last_eviction_at == 0.0:
+            state.last_eviction_at = now
+        with shard.lock:
+            # Insertions are serialized by _evict_lock, but another writer may
+            # have inserted the symbol while this one waited for it.
+            entry = shard.symbols.get(symbol)
+            if entry is not None:
+                entry.append(bar, now)
+                return
+        if state.symbol_count >= state.max_symbols:
+            # Evict exactly the required overshoot (+1 for the incoming symbol)
+            # in a single heap pass to keep lock hold time bounded.
+            _evict_n_stale_symbols_locked(state.symbol_count - state.max_symbols + 1)
+            state.last_eviction_at = now
+        elif (now - state.last_eviction_at) >= _EVICT_INTERVAL_SECS:
+            _evict_stale_symbols_locked()
+            state.last_eviction_at = now
+        entry = _SymbolBars(_BarRing(state.rolling_bars_cap), now)
+        entry.append(bar, now)
+        with shard.lock:
+            shard.symbols[symbol] = entry
+        heapq.heappush(state.heap, (now, symbol))
+        state.symbol_count += 1
+
+
+def _maybe_evict_periodically(now: float) -> None:
+    """L5: periodic eviction so stale symbols don't linger indefinitely."""
+    last_eviction_at = _bar_state.last_eviction_at
+    if last_eviction_at > 0 and (now - last_eviction_at) >= _EVICT_INTERVAL_SECS:
+        with _evict_lock:
+            if (now - _bar_state.last_eviction_at) >= _EVICT_INTERVAL_SECS:
+                _evict_stale_symbols_locked()
+                _bar_state.last_eviction_at = now
 
 
 def _evict_stale_symbols_locked() -> None:
-    """Evict the 10% least-recently-updated symbols. Caller MUST hold _bar_lock."""
-    n_evict = max(1, len(_bars) // 10)
-    _evict_n_stale_symbols_locked(n_evict)
+    """Evict the 10% least-recently-updated symbols. Caller MUST hold _evict_lock."""
+    _evict_n_stale_symbols_locked(max(1, _bar_state.symbol_count // 10))
 
 
 def _evict_n_stale_symbols_locked(n_evict: int) -> None:
-    """Evict N least-recently-updated symbols. Caller MUST hold _bar_lock."""
-    if not _bar_last_update:
-        return
-    n_evict = max(0, min(n_evict, len(_bars)))
-    if n_evict == 0:
-        return
-    victims = sorted(_bar_last_update, key=lambda s: _bar_last_update[s])[:n_evict]
-    for sym in victims:
-        _bars.pop(sym, None)
-        _bar_last_update.pop(sym, None)
-    logger.info("Evicted %d stale symbols from bar cache (cap=%d)", len(victims), _max_symbols)
-
+    """Evict N least-recently-updated symbols. Caller MUST hold _evict_lock."""
+    heap = _bar_state.heap
+    evicted = 0
+    while evicted < n_evict and heap:
+        queued_at, sym = heapq.heappop(heap)
+        shard = _shard_for(sym)
+        with shard.lock:
+            entry = shard.symbols.get(sym)
+            if entry is None:
+                continue
+            if entry.last_update > queued_at:
+                # Updated since it was queued: requeue at its real position.
+                heapq.heappush(heap, (entry.last_update, sym))
+                continue
+            del shard.symbols[sym]
+        evicted += 1
+    _bar_state.symbol_count -= evicted
+    if evicted:
+        logger.info("Evicted %d stale symbols from bar cache (cap=%d)", evicted, _bar_state.max_symbols)
+
+
+def _normalize_bar(bar: dict[str, Any]) -> dict[str, Any]:
+    """Coerce a provider bar the way compute reads it (None = missing field)."""
+    ts_event = _valid_ts_event(bar)
+    return {
+        "open": _coerce_finite_float(bar.get("open")),
+        "high": _coerce_finite_float(bar.get("high")),
+        "low": _coerce_finite_float(bar.get("low")),
+        "close": _coerce_finite_float(bar.get("close")),
+        "volume": _coerce_volume(bar.get("volume")),
+        "ts_event": ts_event if ts_event is not None and ts_event <= _MAX_TS_EVENT else None,
+    }
+
+
+def _to_bar_dicts(values: np.ndarray, ts_event: np.ndarray) -> list[dict[str, Any]]:
+    # NaN is the only float that is not equal to itself.
+    return [
+        {
+            "open": open_ if open_ == open_ else None,
+            "high": high if high == high else None,
+            "low": low if low == low else None,
+            "close": close if close == close else None,
+            "volume": volume if volume == volume else None,
+            "ts_event": ts or None,
+        }
+        for (open_, high, low, close, volume), ts in zip(values.tolist(), ts_event.tolist(), strict=True)
+    ]
+
+
+def _read_only(values: np.ndarray, ts_event: np.ndarray, version: int) -> BarArrays:
+    values.flags.writeable = False
+    ts_event.flags.writeable = False
+    return BarArrays(values, ts_event, version)
 
 # ---------------------------------------------------------------------------
 # Overlay cache API
@@ -148,6 +543,8 @@ def set_overlay(payloads: dict[str, dict[str, Any]]) -> None:
         _overlay.clear()
         _overlay.update(payloads)
         _overlay_computed_at = time.monotonic()
+        _overlay_versions.clear()
+        _overlay_versions.update(dict.fromkeys(_overlay, next(_write_seq)))
 
 
 def get_overlay(symbol: str) -> dict[str, Any] | None:
@@ -193,6 +590,24 @@ def patch_overlay(
                     )
                 }
             )
+            _overlay_versions[upper] = next(_write_seq)
+
+
+def overlay_version(symbol: str) -> int | None:
+    """Version of the symbol's overlay payload, or None when it has none.
+
+    Changes with every set_overlay() and every patch of the symbol, so
+    callers can keep derived data (e.g. encoded responses) until it moves.
+    """
+    with _overlay_lock:
+        upper = symbol.upper()
+        return _overlay_versions.get(upper) if upper in _overlay else None
+
+
+def overlay_versions() -> dict[str, int]:
+    """Return ``overlay_version()`` for every symbol with an overlay payload."""
+    with _overlay_lock:
+        return {sym: version for sym, version in _overlay_versions.items() if sym in _overlay}
 
 
 def overlay_age_secs() -> float:
@@ -32,6 +32,7 @@ Field definitions (matching spec/smc_live_overlay.schema.json):
 """
 from __future__ import annotations
 
+import concurrent.futures
 import datetime
 import json
 import logging
@@ -46,6 +47,14 @@ from pathlib import Path
 from typing import Any
 
 from . import cache, config, observability
+from .bar_aggregation import (
+    _TF_TO_MINUTES,
+    _bar_minute_bucket,
+    _coerce_finite_float,
+    _coerce_volume,
+    _fold_bar_into_bucket,
+    _new_bucket,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -711,68 +720,93 @@ def _load_experiment_history() -> list[dict[str, Any]]:
         return [dict(r) for r in _experiment_history_cache]
 
 
-def _get_news_fields(symbol: str) -> dict[str, Any]:
-    """Extract news_strength and news_bias for a symbol from the snapshot."""
-    snap = _load_news_snapshot()
-    stories = snap.get("stories") or snap.get("items") or []
-    sym_upper = symbol.upper()
-
-    def _normalize_tickers(raw: Any) -> list[str]:
-        """Normalize story tickers to a safe uppercase ticker list."""
-        if isinstance(raw, str):
-            raw_items: list[Any] = [raw]
-        elif isinstance(raw, (list, tuple, set)):
-            raw_items = raw
-        else:
-            return []
+def _story_tickers(raw: Any) -> list[str]:
+    """Normalize story tickers to a safe uppercase ticker list."""
+    if isinstance(raw, str):
+        raw_items: list[Any] = [raw]
+    elif isinstance(raw, (list, tuple, set)):
+        raw_items = raw
+    else:
+        return []
 
-        out: list[str] = []
-        for item in raw_items:
-            if not isinstance(item, str):
-                continue
-            ticker = item.strip().upper()
-            if ticker:
-                out.append(ticker)
-        return out
+    out: list[str] = []
+    for item in raw_items:
+        if not isinstance(item, str):
+            continue
+        ticker = item.strip().upper()
+        if ticker:
+            out.append(ticker)
+    return out
 
-    def _score(story: dict[str, Any]) -> float | None:
-        """Prefer sentiment_score when present (including 0.0), else news_score.
 
-        Invalid/non-finite values are treated as missing (None), not as a
-        neutral 0.0 sample.
-        """
-        if "sentiment_score" in story and story.get("sentiment_score") is not None:
-            if (score := _coerce_finite_float(story["sentiment_score"])) is not None:
-                return score
-            # Malformed sentiment_score should not mask a valid news_score.
-            if "news_score" in story and story.get("news_score") is not None:
-                return _coerce_finite_float(story["news_score"])
-            return None
+def _story_score(story: dict[str, Any]) -> float | None:
+    """Prefer sentiment_score when present (including 0.0), else news_score.
+
+    Invalid/non-finite values are treated as missing (None), not as a
+    neutral 0.0 sample.
+    """
+    if "sentiment_score" in story and story.get("sentiment_score") is not None:
+        if (score := _coerce_finite_float(story["sentiment_score"])) is not None:
+            return score
+        # Malformed sentiment_score should not mask a valid news_score.
         if "news_score" in story and story.get("news_score") is not None:
-            if (score := _coerce_finite_float(story["news_score"])) is not None:
-                return score
-            return None
+            return _coerce_finite_float(story["news_score"])
+        return None
+    if "news_score" in story and story.get("news_score") is not None:
+        if (score := _coerce_finite_float(story["news_score"])) is not None:
+            return score
         return None
+    return None
 
-    scores: list[float] = []
+
+def _build_news_index(stories: Any) -> dict[str, dict[str, Any]]:
+    """Map each ticker to its news_strength / news_bias in one pass over the stories."""
+    scores_by_ticker: dict[str, list[float]] = {}
     for story in stories:
         if not isinstance(story, dict):
             continue
-        tickers = _normalize_tickers(story.get("tickers"))
-        if sym_upper not in tickers:
+        tickers = _story_tickers(story.get("tickers"))
+        if not tickers or (score := _story_score(story)) is None:
             continue
-        if (score := _score(story)) is not None:
-            scores.append(score)
+        # A story listing a ticker twice still counts once for it.
+        for ticker in dict.fromkeys(tickers):
+            scores_by_ticker.setdefault(ticker, []).append(score)
+
+    index: dict[str, dict[str, Any]] = {}
+    for ticker, scores in scores_by_ticker.items():
+        avg = sum(scores) / len(scores)
+        bias = "BULLISH" if avg > 0.1 else ("BEARISH" if avg < -0.1 else "NEUTRAL")
+        index[ticker] = {
+            "news_strength": round(max(0.0, min(1.0, abs(avg))), 4),
+            "news_bias": bias,
+        }
+    return index
+
+
+def _news_index() -> dict[str, dict[str, Any]]:
+    """Return the ticker index of the current news snapshot, memoized per snapshot.
+
+    ``_load_news_snapshot`` returns a shallow copy, so the stories list keeps
+    its identity until the snapshot is reloaded; that identity is the index's
+    input version.
+    """
+    snap = _load_news_snapshot()
+    stories = snap.get("stories") or snap.get("items") or []
+    memo = _cycle_state.news_memo
+    if memo is not None and memo[0] is stories:
+        return memo[1]
+    index = _build_news_index(stories)
+    # One tuple assignment, so concurrent readers see a consistent pair.
+    _cycle_state.news_memo = (stories, index)
+    return index
 
-    if not scores:
-        return {"news_strength": None, "news_bias": None}
 
-    avg = sum(scores) / len(scores)
-    bias = "BULLISH" if avg > 0.1 else ("BEARISH" if avg < -0.1 else "NEUTRAL")
-    return {
-        "news_strength": round(max(0.0, min(1.0, abs(avg))), 4),
-        "news_bias": bias,
-    }
+def _get_news_fields(symbol: str) -> dict[str, Any]:
+    """Extract news_strength and news_bias for a symbol from the snapshot."""
+    fields = _news_index().get(symbol.upper())
+    if fields is None:
+        return {"news_strength": None, "news_bias": None}
+    return dict(fields)
 
 
 def _get_global_news_fields() -> dict[str, Any]:
@@ -836,75 +870,15 @@ def _safe_std(vals: list[float]) -> float:
     return math.sqrt(sum((v - mean) ** 2 for v in vals) / (n - 1))
 
 
-def _coerce_finite_float(v: Any) -> float | None:
-    """Coerce value to finite float, returning None on invalid/non-finite input."""
-    if v is None:
-        return None
-    # bool is a subclass of int in Python, but True/False in OHLC/volume fields
-    # indicates malformed provider data and must not be interpreted as 1.0/0.0.
-    if isinstance(v, bool):
-        return None
-    try:
-        coerced = float(v)
-    except (TypeError, ValueError):
-        return None
-    if not math.isfinite(coerced):
-        return None
-    return coerced
-
-
-def _coerce_volume(v: Any) -> float | None:
-    """Coerce a volume field value to float, returning None on failure.
-
-    Accepts int, float, and numeric strings (e.g. '100' from schema drift).
-    Returns None for None, empty string, negative values, non-finite values
-    (NaN/Inf), or
-    any non-numeric value so that
-    callers can safely skip the bar instead of crashing.
-    """
-    coerced = _coerce_finite_float(v)
-    if coerced is None:
-        return None
-    if coerced < 0:
-        return None
-    return coerced
-
-
 # ---------------------------------------------------------------------------
 # Multi-timeframe aggregation
 # ---------------------------------------------------------------------------
 
-_TF_TO_MINUTES: dict[str, int] = {
-    "5m": 5,
-    "10m": 10,
-    "15m": 15,
-    "30m": 30,
-    "1H": 60,
-    "4H": 240,
-}
-
-
 def supported_timeframes() -> tuple[str, ...]:
     """Return supported intraday overlay timeframes in canonical order."""
     return tuple(_TF_TO_MINUTES.keys())
 
 
-def _bar_minute_bucket(ts_event: int, minutes: int) -> int:
-    """Return the bucket-end timestamp (nanoseconds) for a bar.
-
-    Databento ts_event is in nanoseconds since the Unix epoch. We align
-    to the end of the N-minute bucket in UTC. Intraday timeframes only.
-
-    For bar-close stamps, events between boundaries are ceiled to the next
-    boundary while events already on a boundary remain unchanged.
-    """
-    ns_per_minute = 60_000_000_000
-    minute = ts_event // ns_per_minute
-    floored_minute = (minute // minutes) * minutes
-    aligned_minute = floored_minute if minute == floored_minute else floored_minute + minutes
-    return aligned_minute * ns_per_minute
-
-
 def _aggregate_bars(bars: list[dict[str, Any]], tf: str) -> list[dict[str, Any]]:
     """Aggregate 1-minute bars into higher intraday timeframes.
 
@@ -933,36 +907,9 @@ def _aggregate_bars(bars: list[dict[str, Any]], tf: str) -> list[dict[str, Any]]
         bucket_ts = _bar_minute_bucket(ts_event, minutes)
         bucket = buckets.get(bucket_ts)
         if bucket is None:
-            bucket = {
-                "open": None,
-                "high": None,
-                "low": None,
-                "close": None,
-                "volume": None,
-                "ts_event": bucket_ts,
-                "_first_ts": None,
-                "_last_ts": None,
-            }
+            bucket = _new_bucket(bucket_ts)
             buckets[bucket_ts] = bucket
-
-        open_ = _coerce_finite_float(bar.get("open"))
-        high = _coerce_finite_float(bar.get("high"))
-        low = _coerce_finite_float(bar.get("low"))
-        close = _coerce_finite_float(bar.get("close"))
-        volume = _coerce_volume(bar.get("volume"))
-
-        if open_ is not None and (bucket["_first_ts"] is None or ts_event < bucket["_first_ts"]):
-            bucket["open"] = open_
-            bucket["_first_ts"] = ts_event
-        if high is not None:
-            bucket["high"] = high if bucket["high"] is None else max(bucket["high"], high)
-        if low is not None:
-            bucket["low"] = low if bucket["low"] is None else min(bucket["low"], low)
-        if close is not None and (bucket["_last_ts"] is None or ts_event >= bucket["_last_ts"]):
-            bucket["close"] = close
-            bucket["_last_ts"] = ts_event
-        if volume is not None:
-            bucket["volume"] = volume if bucket["volume"] is None else bucket["volume"] + volume
+        _fold_bar_into_bucket(bucket, bar, ts_event)
 
     # Drop buckets that contain no valid close — they cannot contribute
     # to any indicator and would otherwise create empty aggregated bars.
@@ -1163,35 +1110,34 @@ def _event_fields_for(_symbol: str) -> dict[str, Any]:
 # Full payload builder
 # ---------------------------------------------------------------------------
 
-def build_payload(
-    symbol: str,
-    bars: list[dict[str, Any]],
-    global_fields: dict[str, Any],
-    max_stale_secs: int,
-    tf: str = "5m",
-) -> dict[str, Any]:
-    """Build the full overlay payload for one symbol.
-
-    The supplied ``bars`` are expected to be 1-minute bars. They are
-    aggregated to the requested ``tf`` before computing technical
-    indicators.
-    """
-    # asof_ts is Unix-Epoch seconds (int) per smc-live-overlay/1 schema
-    asof_ts = int(datetime.datetime.now(datetime.UTC).timestamp())
-
-    aggregated = _bars_for_timeframe(bars, tf)
-
-    news = _get_news_fields(symbol)
+def _technical_fields(aggregated: list[dict[str, Any]]) -> dict[str, Any]:
+    """Flow, squeeze and ATS payload fields from bars already at the target timeframe."""
     flow = compute_flow_fields(aggregated)
     squeeze_period = len(aggregated) if 5 <= len(aggregated) < 20 else 20
     squeeze = compute_squeeze_on(aggregated, period=squeeze_period)
     ats = compute_ats_fields(aggregated)
-    vix = cache.get_vix()
-    events = _event_fields_for(symbol)
+    return {
+        # Flow
+        "flow_rel_vol": flow.get("flow_rel_vol"),
+        "flow_delta_proxy_pct": flow.get("flow_delta_proxy_pct"),
+        # Technicals
+        "squeeze_on": int(squeeze) if squeeze is not None else None,
+        "ats_state": ats.get("ats_state"),
+        "ats_zscore": ats.get("ats_zscore"),
+    }
 
-    age = cache.overlay_age_secs()
-    stale = (age > max_stale_secs) if age != float("inf") else True
 
+def _assemble_payload(
+    symbol: str,
+    news: dict[str, Any],
+    technicals: dict[str, Any],
+    global_fields: dict[str, Any],
+    vix: float | None,
+    *,
+    asof_ts: int,
+    stale: bool,
+) -> dict[str, Any]:
+    """Lay out one overlay payload in schema key order."""
     return {
         "schema": "smc-live-overlay/1",
         "symbol": symbol.upper(),
@@ -1200,20 +1146,158 @@ def build_payload(
         # News
         "news_strength": news.get("news_strength"),
         "news_bias": news.get("news_bias"),
-        # Flow
-        "flow_rel_vol": flow.get("flow_rel_vol"),
-        "flow_delta_proxy_pct": flow.get("flow_delta_proxy_pct"),
-        # Technicals
-        "squeeze_on": int(squeeze) if squeeze is not None else None,
-        "ats_state": ats.get("ats_state"),
-        "ats_zscore": ats.get("ats_zscore"),
+        # Flow + technicals
+        **technicals,
         # Market-wide
         "vix_level": round(vix, 4) if vix is not None else None,
         "tone": global_fields.get("tone"),
         "global_heat": global_fields.get("global_heat"),
         # Events
-        **events,
+        **_event_fields_for(symbol),
+    }
+
+
+def _overlay_stale(max_stale_secs: int) -> bool:
+    age = cache.overlay_age_secs()
+    return (age > max_stale_secs) if age != float("inf") else True
+
+
+def build_payload(
+    symbol: str,
+    bars: list[dict[str, Any]],
+    global_fields: dict[str, Any],
+    max_stale_secs: int,
+    tf: str = "5m",
+    *,
+    preaggregated: bool = False,
+) -> dict[str, Any]:
+    """Build the full overlay payload for one symbol.
+
+    The supplied ``bars`` are expected to be 1-minute bars. They are
+    aggregated to the requested ``tf`` before computing technical
+    indicators. With ``preaggregated=True`` the bars are already at ``tf``
+    (from ``cache.get_timeframe_bars_snapshot``) and are used as-is.
+    """
+    # asof_ts is Unix-Epoch seconds (int) per smc-live-overlay/1 schema
+    asof_ts = int(datetime.datetime.now(datetime.UTC).timestamp())
+
+    aggregated = bars if preaggregated else _bars_for_timeframe(bars, tf)
+
+    return _assemble_payload(
+        symbol,
+        _get_news_fields(symbol),
+        _technical_fields(aggregated),
+        global_fields,
+        cache.get_vix(),
+        asof_ts=asof_ts,
+        stale=_overlay_stale(max_stale_secs),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Full compute cycle
+# ---------------------------------------------------------------------------
+# The cycle only recomputes what changed. Technical fields are memoized per
+# symbol on the bar ring version the cache reports (a symbol with new bars is
+# dirty), news fields come from a ticker index memoized per news snapshot, and
+# the cheap cycle-wide fields (asof_ts, stale, vix, tone, heat, events) are
+# refreshed for every symbol. Dirty symbols are computed in chunks on a
+# bounded thread pool; chunks that miss the per-cycle deadline keep their
+# symbols' previous payload (or leave a new symbol out) and, since their memo
+# version did not move, are recomputed on the next cycle. A chunk that is
+# already running cannot be cancelled; until it returns its symbols are not
+# resubmitted, so a stuck chunk holds one worker instead of one per cycle.
+
+_COMPUTE_CHUNK_SYMBOLS = 32  # dirty symbols per pool task
+
+
+class _ComputeCycleState:
+    """Memo and worker pool of run_full_compute_cycle (refresh thread only).
+
+    ``news_memo`` is also read and replaced by _news_index() on HTTP threads;
+    it is only ever swapped as a whole tuple. ``running`` maps chunks that
+    outlived their cycle's deadline to their symbols; it survives reset()
+    because those chunks still occupy workers.
+    """
+
+    __slots__ = ("executor", "news_memo", "running", "technicals", "tf", "workers")
+
+    def __init__(self) -> None:
+        self.executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self.workers = 0
+        self.running: dict[concurrent.futures.Future[Any], frozenset[str]] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        self.tf = ""
+        # symbol -> (bar ring version, technical fields at ``tf``)
+        self.technicals: dict[str, tuple[int, dict[str, Any]]] = {}
+        self.news_memo: tuple[Any, dict[str, dict[str, Any]]] | None = None
+
+    def pool(self, workers: int) -> concurrent.futures.ThreadPoolExecutor:
+        if self.executor is None or workers != self.workers:
+            if self.executor is not None:
+                # Chunks still running finish on their own; results are dropped.
+                self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="overlay-compute"
+            )
+            self.workers = workers
+        return self.executor
+
+
+_cycle_state = _ComputeCycleState()
+
+
+def _compute_technicals_chunk(
+    chunk: list[tuple[str, int, list[dict[str, Any]]]],
+) -> list[tuple[str, int, dict[str, Any]]]:
+    return [(sym, version, _technical_fields(bars)) for sym, version, bars in chunk]
+
+
+def _recompute_dirty(
+    dirty: list[tuple[str, int, list[dict[str, Any]]]], deadline_secs: float
+) -> tuple[dict[str, tuple[int, dict[str, Any]]], int, int]:
+    """Compute technicals of ``dirty`` on the pool.
+
+    Returns the finished ones, the missed count and the number of chunks
+    that missed the deadline while already running. Symbols of a chunk that
+    is still running from an earlier cycle are skipped and count as missed.
+    """
+    state = _cycle_state
+    state.running = {future: symbols for future, symbols in state.running.items() if not future.done()}
+    missed = 0
+    if state.running:
+        busy = frozenset().union(*state.running.values())
+        ready = [item for item in dirty if item[0] not in busy]
+        missed = len(dirty) - len(ready)
+        dirty = ready
+    if not dirty:
+        return {}, missed, 0
+    pool = state.pool(config.compute_workers())
+    chunks = {
+        pool.submit(_compute_technicals_chunk, chunk): chunk
+        for chunk in (dirty[i : i + _COMPUTE_CHUNK_SYMBOLS] for i in range(0, len(dirty), _COMPUTE_CHUNK_SYMBOLS))
     }
+    done, not_done = concurrent.futures.wait(chunks, timeout=deadline_secs)
+    stuck = 0
+    for future in not_done:
+        if not future.cancel():
+            state.running[future] = frozenset(sym for sym, _, _ in chunks[future])
+            stuck += 1
+        missed += len(chunks[future])
+
+    computed: dict[str, tuple[int, dict[str, Any]]] = {}
+    for future in done:
+        try:
+            results = future.result()
+        except Exception:
+            # Left dirty, so the chunk is retried next cycle like a missed one.
+            logger.exception("Overlay compute chunk failed")
+            missed += len(chunks[future])
+            continue
+        computed.update((sym, (version, fields)) for sym, version, fields in results)
+    return computed, missed, stuck
 
 
 def run_full_compute_cycle(tf: str = "5m") -> int:
@@ -1223,15 +1307,48 @@ def run_full_compute_cycle(tf: str = "5m") -> int:
     Called every OVERLAY_REFRESH_SECS by the refresh thread.
     """
     with observability.trace_span("live_overlay.full_compute_cycle"):
-        all_bars = cache.get_all_symbols_snapshot()
+        started = time.monotonic()
+        state = _cycle_state
+        if state.tf != tf:
+            state.reset()
+            state.tf = tf
+        memo = state.technicals
+
+        # Bars arrive already aggregated to tf by the cache's rolling
+        # aggregator, and only for symbols whose bars changed since their
+        # memoized version; symbols without any 1-minute bars are omitted.
+        versions, dirty_bars = cache.get_dirty_timeframe_snapshots(
+            tf, {sym: entry[0] for sym, entry in memo.items()}
+        )
+        for sym in memo.keys() - versions.keys():
+            del memo[sym]  # evicted from the bar cache
+        dirty = [(sym, versions[sym], bars) for sym, bars in dirty_bars.items()]
+        budget = config.compute_deadline_secs() - (time.monotonic() - started)
+        computed, missed, stuck = _recompute_dirty(dirty, max(budget, 0.0))
+        memo.update(computed)
+
         max_stale = config.max_stale_secs()
         global_fields = _get_global_news_fields()
+        news_index = _news_index()
+        vix = cache.get_vix()
+        asof_ts = int(datetime.datetime.now(datetime.UTC).timestamp())
+        stale = _overlay_stale(max_stale)
+        no_news = {"news_strength": None, "news_bias": None}
 
         payloads: dict[str, Any] = {}
-        for sym, bars in all_bars.items():
-            if not bars:
-                continue
-            payloads[sym.upper()] = build_payload(sym, bars, global_fields, max_stale, tf=tf)
+        for sym in versions:
+            entry = memo.get(sym)
+            if entry is None:
+                continue  # first computation missed the deadline
+            payloads[sym.upper()] = _assemble_payload(
+                sym,
+                news_index.get(sym.upper(), no_news),
+                entry[1],
+                global_fields,
+                vix,
+                asof_ts=asof_ts,
+                stale=stale,
+            )
 
         # Always replace snapshot (including empty) so stale symbols are removed
         # when bar cache is temporarily empty.
@@ -1240,10 +1357,19 @@ def run_full_compute_cycle(tf: str = "5m") -> int:
         count = len(payloads)
         observability.metric_gauge("live_overlay.overlay_symbols", count)
         observability.metric_counter("live_overlay.full_compute_cycle.total")
+        observability.metric_counter("live_overlay.full_compute_cycle.recomputed_symbols", len(computed))
+        observability.metric_gauge("live_overlay.full_compute_cycle.running_stuck_chunks", len(state.running))
+        if stuck:
+            observability.metric_counter("live_overlay.full_compute_cycle.stuck_chunks", stuck)
+            logger.warning("Full compute cycle: %d chunks still running past the deadline", stuck)
+        if missed:
+            observability.metric_counter("live_overlay.full_compute_cycle.deadline_missed_symbols", missed)
+            logger.warning("Full compute cycle: %d dirty symbols missed the deadline; retrying next cycle", missed)
         observability.audit_event(
             "live_overlay_full_compute_cycle",
             "ok",
             symbols=count,
+            recomputed=len(computed),
         )
         return count
 
@@ -1255,13 +1381,10 @@ def run_flow_patch_cycle(tf: str = "5m") -> int:
     Called every OVERLAY_FLOW_REFRESH_SECS.
     """
     with observability.trace_span("live_overlay.flow_patch_cycle"):
-        all_bars = cache.get_all_symbols_snapshot()
+        all_bars = cache.get_all_timeframe_snapshots(tf)
         vix = cache.get_vix()
         count = 0
-        for sym, bars in all_bars.items():
-            if not bars:
-                continue
-            aggregated = _bars_for_timeframe(bars, tf)
+        for sym, aggregated in all_bars.items():
             updates = compute_flow_fields(aggregated)
             if (vix_value := _coerce_finite_float(vix)) is not None:
                 updates["vix_level"] = round(vix_value, 4)
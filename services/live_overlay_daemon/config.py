@@ -10,6 +10,9 @@ Optional vars:
   OVERLAY_FLOW_REFRESH_SECS   — flow-field fast refresh cadence, default 300 (5 min)
   OVERLAY_MAX_STALE_SECS      — threshold for marking payload stale, default 3600 (1 h)
   OVERLAY_ROLLING_BARS        — number of 1-min bars to keep per symbol, default 60
+  OVERLAY_COMPUTE_WORKERS     — full compute cycle worker threads, default 4
+  OVERLAY_COMPUTE_DEADLINE_SECS — full compute cycle recompute budget, default 60
+  OVERLAY_PAYLOAD_GZIP_MIN_BYTES — smallest /smc_live body kept gzip-encoded, default 500
   NEWS_SNAPSHOT_PATH          — path to news snapshot JSON, default relative to repo root
   NEWS_SNAPSHOT_URL           — optional https URL fetched at runtime; takes precedence
                                 over NEWS_SNAPSHOT_PATH and falls back to it (and the
@@ -123,6 +126,21 @@ def rolling_bars() -> int:
     return _clamped_int("OVERLAY_ROLLING_BARS", 60, 1, 500)
 
 
+def compute_workers() -> int:
+    """Worker threads the full compute cycle fans dirty symbols out to."""
+    return _clamped_int("OVERLAY_COMPUTE_WORKERS", 4, 1, 32)
+
+
+def compute_deadline_secs() -> int:
+    """Per-cycle budget for recomputing dirty symbols; the rest carry over to the next cycle."""
+    return _clamped_int("OVERLAY_COMPUTE_DEADLINE_SECS", 60, 1, 3600)
+
+
+def payload_gzip_min_bytes() -> int:
+    """Smallest encoded /smc_live body the payload cache also keeps gzip-compressed."""
+    return _clamped_int("OVERLAY_PAYLOAD_GZIP_MIN_BYTES", 500, 0, 1_048_576)
+
+
 def news_snapshot_path() -> Path:
     """Local path to the latest news-provider health snapshot JSON.
 
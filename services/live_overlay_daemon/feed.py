@@ -3,7 +3,13 @@ Live feed consumer — runs in a daemon background thread.
 
 Architecture:
   - One db.Live() connection subscribes to EQUS.MINI ohlcv-1m ALL_SYMBOLS.
-  - Records are pushed to cache.push_bar() as they arrive.
+  - The feed thread converts records to bars and hands them to the ingest
+    thread through an IngestBuffer; the ingest thread drains everything
+    queued at once and applies it with cache.push_bars(), so a minute-
+    rollover burst costs one stripe-lock round per batch, not per bar.
+  - Record classes are dispatched through ``_record_kinds``, a class ->
+    kind table seeded with the Databento message classes and filled in by
+    name for any other class the first time it is seen.
   - A separate refresh thread runs compute.run_full_compute_cycle() on schedule.
   - A fast-refresh thread runs compute.run_flow_patch_cycle() more frequently.
 
@@ -25,11 +31,13 @@ import logging
 import queue
 import threading
 import time
+from collections.abc import Iterable
 from typing import Any
 
 import databento as db
 
-from . import cache, compute, config
+from . import cache, compute, config, payload_cache
+from .ingest_buffer import IngestBuffer
 from .observability import metric_counter
 
 logger = logging.getLogger(__name__)
@@ -38,6 +46,18 @@ _RECONNECT_DELAY_SECS = 10
 _MAX_RECONNECT_ATTEMPTS = 5
 _RECONNECT_BACKOFF_SECS = 120
 _INGEST_STOP_SENTINEL = object()
+_INGEST_BATCH_MAX = 4096  # bars applied per cache.push_bars() call
+_INGEST_WAIT_SECS = 0.5
+
+# How the feed loop handles each record class (see _record_kind()).
+_RECORD_SKIP = 0
+_RECORD_SYMBOL_MAPPING = 1
+_RECORD_BAR = 2
+_RECORD_OHLCV_MSG = 3  # db.OHLCVMsg: fixed layout, read without getattr probing
+_record_kinds: dict[type, int] = {
+    db.SymbolMappingMsg: _RECORD_SYMBOL_MAPPING,
+    db.OHLCVMsg: _RECORD_OHLCV_MSG,
+}
 
 # VIX symbol on EQUS.MINI
 _VIX_SYMBOL = "VIX"
@@ -103,6 +123,34 @@ def _record_to_bar(record: Any) -> dict[str, Any] | None:
         return None
 
 
+def _ohlcv_msg_to_bar(record: Any) -> dict[str, Any]:
+    """Convert a ``db.OHLCVMsg`` (every field always present) to a plain bar dict."""
+    return {
+        "open": record.open / 1e9,
+        "high": record.high / 1e9,
+        "low": record.low / 1e9,
+        "close": record.close / 1e9,
+        "volume": record.volume,
+        "ts_event": record.ts_event,
+    }
+
+
+def _record_kind(record_type: type) -> int:
+    """Classify a record class by name and remember it in ``_record_kinds``."""
+    kind = _record_kinds.get(record_type)
+    if kind is None:
+        name = record_type.__name__
+        if name == "SymbolMappingMsg":
+            kind = _RECORD_SYMBOL_MAPPING
+        elif "OHLCV" in name.upper() or "BAR" in name.upper():
+            kind = _RECORD_BAR
+        else:
+            # Skip system records that aren't OHLCV data
+            kind = _RECORD_SKIP
+        _record_kinds[record_type] = kind
+    return kind
+
+
 def _symbol_from_record(record: Any, symmap: dict[int, str]) -> str | None:
     """Resolve instrument_id → ticker symbol via the session symmap."""
     try:
@@ -136,13 +184,15 @@ def _metrics_snapshot() -> dict[str, int]:
         return dict(_metrics)
 
 
-def _record_enqueue_backpressure() -> None:
+def _record_queue_depth(depth: int) -> None:
+    """Record the queue depth the ingest thread found when it drained a batch.
+
+    Depth only grows between drains, so the depth at drain time is the peak.
+    """
     with _backpressure_lock:
-        ingest_queue = _runtime.get("ingest_queue")
-        depth = float(ingest_queue.qsize()) if ingest_queue is not None else 0.0
         _backpressure["ingest_queue_depth_max"] = max(
             _backpressure.get("ingest_queue_depth_max", 0.0),
-            depth,
+            float(depth),
         )
 
 
@@ -218,77 +268,7 @@ def _run_feed_loop(stop: threading.Event) -> None:
                 logger.info("db.Live() connected — subscribing EQUS.MINI ohlcv-1m ALL_SYMBOLS")
                 consecutive_failures = 0
 
-                # Build symbology map from SymbolMappingMsg records
-                # yielded by the iterator (no private-attr access).
-                symmap: dict[int, str] = {}
-
-                _rec_count = 0
-                _ohlcv_count = 0
-                _sym_none_count = 0
-                _bar_none_count = 0
-                _bars_pushed_count = 0
-                for record in client:
-                    if stop.is_set():
-                        break
-
-                    rec_type = type(record).__name__
-                    _rec_count += 1
-                    if _rec_count % 2000 == 0:
-                        logger.debug(
-                            "Feed stats: total=%d symmap=%d ohlcv=%d sym_none=%d bar_none=%d bars_pushed=%d",
-                            _rec_count, len(symmap), _ohlcv_count, _sym_none_count,
-                            _bar_none_count, _bars_pushed_count,
-                        )
-
-                    # Handle SymbolMappingMsg to build symbology map
-                    if rec_type == "SymbolMappingMsg":
-                        iid = getattr(record, "instrument_id", None)
-                        raw = getattr(record, "stype_out_symbol", None) or getattr(record, "raw_symbol", None)
-                        if iid is not None and raw:
-                            symmap[iid] = raw
-                        continue
-
-                    # Skip system records that aren't OHLCV data
-                    rec_type_upper = rec_type.upper()
-                    if "OHLCV" not in rec_type_upper and "BAR" not in rec_type_upper:
-                        continue
-
-                    _ohlcv_count += 1
-                    if _ohlcv_count == 1:
-                        logger.info("First OHLCV record: type=%s symmap_size=%d", rec_type, len(symmap))
-
-                    sym = _symbol_from_record(record, symmap)
-                    if sym is None:
-                        _sym_none_count += 1
-                        if _sym_none_count <= 3:
-                            logger.warning(
-                                "sym=None for instrument_id=%s symmap_size=%d",
-                                getattr(record, "instrument_id", "?"),
-                                len(symmap),
-                            )
-                        continue
-
-                    bar = _record_to_bar(record)
-                    if bar is None:
-                        _bar_none_count += 1
-                        if _bar_none_count <= 3:
-                            logger.warning("bar=None for sym=%s rec_type=%s", sym, rec_type)
-                        continue
-
-                    ingest_queue = _runtime.get("ingest_queue")
-                    if ingest_queue is None:
-                        continue
-                    try:
-                        ingest_queue.put_nowait((sym, bar, time.monotonic()))
-                        _record_enqueue_backpressure()
-                        _bars_pushed_count += 1
-                    except queue.Full:
-                        dropped_total = _record_queue_drop()
-                        if _should_log_queue_drop_warning(dropped_total):
-                            logger.warning(
-                                "Ingest queue full — dropping newest bar (dropped_total=%d)",
-                                int(dropped_total),
-                            )
+                _consume_records(client, stop)
 
             except db.BentoError as exc:
                 consecutive_failures += 1
@@ -342,8 +322,88 @@ def _run_feed_loop(stop: threading.Event) -> None:
         loop.close()
 
 
+def _consume_records(records: Iterable[Any], stop: threading.Event) -> None:
+    """Convert live records to bars and enqueue them for the ingest thread."""
+    # Build symbology map from SymbolMappingMsg records
+    # yielded by the iterator (no private-attr access).
+    symmap: dict[int, str] = {}
+    record_kinds = _record_kinds
+
+    _rec_count = 0
+    _ohlcv_count = 0
+    _sym_none_count = 0
+    _bar_none_count = 0
+    _bars_pushed_count = 0
+    for record in records:
+        if stop.is_set():
+            break
+
+        record_type = type(record)
+        kind = record_kinds.get(record_type)
+        if kind is None:
+            kind = _record_kind(record_type)
+        _rec_count += 1
+        if _rec_count % 2000 == 0:
+            logger.debug(
+                "Feed stats: total=%d symmap=%d ohlcv=%d sym_none=%d bar_none=%d bars_pushed=%d",
+                _rec_count, len(symmap), _ohlcv_count, _sym_none_count,
+                _bar_none_count, _bars_pushed_count,
+            )
+
+        # Handle SymbolMappingMsg to build symbology map
+        if kind == _RECORD_SYMBOL_MAPPING:
+            iid = getattr(record, "instrument_id", None)
+            raw = getattr(record, "stype_out_symbol", None) or getattr(record, "raw_symbol", None)
+            if iid is not None and raw:
+                symmap[iid] = raw
+            continue
+
+        if kind == _RECORD_SKIP:
+            continue
+
+        _ohlcv_count += 1
+        if _ohlcv_count == 1:
+            logger.info("First OHLCV record: type=%s symmap_size=%d", record_type.__name__, len(symmap))
+
+        if kind == _RECORD_OHLCV_MSG:
+            raw = symmap.get(record.instrument_id)
+            sym = raw.upper() if raw else None
+        else:
+            sym = _symbol_from_record(record, symmap)
+        if sym is None:
+            _sym_none_count += 1
+            if _sym_none_count <= 3:
+                logger.warning(
+                    "sym=None for instrument_id=%s symmap_size=%d",
+                    getattr(record, "instrument_id", "?"),
+                    len(symmap),
+                )
+            continue
+
+        bar = _ohlcv_msg_to_bar(record) if kind == _RECORD_OHLCV_MSG else _record_to_bar(record)
+        if bar is None:
+            _bar_none_count += 1
+            if _bar_none_count <= 3:
+                logger.warning("bar=None for sym=%s rec_type=%s", sym, record_type.__name__)
+            continue
+
+        ingest_queue = _runtime.get("ingest_queue")
+        if ingest_queue is None:
+            continue
+        try:
+            ingest_queue.put_nowait((sym, bar, time.monotonic()))
+            _bars_pushed_count += 1
+        except queue.Full:
+            dropped_total = _record_queue_drop()
+            if _should_log_queue_drop_warning(dropped_total):
+                logger.warning(
+                    "Ingest queue full — dropping newest bar (dropped_total=%d)",
+                    int(dropped_total),
+                )
+
+
 def _run_ingest_loop(stop: threading.Event) -> None:
-    """Drain feed queue into cache and compute backpressure telemetry."""
+    """Drain feed queue into cache in batches and compute backpressure telemetry."""
     while True:
         ingest_queue = _runtime.get("ingest_queue")
         if stop.is_set() and (ingest_queue is None or ingest_queue.empty()):
@@ -351,40 +411,51 @@ def _run_ingest_loop(stop: threading.Event) -> None:
         if ingest_queue is None:
             stop.wait(0.2)
             continue
-        try:
-            item = ingest_queue.get(timeout=0.5)
-        except queue.Empty:
+        batch = ingest_queue.drain(_INGEST_WAIT_SECS, _INGEST_BATCH_MAX)
+        if not batch:
             continue
+        _record_queue_depth(len(batch) + ingest_queue.qsize())
 
-        if item is _INGEST_STOP_SENTINEL:
-            ingest_queue.task_done()
-            if stop.is_set():
-                break
-            continue
-
-        sym, bar, queued_at = item
+        items = [item for item in batch if item is not _INGEST_STOP_SENTINEL]
+        if items:
+            _apply_ingest_batch(items, stop)
+        if len(items) < len(batch) and stop.is_set():
+            break
+    logger.info("Ingest thread stopped.")
 
-        cache.push_bar(sym, bar)
-        _maybe_cache_vix(sym, bar)
 
-        now = time.monotonic()
-        _record_queue_lag_ms(max(0.0, (now - queued_at) * 1000.0))
+def _apply_ingest_batch(items: list[tuple[str, dict[str, Any], float]], stop: threading.Event) -> None:
+    """Push one drained batch of ``(sym, bar, queued_at)`` items into the cache."""
+    cache.push_bars((sym, bar) for sym, bar, _ in items)
+    for sym, bar, _ in items:
+        if sym == _VIX_SYMBOL:
+            _maybe_cache_vix(sym, bar)
 
-        global _last_bar_at
-        with _last_bar_lock:
-            _last_bar_at = now
-            if not stop.is_set() and not _feed_ready.is_set():
-                _feed_ready.set()
-                logger.info("Feed ready — first bar pushed for %s", sym)
+    now = time.monotonic()
+    # The queue is FIFO, so the first item waited longest.
+    _record_queue_lag_ms(max(0.0, (now - items[0][2]) * 1000.0))
 
-        ingest_queue.task_done()
-    logger.info("Ingest thread stopped.")
+    global _last_bar_at
+    with _last_bar_lock:
+        _last_bar_at = now
+        if not stop.is_set() and not _feed_ready.is_set():
+            _feed_ready.set()
+            logger.info("Feed ready — first bar pushed for %s", items[0][0])
 
 
 # ---------------------------------------------------------------------------
 # Refresh loop
 # ---------------------------------------------------------------------------
 
+def _refresh_payload_cache() -> None:
+    """Re-encode the served /smc_live payloads after a compute cycle."""
+    try:
+        payload_cache.refresh()
+    except Exception as exc:
+        metric_counter("live_overlay.payload_cache_refresh.errors")
+        logger.error("Payload cache refresh error: %s", exc, exc_info=True)
+
+
 def _run_refresh_loop(stop: threading.Event) -> None:
     """Full overlay recompute on the standard refresh cadence."""
     secs = config.refresh_secs()
@@ -396,6 +467,7 @@ def _run_refresh_loop(stop: threading.Event) -> None:
             n = compute.run_full_compute_cycle()
             elapsed = time.monotonic() - t0
             logger.info("Full overlay computed: %d symbols in %.1fs", n, elapsed)
+            _refresh_payload_cache()
         except Exception as exc:
             metric_counter("live_overlay.full_compute_cycle.errors")
             logger.error("Full overlay compute error: %s", exc, exc_info=True)
@@ -413,6 +485,7 @@ def _run_flow_refresh_loop(stop: threading.Event) -> None:
             n = compute.run_flow_patch_cycle()
             elapsed = time.monotonic() - t0
             logger.debug("Flow patch: %d symbols in %.1fs", n, elapsed)
+            _refresh_payload_cache()
         except Exception as exc:
             metric_counter("live_overlay.flow_patch_cycle.errors")
             logger.error("Flow patch error: %s", exc, exc_info=True)
@@ -439,7 +512,7 @@ def _do_start() -> None:
         or (_flow_refresh_thread is not None and _flow_refresh_thread.is_alive())
     )
     if _runtime.get("ingest_queue") is None or (_runtime.get("ingest_queue_max") != desired_queue_max and not workers_alive):
-        _runtime["ingest_queue"] = queue.Queue(maxsize=desired_queue_max)
+        _runtime["ingest_queue"] = IngestBuffer(maxsize=desired_queue_max)
         _runtime["ingest_queue_max"] = desired_queue_max
     elif _runtime.get("ingest_queue_max") != desired_queue_max:
         logger.warning(
@@ -527,7 +600,7 @@ def stop() -> None:
         ingest_queue = _runtime.get("ingest_queue")
         if ingest_queue is not None and ingest_thread is not None and ingest_thread.is_alive():
             try:
-                # Wake a potentially blocked queue.get(timeout=0.5) so stop()
+                # Wake a potentially blocked drain(timeout=0.5) so stop()
                 # does not need to wait for timeout jitter during teardown.
                 ingest_queue.put_nowait(_INGEST_STOP_SENTINEL)
             except queue.Full:
@@ -14,22 +14,32 @@ Stale handling:
   If the overlay cache is older than OVERLAY_MAX_STALE_SECS, the response
   still returns 200 but with stale=true and asof_ts showing the last computation
   time, so Pine can degrade gracefully to the baked mp.* defaults.
+
+Conditional requests:
+  /smc_live serves pre-encoded bytes from payload_cache with a weak ETag;
+  a poller that sends If-None-Match gets a 304 while the payload is unchanged.
+  Large bodies are sent gzip-encoded when Accept-Encoding allows it.
+
+Metrics exposition:
+  /metrics and /{token}/metrics render OpenMetrics 1.0 when Accept lists
+  application/openmetrics-text (Prometheus' default scrape Accept does) and the
+  Prometheus 0.0.4 text format otherwise, gzip-encoded when Accept-Encoding allows it.
 """
 from __future__ import annotations
 
 import base64
 import binascii
 import datetime
+import gzip
 import logging
-import math
 import time
 from contextlib import asynccontextmanager
-from typing import Any
+from typing import Annotated
 
-from fastapi import FastAPI, HTTPException, Path, Query, Request
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi import FastAPI, Header, HTTPException, Path, Query, Request
+from fastapi.responses import JSONResponse, Response
 
-from . import cache, compute, config, feed, metrics, observability, request_hotspots
+from . import cache, compute, config, feed, metrics, observability, payload_cache, request_hotspots
 from .market_hours import (
     compute_daemon_health_status,
 )
@@ -49,18 +59,7 @@ _startup_ts: float = 0.0
 
 _VALID_TFS: frozenset[str] = frozenset(compute.supported_timeframes())
 
-
-def _json_safe(value: Any) -> Any:
-    """Return a JSON-safe value tree by normalizing non-finite floats to None."""
-    if isinstance(value, float) or value.__class__.__name__ == "Decimal":
-        return _coerced if math.isfinite(_coerced := float(value)) else None
-    if isinstance(value, dict):
-        return {k: _json_safe(v) for k, v in value.items()}
-    if isinstance(value, list):
-        return [_json_safe(v) for v in value]
-    if isinstance(value, tuple):
-        return [_json_safe(v) for v in value]
-    return value
+_json_safe = payload_cache.json_safe
 
 
 # ---------------------------------------------------------------------------
@@ -210,12 +209,52 @@ def ready() -> JSONResponse:
     )
 
 
+# ---------------------------------------------------------------------------
+# Metrics exposition format / encoding negotiation
+# ---------------------------------------------------------------------------
+
+_PROMETHEUS_TEXT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+_OPENMETRICS_TEXT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+def _accepts_openmetrics(accept: str | None) -> bool:
+    """True when ``Accept`` lists ``application/openmetrics-text`` (q > 0)."""
+    for item in (accept or "").split(","):
+        media_type, *params = item.split(";")
+        if media_type.strip().lower() != "application/openmetrics-text":
+            continue
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key.lower() == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+def _metrics_response(accept: str | None, accept_encoding: str | None) -> Response:
+    openmetrics = _accepts_openmetrics(accept)
+    body = metrics.render_metrics(_startup_ts, openmetrics=openmetrics).encode("utf-8")
+    headers = {"Vary": "Accept, Accept-Encoding"}
+    if accept_encoding and payload_cache.accepts_gzip(accept_encoding):
+        body = gzip.compress(body, compresslevel=1, mtime=0)
+        headers["Content-Encoding"] = "gzip"
+    media_type = _OPENMETRICS_TEXT_TYPE if openmetrics else _PROMETHEUS_TEXT_TYPE
+    return Response(body, media_type=media_type, headers=headers)
+
+
 # ---------------------------------------------------------------------------
 # /{token}/metrics — Prometheus text exposition (token-protected, legacy path)
 # ---------------------------------------------------------------------------
 
 @app.get("/{token}/metrics", include_in_schema=False)
-def prometheus_metrics_legacy(token: str = Path(...)) -> PlainTextResponse:
+def prometheus_metrics_legacy(
+    token: str = Path(...),
+    accept: Annotated[str | None, Header()] = None,
+    accept_encoding: Annotated[str | None, Header()] = None,
+) -> Response:
     """Prometheus scrape endpoint, protected by the same path secret as /smc_live.
 
     Legacy path kept for backwards compatibility. New deployments should use
@@ -226,8 +265,7 @@ def prometheus_metrics_legacy(token: str = Path(...)) -> PlainTextResponse:
     if not _ct_eq(token, expected):
         raise HTTPException(status_code=404)
 
-    body = metrics.render_metrics(_startup_ts)
-    return PlainTextResponse(body, media_type="text/plain; version=0.0.4; charset=utf-8")
+    return _metrics_response(accept, accept_encoding)
 
 
 # ---------------------------------------------------------------------------
@@ -257,7 +295,11 @@ def _basic_auth_password(request: Request) -> str | None:
 
 
 @app.get("/metrics", include_in_schema=False)
-def prometheus_metrics(request: Request) -> PlainTextResponse:
+def prometheus_metrics(
+    request: Request,
+    accept: Annotated[str | None, Header()] = None,
+    accept_encoding: Annotated[str | None, Header()] = None,
+) -> Response:
     """Prometheus scrape endpoint protected by Basic auth.
 
     Uses the overlay secret token as the Basic auth password. This keeps the
@@ -270,50 +312,7 @@ def prometheus_metrics(request: Request) -> PlainTextResponse:
     if password is None or not _ct_eq(password, expected):
         raise HTTPException(status_code=401, headers={"WWW-Authenticate": "Basic"})
 
-    body = metrics.render_metrics(_startup_ts)
-    return PlainTextResponse(body, media_type="text/plain; version=0.0.4; charset=utf-8")
-
-
-# ---------------------------------------------------------------------------
-# Timeframe-aware payload lookup / on-demand compute
-# ---------------------------------------------------------------------------
-
-def _get_payload_for_timeframe(sym: str, tf: str) -> dict[str, Any] | None:
-    """Return overlay payload for symbol and timeframe.
-
-    The background refresh thread computes the default 5m timeframe and stores
-    it in the overlay cache. For non-default timeframes we aggregate the cached
-    1-minute bars on demand so callers still get timeframe-consistent fields.
-    """
-    if tf == "5m":
-        return cache.get_overlay(sym)
-
-    bars = cache.get_bars_snapshot(sym)
-    if not bars:
-        return None
-    payload = compute.build_payload(
-        sym,
-        bars,
-        compute.get_global_news_fields(),
-        config.max_stale_secs(),
-        tf=tf,
-    )
-    # On-demand payloads should be marked stale based on bar recency, not
-    # overlay cache age (which tracks only the background 5m snapshot).
-    valid_ts_events = [
-        ts
-        for bar in bars
-        if isinstance((ts := bar.get("ts_event")), int)
-        and not isinstance(ts, bool)
-        and ts > 0
-    ]
-    if not valid_ts_events:
-        payload["stale"] = True
-        return payload
-
-    latest_bar_age_secs = max(0.0, time.time() - (max(valid_ts_events) / 1_000_000_000))
-    payload["stale"] = latest_bar_age_secs > config.max_stale_secs()
-    return payload
+    return _metrics_response(accept, accept_encoding)
 
 
 # ---------------------------------------------------------------------------
@@ -325,7 +324,9 @@ def smc_live(
     token: str = Path(...),
     symbol: str = Query(..., min_length=1, max_length=10),
     tf: str = Query("5m", max_length=8),  # timeframe hint — stored in response
-) -> JSONResponse:
+    if_none_match: Annotated[str | None, Header()] = None,
+    accept_encoding: Annotated[str | None, Header()] = None,
+) -> Response:
     started_at, record_latency = time.monotonic(), False
     observability.metric_counter("live_overlay.smc_live_requests.total")
     sym = symbol.upper().strip()
@@ -347,10 +348,10 @@ def smc_live(
                 detail=f"tf must be one of {sorted(_VALID_TFS)}",
             )
         record_latency = True
-        payload = _get_payload_for_timeframe(sym, tf)
+        encoded, hit = payload_cache.get_encoded(sym, tf)
         request_hotspots.record_request(sym, tf)
 
-        if payload is None:
+        if encoded is None:
             observability.metric_counter("live_overlay.smc_live_cache_miss.total")
             observability.metric_counter("live_overlay.smc_live_stale_served.total")
             observability.audit_event("smc_live_fetch", "cache_miss", symbol=sym, tf=tf)
@@ -382,19 +383,22 @@ def smc_live(
                 }
             )
 
-        payload = dict(payload)  # shallow-copy — do not mutate shared cache state
-        if tf == "5m":
-            # Re-evaluate stale for cached background snapshots.
-            age = cache.overlay_age_secs()
-            max_stale = config.max_stale_secs()
-            payload["stale"] = (age > max_stale) if age != float("inf") else True
-        if payload.get("stale"):
+        observability.metric_counter(
+            "live_overlay.smc_live_payload_cache_hit.total" if hit else "live_overlay.smc_live_payload_cache_build.total"
+        )
+        if encoded.stale:
             observability.metric_counter("live_overlay.smc_live_stale_served.total")
-        # Inject tf into response
-        payload["tf"] = tf
         observability.metric_counter("live_overlay.smc_live_success.total")
-        observability.audit_event("smc_live_fetch", "ok", symbol=sym, tf=tf, stale=payload["stale"])
-        return JSONResponse(_json_safe(payload))
+        observability.audit_event("smc_live_fetch", "ok", symbol=sym, tf=tf, stale=encoded.stale)
+        # Pollers revalidate every time (no-cache) and get a 304 while the payload is unchanged.
+        headers = {"ETag": encoded.etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+        if if_none_match and payload_cache.etag_matches(if_none_match, encoded.etag):
+            observability.metric_counter("live_overlay.smc_live_not_modified.total")
+            return Response(status_code=304, headers=headers)
+        if encoded.gzip_body is not None and accept_encoding and payload_cache.accepts_gzip(accept_encoding):
+            headers["Content-Encoding"] = "gzip"
+            return Response(encoded.gzip_body, media_type="application/json", headers=headers)
+        return Response(encoded.body, media_type="application/json", headers=headers)
     except Exception as exc:
         # Let FastAPI's own HTTPExceptions (auth denied, bad tf, etc.) propagate
         # unchanged; only unexpected failures (cache/config bugs, etc.) become
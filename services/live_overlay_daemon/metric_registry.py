@@ -0,0 +1,83 @@
+"""
+Cached exposition fragments for the Prometheus renderer.
+
+Leaf module (stdlib only). ``metrics.render_metrics`` used to format every
+in-process counter on every scrape (name sanitizing, value coercion and
+f-strings per series), so scrape cost grew with the number of counters
+even when almost none had moved. ``FragmentRegistry`` keeps one rendered
+text fragment per metric family, in both the Prometheus text format and
+OpenMetrics, and re-renders a family only when its value changed since
+the previous scrape; the section body is the join of the cached fragments
+and is itself reused while nothing changed.
+
+Design notes:
+  - The source of truth stays ``observability._counters``. ``render()`` is
+    handed a snapshot and compares each value with the one its fragment was
+    rendered from (identity first, then ``==``), so updates are picked up
+    however the counter was written, and no bookkeeping is added to the
+    ``metric_counter`` hot path.
+  - Families missing from the snapshot are dropped; the sorted family order
+    is rebuilt only when the set of names changes.
+  - Scrapes may run concurrently on the server's thread pool, so the
+    registry state is guarded by one lock.
+"""
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Mapping
+
+
+class FragmentRegistry:
+    """Per-family cached text fragments, joined in sorted family-name order."""
+
+    __slots__ = ("_bodies", "_families", "_lock", "_order", "_render")
+
+    def __init__(self, render: Callable[[str, object], tuple[str, str]]) -> None:
+        # render(name, value) -> (Prometheus text fragment, OpenMetrics fragment)
+        self._render = render
+        self._lock = threading.Lock()
+        # name → (value the fragments were rendered from, fragments)
+        self._families: dict[str, tuple[object, tuple[str, str]]] = {}
+        self._order: list[str] | None = None
+        # joined section per format: index 0 = Prometheus text, 1 = OpenMetrics
+        self._bodies: list[str | None] = [None, None]
+
+    def render(self, values: Mapping[str, object], *, openmetrics: bool = False) -> str:
+        """Return the section for ``values``, re-rendering only the families that changed."""
+        with self._lock:
+            families = self._families
+            changed = False
+            for name, value in values.items():
+                family = families.get(name)
+                if family is not None and (family[0] is value or family[0] == value):
+                    continue
+                if family is None:
+                    self._order = None
+                families[name] = (value, self._render(name, value))
+                changed = True
+            if len(families) != len(values):
+                for name in [name for name in families if name not in values]:
+                    del families[name]
+                self._order = None
+                changed = True
+            if changed:
+                self._bodies = [None, None]
+            index = 1 if openmetrics else 0
+            body = self._bodies[index]
+            if body is None:
+                if self._order is None:
+                    self._order = sorted(families)
+                body = "".join([families[name][1][index] for name in self._order])
+                self._bodies[index] = body
+            return body
+
+    def family_count(self) -> int:
+        with self._lock:
+            return len(self._families)
+
+    def reset(self) -> None:
+        """Drop every cached fragment (tests/benchmarks only)."""
+        with self._lock:
+            self._families.clear()
+            self._order = None
+            self._bodies = [None, None]
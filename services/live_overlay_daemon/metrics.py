@@ -6,6 +6,13 @@ heavyweight prometheus_client dependency.
 
 Single-worker deployment (uvicorn --workers 1) guarantees these in-process
 values are consistent and complete.
+
+The in-process counter section grows with every counter ever recorded, so it
+is rendered through a metric_registry.FragmentRegistry: one cached fragment
+per counter, re-rendered only when its value changed since the last scrape.
+``render_metrics(..., openmetrics=True)`` renders the OpenMetrics 1.0 text
+format instead (counter families ending in ``_total``; other counters keep
+their sample name and are typed ``unknown``; ``# EOF`` terminator).
 """
 
 from __future__ import annotations
@@ -22,6 +29,7 @@ from . import (
     config,
     feed,
     github_workflow_bridge,
+    metric_registry,
     observability,
     railway_metrics,
     request_hotspots,
@@ -936,8 +944,60 @@ def _append_bridge_metrics(
     )
 
 
-def render_metrics(startup_ts: float) -> str:
-    """Return Prometheus text-format exposition of all daemon metrics."""
+def _counter_fragments(name: str, value: object) -> tuple[str, str]:
+    """Render one in-process counter as (Prometheus text, OpenMetrics) fragments."""
+    prom_name = _sanitize_name(name)
+    sample = f"{prom_name} {_prom_numeric_value(value)}\n"
+    family, kind = _openmetrics_family(prom_name, "counter")
+    return f"# TYPE {prom_name} counter\n{sample}", f"# TYPE {family} {kind}\n{sample}"
+
+
+def _openmetrics_family(prom_name: str, kind: str) -> tuple[str, str]:
+    """Map a Prometheus ``# TYPE`` name/kind to its OpenMetrics family name/kind.
+
+    OpenMetrics counter samples must be ``<family>_total``. Counters already
+    named that way become the ``<family>`` counter family; the rest keep their
+    sample name (dashboards query it) and are exposed as ``unknown``.
+    """
+    if kind != "counter":
+        return prom_name, kind
+    if prom_name.endswith("_total"):
+        return prom_name[: -len("_total")], kind
+    return prom_name, "unknown"
+
+
+def _openmetrics_lines(lines: list[str]) -> list[str]:
+    """Rewrite Prometheus text lines to OpenMetrics.
+
+    OpenMetrics allows one ``# TYPE`` line per family and no interleaving, so
+    samples are regrouped under the family that first declared them (the
+    bridge series, for example, are emitted once per bridge).
+    """
+    families: dict[str, list[str]] = {}
+    owners: dict[str, str] = {}  # sample name → family
+    current: list[str] = families.setdefault("", [])
+    for line in lines:
+        if line.startswith("# TYPE "):
+            _, _, prom_name, kind = line.split(" ", 3)
+            family, kind = _openmetrics_family(prom_name, kind)
+            if family not in families:
+                families[family] = [f"# TYPE {family} {kind}"]
+                owners[prom_name] = family
+                if kind == "histogram":
+                    owners.update((f"{family}{suffix}", family) for suffix in ("_bucket", "_sum", "_count"))
+            current = families[family]
+            continue
+        sample_name = line.partition("{")[0].partition(" ")[0]
+        owner = owners.get(sample_name)
+        (current if owner is None else families[owner]).append(line)
+    return [line for group in families.values() for line in group]
+
+
+_counter_families = metric_registry.FragmentRegistry(_counter_fragments)
+
+
+def render_metrics(startup_ts: float, *, openmetrics: bool = False) -> str:
+    """Return the exposition of all daemon metrics (Prometheus text or OpenMetrics)."""
     lines: list[str] = []
 
     # --- Counters from observability ---
@@ -959,10 +1019,7 @@ def render_metrics(startup_ts: float) -> str:
     ):
         counters.setdefault(traffic_counter, 0.0)
 
-    for name, value in sorted(counters.items()):
-        prom_name = _sanitize_name(name)
-        lines.append(f"# TYPE {prom_name} counter")
-        lines.append(f"{prom_name} {_prom_numeric_value(value)}")
+    counter_section = _counter_families.render(counters, openmetrics=openmetrics)
 
     hotspot = request_hotspots.snapshot(top_n=5)
     lines.append("# TYPE live_overlay_hotspot_symbols_tracked gauge")
@@ -1714,5 +1771,8 @@ def render_metrics(startup_ts: float) -> str:
     # --- Process-level metrics (CPU, memory, FDs, GC) ---
     lines.extend(_collect_process_metrics(startup_ts))
 
+    if openmetrics:
+        lines = _openmetrics_lines(lines)
+        lines.append("# EOF")
     lines.append("")  # trailing newline
-    return "\n".join(lines)
+    return counter_section + "\n".join(lines)
@@ -0,0 +1,221 @@
+"""
+Pre-encoded /smc_live response cache.
+
+Holds the response body of every served symbol/timeframe as JSON bytes
+(plus a gzip copy when it is large enough) with a weak ETag, so a hit
+serves bytes without rebuilding, deep-copying or re-serializing the
+payload and a poller that sends ``If-None-Match`` gets a 304.
+
+Design notes:
+  - Each entry records the input version it was encoded from: the symbol's
+    overlay version (``cache.overlay_version``; moves on every full cycle
+    and flow patch) and, for timeframes other than 5m, its bar ring version
+    (``cache.bar_version``; moves on every pushed bar). A request whose
+    current version differs rebuilds the entry, so a hit never serves data
+    older than the on-demand path would have computed.
+  - ``stale`` depends on the clock as well, so it is part of the entry; a
+    request whose current stale flag differs rebuilds the entry too.
+  - refresh() runs on the refresh threads after each compute cycle and
+    re-encodes the 5m payload of every overlay symbol plus every other
+    entry still held (the timeframes actually served), so pollers hit
+    pre-encoded bytes right after a cycle. Entries of symbols that left
+    the overlay and bar caches are dropped there.
+  - Per user memory (concurrency-shared-mutables.md): ``_entries`` is
+    touched from HTTP and refresh threads and is guarded by ``_lock``.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import math
+import threading
+import time
+from typing import Any, NamedTuple
+
+from . import cache, compute, config
+
+_DEFAULT_TF = "5m"
+
+
+class EncodedPayload(NamedTuple):
+    """One encoded /smc_live response body and the inputs it was built from."""
+
+    body: bytes
+    gzip_body: bytes | None
+    etag: str
+    stale: bool
+    # (overlay version, bar version); None parts are not cacheable
+    version: tuple[int | None, int | None]
+
+
+_lock = threading.Lock()
+# (symbol, tf) → encoded response
+_entries: dict[tuple[str, str], EncodedPayload] = {}
+
+
+def json_safe(value: Any) -> Any:
+    """Return a JSON-safe value tree by normalizing non-finite floats to None."""
+    if isinstance(value, float) or value.__class__.__name__ == "Decimal":
+        return _coerced if math.isfinite(_coerced := float(value)) else None
+    if isinstance(value, dict):
+        return {k: json_safe(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [json_safe(v) for v in value]
+    if isinstance(value, tuple):
+        return [json_safe(v) for v in value]
+    return value
+
+
+def payload_for_timeframe(sym: str, tf: str) -> dict[str, Any] | None:
+    """Return the /smc_live payload for symbol and timeframe, or None when uncached.
+
+    The background refresh thread computes the default 5m timeframe and stores
+    it in the overlay cache. For non-default timeframes we read the cache's
+    rolling aggregate of the 1-minute bars so callers still get
+    timeframe-consistent fields without re-bucketing the window per request.
+    The returned dict is a copy with ``stale`` re-evaluated and ``tf`` set.
+    """
+    if tf == _DEFAULT_TF:
+        payload = cache.get_overlay(sym)
+        if payload is None:
+            return None
+    else:
+        bars = cache.get_timeframe_bars_snapshot(sym, tf)
+        if bars is None:
+            return None
+        payload = compute.build_payload(
+            sym,
+            bars,
+            compute.get_global_news_fields(),
+            config.max_stale_secs(),
+            tf=tf,
+            preaggregated=True,
+        )
+    payload = dict(payload)  # shallow-copy — do not mutate shared cache state
+    payload["stale"] = _is_stale(sym, tf)
+    payload["tf"] = tf
+    return payload
+
+
+def _is_stale(sym: str, tf: str) -> bool:
+    max_stale = config.max_stale_secs()
+    if tf == _DEFAULT_TF:
+        # Cached background snapshots are stale by overlay cache age.
+        age = cache.overlay_age_secs()
+        return (age > max_stale) if age != float("inf") else True
+    # On-demand payloads should be marked stale based on bar recency, not
+    # overlay cache age (which tracks only the background 5m snapshot).
+    latest_ts_event = cache.latest_bar_ts_event(sym)
+    if latest_ts_event is None:
+        return True
+    latest_bar_age_secs = max(0.0, time.time() - (latest_ts_event / 1_000_000_000))
+    return latest_bar_age_secs > max_stale
+
+
+def _input_version(sym: str, tf: str) -> tuple[int | None, int | None]:
+    overlay_version = cache.overlay_version(sym)
+    if tf == _DEFAULT_TF:
+        return (overlay_version, 0) if overlay_version is not None else (None, None)
+    return (overlay_version, cache.bar_version(sym))
+
+
+def _cacheable(version: tuple[int | None, int | None]) -> bool:
+    # Non-5m payloads embed the overlay's news / VIX inputs only through the
+    # overlay version, so both parts are required.
+    return version[0] is not None and version[1] is not None
+
+
+def encode(payload: dict[str, Any], version: tuple[int | None, int | None] = (None, None)) -> EncodedPayload:
+    """Encode ``payload`` the way ``JSONResponse`` renders it, plus gzip and ETag."""
+    body = json.dumps(
+        json_safe(payload), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+    gzip_body = gzip.compress(body, mtime=0) if len(body) >= config.payload_gzip_min_bytes() else None
+    # Weak: the gzip and identity bodies are the same representation.
+    etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    return EncodedPayload(body, gzip_body, etag, bool(payload.get("stale")), version)
+
+
+def _build(sym: str, tf: str) -> EncodedPayload | None:
+    # Read the version first: a payload newer than its version only costs a
+    # rebuild on the next request, never a stale hit.
+    version = _input_version(sym, tf)
+    payload = payload_for_timeframe(sym, tf)
+    if payload is None:
+        return None
+    return encode(payload, version)
+
+
+def get_encoded(sym: str, tf: str) -> tuple[EncodedPayload | None, bool]:
+    """Return the encoded response for symbol/timeframe and whether it was a cache hit.
+
+    Returns ``(None, False)`` when there is no payload for the symbol.
+    """
+    version = _input_version(sym, tf)
+    if _cacheable(version):
+        with _lock:
+            entry = _entries.get((sym, tf))
+        if entry is not None and entry.version == version and entry.stale == _is_stale(sym, tf):
+            return entry, True
+    entry = _build(sym, tf)
+    if entry is not None and _cacheable(entry.version):
+        with _lock:
+            _entries[(sym, tf)] = entry
+    return entry, False
+
+
+def refresh() -> int:
+    """Re-encode the 5m payload of every overlay symbol and every other held entry.
+
+    Called by the refresh threads after each compute cycle. Returns the
+    number of entries held afterwards.
+    """
+    with _lock:
+        keys = set(_entries)
+    keys.update((sym, _DEFAULT_TF) for sym in cache.overlay_versions())
+    entries: dict[tuple[str, str], EncodedPayload] = {}
+    for sym, tf in keys:
+        entry = _build(sym, tf)
+        if entry is not None and _cacheable(entry.version):
+            entries[(sym, tf)] = entry
+    with _lock:
+        _entries.clear()
+        _entries.update(entries)
+    return len(entries)
+
+
+def entry_count() -> int:
+    with _lock:
+        return len(_entries)
+
+
+def reset() -> None:
+    """Drop every cached entry (tests/debug only)."""
+    with _lock:
+        _entries.clear()
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak ``If-None-Match`` comparison (RFC 9110 §13.1.2)."""
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """True when ``Accept-Encoding`` allows gzip (an explicit ``q=0`` refuses it)."""
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        if coding.strip().lower() not in {"gzip", "*"}:
+            continue
+        q = params.strip().lower().removeprefix("q=")
+        try:
+            return not params.strip() or float(q) > 0
+        except ValueError:
+            return False
+    return False
+
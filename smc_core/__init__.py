@@ -1,38 +1,93 @@
-from .ensemble_quality import EnsembleQualityResult, build_ensemble_quality, serialize_ensemble_quality
-from .layering import apply_layering, derive_base_signals, normalize_meta
-from .schema_version import SCHEMA_VERSION
-from .serialization import snapshot_to_dict
-from .types import (
-    BaseLayerSignals,
-    BosDir,
-    BosEvent,
-    BosEventKind,
-    DirectionalStrength,
-    EnrichedNews,
-    EventRisk,
-    EventSeverity,
-    EventType,
-    Fvg,
-    FvgDir,
-    LiquiditySweep,
-    MarketRegime,
-    MarketRegimeContext,
-    NewsCategory,
-    ObDir,
-    Orderblock,
-    ReasonCode,
-    SmcLayered,
-    SmcMeta,
-    SmcSnapshot,
-    SmcStructure,
-    SweepSide,
-    TimedDirectionalStrength,
-    TimedEnrichedNews,
-    TimedVolumeInfo,
-    VolumeInfo,
-    VolumeRegime,
-    ZoneStyle,
-)
+"""SMC core types, layering and scoring.
+
+The re-exports below resolve lazily: ``from smc_core.schema_version import
+SESSION_SCHEMA_VERSION`` (the screener and the terminal) only loads that
+submodule, not the scoring / layering stack behind ``smc_core.types``.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .ensemble_quality import EnsembleQualityResult, build_ensemble_quality, serialize_ensemble_quality
+    from .layering import apply_layering, derive_base_signals, normalize_meta
+    from .schema_version import SCHEMA_VERSION
+    from .serialization import snapshot_to_dict
+    from .types import (
+        BaseLayerSignals,
+        BosDir,
+        BosEvent,
+        BosEventKind,
+        DirectionalStrength,
+        EnrichedNews,
+        EventRisk,
+        EventSeverity,
+        EventType,
+        Fvg,
+        FvgDir,
+        LiquiditySweep,
+        MarketRegime,
+        MarketRegimeContext,
+        NewsCategory,
+        ObDir,
+        Orderblock,
+        ReasonCode,
+        SmcLayered,
+        SmcMeta,
+        SmcSnapshot,
+        SmcStructure,
+        SweepSide,
+        TimedDirectionalStrength,
+        TimedEnrichedNews,
+        TimedVolumeInfo,
+        VolumeInfo,
+        VolumeRegime,
+        ZoneStyle,
+    )
+
+# Public name -> defining submodule, imported on first access via
+# :func:`__getattr__` (PEP 562).
+_EXPORTS: dict[str, str] = {
+    "EnsembleQualityResult": ".ensemble_quality",
+    "build_ensemble_quality": ".ensemble_quality",
+    "serialize_ensemble_quality": ".ensemble_quality",
+    "apply_layering": ".layering",
+    "derive_base_signals": ".layering",
+    "normalize_meta": ".layering",
+    "SCHEMA_VERSION": ".schema_version",
+    "snapshot_to_dict": ".serialization",
+    "BaseLayerSignals": ".types",
+    "BosDir": ".types",
+    "BosEvent": ".types",
+    "BosEventKind": ".types",
+    "DirectionalStrength": ".types",
+    "EnrichedNews": ".types",
+    "EventRisk": ".types",
+    "EventSeverity": ".types",
+    "EventType": ".types",
+    "Fvg": ".types",
+    "FvgDir": ".types",
+    "LiquiditySweep": ".types",
+    "MarketRegime": ".types",
+    "MarketRegimeContext": ".types",
+    "NewsCategory": ".types",
+    "ObDir": ".types",
+    "Orderblock": ".types",
+    "ReasonCode": ".types",
+    "SmcLayered": ".types",
+    "SmcMeta": ".types",
+    "SmcSnapshot": ".types",
+    "SmcStructure": ".types",
+    "SweepSide": ".types",
+    "TimedDirectionalStrength": ".types",
+    "TimedEnrichedNews": ".types",
+    "TimedVolumeInfo": ".types",
+    "VolumeInfo": ".types",
+    "VolumeRegime": ".types",
+    "ZoneStyle": ".types",
+}
 
 __all__ = [
     "SCHEMA_VERSION",
@@ -73,3 +128,14 @@ __all__ = [
     "serialize_ensemble_quality",
     "snapshot_to_dict",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(submodule, __name__), name)
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
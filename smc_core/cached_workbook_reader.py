@@ -1,10 +1,60 @@
+"""Shared reader for the production workbook's ``daily_bars`` sheet.
+
+Design notes:
+  - The xlsx parse is the expensive part (seconds for a full-universe
+    workbook), so the first read materializes a Parquet sidecar that every
+    later reader -- in this process or any other -- uses instead.
+  - Sidecars are content-addressed: the file name is the sha256 of the
+    workbook bytes. A small per-workbook index records the (mtime_ns, size)
+    the hash was taken at, so an unchanged workbook is never re-hashed and a
+    touched-but-identical one is re-hashed but never re-parsed.
+  - Rows are stored sorted by normalized symbol with an ``__row`` column
+    holding the sheet order, so a ``symbols=`` read only decodes the row
+    groups whose min/max statistics can contain those symbols, and the
+    result is restored to sheet order with the sheet's row labels.
+  - Sidecar writes are best effort (temp file + ``os.replace``). When the
+    cache dir is not writable or the sheet does not convert to Arrow, reads
+    fall back to the in-process memoized xlsx parse with identical output.
+  - The producer also writes the workbook's sheets as a Parquet sheet
+    dataset (``<workbook stem>_sheets/``: one file per sheet plus a
+    ``sheets.json`` index). When that dataset is at least as new as the
+    xlsx, ``daily_bars`` is read from it and the xlsx is never parsed; the
+    xlsx may then be missing altogether (``DATABENTO_PRODUCTION_WORKBOOK_XLSX=off``).
+"""
+
 from __future__ import annotations
 
 import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections.abc import Iterable
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
+SIDECAR_DIR_ENV = "SMC_DAILY_BARS_SIDECAR_DIR"
+SIDECAR_DISABLE_ENV = "SMC_DAILY_BARS_SIDECAR_DISABLE"
+DEFAULT_SIDECAR_DIRNAME = ".daily_bars_sidecar"
+SIDECAR_FORMAT_VERSION = "1"
+
+_ROW_COLUMN = "__row"
+_SYMBOL_KEY_COLUMN = "__symbol_key"
+_HIDDEN_COLUMNS = (_ROW_COLUMN, _SYMBOL_KEY_COLUMN)
+# ~250 trading days per symbol, so one row group spans a few hundred symbols
+# and a single-symbol read decodes one (occasionally two) of them.
+_ROW_GROUP_SIZE = 65_536
+_HASH_CHUNK_BYTES = 1 << 20
+
+SHEET_DATASET_SUFFIX = "_sheets"
+SHEET_DATASET_INDEX_NAME = "sheets.json"
+SHEET_DATASET_FORMAT_VERSION = "1"
+
 
 @functools.lru_cache(maxsize=8)
 def _read_daily_bars_cached(resolved_path: str, mtime_ns: int) -> pd.DataFrame:
@@ -18,15 +68,231 @@ def _read_daily_bars_cached(resolved_path: str, mtime_ns: int) -> pd.DataFrame:
     return pd.read_excel(resolved_path, sheet_name="daily_bars")
 
 
-def read_daily_bars(workbook: str | Path) -> pd.DataFrame:
-    """Return the workbook's ``daily_bars`` sheet, memoized by path + mtime.
+def read_sheet_dataset_index(dataset_dir: str | Path) -> dict[str, Any]:
+    index_path = Path(dataset_dir).expanduser() / SHEET_DATASET_INDEX_NAME
+    payload = json.loads(index_path.read_text(encoding="utf-8"))
+    if str(payload.get("format_version")) != SHEET_DATASET_FORMAT_VERSION:
+        raise ValueError(
+            f"unsupported sheet dataset format {payload.get('format_version')!r} in {index_path}"
+        )
+    return payload
 
-    The heavy ``pd.read_excel`` xlsx parse is shared across the many callers
-    (structure-artifact export, structure batch, measurement evidence) that all
-    read the same daily-only workbook repeatedly. A fresh ``.copy()`` is handed
-    out on every call so downstream mutation cannot leak between callers and
-    test isolation is preserved.
+
+def read_production_workbook_sheet(
+    dataset_dir: str | Path,
+    sheet: str,
+    *,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """Load one workbook sheet from the Parquet sheet dataset.
+
+    This is the primary read path for the canonical workbook's content: it
+    returns the frame's original dtypes (tz-aware timestamps, dates, bools)
+    without an xlsx parse. ``columns`` projects to the named columns.
     """
-    path = Path(workbook)
-    frame = _read_daily_bars_cached(str(path.resolve()), path.stat().st_mtime_ns)
+    root = Path(dataset_dir).expanduser()
+    for entry in read_sheet_dataset_index(root)["sheets"]:
+        if entry["name"] == sheet:
+            return pd.read_parquet(root / entry["file"], columns=columns)
+    raise KeyError(f"sheet {sheet!r} not found in workbook sheet dataset {root}")
+
+
+def sheet_dataset_for(workbook: str | Path) -> Path | None:
+    """Return the sheet dataset written with ``workbook``, or None when absent or stale.
+
+    The dataset is current when its index is at least as new as the xlsx (the
+    producer touches the index after rendering the xlsx) or the xlsx is
+    missing. A workbook rewritten later by an xlsx-only writer wins.
+    """
+    path = Path(workbook).expanduser()
+    dataset = path.with_name(f"{path.stem}{SHEET_DATASET_SUFFIX}")
+    try:
+        index_mtime_ns = (dataset / SHEET_DATASET_INDEX_NAME).stat().st_mtime_ns
+    except OSError:
+        return None
+    try:
+        if path.stat().st_mtime_ns > index_mtime_ns:
+            return None
+    except FileNotFoundError:
+        pass
+    return dataset
+
+
+@functools.lru_cache(maxsize=8)
+def _read_dataset_daily_bars_cached(dataset_dir: str, index_mtime_ns: int) -> pd.DataFrame:
+    """``daily_bars`` of a sheet dataset, memoized per (dataset, index mtime) like the xlsx parse."""
+    return read_production_workbook_sheet(dataset_dir, "daily_bars")
+
+
+def _normalize_symbols(symbols: Iterable[str]) -> list[str]:
+    return sorted({str(symbol).strip().upper() for symbol in symbols})
+
+
+def _symbol_keys(frame: pd.DataFrame) -> pd.Series:
+    return frame["symbol"].astype(str).str.strip().str.upper()
+
+
+def _select(frame: pd.DataFrame, symbols: list[str] | None, columns: list[str] | None) -> pd.DataFrame:
+    """Apply the symbol filter / column projection to a parsed sheet (copy)."""
+    if symbols is not None:
+        if "symbol" in frame.columns:
+            frame = frame.loc[_symbol_keys(frame).isin(symbols)]
+        else:
+            frame = frame.iloc[0:0]
+    if columns is not None:
+        frame = frame[[column for column in columns if column in frame.columns]]
     return frame.copy()
+
+
+def sidecar_dir_for(workbook: Path, cache_dir: str | Path | None = None) -> Path:
+    """Return the sidecar directory for ``workbook``.
+
+    Resolution order: explicit ``cache_dir``, ``$SMC_DAILY_BARS_SIDECAR_DIR``,
+    then ``.daily_bars_sidecar/`` next to the workbook.
+    """
+    if cache_dir is not None:
+        return Path(cache_dir)
+    env_dir = os.environ.get(SIDECAR_DIR_ENV, "").strip()
+    if env_dir:
+        return Path(env_dir)
+    return workbook.parent / DEFAULT_SIDECAR_DIRNAME
+
+
+def _workbook_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_atomic(target: Path, write) -> None:
+    # pid + thread id keeps concurrent writers (other processes, or threads of
+    # a structure batch) off each other's temp file; os.replace is atomic.
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, target)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _content_key(path: Path, stat: os.stat_result, sidecar_dir: Path) -> str:
+    """Return the workbook's sha256, reusing the index entry when unchanged."""
+    index_path = sidecar_dir / f"{path.name}.index.json"
+    try:
+        entry = json.loads(index_path.read_text(encoding="utf-8"))
+        if entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+            return str(entry["sha256"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+    sha256 = _workbook_sha256(path)
+    entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": sha256}
+    # ATOMIC-WRITE-EXEMPT: writes the temp file that ``_write_atomic`` os.replace()s.
+    _write_atomic(index_path, lambda tmp: tmp.write_text(json.dumps(entry, sort_keys=True), encoding="utf-8"))
+    return sha256
+
+
+def _write_sidecar(frame: pd.DataFrame, target: Path) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    stored = frame.reset_index(drop=True)
+    stored[_ROW_COLUMN] = range(len(stored))
+    if "symbol" in stored.columns:
+        stored[_SYMBOL_KEY_COLUMN] = _symbol_keys(stored)
+        stored = stored.sort_values([_SYMBOL_KEY_COLUMN, _ROW_COLUMN], kind="stable")
+    table = pa.Table.from_pandas(stored, preserve_index=False)
+    table = table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), b"skipp.daily_bars_sidecar": SIDECAR_FORMAT_VERSION.encode()}
+    )
+    _write_atomic(target, lambda tmp: pq.write_table(table, tmp, row_group_size=_ROW_GROUP_SIZE))
+
+
+def _ensure_sidecar(path: Path, stat: os.stat_result, cache_dir: str | Path | None) -> Path | None:
+    """Return the sidecar path for ``path``, building it on first use.
+
+    Returns None when the sidecar cannot be used (disabled, unwritable cache
+    dir, or a sheet that does not round-trip through Arrow).
+    """
+    if os.environ.get(SIDECAR_DISABLE_ENV, "").strip().lower() in {"1", "true", "yes"}:
+        return None
+    sidecar_dir = sidecar_dir_for(path, cache_dir)
+    try:
+        sidecar_dir.mkdir(parents=True, exist_ok=True)
+        sidecar = sidecar_dir / f"{_content_key(path, stat, sidecar_dir)}.daily_bars.parquet"
+        if sidecar.exists():
+            return sidecar
+        frame = _read_daily_bars_cached(str(path.resolve()), stat.st_mtime_ns)
+        _write_sidecar(frame, sidecar)
+    except OSError as exc:
+        logger.debug("daily_bars sidecar unavailable for %s: %s", path, exc)
+        return None
+    except (ImportError, TypeError, ValueError) as exc:
+        # pyarrow missing, or mixed-type object columns Arrow cannot encode.
+        logger.warning("daily_bars sidecar not written for %s: %s", path, exc)
+        return None
+    return sidecar
+
+
+def _read_sidecar(sidecar: Path, symbols: list[str] | None, columns: list[str] | None) -> pd.DataFrame:
+    import pyarrow.parquet as pq
+
+    parquet = pq.ParquetFile(sidecar)
+    stored_columns = [name for name in parquet.schema_arrow.names if name not in _HIDDEN_COLUMNS]
+    wanted = stored_columns if columns is None else [column for column in columns if column in stored_columns]
+    if symbols is not None and (not symbols or _SYMBOL_KEY_COLUMN not in parquet.schema_arrow.names):
+        table = parquet.schema_arrow.empty_table().select([*wanted, _ROW_COLUMN])
+    elif symbols is not None:
+        table = pq.read_table(
+            sidecar,
+            columns=[*wanted, _ROW_COLUMN],
+            filters=[(_SYMBOL_KEY_COLUMN, "in", symbols)],
+        )
+    else:
+        table = parquet.read(columns=[*wanted, _ROW_COLUMN])
+    frame = table.to_pandas().sort_values(_ROW_COLUMN, kind="stable")
+    if symbols is None:
+        frame.index = pd.RangeIndex(len(frame))
+    else:
+        frame.index = pd.Index(frame[_ROW_COLUMN].to_numpy(), dtype="int64")
+    return frame.drop(columns=[_ROW_COLUMN])
+
+
+def read_daily_bars(
+    workbook: str | Path,
+    *,
+    symbols: Iterable[str] | None = None,
+    columns: Iterable[str] | None = None,
+    cache_dir: str | Path | None = None,
+) -> pd.DataFrame:
+    """Return the workbook's ``daily_bars`` sheet, served from the sheet dataset or the Parquet sidecar.
+
+    ``symbols`` keeps only rows whose stripped, upper-cased ``symbol`` is in
+    the set; ``columns`` projects to those sheet columns (absent ones are
+    skipped). From the sidecar the result equals applying the same selection
+    to the ``pd.read_excel`` frame -- same dtypes, sheet row order and row
+    labels. From a current sheet dataset it has the same rows, order and
+    labels but the producer's dtypes (``trade_date`` as dates rather than
+    naive datetimes). Either way it is a fresh frame the caller may mutate.
+    """
+    path = Path(workbook)
+    wanted_symbols = None if symbols is None else _normalize_symbols(symbols)
+    wanted_columns = None if columns is None else list(columns)
+    dataset = sheet_dataset_for(path)
+    if dataset is not None:
+        try:
+            index_mtime_ns = (dataset / SHEET_DATASET_INDEX_NAME).stat().st_mtime_ns
+            frame = _read_dataset_daily_bars_cached(str(dataset.resolve()), index_mtime_ns)
+            return _select(frame, wanted_symbols, wanted_columns)
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning("daily_bars sheet dataset %s unreadable, falling back to xlsx: %s", dataset, exc)
+    stat = path.stat()
+    sidecar = _ensure_sidecar(path, stat, cache_dir)
+    if sidecar is not None:
+        try:
+            return _read_sidecar(sidecar, wanted_symbols, wanted_columns)
+        except (OSError, ValueError) as exc:
+            logger.warning("daily_bars sidecar %s unreadable, falling back to xlsx: %s", sidecar, exc)
+    frame = _read_daily_bars_cached(str(path.resolve()), stat.st_mtime_ns)
+    return _select(frame, wanted_symbols, wanted_columns)
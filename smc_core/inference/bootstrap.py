@@ -21,13 +21,29 @@ API surface::
     )
     res["ci_low"], res["ci_high"], res["point"], res["method"]
 
+``statistic`` may also name a built-in batched kernel (``"mean"``,
+``"sharpe"``, ``"hit_rate"``); those are evaluated over whole resample
+chunks at once and use closed-form leave-one-out jackknives for BCa.
+Resamples are generated in chunks of at most ``_CHUNK_ELEMENTS`` values,
+so memory stays bounded for large ``B * n``.
+
+Seeded output. The iid path draws each chunk with ``Generator.integers``,
+which consumes the bit stream value by value, so chunked draws are the
+same indices, in the same order, as one ``(B, n)`` draw: seeded iid
+results do not depend on ``B * n`` or the chunk size. The stationary-block
+path switched from a per-position loop to the vectorised kernel below; it
+samples the same distribution from a different RNG stream, so seeded
+stationary replicates (and everything built on them, e.g.
+``governance.family_significance`` with ``block_length > 1``) differ from
+the loop-based implementation.
+
 Pure NumPy. Determinism pinned by ``seed``.
 
 Roadmap: docs/IMPROVEMENTS_C2_C12_ROADMAP_2026-04-26.md#c31
 """
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from math import erf, sqrt
 from typing import Literal, TypedDict
@@ -35,6 +51,11 @@ from typing import Literal, TypedDict
 import numpy as np
 
 CIMethod = Literal["percentile", "basic", "bca"]
+StatisticName = Literal["mean", "sharpe", "hit_rate"]
+
+# Upper bound on resampled values materialised at once (~32 MiB of float64).
+# Chunk rows depend only on ``n`` so seeded output is machine-independent.
+_CHUNK_ELEMENTS = 1 << 22
 
 
 class BootstrapResult(TypedDict):
@@ -133,24 +154,146 @@ def _iid_resample(arr: np.ndarray, B: int, rng: np.random.Generator) -> np.ndarr
     return arr[idx]
 
 
+def _chunk_rows(n: int, B: int) -> int:
+    return max(1, min(B, _CHUNK_ELEMENTS // max(n, 1)))
+
+
+def _stationary_indices(
+    n: int, rows: int, mean_block_length: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Politis-Romano index matrix of shape ``(rows, n)`` in one NumPy pass.
+
+    Block lengths are drawn as ``Geometric(1 / mean_block_length)`` over a
+    flat stream of ``rows * n`` positions; every row start also opens a
+    fresh block (memorylessness keeps the truncated length geometric), so
+    rows are independent. Each block gets a uniform start and indices run
+    cumulatively from it, wrapping modulo ``n``.
+    """
+    total = rows * n
+    p = 1.0 / max(mean_block_length, 1)
+    expected = total * p
+    lengths = rng.geometric(p, size=int(expected + 4.0 * sqrt(expected)) + 16)
+    covered = int(lengths.sum())
+    while covered < total:  # pragma: no cover - 4-sigma headroom
+        extra = rng.geometric(p, size=int(expected) + 16)
+        lengths = np.concatenate([lengths, extra])
+        covered += int(extra.sum())
+    block_first = np.cumsum(lengths) - lengths
+    is_start = np.zeros(total, dtype=bool)
+    is_start[block_first[block_first < total]] = True
+    is_start[::n] = True
+    first = np.flatnonzero(is_start)
+    starts = rng.integers(0, n, size=first.size, dtype=np.int64)
+    idx = np.repeat(starts - first, np.diff(first, append=total))
+    idx += np.arange(total, dtype=np.int64)
+    idx %= n
+    return idx.reshape(rows, n)
+
+
+def _resample_chunks(
+    arr: np.ndarray, B: int, block_length: int, rng: np.random.Generator
+) -> Iterator[np.ndarray]:
+    """Yield ``(rows, n)`` resample chunks that together cover ``B`` rows."""
+    n = arr.size
+    step = _chunk_rows(n, B)
+    for done in range(0, B, step):
+        rows = min(step, B - done)
+        if block_length == 1:
+            yield arr[rng.integers(0, n, size=(rows, n), dtype=np.int64)]
+        else:
+            yield arr[_stationary_indices(n, rows, block_length, rng)]
+
+
 def _stationary_resample(
     arr: np.ndarray, B: int, mean_block_length: int, rng: np.random.Generator
 ) -> np.ndarray:
     """Politis-Romano stationary block bootstrap."""
+    chunks = []
+    step = _chunk_rows(arr.size, B)
+    for done in range(0, B, step):
+        idx = _stationary_indices(arr.size, min(step, B - done), mean_block_length, rng)
+        chunks.append(arr[idx])
+    return np.concatenate(chunks)
+
+
+# ---------------------------------------------------------------------------
+# batched statistics
+# ---------------------------------------------------------------------------
+
+
+def _batch_mean(x: np.ndarray) -> np.ndarray:
+    return x.mean(axis=-1)
+
+
+def _batch_sharpe(x: np.ndarray) -> np.ndarray:
+    """Periodic Sharpe ``mean / std(ddof=1)``; ``0.0`` where the std is zero."""
+    if x.shape[-1] < 2:
+        return np.zeros(x.shape[:-1], dtype=np.float64)
+    sd = x.std(axis=-1, ddof=1)
+    mean = x.mean(axis=-1)
+    return np.divide(mean, sd, out=np.zeros_like(mean), where=sd > 0)
+
+
+def _batch_hit_rate(x: np.ndarray) -> np.ndarray:
+    return (x > 0).mean(axis=-1)
+
+
+_BATCH_STATISTICS: dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "mean": _batch_mean,
+    "sharpe": _batch_sharpe,
+    "hit_rate": _batch_hit_rate,
+}
+
+
+def _jackknife_batch(arr: np.ndarray, name: str) -> np.ndarray:
+    """Closed-form leave-one-out values for the built-in statistics."""
     n = arr.size
-    p = 1.0 / max(mean_block_length, 1)
-    out = np.empty((B, n), dtype=arr.dtype)
-    for b in range(B):
-        starts = rng.integers(0, n, size=n, dtype=np.int64)
-        breaks = rng.random(size=n) < p
-        idx = np.empty(n, dtype=np.int64)
-        cur = int(starts[0])
-        for k in range(n):
-            if k > 0 and breaks[k]:
-                cur = int(starts[k])
-            idx[k] = cur % n
-            cur += 1
-        out[b] = arr[idx]
+    m = n - 1
+    if name == "hit_rate":
+        hits = (arr > 0).astype(np.float64)
+        return (hits.sum() - hits) / m
+    loo_mean = (arr.sum() - arr) / m
+    if name == "mean":
+        return loo_mean
+    if m < 2:
+        return np.zeros(n, dtype=np.float64)
+    # Leave-one-out sum of squared deviations via Welford's removal update,
+    # which stays accurate for samples far from zero.
+    full_mean = float(arr.mean())
+    ss = float(((arr - full_mean) ** 2).sum())
+    loo_ss = np.maximum(ss - (arr - full_mean) ** 2 * n / m, 0.0)
+    sd = np.sqrt(loo_ss / (m - 1))
+    return np.divide(loo_mean, sd, out=np.zeros_like(loo_mean), where=sd > 0)
+
+
+def resample_statistics(
+    sample: np.ndarray,
+    *,
+    statistic: Callable[[np.ndarray], float] | StatisticName,
+    B: int,
+    rng: np.random.Generator,
+    block_length: int = 1,
+) -> np.ndarray:
+    """Return the ``B`` bootstrap replicates of ``statistic`` over ``sample``.
+
+    Resamples are drawn chunk by chunk (iid for ``block_length == 1``,
+    stationary-block otherwise) and discarded after evaluation. Named
+    statistics are evaluated for a whole chunk in one vectorised call;
+    callables are applied row by row.
+    """
+    arr = _validate(sample)
+    batch = _BATCH_STATISTICS.get(statistic) if isinstance(statistic, str) else None
+    if isinstance(statistic, str) and batch is None:
+        raise ValueError(f"unknown statistic: {statistic!r}")
+    out = np.empty(B, dtype=np.float64)
+    cursor = 0
+    for chunk in _resample_chunks(arr, B, block_length, rng):
+        rows = chunk.shape[0]
+        if batch is not None:
+            out[cursor : cursor + rows] = batch(chunk)
+        else:
+            out[cursor : cursor + rows] = [statistic(row) for row in chunk]
+        cursor += rows
     return out
 
 
@@ -222,7 +365,7 @@ class BootstrapConfig:
 def bootstrap_ci(
     sample: np.ndarray,
     *,
-    statistic: Callable[[np.ndarray], float],
+    statistic: Callable[[np.ndarray], float] | StatisticName,
     method: CIMethod = "percentile",
     alpha: float = 0.05,
     B: int = 1000,
@@ -237,10 +380,13 @@ def bootstrap_ci(
         1-D array of observations.
     statistic:
         Callable mapping a 1-D NumPy array to a scalar (mean, std,
-        win-rate, Sharpe, profit-factor, …).
+        win-rate, Sharpe, profit-factor, …), or the name of a batched
+        kernel: ``"mean"``, ``"sharpe"`` (``mean / std(ddof=1)``) or
+        ``"hit_rate"`` (share of positive values).
     method:
         ``"percentile"`` | ``"basic"`` | ``"bca"``. BCa adds a jackknife
-        pass; cost is ``O(n)`` extra statistic evaluations.
+        pass; cost is ``O(n)`` extra statistic evaluations for callables
+        and a single vectorised pass for named statistics.
     alpha:
         Two-sided CI level (default 0.05 -> 95 % CI).
     B:
@@ -259,12 +405,17 @@ def bootstrap_ci(
     if block_length < 1:
         raise ValueError(f"block_length must be >= 1, got {block_length}")
     arr = _validate(sample)
+    if isinstance(statistic, str) and statistic not in _BATCH_STATISTICS:
+        raise ValueError(f"unknown statistic: {statistic!r}")
     rng = np.random.default_rng(seed)
 
-    resamples = _iid_resample(arr, B, rng) if block_length == 1 else _stationary_resample(arr, B, block_length, rng)
-
-    boot = np.array([statistic(resamples[i]) for i in range(B)], dtype=np.float64)
-    observed = float(statistic(arr))
+    boot = resample_statistics(
+        arr, statistic=statistic, B=B, rng=rng, block_length=block_length
+    )
+    if isinstance(statistic, str):
+        observed = float(_BATCH_STATISTICS[statistic](arr))
+    else:
+        observed = float(statistic(arr))
 
     if method == "percentile":
         lo, hi = _percentile(boot, alpha)
@@ -275,7 +426,10 @@ def bootstrap_ci(
             raise ValueError(
                 f"method='bca' requires at least 2 observations, got n={arr.size}"
             )
-        jk = _jackknife(arr, statistic)
+        if isinstance(statistic, str):
+            jk = _jackknife_batch(arr, statistic)
+        else:
+            jk = _jackknife(arr, statistic)
         lo, hi = _bca(boot, observed, jk, alpha)
     else:  # pragma: no cover - guarded by Literal
         raise ValueError(f"unknown method: {method}")
@@ -296,5 +450,7 @@ __all__ = [
     "BootstrapConfig",
     "BootstrapResult",
     "CIMethod",
+    "StatisticName",
     "bootstrap_ci",
+    "resample_statistics",
 ]
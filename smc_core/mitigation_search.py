@@ -0,0 +1,212 @@
+"""Forward mitigation / invalidation search over bar arrays.
+
+The classic structure detectors (order blocks, rejection blocks, FVGs) all
+answer the same question for every zone they emit: *starting at the bar after
+the anchor, which bar first trades into the zone (mitigation) and which bar
+first closes through it (invalidation)?*  The original implementations ran a
+nested ``for j in range(i + 1, len(bars))`` scan per zone, which is O(n²) on
+long intraday histories.
+
+This module answers those queries in O(log n) each from sparse tables of
+range minima / maxima built once per bar array (O(n log n)).  All queries of a
+detector run are resolved together, one numpy pass per sparse-table level, so
+the Python-level cost is O(log n) array operations rather than O(zones × bars)
+scalar lookups.
+
+Design notes
+------------
+* Pure numpy; no pandas, no I/O, no global state.
+* "First index" results use ``n`` (the array length) as the *not found*
+  sentinel so callers can compare indices without special-casing ``None``.
+* :meth:`ForwardExtremaIndex.first_within` answers the two-sided "value lands
+  inside ``[low, high]``" query by descending to the first bar that reaches
+  the near edge and re-querying past bars that overshoot the far edge.  The
+  number of rounds is bounded by the longest overshoot run before the stop
+  index, which for mitigation queries is capped by the invalidation bar.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+
+ZoneDirection = Literal["BULL", "BEAR"]
+
+
+def _build_sparse_table(values: np.ndarray, reduce: np.ufunc) -> list[np.ndarray]:
+    """Return ``table[k][j] = reduce(values[j : j + 2**k])`` for every level ``k``."""
+    table = [values]
+    width = 1
+    while 2 * width <= values.size:
+        prev = table[-1]
+        table.append(reduce(prev[:-width], prev[width:]))
+        width *= 2
+    return table
+
+
+class ForwardExtremaIndex:
+    """Sparse-table index answering "first ``j >= start`` with ``values[j]`` past a level"."""
+
+    def __init__(self, values: np.ndarray) -> None:
+        self.values = np.ascontiguousarray(values, dtype=float)
+        self.size = int(self.values.size)
+        self._min_table: list[np.ndarray] | None = None
+        self._max_table: list[np.ndarray] | None = None
+
+    @property
+    def min_table(self) -> list[np.ndarray]:
+        if self._min_table is None:
+            self._min_table = _build_sparse_table(self.values, np.minimum)
+        return self._min_table
+
+    @property
+    def max_table(self) -> list[np.ndarray]:
+        if self._max_table is None:
+            self._max_table = _build_sparse_table(self.values, np.maximum)
+        return self._max_table
+
+    def _descend(self, table: list[np.ndarray], starts: np.ndarray, levels: np.ndarray, op: str) -> np.ndarray:
+        # Binary lifting: skip a block of 2**k bars whenever the block's
+        # extremum proves no bar inside it satisfies the predicate.  Visiting
+        # levels from widest to narrowest decomposes the distance to the answer
+        # into its binary digits, so every query finishes in len(table) steps.
+        pos = np.asarray(starts, dtype=np.int64).copy()
+        levels = np.asarray(levels, dtype=float)
+        n = self.size
+        for k in range(len(table) - 1, -1, -1):
+            width = 1 << k
+            level_values = table[k]
+            in_range = pos + width <= n
+            if not in_range.any():
+                continue
+            block = level_values[np.where(in_range, pos, 0)]
+            if op == "lt":
+                skip = block >= levels
+            elif op == "le":
+                skip = block > levels
+            elif op == "gt":
+                skip = block <= levels
+            else:
+                skip = block < levels
+            pos = np.where(in_range & skip, pos + width, pos)
+        return np.minimum(pos, n)
+
+    def first_lt(self, starts: np.ndarray, levels: np.ndarray) -> np.ndarray:
+        """First index ``j >= start`` with ``values[j] < level`` (``n`` if none)."""
+        return self._descend(self.min_table, starts, levels, "lt")
+
+    def first_le(self, starts: np.ndarray, levels: np.ndarray) -> np.ndarray:
+        """First index ``j >= start`` with ``values[j] <= level`` (``n`` if none)."""
+        return self._descend(self.min_table, starts, levels, "le")
+
+    def first_gt(self, starts: np.ndarray, levels: np.ndarray) -> np.ndarray:
+        """First index ``j >= start`` with ``values[j] > level`` (``n`` if none)."""
+        return self._descend(self.max_table, starts, levels, "gt")
+
+    def first_ge(self, starts: np.ndarray, levels: np.ndarray) -> np.ndarray:
+        """First index ``j >= start`` with ``values[j] >= level`` (``n`` if none)."""
+        return self._descend(self.max_table, starts, levels, "ge")
+
+    def first_within(
+        self,
+        starts: np.ndarray,
+        lows: np.ndarray,
+        highs: np.ndarray,
+        stops: np.ndarray,
+        *,
+        approach: Literal["from_above", "from_below"],
+    ) -> np.ndarray:
+        """First index ``j`` in ``[start, stop]`` with ``low <= values[j] <= high``.
+
+        ``approach`` names the edge price reaches first: ``"from_above"``
+        searches for ``values[j] <= high`` and rejects bars below ``low``;
+        ``"from_below"`` searches for ``values[j] >= low`` and rejects bars
+        above ``high``.  Returns ``n`` where no index qualifies.
+        """
+        starts = np.asarray(starts, dtype=np.int64)
+        lows = np.asarray(lows, dtype=float)
+        highs = np.asarray(highs, dtype=float)
+        stops = np.asarray(stops, dtype=np.int64)
+        n = self.size
+        result = np.full(starts.size, n, dtype=np.int64)
+        active = np.flatnonzero(starts <= np.minimum(stops, n - 1))
+        pos = starts.copy()
+        while active.size:
+            if approach == "from_above":
+                cand = self.first_le(pos[active], highs[active])
+            else:
+                cand = self.first_ge(pos[active], lows[active])
+            in_window = cand <= np.minimum(stops[active], n - 1)
+            cand_values = self.values[np.where(in_window, cand, 0)]
+            if approach == "from_above":
+                inside = in_window & (cand_values >= lows[active])
+            else:
+                inside = in_window & (cand_values <= highs[active])
+            result[active[inside]] = cand[inside]
+            retry = in_window & ~inside
+            pos[active[retry]] = cand[retry] + 1
+            active = active[retry]
+        return result
+
+
+@dataclass(frozen=True)
+class ZoneResolution:
+    """Per-zone lifecycle resolved by :class:`ZoneMitigationEngine`.
+
+    ``invalidated_index`` / ``mitigated_index`` hold bar indices, with the bar
+    count as the *not found* sentinel.
+    """
+
+    valid: np.ndarray
+    mitigated: np.ndarray
+    mitigated_index: np.ndarray
+    invalidated_index: np.ndarray
+
+
+class ZoneMitigationEngine:
+    """Resolve mitigation and invalidation for batches of price zones.
+
+    Reproduces the forward-scan semantics of the classic detectors exactly:
+    starting at ``start``, a BULL zone is mitigated by the first bar whose low
+    lands inside ``[low, high]`` and invalidated by the first close below
+    ``low``; a BEAR zone is mitigated by the first bar whose high lands inside
+    the zone and invalidated by the first close above ``high``.  A mitigation
+    on the invalidating bar still counts, because the original loops checked
+    mitigation before breaking on invalidation.
+    """
+
+    def __init__(self, low: np.ndarray, high: np.ndarray, close: np.ndarray) -> None:
+        self.size = int(np.asarray(close).size)
+        self._low = ForwardExtremaIndex(low)
+        self._high = ForwardExtremaIndex(high)
+        self._close = ForwardExtremaIndex(close)
+
+    def resolve(
+        self,
+        direction: ZoneDirection,
+        starts: np.ndarray,
+        zone_lows: np.ndarray,
+        zone_highs: np.ndarray,
+    ) -> ZoneResolution:
+        starts = np.asarray(starts, dtype=np.int64)
+        zone_lows = np.asarray(zone_lows, dtype=float)
+        zone_highs = np.asarray(zone_highs, dtype=float)
+        n = self.size
+        if direction == "BULL":
+            invalidated = self._close.first_lt(starts, zone_lows)
+            mitigated_index = self._low.first_within(
+                starts, zone_lows, zone_highs, invalidated, approach="from_above"
+            )
+        else:
+            invalidated = self._close.first_gt(starts, zone_highs)
+            mitigated_index = self._high.first_within(
+                starts, zone_lows, zone_highs, invalidated, approach="from_below"
+            )
+        return ZoneResolution(
+            valid=invalidated >= n,
+            mitigated=mitigated_index < n,
+            mitigated_index=mitigated_index,
+            invalidated_index=invalidated,
+        )
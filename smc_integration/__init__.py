@@ -1,61 +1,121 @@
-from .batch import (
-    build_snapshot_bundles_for_symbols,
-    build_snapshot_manifest,
-    load_symbols_from_source,
-    load_symbols_from_watchlist_source,
-    write_snapshot_bundles_for_symbols,
-)
-from .extended_structure_discovery import (
-    build_extended_structure_discovery_report,
-    discover_extended_structure_by_category,
-    discover_extended_structure_candidates,
-)
-from .provider_matrix import (
-    build_provider_summary,
-    discover_provider_matrix,
-    provider_matrix_to_dict,
-)
-from .repo_sources import (
-    discover_composite_source_plan,
-    discover_repo_source_paths,
-    discover_repo_sources,
-    discover_structure_source_status,
-    load_raw_meta_input,
-    load_raw_meta_input_composite,
-    load_raw_structure_input,
-    select_best_news_source,
-    select_best_source,
-    select_best_structure_source,
-    select_best_technical_source,
-    select_best_volume_source,
-)
-from .service import (
-    build_dashboard_payload_for_symbol_timeframe,
-    build_pine_payload_for_symbol_timeframe,
-    build_snapshot_bundle_for_symbol_timeframe,
-    build_snapshot_for_symbol_timeframe,
-)
-from .structure_audit import (
-    build_structure_gap_report,
-    discover_structure_category_coverage,
-    discover_structure_source_candidates,
-    structure_gap_report_to_dict,
-)
-from .structure_batch import (
-    build_single_symbol_structure_artifact,
-    build_structure_artifact_manifest,
-    write_structure_artifacts_from_workbook,
-)
-from .trust_tier import (
-    PROVIDER_STATES,
-    QUALITY_RECOMMENDATIONS,
-    TRUST_TIERS,
-    derive_quality_recommendation,
-    derive_trust_summary,
-    resolve_provider_state,
-    resolve_trust_main_blocker,
-    resolve_trust_tier,
-)
+"""Snapshot, structure and provider integration for SMC.
+
+The re-exports below resolve lazily: importing one submodule (the
+terminal's ``smc_integration.provider_health``) does not load the batch,
+structure and workbook stack behind the others.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .batch import (
+        build_snapshot_bundles_for_symbols,
+        build_snapshot_manifest,
+        load_symbols_from_source,
+        load_symbols_from_watchlist_source,
+        write_snapshot_bundles_for_symbols,
+    )
+    from .extended_structure_discovery import (
+        build_extended_structure_discovery_report,
+        discover_extended_structure_by_category,
+        discover_extended_structure_candidates,
+    )
+    from .provider_matrix import (
+        build_provider_summary,
+        discover_provider_matrix,
+        provider_matrix_to_dict,
+    )
+    from .repo_sources import (
+        discover_composite_source_plan,
+        discover_repo_source_paths,
+        discover_repo_sources,
+        discover_structure_source_status,
+        load_raw_meta_input,
+        load_raw_meta_input_composite,
+        load_raw_structure_input,
+        select_best_news_source,
+        select_best_source,
+        select_best_structure_source,
+        select_best_technical_source,
+        select_best_volume_source,
+    )
+    from .service import (
+        build_dashboard_payload_for_symbol_timeframe,
+        build_pine_payload_for_symbol_timeframe,
+        build_snapshot_bundle_for_symbol_timeframe,
+        build_snapshot_for_symbol_timeframe,
+    )
+    from .structure_audit import (
+        build_structure_gap_report,
+        discover_structure_category_coverage,
+        discover_structure_source_candidates,
+        structure_gap_report_to_dict,
+    )
+    from .structure_batch import (
+        build_single_symbol_structure_artifact,
+        build_structure_artifact_manifest,
+        write_structure_artifacts_from_workbook,
+    )
+    from .trust_tier import (
+        PROVIDER_STATES,
+        QUALITY_RECOMMENDATIONS,
+        TRUST_TIERS,
+        derive_quality_recommendation,
+        derive_trust_summary,
+        resolve_provider_state,
+        resolve_trust_main_blocker,
+        resolve_trust_tier,
+    )
+
+# Public name -> defining submodule, imported on first access via
+# :func:`__getattr__` (PEP 562).
+_EXPORTS: dict[str, str] = {
+    "build_snapshot_bundles_for_symbols": ".batch",
+    "build_snapshot_manifest": ".batch",
+    "load_symbols_from_source": ".batch",
+    "load_symbols_from_watchlist_source": ".batch",
+    "write_snapshot_bundles_for_symbols": ".batch",
+    "build_extended_structure_discovery_report": ".extended_structure_discovery",
+    "discover_extended_structure_by_category": ".extended_structure_discovery",
+    "discover_extended_structure_candidates": ".extended_structure_discovery",
+    "build_provider_summary": ".provider_matrix",
+    "discover_provider_matrix": ".provider_matrix",
+    "provider_matrix_to_dict": ".provider_matrix",
+    "discover_composite_source_plan": ".repo_sources",
+    "discover_repo_source_paths": ".repo_sources",
+    "discover_repo_sources": ".repo_sources",
+    "discover_structure_source_status": ".repo_sources",
+    "load_raw_meta_input": ".repo_sources",
+    "load_raw_meta_input_composite": ".repo_sources",
+    "load_raw_structure_input": ".repo_sources",
+    "select_best_news_source": ".repo_sources",
+    "select_best_source": ".repo_sources",
+    "select_best_structure_source": ".repo_sources",
+    "select_best_technical_source": ".repo_sources",
+    "select_best_volume_source": ".repo_sources",
+    "build_dashboard_payload_for_symbol_timeframe": ".service",
+    "build_pine_payload_for_symbol_timeframe": ".service",
+    "build_snapshot_bundle_for_symbol_timeframe": ".service",
+    "build_snapshot_for_symbol_timeframe": ".service",
+    "build_structure_gap_report": ".structure_audit",
+    "discover_structure_category_coverage": ".structure_audit",
+    "discover_structure_source_candidates": ".structure_audit",
+    "structure_gap_report_to_dict": ".structure_audit",
+    "build_single_symbol_structure_artifact": ".structure_batch",
+    "build_structure_artifact_manifest": ".structure_batch",
+    "write_structure_artifacts_from_workbook": ".structure_batch",
+    "PROVIDER_STATES": ".trust_tier",
+    "QUALITY_RECOMMENDATIONS": ".trust_tier",
+    "TRUST_TIERS": ".trust_tier",
+    "derive_quality_recommendation": ".trust_tier",
+    "derive_trust_summary": ".trust_tier",
+    "resolve_provider_state": ".trust_tier",
+    "resolve_trust_main_blocker": ".trust_tier",
+    "resolve_trust_tier": ".trust_tier",
+}
 
 __all__ = [
     "PROVIDER_STATES",
@@ -101,3 +161,14 @@ __all__ = [
     "write_snapshot_bundles_for_symbols",
     "write_structure_artifacts_from_workbook",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(submodule, __name__), name)
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
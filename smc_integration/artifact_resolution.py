@@ -10,6 +10,7 @@ from scripts.databento_production_workbook import (
 from scripts.databento_production_workbook import (
     resolve_production_workbook_path as resolve_lineage_workbook_path,
 )
+from smc_core.cached_workbook_reader import sheet_dataset_for
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_STRUCTURE_ARTIFACTS_DIR = Path("reports") / "smc_structure_artifacts"
@@ -27,6 +28,17 @@ def _to_existing_path(raw: str | Path | None) -> Path | None:
     return path if path.exists() else None
 
 
+def _to_existing_workbook(raw: str | Path | None) -> Path | None:
+    """Like ``_to_existing_path``, but a workbook whose xlsx was not rendered
+    (``DATABENTO_PRODUCTION_WORKBOOK_XLSX=off``) counts when its sheet dataset exists."""
+    path = _to_existing_path(raw)
+    if path is None and raw is not None and str(raw).strip():
+        candidate = Path(str(raw).strip()).expanduser()
+        if sheet_dataset_for(candidate) is not None:
+            return candidate
+    return path
+
+
 def _repo_absolute(path: Path) -> Path:
     if path.is_absolute():
         return path
@@ -42,12 +54,12 @@ def _mode(explicit_hit: bool, canonical_hit: bool) -> str:
 
 
 def resolve_production_workbook_path(explicit_path: str | None = None) -> Path | None:
-    explicit = _to_existing_path(explicit_path)
+    explicit = _to_existing_workbook(explicit_path)
     if explicit is not None:
         return explicit
 
     canonical = _repo_absolute(canonical_production_workbook_path(export_dir=_repo_absolute(DEFAULT_PRODUCTION_EXPORT_DIR)))
-    if canonical.exists():
+    if _to_existing_workbook(canonical) is not None:
         return canonical
 
     try:
@@ -82,7 +94,7 @@ def resolve_structure_artifact_inputs(
     errors: list[dict[str, str]] = []
     warnings: list[dict[str, str]] = []
 
-    explicit_workbook = _to_existing_path(explicit_workbook_path)
+    explicit_workbook = _to_existing_workbook(explicit_workbook_path)
     workbook = resolve_production_workbook_path(explicit_workbook_path)
     workbook_mode = _mode(explicit_workbook is not None, workbook is not None and explicit_workbook is None)
     if workbook is None:
@@ -33,7 +33,7 @@ from scripts.smc_structure_state import build_structure_state
 from scripts.smc_structure_state_light import build_structure_state_light
 from smc_core.benchmark import EventFamily
 from smc_core.bias_merge import merge_bias
-from smc_core.cached_workbook_reader import read_daily_bars
+from smc_core.cached_workbook_reader import read_daily_bars, sheet_dataset_for
 from smc_core.ensemble_quality import build_ensemble_quality, serialize_ensemble_quality
 from smc_core.event_freshness import classify_freshness  # Phase A
 from smc_core.htf_context import build_htf_bias_context
@@ -268,9 +268,9 @@ def _load_source_bars(symbol: str, timeframe: str, resolved_inputs: dict[str, An
                     if not bars.empty:
                         return bars.reset_index(drop=True), "canonical_export_bundle"
 
-    if daily and isinstance(workbook_path, Path) and workbook_path.exists():
+    if daily and isinstance(workbook_path, Path) and (workbook_path.exists() or sheet_dataset_for(workbook_path) is not None):
         try:
-            daily_bars = read_daily_bars(workbook_path)
+            daily_bars = read_daily_bars(workbook_path, symbols=[symbol_name])
         except Exception as exc:
             logger.warning(
                 "workbook daily_bars sheet unreadable for symbol=%s workbook_path=%s: %s",
@@ -3,9 +3,12 @@ from __future__ import annotations
 import contextlib
 import json
 import logging
+import multiprocessing
 import os
 import tempfile
 import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from contextvars import ContextVar
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -42,13 +45,8 @@ def _write_text_atomic(path: Path, content: str) -> None:
 def _load_symbol_bars_from_canonical_exports(symbol: str, timeframe: str, export_dir: Path | None) -> pd.DataFrame | None:
     if export_dir is None:
         return None
-    required_frames = ("daily_bars",) if is_daily_timeframe(timeframe) else ("full_universe_second_detail_open",)
     try:
-        bundle = load_export_bundle(
-            export_dir,
-            required_frames=required_frames,
-            manifest_prefix="databento_volatility_production_",
-        )
+        bundle = _load_canonical_bundle(export_dir, timeframe)
     except Exception as exc:
         logger.warning(
             "canonical export bundle unavailable for symbol=%s timeframe=%s export_dir=%s: %s",
@@ -62,36 +60,54 @@ def _load_symbol_bars_from_canonical_exports(symbol: str, timeframe: str, export
     frames = bundle.get("frames", {})
     symbol_name = str(symbol).strip().upper()
     canonical_tf = str(timeframe).strip()
-
-    if is_daily_timeframe(canonical_tf):
-        daily = frames.get("daily_bars")
-        if isinstance(daily, pd.DataFrame) and not daily.empty:
-            bars = daily.copy()
-            bars["symbol"] = bars.get("symbol", "").astype(str).str.strip().str.upper()
-            bars = bars.loc[bars["symbol"].eq(symbol_name)].copy()
-            if bars.empty:
-                return None
-            bars["timestamp"] = pd.to_datetime(bars.get("trade_date"), errors="coerce", utc=True)
-            for column in ("open", "high", "low", "close"):
-                bars[column] = pd.to_numeric(bars.get(column), errors="coerce")
-            return bars[["symbol", "timestamp", "open", "high", "low", "close"]].dropna().reset_index(drop=True)
+    source = _canonical_source_frame(frames, canonical_tf)
+    if source is None:
         return None
+    bars = _with_normalized_symbol(source)
+    return _canonical_bars_from_rows(bars.loc[bars["symbol"].eq(symbol_name)].copy(), canonical_tf)
+
+
+def _load_canonical_bundle(export_dir: Path, timeframe: str) -> dict[str, Any]:
+    required_frames = ("daily_bars",) if is_daily_timeframe(timeframe) else ("full_universe_second_detail_open",)
+    return load_export_bundle(
+        export_dir,
+        required_frames=required_frames,
+        manifest_prefix="databento_volatility_production_",
+    )
+
+
+def _canonical_source_frame(frames: dict[str, Any], timeframe: str) -> pd.DataFrame | None:
+    """Return the bundle frame that carries ``timeframe`` bars, if non-empty."""
+    name = "daily_bars" if is_daily_timeframe(timeframe) else "full_universe_second_detail_open"
+    frame = frames.get(name)
+    if isinstance(frame, pd.DataFrame) and not frame.empty:
+        return frame
+    return None
+
+
+def _with_normalized_symbol(frame: pd.DataFrame) -> pd.DataFrame:
+    bars = frame.copy()
+    bars["symbol"] = bars.get("symbol", "").astype(str).str.strip().str.upper()
+    return bars
 
-    intraday = frames.get("full_universe_second_detail_open")
-    if isinstance(intraday, pd.DataFrame) and not intraday.empty:
-        bars = intraday.copy()
-        bars["symbol"] = bars.get("symbol", "").astype(str).str.strip().str.upper()
-        bars = bars.loc[bars["symbol"].eq(symbol_name)].copy()
-        if bars.empty:
-            return None
-        bars["timestamp"] = pd.to_datetime(bars.get("timestamp"), errors="coerce", utc=True)
+
+def _canonical_bars_from_rows(bars: pd.DataFrame, timeframe: str) -> pd.DataFrame | None:
+    """Shape one symbol's bundle rows into the OHLC(V) frame the engine consumes."""
+    if bars.empty:
+        return None
+    if is_daily_timeframe(timeframe):
+        bars["timestamp"] = pd.to_datetime(bars.get("trade_date"), errors="coerce", utc=True)
         for column in ("open", "high", "low", "close"):
             bars[column] = pd.to_numeric(bars.get(column), errors="coerce")
-        if "volume" in bars.columns:
-            bars["volume"] = pd.to_numeric(bars.get("volume"), errors="coerce").fillna(0.0)
-            return bars[["symbol", "timestamp", "open", "high", "low", "close", "volume"]].dropna().reset_index(drop=True)
         return bars[["symbol", "timestamp", "open", "high", "low", "close"]].dropna().reset_index(drop=True)
-    return None
+
+    bars["timestamp"] = pd.to_datetime(bars.get("timestamp"), errors="coerce", utc=True)
+    for column in ("open", "high", "low", "close"):
+        bars[column] = pd.to_numeric(bars.get(column), errors="coerce")
+    if "volume" in bars.columns:
+        bars["volume"] = pd.to_numeric(bars.get("volume"), errors="coerce").fillna(0.0)
+        return bars[["symbol", "timestamp", "open", "high", "low", "close", "volume"]].dropna().reset_index(drop=True)
+    return bars[["symbol", "timestamp", "open", "high", "low", "close"]].dropna().reset_index(drop=True)
 
 
 def _load_symbol_bars_from_workbook(workbook: Path, symbol: str) -> pd.DataFrame:
@@ -101,8 +117,10 @@ def _load_symbol_bars_from_workbook(workbook: Path, symbol: str) -> pd.DataFrame
     intentionally daily-only. Callers MUST NOT use it for intraday timeframes
     or they will silently feed daily OHLC into intraday structure detection.
     """
-    daily_bars = read_daily_bars(workbook)
-    bars = daily_bars.copy()
+    return _workbook_bars_from_rows(read_daily_bars(workbook, symbols=[symbol]), symbol)
+
+
+def _workbook_bars_from_rows(bars: pd.DataFrame, symbol: str) -> pd.DataFrame:
     bars["symbol"] = bars.get("symbol", "").astype(str).str.strip().str.upper()
     bars = bars.loc[bars["symbol"].eq(str(symbol).strip().upper())].copy()
     if bars.empty:
@@ -234,6 +252,101 @@ def _derive_symbols_from_workbook(daily_bars: pd.DataFrame) -> list[str]:
     return resolved
 
 
+@dataclass(frozen=True)
+class StructureBatchInputs:
+    """Bar sources loaded once per batch and partitioned by symbol.
+
+    ``canonical_bars`` / ``workbook_bars`` map a normalised symbol to its
+    raw rows; ``None`` means the source was not preloaded, in which case
+    :func:`build_single_symbol_structure_artifact` loads it per symbol as
+    before. Only ``symbols`` (and, for the workbook, ``workbook_symbols``)
+    are served from the preloaded partitions.
+    """
+
+    symbols: frozenset[str]
+    canonical_bars: dict[str, pd.DataFrame] | None
+    workbook_bars: dict[str, pd.DataFrame] | None
+    workbook_symbols: frozenset[str] = frozenset()
+    workbook_columns: tuple[str, ...] = ("symbol",)
+
+    def canonical_for(self, symbol: str, timeframe: str) -> pd.DataFrame | None:
+        rows = (self.canonical_bars or {}).get(symbol)
+        return None if rows is None else _canonical_bars_from_rows(rows.copy(), timeframe)
+
+    def workbook_for(self, symbol: str) -> pd.DataFrame:
+        rows = (self.workbook_bars or {}).get(symbol)
+        if rows is None:
+            rows = pd.DataFrame(columns=list(self.workbook_columns))
+        return _workbook_bars_from_rows(rows.copy(), symbol)
+
+
+# Batch-scoped inputs consulted by ``build_single_symbol_structure_artifact``
+# when no ``shared_inputs`` is passed. Set around a serial batch and once per
+# pool worker (forked workers inherit the parent's frames without pickling).
+_BATCH_INPUTS: ContextVar[StructureBatchInputs | None] = ContextVar("structure_batch_inputs", default=None)
+
+
+def _partition_by_symbol(frame: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    bars = _with_normalized_symbol(frame)
+    return {str(symbol): rows for symbol, rows in bars.groupby("symbol", sort=False)}
+
+
+def load_structure_batch_inputs(
+    *,
+    workbook: Path | None,
+    export_bundle_root: Path | None,
+    timeframe: str,
+    symbols: list[str],
+) -> StructureBatchInputs:
+    """Load the export bundle and workbook ``daily_bars`` once for ``symbols``.
+
+    Load failures are not raised here. An export bundle that cannot be
+    loaded is logged and treated as empty, so every symbol falls back to
+    the workbook. A bundle frame that cannot be partitioned, or a workbook
+    ``daily_bars`` sheet that cannot be read, is left un-preloaded
+    (``None``), so each symbol loads that source itself and reports the same
+    error as on the per-symbol path.
+    """
+    wanted = _normalize_symbols(symbols)
+    canonical: dict[str, pd.DataFrame] | None = {}
+    if export_bundle_root is not None:
+        try:
+            bundle = _load_canonical_bundle(export_bundle_root, timeframe)
+        except Exception as exc:
+            logger.warning(
+                "canonical export bundle unavailable for timeframe=%s export_dir=%s: %s",
+                timeframe,
+                export_bundle_root,
+                exc,
+            )
+        else:
+            source = _canonical_source_frame(bundle.get("frames", {}), str(timeframe).strip())
+            try:
+                canonical = {} if source is None else _partition_by_symbol(source)
+            except Exception:
+                logger.debug("canonical bundle frame not partitionable; loading per symbol", exc_info=True)
+                canonical = None
+
+    workbook_bars: dict[str, pd.DataFrame] | None = None
+    workbook_columns: tuple[str, ...] = ("symbol",)
+    fallback_symbols = [symbol for symbol in wanted if canonical is None or symbol not in canonical]
+    if workbook is not None and fallback_symbols and is_daily_timeframe(timeframe):
+        try:
+            daily = read_daily_bars(workbook, symbols=fallback_symbols)
+            workbook_bars = _partition_by_symbol(daily)
+            workbook_columns = tuple(str(column) for column in daily.columns)
+        except Exception:
+            logger.debug("workbook daily_bars not preloadable; loading per symbol", exc_info=True)
+            workbook_bars = None
+    return StructureBatchInputs(
+        symbols=frozenset(wanted),
+        canonical_bars=canonical,
+        workbook_bars=workbook_bars,
+        workbook_symbols=frozenset(fallback_symbols if workbook_bars is not None else ()),
+        workbook_columns=workbook_columns,
+    )
+
+
 def build_single_symbol_structure_artifact(
     *,
     workbook: Path | None,
@@ -242,10 +355,17 @@ def build_single_symbol_structure_artifact(
     timeframe: str,
     generated_at: float,
     structure_profile: str = "hybrid_default",
+    shared_inputs: StructureBatchInputs | None = None,
 ) -> dict[str, Any]:
     normalized_profile = validate_structure_profile(structure_profile)
     resolved_symbol = _normalize_symbol(symbol)
-    canonical_bars = _load_symbol_bars_from_canonical_exports(resolved_symbol, timeframe, export_bundle_root)
+    if shared_inputs is None:
+        shared_inputs = _BATCH_INPUTS.get()
+    shared = shared_inputs if shared_inputs is not None and resolved_symbol in shared_inputs.symbols else None
+    if shared is not None and shared.canonical_bars is not None:
+        canonical_bars = shared.canonical_for(resolved_symbol, timeframe)
+    else:
+        canonical_bars = _load_symbol_bars_from_canonical_exports(resolved_symbol, timeframe, export_bundle_root)
     source_mode = "canonical_export_bundle"
     if canonical_bars is None or canonical_bars.empty:
         if not is_daily_timeframe(timeframe):
@@ -267,7 +387,10 @@ def build_single_symbol_structure_artifact(
             )
         if workbook is None:
             raise ValueError("missing structure input: neither export bundle root nor workbook is available")
-        canonical_bars = _load_symbol_bars_from_workbook(workbook, resolved_symbol)
+        if shared is not None and resolved_symbol in shared.workbook_symbols:
+            canonical_bars = shared.workbook_for(resolved_symbol)
+        else:
+            canonical_bars = _load_symbol_bars_from_workbook(workbook, resolved_symbol)
         source_mode = "workbook_fallback"
 
     explicit_payload = build_explicit_structure_from_bars(
@@ -476,6 +599,140 @@ def _existing_artifact_rows(output_dir: Path, symbols: list[str], timeframe: str
     return rows
 
 
+@dataclass(frozen=True)
+class _SymbolJob:
+    symbol: str
+    artifact_path: Path
+    workbook: Path | None
+    export_bundle_root: Path | None
+    timeframe: str
+    generated_at: float
+    structure_profile: str
+
+
+@dataclass(frozen=True)
+class _SymbolOutcome:
+    symbol: str
+    elapsed_s: float
+    row: StructureArtifactRow | None = None
+    text: str | None = None
+    error: str = ""
+    fallback_reject: bool = False
+
+
+def _init_structure_worker(shared_inputs: StructureBatchInputs) -> None:
+    _BATCH_INPUTS.set(shared_inputs)
+
+
+def _artifact_row_from_payload(
+    payload: dict[str, Any], *, symbol: str, timeframe: str, artifact_path: Path, structure_profile: str
+) -> StructureArtifactRow:
+    structure = payload["structure"]
+    diagnostics = payload.get("diagnostics", {})
+    counts = diagnostics.get("counts", {})
+    coverage = payload.get("coverage", {})
+    return StructureArtifactRow(
+        symbol=symbol,
+        timeframe=timeframe,
+        artifact_path=_relative_repo_path(artifact_path),
+        structure_profile_used=str(diagnostics.get("structure_profile_used", structure_profile)),
+        event_logic_version=str(diagnostics.get("event_logic_version", EVENT_LOGIC_VERSION)),
+        coverage_mode=str(payload.get("coverage_mode", "none")),
+        has_bos=bool(coverage.get("has_bos", bool(structure.get("bos")))),
+        has_orderblocks=bool(coverage.get("has_orderblocks", bool(structure.get("orderblocks")))),
+        has_fvg=bool(coverage.get("has_fvg", bool(structure.get("fvg")))),
+        has_liquidity_sweeps=bool(coverage.get("has_liquidity_sweeps", bool(structure.get("liquidity_sweeps")))),
+        bos_count=int(counts.get("bos", len(structure.get("bos", [])))),
+        orderblocks_count=int(counts.get("orderblocks", len(structure.get("orderblocks", [])))),
+        fvg_count=int(counts.get("fvg", len(structure.get("fvg", [])))),
+        liquidity_sweeps_count=int(counts.get("liquidity_sweeps", len(structure.get("liquidity_sweeps", [])))),
+        warnings_count=len(diagnostics.get("warnings", [])) if isinstance(diagnostics.get("warnings", []), list) else 0,
+    )
+
+
+def _build_symbol_job(job: _SymbolJob) -> _SymbolOutcome:
+    """Build and serialise one artifact; never raises (failure isolation)."""
+    started = time.perf_counter()
+    try:
+        payload = build_single_symbol_structure_artifact(
+            workbook=job.workbook,
+            export_bundle_root=job.export_bundle_root,
+            symbol=job.symbol,
+            timeframe=job.timeframe,
+            generated_at=job.generated_at,
+            structure_profile=job.structure_profile,
+        )
+        text = json.dumps(payload, indent=2, sort_keys=True) + "\n"
+        row = _artifact_row_from_payload(
+            payload,
+            symbol=job.symbol,
+            timeframe=job.timeframe,
+            artifact_path=job.artifact_path,
+            structure_profile=job.structure_profile,
+        )
+    except Exception as exc:
+        return _SymbolOutcome(
+            symbol=job.symbol,
+            elapsed_s=time.perf_counter() - started,
+            error=str(exc),
+            fallback_reject=isinstance(exc, WorkbookFallbackTimeframeError),
+        )
+    return _SymbolOutcome(symbol=job.symbol, elapsed_s=time.perf_counter() - started, row=row, text=text)
+
+
+def _write_outcome(job: _SymbolJob, outcome: _SymbolOutcome) -> _SymbolOutcome:
+    if outcome.text is None:
+        return outcome
+    try:
+        _write_text_atomic(job.artifact_path, outcome.text)
+    except Exception as exc:
+        return _SymbolOutcome(symbol=job.symbol, elapsed_s=outcome.elapsed_s, error=str(exc))
+    return outcome
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    # ``fork`` shares the preloaded frames copy-on-write; elsewhere the
+    # initializer pickles them once per worker.
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def _run_symbol_jobs(
+    jobs: list[_SymbolJob], shared_inputs: StructureBatchInputs, *, max_workers: int
+) -> list[_SymbolOutcome]:
+    """Run ``jobs`` and return their outcomes in job order.
+
+    Artifacts are written by this (parent) process as each build completes.
+    """
+    if max_workers <= 1 or len(jobs) <= 1:
+        token = _BATCH_INPUTS.set(shared_inputs)
+        try:
+            return [_write_outcome(job, _build_symbol_job(job)) for job in jobs]
+        finally:
+            _BATCH_INPUTS.reset(token)
+
+    outcomes: list[_SymbolOutcome | None] = [None] * len(jobs)
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers, len(jobs)),
+        mp_context=_pool_context(),
+        initializer=_init_structure_worker,
+        initargs=(shared_inputs,),
+    ) as pool:
+        futures: dict[Future[_SymbolOutcome], int] = {
+            pool.submit(_build_symbol_job, job): index for index, job in enumerate(jobs)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            job = jobs[index]
+            try:
+                outcome = future.result()
+            except Exception as exc:  # worker died (e.g. BrokenProcessPool)
+                outcome = _SymbolOutcome(symbol=job.symbol, elapsed_s=0.0, error=str(exc) or type(exc).__name__)
+            outcomes[index] = _write_outcome(job, outcome)
+    return [outcome for outcome in outcomes if outcome is not None]
+
+
 def write_structure_artifacts_from_workbook(
     *,
     workbook: Path | None,
@@ -486,7 +743,20 @@ def write_structure_artifacts_from_workbook(
     generated_at: float | None = None,
     allow_missing_inputs: bool = True,
     structure_profile: str = "hybrid_default",
+    max_workers: int = 1,
 ) -> dict[str, Any]:
+    """Build one structure artifact per symbol plus the timeframe manifest.
+
+    Inputs are loaded once (:func:`load_structure_batch_inputs`) and shared
+    by every symbol. ``max_workers > 1`` builds symbols in a process pool;
+    artifacts are written as they complete, while manifest rows and errors
+    keep the requested symbol order, so every file is byte-identical to a
+    serial run. A failing symbol only lands in ``errors``. Input-load and
+    per-symbol build seconds are logged, never written to the manifest, so
+    the returned manifest is reproducible from run to run.
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got {max_workers}")
     structure_profile = validate_structure_profile(structure_profile)
     explicit_workbook_requested = workbook is not None
     explicit_bundle_requested = export_bundle_root is not None
@@ -522,7 +792,7 @@ def write_structure_artifacts_from_workbook(
 
     requested_symbols = _normalize_symbols(symbols) if symbols else []
     if not requested_symbols and resolved_workbook is not None:
-        daily_bars = read_daily_bars(resolved_workbook)
+        daily_bars = read_daily_bars(resolved_workbook, columns=["symbol"])
         requested_symbols = _derive_symbols_from_workbook(daily_bars)
     if not requested_symbols:
         raise ValueError("symbols must not be empty when workbook is unavailable")
@@ -583,48 +853,42 @@ def write_structure_artifacts_from_workbook(
             raise ValueError("missing structure inputs: workbook/export bundle and preexisting artifacts are unavailable")
         return manifest
 
-    for symbol in requested_symbols:
-        artifact_path = output_dir / _artifact_file_name(symbol, resolved_timeframe)
-        try:
-            payload = build_single_symbol_structure_artifact(
-                workbook=resolved_workbook,
-                export_bundle_root=resolved_bundle_root,
-                symbol=symbol,
-                timeframe=resolved_timeframe,
-                generated_at=effective_generated_at,
-                structure_profile=structure_profile,
-            )
-            _write_text_atomic(artifact_path, json.dumps(payload, indent=2, sort_keys=True) + "\n")
-
-            structure = payload["structure"]
-            artifact_rows.append(
-                StructureArtifactRow(
-                    symbol=symbol,
-                    timeframe=resolved_timeframe,
-                    artifact_path=_relative_repo_path(artifact_path),
-                    structure_profile_used=str(payload.get("diagnostics", {}).get("structure_profile_used", structure_profile)),
-                    event_logic_version=str(payload.get("diagnostics", {}).get("event_logic_version", EVENT_LOGIC_VERSION)),
-                    coverage_mode=str(payload.get("coverage_mode", "none")),
-                    has_bos=bool(payload.get("coverage", {}).get("has_bos", bool(structure.get("bos")))),
-                    has_orderblocks=bool(payload.get("coverage", {}).get("has_orderblocks", bool(structure.get("orderblocks")))),
-                    has_fvg=bool(payload.get("coverage", {}).get("has_fvg", bool(structure.get("fvg")))),
-                    has_liquidity_sweeps=bool(payload.get("coverage", {}).get("has_liquidity_sweeps", bool(structure.get("liquidity_sweeps")))),
-                    bos_count=int(payload.get("diagnostics", {}).get("counts", {}).get("bos", len(structure.get("bos", [])))),
-                    orderblocks_count=int(payload.get("diagnostics", {}).get("counts", {}).get("orderblocks", len(structure.get("orderblocks", [])))),
-                    fvg_count=int(payload.get("diagnostics", {}).get("counts", {}).get("fvg", len(structure.get("fvg", [])))),
-                    liquidity_sweeps_count=int(payload.get("diagnostics", {}).get("counts", {}).get("liquidity_sweeps", len(structure.get("liquidity_sweeps", [])))),
-                    warnings_count=len(payload.get("diagnostics", {}).get("warnings", [])) if isinstance(payload.get("diagnostics", {}).get("warnings", []), list) else 0,
-                )
-            )
-        except Exception as exc:
-            if isinstance(exc, WorkbookFallbackTimeframeError):
-                workbook_fallback_rejects.append(str(exc))
-            errors.append({
-                "code": "BUILD_SYMBOL_ARTIFACT_FAILED",
-                "symbol": symbol,
-                "timeframe": resolved_timeframe,
-                "error": str(exc),
-            })
+    load_started = time.perf_counter()
+    shared_inputs = load_structure_batch_inputs(
+        workbook=resolved_workbook,
+        export_bundle_root=resolved_bundle_root,
+        timeframe=resolved_timeframe,
+        symbols=requested_symbols,
+    )
+    input_load_s = time.perf_counter() - load_started
+    jobs = [
+        _SymbolJob(
+            symbol=symbol,
+            artifact_path=output_dir / _artifact_file_name(symbol, resolved_timeframe),
+            workbook=resolved_workbook,
+            export_bundle_root=resolved_bundle_root,
+            timeframe=resolved_timeframe,
+            generated_at=effective_generated_at,
+            structure_profile=structure_profile,
+        )
+        for symbol in requested_symbols
+    ]
+    outcomes = _run_symbol_jobs(jobs, shared_inputs, max_workers=max_workers)
+
+    symbol_timings: dict[str, float] = {}
+    for outcome in outcomes:
+        symbol_timings[outcome.symbol] = round(outcome.elapsed_s, 6)
+        if outcome.row is not None:
+            artifact_rows.append(outcome.row)
+            continue
+        if outcome.fallback_reject:
+            workbook_fallback_rejects.append(outcome.error)
+        errors.append({
+            "code": "BUILD_SYMBOL_ARTIFACT_FAILED",
+            "symbol": outcome.symbol,
+            "timeframe": resolved_timeframe,
+            "error": outcome.error,
+        })
 
     manifest = build_structure_artifact_manifest(
         timeframe=resolved_timeframe,
@@ -642,4 +906,15 @@ def write_structure_artifacts_from_workbook(
     manifest_path = output_dir / _manifest_file_name(resolved_timeframe)
     _write_text_atomic(manifest_path, json.dumps(manifest, indent=2, sort_keys=True) + "\n")
     manifest["manifest_path"] = _relative_repo_path(manifest_path)
+    # Timings vary run to run, so they are logged rather than returned: the
+    # export CLI prints the manifest and its stdout must stay reproducible.
+    logger.info(
+        "structure batch timeframe=%s symbols=%d workers=%d input_load_s=%.3f build_s=%.3f",
+        resolved_timeframe,
+        len(requested_symbols),
+        max_workers,
+        input_load_s,
+        sum(symbol_timings.values()),
+    )
+    logger.debug("structure batch per-symbol build seconds: %s", symbol_timings)
     return manifest
@@ -344,6 +344,7 @@ from dashboard.decision_first_panel import (
 from dashboard.decision_first_panel import (
     render_panel as render_decision_first_panel,
 )
+from lazy_imports import lazy_module
 from newsstack_fmp._bz_http import _WARNED_ENDPOINTS
 from newsstack_fmp.ingest_benzinga import BenzingaRestAdapter
 from newsstack_fmp.ingest_fmp import FmpAdapter
@@ -357,11 +358,6 @@ from open_prep.realtime_signals import (
     get_rt_engine_status,
     get_rt_engine_telemetry_status,
 )
-from smc_integration.provider_health import (
-    _FAILURE_SEMANTICS_MATRIX,
-    FailureAction,
-    run_provider_health_check,
-)
 from terminal_attention_state import (
     annotate_feed_with_ticker_attention_state,
     effective_attention_dispatchable,
@@ -384,16 +380,13 @@ from terminal_export import (
 )
 from terminal_feed_lifecycle import FeedLifecycleManager, feed_staleness_minutes, is_market_hours
 from terminal_feed_state import (
+    IncrementalFeedState,
     build_derived_feed_state,
-    merge_live_feed_rows,
     restore_feed_state,
 )
 from terminal_feed_state import (
     hydrate_feed_story_state as hydrate_feed_story_state_core,
 )
-from terminal_feed_state import (
-    resync_feed_from_jsonl as resync_feed_from_jsonl_core,
-)
 from terminal_live_story_state import (
     apply_live_story_state,
     live_story_key,
@@ -531,6 +524,10 @@ from terminal_ui_helpers import (
 
 logger = logging.getLogger(__name__)
 
+# The provider-health check loads the whole smc_integration snapshot stack;
+# it is imported when the Provider Health tab first renders.
+_provider_health = lazy_module("smc_integration.provider_health")
+
 
 # A-3: Bump this string whenever the *shape* of any cached/derived session_state
 # entry changes (e.g. ClassifiedItem field count, ticker_*_state schema, feed
@@ -1036,6 +1033,19 @@ def _rebuild_feed_states() -> None:
     st.session_state["ticker_attention_state"] = derived.ticker_attention_state
 
 
+def _feed_state_engine() -> IncrementalFeedState:
+    """Session-scoped incremental derived-state engine for live merges.
+
+    ``apply_rows`` rebuilds from ``st.session_state.feed`` whenever another
+    path (restore, manual rebuild, reset) replaced the feed list.
+    """
+    engine = st.session_state.get("feed_state_engine")
+    if engine is None:
+        engine = IncrementalFeedState(st.session_state.get("cfg"))
+        st.session_state["feed_state_engine"] = engine
+    return engine
+
+
 def _load_reaction_quote_context(
     rows: list[dict[str, Any]] | None = None,
 ) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
@@ -1467,7 +1477,7 @@ def _resync_feed_from_jsonl() -> None:
         return
 
     rt_quotes, db_quotes = _load_reaction_quote_context(st.session_state.feed)
-    result = resync_feed_from_jsonl_core(
+    result = _feed_state_engine().resync(
         st.session_state.feed,
         cfg.jsonl_path,
         cfg=cfg,
@@ -2345,9 +2355,9 @@ def _process_new_items(
     new_dicts: list[dict[str, Any]] = []
     if raw_new_dicts or replace_story_key_set:
         rt_quotes, db_quotes = _load_reaction_quote_context(raw_new_dicts + st.session_state.feed)
-        merge_result = merge_live_feed_rows(
-            st.session_state.feed,
+        merge_result = _feed_state_engine().apply_rows(
             raw_new_dicts,
+            current_feed=st.session_state.feed,
             cfg=cfg,
             replace_story_keys=sorted(replace_story_key_set),
             previous_reaction_state=st.session_state.get("ticker_reaction_state") or {},
@@ -5021,7 +5031,7 @@ else:
         st.caption("Live provider status, domain visibility, staleness, failure semantics, and fallback chains.")
 
         try:
-            _health_report: dict[str, Any] | None = run_provider_health_check()
+            _health_report: dict[str, Any] | None = _provider_health.run_provider_health_check()
         except Exception as _health_exc:
             st.error(f"Health check failed: {_health_exc}")
             _health_report = None
@@ -5107,12 +5117,12 @@ else:
             # ── Failure semantics reference ───────────────────
             with st.expander("📖 Failure Semantics Reference"):
                 _sem_rows = []
-                for _fs in _FAILURE_SEMANTICS_MATRIX:
+                for _fs in _provider_health._FAILURE_SEMANTICS_MATRIX:
                     _action_icon = {
-                        FailureAction.FALLBACK: "🔄",
-                        FailureAction.ADVISORY: "ℹ️",
-                        FailureAction.SUPPRESS: "🚫",
-                        FailureAction.HARD_DEGRADE: "💀",
+                        _provider_health.FailureAction.FALLBACK: "🔄",
+                        _provider_health.FailureAction.ADVISORY: "ℹ️",
+                        _provider_health.FailureAction.SUPPRESS: "🚫",
+                        _provider_health.FailureAction.HARD_DEGRADE: "💀",
                     }.get(_fs.action, "")
                     _sem_rows.append({
                         "Domain": _fs.domain,
@@ -31,6 +31,7 @@ from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 from typing import Any
 
+from lazy_imports import lazy_module, module_available
 from open_prep_boundary import FMPClientLike, make_fmp_client
 from terminal_technicals import (
     _tv_cooldown_remaining,
@@ -50,18 +51,12 @@ try:
 except ImportError:
     _HTTPX = False
 
-try:
-    import yfinance as yf  # type: ignore[import-untyped]
-    _YF = True
-except ImportError:
-    yf = SimpleNamespace(Ticker=None)
-    _YF = False
+# yfinance and tradingview_ta are imported on first use, not at startup.
+_YF = module_available("yfinance")
+yf = lazy_module("yfinance") if _YF else SimpleNamespace(Ticker=None)
 
-try:
-    from tradingview_ta import Interval, TA_Handler  # type: ignore[import-untyped]
-    _TV = True
-except ImportError:
-    _TV = False
+tradingview_ta = lazy_module("tradingview_ta")
+_TV = module_available("tradingview_ta")
 
 try:
     import pandas as pd  # type: ignore[import-untyped]  # noqa: F401
@@ -565,6 +560,7 @@ def fetch_btc_technicals(interval: str = "1h") -> BTCTechnicals:
         log.debug("TradingView BTC cooldown active (%.0fs remaining), skipping %s", remaining, interval)
         return BTCTechnicals(interval=interval, error="Rate limited — cooldown active")
 
+    Interval = tradingview_ta.Interval
     interval_map = {
         "1m": Interval.INTERVAL_1_MINUTE,
         "5m": Interval.INTERVAL_5_MINUTES,
@@ -581,7 +577,7 @@ def fetch_btc_technicals(interval: str = "1h") -> BTCTechnicals:
 
     try:
         _tv_throttle()  # enforce spacing + raises on cooldown
-        handler = TA_Handler(
+        handler = tradingview_ta.TA_Handler(
             symbol="BTCUSDT",
             screener="crypto",
             exchange="BINANCE",
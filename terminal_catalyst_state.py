@@ -203,6 +203,7 @@ def build_ticker_catalyst_state(
     feed: list[dict[str, Any]] | None,
     *,
     now: float | None = None,
+    age_anchors: dict[str, float] | None = None,
 ) -> dict[str, dict[str, Any]]:
     if now is None:
         now = time.time()
@@ -293,6 +294,11 @@ def build_ticker_catalyst_state(
         confidence = min(max(confidence, 0.0), 1.0)
 
         age_minutes = _story_age_minutes(best_row, now=now)
+        # Callers that age the state forward without re-deriving it need the
+        # timestamp the age is measured from; an explicit age_minutes is fixed.
+        best_story_ts = _story_timestamp(best_row)
+        if age_anchors is not None and best_story_ts > 0:
+            age_anchors[ticker] = best_story_ts
         freshness = _freshness_bucket(age_minutes)
         best_story_actionable = bool(best_row.get("is_actionable", False))
         actionable = bool(
@@ -334,10 +340,11 @@ def annotate_feed_with_ticker_catalyst_state(
     ticker_state: dict[str, dict[str, Any]] | None = None,
     *,
     now: float | None = None,
+    age_anchors: dict[str, float] | None = None,
 ) -> tuple[list[dict[str, Any]], dict[str, dict[str, Any]]]:
     if now is None:
         now = time.time()
-    resolved_state = ticker_state or build_ticker_catalyst_state(feed, now=now)
+    resolved_state = ticker_state or build_ticker_catalyst_state(feed, now=now, age_anchors=age_anchors)
     annotated: list[dict[str, Any]] = []
     for row in feed or []:
         ticker = str(row.get("ticker") or "").strip().upper()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import heapq
 import time
 from dataclasses import dataclass, field
 from typing import Any
@@ -14,7 +15,7 @@ from terminal_poller import seed_provider_cursors
 from terminal_posture_state import annotate_feed_with_ticker_posture_state
 from terminal_reaction_state import annotate_feed_with_ticker_reaction_state
 from terminal_resolution_state import annotate_feed_with_ticker_resolution_state
-from terminal_ui_helpers import dedup_feed_items, dedup_merge
+from terminal_ui_helpers import dedup_feed_items, dedup_merge, feed_item_identity_key
 
 
 @dataclass(slots=True)
@@ -49,11 +50,19 @@ def _prune_feed(
         return list(feed)
     current_now = float(now if now is not None else time.time())
     cutoff = current_now - float(max_age_s)
-    return [
-        row for row in feed
-        if (row.get("published_ts") or 0) >= cutoff
-        or (row.get("published_ts") or 0) == 0
-    ]
+    return [row for row in feed if _row_within_cutoff(row, cutoff)]
+
+
+def _row_within_cutoff(row: dict[str, Any], cutoff: float) -> bool:
+    published_ts = row.get("published_ts") or 0
+    return published_ts >= cutoff or published_ts == 0
+
+
+def _live_story_params(cfg: Any | None) -> tuple[float, float]:
+    return (
+        float(getattr(cfg, "live_story_ttl_s", 7200.0) or 7200.0),
+        float(getattr(cfg, "live_story_cooldown_s", 900.0) or 900.0),
+    )
 
 
 def _story_key_for_feed_row(row: dict[str, Any]) -> str:
@@ -82,70 +91,71 @@ def _annotate_rows_with_states(
     ticker_resolution_state: dict[str, dict[str, Any]],
     ticker_posture_state: dict[str, dict[str, Any]],
     ticker_attention_state: dict[str, dict[str, Any]],
+    now: float | None = None,
 ) -> list[dict[str, Any]]:
-    annotated, _ = annotate_feed_with_ticker_catalyst_state(rows, ticker_catalyst_state)
-    annotated, _ = annotate_feed_with_ticker_reaction_state(annotated, ticker_reaction_state)
-    annotated, _ = annotate_feed_with_ticker_resolution_state(annotated, ticker_resolution_state)
-    annotated, _ = annotate_feed_with_ticker_posture_state(annotated, ticker_posture_state)
-    annotated, _ = annotate_feed_with_ticker_attention_state(annotated, ticker_attention_state)
+    # An empty state makes the helpers derive one from *rows*; do that as of
+    # the merge's ``now`` rather than the wall clock.
+    annotated, _ = annotate_feed_with_ticker_catalyst_state(rows, ticker_catalyst_state, now=now)
+    annotated, _ = annotate_feed_with_ticker_reaction_state(annotated, ticker_reaction_state, now=now)
+    annotated, _ = annotate_feed_with_ticker_resolution_state(annotated, ticker_resolution_state, now=now)
+    annotated, _ = annotate_feed_with_ticker_posture_state(annotated, ticker_posture_state, now=now)
+    annotated, _ = annotate_feed_with_ticker_attention_state(annotated, ticker_attention_state, now=now)
     return annotated
 
 
+def _hydrate_story_row(row: dict[str, Any], state: dict[str, Any] | None) -> dict[str, Any]:
+    hydrated_row = dict(row)
+    if state is None:
+        return hydrated_row
+
+    hydrated_row["story_key"] = state["story_key"]
+    hydrated_row["story_update_kind"] = str(
+        hydrated_row.get("story_update_kind") or state.get("last_action") or "restored"
+    )
+    hydrated_row["story_first_seen_ts"] = _safe_story_float(
+        hydrated_row.get("story_first_seen_ts") or state.get("first_seen_ts"),
+        default=0.0,
+    )
+    hydrated_row["story_last_seen_ts"] = _safe_story_float(
+        hydrated_row.get("story_last_seen_ts")
+        or hydrated_row.get("updated_ts")
+        or hydrated_row.get("published_ts")
+        or state.get("last_seen_ts")
+        or 0.0,
+        default=0.0,
+    )
+    hydrated_row["story_providers_seen"] = _safe_story_provider_list(
+        hydrated_row.get("story_providers_seen") or state.get("providers_seen") or []
+    )
+    hydrated_row["story_best_source"] = str(
+        hydrated_row.get("story_best_source") or state.get("best_source") or ""
+    )
+    hydrated_row["story_best_provider"] = str(
+        hydrated_row.get("story_best_provider") or state.get("best_provider") or ""
+    )
+    hydrated_row["story_cooldown_until"] = _safe_story_float(
+        hydrated_row.get("story_cooldown_until") or state.get("cooldown_until") or 0.0,
+        default=0.0,
+    )
+    hydrated_row["story_expires_at"] = _safe_story_float(
+        hydrated_row.get("story_expires_at") or state.get("expires_at") or 0.0,
+        default=0.0,
+    )
+    return hydrated_row
+
+
 def _hydrate_feed_story_state(
     feed: list[dict[str, Any]],
     *,
     cfg: Any | None = None,
     now: float | None = None,
 ) -> tuple[list[dict[str, Any]], dict[str, dict[str, Any]]]:
-    story_state = build_live_story_state_from_feed(
-        feed,
-        now=now,
-        ttl_s=float(getattr(cfg, "live_story_ttl_s", 7200.0) or 7200.0),
-        cooldown_s=float(getattr(cfg, "live_story_cooldown_s", 900.0) or 900.0),
-    )
-    hydrated: list[dict[str, Any]] = []
-    for row in feed:
-        hydrated_row = dict(row)
-        story_key = _story_key_for_feed_row(hydrated_row)
-        state = story_state.get(story_key)
-        if state is None:
-            hydrated.append(hydrated_row)
-            continue
-
-        hydrated_row["story_key"] = state["story_key"]
-        hydrated_row["story_update_kind"] = str(
-            hydrated_row.get("story_update_kind") or state.get("last_action") or "restored"
-        )
-        hydrated_row["story_first_seen_ts"] = _safe_story_float(
-            hydrated_row.get("story_first_seen_ts") or state.get("first_seen_ts"),
-            default=0.0,
-        )
-        hydrated_row["story_last_seen_ts"] = _safe_story_float(
-            hydrated_row.get("story_last_seen_ts")
-            or hydrated_row.get("updated_ts")
-            or hydrated_row.get("published_ts")
-            or state.get("last_seen_ts")
-            or 0.0,
-            default=0.0,
-        )
-        hydrated_row["story_providers_seen"] = _safe_story_provider_list(
-            hydrated_row.get("story_providers_seen") or state.get("providers_seen") or []
-        )
-        hydrated_row["story_best_source"] = str(
-            hydrated_row.get("story_best_source") or state.get("best_source") or ""
-        )
-        hydrated_row["story_best_provider"] = str(
-            hydrated_row.get("story_best_provider") or state.get("best_provider") or ""
-        )
-        hydrated_row["story_cooldown_until"] = _safe_story_float(
-            hydrated_row.get("story_cooldown_until") or state.get("cooldown_until") or 0.0,
-            default=0.0,
-        )
-        hydrated_row["story_expires_at"] = _safe_story_float(
-            hydrated_row.get("story_expires_at") or state.get("expires_at") or 0.0,
-            default=0.0,
-        )
-        hydrated.append(hydrated_row)
+    ttl_s, cooldown_s = _live_story_params(cfg)
+    story_state = build_live_story_state_from_feed(feed, now=now, ttl_s=ttl_s, cooldown_s=cooldown_s)
+    hydrated = [
+        _hydrate_story_row(row, story_state.get(_story_key_for_feed_row(row)))
+        for row in feed
+    ]
     return dedup_feed_items(hydrated), story_state
 
 
@@ -158,18 +168,22 @@ def hydrate_feed_story_state(
     return _hydrate_feed_story_state(feed, cfg=cfg, now=now)
 
 
-def _derive_cursors(feed: list[dict[str, Any]]) -> tuple[str | None, dict[str, str]]:
-    timestamps = [
-        row.get("updated_ts") or row.get("published_ts") or 0
-        for row in feed
-    ]
-    timestamps = [ts for ts in timestamps if isinstance(ts, (int, float)) and ts > 0]
-    if not timestamps:
+def _row_cursor_ts(row: dict[str, Any]) -> float:
+    ts = row.get("updated_ts") or row.get("published_ts") or 0
+    return ts if isinstance(ts, (int, float)) and ts > 0 else 0
+
+
+def _cursors_from_ts(max_ts: float) -> tuple[str | None, dict[str, str]]:
+    if max_ts <= 0:
         return None, {}
-    legacy_cursor = str(int(max(timestamps)))
+    legacy_cursor = str(int(max_ts))
     return legacy_cursor, seed_provider_cursors(legacy_cursor)
 
 
+def _derive_cursors(feed: list[dict[str, Any]]) -> tuple[str | None, dict[str, str]]:
+    return _cursors_from_ts(max((_row_cursor_ts(row) for row in feed), default=0))
+
+
 def build_derived_feed_state(
     feed: list[dict[str, Any]] | None,
     *,
@@ -345,6 +359,581 @@ def merge_live_feed_rows(
         ticker_resolution_state=result.ticker_resolution_state,
         ticker_posture_state=result.ticker_posture_state,
         ticker_attention_state=result.ticker_attention_state,
+        now=now,
     )
     result.new_count = len(result.annotated_new_rows)
     return result
+
+
+# Derived fields that restate ``now`` (or the age relative to it) on every
+# pass. No layer decision reads them except through the age/expiry thresholds
+# tracked on the engine's event heap, so a ticker is not re-derived just
+# because they moved; the engine re-stamps them from ``now`` on every merge
+# instead (see ``IncrementalFeedState._refresh_clock_fields``).
+VOLATILE_DERIVED_FIELDS = frozenset(
+    {
+        "catalyst_age_minutes",
+        "reaction_last_update_ts",
+        "resolution_elapsed_minutes",
+        "resolution_last_update_ts",
+        "posture_last_update_ts",
+        "attention_last_update_ts",
+    }
+)
+# Story-age thresholds (minutes) used by the catalyst freshness buckets and
+# the posture/attention layers.
+_AGE_THRESHOLDS_S = tuple(minutes * 60.0 for minutes in (15.0, 30.0, 45.0, 60.0, 240.0, 1440.0))
+# Resolution confidence ramps continuously over this window after the anchor.
+_RESOLUTION_WINDOW_S = 20.0 * 60.0
+# Heap events fire slightly early; a premature recompute is a no-op.
+_EVENT_LEAD_S = 1e-3
+# Rows without a tradable ticker get story hydration but no ticker state.
+_UNSCOPED_GROUPS = frozenset({"", "MARKET"})
+
+
+@dataclass(slots=True, eq=False)
+class _FeedEntry:
+    row: dict[str, Any]
+    identity: str
+    group: str
+    story_key: str
+    alive: bool = True
+
+
+def _feed_group(row: dict[str, Any]) -> str:
+    return str(row.get("ticker") or "").strip().upper()
+
+
+def _stable_view(values: dict[str, Any] | None) -> dict[str, Any] | None:
+    if values is None:
+        return None
+    return {key: value for key, value in values.items() if key not in VOLATILE_DERIVED_FIELDS}
+
+
+def _row_story_ts(row: dict[str, Any]) -> float:
+    for field_name in ("story_last_seen_ts", "updated_ts", "published_ts"):
+        value = _safe_story_float(row.get(field_name) or 0.0)
+        if value > 0:
+            return value
+    return 0.0
+
+
+def _quote_groups(*quote_maps: dict[str, dict[str, Any]] | None) -> set[str]:
+    return {
+        str(symbol or "").strip().upper()
+        for quotes in quote_maps
+        for symbol in (quotes or {})
+        if str(symbol or "").strip()
+    }
+
+
+class IncrementalFeedState:
+    """Reducer-style maintainer of :class:`DerivedFeedState` across merges.
+
+    ``merge_live_feed_rows`` re-derives every layer from the whole feed. All
+    of those layers are keyed by ticker (story state by story key), so this
+    engine keeps the feed indexed by both and, per :meth:`apply_rows`, re-runs
+    the same derivation only for tickers that the delta touched, that carry
+    quote context, or whose next prune/expiry/age boundary has passed (tracked
+    on time-ordered heaps). A ticker stays dirty until one pass leaves it
+    unchanged, because each pass reads back fields the previous one wrote.
+    Tickers left alone still get their :data:`VOLATILE_DERIVED_FIELDS`
+    re-stamped from ``now``, so the result equals the ``merge_live_feed_rows``
+    chain. A config change, a feed replaced outside
+    the engine, or :meth:`resync` falls back to a full rebuild.
+    """
+
+    def __init__(self, cfg: Any | None = None) -> None:
+        self._cfg = cfg
+        self._signature: tuple[float, float, float, int] | None = None
+        self._feed: list[dict[str, Any]] | None = None
+        self._entries: list[_FeedEntry] = []
+        self._by_identity: dict[str, _FeedEntry] = {}
+        self._by_group: dict[str, list[_FeedEntry]] = {}
+        self._by_story: dict[str, list[_FeedEntry]] = {}
+        self._story_state: dict[str, dict[str, Any]] = {}
+        self._catalyst_state: dict[str, dict[str, Any]] = {}
+        self._reaction_state: dict[str, dict[str, Any]] = {}
+        self._resolution_state: dict[str, dict[str, Any]] = {}
+        self._posture_state: dict[str, dict[str, Any]] = {}
+        self._attention_state: dict[str, dict[str, Any]] = {}
+        self._age_anchors: dict[str, float] = {}
+        self._group_events: list[tuple[float, str, int]] = []
+        self._group_generation: dict[str, int] = {}
+        self._story_events: list[tuple[float, str]] = []
+        self._pending_groups: set[str] = set()
+        self._pending_story_keys: set[str] = set()
+        self._live_groups: set[str] = set()
+        self._max_cursor_ts: float = 0
+        self.full_rebuilds = 0
+
+    @property
+    def feed(self) -> list[dict[str, Any]]:
+        return list(self._feed or [])
+
+    @staticmethod
+    def _signature_for(cfg: Any | None, *, market_hours: bool) -> tuple[float, float, float, int]:
+        ttl_s, cooldown_s = _live_story_params(cfg)
+        return (
+            _feed_max_age_s(cfg, market_hours=market_hours),
+            ttl_s,
+            cooldown_s,
+            int(getattr(cfg, "max_items", 0) or 0),
+        )
+
+    def apply_rows(
+        self,
+        new_rows: list[dict[str, Any]],
+        *,
+        current_feed: list[dict[str, Any]] | None = None,
+        cfg: Any | None = None,
+        replace_story_keys: list[str] | None = None,
+        previous_reaction_state: dict[str, dict[str, Any]] | None = None,
+        previous_resolution_state: dict[str, dict[str, Any]] | None = None,
+        rt_quotes: dict[str, dict[str, Any]] | None = None,
+        quote_map: dict[str, dict[str, Any]] | None = None,
+        now: float | None = None,
+        market_hours: bool = True,
+    ) -> DerivedFeedState:
+        """Merge *new_rows* like ``merge_live_feed_rows`` and update derived state.
+
+        *current_feed* is the caller's copy of the feed; when it is not the
+        list this engine last returned, the engine rebuilds from it (as it
+        does on the first call and on a config change). The previous
+        reaction/resolution states are only consulted by that rebuild.
+        """
+        cfg = self._cfg if cfg is None else cfg
+        current_now = float(now if now is not None else time.time())
+        signature = self._signature_for(cfg, market_hours=market_hours)
+        if (
+            self._signature is None
+            or signature != self._signature
+            or (
+                current_feed is not None
+                and (current_feed is not self._feed or len(current_feed) != len(self._entries))
+            )
+        ):
+            result = merge_live_feed_rows(
+                list(current_feed if current_feed is not None else self._feed or []),
+                new_rows,
+                cfg=cfg,
+                replace_story_keys=replace_story_keys,
+                previous_reaction_state=(
+                    previous_reaction_state if previous_reaction_state is not None else self._reaction_state
+                ),
+                previous_resolution_state=(
+                    previous_resolution_state if previous_resolution_state is not None else self._resolution_state
+                ),
+                rt_quotes=rt_quotes,
+                quote_map=quote_map,
+                now=current_now,
+                market_hours=market_hours,
+            )
+            self._load(result, cfg=cfg, signature=signature)
+            return result
+
+        max_age_s, ttl_s, cooldown_s, max_items = signature
+        raw_new_rows = dedup_feed_items(list(new_rows or []))
+        dirty_groups = self._pending_groups | self._live_groups
+        touched_keys = set(self._pending_story_keys)
+        self._pending_groups = set()
+        self._pending_story_keys = set()
+        self._pop_due_events(current_now, dirty_groups)
+
+        removed: list[_FeedEntry] = []
+        for story_key in {str(key).strip() for key in (replace_story_keys or []) if str(key).strip()}:
+            for entry in self._by_story.get(story_key, ()):
+                self._kill(entry, removed)
+
+        new_entries: list[_FeedEntry] = []
+        for row in raw_new_rows:
+            identity = feed_item_identity_key(row)
+            existing = self._by_identity.get(identity)
+            if existing is not None:
+                self._kill(existing, removed)
+            entry = _FeedEntry(row, identity, _feed_group(row), _story_key_for_feed_row(row))
+            self._by_identity[identity] = entry
+            new_entries.append(entry)
+
+        entries = new_entries + [entry for entry in self._entries if entry.alive]
+        if max_items > 0 and len(entries) > max_items:
+            for entry in entries[max_items:]:
+                self._kill(entry, removed)
+            entries = entries[:max_items]
+
+        if max_age_s > 0:
+            cutoff = current_now - max_age_s
+            candidates = [entry for entry in new_entries if entry.alive]
+            for group in dirty_groups:
+                candidates.extend(self._by_group.get(group, ()))
+            for entry in candidates:
+                if entry.alive and not _row_within_cutoff(entry.row, cutoff):
+                    self._kill(entry, removed)
+
+        changed_entries = [entry for entry in new_entries if entry.alive] + removed
+        self._reindex(new_entries, changed_entries)
+        for entry in changed_entries:
+            dirty_groups.add(entry.group)
+            touched_keys.add(entry.story_key)
+        self._entries = [entry for entry in entries if entry.alive]
+        self._update_cursor(new_entries, removed)
+
+        for story_key in touched_keys:
+            story_entries = self._by_story.get(story_key, ())
+            state = None
+            if story_entries:
+                state = build_live_story_state_from_feed(
+                    [entry.row for entry in story_entries],
+                    now=current_now,
+                    ttl_s=ttl_s,
+                    cooldown_s=cooldown_s,
+                ).get(story_key)
+            if state == self._story_state.get(story_key):
+                continue
+            if state is None:
+                self._story_state.pop(story_key, None)
+            else:
+                self._story_state[story_key] = state
+                heapq.heappush(self._story_events, (float(state.get("expires_at", 0.0) or 0.0), story_key))
+            self._pending_story_keys.add(story_key)
+            dirty_groups.update(entry.group for entry in story_entries)
+
+        quote_groups = _quote_groups(rt_quotes, quote_map)
+        dirty_groups |= quote_groups & self._by_group.keys()
+        self._recompute_groups(
+            dirty_groups,
+            quote_groups=quote_groups,
+            rt_quotes=rt_quotes,
+            quote_map=quote_map,
+            now=current_now,
+            max_age_s=max_age_s,
+        )
+        self._refresh_clock_fields(self._by_group.keys() - dirty_groups, now=current_now)
+
+        self._feed = [entry.row for entry in self._entries]
+        legacy_cursor, provider_cursors = _cursors_from_ts(self._max_cursor_ts)
+        result = DerivedFeedState(
+            feed=self._feed,
+            live_story_state=dict(self._story_state),
+            ticker_catalyst_state=dict(self._catalyst_state),
+            ticker_reaction_state=dict(self._reaction_state),
+            ticker_resolution_state=dict(self._resolution_state),
+            ticker_posture_state=dict(self._posture_state),
+            ticker_attention_state=dict(self._attention_state),
+            legacy_cursor=legacy_cursor,
+            provider_cursors=provider_cursors,
+        )
+        result.annotated_new_rows = _annotate_rows_with_states(
+            raw_new_rows,
+            ticker_catalyst_state=result.ticker_catalyst_state,
+            ticker_reaction_state=result.ticker_reaction_state,
+            ticker_resolution_state=result.ticker_resolution_state,
+            ticker_posture_state=result.ticker_posture_state,
+            ticker_attention_state=result.ticker_attention_state,
+            now=current_now,
+        )
+        result.new_count = len(result.annotated_new_rows)
+        return result
+
+    def resync(
+        self,
+        current_feed: list[dict[str, Any]],
+        jsonl_path: str,
+        *,
+        cfg: Any | None = None,
+        previous_reaction_state: dict[str, dict[str, Any]] | None = None,
+        previous_resolution_state: dict[str, dict[str, Any]] | None = None,
+        rt_quotes: dict[str, dict[str, Any]] | None = None,
+        quote_map: dict[str, dict[str, Any]] | None = None,
+        now: float | None = None,
+        market_hours: bool = True,
+    ) -> DerivedFeedState:
+        """Full-rebuild ``resync_feed_from_jsonl`` that re-seeds the engine."""
+        cfg = self._cfg if cfg is None else cfg
+        result = resync_feed_from_jsonl(
+            current_feed,
+            jsonl_path,
+            cfg=cfg,
+            previous_reaction_state=previous_reaction_state,
+            previous_resolution_state=previous_resolution_state,
+            rt_quotes=rt_quotes,
+            quote_map=quote_map,
+            now=now,
+            market_hours=market_hours,
+        )
+        self._load(result, cfg=cfg, signature=self._signature_for(cfg, market_hours=market_hours))
+        return result
+
+    def _load(
+        self,
+        result: DerivedFeedState,
+        *,
+        cfg: Any | None,
+        signature: tuple[float, float, float, int],
+    ) -> None:
+        self.full_rebuilds += 1
+        self._cfg = cfg
+        self._signature = signature
+        self._feed = result.feed
+        self._entries = [
+            _FeedEntry(row, feed_item_identity_key(row), _feed_group(row), _story_key_for_feed_row(row))
+            for row in result.feed
+        ]
+        self._by_identity = {entry.identity: entry for entry in self._entries}
+        self._by_group = {}
+        self._by_story = {}
+        for entry in self._entries:
+            self._by_group.setdefault(entry.group, []).append(entry)
+            self._by_story.setdefault(entry.story_key, []).append(entry)
+        self._story_state = dict(result.live_story_state)
+        self._catalyst_state = dict(result.ticker_catalyst_state)
+        self._reaction_state = dict(result.ticker_reaction_state)
+        self._resolution_state = dict(result.ticker_resolution_state)
+        self._posture_state = dict(result.ticker_posture_state)
+        self._attention_state = dict(result.ticker_attention_state)
+        # Filled by the settling pass below, which recomputes every group.
+        self._age_anchors = {}
+        self._story_events = [
+            (float(state.get("expires_at", 0.0) or 0.0), story_key)
+            for story_key, state in self._story_state.items()
+        ]
+        heapq.heapify(self._story_events)
+        self._group_events = []
+        self._group_generation = {}
+        # The full rebuild derived every layer from rows that did not yet
+        # carry its output, so every group needs one settling pass.
+        self._pending_groups = set(self._by_group)
+        self._pending_story_keys = set(self._by_story)
+        self._live_groups = set()
+        self._max_cursor_ts = max((_row_cursor_ts(entry.row) for entry in self._entries), default=0)
+
+    def _kill(self, entry: _FeedEntry, removed: list[_FeedEntry]) -> None:
+        if not entry.alive:
+            return
+        entry.alive = False
+        removed.append(entry)
+        if self._by_identity.get(entry.identity) is entry:
+            del self._by_identity[entry.identity]
+
+    def _reindex(self, new_entries: list[_FeedEntry], changed_entries: list[_FeedEntry]) -> None:
+        for index, key_of in (
+            (self._by_group, lambda entry: entry.group),
+            (self._by_story, lambda entry: entry.story_key),
+        ):
+            fresh: dict[str, list[_FeedEntry]] = {}
+            for entry in new_entries:
+                if entry.alive:
+                    fresh.setdefault(key_of(entry), []).append(entry)
+            for key in {key_of(entry) for entry in changed_entries}:
+                kept = fresh.get(key, []) + [entry for entry in index.get(key, ()) if entry.alive]
+                if kept:
+                    index[key] = kept
+                else:
+                    index.pop(key, None)
+
+    def _update_cursor(self, new_entries: list[_FeedEntry], removed: list[_FeedEntry]) -> None:
+        if any(_row_cursor_ts(entry.row) >= self._max_cursor_ts for entry in removed):
+            self._max_cursor_ts = max((_row_cursor_ts(entry.row) for entry in self._entries), default=0)
+            return
+        for entry in new_entries:
+            if entry.alive:
+                self._max_cursor_ts = max(self._max_cursor_ts, _row_cursor_ts(entry.row))
+
+    def _pop_due_events(self, now: float, dirty_groups: set[str]) -> None:
+        while self._group_events and self._group_events[0][0] <= now:
+            _, group, generation = heapq.heappop(self._group_events)
+            if self._group_generation.get(group) == generation:
+                dirty_groups.add(group)
+        while self._story_events and self._story_events[0][0] <= now:
+            _, story_key = heapq.heappop(self._story_events)
+            state = self._story_state.get(story_key)
+            if state is not None and float(state.get("expires_at", 0.0) or 0.0) <= now:
+                del self._story_state[story_key]
+
+    def _recompute_groups(
+        self,
+        groups: set[str],
+        *,
+        quote_groups: set[str],
+        rt_quotes: dict[str, dict[str, Any]] | None,
+        quote_map: dict[str, dict[str, Any]] | None,
+        now: float,
+        max_age_s: float,
+    ) -> None:
+        layer_states = (
+            self._catalyst_state,
+            self._reaction_state,
+            self._resolution_state,
+            self._posture_state,
+            self._attention_state,
+        )
+        before_rows: dict[str, list[dict[str, Any]]] = {}
+        dropped = False
+        for group in groups:
+            entries = self._by_group.get(group)
+            if not entries:
+                self._by_group.pop(group, None)
+                for store in layer_states:
+                    store.pop(group, None)
+                self._age_anchors.pop(group, None)
+                self._group_generation.pop(group, None)
+                self._live_groups.discard(group)
+                continue
+            before_rows[group] = [entry.row for entry in entries]
+            seen: set[str] = set()
+            kept: list[_FeedEntry] = []
+            for entry in entries:
+                hydrated = _hydrate_story_row(entry.row, self._story_state.get(entry.story_key))
+                if hydrated != entry.row:
+                    self._pending_story_keys.add(entry.story_key)
+                identity = feed_item_identity_key(hydrated)
+                if identity in seen:
+                    # Same post-hydration dedup as the full rebuild; the story
+                    # state still counted this row, so re-derive it next pass.
+                    entry.alive = False
+                    dropped = True
+                    self._pending_story_keys.add(entry.story_key)
+                    if self._by_identity.get(entry.identity) is entry:
+                        del self._by_identity[entry.identity]
+                    continue
+                seen.add(identity)
+                if self._by_identity.get(entry.identity) is entry:
+                    del self._by_identity[entry.identity]
+                entry.row = hydrated
+                entry.identity = identity
+                self._by_identity[identity] = entry
+                kept.append(entry)
+            self._by_group[group] = kept
+
+        if dropped:
+            for story_key in list(self._pending_story_keys):
+                story_entries = self._by_story.get(story_key)
+                if story_entries is not None:
+                    self._by_story[story_key] = [entry for entry in story_entries if entry.alive]
+            self._entries = [entry for entry in self._entries if entry.alive]
+            self._max_cursor_ts = max((_row_cursor_ts(entry.row) for entry in self._entries), default=0)
+
+        scoped = [group for group in before_rows if group not in _UNSCOPED_GROUPS]
+        chain_entries = [entry for group in scoped for entry in self._by_group[group]]
+        age_anchors: dict[str, float] = {}
+        annotated, catalyst = annotate_feed_with_ticker_catalyst_state(
+            [entry.row for entry in chain_entries],
+            now=now,
+            age_anchors=age_anchors,
+        )
+        annotated, reaction = annotate_feed_with_ticker_reaction_state(
+            annotated,
+            rt_quotes=rt_quotes,
+            quote_map=quote_map,
+            previous_state=self._reaction_state,
+            now=now,
+        )
+        annotated, resolution = annotate_feed_with_ticker_resolution_state(
+            annotated,
+            rt_quotes=rt_quotes,
+            quote_map=quote_map,
+            previous_state=self._resolution_state,
+            now=now,
+        )
+        annotated, posture = annotate_feed_with_ticker_posture_state(annotated, now=now)
+        annotated, attention = annotate_feed_with_ticker_attention_state(annotated, now=now)
+        for entry, row in zip(chain_entries, annotated, strict=True):
+            entry.row = row
+
+        new_states = (catalyst, reaction, resolution, posture, attention)
+        for group, rows_before in before_rows.items():
+            entries = self._by_group[group]
+            changed = len(rows_before) != len(entries) or any(
+                _stable_view(before) != _stable_view(entry.row)
+                for before, entry in zip(rows_before, entries, strict=False)
+            )
+            if group not in _UNSCOPED_GROUPS:
+                for store, fresh in zip(layer_states, new_states, strict=True):
+                    state = fresh.get(group)
+                    if _stable_view(state) != _stable_view(store.get(group)):
+                        changed = True
+                    if state is None:
+                        store.pop(group, None)
+                    else:
+                        store[group] = state
+                if group in age_anchors:
+                    self._age_anchors[group] = age_anchors[group]
+                else:
+                    self._age_anchors.pop(group, None)
+            if changed:
+                self._pending_groups.add(group)
+
+            anchor_ts = _safe_story_float(
+                (self._resolution_state.get(group) or {}).get("resolution_anchor_ts") or 0.0
+            )
+            if group in quote_groups or (anchor_ts > 0 and now < anchor_ts + _RESOLUTION_WINDOW_S + 1.0):
+                self._live_groups.add(group)
+            else:
+                self._live_groups.discard(group)
+            self._schedule_group(group, entries, now=now, max_age_s=max_age_s)
+
+    def _refresh_clock_fields(self, groups: set[str], *, now: float) -> None:
+        """Re-stamp :data:`VOLATILE_DERIVED_FIELDS` of *groups* as of *now*.
+
+        Mirrors what the layer builders would write for an otherwise unchanged
+        ticker: every ``*_last_update_ts`` is ``now`` and the catalyst age and
+        resolution elapsed time are measured from their stored anchors. States
+        and rows are updated in place, so an untouched ticker keeps its rows.
+        """
+        for group in groups:
+            fields: dict[str, Any] = {}
+            catalyst = self._catalyst_state.get(group)
+            age_anchor = self._age_anchors.get(group)
+            if catalyst is not None and age_anchor is not None:
+                catalyst["catalyst_age_minutes"] = round(max((now - age_anchor) / 60.0, 0.0), 3)
+                fields["catalyst_age_minutes"] = catalyst["catalyst_age_minutes"]
+            resolution = self._resolution_state.get(group)
+            if resolution is not None:
+                anchor_ts = _safe_story_float(resolution.get("resolution_anchor_ts") or 0.0)
+                if anchor_ts > 0:
+                    resolution["resolution_elapsed_minutes"] = round(max((now - anchor_ts) / 60.0, 0.0), 6)
+                    fields["resolution_elapsed_minutes"] = resolution["resolution_elapsed_minutes"]
+            for store, field_name in (
+                (self._reaction_state, "reaction_last_update_ts"),
+                (self._resolution_state, "resolution_last_update_ts"),
+                (self._posture_state, "posture_last_update_ts"),
+                (self._attention_state, "attention_last_update_ts"),
+            ):
+                state = store.get(group)
+                if state is not None:
+                    state[field_name] = now
+                    fields[field_name] = now
+            if fields:
+                # The last recompute annotated every row of the group with
+                # these states, so the rows already carry each key.
+                for entry in self._by_group.get(group, ()):
+                    entry.row.update(fields)
+
+    def _schedule_group(
+        self,
+        group: str,
+        entries: list[_FeedEntry],
+        *,
+        now: float,
+        max_age_s: float,
+    ) -> None:
+        boundaries: list[float] = []
+        for entry in entries:
+            row = entry.row
+            published_ts = _safe_story_float(row.get("published_ts") or 0.0)
+            if max_age_s > 0 and published_ts:
+                boundaries.append(published_ts + max_age_s)
+            if group in _UNSCOPED_GROUPS:
+                continue
+            for field_name in ("story_expires_at", "catalyst_expires_at"):
+                expires_at = _safe_story_float(row.get(field_name) or 0.0)
+                if expires_at > 0:
+                    boundaries.append(expires_at)
+            story_ts = _row_story_ts(row)
+            if story_ts > 0:
+                boundaries.extend(story_ts + threshold for threshold in _AGE_THRESHOLDS_S)
+        upcoming = [boundary for boundary in boundaries if boundary > now - _EVENT_LEAD_S]
+        generation = self._group_generation.get(group, 0) + 1
+        self._group_generation[group] = generation
+        if upcoming:
+            heapq.heappush(self._group_events, (max(min(upcoming) - _EVENT_LEAD_S, now), group, generation))
@@ -14,21 +14,20 @@ import threading
 import time
 from dataclasses import dataclass, field
 
+from lazy_imports import lazy_module, module_available
 from open_prep_boundary import FMPClientLike, make_fmp_client
 
 log = logging.getLogger(__name__)
 
 # ── Optional deps ────────────────────────────────────────────────
-try:
-    import yfinance as yf  # type: ignore[import-untyped]
-
-    _YF_AVAILABLE = True
+# yfinance is imported on the first forecast fetch, not at startup.
+_YF_AVAILABLE = module_available("yfinance")
+yf = lazy_module("yfinance")
+if _YF_AVAILABLE:
     # Suppress yfinance internal logger — it emits ERROR for every 404
     # (e.g. leveraged ETFs with no fundamentals on Yahoo), which floods
     # the console with non-actionable noise.
     logging.getLogger("yfinance").setLevel(logging.CRITICAL)
-except ImportError:
-    _YF_AVAILABLE = False
 
 # ── FMP shared client ────────────────────────────────────────────
 
@@ -25,6 +25,7 @@ from datetime import datetime
 from typing import Any
 from zoneinfo import ZoneInfo
 
+from lazy_imports import lazy_module, module_available
 from open_prep_boundary import FMPClientLike, make_fmp_client
 
 logger = logging.getLogger(__name__)
@@ -78,11 +79,9 @@ def market_session() -> str:
 
 # ── yfinance helpers (real-time, free, no API key) ────────────────
 
-try:
-    import yfinance as yf  # type: ignore[import-untyped]
-    _YF_AVAILABLE = True
-except ImportError:
-    _YF_AVAILABLE = False
+# Imported on the first screen, not when the terminal starts.
+_YF_AVAILABLE = module_available("yfinance")
+yf = lazy_module("yfinance")
 
 # Curated lists of liquid US tickers for gainers/losers/actives screening.
 # yfinance doesn't have a "top movers" endpoint, so we screen from a broad
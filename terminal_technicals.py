@@ -16,33 +16,32 @@ from dataclasses import replace as dc_replace
 from typing import Any
 
 from databento_utils import _redact_sensitive_error_text
+from lazy_imports import lazy_module, module_available
 
 log = logging.getLogger(__name__)
 
-try:
-    from tradingview_ta import Interval, TA_Handler  # type: ignore[import-untyped]
-
-    _TV_AVAILABLE = True
-except ImportError:
-    TA_Handler = None
-    Interval = None
-    _TV_AVAILABLE = False
+# ``tradingview_ta`` (and the ``requests`` stack under it) is imported on
+# the first fetch, not when the terminal starts.
+tradingview_ta = lazy_module("tradingview_ta")
+_TV_AVAILABLE = module_available("tradingview_ta")
 
 # ── Interval labels (German matching TradingView UI) ─────────────────
+# Values are the ``tradingview_ta.Interval`` codes, spelled out so the map
+# does not import the library.
 INTERVAL_MAP: dict[str, str] = {}
 if _TV_AVAILABLE:
     INTERVAL_MAP = {
-        "1m": Interval.INTERVAL_1_MINUTE,
-        "5m": Interval.INTERVAL_5_MINUTES,
-        "10m": getattr(Interval, "INTERVAL_10_MINUTES", "10m"),
-        "15m": Interval.INTERVAL_15_MINUTES,
-        "30m": Interval.INTERVAL_30_MINUTES,
-        "1h": Interval.INTERVAL_1_HOUR,
-        "2h": Interval.INTERVAL_2_HOURS,
-        "4h": Interval.INTERVAL_4_HOURS,
-        "1D": Interval.INTERVAL_1_DAY,
-        "1W": Interval.INTERVAL_1_WEEK,
-        "1M": Interval.INTERVAL_1_MONTH,
+        "1m": "1m",
+        "5m": "5m",
+        "10m": "10m",
+        "15m": "15m",
+        "30m": "30m",
+        "1h": "1h",
+        "2h": "2h",
+        "4h": "4h",
+        "1D": "1d",
+        "1W": "1W",
+        "1M": "1M",
     }
 
 # Default interval for the quick summary badge
@@ -363,7 +362,7 @@ def _try_exchanges(symbol: str, interval_val: str) -> Any | None:
     for exchange in exchanges:
         try:
             _tv_throttle()  # enforces spacing + raises on cooldown
-            h = TA_Handler(
+            h = tradingview_ta.TA_Handler(
                 symbol=symbol,
                 screener="america",
                 exchange=exchange,
@@ -320,3 +320,49 @@ def test_merge_shard_payloads_single_shard_passthrough(mod, tmp_path):
     assert summary["daily_bars"] == 4
     merged = pd.read_parquet(out_dir / f"{mod.MERGED_BASENAME}__daily_bars.parquet")
     assert len(merged) == 4
+
+
+@pytest.mark.parametrize("batch_rows", [1, 3, 65_536])
+def test_streaming_merge_matches_concat_dedupe_reference(mod, tmp_path, monkeypatch, batch_rows):
+    """k-way merge over record batches == ``_dedupe_frame`` over the concat.
+
+    Shards overlap on keys (so keep-last must pick the later shard's row),
+    arrive unsorted (so runs get sorted + spilled), carry null symbols and
+    disagree on the column set; tiny batches force many merge rounds.
+    """
+    np = pytest.importorskip("numpy")
+    monkeypatch.setattr(mod, "MERGE_BATCH_ROWS", batch_rows)
+    rng = np.random.default_rng(0)
+    manifests, frames = [], []
+    for shard_id in range(1, 5):
+        rows = 25
+        frame = pd.DataFrame(
+            {
+                "symbol": rng.choice(["AAPL", "MSFT", "NVDA", None], rows),
+                "trade_date": rng.choice([f"2026-04-2{day}" for day in range(5)], rows),
+                "close": rng.normal(size=rows),
+                "source_row": np.arange(rows) + 100 * shard_id,
+            }
+        )
+        if shard_id == 2:
+            frame = frame.drop(columns="close")
+        if shard_id == 3:
+            frame = frame.sort_values(["symbol", "trade_date"], kind="mergesort")
+        export_dir = tmp_path / f"shard-{shard_id}"
+        export_dir.mkdir()
+        basename = f"databento_volatility_production_s{shard_id}"
+        (export_dir / f"{basename}_manifest.json").write_text("{}", encoding="utf-8")
+        frame.to_parquet(export_dir / f"{basename}__daily_bars.parquet", index=shard_id == 4)
+        manifests.append(export_dir / f"{basename}_manifest.json")
+        frames.append(frame.reset_index(drop=True))
+
+    summary = mod.merge_shard_payloads(manifests, tmp_path / "merged")
+
+    merged = pd.read_parquet(tmp_path / "merged" / f"{mod.MERGED_BASENAME}__daily_bars.parquet")
+    expected = mod._dedupe_frame("daily_bars", pd.concat(frames, ignore_index=True))
+    assert summary == {"daily_bars": len(expected)}
+    assert list(merged.columns) == ["symbol", "trade_date", "close", "source_row"]
+    # Pandas types an all-null shard column differently; compare values only.
+    merged, expected = (df.astype(object).where(df.notna(), None) for df in (merged, expected))
+    pd.testing.assert_frame_equal(merged, expected, check_dtype=False)
+    assert not list((tmp_path / "merged").glob(".merge_runs_*"))
@@ -80,8 +80,8 @@ def _atexit_register_sites() -> set[tuple[str, int]]:
 # the sharded producer. Handler is parameter-less, idempotent (dump_cache_probe_log
 # disables the singleton after writing) and bounded (one parquet write).
 ATEXIT_REGISTER_ALLOWED: set[tuple[str, int]] = {
-    ("terminal_bitcoin.py", 103),
-    ("scripts/databento_production_export.py", 4716),  # PR #2787: FMP bridge (+260 lines); rebaselined PR #2810 (+7 lines)
+    ("terminal_bitcoin.py", 98),
+    ("scripts/databento_production_export.py", 4828),  # PR #2787: FMP bridge (+260 lines); rebaselined PR #2810 (+7 lines); +19 content-cache wiring; +16 intraday decode ceiling; +13 incremental features; +48 workbook sheet dataset / xlsx mode; +7 second-detail store; +9 cost-stats planner
     # 2026-06-19 (fix/live-overlay-daemon-security, C2): feed.start() registers a
     # bounded, idempotent shutdown hook (feed.stop()) so the daemon=True feed
     # threads get a chance to close the Databento loop/sockets on a non-lifespan
@@ -95,7 +95,9 @@ ATEXIT_REGISTER_ALLOWED: set[tuple[str, int]] = {
     # provider-news/ingest rework shifted the same single-hook register.
     # 2026-06-25 (fix/overlay-dashboard-metrics): dashboard/metrics updates
     # shifted feed.start() atexit.register one line up (still unregister-then-register).
-    ("services/live_overlay_daemon/feed.py", 514),
+    # Batched ingest (record kind table, _consume_records) shifted it to 576.
+    # The payload cache refresh hook after each compute cycle shifted it to 587.
+    ("services/live_overlay_daemon/feed.py", 587),
 }
 
 
@@ -87,6 +87,7 @@ _ALLOWED_RAW_WRITE_FILES: dict[str, str] = {
     "scripts/run_ibkr_open_execution.py": "execution log CSV (one-shot, not pipeline-consumed)",
     "scripts/analyze_smc_contextual_calibration_history.py": "analysis CSV (one-shot)",
     "scripts/start_open_prep_suite.py": "process bootstrap log files",
+    "scripts/databento_run_shards.py": "per-attempt shard subprocess log files (stream target, not pipeline-consumed)",
     "scripts/export_open_prep_lists.py": "fdopen + os.replace atomic pattern (CSV exports)",
     "scripts/run_smc_measurement_benchmark.py": "benchmark CSV (one-shot, not pipeline-consumed)",
     "scripts/plan_2_8_history_archive.py": "JSONL history append (mode='a', not pipeline-consumed)",
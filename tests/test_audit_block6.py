@@ -182,7 +182,7 @@ class TestExchangeCache:
 
         with patch.object(tt, "_tv_throttle", lambda: None), \
              patch.object(tt, "_tv_register_success", lambda: None), \
-             patch("terminal_technicals.TA_Handler", side_effect=fake_handler):
+             patch("terminal_technicals.tradingview_ta.TA_Handler", side_effect=fake_handler):
             # First call: probes NASDAQ (fails), NYSE (succeeds)
             result = tt._try_exchanges("TESTX", "1h")
             assert result is not None
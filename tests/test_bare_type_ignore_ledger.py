@@ -53,24 +53,24 @@ _FROZEN_BARE_TYPE_IGNORE_SITES: frozenset[tuple[str, int]] = frozenset(
         ("rl/simulator/execution_env.py", 26),
         ("rl/simulator/execution_env.py", 31),
         ("rl/simulator/execution_env.py", 32),
-        ("rl/simulator/sb3_execution_env.py", 17),
-        ("rl/simulator/sb3_execution_env.py", 18),
-        ("rl/simulator/sb3_execution_env.py", 22),
-        ("rl/simulator/sb3_execution_env.py", 23),
-        ("terminal_bitcoin.py", 312),
-        ("terminal_bitcoin.py", 396),
+        ("rl/simulator/sb3_execution_env.py", 20),
+        ("rl/simulator/sb3_execution_env.py", 21),
+        ("rl/simulator/sb3_execution_env.py", 25),
+        ("rl/simulator/sb3_execution_env.py", 26),
+        ("terminal_bitcoin.py", 307),
+        ("terminal_bitcoin.py", 391),
+        ("terminal_bitcoin.py", 471),
         ("terminal_bitcoin.py", 476),
-        ("terminal_bitcoin.py", 481),
-        ("terminal_bitcoin.py", 536),
-        ("terminal_bitcoin.py", 550),
-        ("terminal_bitcoin.py", 554),
-        ("terminal_bitcoin.py", 563),
-        ("terminal_bitcoin.py", 641),
-        ("terminal_bitcoin.py", 696),
-        ("terminal_bitcoin.py", 738),
-        ("terminal_bitcoin.py", 763),
-        ("terminal_bitcoin.py", 789),
-        ("terminal_bitcoin.py", 842),
+        ("terminal_bitcoin.py", 531),
+        ("terminal_bitcoin.py", 545),
+        ("terminal_bitcoin.py", 549),
+        ("terminal_bitcoin.py", 558),
+        ("terminal_bitcoin.py", 637),
+        ("terminal_bitcoin.py", 692),
+        ("terminal_bitcoin.py", 734),
+        ("terminal_bitcoin.py", 759),
+        ("terminal_bitcoin.py", 785),
+        ("terminal_bitcoin.py", 838),
     }
 )
 
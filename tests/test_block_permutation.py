@@ -247,3 +247,29 @@ def test_observed_uses_same_group_sizes_as_null() -> None:
     assert abs(n_t_seen - 47) <= 2
     assert 0.0 <= p <= 1.0
     assert null.shape == (20,)
+
+
+def test_batched_block_indices_match_per_draw_loop() -> None:
+    from smc_core.inference.permutation import _block_indices, _block_indices_batch
+
+    for n, block_size in ((60, 1), (60, 5), (62, 5)):
+        rng = np.random.default_rng(8)
+        loop = np.stack([_block_indices(n, block_size, rng) for _ in range(30)])
+        batch = _block_indices_batch(n, block_size, 30, np.random.default_rng(8))
+        np.testing.assert_array_equal(batch, loop)
+
+
+@pytest.mark.parametrize("block_size", [1, 5])
+def test_named_diff_statistic_matches_callable(block_size: int) -> None:
+    rng = np.random.default_rng(21)
+    t = rng.normal(0.2, 1.0, size=95)
+    c = rng.normal(0.0, 1.0, size=105)
+    p_named, obs_named, null_named = block_permutation_test(
+        treatment=t, control=c, statistic="mean_diff", block_size=block_size, B=150, seed=4
+    )
+    p_call, obs_call, null_call = block_permutation_test(
+        treatment=t, control=c, statistic=_mean_diff, block_size=block_size, B=150, seed=4
+    )
+    assert p_named == p_call
+    assert obs_named == pytest.approx(obs_call)
+    np.testing.assert_allclose(null_named, null_call, atol=1e-12)
@@ -130,3 +130,110 @@ def test_validates_inputs() -> None:
         bootstrap_ci(np.array([1.0, 2.0]), statistic=lambda x: 0.0, B=0)
     with pytest.raises(ValueError, match="block_length"):
         bootstrap_ci(np.array([1.0, 2.0]), statistic=lambda x: 0.0, block_length=0)
+
+
+# ---------------------------------------------------------------------------
+# vectorised kernels
+# ---------------------------------------------------------------------------
+
+
+def _loop_stationary_resample(
+    arr: np.ndarray, B: int, mean_block_length: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Reference per-element Politis-Romano loop (the pre-vectorised kernel)."""
+    n = arr.size
+    p = 1.0 / mean_block_length
+    out = np.empty((B, n), dtype=arr.dtype)
+    for b in range(B):
+        starts = rng.integers(0, n, size=n)
+        breaks = rng.random(size=n) < p
+        cur = int(starts[0])
+        for k in range(n):
+            if k > 0 and breaks[k]:
+                cur = int(starts[k])
+            out[b, k] = arr[cur % n]
+            cur += 1
+    return out
+
+
+def test_stationary_kernel_block_structure_matches_geometric_law() -> None:
+    from smc_core.inference.bootstrap import _stationary_indices
+
+    n, rows, mean_block_length = 500, 400, 8
+    idx = _stationary_indices(n, rows, mean_block_length, np.random.default_rng(0))
+    assert idx.shape == (rows, n)
+    assert idx.min() >= 0 and idx.max() < n
+    # Within a block indices advance by exactly one (mod n); a new block
+    # starts wherever that breaks, so the break rate estimates 1 / L.
+    continues = (idx[:, 1:] - idx[:, :-1]) % n == 1
+    break_rate = 1.0 - continues.mean()
+    assert break_rate == pytest.approx(1.0 / mean_block_length, abs=0.01)
+    # Row starts are uniform over the sample.
+    assert idx[:, 0].mean() == pytest.approx((n - 1) / 2.0, rel=0.1)
+
+
+def test_stationary_kernel_matches_loop_distribution() -> None:
+    from smc_core.inference.bootstrap import _stationary_resample
+
+    rng = np.random.default_rng(7)
+    eps = rng.normal(size=200)
+    ar1 = np.empty_like(eps)
+    ar1[0] = eps[0]
+    for i in range(1, len(eps)):
+        ar1[i] = 0.6 * ar1[i - 1] + eps[i]
+    loop = _loop_stationary_resample(ar1, 2000, 10, np.random.default_rng(1)).mean(axis=1)
+    fast = _stationary_resample(ar1, 2000, 10, np.random.default_rng(1)).mean(axis=1)
+    # Same replicate distribution of the mean (MC error ~1.6% on the sd).
+    assert fast.mean() == pytest.approx(loop.mean(), abs=0.05 * loop.std())
+    assert fast.std() == pytest.approx(loop.std(), rel=0.08)
+    for q in (0.05, 0.5, 0.95):
+        assert np.quantile(fast, q) == pytest.approx(np.quantile(loop, q), abs=0.1 * loop.std())
+
+
+@pytest.mark.parametrize("block_length", [1, 6])
+@pytest.mark.parametrize(
+    ("name", "fn"),
+    [
+        ("mean", lambda x: float(x.mean())),
+        ("sharpe", lambda x: float(x.mean() / x.std(ddof=1))),
+        ("hit_rate", lambda x: float((x > 0).mean())),
+    ],
+)
+def test_named_statistic_matches_callable(name: str, fn, block_length: int) -> None:
+    sample = np.random.default_rng(3).normal(0.2, 1.0, size=150)
+    for method in ("percentile", "bca"):
+        named = bootstrap_ci(sample, statistic=name, method=method, B=300, seed=9, block_length=block_length)
+        called = bootstrap_ci(sample, statistic=fn, method=method, B=300, seed=9, block_length=block_length)
+        for key in ("point", "ci_low", "ci_high"):
+            assert named[key] == pytest.approx(called[key], rel=1e-9, abs=1e-12)
+
+
+def test_chunked_resampling_is_independent_of_chunk_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    import smc_core.inference.bootstrap as bootstrap
+
+    sample = np.random.default_rng(4).normal(size=64)
+    whole = bootstrap_ci(sample, statistic="mean", B=50, seed=2)
+    monkeypatch.setattr(bootstrap, "_CHUNK_ELEMENTS", 64 * 7)
+    chunked = bootstrap_ci(sample, statistic="mean", B=50, seed=2)
+    assert chunked == whole
+
+
+def test_chunked_iid_draws_match_one_shot_baseline(monkeypatch: pytest.MonkeyPatch) -> None:
+    import smc_core.inference.bootstrap as bootstrap
+
+    sample = np.random.default_rng(6).normal(size=257)
+    B = 40
+    # Baseline: one (B, n) index draw, statistic applied row by row.
+    idx = np.random.default_rng(8).integers(0, sample.size, size=(B, sample.size), dtype=np.int64)
+    baseline = np.array([float(row.mean()) for row in sample[idx]])
+    # 3 rows per chunk, so B * n spans many chunks.
+    monkeypatch.setattr(bootstrap, "_CHUNK_ELEMENTS", sample.size * 3)
+    chunked = bootstrap.resample_statistics(
+        sample, statistic=lambda x: float(x.mean()), B=B, rng=np.random.default_rng(8)
+    )
+    np.testing.assert_array_equal(chunked, baseline)
+
+
+def test_unknown_statistic_name_rejected() -> None:
+    with pytest.raises(ValueError, match="unknown statistic"):
+        bootstrap_ci(np.array([1.0, 2.0]), statistic="median")  # type: ignore[arg-type]
@@ -2,24 +2,20 @@
 from __future__ import annotations
 
 import copy
-from collections import deque
+import itertools
+import threading
 
+import numpy as np
 import pytest
 
+_NS_PER_MINUTE = 60_000_000_000
+
 
 @pytest.fixture(autouse=True)
 def _restore_cache_module_state() -> None:
     import services.live_overlay_daemon.cache as cache
 
-    with cache._bar_lock:
-        bars_snapshot = {
-            sym: (list(dq), dq.maxlen)
-            for sym, dq in cache._bars.items()
-        }
-        bar_last_update_snapshot = dict(cache._bar_last_update)
-        rolling_bars_cap_snapshot = cache._rolling_bars_cap
-        max_symbols_snapshot = cache._max_symbols
-        last_eviction_at_snapshot = cache._last_eviction_at
+    cache.reset_bar_cache()
 
     with cache._overlay_lock:
         overlay_snapshot = copy.deepcopy(cache._overlay)
@@ -30,19 +26,7 @@ def _restore_cache_module_state() -> None:
 
     yield
 
-    with cache._bar_lock:
-        cache._bars.clear()
-        cache._bars.update(
-            {
-                sym: deque(items, maxlen=maxlen)
-                for sym, (items, maxlen) in bars_snapshot.items()
-            }
-        )
-        cache._bar_last_update.clear()
-        cache._bar_last_update.update(bar_last_update_snapshot)
-        cache._rolling_bars_cap = rolling_bars_cap_snapshot
-        cache._max_symbols = max_symbols_snapshot
-        cache._last_eviction_at = last_eviction_at_snapshot
+    cache.reset_bar_cache()
 
     with cache._overlay_lock:
         cache._overlay.clear()
@@ -53,6 +37,20 @@ def _restore_cache_module_state() -> None:
         cache._vix_level = vix_level_snapshot
 
 
+def _cached_symbols() -> set[str]:
+    """Symbols across all stripes, checked against the eviction heap and count."""
+    import services.live_overlay_daemon.cache as cache
+
+    with cache._evict_lock:
+        symbols: set[str] = set()
+        for shard in cache._bar_shards:
+            with shard.lock:
+                symbols.update(shard.symbols)
+        assert {sym for _queued_at, sym in cache._bar_state.heap} == symbols
+        assert cache._bar_state.symbol_count == len(symbols) == cache.bar_symbol_count()
+    return symbols
+
+
 def test_get_overlay_returns_deep_copy() -> None:
     import services.live_overlay_daemon.cache as cache
 
@@ -85,11 +83,6 @@ def test_set_overlay_replaces_atomically() -> None:
 def test_eviction_keeps_bar_and_last_update_consistent() -> None:
     import services.live_overlay_daemon.cache as cache
 
-    with cache._bar_lock:
-        cache._bars.clear()
-        cache._bar_last_update.clear()
-        cache._last_eviction_at = 0.0
-
     cache.init_bar_cache(rolling_bars=10, max_symbols=3)
 
     for sym in ["AAPL", "MSFT", "TSLA"]:
@@ -97,27 +90,90 @@ def test_eviction_keeps_bar_and_last_update_consistent() -> None:
 
     cache.push_bar("NVDA", {"open": 1.0, "close": 1.0})
 
-    with cache._bar_lock:
-        assert "NVDA" in cache._bars
-        assert len(cache._bars) == 3
-        assert len({"AAPL", "MSFT", "TSLA"} - set(cache._bars.keys())) >= 1
-        assert set(cache._bars.keys()) == set(cache._bar_last_update.keys())
+    symbols = _cached_symbols()
+    assert "NVDA" in symbols
+    assert len(symbols) == 3
+    assert len({"AAPL", "MSFT", "TSLA"} - symbols) >= 1
 
 
 def test_init_bar_cache_downscale_cleans_last_update() -> None:
     import services.live_overlay_daemon.cache as cache
 
-    with cache._bar_lock:
-        cache._bars.clear()
-        cache._bar_last_update.clear()
-        cache._last_eviction_at = 0.0
-
     cache.init_bar_cache(rolling_bars=10, max_symbols=10)
     for sym in ["A", "B", "C", "D", "E"]:
         cache.push_bar(sym, {"open": 1.0, "close": 1.0})
 
     cache.init_bar_cache(rolling_bars=10, max_symbols=2)
 
-    with cache._bar_lock:
-        assert len(cache._bars) <= 2
-        assert set(cache._bars.keys()) == set(cache._bar_last_update.keys())
+    assert len(_cached_symbols()) <= 2
+
+
+def test_eviction_requeues_symbols_updated_since_they_were_queued(monkeypatch) -> None:
+    import services.live_overlay_daemon.cache as cache
+
+    clock = itertools.count(1.0)
+    monkeypatch.setattr(cache.time, "monotonic", lambda: next(clock))
+    cache.init_bar_cache(rolling_bars=10, max_symbols=3)
+    for sym in ["AAPL", "MSFT", "TSLA", "AAPL"]:
+        cache.push_bar(sym, {"open": 1.0, "close": 1.0})
+
+    # AAPL's heap entry still carries its first push; it is requeued, not evicted.
+    cache.push_bar("NVDA", {"open": 1.0, "close": 1.0})
+
+    assert _cached_symbols() == {"AAPL", "TSLA", "NVDA"}
+    assert len(cache.get_bars_snapshot("AAPL")) == 2
+
+
+def test_ring_keeps_the_newest_bars_as_normalized_read_only_copies() -> None:
+    import services.live_overlay_daemon.cache as cache
+
+    cache.init_bar_cache(rolling_bars=3)
+    versions = []
+    for minute in range(1, 6):
+        cache.push_bar("AAPL", {"open": minute, "close": "1.5", "volume": 10, "ts_event": minute * _NS_PER_MINUTE})
+        versions.append(cache.get_bar_arrays("AAPL").version)
+    cache.push_bar("AAPL", {"open": float("nan"), "high": True, "volume": -1.0, "ts_event": "bad"})
+
+    arrays = cache.get_bar_arrays("AAPL")
+    bars = cache.get_bars_snapshot("AAPL")
+
+    assert versions == sorted(set(versions)) and arrays.version > versions[-1]
+    assert arrays.values[:, 0].tolist()[:2] == [4.0, 5.0]
+    assert arrays.ts_event.tolist() == [4 * _NS_PER_MINUTE, 5 * _NS_PER_MINUTE, 0]
+    assert not arrays.values.flags.writeable and not arrays.ts_event.flags.writeable
+    assert bars[0] == {"open": 4.0, "high": None, "low": None, "close": 1.5, "volume": 10.0, "ts_event": 4 * _NS_PER_MINUTE}
+    assert bars[-1] == dict.fromkeys(("open", "high", "low", "close", "volume", "ts_event"))
+    bars[0]["close"] = -1.0
+    assert cache.get_bars_snapshot("AAPL")[0]["close"] == 1.5
+    assert cache.latest_bar_ts_event("AAPL") == 5 * _NS_PER_MINUTE
+    assert cache.get_bar_arrays("MSFT") is None and cache.total_bar_count() == 3
+
+
+def test_lock_free_readers_never_see_a_torn_window() -> None:
+    import services.live_overlay_daemon.cache as cache
+
+    cache.init_bar_cache(rolling_bars=50)
+    cache.push_bar("AAPL", {"open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1.0, "ts_event": 1})
+    done = threading.Event()
+    errors: list[str] = []
+
+    def _read() -> None:
+        while not done.is_set():
+            arrays = cache.get_bar_arrays("AAPL")
+            values, ts = arrays.values, arrays.ts_event
+            if arrays.version % 2 or not (values == values[:, :1]).all() or ts.tolist() != values[:, 0].tolist():
+                errors.append(f"torn window at version {arrays.version}")
+            elif np.diff(ts).tolist() != [1] * (len(ts) - 1):
+                errors.append(f"non-contiguous window {ts.tolist()}")
+
+    readers = [threading.Thread(target=_read) for _ in range(3)]
+    for reader in readers:
+        reader.start()
+    for i in range(2, 5_000):
+        cache.push_bar("AAPL", dict.fromkeys(("open", "high", "low", "close", "volume", "ts_event"), i))
+    done.set()
+    for reader in readers:
+        reader.join()
+
+    assert not errors, errors[:3]
+    assert cache.get_bar_arrays("AAPL").ts_event.tolist() == list(range(4_950, 5_000))
@@ -0,0 +1,288 @@
+"""Tests for the content-addressed Databento cache (``databento_content_cache``)."""
+
+from __future__ import annotations
+
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import databento_content_cache as dcc
+import databento_volatility_screener as screener
+from databento_content_cache import ContentAddressedCache, ContentKey, session_date
+
+
+def _key(symbols, start: date, end: date, *, schema: str = "ohlcv-1d") -> ContentKey:
+    return ContentKey.build(dataset="XNAS.ITCH", schema=schema, symbols=symbols, start=start, end=end)
+
+
+def _daily_frame(symbols, start: date, end: date, *, close: float = 10.0) -> pd.DataFrame:
+    rows = [
+        {"symbol": symbol, "ts": pd.Timestamp(day, tz=UTC), "close": close + offset}
+        for symbol in symbols
+        for offset, day in enumerate(pd.bdate_range(start, end))
+    ]
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    ticks = itertools.count(1_000_000)
+    monkeypatch.setattr(dcc.time, "time", lambda: float(next(ticks)))
+
+
+def test_content_key_is_canonical() -> None:
+    a = ContentKey.build(
+        dataset="XNAS.ITCH",
+        schema="ohlcv-1s",
+        symbols=["MSFT", " AAPL", "MSFT", ""],
+        start=pd.Timestamp("2026-05-04T13:30:00Z"),
+        end=datetime(2026, 5, 5, 3, 0, tzinfo=UTC),
+    )
+    b = _key(["AAPL", "MSFT"], date(2026, 5, 4), date(2026, 5, 4), schema="ohlcv-1s")
+    assert a == b
+    assert a.digest == b.digest
+    assert [chunk.symbols for chunk in _key(list("EDCBA"), date(2026, 5, 4), date(2026, 5, 4)).chunks(2)] == [
+        ("A", "B"),
+        ("C", "D"),
+        ("E",),
+    ]
+    with pytest.raises(ValueError, match="empty"):
+        _key(["A"], date(2026, 5, 5), date(2026, 5, 4))
+
+
+def test_session_date_uses_utc_for_daily_and_new_york_otherwise() -> None:
+    stamp = pd.Timestamp("2026-05-05T02:00:00Z")
+    assert session_date(stamp, schema="ohlcv-1d") == date(2026, 5, 5)
+    assert session_date(stamp, schema="ohlcv-1s") == date(2026, 5, 4)
+    assert session_date(date(2026, 5, 4)) == date(2026, 5, 4)
+
+
+def test_miss_put_then_full_hit(tmp_path: Path) -> None:
+    cache = ContentAddressedCache(tmp_path, max_bytes=10**8)
+    key = _key(["AAPL", "MSFT"], date(2026, 4, 1), date(2026, 4, 17))
+    miss = cache.lookup(key)
+    assert miss.frame is None
+    assert miss.missing_symbols == {"AAPL", "MSFT"}
+
+    cache.put(key, _daily_frame(["AAPL", "MSFT"], date(2026, 4, 1), date(2026, 4, 17)))
+    hit = cache.lookup(key)
+
+    assert hit.complete
+    assert len(hit.frame) == 2 * 13
+    assert cache.stats.as_dict()["hits"] == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.bytes_written > 0 and cache.stats.bytes_read > 0
+
+
+def test_superset_and_overlap_requests_are_sliced(tmp_path: Path) -> None:
+    cache = ContentAddressedCache(tmp_path, max_bytes=10**8, chunk_size=2)
+    cache.put(
+        _key(["A", "B", "C"], date(2026, 4, 1), date(2026, 4, 20)),
+        _daily_frame(["A", "B", "C"], date(2026, 4, 1), date(2026, 4, 20)),
+    )
+
+    subset = cache.lookup(_key(["C", "A"], date(2026, 4, 6), date(2026, 4, 10)))
+    assert subset.complete
+    assert set(subset.frame["symbol"]) == {"A", "C"}
+    assert subset.frame["ts"].min() == pd.Timestamp("2026-04-06", tz=UTC)
+    assert subset.frame["ts"].max() == pd.Timestamp("2026-04-10", tz=UTC)
+
+    overlap = cache.lookup(_key(["A", "D"], date(2026, 4, 15), date(2026, 4, 24)))
+    assert not overlap.complete
+    assert {(gap.start, gap.end, gap.symbols) for gap in overlap.gaps} == {
+        (date(2026, 4, 15), date(2026, 4, 24), frozenset({"D"})),
+        (date(2026, 4, 21), date(2026, 4, 24), frozenset({"A"})),
+    }
+    assert set(overlap.frame["symbol"]) == {"A"}
+    assert len(overlap.frame) == 4
+    assert cache.stats.partial_hits == 1
+
+
+def test_overlapping_entries_prefer_newest_rows(tmp_path: Path, fake_clock) -> None:
+    cache = ContentAddressedCache(tmp_path, max_bytes=10**8)
+    cache.put(_key(["A"], date(2026, 4, 1), date(2026, 4, 10)), _daily_frame(["A"], date(2026, 4, 1), date(2026, 4, 10)))
+    cache.put(
+        _key(["A"], date(2026, 4, 8), date(2026, 4, 17)),
+        _daily_frame(["A"], date(2026, 4, 8), date(2026, 4, 17), close=100.0),
+    )
+
+    result = cache.lookup(_key(["A"], date(2026, 4, 1), date(2026, 4, 17)))
+
+    assert result.complete
+    assert result.frame["ts"].is_unique
+    assert len(result.frame) == 13
+    assert result.frame.loc[result.frame["ts"] == pd.Timestamp("2026-04-08", tz=UTC), "close"].item() == 100.0
+
+
+def test_lru_eviction_keeps_recently_read_entries(tmp_path: Path, fake_clock) -> None:
+    frame = _daily_frame(["A"], date(2026, 4, 1), date(2026, 4, 30))
+    probe = ContentAddressedCache(tmp_path / "probe", max_bytes=10**8)
+    entry_bytes = probe.put(_key(["A"], date(2026, 4, 1), date(2026, 4, 30)), frame)[0].stat().st_size
+    cache = ContentAddressedCache(tmp_path / "lru", max_bytes=int(entry_bytes * 2.5))
+    keys = {name: _key([name], date(2026, 4, 1), date(2026, 4, 30)) for name in "ABC"}
+    cache.put(keys["A"], frame.assign(symbol="A"))
+    cache.put(keys["B"], frame.assign(symbol="B"))
+    assert cache.lookup(keys["A"]).complete  # A is now more recent than B
+
+    cache.put(keys["C"], frame.assign(symbol="C"))
+
+    assert len(cache) == 2
+    assert cache.total_bytes <= cache.max_bytes
+    assert cache.stats.evictions == 1
+    assert cache.lookup(keys["A"]).complete
+    assert cache.lookup(keys["C"]).complete
+    assert cache.lookup(keys["B"]).frame is None
+    assert sum(1 for _ in (tmp_path / "lru").rglob("*.parquet")) == 2
+
+
+def test_index_persists_and_drops_vanished_entries(tmp_path: Path) -> None:
+    key = _key(["A", "B"], date(2026, 4, 1), date(2026, 4, 10))
+    with ContentAddressedCache(tmp_path, max_bytes=10**8, chunk_size=1) as cache:
+        written = cache.put(key, _daily_frame(["A", "B"], date(2026, 4, 1), date(2026, 4, 10)))
+
+    written[0].unlink()
+    with ContentAddressedCache(tmp_path, max_bytes=10**8, chunk_size=1) as reopened:
+        result = reopened.lookup(key)
+        assert len(reopened) == 1
+
+    assert [gap.symbols for gap in result.gaps] == [frozenset({"A"})]
+    assert set(result.frame["symbol"]) == {"B"}
+
+
+def test_max_age_ignores_stale_entries(tmp_path: Path, monkeypatch) -> None:
+    cache = ContentAddressedCache(tmp_path, max_bytes=10**8)
+    key = _key(["A"], date(2026, 4, 1), date(2026, 4, 10))
+    monkeypatch.setattr(dcc.time, "time", lambda: 1_000.0)
+    cache.put(key, _daily_frame(["A"], date(2026, 4, 1), date(2026, 4, 10)))
+    monkeypatch.setattr(dcc.time, "time", lambda: 5_000.0)
+
+    assert cache.lookup(key, max_age_seconds=10_000).complete
+    assert cache.lookup(key, max_age_seconds=3_600).frame is None
+
+
+def test_put_requires_time_column(tmp_path: Path) -> None:
+    cache = ContentAddressedCache(tmp_path, max_bytes=10**8)
+    with pytest.raises(ValueError, match="'ts'"):
+        cache.put(_key(["A"], date(2026, 4, 1), date(2026, 4, 1)), pd.DataFrame({"symbol": ["A"]}))
+
+
+def test_load_daily_bars_fetches_only_uncovered_days(tmp_path: Path, monkeypatch) -> None:
+    requests: list[tuple[tuple[str, ...], str, str]] = []
+
+    def _fake_get_range(client, *, context, dataset, symbols, schema, start, end):
+        requests.append((tuple(symbols), start, end))
+        return (tuple(symbols), date.fromisoformat(start), date.fromisoformat(end) - timedelta(days=1))
+
+    def _fake_store_to_frame(store, *, context):
+        symbols, start, end = store
+        return _daily_frame(symbols, start, end).assign(open=1.0, high=1.0, low=1.0, volume=100.0)
+
+    monkeypatch.setattr(screener, "_make_databento_client", lambda key: object())
+    monkeypatch.setattr(screener, "_get_schema_available_end", lambda client, dataset, schema: None)
+    monkeypatch.setattr(screener, "_databento_get_range_with_retry", _fake_get_range)
+    monkeypatch.setattr(screener, "_store_to_frame", _fake_store_to_frame)
+    cache = ContentAddressedCache(tmp_path / "content", max_bytes=10**8)
+
+    def _load(trading_days: list[date], universe: set[str]) -> pd.DataFrame:
+        return screener.load_daily_bars(
+            "FAKE-KEY",
+            dataset="XNAS.ITCH",
+            trading_days=trading_days,
+            universe_symbols=universe,
+            cache_dir=tmp_path,
+            use_file_cache=True,
+            content_cache=cache,
+        )
+
+    first = _load([date(2026, 5, 4), date(2026, 5, 5)], {"AAPL", "MSFT"})
+    assert requests == [(("AAPL", "MSFT"), "2026-04-20", "2026-05-06")]
+
+    requests.clear()
+    second = _load([date(2026, 5, 5), date(2026, 5, 6)], {"AAPL", "MSFT"})
+    assert requests == [(("AAPL", "MSFT"), "2026-05-06", "2026-05-07")]
+
+    requests.clear()
+    third = _load([date(2026, 5, 4), date(2026, 5, 6)], {"MSFT"})
+    assert requests == []
+
+    assert set(first["trade_date"]) == {date(2026, 5, 4), date(2026, 5, 5)}
+    assert set(second["trade_date"]) == {date(2026, 5, 5), date(2026, 5, 6)}
+    assert second["previous_close"].notna().all()
+    assert set(third["symbol"]) == {"MSFT"}
+    assert cache.stats.hits == 1 and cache.stats.partial_hits == 1 and cache.stats.misses == 1
+
+
+def test_empty_put_is_a_negative_entry(tmp_path: Path) -> None:
+    cache = ContentAddressedCache(tmp_path, max_bytes=10**8)
+    start, end = date(2026, 4, 1), date(2026, 4, 3)
+    cache.put(_key(["A", "B"], start, end), _daily_frame(["A"], start, end))
+    cache.put(_key(["C"], start, end), pd.DataFrame())
+
+    both = cache.lookup(_key(["A", "B", "C"], start, end))
+    assert both.complete
+    assert set(both.frame["symbol"]) == {"A"}
+
+    nothing = cache.lookup(_key(["B", "C"], start, end))
+    assert nothing.complete
+    assert nothing.frame.empty and {"symbol", "ts"} <= set(nothing.frame.columns)
+
+
+def test_stats_count_every_concurrent_lookup(tmp_path: Path) -> None:
+    cache = ContentAddressedCache(tmp_path, max_bytes=10**8)
+    start, end = date(2026, 4, 1), date(2026, 4, 3)
+    cache.put(_key(["A"], start, end), _daily_frame(["A"], start, end))
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: cache.lookup(_key(["A"], start, end)), range(200)))
+    assert cache.stats.hits == 200
+    assert cache.stats.bytes_read == 200 * cache.total_bytes
+
+
+def test_load_daily_bars_caches_empty_answers_but_not_failures(tmp_path: Path, monkeypatch) -> None:
+    requests: list[tuple[str, ...]] = []
+    failing = {"FAIL"}
+
+    def _fake_get_range(client, *, context, dataset, symbols, schema, start, end):
+        requests.append(tuple(symbols))
+        if failing & set(symbols):
+            raise RuntimeError("upstream 503")
+        return (tuple(s for s in symbols if s != "EMPTY"), date.fromisoformat(start), date.fromisoformat(end) - timedelta(days=1))
+
+    def _fake_store_to_frame(store, *, context):
+        symbols, start, end = store
+        return _daily_frame(symbols, start, end).assign(open=1.0, high=1.0, low=1.0, volume=100.0)
+
+    monkeypatch.setattr(screener, "_iter_symbol_batches", lambda symbols: [[symbol] for symbol in symbols])
+    monkeypatch.setattr(screener, "_make_databento_client", lambda key: object())
+    monkeypatch.setattr(screener, "_get_schema_available_end", lambda client, dataset, schema: None)
+    monkeypatch.setattr(screener, "_databento_get_range_with_retry", _fake_get_range)
+    monkeypatch.setattr(screener, "_store_to_frame", _fake_store_to_frame)
+    cache = ContentAddressedCache(tmp_path / "content", max_bytes=10**8)
+
+    def _load() -> pd.DataFrame:
+        return screener.load_daily_bars(
+            "FAKE-KEY",
+            dataset="XNAS.ITCH",
+            trading_days=[date(2026, 5, 4), date(2026, 5, 5)],
+            universe_symbols={"AAPL", "EMPTY", "FAIL"},
+            cache_dir=tmp_path,
+            use_file_cache=True,
+            content_cache=cache,
+        )
+
+    first = _load()
+    assert sorted(requests) == [("AAPL",), ("EMPTY",), ("FAIL",)]
+    assert set(first["symbol"]) == {"AAPL"}
+
+    requests.clear()
+    failing.clear()
+    second = _load()
+    assert requests == [("FAIL",)]
+    assert set(second["symbol"]) == {"AAPL", "FAIL"}
+
+    requests.clear()
+    _load()
+    assert requests == []
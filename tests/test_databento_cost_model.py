@@ -0,0 +1,218 @@
+"""Tests for the offline Databento cost planner (``databento_cost_model``)."""
+
+from __future__ import annotations
+
+import time
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import databento_volatility_screener as screener
+from databento_cost_model import (
+    ALL_SYMBOLS,
+    CostRequest,
+    CostStatsCache,
+    coalesce_requests,
+    plan_costs,
+)
+
+DATASET = "DBEQ.BASIC"
+SYMBOL_BYTES_PER_SECOND = {"AAPL": 900.0, "MSFT": 600.0, "NVDA": 1_500.0, "TSLA": 1_200.0}
+USD_PER_BYTE = {"ohlcv-1s": 2e-9, "ohlcv-1d": 5e-10}
+
+
+class FakeMetadata:
+    """Prices ranges from fixed per-symbol byte rates with +-3 % day-to-day noise and a fixed latency."""
+
+    def __init__(self, latency_seconds: float = 0.005) -> None:
+        self.latency_seconds = latency_seconds
+        self.calls: list[tuple[str, dict]] = []
+
+    def _bytes(self, *, dataset, start, end, symbols, schema) -> int:
+        start_ts = pd.Timestamp(start)
+        seconds = (pd.Timestamp(end) - start_ts).total_seconds()
+        names = SYMBOL_BYTES_PER_SECOND if symbols == ALL_SYMBOLS else symbols
+        noise = np.random.default_rng(start_ts.value // 10**9).uniform(0.97, 1.03)
+        return int(sum(SYMBOL_BYTES_PER_SECOND[name] for name in names) * seconds * noise)
+
+    def get_billable_size(self, **kwargs) -> int:
+        self.calls.append(("get_billable_size", kwargs))
+        time.sleep(self.latency_seconds)
+        return self._bytes(**kwargs)
+
+    def get_cost(self, **kwargs) -> float:
+        self.calls.append(("get_cost", kwargs))
+        time.sleep(self.latency_seconds)
+        return self._bytes(**kwargs) * USD_PER_BYTE[kwargs["schema"]]
+
+    def get_record_count(self, **kwargs) -> int:
+        self.calls.append(("get_record_count", kwargs))
+        time.sleep(self.latency_seconds)
+        return self._bytes(**kwargs) // 56
+
+
+class FakeClient:
+    def __init__(self, latency_seconds: float = 0.005) -> None:
+        self.metadata = FakeMetadata(latency_seconds)
+
+
+def _open_window(day: date, *, symbols=()) -> CostRequest:
+    start = pd.Timestamp(f"{day.isoformat()} 08:00", tz="America/New_York")
+    return CostRequest.build(
+        "intraday",
+        dataset=DATASET,
+        schema="ohlcv-1s",
+        start=start,
+        end=start + pd.Timedelta(minutes=91),
+        symbols=symbols,
+    )
+
+
+def _sessions(first: str, count: int) -> list[date]:
+    return [day.date() for day in pd.bdate_range(first, periods=count)]
+
+
+@pytest.fixture
+def stats_table(tmp_path):
+    """Statistics of 20 past sessions, as the live metadata API answered them."""
+    client = FakeClient(latency_seconds=0.0)
+    with CostStatsCache(tmp_path / "cost_stats.sqlite3") as stats:
+        for day in _sessions("2026-02-02", 20):
+            stats.refresh(client, _open_window(day))
+            for symbol in ("AAPL", "MSFT", "NVDA"):
+                stats.refresh(client, _open_window(day, symbols=[symbol]))
+        stats.refresh(
+            client,
+            CostRequest.build(
+                "daily", dataset=DATASET, schema="ohlcv-1d", start=date(2026, 1, 19), end=date(2026, 3, 2)
+            ),
+        )
+        yield stats
+
+
+def test_offline_plan_is_fast_and_close_to_the_live_answers(stats_table) -> None:
+    requests = [_open_window(day) for day in _sessions("2026-03-02", 20)]
+    requests.append(
+        CostRequest.build("daily", dataset=DATASET, schema="ohlcv-1d", start=date(2026, 2, 16), end=date(2026, 3, 28))
+    )
+    client = FakeClient()
+
+    plan = plan_costs(requests, stats_table, refresh="never")
+
+    live_started = time.perf_counter()
+    live = [
+        (
+            client.metadata.get_cost(**request.metadata_kwargs()),
+            client.metadata.get_billable_size(**request.metadata_kwargs()),
+        )
+        for request in requests
+    ]
+    live_seconds = time.perf_counter() - live_started
+
+    assert plan.complete and plan.live_calls == 0 and len(plan.estimates) == len(requests)
+    assert plan.elapsed_seconds < live_seconds / 10
+    by_request = {estimate.request: estimate for estimate in plan.estimates}
+    for request, (cost, size) in zip(requests, live, strict=True):
+        estimate = by_request[request]
+        assert estimate.source == "stats"
+        assert estimate.billable_size_bytes == pytest.approx(size, rel=0.05)
+        assert estimate.cost_usd == pytest.approx(cost, rel=0.05)
+        assert estimate.record_count == pytest.approx(size / 56, rel=0.05)
+
+
+def test_symbol_scoped_estimates_use_observed_symbols_and_the_median_for_new_ones(stats_table) -> None:
+    request = _open_window(date(2026, 3, 2), symbols=["nvda", "AAPL", "TSLA"])
+
+    estimate = stats_table.estimate(request)
+
+    # TSLA was never observed and is charged the median of MSFT / AAPL / NVDA (AAPL's rate).
+    expected = (SYMBOL_BYTES_PER_SECOND["NVDA"] + 2 * SYMBOL_BYTES_PER_SECOND["AAPL"]) * request.seconds
+    assert request.symbols == ("AAPL", "NVDA", "TSLA")
+    assert estimate.fallback_symbols == 1
+    assert estimate.billable_size_bytes == pytest.approx(expected, rel=0.03)
+
+
+def test_multi_symbol_answers_are_attributed_by_rate(tmp_path) -> None:
+    with CostStatsCache(tmp_path / "stats.sqlite3") as stats:
+        stats.record(_open_window(date(2026, 3, 2), symbols=["AAPL"]), billable_size_bytes=1_000, cost_usd=1.0)
+        stats.record(_open_window(date(2026, 3, 2), symbols=["MSFT"]), billable_size_bytes=3_000, cost_usd=3.0)
+        stats.record(_open_window(date(2026, 3, 3), symbols=["AAPL", "MSFT"]), billable_size_bytes=8_000, cost_usd=8.0)
+
+        aapl = stats.estimate(_open_window(date(2026, 3, 4), symbols=["AAPL"]))
+        msft = stats.estimate(_open_window(date(2026, 3, 4), symbols=["MSFT"]))
+        rows = len(stats)
+
+    # The 8000 bytes split 1:3 like the single-symbol rates.
+    assert (aapl.billable_size_bytes, msft.billable_size_bytes) == (1_500, 4_500)
+    assert aapl.cost_usd == pytest.approx(1.5)
+    assert rows == 4
+
+
+def test_coalesce_merges_touching_ranges_of_the_same_scope_only() -> None:
+    day = date(2026, 3, 2)
+    daily = [
+        CostRequest.build("daily", dataset=DATASET, schema="ohlcv-1d", start=day, end=day + timedelta(days=2)),
+        CostRequest.build(
+            "daily", dataset=DATASET, schema="ohlcv-1d", start=day + timedelta(days=2), end=day + timedelta(days=5)
+        ),
+        CostRequest.build(
+            "daily", dataset=DATASET, schema="ohlcv-1d", start=day + timedelta(days=1), end=day + timedelta(days=3)
+        ),
+        CostRequest.build(
+            "daily", dataset=DATASET, schema="ohlcv-1d", start=day + timedelta(days=7), end=day + timedelta(days=8)
+        ),
+    ]
+
+    merged = coalesce_requests([*daily, _open_window(day), _open_window(day + timedelta(days=1))])
+
+    assert [(r.scope, r.start.date(), r.end.date()) for r in merged if r.scope == "daily"] == [
+        ("daily", day, day + timedelta(days=5)),
+        ("daily", day + timedelta(days=7), day + timedelta(days=8)),
+    ]
+    assert sum(r.scope == "intraday" for r in merged) == 2
+    with pytest.raises(ValueError, match="empty"):
+        CostRequest.build("daily", dataset=DATASET, schema="ohlcv-1d", start=day, end=day)
+
+
+def test_missing_statistics_are_refreshed_once_then_served_offline(tmp_path) -> None:
+    client = FakeClient(latency_seconds=0.0)
+    requests = [_open_window(day) for day in _sessions("2026-03-02", 5)]
+
+    with CostStatsCache(tmp_path / "stats.sqlite3") as stats:
+        offline = plan_costs(requests, stats, client=client, refresh="never")
+        cold = plan_costs(requests, stats, client=client, refresh="missing")
+        warm = plan_costs(requests, stats, client=client, refresh="missing")
+        forced = plan_costs(requests[:2], stats, client=client, refresh="always")
+
+    assert not offline.complete and offline.live_calls == 0
+    # The first live answer seeds the rates for the remaining sessions.
+    assert cold.complete and cold.live_calls == 1
+    assert [estimate.source for estimate in cold.estimates] == ["live"] + ["stats"] * 4
+    assert warm.live_calls == 0
+    assert forced.live_calls == 2 and {estimate.source for estimate in forced.estimates} == {"live"}
+
+
+def test_estimate_databento_costs_plans_offline_from_the_stats_table(monkeypatch, tmp_path) -> None:
+    client = FakeClient(latency_seconds=0.0)
+    monkeypatch.setattr(screener, "_make_databento_client", lambda api_key: client)
+    monkeypatch.setattr(screener, "_get_schema_available_end", lambda client, dataset, schema: None)
+    trading_days = _sessions("2026-03-02", 10)
+    stats_path = tmp_path / "cost_stats.sqlite3"
+
+    cold = screener.estimate_databento_costs(
+        "test-key", dataset=DATASET, trading_days=trading_days, cost_stats_path=stats_path
+    )
+    live_calls = len(client.metadata.calls)
+    monkeypatch.setattr(screener, "_make_databento_client", lambda api_key: pytest.fail("planned offline"))
+    warm = screener.estimate_databento_costs(
+        "test-key", dataset=DATASET, trading_days=trading_days, cost_stats_path=stats_path
+    )
+
+    # One live refresh (cost, size, record count) per schema instead of two calls per range.
+    assert live_calls == 2 * 3
+    assert warm["scope"].tolist() == ["daily_ohlcv_1d", "intraday_ohlcv_1s_total"]
+    pd.testing.assert_series_equal(warm["scope"], cold["scope"])
+    assert warm["billable_size_bytes"].tolist() == pytest.approx(cold["billable_size_bytes"].tolist(), rel=0.05)
+    assert warm["cost_usd"].notna().all()
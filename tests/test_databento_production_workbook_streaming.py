@@ -0,0 +1,224 @@
+"""Parquet sheet dataset + streaming xlsx writer for the production workbook."""
+
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+import scripts.databento_production_export as export_mod
+import scripts.databento_production_workbook as workbook_mod
+from scripts.databento_production_workbook import (
+    SUMMARY_HEAT_COLUMNS,
+    WorkbookWriteResult,
+    write_databento_production_workbook_from_frames,
+    write_streaming_workbook,
+)
+from smc_core.cached_workbook_reader import read_daily_bars, read_production_workbook_sheet, read_sheet_dataset_index
+from smc_integration.artifact_resolution import resolve_structure_artifact_inputs
+
+SHEETS = ("summary", "manifest", "daily_bars", "output_checks", "second_detail")
+
+
+def _frames(rows: int = 6) -> dict[str, object]:
+    summary = pd.DataFrame(
+        {
+            "trade_date": [date(2026, 3, 6)] * rows,
+            "symbol": [f"SYM{idx}" for idx in range(rows)],
+            **{column: np.linspace(-12.0, 12.0, rows) for column in SUMMARY_HEAT_COLUMNS},
+        }
+    )
+    daily_bars = pd.DataFrame(
+        {
+            "trade_date": [date(2026, 3, 5), date(2026, 3, 6)] * (rows // 2),
+            "symbol": ["AAPL", "MSFT"] * (rows // 2),
+            "close": [180.0, np.nan] * (rows // 2),
+            "volume": np.arange(rows, dtype="int64"),
+            "has_intraday": [True, False] * (rows // 2),
+            "timestamp": pd.date_range("2026-03-06 14:30", periods=rows, freq="min", tz="UTC"),
+        }
+    )
+    manifest = pd.DataFrame({"field": ["dataset", "lookback_days"], "value": ["DBEQ.BASIC", "30"]})
+    # Numbers and strings in one object column: Arrow cannot type it.
+    checks = pd.DataFrame({"check": ["dataset", "rows", "note"], "value": ["DBEQ.BASIC", 30, None]})
+    return {
+        "summary": summary,
+        "additional_sheets": {
+            "manifest": manifest,
+            "daily_bars": daily_bars,
+            "empty": pd.DataFrame(),
+            "output_checks": checks,
+        },
+        "second_detail": daily_bars[["symbol", "close"]],
+    }
+
+
+def _write(tmp_path: Path, mode: str, name: str, **kwargs) -> WorkbookWriteResult:
+    return write_databento_production_workbook_from_frames(
+        output_path=tmp_path / f"{name}.xlsx",
+        generated_at=1_700_000_000.0,
+        sheet_dataset_dir=tmp_path / f"{name}_sheets",
+        xlsx_mode=mode,
+        **{**_frames(), **kwargs},
+    )
+
+
+def test_streaming_xlsx_reads_back_like_in_memory_xlsx(tmp_path: Path) -> None:
+    in_memory = _write(tmp_path, "in_memory", "legacy")
+    streaming = _write(tmp_path, "streaming", "streamed")
+
+    legacy_sheets = pd.read_excel(in_memory.output_path, sheet_name=None)
+    streamed_sheets = pd.read_excel(streaming.output_path, sheet_name=None)
+    assert list(streamed_sheets) == list(legacy_sheets) == [*SHEETS]
+    for name, frame in legacy_sheets.items():
+        if name == "output_checks":
+            # The mixed column is stored (and so rendered) as text.
+            assert streamed_sheets[name]["value"].tolist()[:2] == ["DBEQ.BASIC", "30"]
+            continue
+        pd.testing.assert_frame_equal(streamed_sheets[name], frame, check_dtype=False)
+    assert streaming.row_counts == in_memory.row_counts
+
+    legacy_summary = load_workbook(in_memory.output_path)["summary"]
+    streamed_summary = load_workbook(streaming.output_path)["summary"]
+    assert streamed_summary.freeze_panes == legacy_summary.freeze_panes == "A2"
+    assert streamed_summary.auto_filter.ref == legacy_summary.auto_filter.ref
+    assert streamed_summary["A1"].font.bold and streamed_summary["A1"].fill.fgColor.rgb.endswith("1F4E78")
+    assert sorted(str(rng.sqref) for rng in streamed_summary.conditional_formatting) == sorted(
+        str(rng.sqref) for rng in legacy_summary.conditional_formatting
+    )
+
+
+def test_streaming_xlsx_splits_oversized_sheets_across_chunks(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(workbook_mod, "EXCEL_MAX_ROWS_PER_SHEET", 4)
+    in_memory = _write(tmp_path, "in_memory", "legacy")
+    result = _write(tmp_path, "off", "streamed")
+    streamed = write_streaming_workbook(result.sheet_dataset_dir, tmp_path / "streamed.xlsx", chunk_rows=2)
+
+    legacy_sheets = pd.read_excel(in_memory.output_path, sheet_name=None)
+    streamed_sheets = pd.read_excel(streamed, sheet_name=None)
+    assert list(streamed_sheets) == list(legacy_sheets)
+    assert "summary_002" in streamed_sheets and "daily_bars_002" in streamed_sheets
+    for name, frame in legacy_sheets.items():
+        if name == "output_checks":
+            continue
+        pd.testing.assert_frame_equal(streamed_sheets[name], frame, check_dtype=False)
+
+
+def test_streaming_xlsx_is_byte_stable_for_fixed_generated_at(tmp_path: Path) -> None:
+    left = _write(tmp_path, "streaming", "left")
+    right = _write(tmp_path, "streaming", "right")
+
+    assert left.output_path.read_bytes() == right.output_path.read_bytes()
+
+
+def test_sheet_dataset_is_the_primary_artifact(tmp_path: Path) -> None:
+    result = _write(tmp_path, "off", "primary")
+
+    assert not result.output_path.exists()
+    index = read_sheet_dataset_index(result.sheet_dataset_dir)
+    assert [entry["name"] for entry in index["sheets"]] == [*SHEETS]
+    assert index["generated_at"] == "2023-11-14T22:13:20+00:00"
+    assert {entry["name"]: entry["stringified_columns"] for entry in index["sheets"] if entry["stringified_columns"]} == {
+        "output_checks": ["value"]
+    }
+
+    daily_bars = read_production_workbook_sheet(result.sheet_dataset_dir, "daily_bars")
+    pd.testing.assert_frame_equal(daily_bars, _frames()["additional_sheets"]["daily_bars"])
+    check_values = read_production_workbook_sheet(result.sheet_dataset_dir, "output_checks")["value"]
+    assert check_values.iloc[:2].tolist() == ["DBEQ.BASIC", "30"] and pd.isna(check_values.iloc[2])
+    assert list(read_production_workbook_sheet(result.sheet_dataset_dir, "daily_bars", columns=["symbol"])) == [
+        "symbol"
+    ]
+    with pytest.raises(KeyError):
+        read_production_workbook_sheet(result.sheet_dataset_dir, "ranked")
+
+    # A later run with fewer sheets drops the files the index no longer names.
+    write_databento_production_workbook_from_frames(
+        summary=_frames()["summary"],
+        output_path=result.output_path,
+        sheet_dataset_dir=result.sheet_dataset_dir,
+        xlsx_mode="off",
+    )
+    assert sorted(path.name for path in result.sheet_dataset_dir.glob("*.parquet")) == ["01_summary.parquet"]
+
+
+def test_xlsx_mode_validation(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="xlsx_mode"):
+        write_databento_production_workbook_from_frames(
+            summary=pd.DataFrame(), output_path=tmp_path / "x.xlsx", xlsx_mode="csv"
+        )
+    with pytest.raises(ValueError, match="sheet_dataset_dir"):
+        write_databento_production_workbook_from_frames(
+            summary=pd.DataFrame(), output_path=tmp_path / "x.xlsx", xlsx_mode="streaming"
+        )
+
+
+@pytest.mark.parametrize(
+    "raw, expected", [("", "streaming"), ("in-memory", "in_memory"), ("OFF", "off"), ("bogus", "streaming")]
+)
+def test_export_resolves_xlsx_mode_from_env(monkeypatch, raw, expected) -> None:
+    monkeypatch.setenv(export_mod.PRODUCTION_WORKBOOK_XLSX_ENV_VAR, raw)
+    assert export_mod._resolve_production_workbook_xlsx_mode() == expected
+
+
+def test_export_writes_sheet_dataset_and_skips_xlsx_when_off(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv(export_mod.PRODUCTION_WORKBOOK_XLSX_ENV_VAR, "off")
+    empty = pd.DataFrame()
+    frame_kwargs = {
+        name: empty
+        for name in (
+            "minute_detail",
+            "second_detail",
+            "raw_universe",
+            "intraday",
+            "ranked",
+            "daily_symbol_features_full_universe",
+            "full_universe_second_detail_open",
+            "full_universe_second_detail_close",
+            "full_universe_close_trade_detail",
+            "full_universe_close_outcome_minute",
+            "close_imbalance_features_full_universe",
+            "close_imbalance_outcomes_full_universe",
+            "premarket_features_full_universe",
+            "premarket_window_features_full_universe",
+            "symbol_day_diagnostics",
+            "research_event_flags_full_universe",
+            "research_event_flag_coverage",
+            "research_event_flag_trade_date_distribution",
+            "research_event_flag_outcome_slices",
+            "research_news_flags_full_universe",
+            "research_news_flag_coverage",
+            "research_news_flag_trade_date_distribution",
+            "research_news_flag_outcome_slices",
+            "core_vs_benzinga_news_side_by_side",
+            "core_vs_benzinga_news_overlap_stats",
+            "quality_window_status",
+        )
+    }
+
+    path = export_mod._write_canonical_production_workbook(
+        export_dir=tmp_path,
+        summary=pd.DataFrame([{"symbol": "AAPL"}]),
+        manifest={"dataset": "DBEQ.BASIC"},
+        daily_bars=pd.DataFrame([{"trade_date": date(2026, 3, 26), "symbol": "AAPL", "close": 1.0}]),
+        batl_debug={"ok": True},
+        output_summary={"rows": 1},
+        **frame_kwargs,
+    )
+
+    assert path is None
+    assert not (tmp_path / "databento_volatility_production_workbook.xlsx").exists()
+    dataset_dir = export_mod.canonical_production_sheet_dataset_path(export_dir=tmp_path)
+    names = [entry["name"] for entry in read_sheet_dataset_index(dataset_dir)["sheets"]]
+    assert names == ["summary", "manifest", "daily_bars", "batl_debug", "output_checks"]
+    assert read_production_workbook_sheet(dataset_dir, "daily_bars")["close"].tolist() == [1.0]
+
+    # The daily_bars loaders read the sheet dataset in place of the missing xlsx.
+    workbook = tmp_path / "databento_volatility_production_workbook.xlsx"
+    assert read_daily_bars(workbook, symbols=["aapl"])["close"].tolist() == [1.0]
+    resolved = resolve_structure_artifact_inputs(explicit_workbook_path=str(workbook))
+    assert resolved["workbook_path"] == workbook and resolved["resolution_detail"]["workbook"] == "explicit"
@@ -0,0 +1,187 @@
+"""Local shard runner: bounded pool, retries, progress manifest and the merge step."""
+
+from __future__ import annotations
+
+import json
+import sys
+import textwrap
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import scripts.databento_run_shards as runner
+from scripts.databento_plan_shards import plan_shards
+from scripts.databento_production_merge_shards import MERGED_BASENAME
+
+PLAN = plan_shards(lookback_days=6, num_shards=3, end_date=date(2026, 3, 6))
+
+# Stands in for databento_production_export.py: writes a manifest plus a
+# daily_bars payload for its window. ``fail-once`` shards leave a partial
+# manifest behind and exit 3 on their first attempt; ``fail`` shards always do.
+_FIXTURE_SHARD = textwrap.dedent(
+    """
+    import json, sys, time
+    from datetime import date, timedelta
+    from pathlib import Path
+
+    import pandas as pd
+
+    export_dir, start, end, shard_id, mode, state_dir = sys.argv[1:]
+    export_dir, state_dir = Path(export_dir), Path(state_dir)
+    (state_dir / f"running-{shard_id}").touch()
+    time.sleep(0.3)
+    running = len(list(state_dir.glob("running-*")))
+    (state_dir / f"running-{shard_id}").unlink()
+    with open(state_dir / "concurrency.log", "a") as log:
+        log.write(f"{running}\\n")
+    basename = f"databento_volatility_production_shard{shard_id}"
+    marker = state_dir / f"failed-once-{shard_id}"
+    if mode == "fail" or (mode == "fail-once" and not marker.exists()):
+        marker.touch()
+        (export_dir / f"{basename}_partial_manifest.json").write_text("{}")
+        print("boom", flush=True)
+        sys.exit(3)
+    days = []
+    day = date.fromisoformat(start)
+    while day <= date.fromisoformat(end):
+        days.append(day.isoformat())
+        day += timedelta(days=1)
+    manifest = {"dataset": "DBEQ.BASIC", "trade_dates_covered": days}
+    (export_dir / f"{basename}_manifest.json").write_text(json.dumps(manifest))
+    pd.DataFrame(
+        [{"symbol": symbol, "trade_date": d, "close": float(i)} for i, d in enumerate(days) for symbol in ("MSFT", "AAPL")]
+    ).to_parquet(export_dir / f"{basename}__daily_bars.parquet", index=False)
+    print("ok", flush=True)
+    """
+)
+
+
+def _command(tmp_path: Path, modes: dict[int, str] | None = None):
+    script = tmp_path / "fixture_shard.py"
+    script.write_text(_FIXTURE_SHARD, encoding="utf-8")
+    state_dir = tmp_path / "state"
+    state_dir.mkdir(exist_ok=True)
+    modes = modes or {}
+
+    def command(shard, export_dir: Path) -> list[str]:
+        mode = modes.get(shard["shard_id"], "ok")
+        return [
+            sys.executable,
+            str(script),
+            str(export_dir),
+            shard["start_date"],
+            shard["end_date"],
+            str(shard["shard_id"]),
+            mode,
+            str(state_dir),
+        ]
+
+    return command, state_dir
+
+
+def _run(tmp_path: Path, command, **kwargs):
+    options = {"max_parallel": 2, "retries": 1, "retry_backoff_seconds": 0.0, **kwargs}
+    return runner.run_shards(PLAN, tmp_path / "work", command=command, **options)
+
+
+def test_runs_shards_with_bounded_parallelism_and_merges(tmp_path: Path) -> None:
+    command, state_dir = _command(tmp_path)
+
+    report = _run(tmp_path, command)
+
+    assert report["status"] == "succeeded"
+    assert [entry["status"] for entry in report["shards"]] == ["succeeded"] * 3
+    assert max(int(line) for line in (state_dir / "concurrency.log").read_text().split()) <= 2
+    assert report["wall_seconds"] >= report["shards_wall_seconds"] > 0
+    merge = report["merge"]
+    assert merge["frame_rows"] == {"daily_bars": 12} and merge["peak_rss_mib"] > 0
+    merged_manifest = json.loads(Path(merge["manifest_path"]).read_text(encoding="utf-8"))
+    assert merged_manifest["shard_count"] == 3 and len(merged_manifest["trade_dates_covered"]) == 6
+    bars = pd.read_parquet(tmp_path / "work" / "merged" / f"{MERGED_BASENAME}__daily_bars.parquet")
+    assert bars["symbol"].tolist() == ["AAPL"] * 6 + ["MSFT"] * 6
+    assert bars["trade_date"].tolist()[:6] == [(date(2026, 3, 1) + timedelta(days=i)).isoformat() for i in range(6)]
+    on_disk = json.loads((tmp_path / "work" / runner.PROGRESS_MANIFEST_NAME).read_text(encoding="utf-8"))
+    assert on_disk == report
+
+
+def test_retry_starts_from_a_clean_export_dir(tmp_path: Path) -> None:
+    command, _ = _command(tmp_path, {2: "fail-once"})
+
+    report = _run(tmp_path, command, max_parallel=3)
+
+    assert report["status"] == "succeeded"
+    second = report["shards"][1]
+    assert [attempt["returncode"] for attempt in second["attempts"]] == [3, 0]
+    assert Path(second["attempts"][0]["log_path"]).read_text(encoding="utf-8").strip() == "boom"
+    # The failed attempt's stray manifest would otherwise break the reduce step.
+    assert [path.name for path in Path(second["export_dir"]).glob("*_manifest.json")] == [
+        "databento_volatility_production_shard2_manifest.json"
+    ]
+
+
+def test_failed_shard_blocks_merge_unless_partial_allowed(tmp_path: Path) -> None:
+    command, _ = _command(tmp_path, {3: "fail"})
+
+    report = _run(tmp_path, command)
+
+    assert report["status"] == "failed" and report["failed_shard_ids"] == [3]
+    assert len(report["shards"][2]["attempts"]) == 2
+    assert report["merge"] is None
+
+    partial = _run(tmp_path, command, allow_partial=True)
+
+    assert partial["status"] == "partial"
+    assert [entry.get("resumed", False) for entry in partial["shards"]] == [True, True, False]
+    assert partial["merge"]["partial_run"] is True and partial["merge"]["frame_rows"] == {"daily_bars": 8}
+
+
+def test_unexpected_merge_error_is_recorded_as_merge_failed(tmp_path: Path) -> None:
+    command, _ = _command(tmp_path)
+    _run(tmp_path, command, merge=False)
+    manifest = next((tmp_path / "work").glob("shard-2-of-3/export/*_manifest.json"))
+    manifest.write_text(json.dumps({"dataset": "DBEQ.BASIC", "trade_dates_covered": 5}), encoding="utf-8")
+
+    report = _run(tmp_path, command)
+
+    assert report["status"] == "merge_failed"
+    assert report["merge"]["error"].startswith("TypeError:")
+    on_disk = json.loads((tmp_path / "work" / runner.PROGRESS_MANIFEST_NAME).read_text(encoding="utf-8"))
+    assert on_disk["status"] == "merge_failed"
+
+
+def test_rerun_skips_succeeded_shards_unless_restarted(tmp_path: Path) -> None:
+    command, state_dir = _command(tmp_path)
+    _run(tmp_path, command, merge=False)
+    log = state_dir / "concurrency.log"
+    log.unlink()
+
+    resumed = _run(tmp_path, command, merge=False)
+    assert not log.exists()
+    assert all(entry["resumed"] for entry in resumed["shards"])
+
+    _run(tmp_path, command, merge=False, restart=True)
+    assert len(log.read_text().split()) == 3
+
+
+def test_producer_command_mirrors_the_workflow_matrix_step(tmp_path: Path) -> None:
+    argv = runner.producer_command(PLAN[0], tmp_path / "export", extra_args=["--smc-base-only"])
+
+    assert argv[:3] == [sys.executable, "-u", str(runner.PRODUCER_SCRIPT)]
+    assert argv[3:] == [
+        "--start-date",
+        "2026-03-01",
+        "--end-date",
+        "2026-03-02",
+        "--shard-id",
+        "1",
+        "--shard-of",
+        "3",
+        "--export-dir",
+        str(tmp_path / "export"),
+        "--smc-base-only",
+    ]
+    assert runner.shard_dir_name(PLAN[2]) == "shard-3-of-3"
+    with pytest.raises(ValueError, match="max_parallel"):
+        runner.run_shards(PLAN, tmp_path, max_parallel=0)
@@ -43,6 +43,7 @@ from databento_volatility_screener import (
     _format_intraday_reference_time,
     _format_reclaim_status_series,
     _highlight_rank_change_label,
+    _IntradayStateReducer,
     _iter_symbol_batches,
     _load_ui_runtime_state,
     _normalize_symbol_day_scope,
@@ -3973,6 +3974,87 @@ def test_update_state_from_chunk_handles_empty_chunk() -> None:
     assert states == {}
 
 
+def _synthetic_intraday_chunks(window, *, seed: int, n_symbols: int = 30, n_rows: int = 4_000) -> list[pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    start_ns = pd.Timestamp(window.fetch_start_utc).value
+    seconds = (pd.Timestamp(window.fetch_end_utc).value - start_ns) // 10**9
+    keys = pd.DataFrame(
+        {
+            "symbol": rng.choice([f"s{i}" if i % 3 else f"S{i}" for i in range(n_symbols)], n_rows),
+            "offset": rng.integers(0, seconds, n_rows),
+        }
+    ).drop_duplicates(["symbol", "offset"])
+    n = len(keys)
+    price = rng.uniform(5.0, 50.0, n)
+    open_px = price * rng.uniform(0.99, 1.01, n)
+    close = price * rng.uniform(0.99, 1.01, n)
+    high = np.maximum(open_px, close) * 1.002
+    low = np.minimum(open_px, close) * 0.998
+    for column in (open_px, close, high, low):
+        column[rng.random(n) < 0.03] = np.nan
+    open_px[rng.random(n) < 0.01] = 0.0
+    close[rng.random(n) < 0.01] = 0.0
+    volume = rng.integers(0, 1_000, n).astype(float)
+    volume[rng.random(n) < 0.02] = np.nan
+    index = pd.DatetimeIndex(
+        pd.to_datetime(start_ns + keys["offset"].to_numpy() * 10**9, utc=True), name="ts_event"
+    )
+    frame = pd.DataFrame(
+        {"symbol": keys["symbol"].to_numpy(), "open": open_px, "high": high, "low": low, "close": close, "volume": volume},
+        index=index,
+    ).sort_index(kind="stable")
+    chunks = [frame.iloc[part] for part in np.array_split(np.arange(n), 4)]
+    return [chunk.iloc[rng.permutation(len(chunk))] for chunk in chunks]
+
+
+def _assert_states_equivalent(expected: dict[str, SymbolDayState], actual: dict[str, SymbolDayState]) -> None:
+    assert list(actual) == list(expected)
+    for symbol, state in expected.items():
+        for name in state.__dataclass_fields__:
+            want, got = getattr(state, name), getattr(actual[symbol], name)
+            if isinstance(want, float) and isinstance(got, float):
+                assert got == pytest.approx(want, rel=1e-12, abs=1e-15), (symbol, name)
+            else:
+                assert got == want, (symbol, name)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("universe", [None, {"S0", "S3", "S6", "S9", "S12"}])
+def test_intraday_state_reducer_matches_row_wise_reducer(seed: int, universe: set[str] | None) -> None:
+    window = build_window_definition(
+        date(2026, 3, 5),
+        display_timezone="Europe/Berlin",
+        window_start=time(15, 20),
+        window_end=time(16, 0),
+        premarket_anchor_et=time(8, 0),
+    )
+    expected: dict[str, SymbolDayState] = {}
+    reducer = _IntradayStateReducer(window, universe_symbols=universe)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        for chunk in _synthetic_intraday_chunks(window, seed=seed):
+            _update_state_from_chunk(chunk, window=window, universe_symbols=universe, states=expected)
+            reducer.update(chunk)
+
+    assert expected
+    _assert_states_equivalent(expected, reducer.states())
+
+
+def test_intraday_state_reducer_handles_empty_and_symbol_less_chunks() -> None:
+    window = build_window_definition(
+        date(2026, 3, 5),
+        display_timezone="Europe/Berlin",
+        window_start=time(15, 20),
+        window_end=time(16, 0),
+        premarket_anchor_et=time(8, 0),
+    )
+    reducer = _IntradayStateReducer(window)
+    reducer.update(pd.DataFrame())
+    reducer.update(pd.DataFrame({"close": [1.0]}, index=pd.DatetimeIndex([pd.Timestamp("2026-03-05T14:35:00Z")])))
+    assert len(reducer) == 0
+    assert reducer.states() == {}
+
+
 def test_load_daily_bars_transforms_and_filters_correctly(monkeypatch) -> None:
     """load_daily_bars applies symbol filtering, trade_date filtering, and previous_close shift."""
     raw_df = pd.DataFrame(
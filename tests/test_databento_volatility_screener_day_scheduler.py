@@ -0,0 +1,136 @@
+"""Intraday day scheduler: cost estimates, budget packing and the previous-close join."""
+
+from __future__ import annotations
+
+import os
+import time
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import databento_volatility_screener as screener
+from databento_volatility_screener import (
+    _admit_intraday_days,
+    _estimate_intraday_day_cost,
+    _IntradayDayJob,
+    _previous_close_frame,
+    run_intraday_screen,
+)
+
+DAYS = [date(2026, 3, 2), date(2026, 3, 3), date(2026, 3, 4), date(2026, 3, 5)]
+
+
+def _job(day_index: int, fetch_symbols: int, cached_bytes: int = 0) -> _IntradayDayJob:
+    return _IntradayDayJob(day_index, DAYS[(day_index - 1) % len(DAYS)], fetch_symbols, cached_bytes)
+
+
+def test_admit_runs_cached_days_beside_a_full_fetch_budget() -> None:
+    pending = [_job(1, 100), _job(2, 100), _job(3, 0, 9_000), _job(4, 0, 5_000), _job(5, 0, 1_000)]
+
+    admitted = _admit_intraday_days(pending, running=[], fetch_budget=150, cached_slots=2, max_threads=8)
+
+    assert [job.day_index for job in admitted] == [1, 3, 4]
+    assert [job.day_index for job in pending] == [2, 5]
+    running = [admitted[0], admitted[2]]
+    assert _admit_intraday_days(pending, running=running, fetch_budget=150, cached_slots=2, max_threads=8) == [
+        _job(5, 0, 1_000)
+    ]
+    assert _admit_intraday_days(pending, running=[], fetch_budget=150, cached_slots=2, max_threads=8) == [_job(2, 100)]
+
+
+def test_admit_packs_partial_fetches_and_runs_oversized_day_alone() -> None:
+    pending = [_job(1, 500), _job(2, 60), _job(3, 40), _job(4, 30)]
+
+    assert _admit_intraday_days(pending, running=[], fetch_budget=100, cached_slots=1, max_threads=8) == [_job(1, 500)]
+    assert _admit_intraday_days(pending, running=[], fetch_budget=100, cached_slots=1, max_threads=8) == [
+        _job(2, 60),
+        _job(3, 40),
+    ]
+    assert _admit_intraday_days(pending, running=[], fetch_budget=100, cached_slots=1, max_threads=0) == []
+    assert pending == [_job(4, 30)]
+
+
+def test_estimate_day_cost_from_cache_stats(tmp_path: Path) -> None:
+    cache_path = tmp_path / "intraday_summary.parquet"
+    assert _estimate_intraday_day_cost(cache_path, symbols=8_000, max_age_seconds=None) == (8_000, 0)
+
+    cache_path.write_bytes(b"x" * 4_096)
+    assert _estimate_intraday_day_cost(cache_path, symbols=8_000, max_age_seconds=None) == (0, 4_096)
+    assert _estimate_intraday_day_cost(cache_path, symbols=8_000, max_age_seconds=3_600) == (0, 4_096)
+
+    stale = time.time() - 7_200
+    os.utime(cache_path, (stale, stale))
+    assert _estimate_intraday_day_cost(cache_path, symbols=8_000, max_age_seconds=3_600) == (8_000, 4_096)
+
+    ranges = cache_path.with_suffix(".ranges")
+    ranges.mkdir()
+    (ranges / "abc.parquet").write_bytes(b"x" * 1_000)
+    assert _estimate_intraday_day_cost(cache_path, symbols=8_000, max_age_seconds=3_600) == (8_000, 5_096)
+
+
+def test_previous_close_frame_normalizes_keys_and_keeps_last() -> None:
+    frame = _previous_close_frame(
+        pd.DataFrame(
+            {
+                "trade_date": [pd.Timestamp("2026-03-03"), date(2026, 3, 3), date(2026, 3, 4)],
+                "symbol": ["aapl", "AAPL", "MSFT"],
+                "previous_close": [1.0, 2.0, float("inf")],
+            }
+        )
+    )
+
+    assert frame["trade_date"].tolist() == [date(2026, 3, 3), date(2026, 3, 4)]
+    assert frame["symbol"].tolist() == ["AAPL", "MSFT"]
+    assert frame["previous_close"].iloc[0] == 2.0
+    assert pd.isna(frame["previous_close"].iloc[1])
+
+
+def test_run_intraday_screen_joins_previous_close_per_day(monkeypatch, tmp_path: Path) -> None:
+    daily_bars = pd.DataFrame(
+        {
+            "trade_date": [DAYS[0], DAYS[0], DAYS[1]],
+            "symbol": ["AAPL", "MSFT", "AAPL"],
+            "previous_close": [150.0, 300.0, 151.0],
+        }
+    )
+
+    def fake_read_cached_frame(path: Path, *, max_age_seconds: int | None = None):
+        trade_day = date.fromisoformat(path.name.split("__", 1)[0])
+        return pd.DataFrame(
+            {
+                "trade_date": [pd.Timestamp(trade_day)] * 2,
+                "symbol": ["AAPL", "MSFT"],
+                "current_price": [100.0, 200.0],
+                "has_intraday": [True, True],
+            }
+        )
+
+    monkeypatch.setattr(screener, "_make_databento_client", lambda key: object())
+    monkeypatch.setattr(screener, "_get_schema_available_end", lambda client, dataset, schema: None)
+    monkeypatch.setattr(screener, "_read_cached_frame", fake_read_cached_frame)
+
+    result = run_intraday_screen(
+        "test-key",
+        dataset="DBEQ.BASIC",
+        trading_days=DAYS[:2],
+        universe_symbols={"AAPL", "MSFT"},
+        daily_bars=daily_bars,
+        cache_dir=tmp_path,
+        use_file_cache=True,
+    )
+
+    by_key = {
+        (pd.Timestamp(row.trade_date).date(), row.symbol): row.previous_close for row in result.itertuples()
+    }
+    assert by_key[(DAYS[0], "AAPL")] == 150.0
+    assert by_key[(DAYS[0], "MSFT")] == 300.0
+    assert by_key[(DAYS[1], "AAPL")] == 151.0
+    assert pd.isna(by_key[(DAYS[1], "MSFT")])
+
+
+@pytest.mark.parametrize("requested, cpus, expected", [(None, 1, 0), (None, 8, 4), (None, 3, 2), (2, 1, 2), (-1, 8, 0)])
+def test_reduce_processes_default_to_spare_cpus(monkeypatch, requested, cpus, expected) -> None:
+    monkeypatch.setattr(screener.os, "cpu_count", lambda: cpus)
+    assert screener._intraday_reduce_processes(requested, max_workers=4) == expected
@@ -0,0 +1,265 @@
+"""Incremental daily feature builder: Parquet state reuse must equal a full rebuild."""
+
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import databento_volatility_screener as screener
+from databento_volatility_screener import (
+    DAILY_FEATURE_TRAILING_SESSIONS,
+    _trailing_session_mean,
+    build_daily_features_full_universe,
+    build_daily_features_incremental,
+)
+
+SYMBOLS = ("AAPL", "MSFT", "NVDA")
+DAYS = [day.date() for day in pd.bdate_range("2026-02-02", periods=DAILY_FEATURE_TRAILING_SESSIONS + 4)]
+
+
+def _et(day: date, clock: str) -> pd.Timestamp:
+    return pd.Timestamp(f"{day.isoformat()} {clock}", tz="America/New_York").tz_convert("UTC")
+
+
+def _inputs(days: list[date], *, adjust: dict[str, float] | None = None) -> dict[str, pd.DataFrame]:
+    """Deterministic per-(day, symbol) inputs, so any day range slices the same rows."""
+    adjust = adjust or {}
+    daily, intraday, second, close, trades, outcome = [], [], [], [], [], []
+    for day in days:
+        for offset, symbol in enumerate(SYMBOLS):
+            rng = np.random.default_rng([day.toordinal(), offset])
+            base = 50.0 * (offset + 1) * float(rng.uniform(0.95, 1.05)) * adjust.get(symbol, 1.0)
+            volume = float(rng.integers(10_000, 90_000))
+            daily.append(
+                {
+                    "trade_date": day,
+                    "symbol": symbol,
+                    "open": base,
+                    "high": base * 1.02,
+                    "low": base * 0.98,
+                    "close": base * 1.01,
+                    "volume": volume,
+                    "previous_close": base * 0.99,
+                }
+            )
+            if rng.uniform() < 0.15:
+                # Gaps in the intraday/second inputs exercise the NaN paths of the trailing means.
+                continue
+            intraday.append(
+                {
+                    "trade_date": day,
+                    "symbol": symbol,
+                    "previous_close": base * 0.99,
+                    "market_open_price": base,
+                    "current_price": base * 1.005,
+                    "exact_1000_price": base * 1.004,
+                    "has_premarket_data": bool(rng.uniform() < 0.5),
+                }
+            )
+            for second_offset in (0, 3, 12, 45, 90):
+                price = base * float(rng.uniform(0.99, 1.01))
+                second.append(
+                    {
+                        "trade_date": day,
+                        "symbol": symbol,
+                        "timestamp": _et(day, "09:30:00") + pd.Timedelta(seconds=second_offset),
+                        "session": "regular",
+                        "open": price,
+                        "high": price * 1.002,
+                        "low": price * 0.998,
+                        "close": price * 1.001,
+                        "volume": float(rng.integers(1, 500)),
+                    }
+                )
+            for clock, session in (("15:50:00", "regular"), ("15:59:30", "regular"), ("16:00:00", "postmarket")):
+                price = base * float(rng.uniform(0.99, 1.01))
+                close.append(
+                    {
+                        "trade_date": day,
+                        "symbol": symbol,
+                        "timestamp": _et(day, clock),
+                        "session": session,
+                        "open": price,
+                        "high": price * 1.001,
+                        "low": price * 0.999,
+                        "close": price,
+                        "volume": float(rng.integers(1, 500)),
+                    }
+                )
+            stamp = _et(day, "15:59:20")
+            trades.append(
+                {
+                    "trade_date": day,
+                    "symbol": symbol,
+                    "timestamp": stamp,
+                    "ts_event": stamp,
+                    "ts_recv": stamp,
+                    "publisher_id": 12,
+                    "publisher": "Nasdaq",
+                    "venue_class": "lit_exchange",
+                    "side": "B",
+                    "price": base,
+                    "size": float(rng.integers(1, 300)),
+                    "flags": 0,
+                    "sequence": 1,
+                    "ts_in_delta": 0,
+                }
+            )
+            for clock in ("16:00:00", "19:59:00"):
+                outcome.append(
+                    {
+                        "trade_date": day,
+                        "symbol": symbol,
+                        "timestamp": _et(day, clock),
+                        "open": base,
+                        "high": base * 1.01,
+                        "low": base * 0.99,
+                        "close": base * float(rng.uniform(0.99, 1.01)),
+                        "volume": float(rng.integers(1, 900)),
+                    }
+                )
+    return {
+        "daily_bars": pd.DataFrame(daily),
+        "intraday": pd.DataFrame(intraday),
+        "second_detail_all": pd.DataFrame(second),
+        "close_detail_all": pd.DataFrame(close),
+        "close_trade_detail_all": pd.DataFrame(trades),
+        "close_outcome_minute_detail_all": pd.DataFrame(outcome),
+    }
+
+
+def _universe(symbols=SYMBOLS, *, market_cap: float = 1.0) -> pd.DataFrame:
+    return pd.DataFrame(
+        {"symbol": list(symbols), "company_name": [f"{s} Inc" for s in symbols], "market_cap": market_cap}
+    )
+
+
+def _assert_matches_full(
+    state_path: Path, days: list[date], *, universe=None, adjust=None, smc_base_only: bool = False, **kwargs
+) -> None:
+    universe = _universe() if universe is None else universe
+    options = {"display_timezone": "America/New_York", "smc_base_only": smc_base_only, **_inputs(days, adjust=adjust)}
+    features, coverage = build_daily_features_incremental(
+        state_path, trading_days=days, universe=universe, **options, **kwargs
+    )
+    full_features, full_coverage = build_daily_features_full_universe(trading_days=days, universe=universe, **options)
+    pd.testing.assert_frame_equal(features, full_features, check_exact=True)
+    pd.testing.assert_frame_equal(coverage, full_coverage, check_exact=True)
+
+
+@pytest.fixture
+def aggregated_days(monkeypatch) -> list[list[date]]:
+    """Records the sessions each open-window aggregation pass (0930 focus) covers."""
+    calls: list[list[date]] = []
+    real = screener._build_open_window_aggregates
+
+    def _spy(second_detail_all, *, trading_days, **kwargs):
+        if not kwargs.get("metric_prefix"):
+            calls.append(list(trading_days))
+        return real(second_detail_all, trading_days=trading_days, **kwargs)
+
+    monkeypatch.setattr(screener, "_build_open_window_aggregates", _spy)
+    return calls
+
+
+def test_trailing_session_mean_matches_shifted_rolling_mean() -> None:
+    frame = pd.DataFrame(
+        {
+            "symbol": ["A"] * 30 + ["B"] * 5,
+            "volume": [np.nan if i % 7 == 3 else float(i * 13 % 17) for i in range(35)],
+        }
+    )
+    expected = frame.groupby("symbol")["volume"].transform(lambda s: s.shift(1).rolling(20, min_periods=1).mean())
+
+    np.testing.assert_allclose(_trailing_session_mean(frame["volume"], frame["symbol"]), expected, rtol=1e-12)
+
+
+def test_one_session_update_matches_full_rebuild(tmp_path: Path, aggregated_days) -> None:
+    state_path = tmp_path / "daily_features_state.parquet"
+    _assert_matches_full(state_path, DAYS[:-1])
+    assert aggregated_days[-2:] == [DAYS[:-1], DAYS[:-1]]
+
+    _assert_matches_full(state_path, DAYS, universe=_universe(market_cap=2.0))
+
+    assert aggregated_days[-2:] == [[DAYS[-1]], DAYS]
+    assert len(pd.read_parquet(state_path)) == len(DAYS) * len(SYMBOLS)
+
+
+def test_rolled_lookback_window_matches_full_rebuild(tmp_path: Path, aggregated_days) -> None:
+    state_path = tmp_path / "daily_features_state.parquet"
+    _assert_matches_full(state_path, DAYS[:-2])
+
+    _assert_matches_full(state_path, DAYS[2:])
+
+    assert aggregated_days[-2] == DAYS[-2:]
+
+
+def test_history_change_and_new_symbol_rebuild_only_those_symbols(tmp_path: Path, monkeypatch) -> None:
+    state_path = tmp_path / "daily_features_state.parquet"
+    _assert_matches_full(state_path, DAYS[:-1], universe=_universe(SYMBOLS[:2]))
+    rebuilt: list[tuple[list[date], list[str]]] = []
+    real = screener.build_daily_features_full_universe
+
+    def _spy(*, trading_days, universe, **kwargs):
+        rebuilt.append((list(trading_days), sorted(universe["symbol"])))
+        return real(trading_days=trading_days, universe=universe, **kwargs)
+
+    monkeypatch.setattr(screener, "build_daily_features_full_universe", _spy)
+    # A 2:1 split rewrites MSFT's whole daily history; NVDA joins the universe.
+    _assert_matches_full(state_path, DAYS, adjust={"MSFT": 0.5})
+
+    assert rebuilt[:2] == [([DAYS[-1]], list(SYMBOLS)), (DAYS[:-1], ["MSFT", "NVDA"])]
+
+
+def test_invalidated_symbol_and_parameter_change(tmp_path: Path, monkeypatch) -> None:
+    state_path = tmp_path / "daily_features_state.parquet"
+    _assert_matches_full(state_path, DAYS)
+    rebuilt: list[list[str]] = []
+    real = screener.build_daily_features_full_universe
+
+    def _spy(*, trading_days, universe, **kwargs):
+        rebuilt.append(sorted(universe["symbol"]))
+        return real(trading_days=trading_days, universe=universe, **kwargs)
+
+    monkeypatch.setattr(screener, "build_daily_features_full_universe", _spy)
+    _assert_matches_full(state_path, DAYS, invalidate_symbols=["nvda"])
+    assert rebuilt[0] == ["NVDA"]
+
+    rebuilt.clear()
+    _assert_matches_full(state_path, DAYS, smc_base_only=True)
+    assert rebuilt[0] == list(SYMBOLS)
+
+
+def test_changed_intraday_input_rebuilds_only_that_session(tmp_path: Path, monkeypatch) -> None:
+    state_path = tmp_path / "daily_features_state.parquet"
+    universe = _universe()
+    options = {"display_timezone": "America/New_York", **_inputs(DAYS)}
+    # The first run saw a failed intraday fetch for one MSFT session.
+    intraday = options["intraday"]
+    day = intraday.loc[intraday["symbol"] == "MSFT", "trade_date"].iloc[3]
+    failed = (intraday["trade_date"] == day) & (intraday["symbol"] == "MSFT")
+    build_daily_features_incremental(
+        state_path, trading_days=DAYS, universe=universe, **{**options, "intraday": intraday[~failed]}
+    )
+    rebuilt: list[tuple[list[date], list[str]]] = []
+    real = screener.build_daily_features_full_universe
+
+    def _spy(*, trading_days, universe, **kwargs):
+        rebuilt.append((list(trading_days), sorted(universe["symbol"])))
+        return real(trading_days=trading_days, universe=universe, **kwargs)
+
+    monkeypatch.setattr(screener, "build_daily_features_full_universe", _spy)
+    features, coverage = build_daily_features_incremental(state_path, trading_days=DAYS, universe=universe, **options)
+
+    assert rebuilt == [([day], ["MSFT"])]
+    full_features, full_coverage = real(trading_days=DAYS, universe=universe, **options)
+    pd.testing.assert_frame_equal(features, full_features, check_exact=True)
+    pd.testing.assert_frame_equal(coverage, full_coverage, check_exact=True)
+
+    rebuilt.clear()
+    build_daily_features_incremental(state_path, trading_days=DAYS, universe=universe, **options)
+    assert rebuilt == []
@@ -0,0 +1,239 @@
+"""Streaming intraday summary loader: DBN ndarray decode and per-range checkpoints."""
+
+from __future__ import annotations
+
+import logging
+import math
+from datetime import date
+from datetime import time as dt_time
+from pathlib import Path
+from types import SimpleNamespace
+
+import databento as db
+import databento_dbn as dbn
+import numpy as np
+import pandas as pd
+import pytest
+
+import databento_volatility_screener as screener
+from databento_volatility_screener import (
+    DATA_CACHE_TTL_SECONDS,
+    _intraday_decode_batch_records,
+    _IntradayStateReducer,
+    _reduce_dbn_store,
+    build_window_definition,
+    run_intraday_screen,
+)
+
+TRADE_DAY = date(2026, 3, 5)
+SYMBOLS = ("AAPL", "MSFT", "NVDA")
+
+
+class _Killed(BaseException):
+    """Stands in for SIGTERM / OOM: not caught by the loader's ``except Exception``."""
+
+
+def _window():
+    return build_window_definition(
+        TRADE_DAY,
+        display_timezone="Europe/Berlin",
+        window_start=dt_time(15, 20),
+        window_end=dt_time(16, 0),
+        premarket_anchor_et=dt_time(8, 0),
+    )
+
+
+def _write_dbn(path: Path, symbols, *, seconds_step: int = 30) -> Path:
+    """Write an ``ohlcv-1s`` DBN file for ``symbols`` from 13:00 to 15:10 UTC."""
+    start = pd.Timestamp(f"{TRADE_DAY.isoformat()}T13:00:00Z").value
+    ids = {symbol: 100 + SYMBOLS.index(symbol) for symbol in symbols}
+    metadata = dbn.Metadata(
+        dataset="XNAS.ITCH",
+        schema=dbn.Schema.OHLCV_1S,
+        start=start,
+        stype_in=dbn.SType.RAW_SYMBOL,
+        stype_out=dbn.SType.INSTRUMENT_ID,
+        end=start + 8 * 3600 * 10**9,
+        symbols=list(symbols),
+        partial=[],
+        not_found=[],
+        mappings=[
+            SimpleNamespace(
+                raw_symbol=symbol,
+                intervals=[SimpleNamespace(start_date=TRADE_DAY, end_date=date(2026, 3, 6), symbol=str(iid))],
+            )
+            for symbol, iid in ids.items()
+        ],
+    )
+    offsets = range(0, 130 * 60, seconds_step)
+    # One RNG per symbol keeps every symbol's bars independent of the request it is part of.
+    noise = {symbol: np.random.default_rng(ids[symbol]).normal(0.0, 0.002, len(offsets)) for symbol in symbols}
+    volumes = {symbol: np.random.default_rng(ids[symbol]).integers(1, 500, len(offsets)) for symbol in symbols}
+    payload = bytearray(metadata.encode())
+    for step, offset in enumerate(offsets):
+        for symbol in sorted(symbols):
+            base = 50.0 * (1 + SYMBOLS.index(symbol)) * math.exp(noise[symbol][step])
+            payload += bytes(
+                dbn.OHLCVMsg(
+                    rtype=dbn.RType.OHLCV_1S,
+                    publisher_id=2,
+                    instrument_id=ids[symbol],
+                    ts_event=start + offset * 10**9,
+                    open=round(base * 1e9),
+                    high=round(base * 1.001 * 1e9),
+                    low=round(base * 0.999 * 1e9),
+                    close=round(base * 1.0002 * 1e9),
+                    volume=int(volumes[symbol][step]),
+                )
+            )
+    path.write_bytes(bytes(payload))
+    return path
+
+
+def _assert_same_states(expected, actual) -> None:
+    assert list(expected) == list(actual)
+    for symbol, state in expected.items():
+        for name in state.__dataclass_fields__:
+            want, got = getattr(state, name), getattr(actual[symbol], name)
+            if isinstance(want, float) and isinstance(got, float):
+                assert got == pytest.approx(want, rel=1e-12), (symbol, name)
+            else:
+                assert got == want, (symbol, name)
+
+
+class _FixtureTimeseries:
+    """``get_range`` that streams a DBN fixture to ``path=`` like the Historical client."""
+
+    def __init__(self, fail=None) -> None:
+        self.requests: list[tuple[str, ...]] = []
+        self.fail = fail or (lambda symbols: None)
+
+    def get_range(self, *, symbols, path=None, **kwargs):
+        symbols = tuple(symbols)
+        self.requests.append(symbols)
+        self.fail(symbols)
+        with open(path, "xb") as handle:
+            handle.write(_write_dbn(Path(f"{path}.src"), symbols).read_bytes())
+        Path(f"{path}.src").unlink()
+        return db.DBNStore.from_file(path)
+
+
+def _run(monkeypatch, cache_dir: Path, timeseries: _FixtureTimeseries, **kwargs) -> pd.DataFrame:
+    monkeypatch.setattr(screener, "_make_databento_client", lambda key: SimpleNamespace(timeseries=timeseries))
+    return run_intraday_screen(
+        "test-key",
+        dataset="XNAS.ITCH",
+        trading_days=[TRADE_DAY],
+        universe_symbols=set(SYMBOLS),
+        daily_bars=pd.DataFrame(
+            {"trade_date": [TRADE_DAY] * 3, "symbol": list(SYMBOLS), "previous_close": [49.0, 99.0, 149.0]}
+        ),
+        display_timezone="Europe/Berlin",
+        window_start=dt_time(15, 20),
+        window_end=dt_time(16, 0),
+        cache_dir=cache_dir,
+        use_file_cache=True,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def stream_env(monkeypatch):
+    monkeypatch.setattr(screener, "_get_schema_available_end", lambda client, dataset, schema: None)
+    monkeypatch.setattr(screener, "_trade_day_cache_max_age_seconds", lambda day, latest: DATA_CACHE_TTL_SECONDS)
+    monkeypatch.setattr(screener, "INTRADAY_SUMMARY_BATCH_SIZE", 1)
+    # Reduce in the day thread unless a test asks for the process pool.
+    monkeypatch.setattr(screener, "INTRADAY_REDUCE_PROCESSES", 0)
+
+
+def test_reduce_dbn_store_matches_dataframe_decode(tmp_path: Path) -> None:
+    store = db.DBNStore.from_file(_write_dbn(tmp_path / "day.dbn", SYMBOLS, seconds_step=7))
+    window = _window()
+    by_frame = _IntradayStateReducer(window)
+    for chunk in store.to_df(count=500):
+        by_frame.update(chunk)
+
+    streamed = _IntradayStateReducer(window)
+    records = _reduce_dbn_store(store, streamed, batch_records=500)
+
+    assert records == len(store.to_df())
+    assert len(streamed) == len(SYMBOLS)
+    _assert_same_states(by_frame.states(), streamed.states())
+
+
+def test_decode_batch_records_follow_memory_ceiling() -> None:
+    assert _intraday_decode_batch_records(64) == 64 * 1024 * 1024 // screener._INTRADAY_STREAM_BYTES_PER_RECORD
+    assert _intraday_decode_batch_records(0.001) == 1_024
+
+
+def test_interrupted_day_resumes_from_committed_ranges(tmp_path: Path, monkeypatch, stream_env, caplog) -> None:
+    reference = _run(monkeypatch, tmp_path / "reference", _FixtureTimeseries())
+
+    def _kill_on_nvda(symbols):
+        if "NVDA" in symbols:
+            raise _Killed
+
+    crashed = _FixtureTimeseries(fail=_kill_on_nvda)
+    with pytest.raises(_Killed):
+        _run(monkeypatch, tmp_path / "cache", crashed)
+    assert crashed.requests == [("AAPL",), ("MSFT",), ("NVDA",)]
+    checkpoints = list((tmp_path / "cache").rglob("*.ranges/*"))
+    assert sorted(path.suffix for path in checkpoints) == [".parquet", ".parquet"]
+
+    resumed = _FixtureTimeseries()
+    with caplog.at_level(logging.INFO, logger=screener.logger.name):
+        result = _run(monkeypatch, tmp_path / "cache", resumed)
+
+    assert resumed.requests == [("NVDA",)]
+    pd.testing.assert_frame_equal(result, reference)
+    assert not list((tmp_path / "cache").rglob("*.ranges"))
+    [stats] = [record.getMessage() for record in caplog.records if "streamed ranges=" in record.getMessage()]
+    assert "ranges=1 resumed_ranges=2" in stats
+    assert "records_per_s=" in stats and "rss=cur=" in stats
+
+
+def test_failed_range_is_split_without_double_counting(tmp_path: Path, monkeypatch, stream_env) -> None:
+    monkeypatch.setattr(screener, "INTRADAY_SUMMARY_BATCH_SIZE", 3)
+    monkeypatch.setattr(screener, "_intraday_decode_batch_records", lambda max_mib: 16)
+    reference = _run(monkeypatch, tmp_path / "reference", _FixtureTimeseries())
+
+    class _DroppedStream(_FixtureTimeseries):
+        def get_range(self, *, symbols, path=None, **kwargs):
+            store = super().get_range(symbols=symbols, path=path, **kwargs)
+            if len(store.metadata.symbols) == 1:
+                return store
+
+            def _batches(count):
+                iterator = store.to_ndarray(count=count)
+                yield next(iterator)
+                raise RuntimeError("Connection reset by peer")
+
+            return SimpleNamespace(metadata=store.metadata, to_ndarray=_batches)
+
+    flaky = _DroppedStream()
+    result = _run(monkeypatch, tmp_path / "cache", flaky)
+
+    assert flaky.requests == [SYMBOLS, ("AAPL",), ("MSFT", "NVDA"), ("MSFT",), ("NVDA",)]
+    # Row order follows first touch inside each range, so only the content is compared.
+    pd.testing.assert_frame_equal(
+        result.sort_values("symbol", ignore_index=True), reference.sort_values("symbol", ignore_index=True)
+    )
+    assert not list((tmp_path / "cache").rglob("*.dbn.zst"))
+
+
+def test_spooled_ranges_reduce_in_process_pool(tmp_path: Path, monkeypatch, stream_env) -> None:
+    reference = _run(monkeypatch, tmp_path / "reference", _FixtureTimeseries())
+    submitted: list[str] = []
+    real_reduce = screener._reduce_intraday_range
+
+    def _spy(store, window, *, reduce_executor, **kwargs):
+        submitted.append(type(reduce_executor).__name__)
+        return real_reduce(store, window, reduce_executor=reduce_executor, **kwargs)
+
+    monkeypatch.setattr(screener, "_reduce_intraday_range", _spy)
+    result = _run(monkeypatch, tmp_path / "cache", _FixtureTimeseries(), reduce_processes=1)
+
+    assert submitted == ["ProcessPoolExecutor"] * len(SYMBOLS)
+    pd.testing.assert_frame_equal(
+        result.sort_values("symbol", ignore_index=True), reference.sort_values("symbol", ignore_index=True)
+    )
@@ -0,0 +1,208 @@
+"""Second-detail partition store: closed sessions are computed once and re-read per symbol."""
+
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import databento_volatility_screener as screener
+from databento_volatility_screener import (
+    collect_full_universe_close_trade_detail,
+    collect_full_universe_open_window_second_detail,
+)
+
+DAYS = [date(2026, 3, 2), date(2026, 3, 3), date(2026, 3, 4)]
+SYMBOLS = {"AAPL", "MSFT", "NVDA"}
+# ``EMPTY`` resolves but never trades, so its coverage lives in the part metadata only.
+QUIET_SYMBOL = "EMPTY"
+
+
+class _FakeClient:
+    pass
+
+
+def _fake_rows(symbols: list[str], start: str, end: str, schema: str) -> pd.DataFrame:
+    start_ts = pd.Timestamp(start)
+    rows = []
+    for symbol in symbols:
+        if symbol == QUIET_SYMBOL:
+            continue
+        rng = np.random.default_rng([start_ts.value // 10**9, sum(map(ord, symbol))])
+        for second in range(4):
+            ts = start_ts + pd.Timedelta(seconds=second)
+            price = float(rng.uniform(10.0, 20.0))
+            if schema == "ohlcv-1s":
+                rows.append(
+                    {
+                        "symbol": symbol,
+                        "ts": ts,
+                        "open": price,
+                        "high": price + 0.1,
+                        "low": price - 0.1,
+                        "close": price,
+                        "volume": 100.0 + second,
+                    }
+                )
+            else:
+                rows.append(
+                    {
+                        "symbol": symbol,
+                        "ts": ts,
+                        "ts_event": ts,
+                        "publisher_id": 1,
+                        "side": "B",
+                        "price": price,
+                        "size": 10.0 + second,
+                        "flags": 0,
+                        "sequence": second,
+                        "ts_in_delta": 5,
+                    }
+                )
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    """Record every (trade_date, symbols) range request; ``failing`` days raise."""
+    calls: list[tuple[date, tuple[str, ...]]] = []
+    failing: set[date] = set()
+    available_end = {"value": pd.Timestamp("2026-03-31", tz="UTC")}
+
+    def fake_get_range(client, *, context, dataset, symbols, schema, start, end):
+        trade_day = pd.Timestamp(start).tz_convert("America/New_York").date()
+        calls.append((trade_day, tuple(sorted(symbols))))
+        if trade_day in failing:
+            raise RuntimeError("boom")
+        return _fake_rows(list(symbols), start, end, schema)
+
+    monkeypatch.setattr(screener, "_make_databento_client", lambda key: _FakeClient())
+    monkeypatch.setattr(screener, "_get_schema_available_end", lambda client, dataset, schema: available_end["value"])
+    monkeypatch.setattr(
+        screener,
+        "_load_databento_publisher_lookup",
+        lambda client: {1: {"venue_label": "NYSE", "venue_class": "lit_exchange"}},
+    )
+    monkeypatch.setattr(screener, "_databento_get_range_with_retry", fake_get_range)
+    monkeypatch.setattr(screener, "_store_to_frame", lambda store, count, context: store)
+    monkeypatch.setattr(screener, "_warn_with_redacted_exception", lambda *args, **kwargs: None)
+    return {"calls": calls, "failing": failing, "available_end": available_end}
+
+
+def _daily_bars() -> pd.DataFrame:
+    return pd.DataFrame(
+        [{"trade_date": day, "symbol": symbol, "previous_close": 15.0} for day in DAYS for symbol in sorted(SYMBOLS)]
+    )
+
+
+def _open_detail(store_dir: Path | None, symbols: set[str] = SYMBOLS, **kwargs) -> pd.DataFrame:
+    return collect_full_universe_open_window_second_detail(
+        "test-key",
+        dataset="DBEQ.BASIC",
+        trading_days=DAYS,
+        universe_symbols=symbols,
+        daily_bars=_daily_bars(),
+        display_timezone="America/New_York",
+        detail_store_dir=store_dir,
+        **kwargs,
+    )
+
+
+def _close_trades(store_dir: Path | None, symbols: set[str] = SYMBOLS, **kwargs) -> pd.DataFrame:
+    return collect_full_universe_close_trade_detail(
+        "test-key",
+        dataset="DBEQ.BASIC",
+        trading_days=DAYS,
+        universe_symbols=symbols,
+        display_timezone="America/New_York",
+        detail_store_dir=store_dir,
+        **kwargs,
+    )
+
+
+def _fetched_symbols(calls, trade_day: date) -> set[str]:
+    return {symbol for day, symbols in calls if day == trade_day for symbol in symbols}
+
+
+@pytest.mark.parametrize("collect", [_open_detail, _close_trades], ids=["open_window", "close_trades"])
+def test_rerun_reads_closed_sessions_from_the_store(fetches, tmp_path: Path, collect) -> None:
+    first = collect(tmp_path / "store", SYMBOLS | {QUIET_SYMBOL})
+    fetches["calls"].clear()
+
+    second = collect(tmp_path / "store", SYMBOLS | {QUIET_SYMBOL})
+
+    # Only the latest session (still open in the requested window) is refetched.
+    assert {day for day, _ in fetches["calls"]} == {DAYS[-1]}
+    pd.testing.assert_frame_equal(second, first)
+    # The store holds the same rows the collector computes without it.
+    without_store = collect(None, SYMBOLS | {QUIET_SYMBOL})
+    pd.testing.assert_frame_equal(
+        second.sort_values(["trade_date", "symbol"], kind="mergesort", ignore_index=True),
+        without_store.sort_values(["trade_date", "symbol"], kind="mergesort", ignore_index=True),
+        check_dtype=False,
+    )
+
+
+def test_only_symbols_missing_from_the_store_are_computed(fetches, tmp_path: Path) -> None:
+    store_dir = tmp_path / "store"
+    _open_detail(store_dir, {"AAPL", "MSFT"})
+    fetches["calls"].clear()
+
+    result = _open_detail(store_dir, SYMBOLS)
+
+    assert _fetched_symbols(fetches["calls"], DAYS[0]) == {"NVDA"}
+    assert _fetched_symbols(fetches["calls"], DAYS[-1]) == SYMBOLS
+    day_one = result[result["trade_date"] == DAYS[0]]
+    assert day_one["symbol"].tolist() == ["AAPL"] * 4 + ["MSFT"] * 4 + ["NVDA"] * 4
+    parts = sorted(
+        (store_dir / "open_window_second_detail" / "DBEQ_BASIC").glob("window=*/trade_date=2026-03-02/part-*.parquet")
+    )
+    assert len(parts) == 2
+
+    # A narrower request reads only its symbols from the shared partitions.
+    fetches["calls"].clear()
+    narrow = _open_detail(store_dir, {"MSFT"})
+    assert _fetched_symbols(fetches["calls"], DAYS[0]) == set()
+    assert set(narrow["symbol"]) == {"MSFT"}
+
+
+def test_failed_batches_and_unpublished_windows_are_not_stored(fetches, tmp_path: Path) -> None:
+    store_dir = tmp_path / "store"
+    fetches["failing"].add(DAYS[0])
+    _close_trades(store_dir)
+    fetches["failing"].clear()
+    fetches["calls"].clear()
+
+    result = _close_trades(store_dir)
+
+    assert _fetched_symbols(fetches["calls"], DAYS[0]) == SYMBOLS
+    assert _fetched_symbols(fetches["calls"], DAYS[1]) == set()
+    assert set(result.loc[result["trade_date"] == DAYS[0], "symbol"]) == SYMBOLS
+
+    # Databento has not published the window of the second session yet.
+    fetches["available_end"]["value"] = pd.Timestamp("2026-03-03T20:00:00Z")
+    other_store = tmp_path / "other"
+    _close_trades(other_store)
+    stored_days = {path.name for path in other_store.rglob("trade_date=*")}
+    assert stored_days == {"trade_date=2026-03-02"}
+
+
+def test_force_refresh_recomputes_and_corrupt_parts_are_dropped(fetches, tmp_path: Path) -> None:
+    store_dir = tmp_path / "store"
+    _open_detail(store_dir)
+    partition = next((store_dir / "open_window_second_detail").rglob("trade_date=2026-03-02"))
+    (partition / "part-99999999999999999999.parquet").write_bytes(b"not parquet")
+    fetches["calls"].clear()
+
+    _open_detail(store_dir)
+
+    assert _fetched_symbols(fetches["calls"], DAYS[0]) == set()
+    assert [path.name for path in partition.glob("part-9*.parquet")] == []
+
+    fetches["calls"].clear()
+    _open_detail(store_dir, force_refresh=True)
+    assert _fetched_symbols(fetches["calls"], DAYS[0]) == SYMBOLS
+    assert len(list(partition.glob("part-*.parquet"))) == 1
@@ -95,8 +95,15 @@ def _dynamic_getattr_sites() -> set[tuple[str, int]]:
 # valid names is statically visible.
 DYNAMIC_GETATTR_LEDGER: set[tuple[str, int]] = {
     # 2026-06-22 (ingest-stop sentinel wakeup): helper block growth shifted
-    # _record_to_bar dynamic getattr site 81 -> 82.
-    ("services/live_overlay_daemon/feed.py", 82),
+    # _record_to_bar dynamic getattr site 81 -> 82. The batched-ingest record
+    # kind table moved _price_from_record to 102.
+    ("services/live_overlay_daemon/feed.py", 102),
+    # Lazy-import layer: LazyModule forwards attribute lookups to the real
+    # module, and the PEP 562 package facades resolve their re-exports from
+    # a fixed name -> submodule table.
+    ("lazy_imports.py", 49),
+    ("smc_core/__init__.py", 137),
+    ("smc_integration/__init__.py", 170),
     ("smc_core/event_ledger.py", 79),
     ("smc_core/scoring.py", 308),
     ("streamlit_terminal_alerts.py", 41),
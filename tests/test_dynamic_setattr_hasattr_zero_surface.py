@@ -123,7 +123,7 @@ def test_dynamic_setattr_zero_surface_pin() -> None:
 # overrides. The name comes from a small, trusted override-mapping
 # defined in the same module.
 DYNAMIC_HASATTR_ALLOWED: set[tuple[str, int]] = {
-    ("streamlit_terminal.py", 593),
+    ("streamlit_terminal.py", 590),
 }
 
 
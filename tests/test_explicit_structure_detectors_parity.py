@@ -0,0 +1,104 @@
+"""Byte-parity guard for the classic explicit-structure detectors.
+
+The order-block, rejection-block, FVG and pivot3 liquidity detectors used to
+resolve mitigation / invalidation with a nested per-zone forward scan over
+``bars.iloc``.  They now share the sparse-table engine in
+:mod:`smc_core.mitigation_search`.  The digests in
+``tests/fixtures/explicit_structure_detectors_golden.json`` were recorded from
+the nested-scan implementation on:
+
+* ``long_strategy_input`` -- the recorded 1m bar fixture used by the strategy
+  parity tests (``tests/fixtures/smc_strategy/long_strategy_input.csv``);
+* ``synthetic_walk_seed7`` -- a seeded 1200-bar random walk with wide wicks so
+  every zone family, both directions and both lifecycle outcomes occur.
+
+Any change to the serialized event output (values, ordering, key order or
+float repr) changes the digest.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from scripts.explicit_structure_detectors import (
+    detect_fvg_classic,
+    detect_liquidity_lines_pivot3,
+    detect_orderblocks_classic,
+    detect_rejection_blocks_classic,
+)
+from tests.fixture_helpers import load_fixture
+
+_FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+def _synthetic_walk(seed: int, n: int) -> pd.DataFrame:
+    rng = random.Random(seed)
+    price = 100.0
+    rows = []
+    for i in range(n):
+        open_ = price
+        close = round(open_ + rng.gauss(0, 0.6), 2)
+        high = round(max(open_, close) + abs(rng.gauss(0, 0.3)), 2)
+        low = round(min(open_, close) - abs(rng.gauss(0, 0.3)), 2)
+        rows.append(
+            {"timestamp": 1_700_000_000 + 60 * i, "open": open_, "high": high, "low": low, "close": close, "volume": 1000.0}
+        )
+        price = close
+    return pd.DataFrame(rows)
+
+
+def _case_bars(case: str) -> pd.DataFrame:
+    if case == "long_strategy_input":
+        return pd.read_csv(_FIXTURES_DIR / "smc_strategy" / "long_strategy_input.csv").drop(columns=["bar_index"])
+    if case == "synthetic_walk_seed7":
+        return _synthetic_walk(7, 1200)
+    raise KeyError(case)
+
+
+def _family_payload(bars: pd.DataFrame, family: str):
+    kwargs = {"symbol": "AAPL", "timeframe": "5m"}
+    if family == "orderblocks":
+        return list(detect_orderblocks_classic(bars, **kwargs))
+    if family == "rejection_blocks":
+        return list(detect_rejection_blocks_classic(bars, **kwargs))
+    if family == "fvg":
+        return list(detect_fvg_classic(bars, **kwargs))
+    return detect_liquidity_lines_pivot3(bars, **kwargs)
+
+
+_GOLDEN = load_fixture("explicit_structure_detectors_golden.json")
+_CASES = [(case, family) for case, families in sorted(_GOLDEN.items()) for family in sorted(families)]
+
+
+@pytest.mark.parametrize(("case", "family"), _CASES)
+def test_detector_output_matches_recorded_nested_scan_digest(case: str, family: str) -> None:
+    expected = _GOLDEN[case][family]
+    payload = _family_payload(_case_bars(case), family)
+
+    events = payload if family == "liquidity_lines" else payload[0]
+    assert len(events) == expected["count"]
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    assert hashlib.sha256(blob).hexdigest() == expected["sha256"]
+
+
+def test_detectors_preserve_field_order() -> None:
+    bars = _case_bars("synthetic_walk_seed7")
+    orderblocks, ob_diag = detect_orderblocks_classic(bars, symbol="AAPL", timeframe="5m")
+    _rjb, rjb_diag = detect_rejection_blocks_classic(bars, symbol="AAPL", timeframe="5m")
+    lines = detect_liquidity_lines_pivot3(bars, symbol="AAPL", timeframe="5m")
+
+    assert list(orderblocks[0]) == ["id", "low", "high", "dir", "valid", "anchor_ts", "source"]
+    assert list(ob_diag[0]) == ["id", "kind", "mitigated", "mitigated_ts", "invalidation_rule", "left_anchor_ts"]
+    assert list(rjb_diag[0])[-1] == "variant"
+    assert list(lines[0]) == ["id", "side", "price", "anchor_ts", "source", "active", "consumed"]
+    assert {row["dir"] for row in orderblocks} == {"BULL", "BEAR"}
+    assert {row["valid"] for row in orderblocks} == {True, False}
+    assert {row["mitigated"] for row in ob_diag} == {True, False}
+    assert {row["variant"] for row in rjb_diag} == {"trapped_wick", "signal_wick"}
+    assert all(isinstance(row["mitigated_ts"], int) for row in ob_diag if row["mitigated"])
@@ -7,7 +7,6 @@ exceptions we want to verify.
 from __future__ import annotations
 
 import logging
-import queue
 import threading
 import time
 from collections.abc import Callable
@@ -57,7 +56,7 @@ def _run_feed_loop_until(
     """
     stop = threading.Event()
     if feed._runtime.get("ingest_queue") is None:
-        feed._runtime["ingest_queue"] = queue.Queue(maxsize=feed.config.ingest_queue_max())
+        feed._runtime["ingest_queue"] = feed.IngestBuffer(maxsize=feed.config.ingest_queue_max())
         feed._runtime["ingest_queue_max"] = feed.config.ingest_queue_max()
 
     ingest_thread = threading.Thread(
@@ -196,7 +195,7 @@ class TestFeedReconnectAndCircuitBreaker:
         _patch_reconnect_delays(feed)
 
         # Queue-based architecture: feed loop enqueues, ingest loop applies to cache.
-        feed._runtime["ingest_queue"] = queue.Queue(maxsize=32)
+        feed._runtime["ingest_queue"] = feed.IngestBuffer(maxsize=32)
         feed._runtime["ingest_queue_max"] = 32
 
         sequence = [SymbolMappingMsg(), OHLCV_1m()]
@@ -0,0 +1,199 @@
+"""Tests for the pooled FMP transport and the batch-quote path of FMPClient.
+
+A local stub HTTP/1.1 server counts TCP connections and requests, so the
+handshake reduction of ``PooledHTTPTransport`` over the per-call
+``urlopen`` path is asserted directly rather than inferred from timings.
+"""
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from open_prep.fmp_transport import PooledHTTPTransport
+from open_prep.macro import FMPClient
+
+
+class _StubFMPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _StubFMPHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests: list[str] = []
+        self.fail_status: dict[str, list[int]] = {}
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+class _StubFMPHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _StubFMPServer
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, fmt: str, *args: Any) -> None:
+        return None
+
+    def do_GET(self) -> None:
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        with self.server.lock:
+            self.server.requests.append(parsed.path)
+            queued = self.server.fail_status.get(parsed.path) or []
+            status = queued.pop(0) if queued else 200
+        if status != 200:
+            body = json.dumps({"message": f"stub {status}"}).encode()
+        elif parsed.path == "/stable/quote":
+            symbol = query["symbol"][0]
+            body = json.dumps([{"symbol": symbol, "price": 100.0}]).encode()
+        elif parsed.path == "/stable/batch-quote":
+            symbols = [s for s in query["symbols"][0].split(",") if s != "GONE"]
+            body = json.dumps([{"symbol": s, "price": 100.0} for s in symbols]).encode()
+        else:
+            status, body = 404, b'{"message":"unknown"}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture()
+def stub_server() -> Iterator[_StubFMPServer]:
+    server = _StubFMPServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _client(server: _StubFMPServer, transport: PooledHTTPTransport | None) -> FMPClient:
+    return FMPClient(
+        api_key="K",
+        stable_base_url=server.base_url,
+        retry_attempts=2,
+        retry_backoff_seconds=0.0,
+        timeout_seconds=5.0,
+        transport=transport,
+    )
+
+
+_SYMBOLS = [f"S{idx:02d}" for idx in range(24)]
+
+
+def test_pooled_transport_reuses_keepalive_connections(
+    stub_server: _StubFMPServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("OPEN_PREP_FMP_QUOTE_WORKERS", "4")
+
+    client = _client(stub_server, PooledHTTPTransport(pool_size=2))
+    try:
+        rows = client.get_batch_quotes(_SYMBOLS)
+    finally:
+        client.close()
+
+    assert [row["symbol"] for row in rows] == _SYMBOLS
+    assert len(stub_server.requests) == len(_SYMBOLS)
+    assert stub_server.connections <= 2
+    assert client.get_endpoint_usage_stats()["/stable/quote"]["calls"] == len(_SYMBOLS)
+
+
+def test_urlopen_path_opens_one_connection_per_request(
+    stub_server: _StubFMPServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("OPEN_PREP_FMP_QUOTE_WORKERS", "1")
+
+    rows = _client(stub_server, None).get_batch_quotes(_SYMBOLS[:6])
+
+    assert len(rows) == 6
+    assert stub_server.connections == 6
+
+
+def test_batch_quotes_chunk_symbols_into_batch_requests(
+    stub_server: _StubFMPServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("OPEN_PREP_FMP_QUOTE_BATCH_SIZE", "10")
+    client = _client(stub_server, PooledHTTPTransport(pool_size=4))
+
+    rows = client.get_batch_quotes([*_SYMBOLS, "GONE", "s00"])
+    client.close()
+
+    assert [row["symbol"] for row in rows] == _SYMBOLS
+    assert stub_server.requests == ["/stable/batch-quote"] * 3
+    diagnostics = client.get_last_quote_fetch_diagnostics()
+    assert diagnostics["quote_fetch_mode"] == "fmp_stable_batch_quote"
+    assert diagnostics["endpoint_used"] == "/stable/batch-quote"
+    assert diagnostics["quote_batch_size"] == 10
+    assert diagnostics["failed_quote_symbols"] == ["GONE"]
+    assert client.get_endpoint_usage_stats()["/stable/batch-quote"]["calls"] == 3
+
+
+def test_rejected_batch_chunk_falls_back_to_per_symbol(
+    stub_server: _StubFMPServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("OPEN_PREP_FMP_QUOTE_BATCH_SIZE", "5")
+    monkeypatch.setenv("OPEN_PREP_FMP_QUOTE_WORKERS", "1")
+    stub_server.fail_status["/stable/batch-quote"] = [402]
+    client = _client(stub_server, PooledHTTPTransport(pool_size=1))
+
+    rows = client.get_batch_quotes(_SYMBOLS[:10])
+    client.close()
+
+    assert [row["symbol"] for row in rows] == _SYMBOLS[:10]
+    assert stub_server.requests == ["/stable/batch-quote"] + ["/stable/quote"] * 5 + ["/stable/batch-quote"]
+    assert client.get_last_quote_fetch_diagnostics()["quote_batch_fallback_chunks"] == 1
+
+
+def test_pooled_transport_keeps_retry_and_circuit_breaker_semantics(stub_server: _StubFMPServer) -> None:
+    stub_server.fail_status["/stable/quote"] = [503]
+    client = _client(stub_server, PooledHTTPTransport(pool_size=1))
+
+    assert client._get("/stable/quote", {"symbol": "AAPL"}) == [{"symbol": "AAPL", "price": 100.0}]
+    assert stub_server.requests == ["/stable/quote", "/stable/quote"]
+
+    # A 4xx is a client/data error: surfaced, not retried, breaker untouched.
+    with pytest.raises(RuntimeError, match="FMP API HTTP 404 on /stable/unknown"):
+        client._get("/stable/unknown", {})
+    assert client._circuit_breaker.allow_request()
+    assert client.get_endpoint_usage_stats()["/stable/unknown"]["errors"] == 1
+    client.close()
+
+
+def test_pooled_transport_reports_connection_failure_as_network_error() -> None:
+    client = FMPClient(
+        api_key="K",
+        stable_base_url="http://127.0.0.1:9",
+        retry_attempts=1,
+        transport=PooledHTTPTransport(pool_size=1, timeout=1.0),
+    )
+    with pytest.raises(RuntimeError, match="FMP API network error on /stable/quote"):
+        client._get("/stable/quote", {"symbol": "AAPL"})
+    client.close()
+
+
+def test_from_env_pool_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OPEN_PREP_FMP_HTTP_POOL_SIZE", "3")
+    client = FMPClient.from_env()
+    assert isinstance(client.transport, PooledHTTPTransport)
+    assert client.transport.pool_size == 3
+
+    monkeypatch.setenv("OPEN_PREP_FMP_HTTP_POOL_SIZE", "0")
+    assert FMPClient.from_env().transport is None
+
+    with pytest.raises(ValueError, match="pool_size"):
+        PooledHTTPTransport(pool_size=0)
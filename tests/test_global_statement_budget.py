@@ -86,15 +86,15 @@ _FROZEN_SITES: frozenset[tuple[str, int, tuple[str, ...]]] = frozenset(
         ("newsstack_fmp/pipeline.py", 108, ("_bz_ws_adapter", "_bz_ws_adapter_key")),
         ("newsstack_fmp/pipeline.py", 134, ("_bz_rss_adapter",)),
         ("newsstack_fmp/pipeline.py", 143, ("_enricher",)),
-        ("newsstack_fmp/pipeline.py", 1119, ("_last_meta",)),
+        ("newsstack_fmp/pipeline.py", 1200, ("_last_meta",)),
         (
             "newsstack_fmp/pipeline.py",
-            1208,
+            1289,
             ("_bz_rest_adapter", "_bz_rss_adapter", "_bz_ws_adapter", "_enricher", "_fmp_adapter", "_last_meta", "_store"),
         ),
         (
             "newsstack_fmp/pipeline.py",
-            1209,
+            1290,
             ("_bz_rest_adapter_key", "_bz_ws_adapter_key", "_fmp_adapter_key"),
         ),
         ("open_prep/regime.py", 129, ("_prev_regime",)),
@@ -102,7 +102,7 @@ _FROZEN_SITES: frozenset[tuple[str, int, tuple[str, ...]]] = frozenset(
         # R-E2 audit (2026-06-14): thread-safe one-time guard for
         # _normalize_tls_certificate_env os.environ write (see macro.py R-E2).
         # Line shifted 145→148 by M1 iteration-limit addition (PR #2828).
-        ("open_prep/macro.py", 148, ("_TLS_NORM_DONE",)),
+        ("open_prep/macro.py", 153, ("_TLS_NORM_DONE",)),
         # F-V5-G1 (2026-05-01): pre-existing site surfaced when ``scripts/``
         # was added to the audit scope. TODO move to a class attribute or
         # injected dependency in a follow-up PR.
@@ -125,9 +125,13 @@ _FROZEN_SITES: frozenset[tuple[str, int, tuple[str, ...]]] = frozenset(
         # ``DEFAULT_SLIM_CANONICAL_WORKBOOK_SHEET_NAMES`` + env-resolver
         # block inserted next to ``SMC_BASE_ONLY_CANONICAL_WORKBOOK_SHEET_NAMES``
         # to fix the 5 consecutive cron OOMs 2026-05-11 → 2026-05-13.
+        # The content-cache import shifted it +1 (843 -> 844), the intraday
+        # decode-ceiling import +1 more (844 -> 845), the incremental
+        # feature-builder import +1 more (845 -> 846), the workbook
+        # xlsx-mode env block + resolver +32 (846 -> 878).
         (
             "scripts/databento_production_export.py",
-            843,
+            878,
             ("_DEFAULT_BULLISH_QUALITY_CFG",),
         ),
         # WP-H (PR #2612): lines shifted 184/192/200 -> 186/194/202 by the
@@ -140,7 +144,7 @@ _FROZEN_SITES: frozenset[tuple[str, int, tuple[str, ...]]] = frozenset(
         ("smc_tv_bridge/smc_api.py", 208, ("_tech_provider",)),
         (
             "streamlit_terminal.py",
-            599,
+            596,
             ("btc_available", "databento_available", "ensure_rt_engine_running", "newsapi_available", "tv_available"),
         ),
         # F-V8-perf-3.5 (2026-05-19): opt-in cache probe log for the sharded
@@ -148,9 +152,10 @@ _FROZEN_SITES: frozenset[tuple[str, int, tuple[str, ...]]] = frozenset(
         # sets DATABENTO_CACHE_PROBE_LOG and the producer explicitly enables it.
         # F-002 (PR #2295): extracted enable/reset helpers; the original
         # 5601-site relocated to enable_cache_probe_log()/reset_cache_probe_log().
-        ("databento_volatility_screener.py", 87, ("_CACHE_PROBE_LOG",)),
-        ("databento_volatility_screener.py", 94, ("_CACHE_PROBE_LOG",)),
-        ("terminal_bitcoin.py", 96, ("_client",)),
+        # The content-cache import shifted both sites +1.
+        ("databento_volatility_screener.py", 98, ("_CACHE_PROBE_LOG",)),
+        ("databento_volatility_screener.py", 105, ("_CACHE_PROBE_LOG",)),
+        ("terminal_bitcoin.py", 91, ("_client",)),
         (
             "terminal_finnhub.py",
             213,
@@ -169,20 +174,20 @@ _FROZEN_SITES: frozenset[tuple[str, int, tuple[str, ...]]] = frozenset(
                 "_social_sentiment_blocked",
             ),
         ),
-        ("terminal_spike_scanner.py", 97, ("_YF_UNIVERSE_CACHE",)),
+        ("terminal_spike_scanner.py", 96, ("_YF_UNIVERSE_CACHE",)),
         # 2026-06-10 (#2670 W3): TechnicalResult gained a `source` field +
         # dc_replace import, shifting the four global sites +6 (212/213/245/262
         # -> 218/219/251/268).
         # 2026-06-19 (timeframe expansion): added 10m map/default interval,
         # shifting these global sites 219/220/252/269 -> 220/221/253/270.
-        ("terminal_technicals.py", 220, ("_tv_consecutive_429s", "_tv_cooldown_until")),
+        ("terminal_technicals.py", 219, ("_tv_consecutive_429s", "_tv_cooldown_until")),
         (
             "terminal_technicals.py",
-            221,
+            220,
             ("_tv_last_429_log_key", "_tv_last_429_log_ts", "_tv_suppressed_429_logs"),
         ),
-        ("terminal_technicals.py", 253, ("_tv_consecutive_429s",)),
-        ("terminal_technicals.py", 270, ("_tv_cooldown_ended_at", "_tv_last_call_ts")),
+        ("terminal_technicals.py", 252, ("_tv_consecutive_429s",)),
+        ("terminal_technicals.py", 269, ("_tv_cooldown_ended_at", "_tv_last_call_ts")),
         ("terminal_tradingview_news.py", 403, ("_last_request_ts",)),
         # 2026-06-16 (feat/live-overlay-daemon): daemon singletons guarded by
         # threading.Lock() per concurrency-shared-mutables guideline.
@@ -199,10 +204,12 @@ _FROZEN_SITES: frozenset[tuple[str, int, tuple[str, ...]]] = frozenset(
         # allow_none_keys semantics for flow-field stale-state fixes, shifting
         # cache.py set_vix global line 198 -> 210.
         # 2026-06-20 (cache defensive copy): added copy import shifted globals +1.
-        ("services/live_overlay_daemon/cache.py", 49, ("_max_symbols", "_rolling_bars_cap")),
-        ("services/live_overlay_daemon/cache.py", 69, ("_last_eviction_at",)),
-        ("services/live_overlay_daemon/cache.py", 146, ("_overlay_computed_at",)),
-        ("services/live_overlay_daemon/cache.py", 216, ("_vix_level",)),
+        # Sharded bar cache: the bar caps and eviction clock moved onto
+        # _BarCacheState (two globals dropped); overlay/VIX shifted to 502/572,
+        # then to 530/600 by the dirty-snapshot read for the compute cycle.
+        # Overlay versions for the /smc_live payload cache shifted them to 541/631.
+        ("services/live_overlay_daemon/cache.py", 541, ("_overlay_computed_at",)),
+        ("services/live_overlay_daemon/cache.py", 631, ("_vix_level",)),
         # 2026-06-19 (fix/live-overlay-post-merge-bugs): separate _news_checked_at
         # from _news_loaded_at so missing-file rate-limiting does not pin the
         # success cache for the full TTL when a snapshot appears later.
@@ -228,30 +235,34 @@ _FROZEN_SITES: frozenset[tuple[str, int, tuple[str, ...]]] = frozenset(
         # 2026-06-26 (feat/overlay-consume-signals-service, PR #2962):
         # producer-first signal loader + http://*.railway.internal guard shifted
         # the news/signals/credential/experiment/experiment_history anchors.
-        ("services/live_overlay_daemon/compute.py", 256, ("_news_cache", "_news_checked_at", "_news_loaded_at")),
+        ("services/live_overlay_daemon/compute.py", 265, ("_news_cache", "_news_checked_at", "_news_loaded_at")),
         # 2026-06-23 (feat/grafana-trading-signals): realtime trading-signals
         # snapshot loader mirrors the news snapshot caching pattern.
         # 2026-06-26 (PR #2962): shifted by producer client code.
-        ("services/live_overlay_daemon/compute.py", 416, ("_signals_cache", "_signals_checked_at", "_signals_loaded_at")),
+        ("services/live_overlay_daemon/compute.py", 425, ("_signals_cache", "_signals_checked_at", "_signals_loaded_at")),
         # 2026-06-23 (feat/grafana-tv-credential-age): credential-health report
         # loader mirrors the same snapshot caching pattern.
         # 2026-06-26 (PR #2962): shifted by producer client code.
-        ("services/live_overlay_daemon/compute.py", 503, ("_tradingview_credential_cache", "_tradingview_credential_checked_at", "_tradingview_credential_loaded_at")),
+        ("services/live_overlay_daemon/compute.py", 512, ("_tradingview_credential_cache", "_tradingview_credential_checked_at", "_tradingview_credential_loaded_at")),
         # 2026-06-23 (feat/grafana-experiment-timeline): daily experiment rollup
         # + per-day history loaders mirror the same snapshot caching pattern.
         # 2026-06-24 (feat/live-overlay-credential-health): +5 lines for
         # _load_credential_health_snapshot alias shifted globals to 520/568.
         # 2026-06-26 (PR #2962): shifted by producer client code.
-        ("services/live_overlay_daemon/compute.py", 622, ("_experiment_cache", "_experiment_checked_at", "_experiment_loaded_at")),
-        ("services/live_overlay_daemon/compute.py", 670, ("_experiment_history_cache", "_experiment_history_checked_at", "_experiment_history_loaded_at")),
+        # Every compute.py anchor shifted +1 by the concurrent.futures import.
+        ("services/live_overlay_daemon/compute.py", 631, ("_experiment_cache", "_experiment_checked_at", "_experiment_loaded_at")),
+        ("services/live_overlay_daemon/compute.py", 679, ("_experiment_history_cache", "_experiment_history_checked_at", "_experiment_history_loaded_at")),
         # 2026-06-21 (provider/bridge + queue backpressure follow-ups):
         # feed.py gained additional helper/config blocks, shifting global
         # statements to 362/420/496.
         # 2026-06-22 follow-ups shifted these anchors to 365/423/512.
         # Post-merge sync with main shifted these anchors to 374/432/521.
-        ("services/live_overlay_daemon/feed.py", 373, ("_last_bar_at",)),
-        ("services/live_overlay_daemon/feed.py", 431, ("_feed_thread", "_flow_refresh_thread", "_refresh_thread")),
-        ("services/live_overlay_daemon/feed.py", 520, ("_feed_thread", "_flow_refresh_thread", "_refresh_thread")),
+        # Batched ingest moved the _last_bar_at update into
+        # _apply_ingest_batch (438) and shifted start/stop to 493/582.
+        ("services/live_overlay_daemon/feed.py", 438, ("_last_bar_at",)),
+        # The payload cache refresh hook shifted start/stop to 504/593.
+        ("services/live_overlay_daemon/feed.py", 504, ("_feed_thread", "_flow_refresh_thread", "_refresh_thread")),
+        ("services/live_overlay_daemon/feed.py", 593, ("_feed_thread", "_flow_refresh_thread", "_refresh_thread")),
         # 2026-06-21: optional external bridge snapshot caches are guarded by
         # module locks and cached via module-level singleton snapshots.
         # 2026-06-23: workflow bridge hardening (status/conclusion semantics,
@@ -279,7 +290,10 @@ _FROZEN_SITES: frozenset[tuple[str, int, tuple[str, ...]]] = frozenset(
         # basic-auth endpoint updates) shifted _startup_ts to line 71.
         # 2026-06-21 (auth decode hardening): binascii import shifted
         # _startup_ts to line 72.
-        ("services/live_overlay_daemon/main.py", 72, ("_startup_ts",)),
+        # The /smc_live payload cache moved _json_safe out of main.py
+        # (_startup_ts now on line 65).
+        # Metrics format negotiation notes in the module docstring (line 71).
+        ("services/live_overlay_daemon/main.py", 71, ("_startup_ts",)),
     }
 )
 
@@ -65,7 +65,7 @@ _FROZEN_SITES: dict[str, dict[str, frozenset[int]]] = {
     # 475) and shifted the two cache-probe sites by ~100 lines (cache-pollution
     # filter + drift detector block). Still non-security fingerprinting.
     # 2026-06-10 (#2670 W9): timestamp_substitutions disclosure shifted +5.
-    "databento_volatility_screener.py": {"sha1": frozenset({400, 482, 698, 716})},
+    "databento_volatility_screener.py": {"sha1": frozenset({442, 524, 740, 758})},
     "newsstack_fmp/normalize.py": {
         "md5": frozenset({132, 255}),
         "sha1": frozenset({336, 422, 460, 504}),
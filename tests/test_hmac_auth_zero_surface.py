@@ -44,11 +44,14 @@ HMAC_ALLOWED: set[tuple[str, int, str]] = {
     # provider-news rework shifted the same compare_digest call 418 → 421.
     # 2026-06-30 (Railway PORT follow-up): daemon entrypoint refactor shifted
     # the reviewed constant-time token compare call 422 → 442.
+    # Rolling timeframe aggregator in the payload path shifted it 442 → 438.
     # 2026-06-24 (signals auth): realtime /signals bearer-token checks use
     # constant-time comparison at two call sites.
     ("open_prep/realtime_signals.py", 960, "compare_digest"),
     ("open_prep/realtime_signals.py", 991, "compare_digest"),
-    ("services/live_overlay_daemon/main.py", 442, "compare_digest"),
+    # /smc_live payload cache: on-demand payload lookup moved to payload_cache.py.
+    # Metrics exposition: OpenMetrics/gzip negotiation helpers added above.
+    ("services/live_overlay_daemon/main.py", 446, "compare_digest"),
 }
 
 _DIR_EXCLUDE = {
@@ -149,7 +149,7 @@ _FROZEN_URLOPEN_SITES: frozenset[tuple[str, int]] = frozenset(
         # by the explicit missing-symbols-key warn-and-refetch branch added
         # to ``_load_cache_with_drift_check``.
         # 2026-06-10: +5 (1423→1428).
-        ("databento_volatility_screener.py", 1430),
+        ("databento_volatility_screener.py", 1483),
         ("open_prep/bea.py", 94),
         # open_prep/macro.py:691 — shifted by ruff RUF046/B904/SIM103 cleanup;
         # was 692 after audit/discipline-pattern-v4 (originally 600).
@@ -164,7 +164,7 @@ _FROZEN_URLOPEN_SITES: frozenset[tuple[str, int]] = frozenset(
         # instrumentation block in macro.py.
         # 2026-06-11 (eval-findings B8): surprise-scale comment +8 (713→721).
         # 2026-06-13: profile-bulk pagination constant shifted +1 (721→722).
-        ("open_prep/macro.py", 740),  # R-E2 (2026-06-14): +14 from TLS lock guard; +1 iteration-limit; +3 rebase
+        ("open_prep/macro.py", 775),  # R-E2 (2026-06-14): +14 from TLS lock guard; +1 iteration-limit; +3 rebase; +35 pooled transport
         ("open_prep/sentiment_fng.py", 100),
         ("terminal_finnhub.py", 245),
         ("terminal_notifications.py", 255),
@@ -196,9 +196,9 @@ _FROZEN_URLOPEN_SITES: frozenset[tuple[str, int]] = frozenset(
         #   * experiment text fetcher (rollup/history) with GitHub-contents
         #     Accept-header hardening via parsed URL checks.
         # 2026-06-26 (PR #2962): shifted/expanded by the producer client.
-        ("services/live_overlay_daemon/compute.py", 230),
-        ("services/live_overlay_daemon/compute.py", 389),
-        ("services/live_overlay_daemon/compute.py", 581),
+        ("services/live_overlay_daemon/compute.py", 239),
+        ("services/live_overlay_daemon/compute.py", 398),
+        ("services/live_overlay_daemon/compute.py", 590),
         # 2026-06-24: Railway GraphQL API bridge for container metrics polling;
         # fixed https endpoint (backboard.railway.com), explicit timeout discipline.
         ("services/live_overlay_daemon/railway_metrics.py", 85),
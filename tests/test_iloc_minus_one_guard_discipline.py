@@ -105,7 +105,9 @@ _KNOWN_HOTSPOTS: Final[frozenset[tuple[str, int]]] = frozenset(
         # PR #2198 main churn added 1 line near top (-> 2397) and
         # Bridge 1c (PR #2197) inserted DEFAULT_SLIM_CANONICAL_WORKBOOK_SHEET_NAMES
         # + env-resolver block (~61 lines), shifting 2397 -> 2458.
-        ("scripts/databento_production_export.py", 2457),
+        # The content-cache import shifted it +1 (2457 -> 2458).
+        # The workbook xlsx-mode env block + resolver shifted it 2466 -> 2498.
+        ("scripts/databento_production_export.py", 2498),
         # scripts/generate_bullish_quality_scanner.py — manifest scalar
         # lookups (source_data_fetched_at / latest window_tag); not bar
         # data.
@@ -0,0 +1,125 @@
+"""Batched ingest path of the live overlay daemon: feed dispatch -> IngestBuffer -> cache.push_bars."""
+from __future__ import annotations
+
+import queue
+import random
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+import databento as db
+import pytest
+
+from scripts.benchmark_live_overlay_ingest import synthetic_burst_dbn
+from services.live_overlay_daemon import cache, feed
+from services.live_overlay_daemon.ingest_buffer import IngestBuffer
+
+_NS_PER_MINUTE = 60_000_000_000
+
+
+@pytest.fixture(autouse=True)
+def _fresh_bar_cache() -> Iterator[None]:
+    cache.reset_bar_cache()
+    yield
+    cache.reset_bar_cache()
+
+
+def _bar(rng: random.Random, minute: int) -> dict[str, Any]:
+    price = 100.0 + rng.uniform(-5.0, 5.0)
+    return {
+        "open": price,
+        "high": price + 0.5,
+        "low": price - 0.5,
+        "close": rng.choice([price, None]),
+        "volume": rng.choice([10, "12", -1]),
+        "ts_event": rng.choice([minute * _NS_PER_MINUTE, minute * _NS_PER_MINUTE, None]),
+    }
+
+
+def test_push_bars_matches_push_bar_per_pair() -> None:
+    rng = random.Random(3)
+    batches = [
+        [(rng.choice("ABCDEFGHIJ"), _bar(rng, minute)) for _ in range(rng.randint(0, 40))]
+        for minute in range(1_000, 1_030)
+    ]
+
+    cache.init_bar_cache(12)
+    for batch in batches:
+        for symbol, bar in batch:
+            cache.push_bar(symbol, bar)
+    expected = (cache.get_all_symbols_snapshot(), cache.get_all_timeframe_snapshots("5m"))
+
+    cache.reset_bar_cache()
+    cache.init_bar_cache(12)
+    applied = [cache.push_bars(iter(batch)) for batch in batches]
+
+    assert applied == [len(batch) for batch in batches]
+    assert (cache.get_all_symbols_snapshot(), cache.get_all_timeframe_snapshots("5m")) == expected
+
+    # Under the symbol cap a batch still evicts down to it.
+    cache.init_bar_cache(12, max_symbols=4)
+    cache.push_bars([("NEW", _bar(rng, 1_031))])
+    assert cache.bar_symbol_count() == 4
+
+
+def test_ingest_buffer_is_bounded_and_drains_oldest_first() -> None:
+    buffer = IngestBuffer(maxsize=3)
+    for item in range(3):
+        buffer.put_nowait(item)
+
+    with pytest.raises(queue.Full):
+        buffer.put_nowait(3)
+    assert buffer.qsize() == 3
+    assert buffer.drain(0.0, 2) == [0, 1]
+    assert buffer.drain(0.0, 10) == [2]
+    assert buffer.empty() and buffer.drain(0.01, 10) == []
+
+
+def test_ingest_buffer_wakes_a_waiting_consumer() -> None:
+    buffer = IngestBuffer()
+    drained: list[list[Any]] = []
+    consumer = threading.Thread(target=lambda: drained.append(buffer.drain(5.0, 10)), daemon=True)
+    consumer.start()
+    threading.Event().wait(0.05)  # let the consumer park on the empty buffer
+    buffer.put_nowait("bar")
+    consumer.join(timeout=2.0)
+
+    assert not consumer.is_alive()
+    assert drained == [["bar"]]
+
+
+def test_feed_replays_a_dbn_burst_into_the_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    class CustomBar:
+        """Unknown bar class: classified by name, converted by the generic path."""
+
+        instrument_id = 1
+        open = high = low = close = 200_000_000_000
+        volume = 7
+        ts_event = 1_780_000_000 * 1_000_000_000 + _NS_PER_MINUTE
+
+    class Heartbeat:
+        pass
+
+    records: list[Any] = list(db.DBNStore.from_bytes(synthetic_burst_dbn(50)))
+    records[60:60] = [Heartbeat(), CustomBar()]
+    buffer = IngestBuffer(maxsize=100)
+    monkeypatch.setitem(feed._runtime, "ingest_queue", buffer)
+    monkeypatch.setattr(feed, "_record_kinds", dict(feed._record_kinds))
+    monkeypatch.setattr(feed, "_backpressure", dict.fromkeys(feed._backpressure, 0.0))
+    cache.init_bar_cache(5, max_symbols=100)
+    stop = threading.Event()
+
+    feed._consume_records(iter(records), stop)
+    stop.set()
+    feed._run_ingest_loop(stop)
+
+    assert feed._record_kinds[Heartbeat] == feed._RECORD_SKIP
+    assert feed._record_kinds[CustomBar] == feed._RECORD_BAR
+    assert cache.bar_symbol_count() == 50 and cache.total_bar_count() == 51
+    first = cache.get_bars_snapshot("S00000")
+    assert first[-1] == {"open": 200.0, "high": 200.0, "low": 200.0, "close": 200.0, "volume": 7.0,
+                         "ts_event": CustomBar.ts_event}
+    bar = cache.get_bars_snapshot("S00049")[0]
+    assert bar["high"] - bar["low"] == pytest.approx(1.0)
+    assert feed.backpressure_snapshot()["ingest_queue_depth_max"] == 51.0
+    assert buffer.empty()
@@ -0,0 +1,201 @@
+"""Incremental full compute cycle of the live overlay daemon: dirty tracking, memo, deadline."""
+from __future__ import annotations
+
+import concurrent.futures
+import random
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from services.live_overlay_daemon import cache, compute
+
+_NS_PER_MINUTE = 60_000_000_000
+_SLOW_CLOSE = 123.456
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cycle(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    news = {
+        "stories": [
+            {"tickers": ["S0", "s1", "S0"], "sentiment_score": 0.6},
+            {"tickers": "S1", "sentiment_score": "bad", "news_score": -0.9},
+            {"tickers": ["S2"], "news_score": float("nan")},
+            "not-a-story",
+        ]
+    }
+    monkeypatch.setattr(compute, "_load_news_snapshot", lambda: dict(news))
+    monkeypatch.setattr(compute.config, "max_stale_secs", lambda: 3600)
+    monkeypatch.setattr(cache, "_overlay", {})
+    monkeypatch.setattr(cache, "_overlay_computed_at", 0.0)
+    cache.reset_bar_cache()
+    compute._cycle_state.reset()
+    yield
+    compute._cycle_state.reset()
+    cache.reset_bar_cache()
+
+
+def _push(symbol: str, rng: random.Random, minute: int, *, close: float | None = None) -> None:
+    price = 100.0 + rng.uniform(-5.0, 5.0)
+    cache.push_bar(
+        symbol,
+        {
+            "open": price,
+            "high": price + 0.5,
+            "low": price - 0.5,
+            "close": price if close is None else close,
+            "volume": float(rng.randint(1, 5_000)),
+            "ts_event": minute * _NS_PER_MINUTE,
+        },
+    )
+
+
+def _fill(symbols: list[str], minutes: int = 30) -> random.Random:
+    rng = random.Random(5)
+    for minute in range(1_000, 1_000 + minutes):
+        for symbol in symbols:
+            _push(symbol, rng, minute)
+    return rng
+
+
+def test_cycle_payloads_match_build_payload() -> None:
+    symbols = [f"S{i}" for i in range(5)]
+    _fill(symbols)
+
+    assert compute.run_full_compute_cycle() == 5
+    global_fields = compute._get_global_news_fields()
+    expected = {
+        sym: compute.build_payload(sym, cache.get_timeframe_bars_snapshot(sym, "5m"), global_fields, 3600, preaggregated=True)
+        for sym in symbols
+    }
+    for sym in symbols:
+        payload = cache.get_overlay(sym)
+        assert payload is not None
+        payload["asof_ts"] = expected[sym]["asof_ts"]
+        # build_payload ran after set_overlay, so the overlay is fresh for it.
+        payload["stale"] = expected[sym]["stale"]
+        assert list(payload) == list(expected[sym])
+        assert payload == expected[sym]
+    assert cache.get_overlay("S0")["news_strength"] == 0.6
+    assert cache.get_overlay("S1")["news_bias"] == "BEARISH"
+    assert cache.get_overlay("S2")["news_bias"] is None
+
+
+def test_cycle_recomputes_only_dirty_symbols(monkeypatch: pytest.MonkeyPatch) -> None:
+    symbols = [f"S{i}" for i in range(40)]
+    rng = _fill(symbols)
+    computed: list[int] = []
+    technical_fields = compute._technical_fields
+
+    def _counting(bars: list[dict[str, Any]]) -> dict[str, Any]:
+        computed.append(len(bars))
+        return technical_fields(bars)
+
+    monkeypatch.setattr(compute, "_technical_fields", _counting)
+    assert compute.run_full_compute_cycle() == 40
+    assert len(computed) == 40
+
+    del computed[:]
+    assert compute.run_full_compute_cycle() == 40
+    assert computed == []
+
+    _push("S3", rng, 2_000)
+    _push("S7", rng, 2_000)
+    assert compute.run_full_compute_cycle() == 40
+    assert len(computed) == 2
+    assert cache.get_overlay("S3")["flow_delta_proxy_pct"] == technical_fields(
+        cache.get_timeframe_bars_snapshot("S3", "5m")
+    )["flow_delta_proxy_pct"]
+
+    # Evicted symbols leave both the overlay and the memo.
+    cache.init_bar_cache(60, max_symbols=39)
+    assert compute.run_full_compute_cycle() == 39
+    assert len(compute._cycle_state.technicals) == 39
+
+
+def test_deadline_miss_keeps_the_rest_and_retries_next_cycle(monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = _fill(["FAST", "OLD"])
+    technical_fields = compute._technical_fields
+    release = threading.Event()
+
+    def _slow_for_marked_bars(bars: list[dict[str, Any]]) -> dict[str, Any]:
+        if bars[-1]["close"] == _SLOW_CLOSE:
+            release.wait(5.0)
+        return technical_fields(bars)
+
+    monkeypatch.setattr(compute, "_technical_fields", _slow_for_marked_bars)
+    monkeypatch.setattr(compute, "_COMPUTE_CHUNK_SYMBOLS", 1)
+    monkeypatch.setattr(compute.config, "compute_workers", lambda: 3)
+    monkeypatch.setattr(compute.config, "compute_deadline_secs", lambda: 0.2)
+    assert compute.run_full_compute_cycle() == 2
+    before = cache.get_overlay("OLD")
+
+    # New SLOW has no payload to fall back on; OLD keeps its previous one.
+    _push("FAST", rng, 2_000)
+    _push("OLD", rng, 2_000, close=_SLOW_CLOSE)
+    _push("SLOW", rng, 2_000, close=_SLOW_CLOSE)
+    try:
+        assert compute.run_full_compute_cycle() == 2
+        assert cache.get_overlay("SLOW") is None
+        assert cache.get_overlay("FAST")["flow_delta_proxy_pct"] == technical_fields(
+            cache.get_timeframe_bars_snapshot("FAST", "5m")
+        )["flow_delta_proxy_pct"]
+        kept = cache.get_overlay("OLD")
+        assert [kept[key] for key in technical_fields([])] == [before[key] for key in technical_fields([])]
+    finally:
+        release.set()
+    concurrent.futures.wait(compute._cycle_state.running)
+
+    # The missed symbols stayed dirty, so the next cycle recomputes them.
+    assert compute.run_full_compute_cycle() == 3
+    assert cache.get_overlay("SLOW") is not None
+    assert cache.get_overlay("OLD")["flow_delta_proxy_pct"] == technical_fields(
+        cache.get_timeframe_bars_snapshot("OLD", "5m")
+    )["flow_delta_proxy_pct"]
+
+
+def test_running_chunk_is_not_resubmitted_until_it_returns(monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = _fill(["FAST", "SLOW"])
+    technical_fields = compute._technical_fields
+    release = threading.Event()
+    slow_calls: list[int] = []
+    counters: list[tuple[str, float]] = []
+
+    def _slow_for_marked_bars(bars: list[dict[str, Any]]) -> dict[str, Any]:
+        if bars[-1]["close"] == _SLOW_CLOSE:
+            slow_calls.append(len(bars))
+            release.wait(5.0)
+        return technical_fields(bars)
+
+    monkeypatch.setattr(compute, "_technical_fields", _slow_for_marked_bars)
+    monkeypatch.setattr(compute, "_COMPUTE_CHUNK_SYMBOLS", 1)
+    monkeypatch.setattr(compute.config, "compute_workers", lambda: 2)
+    monkeypatch.setattr(compute.config, "compute_deadline_secs", lambda: 0.2)
+    monkeypatch.setattr(
+        compute.observability, "metric_counter", lambda name, value=1.0, **_: counters.append((name, value))
+    )
+    assert compute.run_full_compute_cycle() == 2
+
+    _push("SLOW", rng, 2_000, close=_SLOW_CLOSE)
+    try:
+        compute.run_full_compute_cycle()
+        stuck = [future for future, symbols in compute._cycle_state.running.items() if symbols == {"SLOW"}]
+        assert len(stuck) == 1
+        assert ("live_overlay.full_compute_cycle.stuck_chunks", 1) in counters
+
+        # SLOW is still dirty but its chunk still holds a worker: no second submit.
+        _push("FAST", rng, 2_000)
+        compute.run_full_compute_cycle()
+        assert len(slow_calls) == 1
+        assert cache.get_overlay("FAST")["flow_delta_proxy_pct"] == technical_fields(
+            cache.get_timeframe_bars_snapshot("FAST", "5m")
+        )["flow_delta_proxy_pct"]
+        assert [name for name, _ in counters].count("live_overlay.full_compute_cycle.stuck_chunks") == 1
+    finally:
+        release.set()
+    concurrent.futures.wait(stuck)
+
+    compute.run_full_compute_cycle()
+    assert len(slow_calls) == 2
+    assert not compute._cycle_state.running
@@ -0,0 +1,165 @@
+"""Golden-file regression test for ``services.live_overlay_daemon.metrics.render_metrics``.
+
+Every input of the renderer is stubbed to a fixed value, so the exposition
+is byte-for-byte deterministic in both formats. The expected bodies live in
+``tests/fixtures/live_overlay_metrics_golden.prom`` (Prometheus text 0.0.4)
+and ``tests/fixtures/live_overlay_metrics_golden.openmetrics`` (OpenMetrics
+1.0). A diff in either file IS the contract change: review it, then accept
+it by re-running with ``REGEN_LIVE_OVERLAY_METRICS_GOLDEN=1``:
+
+    REGEN_LIVE_OVERLAY_METRICS_GOLDEN=1 .venv/bin/python -m pytest \\
+        tests/test_live_overlay_metrics_golden.py -p no:cacheprovider
+
+The counter section is rendered through cached per-counter fragments, so the
+tests also pin that incremental renders after updates, additions and
+removals match a from-scratch render.
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from services.live_overlay_daemon import (
+    cache,
+    compute,
+    config,
+    feed,
+    github_workflow_bridge,
+    metric_registry,
+    metrics,
+    observability,
+    railway_metrics,
+    request_hotspots,
+    uptimerobot_bridge,
+)
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+GOLDEN_PATHS = {
+    False: FIXTURE_DIR / "live_overlay_metrics_golden.prom",
+    True: FIXTURE_DIR / "live_overlay_metrics_golden.openmetrics",
+}
+
+_COUNTERS: dict[str, float] = {
+    "live_overlay.smc_live_requests.total": 12.0,
+    "live_overlay.smc_live_success.total": 10.0,
+    "live_overlay.smc_live_auth.denied": 1.0,
+    "live_overlay.full_compute_cycle.errors": 0.0,
+    "live_overlay.full_compute_cycle.recomputed_symbols": 2500.0,
+    "Live-Overlay.odd name!": 3.0,
+    "live_overlay.smc_live_latency.count": 4.0,
+    "live_overlay.smc_live_latency.sum_ms": 61.5,
+    "live_overlay.smc_live_latency.bucket_le_10": 1.0,
+    "live_overlay.smc_live_latency.bucket_le_25": 3.0,
+    "live_overlay.smc_live_latency.bucket_le_inf": 4.0,
+}
+
+
+@pytest.fixture(autouse=True)
+def _deterministic_inputs(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(observability, "_counters", dict(_COUNTERS))
+    monkeypatch.setattr(metrics, "_counter_families", metric_registry.FragmentRegistry(metrics._counter_fragments))
+    monkeypatch.setattr(
+        request_hotspots,
+        "snapshot",
+        lambda top_n: {"symbol_count": 2, "tf_count": 1, "top_symbols": [("NVDA", 7)], "top_tfs": [("5m", 7)]},
+    )
+    monkeypatch.setattr(feed, "metrics_snapshot", lambda: {"reconnect_attempts": 2, "bento_errors": 0})
+    monkeypatch.setattr(
+        feed,
+        "backpressure_snapshot",
+        lambda: {"ingest_queue_depth": 1.0, "ingest_queue_dropped_total": 0.0, "ingest_queue_lag_ms_last": 2.5},
+    )
+    monkeypatch.setattr(feed, "last_bar_age_secs", lambda: 4.0)
+    monkeypatch.setattr(feed, "is_ready", lambda: True)
+    monkeypatch.setattr(feed, "worker_liveness", lambda: {"live_feed": True, "overlay_refresh": True})
+    monkeypatch.setattr(cache, "overlay_symbol_count", lambda: 3)
+    monkeypatch.setattr(cache, "bar_symbol_count", lambda: 3)
+    monkeypatch.setattr(cache, "total_bar_count", lambda: 90)
+    monkeypatch.setattr(cache, "overlay_age_secs", lambda: 30.0)
+    monkeypatch.setattr(config, "max_stale_secs", lambda: 300)
+    monkeypatch.setattr(config, "expect_market_traffic", lambda: False)
+    monkeypatch.setattr(config, "signals_max_age_secs", lambda: 480)
+    monkeypatch.setattr(metrics, "is_us_regular_session_open", lambda: True)
+    monkeypatch.setattr(metrics, "is_europe_regular_session_open", lambda: False)
+    monkeypatch.setattr(metrics, "is_asia_regular_session_open", lambda: False)
+    monkeypatch.setattr(compute, "_load_news_snapshot", lambda: {})
+    monkeypatch.setattr(compute, "_load_signals_snapshot", lambda: {})
+    monkeypatch.setattr(compute, "_load_tradingview_credential_snapshot", lambda: {})
+    monkeypatch.setattr(compute, "_load_credential_health_snapshot", lambda: {})
+    monkeypatch.setattr(compute, "_load_experiment_snapshot", lambda: {})
+    monkeypatch.setattr(compute, "_load_experiment_history", lambda: [])
+    monkeypatch.setattr(uptimerobot_bridge, "snapshot", lambda: {"enabled": False, "configured": False})
+    monkeypatch.setattr(github_workflow_bridge, "snapshot", lambda: {"enabled": False, "configured": False})
+    monkeypatch.setattr(railway_metrics, "snapshot", railway_metrics._disabled_snapshot)
+    monkeypatch.setattr(
+        metrics,
+        "_collect_process_metrics",
+        lambda _startup_ts: [
+            "# TYPE live_overlay_process_cpu_seconds_total counter",
+            "live_overlay_process_cpu_seconds_total 1.500000",
+        ],
+    )
+
+
+def _render(*, openmetrics: bool) -> str:
+    # startup_ts=0 pins uptime to 0.
+    return metrics.render_metrics(0.0, openmetrics=openmetrics)
+
+
+@pytest.mark.parametrize("openmetrics", [False, True], ids=["prometheus", "openmetrics"])
+def test_render_metrics_matches_golden(openmetrics: bool) -> None:
+    actual = _render(openmetrics=openmetrics)
+    golden = GOLDEN_PATHS[openmetrics]
+
+    if os.environ.get("REGEN_LIVE_OVERLAY_METRICS_GOLDEN") == "1":
+        golden.write_text(actual, encoding="utf-8")
+        pytest.skip("Regenerated golden; rerun without REGEN_LIVE_OVERLAY_METRICS_GOLDEN to assert.")
+
+    assert actual == golden.read_text(encoding="utf-8"), (
+        f"render_metrics output drifted from {golden.name}. If intentional, re-run with "
+        "REGEN_LIVE_OVERLAY_METRICS_GOLDEN=1 and commit the golden diff."
+    )
+    # Cached fragments render the same body on the next scrape.
+    assert _render(openmetrics=openmetrics) == actual
+
+
+@pytest.mark.parametrize("openmetrics", [False, True], ids=["prometheus", "openmetrics"])
+def test_incremental_render_matches_fresh_render(openmetrics: bool) -> None:
+    _render(openmetrics=openmetrics)
+    observability.metric_counter("live_overlay.smc_live_requests.total")
+    observability.metric_counter("live_overlay.brand_new_counter.total", 2.0)
+    with observability._counter_lock:
+        observability._counters.pop("live_overlay.smc_live_auth.denied")
+        observability._counters["live_overlay.smc_live_success.total"] = float("nan")
+    incremental = _render(openmetrics=openmetrics)
+
+    metrics._counter_families.reset()
+    assert incremental == _render(openmetrics=openmetrics)
+    assert "live_overlay_smc_live_requests_total 13.0\n" in incremental
+    assert "live_overlay_brand_new_counter_total 2.0\n" in incremental
+    assert "live_overlay_smc_live_success_total nan\n" in incremental
+    # Seeded traffic counters survive removal from the counter dict.
+    assert "live_overlay_smc_live_auth_denied 0.0\n" in incremental
+
+
+def test_registry_rerenders_only_changed_families() -> None:
+    rendered: list[str] = []
+
+    def _fragments(name: str, value: object) -> tuple[str, str]:
+        rendered.append(name)
+        return f"{name} {value}\n", f"{name} {value} om\n"
+
+    registry = metric_registry.FragmentRegistry(_fragments)
+    assert registry.render({"b": 1.0, "a": 2.0}) == "a 2.0\nb 1.0\n"
+    assert registry.render({"b": 1.0, "a": 2.0}, openmetrics=True) == "a 2.0 om\nb 1.0 om\n"
+    assert sorted(rendered) == ["a", "b"]
+
+    rendered.clear()
+    assert registry.render({"b": 5.0, "a": 2.0, "c": 0.0}) == "a 2.0\nb 5.0\nc 0.0\n"
+    assert sorted(rendered) == ["b", "c"]
+    rendered.clear()
+    assert registry.render({"c": 0.0}) == "c 0.0\n"
+    assert rendered == []
+    assert registry.family_count() == 1
@@ -0,0 +1,182 @@
+"""Pre-encoded /smc_live payload cache: versioned entries, ETag / 304, gzip negotiation."""
+from __future__ import annotations
+
+import gzip
+import json
+import random
+import time
+from collections.abc import Iterator
+
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from services.live_overlay_daemon import cache, compute, main, payload_cache
+
+_TOKEN = "tok"
+_NS_PER_MINUTE = 60_000_000_000
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setattr(main.config, "overlay_secret_token", lambda: _TOKEN)
+    monkeypatch.setattr(compute.config, "max_stale_secs", lambda: 3600)
+    monkeypatch.setattr(compute, "_load_news_snapshot", lambda: {"stories": [{"tickers": ["S0"], "news_score": 0.7}]})
+    monkeypatch.setattr(cache, "_overlay", {})
+    monkeypatch.setattr(cache, "_overlay_versions", {})
+    monkeypatch.setattr(cache, "_overlay_computed_at", 0.0)
+    cache.reset_bar_cache()
+    compute._cycle_state.reset()
+    payload_cache.reset()
+    yield
+    payload_cache.reset()
+    compute._cycle_state.reset()
+    cache.reset_bar_cache()
+
+
+def _push(symbol: str, rng: random.Random, minute: int) -> None:
+    price = 100.0 + rng.uniform(-5.0, 5.0)
+    cache.push_bar(
+        symbol,
+        {
+            "open": price,
+            "high": price + 0.5,
+            "low": price - 0.5,
+            "close": price,
+            "volume": float(rng.randint(1, 5_000)),
+            "ts_event": minute * _NS_PER_MINUTE,
+        },
+    )
+
+
+def _fill(symbols: list[str], minutes: int = 30) -> tuple[random.Random, int]:
+    rng = random.Random(3)
+    # Bars end now, so the non-5m payloads are fresh.
+    last = int(time.time() // 60)
+    for minute in range(last - minutes + 1, last + 1):
+        for symbol in symbols:
+            _push(symbol, rng, minute)
+    compute.run_full_compute_cycle()
+    return rng, last
+
+
+@pytest.mark.parametrize("tf", ["5m", "15m", "4H"])
+def test_encoded_body_matches_json_response_rendering(tf: str) -> None:
+    _fill(["S0"])
+
+    entry, hit = payload_cache.get_encoded("S0", tf)
+
+    assert entry is not None and hit is False
+    payload = payload_cache.payload_for_timeframe("S0", tf)
+    assert payload is not None
+    assert entry.body == JSONResponse(payload).body
+    assert json.loads(entry.body)["tf"] == tf
+    assert entry.stale is False
+
+
+def test_hit_serves_same_entry_until_an_input_version_moves(monkeypatch: pytest.MonkeyPatch) -> None:
+    rng, last = _fill(["S0", "S1"])
+    built: list[tuple[str, str]] = []
+    build = payload_cache._build
+
+    def _counting(sym: str, tf: str) -> payload_cache.EncodedPayload | None:
+        built.append((sym, tf))
+        return build(sym, tf)
+
+    monkeypatch.setattr(payload_cache, "_build", _counting)
+    first_5m, _ = payload_cache.get_encoded("S0", "5m")
+    first_15m, _ = payload_cache.get_encoded("S0", "15m")
+    assert payload_cache.get_encoded("S0", "5m") == (first_5m, True)
+    assert payload_cache.get_encoded("S0", "15m") == (first_15m, True)
+    assert built == [("S0", "5m"), ("S0", "15m")]
+
+    # A new bar moves the 15m input at once; 5m follows the next cycle.
+    _push("S0", rng, last + 1)
+    assert payload_cache.get_encoded("S0", "5m") == (first_5m, True)
+    rebuilt_15m, hit = payload_cache.get_encoded("S0", "15m")
+    assert hit is False and rebuilt_15m.version != first_15m.version
+
+    compute.run_full_compute_cycle()
+    rebuilt_5m, hit = payload_cache.get_encoded("S0", "5m")
+    assert hit is False and rebuilt_5m.version != first_5m.version
+
+    # A flow patch of another symbol leaves S0's entry valid.
+    cache.patch_overlay("S1", {"flow_rel_vol": 2.0})
+    assert payload_cache.get_encoded("S0", "5m") == (rebuilt_5m, True)
+
+
+def test_stale_flip_rebuilds_the_entry(monkeypatch: pytest.MonkeyPatch) -> None:
+    _fill(["S0"])
+    fresh, _ = payload_cache.get_encoded("S0", "5m")
+    assert fresh is not None and fresh.stale is False
+
+    monkeypatch.setattr(cache, "overlay_age_secs", lambda: 7200.0)
+    stale, hit = payload_cache.get_encoded("S0", "5m")
+
+    assert hit is False
+    assert stale.stale is True and json.loads(stale.body)["stale"] is True
+    assert stale.etag != fresh.etag
+
+
+def test_refresh_fills_overlay_symbols_and_drops_evicted_ones() -> None:
+    _fill(["S0", "S1", "S2"])
+    payload_cache.get_encoded("S2", "30m")
+
+    assert payload_cache.refresh() == 4
+    assert payload_cache.get_encoded("S1", "5m")[1] is True
+    assert payload_cache.get_encoded("S2", "30m")[1] is True
+
+    cache.init_bar_cache(60, max_symbols=2)  # evicts S0, the oldest
+    compute.run_full_compute_cycle()
+    assert payload_cache.refresh() == 3  # S1 and S2 at 5m, S2 at 30m
+    assert payload_cache.get_encoded("S0", "5m") == (None, False)
+
+
+def test_etag_revalidation_and_gzip_negotiation(monkeypatch: pytest.MonkeyPatch) -> None:
+    _fill(["S0"])
+    monkeypatch.setattr(payload_cache.config, "payload_gzip_min_bytes", lambda: 0)
+    client = TestClient(main.app)
+    url = f"/{_TOKEN}/smc_live?symbol=s0&tf=15m"
+
+    plain = client.get(url, headers={"Accept-Encoding": "identity"})
+    assert plain.status_code == 200
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["content-type"] == "application/json"
+    assert plain.headers["vary"] == "Accept-Encoding"
+    etag = plain.headers["etag"]
+    assert etag.startswith('W/"')
+
+    zipped = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert zipped.headers["content-encoding"] == "gzip"
+    assert zipped.headers["etag"] == etag
+    assert zipped.content == plain.content  # httpx decodes the gzip body
+
+    not_modified = client.get(url, headers={"If-None-Match": f'"other", {etag.removeprefix("W/")}'})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+    assert client.get(url, headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip", True),
+        ("br, GZIP;q=0.5", True),
+        ("*", True),
+        ("gzip;q=0", False),
+        ("gzip;q=bogus", False),
+        ("identity, br", False),
+    ],
+)
+def test_accepts_gzip(accept_encoding: str, expected: bool) -> None:
+    assert payload_cache.accepts_gzip(accept_encoding) is expected
+
+
+def test_small_bodies_are_not_gzipped(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(payload_cache.config, "payload_gzip_min_bytes", lambda: 10_000)
+    assert payload_cache.encode({"stale": False}).gzip_body is None
+    monkeypatch.setattr(payload_cache.config, "payload_gzip_min_bytes", lambda: 0)
+    entry = payload_cache.encode({"stale": False})
+    assert entry.gzip_body is not None and gzip.decompress(entry.gzip_body) == entry.body
@@ -0,0 +1,106 @@
+"""Equivalence tests for the incremental multi-timeframe bar aggregator.
+
+``RollingBarAggregator`` must return exactly what the from-scratch
+``compute._bars_for_timeframe`` returns for the current deque contents after
+every push, including out-of-order arrivals, malformed bars and eviction.
+"""
+from __future__ import annotations
+
+import random
+from collections import deque
+from typing import Any
+
+import pytest
+
+from services.live_overlay_daemon import cache, compute
+from services.live_overlay_daemon.bar_aggregation import _TF_TO_MINUTES, RollingBarAggregator
+
+_NS_PER_MINUTE = 60_000_000_000
+
+
+def _random_bar(rng: random.Random, minute: int) -> dict[str, Any]:
+    price = 100.0 + rng.uniform(-5.0, 5.0)
+    bar: dict[str, Any] = {
+        "open": price,
+        "high": price + rng.uniform(0.0, 1.0),
+        "low": price - rng.uniform(0.0, 1.0),
+        "close": price + rng.uniform(-0.5, 0.5),
+        "volume": float(rng.randint(0, 500)),
+        "ts_event": minute * _NS_PER_MINUTE + rng.choice([0, 0, 0, 1_000]),
+    }
+    roll = rng.random()
+    if roll < 0.05:
+        bar["ts_event"] = rng.choice([None, 0, -5, "bad", True])
+    elif roll < 0.10:
+        bar[rng.choice(["open", "high", "low", "close", "volume"])] = rng.choice([None, float("nan"), "x", -1.0])
+    return bar
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_rolling_aggregator_matches_from_scratch_aggregation(seed: int) -> None:
+    rng = random.Random(seed)
+    dq: deque[dict[str, Any]] = deque(maxlen=37)
+    aggregator = RollingBarAggregator(dq)
+    minute = 1_000_000
+    for _ in range(600):
+        # Mostly forward, with occasional late or duplicate-minute arrivals.
+        minute += rng.choice([1, 1, 1, 1, 2, 0, -3, -11])
+        bar = _random_bar(rng, minute)
+        evicted = dq[0] if len(dq) == dq.maxlen else None
+        dq.append(bar)
+        aggregator.push(bar, evicted)
+        tf = rng.choice(list(_TF_TO_MINUTES))
+        assert aggregator.timeframe_bars(tf) == compute._bars_for_timeframe(list(dq), tf)
+
+    for tf in _TF_TO_MINUTES:
+        assert aggregator.timeframe_bars(tf) == compute._bars_for_timeframe(list(dq), tf)
+
+
+def test_rolling_aggregator_keeps_raw_fallback_without_timestamps() -> None:
+    dq: deque[dict[str, Any]] = deque(maxlen=5)
+    aggregator = RollingBarAggregator(dq)
+    bar = {"open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 10.0}
+    dq.append(bar)
+    aggregator.push(bar)
+
+    assert aggregator.timeframe_bars("5m") == [bar]
+    assert aggregator.latest_ts_event() is None
+    with pytest.raises(ValueError, match="unsupported timeframe"):
+        aggregator.aggregated("1D")
+
+
+def test_rolling_aggregator_returns_copies() -> None:
+    dq: deque[dict[str, Any]] = deque(maxlen=10)
+    aggregator = RollingBarAggregator(dq)
+    for i in range(1, 6):
+        bar = {"open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 1.0, "ts_event": i * _NS_PER_MINUTE}
+        dq.append(bar)
+        aggregator.push(bar)
+
+    first = aggregator.timeframe_bars("5m")
+    first[0]["close"] = -1.0
+    assert aggregator.timeframe_bars("5m")[0]["close"] == 1.5
+    assert aggregator.latest_ts_event() == 5 * _NS_PER_MINUTE
+
+
+def test_cache_timeframe_snapshots_follow_push_bar_and_reinit() -> None:
+    cache.init_bar_cache(8)
+    try:
+        for i in range(1, 21):
+            cache.push_bar("AAPL", {
+                "open": float(i), "high": i + 1.0, "low": i - 1.0, "close": float(i),
+                "volume": 10.0, "ts_event": i * _NS_PER_MINUTE,
+            })
+        raw = cache.get_bars_snapshot("AAPL")
+        assert cache.get_timeframe_bars_snapshot("AAPL", "5m") == compute._bars_for_timeframe(raw, "5m")
+        assert cache.get_all_timeframe_snapshots("15m") == {"AAPL": compute._bars_for_timeframe(raw, "15m")}
+        assert cache.latest_bar_ts_event("AAPL") == 20 * _NS_PER_MINUTE
+        assert cache.get_timeframe_bars_snapshot("MSFT", "5m") is None
+
+        # Shrinking the window replaces the deques; the aggregator must follow.
+        cache.init_bar_cache(3)
+        raw = cache.get_bars_snapshot("AAPL")
+        assert len(raw) == 3
+        assert cache.get_timeframe_bars_snapshot("AAPL", "5m") == compute._bars_for_timeframe(raw, "5m")
+    finally:
+        cache.reset_bar_cache()
@@ -2497,6 +2497,8 @@ class TestSeenTsNotInExport(unittest.TestCase):
         store.get_kv.return_value = "0"
         store.mark_seen.return_value = True
         store.cluster_touch.return_value = (1, 1700000000.0)
+        store.mark_seen_many.side_effect = lambda rows: [True] * len(rows)
+        store.cluster_touch_many.side_effect = lambda touches: [(1, 1700000000.0)] * len(touches)
         mock_store.return_value = store
         mock_enr.return_value = MagicMock()
 
@@ -2896,6 +2898,8 @@ class TestPollOnceReturnsCopies(unittest.TestCase):
         store.get_kv.return_value = "0"
         store.mark_seen.return_value = True
         store.cluster_touch.return_value = (1, 1700000000.0)
+        store.mark_seen_many.side_effect = lambda rows: [True] * len(rows)
+        store.cluster_touch_many.side_effect = lambda touches: [(1, 1700000000.0)] * len(touches)
         mock_store.return_value = store
         mock_enr.return_value = MagicMock()
 
@@ -2957,6 +2961,8 @@ class TestPollOnceReturnsCopies(unittest.TestCase):
         store.get_kv.return_value = "0"
         store.mark_seen.return_value = True
         store.cluster_touch.return_value = (1, 1700000000.0)
+        store.mark_seen_many.side_effect = lambda rows: [True] * len(rows)
+        store.cluster_touch_many.side_effect = lambda touches: [(1, 1700000000.0)] * len(touches)
         mock_store.return_value = store
         mock_enr.return_value = MagicMock()
 
@@ -3050,6 +3056,8 @@ class TestExportCandidatesDeepCopy(unittest.TestCase):
         store.get_kv.return_value = "0"
         store.mark_seen.return_value = True
         store.cluster_touch.return_value = (1, 1700000000.0)
+        store.mark_seen_many.side_effect = lambda rows: [True] * len(rows)
+        store.cluster_touch_many.side_effect = lambda touches: [(1, 1700000000.0)] * len(touches)
         mock_store.return_value = store
         mock_enr.return_value = MagicMock()
 
@@ -3126,6 +3134,8 @@ class TestExportCandidatesDeepCopy(unittest.TestCase):
         store.get_kv.return_value = "0"
         store.mark_seen.return_value = True
         store.cluster_touch.return_value = (1, 1700000000.0)
+        store.mark_seen_many.side_effect = lambda rows: [True] * len(rows)
+        store.cluster_touch_many.side_effect = lambda touches: [(1, 1700000000.0)] * len(touches)
         mock_store.return_value = store
         mock_enr.return_value = MagicMock()
 
@@ -3308,7 +3318,13 @@ class TestProcessNewsItemsPerItemIsolation(unittest.TestCase):
                 raise RuntimeError("simulated DB outage on this item")
             return real_mark_seen(provider, item_id, ts)
 
+        def failing_mark_seen_many(rows):
+            raise RuntimeError("simulated DB outage for the whole batch")
+
+        # The bulk dedup fails too, so the pipeline falls back to per-item
+        # ``mark_seen`` and only the bad item is lost.
         store.mark_seen = flaky_mark_seen  # type: ignore[assignment]
+        store.mark_seen_many = failing_mark_seen_many  # type: ignore[assignment]
 
         try:
             max_ts, _ = process_news_items(
@@ -0,0 +1,140 @@
+"""Tests for the batched dedup / novelty APIs of ``newsstack_fmp.store_sqlite``.
+
+``mark_seen_many`` / ``cluster_touch_many`` must report exactly what the
+same sequence of per-item ``mark_seen`` / ``cluster_touch`` calls reports,
+and ``process_news_items`` must issue one write transaction per batch.
+"""
+
+from __future__ import annotations
+
+import random
+import sqlite3
+
+import pytest
+
+from newsstack_fmp.common_types import NewsItem
+from newsstack_fmp.enrich import Enricher
+from newsstack_fmp.pipeline import process_news_items
+from newsstack_fmp.store_sqlite import SqliteStore
+from scripts.benchmark_newsstack_store_bulk import build_synthetic_items, run_benchmark
+
+
+@pytest.fixture()
+def stores():
+    per_item, bulk = SqliteStore(":memory:"), SqliteStore(":memory:")
+    yield per_item, bulk
+    per_item.close()
+    bulk.close()
+
+
+def test_empty_batches_are_noops(stores) -> None:
+    _, bulk = stores
+    assert bulk.mark_seen_many([]) == []
+    assert bulk.cluster_touch_many([]) == []
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_bulk_calls_match_sequential_calls(stores, seed: int) -> None:
+    per_item, bulk = stores
+    rng = random.Random(seed)
+    # 450 rows per batch spans several 200-row statement chunks.
+    rows = build_synthetic_items(1_800, dup_ratio=0.3, seed=seed)
+    for start in range(0, len(rows), 450):
+        batch = rows[start:start + 450]
+        rng.shuffle(batch)
+        seen_rows = [(provider, item_id, ts) for provider, item_id, ts, _ in batch]
+        touches = [(chash, ts) for _, _, ts, chash in batch]
+
+        assert bulk.mark_seen_many(seen_rows) == [per_item.mark_seen(*row) for row in seen_rows]
+        assert bulk.cluster_touch_many(touches) == [per_item.cluster_touch(*touch) for touch in touches]
+
+    dump = "SELECT * FROM {} ORDER BY 1, 2"
+    for table in ("seen", "clusters"):
+        assert bulk.conn.execute(dump.format(table)).fetchall() == per_item.conn.execute(dump.format(table)).fetchall()
+
+
+def test_failed_batch_rolls_back(stores) -> None:
+    _, bulk = stores
+    bulk.mark_seen("p", "old", 1.0)
+    # An unbindable value fails the INSERT after BEGIN IMMEDIATE.
+    with pytest.raises(sqlite3.Error):
+        bulk.mark_seen_many([("p", "new", 2.0), ("p", "bad", object())])  # type: ignore[list-item]
+    assert bulk.mark_seen_many([("p", "new", 3.0), ("p", "old", 3.0)]) == [True, False]
+    assert not bulk.conn.in_transaction
+
+
+class _LockedOnce:
+    """Connection proxy whose first ``BEGIN IMMEDIATE`` fails with "database is locked"."""
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+        self.locked = True
+
+    def execute(self, sql: str, *args):
+        if sql == "BEGIN IMMEDIATE" and self.locked:
+            self.locked = False
+            raise sqlite3.OperationalError("database is locked")
+        return self._conn.execute(sql, *args)
+
+    def __getattr__(self, name: str):
+        return getattr(self._conn, name)
+
+
+def test_retry_after_lock_keeps_generator_input(stores, monkeypatch: pytest.MonkeyPatch) -> None:
+    _, bulk = stores
+    monkeypatch.setattr("newsstack_fmp.store_sqlite._BASE_BACKOFF_S", 0.0)
+
+    monkeypatch.setattr(bulk, "conn", _LockedOnce(bulk.conn))
+    assert bulk.mark_seen_many(("p", f"id{i}", 1.0) for i in range(3)) == [True, True, True]
+    monkeypatch.setattr(bulk, "conn", _LockedOnce(bulk.conn._conn))
+    assert bulk.cluster_touch_many(("h", float(ts)) for ts in (1, 2)) == [(1, 1.0), (2, 1.0)]
+
+    assert bulk.conn.execute("SELECT COUNT(*) FROM seen").fetchone() == (3,)
+
+
+def _item(item_id: str, ts: float, headline: str, tickers: list[str]) -> NewsItem:
+    return NewsItem(
+        provider="fmp_stock_latest",
+        item_id=item_id,
+        published_ts=ts,
+        updated_ts=ts,
+        headline=headline,
+        snippet="",
+        tickers=tickers,
+        url=f"https://example.com/{item_id}",
+        source="Test",
+    )
+
+
+def test_process_news_items_uses_one_transaction_per_write_phase() -> None:
+    store = SqliteStore(":memory:")
+    statements: list[str] = []
+    store.conn.set_trace_callback(statements.append)
+    items = [
+        _item("a", 100.0, "AAPL beats Q1 earnings", ["AAPL"]),
+        _item("b", 101.0, "AAPL beats Q1 earnings", ["AAPL"]),
+        _item("a", 100.0, "AAPL beats Q1 earnings", ["AAPL"]),
+        _item("c", 102.0, "MSFT raises guidance", ["msft", "MSFT"]),
+    ]
+    best: dict = {}
+    enricher = Enricher()
+    try:
+        max_ts, _ = process_news_items(store, items, best, None, enricher, 99.0)
+        cluster_counts = sorted(row[0] for row in store.conn.execute("SELECT count FROM clusters"))
+    finally:
+        enricher.close()
+        store.close()
+
+    assert max_ts == 102.0
+    assert sum(stmt == "BEGIN IMMEDIATE" for stmt in statements) == 2
+    assert cluster_counts == [1, 2]
+    # The repeat of "a" was deduped; "b" is the second touch of its cluster.
+    assert best["AAPL"]["news_url"] == "https://example.com/a"
+    assert best["MSFT"]["novelty_cluster_count"] == 1
+
+
+def test_benchmark_smoke() -> None:
+    report = run_benchmark(300, batch_size=64, repeat=1)
+    assert report["items"] == 300
+    assert report["results_match"] is True
+    assert set(report["timings_s"]) == {"per_item", "batched"}
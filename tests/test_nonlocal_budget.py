@@ -99,10 +99,17 @@ _FROZEN_SITES: frozenset[tuple[str, int, tuple[str, ...]]] = frozenset(
         # semantic change to the progress closure itself.
         # 2026-06-10 (#2670 W9): timestamp_substitutions disclosure shifted
         # the four sites +27 (5368-5371 -> 5395-5398).
-        ("databento_volatility_screener.py", 5398, ("_fast_progress_pct",)),
-        ("databento_volatility_screener.py", 5399, ("_fast_progress_step",)),
-        ("databento_volatility_screener.py", 5400, ("_fast_progress_total",)),
-        ("databento_volatility_screener.py", 5401, ("_fast_eta_smooth_seconds",)),
+        # _IntradayStateReducer (columnar chunk reducer) shifted them +281
+        # (5398-5401 -> 5679-5682). The content-addressed daily-bar cache
+        # branch in load_daily_bars shifted them +72 (-> 5751-5754).
+        # The second-detail partition store shifted them +190 (-> 6722-6725).
+        # The offline cost planner shifted them +113 (-> 6835-6838).
+        # Negative daily-bar cache entries shifted them +12 (-> 6853-6856).
+        # Per-session input digests in the feature state shifted them +74 (-> 6927-6930).
+        ("databento_volatility_screener.py", 6927, ("_fast_progress_pct",)),
+        ("databento_volatility_screener.py", 6928, ("_fast_progress_step",)),
+        ("databento_volatility_screener.py", 6929, ("_fast_progress_total",)),
+        ("databento_volatility_screener.py", 6930, ("_fast_eta_smooth_seconds",)),
         ("smc_core/ensemble_quality.py", 188, ("active_weight", "weighted_total")),
         # 2026-06-25: worker-thread target for interruptible AsyncNewsstackPoller
         # poll loop uses nonlocal to ferry result/error back to the caller.
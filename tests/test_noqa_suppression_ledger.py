@@ -196,6 +196,14 @@ _FROZEN_SITES: dict[str, int] = {
     # calls go through one ``_git`` wrapper (git resolved via shutil.which,
     # fixed argv, no shell), which carries a single ``# noqa: S603``.
     "scripts/publish_signals_snapshot.py": 1,
+    # Local shard runner for the sharded production export: every shard
+    # attempt goes through one ``_run_command`` wrapper (argv list from
+    # ``producer_command`` or the caller's factory, no shell), which carries
+    # a single ``# noqa: S603``.
+    "scripts/databento_run_shards.py": 1,
+    # Startup import profiler: one ``-X importtime`` child per entry module
+    # (fixed argv around the module name, no shell), one ``# noqa: S603``.
+    "scripts/profile_startup_imports.py": 1,
     # 2026-05-12 PR #2157: Databento entitlement probe wraps each
     # provider request in a generic ``except Exception`` so it can
     # surface the original error message in the probe report. BLE001
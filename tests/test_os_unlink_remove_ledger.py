@@ -89,7 +89,7 @@ def _os_delete_sites() -> set[tuple[str, int, str]]:
 # so a stale handle never crashes the caller.
 OS_DELETE_LEDGER: set[tuple[str, int, str]] = {
     ("newsstack_fmp/open_prep_export.py", 35, "unlink"),
-    ("newsstack_fmp/store_sqlite.py", 143, "remove"),
+    ("newsstack_fmp/store_sqlite.py", 162, "remove"),
     # 2026-07-01: alerts payload/url hardening inserted helper functions;
     # cleanup unlink site shifted 79 -> 80.
     # 2026-07-02: SSRF path/query hardening shifted unlink 80 -> 81.
@@ -163,8 +163,8 @@ OS_DELETE_LEDGER: set[tuple[str, int, str]] = {
     ("smc_core/scoring.py", 1220, "unlink"),
     ("smc_integration/batch.py", 35, "unlink"),
     ("smc_integration/provider_health.py", 69, "unlink"),
-    ("smc_integration/structure_batch.py", 39, "unlink"),
-    ("streamlit_terminal.py", 2264, "unlink"),
+    ("smc_integration/structure_batch.py", 42, "unlink"),
+    ("streamlit_terminal.py", 2274, "unlink"),
     ("terminal_export.py", 186, "unlink"),
     ("terminal_export.py", 236, "unlink"),
     ("terminal_export.py", 618, "unlink"),
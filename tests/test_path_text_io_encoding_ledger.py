@@ -62,7 +62,7 @@ _FROZEN_SITES: dict[str, frozenset[int]] = {
     "pine_apply_surface_reduction.py": frozenset({53, 87, 397, 471, 502, 555}),
     "pine_input_surface.py": frozenset({129, 156, 187, 260, 270, 344}),
     "scripts/investigate_universe_delta.py": frozenset({28}),
-    "streamlit_terminal.py": frozenset({1621}),
+    "streamlit_terminal.py": frozenset({1631}),
 }
 _FROZEN_TOTAL = sum(len(v) for v in _FROZEN_SITES.values())
 
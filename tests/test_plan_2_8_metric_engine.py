@@ -0,0 +1,143 @@
+"""Tests for ``scripts/plan_2_8_metric_engine.py``."""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import importlib.util
+import io
+import json
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parents[1]
+SCRIPT = REPO / "scripts" / "plan_2_8_metric_engine.py"
+
+
+def _load():
+    spec = importlib.util.spec_from_file_location(
+        "plan_2_8_metric_engine", SCRIPT,
+    )
+    assert spec and spec.loader
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules["plan_2_8_metric_engine"] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+eng = _load()
+
+
+def _write_inputs(tmp_path: Path) -> tuple[Path, Path]:
+    statuses = ["green", "amber", "green", "red", "unknown", "GREEN ", "bogus", "green", "amber", "red"]
+    lines = []
+    for day, status in enumerate(statuses, start=1):
+        rec = {
+            "status": status,
+            "captured_at": f"2026-05-{day:02d}T0{day % 10}:15:00Z",
+            "extra": [day] if day % 2 else {"nested": {"k": None}},
+            "ratio": day / 3,
+            "flag": day % 3 == 0,
+        }
+        lines.append(json.dumps(rec))
+    lines[3:3] = ["", "{not json", "[1, 2]", "   "]
+    ledger = tmp_path / "state_ledger.jsonl"
+    ledger.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    summary = tmp_path / "weekly_summary.md"
+    summary.write_bytes(
+        b"# Plan 2.8 weekly summary\r\n\r\n## Status\r\n\r\n- green: 4 & amber: 2\r\n"
+        b"- see [docs](https://example.com/a_b) `code`\r\n\r\n```\r\nfenced # not a heading\r\n```\r\n"
+        b"## Trend\r\n\r\n| col | val |\r\n|---|---|\r\n| a | 1 |\r\n\r\nTrailing line with \xc3\xa9 and tab\t.\r\n"
+    )
+    return ledger, summary
+
+
+def _script_output(spec, path: Path, fmt: str, out: Path) -> bytes:
+    mod = importlib.import_module(spec.module)
+    with contextlib.redirect_stdout(io.StringIO()):
+        rc = mod.main([f"--{spec.source}", str(path), "--format", fmt, "--output", str(out)])
+    assert rc == 0, spec.name
+    return out.read_bytes()
+
+
+def test_discovers_standard_template_scripts_only() -> None:
+    registry = eng.discover_metrics()
+    assert len(registry) >= 200
+    assert registry["ledger_green_ratio"].input == "records"
+    assert registry["ledger_json_valid_count"].input == "path"
+    assert registry["summary_ampersand_char_count"].source == "summary"
+    # Extra flags / exit gates keep the script standalone.
+    assert "ledger_amber_ratio" not in registry
+
+
+@pytest.mark.parametrize("fmt", ["md", "json"])
+def test_engine_outputs_match_standalone_scripts(tmp_path: Path, fmt: str) -> None:
+    ledger, summary = _write_inputs(tmp_path)
+    registry = eng.discover_metrics()
+    written = eng.run_metrics(
+        registry.values(),
+        inputs={"ledger": ledger, "summary": summary},
+        output_dir=tmp_path / "engine",
+        fmt=fmt,
+    )
+    assert set(written) == set(registry)
+    script_dir = tmp_path / "scripts"
+    mismatched = [
+        name
+        for name, spec in registry.items()
+        if written[name].read_bytes()
+        != _script_output(spec, ledger if spec.source == "ledger" else summary, fmt, script_dir / f"{name}.{fmt}")
+    ]
+    assert not mismatched
+
+
+def test_table_parses_ledger_once(tmp_path: Path) -> None:
+    ledger, _summary = _write_inputs(tmp_path)
+    table = eng.LedgerTable.load(ledger)
+    assert len(table.records) == 10
+    snapshot = table.snapshot_path()
+    assert snapshot.read_text(encoding="utf-8") == ledger.read_text(encoding="utf-8")
+    assert snapshot.read_bytes() == ledger.read_bytes()
+
+
+def test_main_selected_metrics_and_missing_input(tmp_path: Path, capsys) -> None:
+    ledger, _summary = _write_inputs(tmp_path)
+    out = tmp_path / "out"
+    rc = eng.main([
+        "--ledger", str(ledger),
+        "--output-dir", str(out),
+        "--metric", "ledger_green_ratio",
+        "--metric", "summary_ampersand_char_count",
+    ])
+    assert rc == 1
+    assert "summary not found" in capsys.readouterr().err
+    assert sorted(p.name for p in out.iterdir()) == ["ledger_green_ratio.md"]
+
+
+def test_main_rejects_unknown_metric(tmp_path: Path) -> None:
+    assert eng.main(["--output-dir", str(tmp_path), "--metric", "nope"]) == 2
+
+
+def test_weekly_digest_runs_engine_and_copies_its_outputs() -> None:
+    yaml = pytest.importorskip("yaml")
+    wf = yaml.safe_load((REPO / ".github" / "workflows" / "plan-2-8-weekly-digest.yml").read_text(encoding="utf-8"))
+    steps = wf["jobs"]["weekly-digest"]["steps"]
+    names = [s.get("name", "") for s in steps]
+    engine_at = names.index("Plan 2.8 metric engine (single pass)")
+    assert engine_at > names.index("Plan 2.8 weekly summary index")
+    assert "plan_2_8_metric_engine.py" in steps[engine_at]["run"]
+    assert "--output-dir artifacts/plan_2_8_metric_engine" in steps[engine_at]["run"]
+
+    registry = eng.discover_metrics()
+    copied: list[str] = []
+    for at, step in enumerate(steps):
+        for name in re.findall(r"^cp artifacts/plan_2_8_metric_engine/(\w+)\.md ", step.get("run", ""), re.M):
+            assert name in registry, name
+            # Falls back to the metric's own script when the engine wrote nothing.
+            assert f"python scripts/{registry[name].module.removeprefix('scripts.')}.py" in step["run"]
+            assert at > engine_at
+            copied.append(name)
+    assert len(copied) == len(set(copied)) >= 200
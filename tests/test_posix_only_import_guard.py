@@ -63,6 +63,9 @@ _DIR_EXCLUDE = frozenset(
 _POSIX_ONLY_FILES: frozenset[str] = frozenset(
     {
         "ib_client_id.py",  # IB TWS client — Linux/macOS daemon only
+        # Dev-only benchmarks measuring per-mode peak RSS via ru_maxrss.
+        "benchmark_intraday_day_scheduler.py",
+        "benchmark_production_workbook_writer.py",
     }
 )
 
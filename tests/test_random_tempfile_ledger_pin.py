@@ -71,8 +71,10 @@ _TEMPFILE_LEDGER: frozenset[tuple[str, int, str]] = frozenset({
     # metadata) added the drift detector / version-bump persistence
     # block above the helper which shifted the site further: 489 → 597.
     # 2026-06-10 (#2670 W9): timestamp_substitutions disclosure shifted +5
-    # (597 -> 602).
-    ("databento_volatility_screener.py", 604, "mkstemp"),
+    # (597 -> 602). The content-cache import shifted it +1 (604 -> 605),
+    # the intraday streaming-decode constants +10 (605 -> 615), the
+    # cost-model import +1.
+    ("databento_volatility_screener.py", 646, "mkstemp"),
     ("governance/alpha_ledger.py", 70, "mkstemp"),
     ("newsstack_fmp/open_prep_export.py", 25, "mkstemp"),
     ("newsstack_fmp/shared_fetch.py", 258, "mkstemp"),
@@ -120,8 +122,8 @@ _TEMPFILE_LEDGER: frozenset[tuple[str, int, str]] = frozenset({
     ("smc_core/scoring.py", 1211, "mkstemp"),
     ("smc_integration/batch.py", 26, "mkstemp"),
     ("smc_integration/provider_health.py", 60, "mkstemp"),
-    ("smc_integration/structure_batch.py", 30, "mkstemp"),
-    ("streamlit_terminal.py", 2255, "mkstemp"),
+    ("smc_integration/structure_batch.py", 33, "mkstemp"),
+    ("streamlit_terminal.py", 2265, "mkstemp"),
     ("terminal_export.py", 177, "mkstemp"),
     ("terminal_export.py", 229, "mkstemp"),
     ("terminal_export.py", 606, "mkstemp"),
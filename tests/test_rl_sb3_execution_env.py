@@ -45,3 +45,61 @@ def test_execution_env_non_finite_action_is_safely_neutralized() -> None:
     env.reset(seed=7)
     _obs, _reward, _terminated, _truncated, info = env.step(np.asarray([np.nan], dtype=np.float32))
     assert float(info["slice_qty"]) == 0.0
+
+
+def _rollout(env, steps: int) -> tuple[list[np.ndarray], list[np.ndarray], list[list[dict]]]:
+    observations, rewards, infos = [], [], []
+    for _ in range(steps):
+        env.step_async(np.full((env.num_envs, 1), 0.3, dtype=np.float32))
+        obs, reward, _dones, info = env.step_wait()
+        observations.append(obs)
+        rewards.append(reward)
+        infos.append(info)
+    return observations, rewards, infos
+
+
+def test_sb3_vector_env_drives_through_vecenv_api() -> None:
+    pytest.importorskip("stable_baselines3")
+    from stable_baselines3.common.vec_env import VecEnv, VecMonitor
+
+    from rl.simulator import SB3VectorExecutionEnv
+
+    env = SB3VectorExecutionEnv(cfg=EnvConfig(parent_qty=1_000.0, horizon_steps=4, seed=1), n_envs=3)
+    assert isinstance(env, VecEnv)
+    assert env.seed(11) == [11, 12, 13]
+    first = env.reset()
+    assert first.shape == (3, 5) and first.dtype == np.float32
+    observations, rewards, infos = _rollout(env, 4)
+    assert rewards[0].shape == (3,) and rewards[0].dtype == np.float32
+    # Every slot finishes its 4-step episode on the last step and auto-resets.
+    assert all("terminal_observation" in info for info in infos[-1])
+    assert not any(infos[0])
+
+    # Re-seeding through the public API replays the same episodes.
+    env.seed(11)
+    np.testing.assert_array_equal(env.reset(), first)
+    replay_obs, replay_rewards, _ = _rollout(env, 4)
+    np.testing.assert_array_equal(np.stack(replay_obs), np.stack(observations))
+    np.testing.assert_array_equal(np.stack(replay_rewards), np.stack(rewards))
+
+    monitored = VecMonitor(env)
+    monitored.reset()
+    *_, monitored_infos = _rollout(monitored, 4)
+    assert all(info["episode"]["l"] == 4 for info in monitored_infos[-1])
+
+
+def test_sb3_vector_env_attribute_access_is_batch_level() -> None:
+    pytest.importorskip("stable_baselines3")
+    from rl.simulator import SB3VectorExecutionEnv
+
+    env = SB3VectorExecutionEnv(cfg=EnvConfig(parent_qty=1_000.0, horizon_steps=4, seed=1), n_envs=2)
+    env.set_attr("order_type", "market")
+    assert env.get_attr("order_type") == ["market", "market"]
+    assert env.vector_env.cfg.default_order_type == "market"
+    with pytest.raises(ValueError, match="shared by all slots"):
+        env.set_attr("order_type", "limit_at_mid", indices=[0])
+    with pytest.raises(AttributeError):
+        env.set_attr("cfg", None)
+    with pytest.raises(AttributeError, match="no per-slot sub-environments"):
+        env.env_method("render")
+    assert env.env_is_wrapped(object) == [False, False]
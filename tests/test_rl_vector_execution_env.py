@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from rl.simulator import EnvConfig, ExecutionEnv, VectorExecutionEnv
+from rl.slippage import AlmgrenChrissCalibrator
+
+
+def _fitted_calibrator() -> AlmgrenChrissCalibrator:
+    rng = np.random.default_rng(5)
+    X = np.column_stack([rng.uniform(-0.5, 0.5, 300), np.full(300, 30.0**0.5), rng.uniform(0.0, 0.5, 300)])
+    y = X @ np.array([4.0, 0.3, 6.0]) + rng.normal(0.0, 0.5, 300)
+    return AlmgrenChrissCalibrator(prior_precision=0.01).fit(X, y)
+
+
+def _collect_episodes(env: VectorExecutionEnv, actions: np.ndarray) -> list[dict]:
+    """Run ``actions`` (steps x n_envs) and return every finished episode."""
+    episodes: list[dict] = []
+    running = [{"actions": [], "rewards": [], "fills": [], "obs": []} for _ in range(env.n_envs)]
+    for step_actions in actions:
+        _obs, rewards, terminated, truncated, info = env.step(step_actions)
+        for row in range(env.n_envs):
+            episode = running[row]
+            episode["actions"].append(float(step_actions[row]))
+            episode["rewards"].append(float(rewards[row]))
+            episode["fills"].append(float(info["fill_price"][row]))
+            episode["obs"].append(info["final_observation"][row].copy())
+            if terminated[row] or truncated[row]:
+                episode["seed"] = int(info["episode_seed"][row])
+                episode["is_bps"] = float(info["is_bps"][row])
+                episodes.append(episode)
+                running[row] = {"actions": [], "rewards": [], "fills": [], "obs": []}
+    return episodes
+
+
+def _replay_on_scalar_env(cfg: EnvConfig, slippage, episode: dict) -> None:
+    env = ExecutionEnv(cfg=cfg, slippage=slippage)
+    env.reset(seed=episode["seed"])
+    for action, reward, fill, obs in zip(
+        episode["actions"], episode["rewards"], episode["fills"], episode["obs"], strict=True
+    ):
+        scalar_obs, scalar_reward, _terminated, _truncated, info = env.step(np.asarray([action]))
+        assert scalar_reward == pytest.approx(reward, rel=1e-12, abs=1e-12)
+        assert info["fill_price"] == pytest.approx(fill, rel=1e-12)
+        np.testing.assert_allclose(scalar_obs, obs, rtol=1e-12, atol=1e-12)
+    assert env.total_implementation_shortfall_bps == pytest.approx(episode["is_bps"], rel=1e-12, abs=1e-12)
+
+
+@pytest.mark.parametrize(
+    ("risk_metric", "order_type", "with_slippage"),
+    [("variance", "limit_at_mid", False), ("variance", "market", True), ("cvar5", "limit_aggressive", True)],
+)
+def test_vector_env_episodes_match_seeded_scalar_envs(risk_metric, order_type, with_slippage) -> None:
+    cfg = EnvConfig(
+        parent_qty=2_000.0,
+        horizon_steps=5,
+        seed=11,
+        risk_metric=risk_metric,
+        default_order_type=order_type,
+    )
+    slippage = _fitted_calibrator() if with_slippage else None
+    env = VectorExecutionEnv(cfg=cfg, n_envs=6, slippage=slippage)
+    env.reset(seed=3)
+    actions = np.random.default_rng(0).uniform(-0.2, 1.2, size=(23, 6))
+    actions[4, 0] = 1.0  # early termination in slot 0
+    actions[7, 2] = np.nan
+    episodes = _collect_episodes(env, actions)
+
+    assert len(episodes) >= 6 * 4
+    assert len({episode["seed"] for episode in episodes}) == len(episodes)
+    for episode in episodes:
+        _replay_on_scalar_env(cfg, slippage, episode)
+
+
+def test_vector_env_auto_resets_finished_slots() -> None:
+    env = VectorExecutionEnv(cfg=EnvConfig(parent_qty=1_000.0, horizon_steps=3, seed=1), n_envs=2)
+    obs, info = env.reset(seed=9)
+    first_seeds = info["episode_seed"].copy()
+    assert obs.shape == (2, 5)
+
+    obs, _rewards, terminated, truncated, info = env.step(np.asarray([[1.0], [0.5]]))
+
+    assert terminated.tolist() == [True, False]
+    assert not truncated.any()
+    assert info["final_observation"][0, 0] == 0.0
+    assert obs[0, 0] == 1.0 and obs[0, 1] == 1.0  # slot 0 restarted
+    assert obs[1, 0] == pytest.approx(0.5)
+    assert env.episode_seeds[0] != first_seeds[0]
+    assert env.episode_seeds[1] == first_seeds[1]
+
+
+def test_vector_env_reset_seed_is_reproducible() -> None:
+    env = VectorExecutionEnv(cfg=EnvConfig(horizon_steps=4), n_envs=3)
+    actions = np.full((6, 3), 0.4)
+    env.reset(seed=21)
+    first = [env.step(step)[1] for step in actions]
+    env.reset(seed=21)
+    second = [env.step(step)[1] for step in actions]
+    np.testing.assert_array_equal(np.asarray(first), np.asarray(second))
+
+
+def test_vector_env_rejects_empty_batch() -> None:
+    with pytest.raises(ValueError, match="n_envs"):
+        VectorExecutionEnv(n_envs=0)
@@ -209,7 +209,9 @@ _FROZEN_BASIC_CONFIG_SITES: frozenset[tuple[str, int]] = frozenset({
     # import and endpoint movement shifted basicConfig to line 39.
     # 2026-06-21 (auth decode hardening): binascii import shifted
     # basicConfig to line 40.
-    ("services/live_overlay_daemon/main.py", 40),
+    # /smc_live payload cache: module docstring note shifted basicConfig to line 44.
+    # Metrics exposition: docstring note + gzip import shifted basicConfig to line 50.
+    ("services/live_overlay_daemon/main.py", 50),
     # WP-H (PR #2612): 35 -> 37, VIX import + helper block added above.
     ("smc_tv_bridge/smc_api.py", 37),
 })
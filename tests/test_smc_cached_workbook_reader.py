@@ -0,0 +1,157 @@
+"""Tests for the Parquet sidecar behind ``smc_core.cached_workbook_reader``.
+
+Every sidecar read must equal the same selection applied to the
+``pd.read_excel`` frame (dtypes, sheet row order and row labels).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from scripts.benchmark_daily_bars_sidecar import build_synthetic_daily_bars, run_benchmark
+from smc_core import cached_workbook_reader as reader
+
+
+def _write_workbook(path: Path, frame: pd.DataFrame) -> Path:
+    with pd.ExcelWriter(path) as writer:
+        frame.to_excel(writer, sheet_name="daily_bars", index=False)
+    return path
+
+
+@pytest.fixture()
+def workbook(tmp_path: Path) -> Path:
+    frame = build_synthetic_daily_bars(40, 15, seed=3)
+    frame.loc[frame.index % 7 == 0, "symbol"] = " s00003 "
+    return _write_workbook(tmp_path / "production.xlsx", frame)
+
+
+def _sidecars(directory: Path) -> list[Path]:
+    return sorted(directory.glob("*.daily_bars.parquet"))
+
+
+def test_full_read_matches_xlsx_and_writes_content_addressed_sidecar(workbook: Path) -> None:
+    expected = pd.read_excel(workbook, sheet_name="daily_bars")
+
+    got = reader.read_daily_bars(workbook)
+
+    pd.testing.assert_frame_equal(got, expected)
+    sidecar_dir = workbook.parent / reader.DEFAULT_SIDECAR_DIRNAME
+    (sidecar,) = _sidecars(sidecar_dir)
+    assert sidecar.name.split(".")[0] == reader._workbook_sha256(workbook)
+    index = json.loads((sidecar_dir / "production.xlsx.index.json").read_text(encoding="utf-8"))
+    assert index["mtime_ns"] == workbook.stat().st_mtime_ns
+
+
+@pytest.mark.parametrize(
+    ("symbols", "columns"),
+    [
+        (["S00003"], None),
+        (["s00003", " S00010", "MISSING"], ["trade_date", "close", "not_a_column"]),
+        ([], ["symbol"]),
+        (None, ["volume", "symbol"]),
+    ],
+)
+def test_selected_reads_match_xlsx_selection(workbook: Path, symbols, columns) -> None:
+    expected_symbols = None if symbols is None else reader._normalize_symbols(symbols)
+    expected = reader._select(pd.read_excel(workbook, sheet_name="daily_bars"), expected_symbols, columns)
+
+    got = reader.read_daily_bars(workbook, symbols=symbols, columns=columns)
+
+    pd.testing.assert_frame_equal(got, expected)
+
+
+def test_sidecar_is_reused_across_processes_and_survives_touch(workbook: Path, monkeypatch) -> None:
+    reader.read_daily_bars(workbook)
+    reader._read_daily_bars_cached.cache_clear()
+
+    def _no_xlsx(*_args, **_kwargs):
+        raise AssertionError("xlsx must not be re-parsed while the sidecar is valid")
+
+    monkeypatch.setattr(reader.pd, "read_excel", _no_xlsx)
+    reader.read_daily_bars(workbook, symbols=["S00001"])
+    # Same bytes, new mtime: re-hashed, same content address, still no parse.
+    stat = workbook.stat()
+    os.utime(workbook, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    reader.read_daily_bars(workbook)
+    assert len(_sidecars(workbook.parent / reader.DEFAULT_SIDECAR_DIRNAME)) == 1
+
+
+def test_changed_workbook_gets_new_sidecar(workbook: Path) -> None:
+    reader.read_daily_bars(workbook)
+    changed = build_synthetic_daily_bars(5, 4, seed=9)
+    _write_workbook(workbook, changed)
+
+    got = reader.read_daily_bars(workbook)
+
+    pd.testing.assert_frame_equal(got, pd.read_excel(workbook, sheet_name="daily_bars"))
+    assert len(_sidecars(workbook.parent / reader.DEFAULT_SIDECAR_DIRNAME)) == 2
+
+
+def test_cache_dir_env_and_disable_switch(workbook: Path, tmp_path: Path, monkeypatch) -> None:
+    cache_dir = tmp_path / "shared_cache"
+    monkeypatch.setenv(reader.SIDECAR_DIR_ENV, str(cache_dir))
+    reader.read_daily_bars(workbook, symbols=["S00002"])
+    assert len(_sidecars(cache_dir)) == 1
+
+    other = tmp_path / "disabled"
+    monkeypatch.setenv(reader.SIDECAR_DISABLE_ENV, "1")
+    got = reader.read_daily_bars(workbook, symbols=["S00002"], cache_dir=other)
+    assert not other.exists()
+    assert set(got["symbol"]) == {"S00002"}
+
+
+def test_unwritable_cache_dir_falls_back_to_xlsx(workbook: Path, tmp_path: Path) -> None:
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("x", encoding="utf-8")
+
+    got = reader.read_daily_bars(workbook, columns=["symbol"], cache_dir=blocker / "sidecar")
+
+    pd.testing.assert_frame_equal(got, pd.read_excel(workbook, sheet_name="daily_bars")[["symbol"]])
+
+
+def test_corrupt_sidecar_falls_back_to_xlsx(workbook: Path) -> None:
+    reader.read_daily_bars(workbook)
+    (sidecar,) = _sidecars(workbook.parent / reader.DEFAULT_SIDECAR_DIRNAME)
+    sidecar.write_bytes(b"not parquet")
+
+    got = reader.read_daily_bars(workbook, symbols=["S00004"])
+
+    assert set(got["symbol"]) == {"S00004"}
+
+
+def test_current_sheet_dataset_is_read_instead_of_the_xlsx(workbook: Path) -> None:
+    from scripts.databento_production_workbook import write_workbook_sheet_dataset
+
+    frame = pd.read_excel(workbook, sheet_name="daily_bars")
+    dataset = workbook.with_name("production_sheets")
+    write_workbook_sheet_dataset(dataset, [("summary", frame.head(1)), ("daily_bars", frame.assign(close=-1.0))])
+
+    assert reader.sheet_dataset_for(workbook) == dataset
+    got = reader.read_daily_bars(workbook, symbols=["s00003"], columns=["symbol", "close"])
+    expected = frame.loc[frame["symbol"].str.strip().str.upper().eq("S00003"), ["symbol", "close"]].assign(close=-1.0)
+    pd.testing.assert_frame_equal(got, expected)
+    assert not _sidecars(workbook.parent / reader.DEFAULT_SIDECAR_DIRNAME)
+
+    # An xlsx rewritten after the dataset wins again.
+    index_mtime = (dataset / reader.SHEET_DATASET_INDEX_NAME).stat().st_mtime_ns
+    os.utime(workbook, ns=(index_mtime + 1_000_000_000, index_mtime + 1_000_000_000))
+    assert reader.sheet_dataset_for(workbook) is None
+    pd.testing.assert_frame_equal(reader.read_daily_bars(workbook), frame)
+
+    # Without the xlsx the dataset is the only source.
+    workbook.unlink()
+    assert reader.sheet_dataset_for(workbook) == dataset
+    assert reader.read_daily_bars(workbook)["close"].eq(-1.0).all()
+
+
+def test_benchmark_smoke() -> None:
+    report = run_benchmark(12, 5, repeat=1)
+    assert report["rows"] == 60
+    assert report["warm_rows"] == 60
+    assert report["projected_rows"] == 5
+    assert set(report["timings_s"]) == {"cold_xlsx", "sidecar_build", "warm_sidecar", "projected_sidecar"}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import logging
 from pathlib import Path
 
 import pandas as pd
@@ -420,6 +421,105 @@ def test_canonical_intraday_loader_requires_intraday_bundle_frame(tmp_path: Path
     assert float(bars.loc[0, "volume"]) == 2.0
 
 
+def _snapshot_dir(path: Path) -> dict[str, bytes]:
+    return {item.name: item.read_bytes() for item in sorted(path.iterdir())}
+
+
+@pytest.mark.parametrize("use_bundle", [False, True])
+def test_structure_batch_parallel_output_is_byte_identical_to_serial(
+    tmp_path: Path, use_bundle: bool, caplog: pytest.LogCaptureFixture
+) -> None:
+    workbook = make_minimal_workbook(tmp_path, symbols=["AAPL", "MSFT", "NVDA", "TSLA"])
+    bundle_root = None
+    if use_bundle:
+        bundle_root = tmp_path / "bundle"
+        # MSFT/TSLA are missing from the bundle and fall back to the workbook.
+        _write_bundle_frames(
+            bundle_root,
+            prefix="databento_volatility_production_20990101_000000",
+            frames={
+                "daily_bars": pd.DataFrame(
+                    {
+                        "trade_date": ["2026-03-05", "2026-03-06", "2026-03-05", "2026-03-06"],
+                        "symbol": ["aapl", "AAPL", "NVDA ", "NVDA"],
+                        "open": [10.0, 11.0, 20.0, 21.0],
+                        "high": [12.0, 13.0, 22.0, 23.0],
+                        "low": [9.0, 10.0, 19.0, 20.0],
+                        "close": [11.0, 12.0, 21.0, 22.0],
+                    }
+                ),
+            },
+        )
+    output_dir = tmp_path / "output"
+    kwargs = {
+        "workbook": workbook,
+        "timeframe": "1D",
+        "symbols": ["TSLA", "AAPL", "ZZZZ", "NVDA", "MSFT"],
+        "output_dir": output_dir,
+        "export_bundle_root": bundle_root,
+        "generated_at": 1709254000.0,
+    }
+
+    serial = write_structure_artifacts_from_workbook(**kwargs)
+    serial_files = _snapshot_dir(output_dir)
+    with caplog.at_level(logging.INFO, logger=structure_batch_module.__name__):
+        parallel = write_structure_artifacts_from_workbook(**kwargs, max_workers=3)
+
+    assert _snapshot_dir(output_dir) == serial_files
+    assert serial["counts"]["artifacts_written"] == 4
+    assert [error["symbol"] for error in parallel["errors"]] == ["ZZZZ"]
+    # No wall-clock data in the returned manifest: the export CLI prints it.
+    assert parallel == serial
+    assert "batch_timing" not in parallel
+    assert "symbols=5 workers=3 input_load_s=" in caplog.text
+    if use_bundle:
+        aapl = json.loads((output_dir / "AAPL_1D.structure.json").read_text(encoding="utf-8"))
+        msft = json.loads((output_dir / "MSFT_1D.structure.json").read_text(encoding="utf-8"))
+        assert aapl["source"]["canonical_upstream"] == "canonical_export_bundle"
+        assert msft["source"]["canonical_upstream"] == "workbook_fallback"
+
+
+def test_structure_batch_loads_workbook_once_and_isolates_failures(monkeypatch, tmp_path: Path) -> None:
+    workbook = make_minimal_workbook(tmp_path, symbols=["AAPL", "MSFT", "NVDA"])
+    reads: list[object] = []
+    real_read = structure_batch_module.read_daily_bars
+
+    def _counting_read(path, **kwargs):
+        reads.append(kwargs.get("symbols"))
+        return real_read(path, **kwargs)
+
+    monkeypatch.setattr(structure_batch_module, "read_daily_bars", _counting_read)
+    original_build = structure_batch_module.build_single_symbol_structure_artifact
+
+    def _boom(**kwargs):
+        if kwargs["symbol"] == "MSFT":
+            raise RuntimeError("msft boom")
+        return original_build(**kwargs)
+
+    monkeypatch.setattr(structure_batch_module, "build_single_symbol_structure_artifact", _boom)
+
+    for max_workers in (1, 2):
+        reads.clear()
+        manifest = write_structure_artifacts_from_workbook(
+            workbook=workbook,
+            timeframe="1D",
+            symbols=["AAPL", "MSFT", "NVDA"],
+            output_dir=tmp_path / f"out_{max_workers}",
+            generated_at=1709254000.0,
+            max_workers=max_workers,
+        )
+        assert len(reads) == 1
+        assert manifest["counts"]["artifacts_written"] == 2
+        assert manifest["errors"] == [
+            {"code": "BUILD_SYMBOL_ARTIFACT_FAILED", "symbol": "MSFT", "timeframe": "1D", "error": "msft boom"}
+        ]
+
+    with pytest.raises(ValueError, match="max_workers"):
+        write_structure_artifacts_from_workbook(
+            workbook=workbook, timeframe="1D", symbols=["AAPL"], output_dir=tmp_path / "bad", max_workers=0
+        )
+
+
 # ── pure helper coverage ─────────────────────────────────────────
 
 from smc_integration.structure_batch import (
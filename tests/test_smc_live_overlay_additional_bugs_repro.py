@@ -65,7 +65,7 @@ class TestRunFullComputeCycleEmptyCacheBug:
         assert old_overlay is not None
 
         # Bar cache is empty
-        monkeypatch.setattr(cache_mod, "_bars", {})
+        cache_mod.reset_bar_cache()
         monkeypatch.setattr(compute.config, "max_stale_secs", lambda: 3600)
 
         # Reset news cache
@@ -255,13 +255,13 @@ class TestVolumeTypeDriftRobustness:
         assert ats["ats_zscore"] is not None
 
     def test_run_full_compute_cycle_skips_invalid_volume_types_without_crash(
-        self, monkeypatch: pytest.MonkeyPatch
+        self, monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureRequest
     ) -> None:
         import services.live_overlay_daemon.cache as cache_mod
         import services.live_overlay_daemon.compute as compute
 
-        monkeypatch.setattr(cache_mod, "_bars", {})
-        monkeypatch.setattr(cache_mod, "_bar_last_update", {})
+        cache_mod.reset_bar_cache()
+        request.addfinalizer(cache_mod.reset_bar_cache)
         monkeypatch.setattr(cache_mod, "_overlay", {})
         monkeypatch.setattr(cache_mod, "_overlay_computed_at", 0.0)
         monkeypatch.setattr(compute.config, "max_stale_secs", lambda: 3600)
@@ -332,8 +332,8 @@ class TestVolumeTypeDriftRobustness:
 
         monkeypatch.setattr(
             cache_mod,
-            "get_all_symbols_snapshot",
-            lambda: {
+            "get_all_timeframe_snapshots",
+            lambda _tf: {
                 "AAPL": [
                     {"open": 100.0, "high": 101.0, "low": 99.0, "close": 100.5, "volume": 100},
                     {"open": 100.0, "high": 101.0, "low": 99.0, "close": 100.5, "volume": 110},
@@ -370,8 +370,8 @@ class TestVolumeTypeDriftRobustness:
 
         monkeypatch.setattr(
             cache_mod,
-            "get_all_symbols_snapshot",
-            lambda: {
+            "get_all_timeframe_snapshots",
+            lambda _tf: {
                 "AAPL": [
                     {"open": 100.0, "high": 101.0, "low": 99.0, "close": 100.5, "volume": 100},
                     {"open": 100.0, "high": 101.0, "low": 99.0, "close": 100.5, "volume": 110},
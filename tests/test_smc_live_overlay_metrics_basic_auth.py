@@ -97,3 +97,32 @@ def test_metrics_legacy_path_rejects_wrong_token(monkeypatch: pytest.MonkeyPatch
     client = _client(monkeypatch)
     resp = client.get("/wrong-token/metrics")
     assert resp.status_code == 404
+
+
+def test_metrics_negotiates_openmetrics_and_gzip(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _client(monkeypatch)
+    headers = {
+        **_basic_header(_TEST_TOKEN),
+        "Accept": "application/openmetrics-text;version=1.0.0;q=0.9,text/plain;q=0.5",
+        "Accept-Encoding": "gzip",
+    }
+    resp = client.get("/metrics", headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/openmetrics-text; version=1.0.0")
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.headers["vary"] == "Accept, Accept-Encoding"
+    assert "live_overlay_feed_healthy 1" in resp.text  # httpx decodes the gzip body
+    assert resp.text.endswith("# EOF\n")
+
+
+@pytest.mark.parametrize("accept", [None, "text/plain", "application/openmetrics-text;q=0", "*/*"])
+def test_metrics_defaults_to_prometheus_text(monkeypatch: pytest.MonkeyPatch, accept: str | None) -> None:
+    client = _client(monkeypatch)
+    headers = {"Accept-Encoding": "identity"}
+    if accept is not None:
+        headers["Accept"] = accept
+    resp = client.get(f"/{_TEST_TOKEN}/metrics", headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "text/plain; version=0.0.4; charset=utf-8"
+    assert "content-encoding" not in resp.headers
+    assert "# EOF" not in resp.text
@@ -28,10 +28,13 @@ def test_full_compute_cycle_emits_trace_metric_and_audit(
     import services.live_overlay_daemon.compute as compute
     import services.live_overlay_daemon.observability as obs
 
-    monkeypatch.setattr(compute.cache, "get_all_symbols_snapshot", lambda: {"AAPL": [_sample_bar()]})
+    monkeypatch.setattr(
+        compute.cache, "get_dirty_timeframe_snapshots", lambda _tf, _seen: ({"AAPL": 2}, {"AAPL": [_sample_bar()]})
+    )
     monkeypatch.setattr(compute.config, "max_stale_secs", lambda: 3600)
     monkeypatch.setattr(compute, "_get_global_news_fields", lambda: {"tone": "NEUTRAL", "global_heat": 0.0})
-    monkeypatch.setattr(compute, "build_payload", lambda *args, **kwargs: {"symbol": "AAPL"})
+    monkeypatch.setattr(compute, "_load_news_snapshot", lambda: {})
+    monkeypatch.setattr(compute, "_cycle_state", compute._ComputeCycleState())
     monkeypatch.setattr(compute.cache, "set_overlay", lambda _payloads: None)
 
     with caplog.at_level(logging.INFO, logger=obs.logger.name):
@@ -51,7 +54,7 @@ def test_flow_patch_cycle_emits_trace_metric_and_audit(
     import services.live_overlay_daemon.compute as compute
     import services.live_overlay_daemon.observability as obs
 
-    monkeypatch.setattr(compute.cache, "get_all_symbols_snapshot", lambda: {"AAPL": [_sample_bar()]})
+    monkeypatch.setattr(compute.cache, "get_all_timeframe_snapshots", lambda _tf: {"AAPL": [_sample_bar()]})
     monkeypatch.setattr(compute.cache, "get_vix", lambda: 18.12345)
     monkeypatch.setattr(compute.cache, "patch_overlay", lambda *_args, **_kwargs: None)
 
@@ -96,6 +99,7 @@ def test_smc_live_cache_miss_counts_stale_served(
     import services.live_overlay_daemon.observability as obs
 
     monkeypatch.setattr(main_mod.config, "overlay_secret_token", lambda: "secret-token")
+    monkeypatch.setattr(main_mod.payload_cache, "_entries", {})
     monkeypatch.setattr(main_mod.cache, "get_overlay", lambda _sym: None)
 
     with obs._counter_lock:
@@ -115,6 +119,7 @@ def test_smc_live_records_latency_histogram_counters(
     import services.live_overlay_daemon.observability as obs
 
     monkeypatch.setattr(main_mod.config, "overlay_secret_token", lambda: "secret-token")
+    monkeypatch.setattr(main_mod.payload_cache, "_entries", {})
     monkeypatch.setattr(main_mod.cache, "overlay_age_secs", lambda: 1.0)
     monkeypatch.setattr(main_mod.config, "max_stale_secs", lambda: 3600)
     monkeypatch.setattr(
@@ -201,6 +206,7 @@ def test_smc_live_unexpected_error_emits_error_metric_and_audit(
     import services.live_overlay_daemon.observability as obs
 
     monkeypatch.setattr(main_mod.config, "overlay_secret_token", lambda: "secret-token")
+    monkeypatch.setattr(main_mod.payload_cache, "_entries", {})
     monkeypatch.setattr(main_mod.config, "max_stale_secs", lambda: 3600)
     monkeypatch.setattr(
         main_mod.cache,
@@ -14,9 +14,9 @@ from __future__ import annotations
 
 import json
 import logging
-import queue
 import threading
 import time
+from collections.abc import Iterator
 from pathlib import Path
 from typing import ClassVar
 from unittest.mock import MagicMock, patch
@@ -167,17 +167,19 @@ class TestNewsSnapshotWarningLogging:
 class TestBarCacheEviction:
     """Bar cache evicts least-recently-updated symbols when hitting _MAX_SYMBOLS."""
 
-    def test_eviction_at_cap(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    @pytest.fixture(autouse=True)
+    def _fresh_bar_cache(self) -> Iterator[None]:
         import services.live_overlay_daemon.cache as cache_mod
 
-        # Reset module state
-        monkeypatch.setattr(cache_mod, "_bars", {})
-        monkeypatch.setattr(cache_mod, "_bar_last_update", {})
-        monkeypatch.setattr(cache_mod, "_last_eviction_at", 0.0)
-        monkeypatch.setattr(cache_mod, "_rolling_bars_cap", 5)
+        cache_mod.reset_bar_cache()
+        yield
+        cache_mod.reset_bar_cache()
+
+    def test_eviction_at_cap(self) -> None:
+        import services.live_overlay_daemon.cache as cache_mod
 
         small_cap = 20
-        monkeypatch.setattr(cache_mod, "_max_symbols", small_cap)
+        cache_mod.init_bar_cache(5, max_symbols=small_cap)
 
         # Fill to cap with stale symbols
         for i in range(small_cap):
@@ -192,14 +194,10 @@ class TestBarCacheEviction:
         assert cache_mod.bar_symbol_count() <= small_cap
         assert cache_mod.get_bars_snapshot("NEW_SYMBOL") != []
 
-    def test_eviction_removes_oldest(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_eviction_removes_oldest(self) -> None:
         import services.live_overlay_daemon.cache as cache_mod
 
-        monkeypatch.setattr(cache_mod, "_bars", {})
-        monkeypatch.setattr(cache_mod, "_bar_last_update", {})
-        monkeypatch.setattr(cache_mod, "_last_eviction_at", 0.0)
-        monkeypatch.setattr(cache_mod, "_rolling_bars_cap", 5)
-        monkeypatch.setattr(cache_mod, "_max_symbols", 5)
+        cache_mod.init_bar_cache(5, max_symbols=5)
 
         bar = {"open": 1, "close": 1, "high": 1, "low": 1, "volume": 100}
 
@@ -216,13 +214,9 @@ class TestBarCacheEviction:
         # FRESH should exist
         assert cache_mod.get_bars_snapshot("FRESH") != []
 
-    def test_reinit_updates_existing_symbol_deque_cap(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_reinit_updates_existing_symbol_deque_cap(self) -> None:
         import services.live_overlay_daemon.cache as cache_mod
 
-        monkeypatch.setattr(cache_mod, "_bars", {})
-        monkeypatch.setattr(cache_mod, "_bar_last_update", {})
-        monkeypatch.setattr(cache_mod, "_last_eviction_at", 0.0)
-
         cache_mod.init_bar_cache(2, max_symbols=2000)
         for i in range(4):
             cache_mod.push_bar("AAPL", {"open": 1, "close": 1, "high": 1, "low": 1, "volume": i})
@@ -234,15 +228,9 @@ class TestBarCacheEviction:
 
         assert len(cache_mod.get_bars_snapshot("AAPL")) == 5
 
-    def test_downscale_max_symbols_enforces_hard_cap_immediately(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_downscale_max_symbols_enforces_hard_cap_immediately(self) -> None:
         import services.live_overlay_daemon.cache as cache_mod
 
-        monkeypatch.setattr(cache_mod, "_bars", {})
-        monkeypatch.setattr(cache_mod, "_bar_last_update", {})
-        monkeypatch.setattr(cache_mod, "_last_eviction_at", 0.0)
-
         bar = {"open": 1, "close": 1, "high": 1, "low": 1, "volume": 1}
         cache_mod.init_bar_cache(5, max_symbols=100)
         for i in range(10):
@@ -252,15 +240,9 @@ class TestBarCacheEviction:
         cache_mod.init_bar_cache(5, max_symbols=3)
         assert cache_mod.bar_symbol_count() <= 3
 
-    def test_new_symbol_push_at_capacity_after_downscale_keeps_cache_within_cap(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_new_symbol_push_at_capacity_after_downscale_keeps_cache_within_cap(self) -> None:
         import services.live_overlay_daemon.cache as cache_mod
 
-        monkeypatch.setattr(cache_mod, "_bars", {})
-        monkeypatch.setattr(cache_mod, "_bar_last_update", {})
-        monkeypatch.setattr(cache_mod, "_last_eviction_at", 0.0)
-
         bar = {"open": 1, "close": 1, "high": 1, "low": 1, "volume": 1}
         cache_mod.init_bar_cache(5, max_symbols=100)
         for i in range(10):
@@ -777,6 +759,7 @@ class TestSmcLiveSerializationSafety:
         import services.live_overlay_daemon.main as main_mod
 
         monkeypatch.setattr(main_mod.config, "overlay_secret_token", lambda: "tok")
+        monkeypatch.setattr(main_mod.payload_cache, "_entries", {})
         monkeypatch.setattr(main_mod.cache, "overlay_age_secs", lambda: 1.0)
         monkeypatch.setattr(main_mod.config, "max_stale_secs", lambda: 3600)
         monkeypatch.setattr(
@@ -833,8 +816,8 @@ class TestVixFiniteContract:
 
         monkeypatch.setattr(
             cache_mod,
-            "get_all_symbols_snapshot",
-            lambda: {
+            "get_all_timeframe_snapshots",
+            lambda _tf: {
                 "AAPL": [
                     {"open": 1.0, "high": 1.2, "low": 0.9, "close": 1.1, "volume": 100},
                     {"open": 1.0, "high": 1.2, "low": 0.9, "close": 1.1, "volume": 110},
@@ -894,13 +877,13 @@ class TestFeedReadyClearedOnStop:
 
         ingest_waiting = threading.Event()
 
-        class _SignalingQueue(queue.Queue[object]):
-            def get(self, *args, **kwargs):
+        class _SignalingQueue(feed_mod.IngestBuffer):
+            def drain(self, *args, **kwargs):
                 ingest_waiting.set()
-                return super().get(*args, **kwargs)
+                return super().drain(*args, **kwargs)
 
         original_ingest_queue = feed_mod._runtime.get("ingest_queue")
-        ingest_q: queue.Queue[object] = _SignalingQueue(maxsize=4)
+        ingest_q = _SignalingQueue(maxsize=4)
         feed_mod._runtime["ingest_queue"] = ingest_q
         ingest_thread = threading.Thread(
             target=feed_mod._run_ingest_loop,
@@ -910,7 +893,7 @@ class TestFeedReadyClearedOnStop:
         )
         feed_mod._runtime["ingest_thread"] = ingest_thread
         ingest_thread.start()
-        assert ingest_waiting.wait(timeout=1.0), "ingest worker did not reach queue.get() in time"
+        assert ingest_waiting.wait(timeout=1.0), "ingest worker did not reach drain() in time"
 
         with caplog.at_level(logging.WARNING):
             feed_mod.stop()
@@ -0,0 +1,104 @@
+"""Tests for the sparse-table forward search in :mod:`smc_core.mitigation_search`.
+
+Every query is checked against a brute-force forward scan that mirrors the
+original per-zone ``for j in range(i + 1, len(bars))`` loops of the classic
+structure detectors.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from smc_core.mitigation_search import ForwardExtremaIndex, ZoneMitigationEngine
+
+
+def _brute_first(values: np.ndarray, start: int, predicate) -> int:
+    for j in range(start, values.size):
+        if predicate(values[j]):
+            return j
+    return values.size
+
+
+def _brute_zone(low, high, close, start, zone_low, zone_high, direction):
+    mitigated_index = None
+    for j in range(start, close.size):
+        probe = low[j] if direction == "BULL" else high[j]
+        if mitigated_index is None and zone_low <= probe <= zone_high:
+            mitigated_index = j
+        if (direction == "BULL" and close[j] < zone_low) or (direction == "BEAR" and close[j] > zone_high):
+            return False, mitigated_index
+    return True, mitigated_index
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 7, 64, 257])
+def test_first_crossing_queries_match_brute_force(n: int) -> None:
+    rng = np.random.default_rng(n)
+    values = rng.integers(0, 20, size=n).astype(float)
+    index = ForwardExtremaIndex(values)
+    starts = rng.integers(0, n + 1, size=200)
+    levels = rng.integers(-1, 21, size=200).astype(float)
+
+    checks = {
+        "first_lt": lambda level: lambda v: v < level,
+        "first_le": lambda level: lambda v: v <= level,
+        "first_gt": lambda level: lambda v: v > level,
+        "first_ge": lambda level: lambda v: v >= level,
+    }
+    for name, make_predicate in checks.items():
+        got = getattr(index, name)(starts, levels)
+        expected = [_brute_first(values, int(s), make_predicate(lv)) for s, lv in zip(starts, levels)]
+        assert got.tolist() == expected, name
+
+
+@pytest.mark.parametrize("approach", ["from_above", "from_below"])
+def test_first_within_respects_band_and_stop(approach: str) -> None:
+    rng = np.random.default_rng(11)
+    values = rng.integers(0, 30, size=300).astype(float)
+    index = ForwardExtremaIndex(values)
+    starts = rng.integers(0, 301, size=300)
+    lows = rng.integers(0, 25, size=300).astype(float)
+    highs = lows + rng.integers(0, 6, size=300)
+    stops = np.minimum(starts + rng.integers(0, 120, size=300), 300)
+
+    got = index.first_within(starts, lows, highs, stops, approach=approach)
+    for k in range(starts.size):
+        lo, hi = lows[k], highs[k]
+        hit = _brute_first(values[: min(stops[k], 299) + 1], int(starts[k]), lambda v, lo=lo, hi=hi: lo <= v <= hi)
+        expected = hit if hit <= min(stops[k], 299) else values.size
+        assert got[k] == expected
+
+
+@pytest.mark.parametrize("direction", ["BULL", "BEAR"])
+def test_zone_engine_matches_nested_forward_scan(direction: str) -> None:
+    rng = np.random.default_rng(3)
+    n = 400
+    close = 100 + np.cumsum(rng.normal(0, 0.5, size=n)).round(2)
+    high = close + np.abs(rng.normal(0, 0.4, size=n)).round(2)
+    low = close - np.abs(rng.normal(0, 0.4, size=n)).round(2)
+    starts = rng.integers(1, n + 1, size=250)
+    zone_lows = close[np.minimum(starts, n - 1)] - np.abs(rng.normal(0, 1.0, size=250)).round(2)
+    zone_highs = zone_lows + np.abs(rng.normal(0, 0.8, size=250)).round(2)
+
+    engine = ZoneMitigationEngine(low, high, close)
+    result = engine.resolve(direction, starts, zone_lows, zone_highs)
+
+    for k in range(starts.size):
+        valid, mitigated_index = _brute_zone(low, high, close, int(starts[k]), zone_lows[k], zone_highs[k], direction)
+        assert bool(result.valid[k]) is valid
+        assert bool(result.mitigated[k]) is (mitigated_index is not None)
+        if mitigated_index is not None:
+            assert result.mitigated_index[k] == mitigated_index
+
+
+def test_mitigation_on_invalidating_bar_still_counts() -> None:
+    # Bar 1 trades into the BULL zone and closes below it in the same bar.
+    low = np.array([10.0, 9.5, 9.0])
+    high = np.array([11.0, 10.5, 9.5])
+    close = np.array([10.5, 9.4, 9.2])
+    result = ZoneMitigationEngine(low, high, close).resolve(
+        "BULL", np.array([1]), np.array([9.5]), np.array([10.0])
+    )
+    assert result.valid.tolist() == [False]
+    assert result.mitigated_index.tolist() == [1]
+    assert result.invalidated_index.tolist() == [1]
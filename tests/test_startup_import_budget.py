@@ -0,0 +1,73 @@
+"""Startup import budget of the Streamlit / CLI entry modules and the lazy-import layer."""
+
+from __future__ import annotations
+
+import sys
+from unittest import mock
+
+import pytest
+
+from lazy_imports import LazyModule, lazy_module, module_available
+from scripts.profile_startup_imports import (
+    STARTUP_IMPORT_BUDGET,
+    ImportTiming,
+    StartupProfile,
+    parse_importtime,
+    profile_import,
+)
+
+_IMPORTTIME_STDERR = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2500 |       2500 |     pandas._libs
+import time:      9000 |      11500 |   pandas
+import time:       300 |      11920 | databento_volatility_screener
+Traceback lines and warnings are ignored
+"""
+
+
+@pytest.mark.parametrize("entry", sorted(STARTUP_IMPORT_BUDGET))
+def test_entry_module_import_stays_within_the_heavy_module_budget(entry: str) -> None:
+    profile = profile_import(entry)
+
+    assert entry in profile.modules
+    assert not profile.over_budget, (
+        f"importing {entry} loads {sorted(profile.over_budget)}; defer them with "
+        "lazy_imports.lazy_module / a PEP 562 package facade, or budget them in "
+        "scripts/profile_startup_imports.py with a reason."
+    )
+
+
+def test_package_facades_resolve_exports_on_first_access() -> None:
+    profile = profile_import("smc_core.schema_version")
+
+    assert "smc_core.types" not in profile.modules
+    assert "smc_integration.service" not in profile_import("smc_integration.provider_matrix").modules
+
+
+def test_parse_importtime_reads_self_and_cumulative_times() -> None:
+    profile = StartupProfile("databento_volatility_screener", parse_importtime(_IMPORTTIME_STDERR))
+
+    assert profile.timings[1] == ImportTiming("pandas._libs", 2500, 2500, 2)
+    assert profile.total_us == 11_920
+    assert profile.by_package() == {"_io": 120, "pandas": 11_500, "databento_volatility_screener": 300}
+    assert profile.heavy_loaded == {"pandas"} and not profile.over_budget
+    report = profile.to_report(top=2)
+    assert report["top_self_ms"] == {"pandas": 9.0, "pandas._libs": 2.5}
+    assert StartupProfile("streamlit_terminal_alerts", profile.timings).over_budget == {"pandas"}
+
+
+def test_lazy_module_imports_on_first_attribute_access(monkeypatch) -> None:
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+
+    colorsys = lazy_module("colorsys")
+
+    assert isinstance(colorsys, LazyModule) and not colorsys.is_loaded
+    assert "colorsys" not in sys.modules
+    assert colorsys.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert colorsys.is_loaded and lazy_module("colorsys") is sys.modules["colorsys"]
+    # Patches on the stand-in shadow the real module and are undone cleanly.
+    with mock.patch.object(colorsys, "rgb_to_hsv", return_value="patched"):
+        assert colorsys.rgb_to_hsv(1.0, 0.0, 0.0) == "patched"
+    assert colorsys.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert module_available("colorsys") and not module_available("not_a_real_module_xyz.sub")
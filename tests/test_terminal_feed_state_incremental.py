@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import copy
+import random
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
+from terminal_feed_state import (
+    DerivedFeedState,
+    IncrementalFeedState,
+    merge_live_feed_rows,
+)
+
+_TICKERS = ("AAPL", "MSFT", "NVDA", "TSLA", "amd", "MARKET", "")
+_HEADLINES = (
+    "Guidance raised after record quarter",
+    "FDA approval for lead candidate",
+    "Downgrade to underperform at major bank",
+    "Announces buyback program",
+    "CEO departs unexpectedly",
+    "Wins large government contract",
+)
+_PROVIDERS = ("benzinga_rest", "fmp_stock_latest", "tv_news", "newsapi_ai")
+_SENTIMENTS = ("bullish", "bearish", "neutral", "")
+_MATERIALITY = ("LOW", "MEDIUM", "HIGH", "")
+
+
+@dataclass(slots=True)
+class _Cfg:
+    feed_max_age_s: float = 14400.0
+    live_story_ttl_s: float = 7200.0
+    live_story_cooldown_s: float = 900.0
+    max_items: int = 60
+
+
+def _random_row(rng: random.Random, serial: int, now: float) -> dict[str, Any]:
+    age_s = rng.choice((0.0, 30.0, 300.0, 1200.0, 3000.0, 9000.0, 20000.0))
+    published_ts = 0.0 if rng.random() < 0.03 else now - age_s - rng.random() * 60.0
+    row: dict[str, Any] = {
+        "item_id": f"item-{serial}",
+        "ticker": rng.choice(_TICKERS),
+        "headline": rng.choice(_HEADLINES),
+        "provider": rng.choice(_PROVIDERS),
+        "source": rng.choice(("Benzinga", "Reuters", "PR Newswire")),
+        "source_rank": rng.randint(1, 4),
+        "news_score": round(rng.random(), 3),
+        "materiality": rng.choice(_MATERIALITY),
+        "published_ts": published_ts,
+        "updated_ts": published_ts,
+        "sentiment_label": rng.choice(_SENTIMENTS),
+        "event_label": "news",
+        "is_actionable": rng.random() < 0.3,
+    }
+    if rng.random() < 0.2:
+        row["url"] = f"https://example.com/a/{rng.randrange(8)}?utm_source=x"
+    if rng.random() < 0.1:
+        row["story_key"] = f"explicit-{rng.randrange(4)}"
+    return row
+
+
+def _random_quotes(rng: random.Random) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+    rt_quotes: dict[str, dict[str, Any]] = {}
+    db_quotes: dict[str, dict[str, Any]] = {}
+    for ticker in rng.sample(("AAPL", "MSFT", "NVDA"), k=rng.randint(0, 2)):
+        quote = {"price": round(100.0 + rng.uniform(-3.0, 3.0), 2), "chg_pct": round(rng.uniform(-2.0, 2.0), 2)}
+        if rng.random() < 0.5:
+            quote["vol_ratio"] = round(rng.uniform(0.5, 3.0), 2)
+            rt_quotes[ticker] = quote
+        else:
+            db_quotes[ticker] = {"price": quote["price"], "changesPercentage": quote["chg_pct"]}
+    return rt_quotes, db_quotes
+
+
+def _assert_equivalent(incremental: DerivedFeedState, full: DerivedFeedState) -> None:
+    assert incremental.feed == full.feed
+    assert incremental.live_story_state == full.live_story_state
+    for name in (
+        "ticker_catalyst_state",
+        "ticker_reaction_state",
+        "ticker_resolution_state",
+        "ticker_posture_state",
+        "ticker_attention_state",
+    ):
+        assert getattr(incremental, name) == getattr(full, name), name
+    assert incremental.annotated_new_rows == full.annotated_new_rows
+    assert incremental.new_count == full.new_count
+    assert incremental.legacy_cursor == full.legacy_cursor
+    assert incremental.provider_cursors == full.provider_cursors
+
+
+@pytest.mark.parametrize("seed", range(16))
+def test_incremental_apply_rows_matches_full_rebuild_chain(seed: int) -> None:
+    rng = random.Random(seed)
+    cfg = _Cfg(max_items=rng.choice((0, 25, 60)))
+    engine = IncrementalFeedState(cfg)
+    full = DerivedFeedState(
+        feed=[],
+        live_story_state={},
+        ticker_catalyst_state={},
+        ticker_reaction_state={},
+        ticker_resolution_state={},
+        ticker_posture_state={},
+        ticker_attention_state={},
+    )
+    now = 1_700_000_000.0
+    serial = 0
+    for _step in range(40):
+        now += rng.choice((0.0, 5.0, 60.0, 400.0, 1000.0, 3600.0, 20000.0))
+        delta = []
+        for _ in range(rng.choice((0, 1, 2, 5))):
+            delta.append(_random_row(rng, serial, now))
+            serial += 1
+        if full.feed and rng.random() < 0.15:
+            delta.append({key: value for key, value in rng.choice(full.feed).items() if key != "story_key"})
+        replace_keys = []
+        if full.live_story_state and rng.random() < 0.2:
+            replace_keys = [rng.choice(sorted(full.live_story_state))]
+        rt_quotes, db_quotes = _random_quotes(rng)
+
+        full = merge_live_feed_rows(
+            full.feed,
+            copy.deepcopy(delta),
+            cfg=cfg,
+            replace_story_keys=replace_keys,
+            previous_reaction_state=full.ticker_reaction_state,
+            previous_resolution_state=full.ticker_resolution_state,
+            rt_quotes=rt_quotes,
+            quote_map=db_quotes,
+            now=now,
+        )
+        incremental = engine.apply_rows(
+            copy.deepcopy(delta),
+            cfg=cfg,
+            replace_story_keys=replace_keys,
+            rt_quotes=rt_quotes,
+            quote_map=db_quotes,
+            now=now,
+        )
+        _assert_equivalent(incremental, full)
+
+    assert engine.full_rebuilds == 1
+
+
+def test_apply_rows_only_rederives_touched_tickers() -> None:
+    cfg = _Cfg(max_items=0)
+    engine = IncrementalFeedState(cfg)
+    now = 1_700_000_000.0
+    rng = random.Random(3)
+    seed_rows = []
+    for serial in range(200):
+        row = _random_row(rng, serial, now)
+        row.update(ticker=f"T{serial % 50:02d}", headline=f"headline {serial}", published_ts=now - 60.0, updated_ts=now - 60.0)
+        row.pop("story_key", None)
+        seed_rows.append(row)
+    first = engine.apply_rows(seed_rows, now=now)
+    for step in range(1, 4):
+        first = engine.apply_rows([], now=now + step)
+
+    untouched = {id(row) for row in first.feed if row["ticker"] != "T07"}
+    update = _random_row(rng, 999, now + 10.0)
+    update.update(ticker="T07", headline="fresh T07 headline", published_ts=now + 9.0, updated_ts=now + 9.0)
+    update.pop("story_key", None)
+    result = engine.apply_rows([update], current_feed=first.feed, now=now + 10.0)
+
+    assert engine.full_rebuilds == 1
+    assert result.new_count == 1
+    assert result.feed[0]["headline"] == "fresh T07 headline"
+    assert {id(row) for row in result.feed if row["ticker"] != "T07"} == untouched
+
+
+def test_untouched_ticker_ages_with_now_between_recomputes() -> None:
+    engine = IncrementalFeedState(_Cfg(max_items=0))
+    now = 1_700_000_000.0
+    row = _random_row(random.Random(5), 0, now)
+    row.update(ticker="AAPL", published_ts=now - 300.0, updated_ts=now - 300.0)
+    row.pop("story_key", None)
+    engine.apply_rows([row], now=now)
+    settled = engine.apply_rows([], now=now + 1.0)
+    settled = engine.apply_rows([], now=now + 2.0)
+    rows_before = [id(feed_row) for feed_row in settled.feed]
+
+    # 7 minutes on: no age/expiry threshold is crossed, so nothing is re-derived.
+    later = now + 420.0
+    result = engine.apply_rows([], now=later)
+
+    assert [id(feed_row) for feed_row in result.feed] == rows_before
+    catalyst = result.ticker_catalyst_state["AAPL"]
+    assert catalyst["catalyst_age_minutes"] == pytest.approx(12.0)
+    assert result.feed[0]["catalyst_age_minutes"] == catalyst["catalyst_age_minutes"]
+    assert result.ticker_posture_state["AAPL"]["posture_last_update_ts"] == later
+    assert result.ticker_attention_state["AAPL"]["attention_last_update_ts"] == later
+    assert result.feed[0]["attention_last_update_ts"] == later
+
+
+def test_apply_rows_falls_back_to_full_rebuild_when_feed_replaced_or_cfg_changes() -> None:
+    engine = IncrementalFeedState(_Cfg())
+    now = 1_700_000_000.0
+    rows = [_random_row(random.Random(1), serial, now) for serial in range(5)]
+    result = engine.apply_rows(rows, now=now)
+    engine.apply_rows([], current_feed=result.feed, now=now + 1.0)
+    assert engine.full_rebuilds == 1
+
+    engine.apply_rows([], current_feed=list(result.feed[:2]), now=now + 2.0)
+    assert engine.full_rebuilds == 2
+
+    engine.apply_rows([], cfg=_Cfg(feed_max_age_s=3600.0), now=now + 3.0)
+    assert engine.full_rebuilds == 3
+
+
+def test_apply_rows_expires_stories_on_schedule_without_new_rows() -> None:
+    cfg = _Cfg(max_items=0)
+    engine = IncrementalFeedState(cfg)
+    now = 1_700_000_000.0
+    row = _random_row(random.Random(5), 1, now)
+    row.update(ticker="AAPL", published_ts=now, updated_ts=now, sentiment_label="bullish", news_score=0.9)
+    result = engine.apply_rows([row], now=now)
+    assert "AAPL" in result.ticker_catalyst_state
+
+    result = engine.apply_rows([], now=now + cfg.live_story_ttl_s + 1.0)
+    assert result.live_story_state == {}
+    assert "AAPL" not in result.ticker_catalyst_state
+    assert len(result.feed) == 1
+
+    result = engine.apply_rows([], now=now + cfg.feed_max_age_s + 1.0)
+    assert result.feed == []
+    assert result.legacy_cursor is None
@@ -105,14 +105,14 @@ _FROZEN_SITES: frozenset[tuple[str, int]] = frozenset(
         # (776→784, 795→803).
         # 2026-06-13: profile-bulk pagination constant shifted +1
         # (784→785, 803→804); sleeps unchanged: retry-backoff paths.
-        ("open_prep/macro.py", 803),
-        ("open_prep/macro.py", 822),
+        ("open_prep/macro.py", 838),
+        ("open_prep/macro.py", 857),
         ("newsstack_fmp/ingest_fmp_political.py", 122),
         ("newsstack_fmp/ingest_fmp_political.py", 135),
         ("newsstack_fmp/shared_fetch.py", 297),
-        ("newsstack_fmp/pipeline.py", 1259),
-        ("newsstack_fmp/store_sqlite.py", 81),
-        ("newsstack_fmp/store_sqlite.py", 86),
+        ("newsstack_fmp/pipeline.py", 1340),
+        ("newsstack_fmp/store_sqlite.py", 100),
+        ("newsstack_fmp/store_sqlite.py", 105),
         # 2026-07-01: alert candidate/throttle hardening + payload/url guards
         # shifted webhook retry sleeps 452/462 -> 489/499; semantics
         # unchanged: webhook retry-backoff paths.
@@ -133,12 +133,12 @@ _FROZEN_SITES: frozenset[tuple[str, int]] = frozenset(
         ("open_prep/run_open_prep.py", 2038),
         ("open_prep/run_open_prep.py", 2040),
         ("newsstack_fmp/_bz_http.py", 44),
-        ("terminal_bitcoin.py", 846),
-        ("terminal_bitcoin.py", 848),
+        ("terminal_bitcoin.py", 842),
+        ("terminal_bitcoin.py", 844),
         # 2026-06-10 (#2670 W3): source-field additions shifted +6 (286 -> 292).
         # 2026-06-19 (timeframe expansion): INTERVAL_MAP/default list additions
         # shifted the throttle sleep site 293 -> 294.
-        ("terminal_technicals.py", 294),
+        ("terminal_technicals.py", 293),
         ("terminal_tradingview_news.py", 409),
         # 2026-06-24 feat/benzinga-rss: retry backoff sleeps in REST client
         # (198→199, 209→210 after RSS improvements).
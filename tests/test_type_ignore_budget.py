@@ -99,21 +99,20 @@ _FROZEN_FILE_COUNTS: dict[str, int] = {
     "rl/agents/ppo_slicer.py": 4,
     "rl/agents/sac_sizer.py": 2,
     "rl/simulator/execution_env.py": 5,
-    "rl/simulator/sb3_execution_env.py": 5,
+    "rl/simulator/sb3_execution_env.py": 8,  # +3 for the optional sb3 VecEnv import shim and SB3VectorExecutionEnv base
     "smc_adapters/regime_bridge.py": 2,
     "smc_core/layering.py": 1,
     "smc_core/resilient.py": 2,
     "streamlit_terminal.py": 7,
     "terminal_ai_insights.py": 1,  # PR #2128: tuple-return (bool, T) miss-cache helper signature confuses generic narrowing.
-    "terminal_bitcoin.py": 18,
+    "terminal_bitcoin.py": 16,
     "terminal_export.py": 1,
     "terminal_finnhub.py": 4,
     "terminal_fmp_insights.py": 1,  # PR #2128: tuple-return (bool, T) miss-cache helper signature confuses generic narrowing.
-    "terminal_forecast.py": 2,
+    "terminal_forecast.py": 1,
     "terminal_poller.py": 12,  # rebaselined 2026-05-30 PR #2451 (was 13; -1 for dead-code removal)
-    "terminal_spike_scanner.py": 1,
     "terminal_tabs/tab_live_incubation.py": 1,
-    "terminal_technicals.py": 2,
+    "terminal_technicals.py": 1,
     "terminal_tradingview_news.py": 1,  # PR #2128: tuple-return (bool, T) miss-cache helper signature confuses generic narrowing.
     "smc_integration/measurement_evidence.py": 1,  # 2026-06-24: datetime subtraction type narrowing
     "open_prep/realtime_signals.py": 1,  # 2026-06-24: _resource=None POSIX-guard shim (type: ignore[assignment])
@@ -103,11 +103,15 @@ WARNINGS_SIMPLEFILTER_LEDGER: set[tuple[str, int, str]] = {
     # additional helpers landed across the screener, shifting all five sites
     # downward by +115/+124/+134/+143/+152 — action remains ``"always"``.
     # 2026-06-10 (#2670 W9): timestamp_substitutions disclosure shifted +5.
-    ("databento_volatility_screener.py", 874, "always"),
-    ("databento_volatility_screener.py", 1973, "always"),
-    ("databento_volatility_screener.py", 2614, "always"),
-    ("databento_volatility_screener.py", 3113, "always"),
-    ("databento_volatility_screener.py", 3277, "always"),
+    # _IntradayStateReducer (columnar chunk reducer) shifted the four sites
+    # below it by +281. The content-cache import (+1) and load_daily_bars
+    # content-cache branch (+71 more) shifted them again. Negative daily-bar
+    # cache entries moved the last four by +12.
+    ("databento_volatility_screener.py", 916, "always"),
+    ("databento_volatility_screener.py", 2642, "always"),
+    ("databento_volatility_screener.py", 3636, "always"),
+    ("databento_volatility_screener.py", 4152, "always"),
+    ("databento_volatility_screener.py", 4325, "always"),
     ("databento_universe.py", 162, "always"),
 }
 